@@ -0,0 +1,123 @@
+"""
+SuperTrend benchmark: original pandas .iloc loop vs NumPy single-pass version
+
+Run from the repository root:
+    python benchmarks/bench_supertrend.py
+"""
+import logging
+import os
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+# The app module talks to Streamlit at import time; keep bare-mode warnings quiet
+logging.disable(logging.WARNING)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nyztrade_valuation_screener import calculate_supertrend
+
+HISTORIES = {"1y": 252, "5y": 1260}
+REPEATS = 5
+
+
+def legacy_calculate_supertrend(high, low, close, period=10, multiplier=3):
+    """Original implementation kept verbatim as the reference for timing and output checks"""
+    tr1 = high - low
+    tr2 = abs(high - close.shift())
+    tr3 = abs(low - close.shift())
+    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    atr = tr.rolling(window=period).mean()
+
+    hl_avg = (high + low) / 2
+    upper_band = hl_avg + (multiplier * atr)
+    lower_band = hl_avg - (multiplier * atr)
+
+    supertrend = pd.Series(index=close.index, dtype=float)
+    direction = pd.Series(index=close.index, dtype=int)
+
+    for i in range(1, len(close)):
+        if pd.isna(upper_band.iloc[i]) or pd.isna(lower_band.iloc[i]):
+            continue
+
+        curr_upper = upper_band.iloc[i]
+        curr_lower = lower_band.iloc[i]
+        prev_close = close.iloc[i-1]
+        curr_close = close.iloc[i]
+
+        if curr_upper < upper_band.iloc[i-1] or prev_close > upper_band.iloc[i-1]:
+            upper_band.iloc[i] = curr_upper
+        else:
+            upper_band.iloc[i] = upper_band.iloc[i-1]
+
+        if curr_lower > lower_band.iloc[i-1] or prev_close < lower_band.iloc[i-1]:
+            lower_band.iloc[i] = curr_lower
+        else:
+            lower_band.iloc[i] = lower_band.iloc[i-1]
+
+        if i == 1:
+            direction.iloc[i] = 1 if curr_close <= lower_band.iloc[i] else -1
+            supertrend.iloc[i] = lower_band.iloc[i] if direction.iloc[i] == 1 else upper_band.iloc[i]
+        else:
+            prev_direction = direction.iloc[i-1]
+
+            if prev_direction == 1 and curr_close >= lower_band.iloc[i]:
+                direction.iloc[i] = -1
+                supertrend.iloc[i] = upper_band.iloc[i]
+            elif prev_direction == -1 and curr_close <= upper_band.iloc[i]:
+                direction.iloc[i] = 1
+                supertrend.iloc[i] = lower_band.iloc[i]
+            else:
+                direction.iloc[i] = prev_direction
+                supertrend.iloc[i] = lower_band.iloc[i] if direction.iloc[i] == 1 else upper_band.iloc[i]
+
+    signal = (close > supertrend).astype(int) * 2 - 1
+
+    return {
+        'supertrend': supertrend,
+        'direction': direction,
+        'signal': signal.iloc[-1] if len(signal) > 0 else 0,
+        'upper_band': upper_band,
+        'lower_band': lower_band
+    }
+
+
+def synthetic_history(days, seed=42):
+    """Random-walk OHLC series with business-day index"""
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range("2020-01-01", periods=days)
+    close = pd.Series(1000 + np.cumsum(rng.normal(0, 10, days)), index=index)
+    high = close + rng.uniform(0, 20, days)
+    low = close - rng.uniform(0, 20, days)
+    return high, low, close
+
+
+def check_identical(high, low, close):
+    """Assert both implementations agree on every returned series"""
+    expected = legacy_calculate_supertrend(high.copy(), low.copy(), close.copy())
+    actual = calculate_supertrend(high, low, close)
+    for key in ('supertrend', 'direction', 'upper_band', 'lower_band'):
+        pd.testing.assert_series_equal(expected[key], actual[key])
+    assert expected['signal'] == actual['signal']
+
+
+def main():
+    print(f"{'History':<8} {'Rows':>6} {'Legacy (ms)':>12} {'NumPy (ms)':>12} {'Speedup':>9}")
+    for label, days in HISTORIES.items():
+        high, low, close = synthetic_history(days)
+        check_identical(high, low, close)
+
+        legacy = min(timeit.repeat(
+            lambda: legacy_calculate_supertrend(high.copy(), low.copy(), close.copy()),
+            number=1, repeat=REPEATS
+        ))
+        current = min(timeit.repeat(
+            lambda: calculate_supertrend(high, low, close),
+            number=1, repeat=REPEATS
+        ))
+        print(f"{label:<8} {days:>6} {legacy * 1000:>12.2f} {current * 1000:>12.2f} {legacy / current:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Stock-universe load benchmark: inline INDIAN_STOCKS literal vs packed JSON data file
+
+Run from the repository root:
+    python benchmarks/bench_universe_load.py
+
+Cold import is measured as parse/compile plus execution of the module-level
+literal; a Streamlit rerun skips the parse (the script's bytecode is cached)
+but still executes it. With the data file, a cold start pays one json.load
+and every rerun is a memoized lookup.
+"""
+import json
+import logging
+import os
+import sys
+import timeit
+
+# The app module talks to Streamlit at import time; keep bare-mode warnings quiet
+logging.disable(logging.WARNING)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import nyztrade_valuation_screener as app
+
+APP_PATH = os.path.join(REPO_ROOT, "nyztrade_valuation_screener.py")
+REPEATS = 5
+
+
+def legacy_literal_source(stocks_db):
+    """Rebuild the INDIAN_STOCKS literal in the layout the module used to ship"""
+    blocks = []
+    for category, stocks in stocks_db.items():
+        rows = ",\n".join(f"        {json.dumps(t)}: {json.dumps(n, ensure_ascii=False)}" for t, n in stocks.items())
+        blocks.append(f"    {json.dumps(category)}: {{\n{rows}\n    }}")
+    return "INDIAN_STOCKS = {\n" + ",\n\n".join(blocks) + "\n\n}\n"
+
+
+def best_of(func):
+    """Fastest of REPEATS single runs, in milliseconds"""
+    return min(timeit.repeat(func, number=1, repeat=REPEATS)) * 1000
+
+
+def main():
+    literal = legacy_literal_source(app.INDIAN_STOCKS)
+    with open(APP_PATH, encoding="utf-8") as f:
+        module_source = f.read()
+    legacy_module_source = module_source.replace(
+        "INDIAN_STOCKS = load_indian_stocks()\n", literal, 1
+    )
+
+    code = compile(literal, "<literal>", "exec")
+    namespace = {}
+    exec(code, namespace)
+    assert namespace["INDIAN_STOCKS"] == app.INDIAN_STOCKS
+
+    results = [
+        ("Module compile (legacy, with literal)", best_of(lambda: compile(legacy_module_source, APP_PATH, "exec"))),
+        ("Module compile (data file)", best_of(lambda: compile(module_source, APP_PATH, "exec"))),
+        ("Literal exec (legacy rerun)", best_of(lambda: exec(code, {}))),
+        ("json.load (data file cold start)", best_of(lambda: app.load_indian_stocks.__wrapped__(app.INDIAN_STOCKS_PATH))),
+        ("load_indian_stocks() (memoized rerun)", best_of(lambda: app.load_indian_stocks())),
+    ]
+
+    print(f"Universe: {len(app.INDIAN_STOCKS)} categories, {sum(map(len, app.INDIAN_STOCKS.values())):,} tickers")
+    print(f"Literal source: {literal.count(chr(10)):,} lines")
+    for label, ms in results:
+        print(f"{label:<42} {ms:>9.2f} ms")
+
+    cold_legacy = results[0][1] + results[2][1]
+    cold_new = results[1][1] + results[3][1]
+    print(f"{'Cold start (compile + build universe)':<42} {cold_legacy:>9.2f} ms -> {cold_new:.2f} ms")
+    print(f"{'Rerun (build universe)':<42} {results[2][1]:>9.2f} ms -> {results[4][1]:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
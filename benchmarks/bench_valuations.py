@@ -0,0 +1,102 @@
+"""
+Valuation benchmark: scalar calculate_valuations loop vs vectorized calculate_valuations_batch
+
+Run from the repository root:
+    python benchmarks/bench_valuations.py
+
+Both engines value the same synthetic universe (including missing and
+negative fields); the script checks they agree value for value before timing.
+"""
+import logging
+import math
+import os
+import sys
+import timeit
+
+import numpy as np
+
+# The app module talks to Streamlit at import time; keep bare-mode warnings quiet
+logging.disable(logging.WARNING)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nyztrade_valuation_screener as app
+
+UNIVERSE_SIZES = (500, 6000)
+REPEATS = 5
+COMPARED_KEYS = (
+    'price', 'trailing_pe', 'industry_pe', 'fair_value_pe', 'upside_pe', 'current_ev_ebitda',
+    'industry_ev_ebitda', 'fair_value_ev', 'upside_ev', 'pb_ratio', 'ps_ratio', 'net_debt'
+)
+
+
+def synthetic_infos(count, seed=7):
+    """yfinance-like info dicts with the gaps and odd values real data has"""
+    rng = np.random.default_rng(seed)
+    industries = sorted(app.INDIAN_STOCKS)
+    infos, industry_of = {}, {}
+    for i in range(count):
+        price = float(rng.uniform(10, 3000))
+        eps = float(rng.uniform(-20, 150))
+        info = {
+            'currentPrice': price if rng.random() > 0.05 else None,
+            'regularMarketPrice': price,
+            'trailingPE': price / eps if eps > 0 else None,
+            'forwardPE': float(rng.uniform(5, 60)),
+            'trailingEps': eps,
+            'enterpriseValue': float(rng.uniform(1e9, 5e12)),
+            'ebitda': float(rng.uniform(-1e9, 5e11)) if rng.random() > 0.1 else None,
+            'marketCap': float(rng.choice([1e10, 8e10, 4e11])),
+            'sharesOutstanding': float(rng.uniform(1e6, 5e9)) if rng.random() > 0.05 else None,
+            'bookValue': float(rng.uniform(-50, 900)),
+            'totalRevenue': float(rng.uniform(0, 1e12)),
+            'totalDebt': float(rng.uniform(0, 1e11)) if rng.random() > 0.1 else None,
+            'totalCash': float(rng.uniform(0, 1e11)),
+            'sector': str(rng.choice(['Technology', 'Energy', 'Utilities', 'Unknown'])),
+        }
+        ticker = f"SYN{i}.NS"
+        infos[ticker] = info
+        industry_of[ticker] = industries[i % len(industries)] if i % 7 else None
+    return infos, industry_of
+
+
+def same(expected, actual):
+    """Scalar value (None for missing) against a batch value (NaN for missing)"""
+    if expected is None or (isinstance(expected, float) and math.isnan(expected)):
+        return actual is None or (isinstance(actual, float) and math.isnan(actual))
+    return math.isclose(expected, actual, rel_tol=1e-9, abs_tol=1e-9)
+
+
+def check_identical(infos, industry_of):
+    """Assert the batch engine drops and values exactly the rows the scalar engine does"""
+    info_df = app.build_info_frame(infos)
+    batch = app.calculate_valuations_batch(info_df, [industry_of[t] for t in info_df.index])
+    for ticker, info in infos.items():
+        expected = app.calculate_valuations(info, industry_of[ticker])
+        assert (expected is None) == (ticker not in batch.index), ticker
+        if expected is None:
+            continue
+        row = batch.loc[ticker]
+        assert expected['cap_type'] == row['cap_type'], ticker
+        for key in COMPARED_KEYS:
+            assert same(expected[key], float(row[key])), (ticker, key, expected[key], row[key])
+
+
+def main():
+    print(f"{'Stocks':>7} {'Scalar (ms)':>12} {'Batch (ms)':>11} {'Speedup':>9}")
+    for count in UNIVERSE_SIZES:
+        infos, industry_of = synthetic_infos(count)
+        check_identical(infos, industry_of)
+
+        scalar = min(timeit.repeat(
+            lambda: [app.calculate_valuations(info, industry_of[t]) for t, info in infos.items()],
+            number=1, repeat=REPEATS
+        ))
+        batch = min(timeit.repeat(
+            lambda: app.calculate_valuations_batch(app.build_info_frame(infos), list(industry_of.values())),
+            number=1, repeat=REPEATS
+        ))
+        print(f"{count:>7} {scalar * 1000:>12.2f} {batch * 1000:>11.2f} {scalar / batch:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Screen DSL check: rows with a missing (NaN) compared value never pass
+
+Run from the repository root:
+    python benchmarks/check_screen_dsl.py
+
+Each case compiles a screen and evaluates it over three rows (a PE of 10,
+a PE of 40 and no PE), asserting which rows pass.
+"""
+import logging
+import os
+import sys
+
+import numpy as np
+
+# The app module talks to Streamlit at import time; keep bare-mode warnings quiet
+logging.disable(logging.WARNING)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nyztrade_valuation_screener as app
+
+NAMESPACE = {
+    'size': 3,
+    'trailing_pe': np.array([10.0, 40.0, np.nan]),
+    'roe': np.array([0.2, 0.2, 0.2]),
+}
+
+# Screen → expected pass mask for (PE 10, PE 40, no PE)
+CASES = {
+    'trailing_pe > 30': [False, True, False],
+    'not trailing_pe > 30': [True, False, False],
+    'trailing_pe != 10': [False, True, False],
+    'not trailing_pe == 10': [False, True, False],
+    'not (trailing_pe > 30 and roe > 0.1)': [True, False, False],
+    # A false branch decides and/or even when the other side is unknown
+    'not (trailing_pe > 30 or roe > 0.5)': [True, False, False],
+    'not (roe > 0.5 and trailing_pe > 30)': [True, True, True],
+    'roe > 0.1 or trailing_pe > 30': [True, True, True],
+    'not not trailing_pe > 30': [False, True, False],
+    '5 < trailing_pe < 20': [True, False, False],
+}
+
+
+def main():
+    for expression, expected in CASES.items():
+        actual = app.compile_screen(expression)(NAMESPACE).tolist()
+        assert actual == expected, (expression, actual, expected)
+        print(f"{expression:<40} {actual}")
+    print(f"{len(CASES)} screens ok")
+
+
+if __name__ == "__main__":
+    main()
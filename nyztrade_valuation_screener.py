@@ -1,4 +1,6 @@
 import streamlit as st
+from streamlit import config as streamlit_config
+from streamlit import logger as streamlit_logger
 import yfinance as yf
 import pandas as pd
 import numpy as np
@@ -6,10 +8,28 @@ import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import plotly.express as px
 from datetime import datetime, timedelta
+import os
+import sys
+import re
+import argparse
+import json
+import hashlib
+import sqlite3
 import time
+import threading
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from bisect import bisect_left
+from collections import Counter
+from contextlib import contextmanager
 from functools import wraps
 from io import BytesIO
+from types import MappingProxyType
 import statistics
+import heapq
+import ast
+import operator
+import functools
 from reportlab.lib.pagesizes import A4
 from reportlab.lib import colors
 from reportlab.lib.units import inch
@@ -20,6 +40,15 @@ from reportlab.lib.enums import TA_CENTER
 # ============================================================================
 # STREAMLIT CONFIGURATION
 # ============================================================================
+# False when the module runs headless (CLI, scripts) rather than under `streamlit run`
+IN_STREAMLIT = st.runtime.exists()
+if not IN_STREAMLIT:
+    # Bare-mode Streamlit warns on every widget and cache call; keep headless output readable.
+    # Setting the options parses Streamlit's config now, so a later lazy parse cannot reset the level.
+    streamlit_config.set_option("global.showWarningOnDirectExecution", False)
+    streamlit_config.set_option("logger.level", "error")
+    streamlit_logger.set_log_level("error")
+
 st.set_page_config(
     page_title="NYZTrade Stock Valuation + Screener Professional dashboard",
     page_icon="🎯",
@@ -532,7 +561,7 @@ def check_password():
         return False
     return True
 
-if not check_password():
+if IN_STREAMLIT and not check_password():
     st.stop()
 
 # ============================================================================
@@ -545,9357 +574,17 @@ Total Categories: 117
 Total Stocks: 8984
 """
 
-"""
-Indian Stocks Database
-Generated from stocks_universe_categorized_enhanced.csv
-Total Categories: 117
-Total Stocks: 8984
-"""
+# The universe ships as a packed JSON data file (category → {ticker: name}) so that
+# cold imports and Streamlit reruns don't re-parse and rebuild a 9,000-line literal
+INDIAN_STOCKS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "indian_stocks.json")
 
-INDIAN_STOCKS = {
-    "Advertising Agencies": {
-        "AMMLTD.BO": "Appu Marketing & Manufacturing",
-        "GOVMC.BO": "GOOD VALUE MARKETING CO.LTD.",
-        "NEERAJ.BO": "NEERAJ PAPER MARKETING LIMITED",
-        "PRESSMN.BO": "PRESSMAN ADVERTISING LIMITED",
-        "PRESSMN.NS": "Pressman Advertising Limited",
-        "SPECMKT.BO": "SPECULAR MARKETING & FINANCING",
-        "SURYAMARK.BO": "SURYA MARKETING LTD"
-    },
-
-    "Aerospace/Defense - Major Diversified": {
-        "ABGSHIP.NS": "ABG Shipyard Limited",
-        "BEL.NS": "Bharat Electronics Limited",
-        "BHARATIDIL.NS": "Bharati Defence And Infrastructure Limited",
-        "RDEL.NS": "Reliance Defence and Engineering Limited"
-    },
-
-    "Agricultural Chemicals": {
-        "AGRITECH.NS": "Agri-Tech (India) Ltd",
-        "AGRODUTCH-BE.NS": "AGRO DUTCH INDUSTRIES LTD",
-        "AGRODUTCH.BO": "AGRO DUTCH INDUSTRIES LTD.",
-        "ARIES.NS": "ARIES AGRO LIMITED",
-        "ARIES.BO": "Aries Agro Limited",
-        "ARIES.NS": "Aries Agro Limited",
-        "ASHAI.BO": "Ashiana Agro Industries Ltd.",
-        "ASIANFR.BO": "ASIAN FERTILIZERS LTD.",
-        "BAMBINO.BO": "Bambino Agro Industries Ltd.",
-        "BAYERCROP.NS": "Bayer CropScience Limited",
-        "BELAGRO.BO": "Bell Agromachina Ltd.",
-        "BHARATRAS.NS": "Bharat Rasayan Limited",
-        "BHASKAGR.BO": "BHASKAR AGROCHEMICALS LTD.",
-        "CHAMBLFERT.NS": "Chambal Fertilisers and Chemicals Limited",
-        "COROMANDEL.NS": "Coromandel International Limited",
-        "CRYPTAG.BO": "CRYPTOGEN AGRO INDUSTRIES LTD.",
-        "DEEPAKFERT.NS": "DEEPAK FERTILIZERS AND PETROCHE",
-        "DEEPAKFERT.NS": "Deepak Fertilisers And Petrochemicals Corporation Limited",
-        "DHANUKA.NS": "Dhanuka Agritech Limited",
-        "DHARNAG.BO": "DHARNENDRA AGRO FOOD INDUSTRIE",
-        "EXCELCROP.NS": "Excel Crop Care Limited",
-        "FACT.NS": "The Fertilisers And Chemicals Travancore Limited",
-        "GNFC.NS": "Gujarat Narmada Valley Fertilizers & Chemicals Limited",
-        "GOKULAGRO.BO": "Gokul Agro Resources Ltd",
-        "GREENFIRE.NS": "Proseed India Limited",
-        "GSFC.NS": "Gujarat State Fertilizers & Chemicals Limited",
-        "HATSUN.NS": "HATSUN AGRO PRODUC INR1",
-        "HATSUN.BO": "Hatsun Agro Product Limited",
-        "HERUKAG.BO": "HERUK AGRO FOODS LTD.",
-        "IFBAGRO.BO": "IFB AGRO INDUSTRIES LTD.",
-        "INSECTICID.NS": "Insecticides (India) Limited",
-        "JAYAGROGN.NS": "JAYANT AGRO ORGANICS LIMITED",
-        "JAYAGROGN.BO": "JAYANT AGRO-ORGANICS LTD.",
-        "JVLAGRO.BO": "JVL Agro Industries Ltd",
-        "KGNAGRO.BO": "KGN AGRO INTERNATIONALS LTD.",
-        "MADRASFERT.NS": "MADRAS FERTILIZERS INR10(DEMAT)",
-        "MADRASFERT.BO": "Madras Fertilizer Limited",
-        "MADRASFERT.NS": "Madras Fertilizers Limited",
-        "MANGCHEFER.NS": "Mangalore Chemicals & Fertilizers Limited",
-        "MAYAGRP.BO": "MAYA AGRO PRODUCTS LTD.",
-        "MEGH.NS": "Meghmani Organics Limited",
-        "MONESHIA.BO": "MONESHI AGRO INDUSTRIES LTD.",
-        "MONSANTO.NS": "Monsanto India Limited",
-        "MPAGI.BO": "M. P. Agro Industries Ltd",
-        "NAPL.BO": "Naturite Agro Products Limited",
-        "NATHBIOGEN.NS": "Nath Bio-Genes (India) Limited",
-        "NEAGI.BO": "Neelamalai Agro Industries Ltd.",
-        "NEPCAGRO.BO": "NEPC AGRO FOODS LTD.",
-        "NFL.BO": "National Fertilizers Ltd.",
-        "NFL.NS": "National Fertilizers Limited",
-        "NIJJER.BO": "NIJJER AGRO FOODS LTD.",
-        "OCEAGRO.BO": "Ocean Agro (India) Limited",
-        "OSWALAGRO.BO": "OSWAL AGRO MILLS LTD.",
-        "PARKERAC.BO": "Parker Agrochem Exports Ltd.",
-        "PICCADIL.BO": "Piccadily Agro Industries Limited",
-        "PIIND.NS": "PI Industries Limited",
-        "PIONAGR.BO": "Pioneer Agro Extracts Ltd",
-        "PRIMAGR.BO": "Prima Agro Limited",
-        "RAASHIF.BO": "RAASHI FERTILIZERS LTD.",
-        "RAFL.BO": "Raghuvansh Agrofarms Limited",
-        "RAJAGRO.BO": "Raj Agro Mills Ltd.",
-        "RALLIS.NS": "Rallis India Limited",
-        "RATNAMAGRO.BO": "RATNAMANI AGRO INDUSTRIES LTD",
-        "RCF.NS": "Rashtriya Chemicals And Fertilizers Limited",
-        "REIAGROLTD-BE.NS": "REI AGRO LTD INR1",
-        "REIAGROLTD.NS": "REI AGRO LTD INR1",
-        "REIAGROLTD.BO": "REI AGRO LTD.",
-        "REIAGROLTD6.BO": "REIAGROLTD6.BO",
-        "RKB.BO": "RKB AGRO INDUSTRIES LIMITED",
-        "SANJAG.BO": "SANJIVANI AGRO INDUSTRIES LTD.",
-        "SATGAGR.BO": "SATGURU AGRO INDUSTRIES LTD.",
-        "SEASTAG.BO": "SOUTH EAST AGRO INDUSTRIES LTD",
-        "SH-ANJY.BO": "SHRI ANJANEY AGRO FOODS LTD.",
-        "SHARDACROP.NS": "Sharda Cropchem Limited",
-        "SHIVAAGRO.BO": "SHIVA GLOBAL AGRO INDUSTRIES L",
-        "SPIC.NS": "Southern Petrochemical Industries Corporation Limited",
-        "SPTRSHI.BO": "Saptarishi Agro Industries Limited",
-        "SUNILAGR.BO": "Sunil Agro Foods Ltd",
-        "SYPAGFD.BO": "SYP AGRO FOODS LTD.",
-        "TEEAI.BO": "Teesta Agro Industries Ltd.",
-        "UMREAGR.BO": "CIAN AGRO IND & INFRA LTD",
-        "UNQAGRO.BO": "UNIQUE AGRO PROCESSORS (INDIA)",
-        "UPL.NS": "UPL Limited",
-        "USHERAGRO.BO": "USHER AGRO LTD.",
-        "VITANAGRO.BO": "VITAN AGRO INDUSTRIES LTD",
-        "VRUNAGR.BO": "VARUNA AGROPROTEINS LTD.",
-        "ZUARI.BO": "ZUARI AGRO CHEMICALS LTD.",
-        "ZUARI.NS": "Zuari Agro Chemicals Limited",
-        "ZUARIGLOB.NS": "Zuari Global Limited"
-    },
-
-    "Air Delivery & Freight Services": {
-        "ALLCARGO.NS": "Allcargo Logistics Limited",
-        "ARSHIYA.NS": "Arshiya Limited",
-        "BLUEDART.NS": "Blue Dart Express Limited",
-        "CONCOR.NS": "Container Corporation of India Limited",
-        "GATI.NS": "Gati Limited",
-        "GDL.NS": "Gateway Distriparks Limited",
-        "NAVKARCORP.NS": "Navkar Corporation Limited",
-        "PATINTLOG.NS": "Patel Integrated Logistics Limited",
-        "SICAL.NS": "Sical Logistics Limited",
-        "SNOWMAN.NS": "Snowman Logistics Limited",
-        "TCI.NS": "Transport Corporation of India Limited"
-    },
-
-    "Air Services, Other": {
-        "GLOBALVECT.NS": "Global Vectra Helicorp Limited",
-        "GVKPIL.NS": "GVK Power & Infrastructure Limited"
-    },
-
-    "Aluminum": {
-        "CENTEXT.NS": "Century Extrusions Limited",
-        "HINDALCO.NS": "Hindalco Industries Limited",
-        "MAANALU.NS": "Maan Aluminium Limited",
-        "NATIONALUM.NS": "National Aluminium Company Limited"
-    },
-
-    "Apparel Stores": {
-        "FLFL.NS": "Future Lifestyle Fashions Limited",
-        "TRENT.NS": "Trent Limited"
-    },
-
-    "Asset Management": {
-        "AADHAARVEN.BO": "AADHAAR VENTURES INDIA LTD.",
-        "ABHIINFRA.BO": "Abhishek Infraventures Limited",
-        "ACHAL.BO": "ACHAL INVESTMENTS LTD",
-        "AEONIA.BO": "AEONIAN INVESTMENTS CO.LTD.",
-        "AQUAPIV.BO": "AQUA PUMPS INFRA VENTURES LTD",
-        "ARMAN.BO": "ARMAN HOLDINGS LTD",
-        "ARNOLD.BO": "ARNOLD HOLDINGS LTD",
-        "ATNINTER.NS": "ATN International Ltd.",
-        "AXONVL.BO": "Axon Ventures Limited",
-        "BAJAJHLDNG.NS": "Bajaj Holdings & Investment Limited",
-        "BERVINL.BO": "Bervin Investment & Leasing Ltd.",
-        "BETKAPA.BO": "BETA-KAPPA INVESTMENTS LTD.",
-        "BFINVEST.BO": "BF INVESTMENT LTD.",
-        "BFINVEST.NS": "BF Investment Limited",
-        "BINDALAGRO.NS": "Oswal Greentech Limited",
-        "BLIL.BO": "Balmer Lawrie Investments Limited",
-        "BVL.BO": "Blueblood Ventures Limited",
-        "CENPORT.BO": "Arunjyoti Bio Ventures Limited",
-        "CHAMAK.BO": "CHAMAK HOLDINGS LIMITED",
-        "CHRTEDCA.BO": "Chartered Capital and Investment Limited",
-        "CREST.NS": "Crest Ventures Limited",
-        "DCHL.BO": "Deccan Chronicle Holdings Limited",
-        "DHUNINV.BO": "DHUNSERI INVESTMENTS LTD.",
-        "DOLAT.BO": "Dolat Investments Limited",
-        "DSINVEST.BO": "Dalal Street Investments Limited",
-        "ELCIDIN.BO": "ELCID INVESTMENTS LTD.",
-        "ESSRINV.BO": "ESSAR INVESTMENTS LTD.",
-        "GANHOLD.BO": "GANESH HOLDINGS LTD.",
-        "GEECEE.NS": "GEECEE VENTURES LIMITED",
-        "GEECEE.BO": "GeeCee Ventures Ltd",
-        "HBSTOCK.BO": "HB Stockholdings Limited",
-        "HEALINV.BO": "HEALTHY INVESTMENTS LTD.",
-        "HINDUJAVEN.BO": "HINDUJA VENTURES LTD.",
-        "IBVENTURES.BO": "INDIABULLS VENTURES LTD.",
-        "IBWSL.NS": "SORIL Holdings and Ventures Limited",
-        "IIFL.NS": "IIFL HOLDINGS LTD INR2",
-        "IIFL.BO": "IIFL HOLDINGS LIMITED",
-        "INDBANK.NS": "Indbank Merchant Banking Services Limited",
-        "INDIACO.BO": "Indiaco Ventures Ltd",
-        "INOVSYNTH.BO": "INNOVASSYNTH INVESTMENTS LTD.",
-        "INTELLCAP.BO": "Intellivate Capital Ventures Ltd",
-        "INVPRECQ.BO": "Investment & Precision Castings Ltd",
-        "IVC.BO": "IL&FS INVESTMENT MANAGERS LTD.",
-        "IVC.NS": "IL&FS Investment Managers Limited",
-        "JACKSON.BO": "JACKSON INVESTMENTS LTD",
-        "JAYMAHESH.BO": "JAY MAHESH INFRAVENTURES LTD.",
-        "JMDTELEFILM.BO": "JMD Ventures Limited",
-        "JPOLYINVST.NS": "Jindal Poly Investment and Finance Company Limited",
-        "JSWHL.BO": "JSW Holdings Limited",
-        "JSWHL.NS": "JSW Holdings Limited",
-        "JYOTHI.BO": "JYOTHI INFRAVENTURES LTD.",
-        "KAMAHOLD.BO": "KAMA HOLDINGS LIMITED",
-        "KARTKIN.BO": "KARTIK INVESTMENTS TRUST LTD.",
-        "KBIL.NS": "Kirloskar Brothers Investments Ltd.",
-        "KICL.BO": "KALYANI INVESTMENT COMPANY LTD",
-        "KICL.NS": "Kalyani Investment Company Limited",
-        "KINGSINFR.BO": "KINGS INFRA VENTURES LIMITED",
-        "KIRLOSIND.NS": "Kirloskar Industries Limited",
-        "KRISHNA.BO": "KRISHNA VENTURES LIMITED",
-        "KSHITIJ.BO": "KSHITIZ INVESTMENT LTD.",
-        "LANCORHOL.BO": "Lancor Holdings Ltd.",
-        "LFIC.NS": "Lakshmi Finance & Industrial Corporation Limited",
-        "MCDHOLDING.NS": "MCDOWELL HOLDINGS LIMITED",
-        "MCDHOLDING.BO": "MCDOWELL HOLDINGS LTD.",
-        "MCX.NS": "Multi Commodity Exchange of India Limited",
-        "MERCANTILE.BO": "Mercantile Ventures Limited",
-        "MICROSEC.NS": "Sastasundar Ventures Limited",
-        "MORGAN.BO": "Morgan Ventures Limited",
-        "MOTILALOFS.NS": "Motilal Oswal Financial Services Limited",
-        "MULTIIN.BO": "Multiplus Holdings Ltd.",
-        "NAHARCAP.NS": "Nahar Capital and Financial Services Limited",
-        "NBVENTURES.BO": "NAVA BHARAT VENTURES LTD.",
-        "NOUVEAU.BO": "Nouveau Global Ventures Ltd.",
-        "NSIL.BO": "NALWA SONS INVESTMENTS LTD.",
-        "NSIL.NS": "Nalwa Sons Investments Limited",
-        "OSCAR.BO": "Oscar Investments Ltd.",
-        "PARSHINV.BO": "Parsharti Investment Ltd",
-        "PAWANSUT.BO": "PAWANSUT HOLDINGS LTD.",
-        "PEOPLIN.BO": "PEOPLES INVESTMENTS LTD.",
-        "PHL.BO": "Pneumatic Holdings Limited",
-        "PILANIINVS.NS": "Pilani Investment and Industries Corporation Limited",
-        "PNBGILTS.NS": "PNB Gilts Ltd.",
-        "PNEUMATIC-BE.NS": "Pneumatic Holdings Ltd",
-        "PNEUMATIC.NS": "Pneumatic Holdings Limited",
-        "PREMCAPM.BO": "Premium Capital Market & Investment Ltd.",
-        "PVP.BO": "PVP Ventures Ltd",
-        "QUADRANT.BO": "QUADRANT TELEVENTURES LIMITED",
-        "RANEHOLDIN.BO": "RANE HOLDINGS LTD.",
-        "RAPIDIN.BO": "RAPID INVESTMENTS LTD.",
-        "RELCAPITAL.NS": "Reliance Capital Limited",
-        "RELIABVEN.BO": "Reliable Ventures India Ltd.",
-        "RICHIRICH.BO": "RICHIRICH INVENTURES LIMITED",
-        "ROSEI.BO": "ROSE INVESTMENTS LTD.",
-        "SALSAIN.BO": "SHREE SALASAR INVESTMENT LTD.",
-        "SEINV.BO": "S.E.INVESTMENTS LTD.",
-        "SHARPINV.BO": "SHARP INVESTMENTS LTD",
-        "SHKALYN.BO": "SHRI KALYAN HOLDINGS LTD.",
-        "SHRENTI.BO": "SHREENATH INVESTMENTS CO.LTD.",
-        "SHYMINV.BO": "SHYAMKAMAL INVESTMENTS LTD.",
-        "SIDDHA.BO": "Siddha Ventures Ltd",
-        "SIGRUN.BO": "SIGRUN HOLDINGS LIMITED",
-        "SILINV.BO": "SIL INVESTMENTS LTD.",
-        "SILINV.NS": "SIL Investments Ltd.",
-        "SOFTRAKV.BO": "SOFTRAK VENTURE INVESTMENT LTD",
-        "SOLITIN.BO": "SOLITAIRE INVESTMENTS CO.LTD.",
-        "SPECTACLE-BE.NS": "SPEC VENTURES LTD INR1",
-        "SPECTACLE.NS": "SPEC VENTURES LTD INR1",
-        "SPECTACLE.BO": "Spectacle Ventures Limited",
-        "SPECTACLE.NS": "Spectacle Ventures Limited",
-        "STEL-BE.NS": "STEL HOLDINGS LTD INR10",
-        "STEL.NS": "STEL HOLDINGS LIMITED",
-        "STEL.BO": "STEL HOLDINGS LIMITED",
-        "SURAJHLD.BO": "SURAJ HOLDINGS LTD.",
-        "SVPGLOB.BO": "SVP GLOBAL VENTURES LTD.",
-        "SW1.BO": "SW INVESTMENTS LTD",
-        "TATAINVEST.BO": "Tata Investment Corporation Ltd.",
-        "TIMESGTY.NS": "Times Guaranty Ltd.",
-        "TRINETHRA.BO": "Trinethra Infra Ventures Ltd.",
-        "TUBEINVEST.BO": "Tube Investments of India Limited",
-        "TYPHOON.BO": "TYPHOON HOLDINGS LTD.",
-        "UNIJOLL.BO": "UNIJOLLY INVESTMENTS CO.LTD.",
-        "VAARAD.BO": "VAARAD VENTURES LTD",
-        "VHL.BO": "VARDHMAN HOLDINGS LTD.",
-        "VISHINV.BO": "VISHVAKIRTI INVESTMENT LTD.",
-        "WILLAMAGOR.NS": "Williamson Magor & Co. Limited",
-        "YAMNINV.BO": "YAMINI INVESTMENTS COMPANY LTD",
-        "ZBHAVIIN.BO": "BHAVI INVESTMENTS LTD.",
-        "ZCHANAIN.BO": "CHANAKYA INVESTMENTS LTD.",
-        "ZDOLPINV.BO": "DOLPHIN INVESTMENTS LTD.",
-        "ZGOLDINV.BO": "GOLD ROCK INVESTMENTS LTD.",
-        "ZODIACVEN.BO": "ZODIAC VENTURES LIMITED",
-        "ZPARICIN.BO": "Parichay Investments Limited",
-        "ZSAMTULI.BO": "SAM-TUL INVESTMENTS LTD."
-    },
-
-    "Auto Manufacturers - Major": {
-        "$AUTPA41.BO": "AUTO PAL IND",
-        "$AUTPA42.BO": "AUTOPAL IND",
-        "ACGL.BO": "Automobile Corp. of Goa Ltd.",
-        "AMTEKAUTO.BO": "Amtek Auto Ltd.",
-        "AMTEKAUTO4.BO": "AMTEKAUTO4.BO",
-        "AMTEKBBPH.BO": "AMTEKAUTO*",
-        "ASAL.NS": "AUTOMOTIVE STAMPINGS AND ASSEMB",
-        "ASAL.BO": "Automotive Stampings & Assemblies Ltd.",
-        "ASHOKLEY.NS": "Ashok Leyland Limited",
-        "ATULAUTO.NS": "ATUL AUTO LTD INR5",
-        "ATULAUTO.BO": "Atul Auto Limited",
-        "ATULAUTO.NS": "Atul Auto Limited",
-        "AUTOAXLES.BO": "Automotive Axles Ltd.",
-        "AUTOIND.BO": "Autoline Industries Limited",
-        "AUTOINT.BO": "AUTORIDERS INTERNATIONAL LTD.",
-        "AUTOLITIND.NS": "AUTOLITE (INDIA) LIMITED",
-        "AUTOLITIND.BO": "AUTOLITE (INDIA) LTD.",
-        "AUTOPAL.BO": "Autopal Industries Limited",
-        "AUTOPINS.BO": "AUTO PINS (INDIA) LTD.",
-        "AUTOPRD.BO": "AUTOMOBILE PRODUCTS OF INDIA L",
-        "BAJAJ-AUTO.NS": "BAJAJ AUTO LTD INR10",
-        "BAJAJ-AUTO.BO": "BAJAJ AUTO LTD.",
-        "BAJAJ-AUTO.NS": "Bajaj Auto Limited",
-        "BGWTATO.BO": "Bhagwati Autocast Ltd.",
-        "BOMBCYC.BO": "Bombay Cycle & Motor Agency Ltd.",
-        "BRAKAUT.BO": "Brakes Auto (India) Limited",
-        "CLUTCHAUTO-BE.NS": "CLUTCH AUTO LTD",
-        "CLUTCHAUTO-BZ.NS": "CLUTCH AUTO LTD",
-        "CLUTCHAUTO.NS": "CLUTCH AUTO INR10",
-        "CLUTCHAUTO.BO": "CLUTCH AUTO LTD.",
-        "CLUTCHAUTO.NS": "Clutch Auto Ltd.",
-        "COMPEAU.BO": "Competent Automobiles Company Limited",
-        "DAEWOO.BO": "DAEWOO MOTORS (INDIA) LTD.",
-        "EICHERMOT.BO": "Eicher Motors Ltd.",
-        "EICHERMOT.NS": "Eicher Motors Limited",
-        "FORCEMOT.BO": "Force Motors Ltd.",
-        "GGAUTO.BO": "G.G.AUTOMOTIVE GEARS LTD.",
-        "GSAUTO.BO": "GS Auto International Limited",
-        "GUJAUTO.BO": "Gujarat Automotive Gears Ltd.",
-        "HEROMOTOCO.NS": "Hero MotoCorp Limited",
-        "HIMATAUT.BO": "HIMATSINGKA AUTO ENTERPRISES L",
-        "HINDMOTORS.NS": "HINDUSTAN MOTORS INR5",
-        "HINDMOTORS.BO": "HINDUSTAN MOTORS LTD.",
-        "HINDMOTORS.NS": "Hindustan Motors Limited",
-        "HIRAUTO.BO": "HIRA AUTOMOBILES LTD.",
-        "HONAUT.BO": "HONEYWELL AUTOMATION INDIA LTD",
-        "IGARASHI.BO": "IGARASHI MOTORS INDIA LTD.",
-        "JAMNAAUTO.NS": "JAMNA AUTO INDUSTRIES LIMITED",
-        "JAMNAAUTO.BO": "JAMNA AUTO INDUSTRIES LTD.",
-        "JBMA.NS": "JBM AUTO LTD INR5",
-        "JBMA.BO": "JBM Auto Limited",
-        "JMA.NS": "JULLUNDUR MOTOR AG INR10",
-        "JMTAUTOLTD.NS": "JMT AUTO LIMITED",
-        "JMTAUTOLTD.BO": "JMT AUTO LTD.",
-        "KILBURN.BO": "Kilburn Office Automation Ltd.",
-        "LML.NS": "LML Limited",
-        "LXMIATO.BO": "Lakshmi Automatic Loom Works Limited",
-        "M&M.NS": "Mahindra & Mahindra Limited",
-        "MAHINDCIE.NS": "MAHINDRA CIE AUTO INR10",
-        "MAHINDCIE.BO": "MAHINDRA CIE AUTOMOTIVE LIMITE",
-        "MAJESAUT.BO": "Majestic Auto Ltd.",
-        "MARUTI.NS": "Maruti Suzuki India Limited",
-        "MOTOGENFIN.NS": "MOTOR & GEN FINANC INR10",
-        "MUNJALAU.BO": "Munjal Auto Industries Limited",
-        "NATAUTO.BO": "NATAUTO.BO",
-        "OMAXAUTO.BO": "OMAX AUTOS LTD.",
-        "PAEL.NS": "PREMIER AUTO ELECT INR10",
-        "PANAUTO.BO": "PAN AUTO LTD.",
-        "PPAP.BO": "PPAP Automotive Limited",
-        "RICOAUTO.BO": "Rico Auto Industries Limited",
-        "SAPL.BO": "Sar Auto Products Limited",
-        "SETCO.BO": "Setco Automotive Limited",
-        "SHARDA.BO": "SHARDA MOTOR INDUSTRIES LTD",
-        "SHARDAMOTR.NS": "SHARDA MOTOR INDUS INR10",
-        "SHARDAMOTR.NS": "SHARDA MOTOR INDUS INR10",
-        "SMLISUZU.NS": "SML Isuzu Limited",
-        "SREEJAYA.BO": "Sree Jayalakshmi Autospin Ltd",
-        "SWARAJAUTO.BO": "SWARAJ AUTOMOTIVES LIMITED",
-        "TALBROAUTO.NS": "TALBROS AUTO INR10",
-        "TATAMOTORS.BO": "Tata Motors Limited",
-        "TATAMOTORS.NS": "Tata Motors Limited",
-        "TATAMOTORS6.BO": "TATAMOTORS6.BO",
-        "TATAMTRDVR.BO": "TATA MOTORS LTD - DVR",
-        "TATAMTRDVR.NS": "Tata Motors Limited",
-        "TVSMOTOR.BO": "TVS Motor Company Limited",
-        "TVSMOTOR.NS": "TVS Motor Company Limited",
-        "UNIAUTO.BO": "Universal Autofoundry Limited",
-        "UNIOFFICE.BO": "Universal Office Automation Ltd.",
-        "VAL.BO": "Vaksons Automobiles Limited",
-        "VYVRAUT.BO": "Vybra Automet Ltd.",
-        "ZHIMATMO.BO": "HIMATSINGKA MOTOR WORKS LTD."
-    },
-
-    "Auto Parts": {
-        "AMTEKAUTO.NS": "Amtek Auto Limited",
-        "ANGIND.NS": "ANG Industries Limited",
-        "APLOTYRBBPH.BO": "APOLLOTYRE*",
-        "APOLLOTYRE.NS": "APOLLO TYRES INR1.00",
-        "APOLLOTYRE.BO": "Apollo Tyres Ltd.",
-        "ASAHIINDIA.NS": "Asahi India Glass Limited",
-        "ASAL.NS": "Automotive Stampings and Assemblies Limited",
-        "AUTOAXLES.NS": "Automotive Axles Limited",
-        "AUTOIND.NS": "Autoline Industries Limited",
-        "AUTOLITIND.NS": "Autolite (India) Limited",
-        "BANCOINDIA.NS": "Banco Products (India) Limited",
-        "BHARATFORG.NS": "Bharat Forge Limited",
-        "BHARATGEAR.NS": "Bharat Gears Limited",
-        "BOSCHLTD.NS": "Bosch Limited",
-        "CASTEXTECH.NS": "Castex Technologies Limited",
-        "DEWNTYR-B.BO": "DEWAN TYRES LTD.",
-        "DYNAMATECH.NS": "Dynamatic Technologies Limited",
-        "EXIDEIND.NS": "Exide Industries Limited",
-        "FALCONTQ.BO": "Falcon Tyres Ltd.",
-        "FIEMIND.NS": "Fiem Industries Limited",
-        "FMGOETZE.NS": "Federal-Mogul Goetze (India) Limited",
-        "GABRIEL.NS": "Gabriel India Limited",
-        "HARITASEAT.NS": "Harita Seating Systems Limited",
-        "HINDCOMPOS.NS": "Hindustan Composites Limited",
-        "HINDUJAFO.NS": "Hinduja Foundries Limited",
-        "HITECHGEAR.NS": "The Hi-Tech Gears Limited",
-        "IGARASHI.NS": "Igarashi Motors India Limited",
-        "IMPAL.BO": "India Motor Parts and Accessories Limited",
-        "IMPAL.NS": "India Motor Parts and Accessories Limited",
-        "INDNIPPON.NS": "India Nippon Electricals Limited",
-        "JAMNAAUTO.NS": "Jamna Auto Industries Limited",
-        "JAYBARMARU.NS": "Jay Bharat Maruti Limited",
-        "JBMA.NS": "JBM Auto Limited",
-        "JKTYRE.BO": "JK TYRE & INDUSTRIES LTD.",
-        "JKTYRE.NS": "JK Tyre & Industries Limited",
-        "JMA.NS": "Jullundur Motor Agency (Delhi) Limited",
-        "JMTAUTOLTD.NS": "JMT Auto Limited",
-        "KALYANIFRG.NS": "Kalyani Forge Limited",
-        "KONTY.BO": "KONKAN TYRES LTD.",
-        "LGBBROSLTD.NS": "L.G. Balakrishnan & Bros Limited",
-        "LUMAXAUTO.NS": "Lumax Automotive Systems Limited",
-        "LUMAXIND.NS": "Lumax Industries Limited",
-        "LUMAXTECH.NS": "Lumax Auto Technologies Limited",
-        "MAHSCOOTER.NS": "Maharashtra Scooters Limited",
-        "MENONBE.NS": "Menon Bearings Limited",
-        "MINDACORP.NS": "Minda Corporation Limited",
-        "MOTHERSUMI.NS": "Motherson Sumi Systems Limited",
-        "MUNJALAU.NS": "Munjal Auto Industries Limited",
-        "MUNJALSHOW.NS": "Munjal Showa Limited",
-        "NRBBEARING.NS": "NRB Bearings Limited",
-        "OMAXAUTO.NS": "Omax Autos Limited",
-        "PORWAL.BO": "Porwal Auto Components Ltd",
-        "PPAP.NS": "PPAP Automotive Limited",
-        "PRECAM.NS": "Precision Camshafts Limited",
-        "RANEENGINE.NS": "Rane Engine Valve Limited",
-        "RANEHOLDIN.NS": "Rane Holdings Limited",
-        "RBL.NS": "Rane Brake Lining Limited",
-        "REMSONSIND.NS": "Remsons Industries Limited",
-        "RICOAUTO.NS": "Rico Auto Industries Limited",
-        "RML.NS": "Rane (Madras) Limited",
-        "SHIVAMAUTO.NS": "Shivam Autotech Limited",
-        "SIBARAUT.BO": "Sibar Auto Parts Ltd",
-        "SONASTEER.NS": "Sona Koyo Steering Systems Limited",
-        "SSWL.NS": "Steel Strips Wheels Limited",
-        "SUBROS.NS": "Subros",
-        "SUNCLAYLTD.NS": "Sundaram-Clayton Limited",
-        "SUNDRMBRAK.NS": "Sundaram Brake Linings Limited",
-        "SUNDRMFAST.NS": "Sundram Fasteners Limited",
-        "SUPRAJIT.NS": "Suprajit Engineering Limited",
-        "SWARAJENG.NS": "Swaraj Engines Limited",
-        "TALBROAUTO.BO": "TALBROS AUTOMOTIVE COMPONENTS",
-        "TALBROAUTO.NS": "Talbros Automotive Components Limited",
-        "TTIL.BO": "Tirupati Tyres Ltd.",
-        "TUBEINVEST.NS": "TI Financial Holdings Limited",
-        "UCALFUEL.NS": "Ucal Fuel Systems Limited",
-        "WABCOINDIA.NS": "Wabco India Limited",
-        "WHEELS.NS": "Wheels India Limited"
-    },
-
-    "Beverages - Alcoholic": {
-        "ASALCBR.BO": "Associated Alcohols & Breweries Limited",
-        "MANPASAND.NS": "MANPASAND BEVERAGE INR10",
-        "MANPASAND.BO": "Manpasand Beverages Limited",
-        "ORIBEVER.BO": "Orient Beverages Ltd.",
-        "TATAGLOBAL.BO": "TATA GLOBAL BEVERAGES LIMITED"
-    },
-
-    "Beverages - Brewers": {
-        "EDL.NS": "Empee Distilleries Limited",
-        "SDBL.NS": "Som Distilleries & Breweries Limited",
-        "UBHOLDINGS.NS": "United Breweries (Holdings) Limited",
-        "UBL.NS": "United Breweries Limited"
-    },
-
-    "Beverages - Soft Drinks": {
-        "MANPASAND.NS": "Manpasand Beverages Limited",
-        "UNITEDTEA.NS": "The United Nilgiri Tea Estates Company Limited"
-    },
-
-    "Beverages - Wineries & Distillers": {
-        "GLOBUSSPR.NS": "Globus Spirits Limited",
-        "GMBREW.NS": "G.M.Breweries Limited",
-        "IFBAGRO.NS": "IFB Agro Industries Limited",
-        "PIONDIST.NS": "Pioneer Distilleries Limited",
-        "RKDL.NS": "Ravi Kumar Distilleries Limited",
-        "TI.NS": "Tilaknagar Industries Ltd."
-    },
-
-    "Biotechnology": {
-        "BONANZAB.BO": "BONANZA BIOTECH LTD.",
-        "BRAWN.BO": "Brawn Biotech Limited",
-        "CELESTIAL.NS": "Celestial Biolabs Limited",
-        "CLASSICB.BO": "CLASSIC BIOTECH & EXPORTS LTD.",
-        "DISHMAN.NS": "Dishman Pharmaceuticals and Chemicals Limited",
-        "DOCTORBI.BO": "DOCTORS BIOTECH INDIA LTD.",
-        "DSQBIO.BO": "DSQ BIOTECH LTD.",
-        "EMMESSA.BO": "Emmessar Biotech & Nutrition Limited",
-        "GENOMICS.BO": "GENOMICS BIOTECH LTD.",
-        "GUFICBIO.BO": "Gufic Biosciences Ltd.",
-        "GVBL.BO": "GENOMIC VALLEY BIOTECH LIMITED",
-        "HESTERBIO.NS": "HESTER BIOSCIENCES INR10",
-        "HESTERBIO.BO": "Hester Biosciences Ltd",
-        "HPCBL.BO": "HPC BIOSCIENCES LTD.",
-        "INDBF.BO": "INDO BIOTECH FOODS LTD.",
-        "INDOFREB.BO": "INDO-FRENCH BIOTECH ENTERPRISE",
-        "INDRANIB.BO": "Indrayani Biotech Limited",
-        "IVEE.BO": "Vivanza Biosciences Limited",
-        "KOLARBIO.BO": "KOLAR BIOTECH LTD.",
-        "KOPDRUGS-BZ.NS": "KDL BIOTECH LIMITED",
-        "KOPDRUGS.BO": "KDL BIOTECH LTD.",
-        "LYKALABS.NS": "Lyka Labs Limited",
-        "MAVENSBIO.BO": "Mavens Biotech Limited",
-        "MEDICAMEQ.BO": "Medicamen Biotech Ltd.",
-        "PANACEABIO.NS": "Panacea Biotec Limited",
-        "SAAMYABIO.BO": "Saamya Biotech (India) Limited",
-        "SEQUENT.NS": "Sequent Scientific Limited",
-        "SHKRISHNAB.BO": "SHREEKRISHNA BIOTECH LTD.",
-        "SHREEGANES.BO": "Shree Ganesh Biotech (India) L",
-        "STERLINBIO.NS": "STERLING BIOTECH INR1",
-        "STERLINBIO.BO": "Sterling Biotech Limited",
-        "STERLINBIO.NS": "Sterling Biotech Limited",
-        "TITANBIO.BO": "Titan Biotech Limited",
-        "VALPLUS.BO": "VALPLUS BIOTECH LTD.",
-        "VIVANZA.BO": "Vivanza Biosciences Limited"
-    },
-
-    "Broadcasting & Cable TV": {
-        "3RDROCK-IT.NS": "3rd Rock Multimedia Ltd",
-        "3RDROCK.NS": "3rd Rock Multimedia Limited",
-        "BAGFILMS.BO": "B.A.G.FILMS & MEDIA LTD.",
-        "BGLOBAL.NS": "BHARATIYA GLOBAL INFOMEDIA LIMI",
-        "BGLOBAL.BO": "BHARATIYA GLOBAL INFOMEDIA LTD",
-        "CATVISION.BO": "CATVISION LIMITED",
-        "CYBERMEDIA.NS": "CYBER MEDIA (INDIA INR10",
-        "CYBERMEDIA.BO": "Cyber Media (India) Ltd.",
-        "CYBERSC.BO": "Cyberscape Multimedia Ltd.",
-        "DISHTV.BO": "Dish TV India Limited",
-        "DISHTV6.BO": "DISHTV6.BO",
-        "DIVINE.BO": "DIVINE MULTIMEDIA (INDIA) LTD.",
-        "EROSMEDIA.BO": "EROS INTERNATIONAL MEDIA LTD.",
-        "ESHAMEDIA.BO": "ESHA MEDIA RESEARCH LIMITED",
-        "FILME.BO": "Filmcity Media Ltd.",
-        "GDRMEDIA.BO": "GDR MEDIA LTD.",
-        "HMVL.NS": "HINDUSTAN MEDIA VENTURES LIMITE",
-        "HMVL.BO": "Hindustan Media Ventures Limited",
-        "HTMEDIA.BO": "HT Media Limited",
-        "HTMEDIA6.BO": "HTMEDIA6.BO",
-        "HTMEDIBBPH.BO": "HTMEDIA*",
-        "INFOMEDIA.NS": "INFOMEDIA PRESS LI INR10",
-        "INFOMEDIA.BO": "Infomedia Press Limited",
-        "IRISMEDIA.BO": "IRIS MEDIAWORKS LTD.",
-        "JUPITERIN.BO": "JUPITER INFOMEDIA LTD.",
-        "KHYATI.BO": "Khyati Multimedia Entertainment Ltd.",
-        "KIRLMU.BO": "KIRLOSKAR MULTIMEDIA LTD.",
-        "LUHARUKA.BO": "Luharuka Media & Infra Limited",
-        "MEDIAONE.BO": "Mediaone Global Entertainment Ltd.",
-        "MMNL.NS": "MIG MEDIA NEURONS INR10",
-        "MMNL-IT.NS": "MIG Media Neurons Limited",
-        "MMNL.NS": "Mig Media Neurons Limited",
-        "MMWL.BO": "MEDIA MATRIX WORLDWIDE LTD.",
-        "NDTV.BO": "New Delhi Television Limited",
-        "NETWORK18.BO": "Network18 Media & Investments Limited",
-        "NEXTGENT.BO": "NEXTGEN ANIMATION MEDIAA LTD.",
-        "NEXTMEDIA.NS": "NEXT MEDIAWORKS LT INR10",
-        "NEXTMEDIA.BO": "NEXT MEDIAWORKS LTD.",
-        "OASISME.BO": "OASIS MEDIA MATRIX LTD.",
-        "ORBIT.BO": "ORBIT MULTIMEDIA LTD.",
-        "OYEEEE.BO": "Oyeeee Media Limited",
-        "PENTA6.BO": "PENTAMEDIA GRAPHICS LTD",
-        "PENTAGRAPH.BO": "Pentamedia Graphics Ltd.",
-        "PICTUREHS.BO": "PICTUREHOUSE MEDIA LTD.",
-        "RADAAN-BE.NS": "RADAAN MEDIAWORKS (I) LTD",
-        "RADAAN.BO": "RADAAN MEDIAWORKS (I) LTD.",
-        "RAJTV.BO": "Raj Television Network Ltd.",
-        "RAP.BO": "Rap Media Ltd.",
-        "SAHARA.BO": "Sahara One Media and Entertainment Limited",
-        "SAMBHAAV.NS": "SAMBHAAV MEDIA LTD INR1",
-        "SAMBHAAV.BO": "SAMBHAAV MEDIA LTD.",
-        "SANGUI.BO": "Sanguine Media Ltd.",
-        "SANRAA.BO": "SANRAA MEDIA LTD.",
-        "SEATV.BO": "SEA TV NETWORK LTD.",
-        "SHREYASI.BO": "Shreyas Intermediates Limited",
-        "SIBARMED.BO": "SIBAR MEDIA & ENTERTAINMENT LT",
-        "SOWBHAGYA.BO": "Sowbhagya Media Limited",
-        "SUNTV.BO": "Sun TV Network Ltd",
-        "SUNTV6.BO": "SUNTV6.BO",
-        "TOPMEDIA.BO": "TOP MEDIA ENTERTAINMENT LTD.",
-        "TOPTELE.BO": "TOP TELEMEDIA LTD.",
-        "TV18BRDCST.BO": "TV18 BROADCAST LTD.",
-        "TVSELECT.NS": "TVS ELECTRONICS LIMITED",
-        "TVSELECT.BO": "TVS ELECTRONICS LTD.",
-        "TVSSRICHAK.BO": "TVS Srichakra",
-        "TVTODAY.NS": "TV TODAY NETWORK LIMITED",
-        "TVTODAY.BO": "TV TODAY NETWORK LTD.",
-        "UNIMEDIA.BO": "UNIVERSAL MEDIA NETWORK LTD.",
-        "UNISTRMU.BO": "Unistar Multimedia Limited",
-        "WARNER.BO": "Warner Multimedia Ltd.",
-        "ZEEMEDIA.BO": "ZEE MEDIA CORPORATION LIMITED",
-        "ZEEMEDIA6.BO": "ZEEMEDIA6.BO"
-    },
-
-    "Broadcasting - Radio": {
-        "ENIL.NS": "Entertainment Network (India) Limited"
-    },
-
-    "Broadcasting - TV": {
-        "DEN.NS": "DEN Networks Limited",
-        "JAINSTUDIO.NS": "Jain Studios Limited",
-        "NDTV.NS": "New Delhi Television Limited",
-        "NETWORK18.NS": "Network18 Media & Investments Limited",
-        "RAJTV.NS": "Raj Television Network Limited",
-        "SABTN.NS": "Sri Adhikari Brothers Television Network Limited",
-        "SUNTV.NS": "Sun TV Network Limited",
-        "TV18BRDCST.NS": "TV18 Broadcast Limited",
-        "TVTODAY.NS": "T.V. Today Network Limited",
-        "ZEEL.NS": "Zee Entertainment Enterprises Limited",
-        "ZEEMEDIA.NS": "Zee Media Corporation Limited"
-    },
-
-    "Building Materials & Fixtures": {
-        "ASAHIINDIA.NS": "ASAHI INDIA GLASS INR1",
-        "ASAHIINDIA.BO": "ASAHI INDIA GLASS LTD.",
-        "ASSOCER.BO": "ASSOCIATED CERAMICS LTD.",
-        "BOROSIL.BO": "Borosil Glass Works Limited",
-        "CANAGLS.BO": "CANA GLASS LTD.",
-        "DECOLIGHT-BE.NS": "DECOLIGHT CERAMICS INR10",
-        "DECOLIGHT.BO": "Decolight Ceramics Ltd.",
-        "DECOLIGHT.NS": "Decolight Ceramics Ltd.",
-        "DYNALMP.BO": "DYNA LAMPS & GLASS WORKS LTD.",
-        "EUROCERA.BO": "Euro Ceramics Ltd.",
-        "HALDYNGL.BO": "Haldyn Glass Ltd",
-        "HARYANSHET.BO": "HARYANA SHEET GLASS LTD.",
-        "HINDNATGLS.BO": "HINDUSTHAN NATIONAL GLASS & IN",
-        "HOTLINGLAS.BO": "HOTLINE GLASS LTD.",
-        "JAIMATAG.BO": "Jai Mata Glass Ltd.",
-        "KAJARIACER.BO": "KAJARIA CERAMICS LTD.",
-        "MURUDCERA.BO": "MURUDESHWAR CERAMICS LTD.",
-        "PRACERA.BO": "PRAKASH CERAMICS LTD.",
-        "REGENCERAM-BE.NS": "REGENCYCERAMICS-LTD",
-        "REGENCERAM.NS": "REGENCY CERAMICS INR10",
-        "REGENCERAM.BO": "REGENCY CERAMICS LTD.",
-        "RESTILE.BO": "Restile Ceramics Ltd.",
-        "SEZAL-BE.NS": "SEZAL GLASS INR10",
-        "SEZAL.NS": "SEZAL GLASS INR10",
-        "SEZAL.BO": "SEZAL GLASS LIMITED",
-        "SOMANYCERA.NS": "SOMANY CERAMICS LD INR2",
-        "SOMANYCERA.BO": "SOMANY CERAMICS LTD.",
-        "SPACI.BO": "SPARTEK CERAMICS INDIA LTD.",
-        "SUNEARTH.BO": "SUN EARTH CERAMICS LTD.",
-        "TRIVENIGQ.BO": "Triveni Glass",
-        "XCLGLASS.BO": "Excel Glasses Limited"
-    },
-
-    "Business Equipment": {
-        "KOKUYOCMLN.NS": "Kokuyo Camlin Limited",
-        "TODAYS.NS": "Todays Writing Instruments Limited"
-    },
-
-    "Business Services": {
-        "ALANKIT.NS": "Alankit Limited",
-        "ALLSEC.NS": "Allsec Technologies Limited",
-        "BODHTREE.BO": "Bodhtree Consulting Limited",
-        "CURATECH.NS": "CURA Technologies Limited",
-        "DATAMATICS.NS": "Datamatics Global Services Limited",
-        "ECLERX.NS": "eClerx Services Limited",
-        "FSL.NS": "Firstsource Solutions Limited",
-        "GKWLIMITED.NS": "GKW Limited",
-        "GROMOTRADE.BO": "Gromo Trade & Consultancy Ltd.",
-        "HEXATRADEX.NS": "Hexa Tradex Limited",
-        "HUSYS.NS": "Husys Consulting Limited",
-        "ISLCONSUL.BO": "ISL CONSULTING LTD.",
-        "KTIL.NS": "Kesar Terminals & Infrastructure Limited",
-        "NESCO.NS": "Nesco Limited",
-        "POLARIS.BO": "Polaris Consulting & Services Limited",
-        "RANCC.BO": "RANE COMPUTERS CONSULTANCY LTD",
-        "REPRO.NS": "Repro India Limited",
-        "TCS.BO": "Tata Consultancy Services Limited",
-        "ZLEENCON.BO": "LEENA CONSULTANCY LTD."
-    },
-
-    "Business Software & Services": {
-        "3IINFOTECH-BE.NS": "3I INFOTECH LTD.",
-        "3IINFOTECH.NS": "3I INFOTECH LTD INR10",
-        "3IINFOTECH.BO": "3I INFOTECH LTD.",
-        "8KMILES.NS": "8K MILES SOFTWARE INR5 (DEMAT)",
-        "8KMILES.BO": "8K MILES SOFTWARE SERVICES LTD",
-        "AASHEE.BO": "AASHEE INFOTECH LTD.",
-        "ACESOFT.BO": "Ace Software Exports Limited",
-        "AGCNET.NS": "AGC Networks Limited",
-        "AGSINFO.BO": "AGS INFOTECH LIMITED",
-        "AURIONPRO.NS": "aurionPro Solutions Limited",
-        "B2BSOFT.BO": "B2B Software Technologies Ltd.",
-        "BARONINF.BO": "Baron Infotech Limited",
-        "BLSINFOTE.BO": "BLS Infotech Ltd.",
-        "BLUESTINFO.NS": "BLUE STAR INFOTECH LIMITED",
-        "BLUESTINFO.BO": "Blue Star Infotech Ltd.",
-        "BLUESTINFO.NS": "Blue Star Infotech Ltd.",
-        "BOSTON.BO": "BOSTON EDUCATION AND SOFTWARE",
-        "CALSOFT-BE.NS": "CALIFORNIA SOFTWARE CO LT",
-        "CALSOFT.BO": "CALIFORNIA SOFTWARE CO.LTD.",
-        "CAUVERSOFT.BO": "CAUVERY SOFTWARE ENGINEERING S",
-        "CCSIN.BO": "CCS Infotech Ltd.",
-        "CGVAK.BO": "CG-VAK Software and Exports Limited",
-        "CHISO.BO": "CHICAGO SOFTWARE INDUSTRIES LT",
-        "CLIOINFO.BO": "Clio Infotech Limited",
-        "CMSINFO.BO": "CMS INFOTECH LTD.",
-        "COMPUSOFT.NS": "COMPUCOM SOFTWARE LIMITED",
-        "COMPUSOFT.BO": "COMPUCOM SOFTWARE LTD.",
-        "CRANESSOFT.BO": "CRANES SOFTWARE INTERNATIONAL",
-        "CRAZYINF.BO": "Crazy Infotech Ltd.",
-        "CRYSS.BO": "CRYSTAL SOFTWARE SOLUTIONS LTD",
-        "CYBERTECH.NS": "CYBERTECH SYSTEMS AND SOFTWARE",
-        "CYBERTECH.BO": "CYBERTECH SYSTEMS AND SOFTWARE",
-        "DATASOFT.BO": "Datasoft Application Software India Ltd.",
-        "DSQSOFT.BO": "DSQ SOFTWARE LTD.",
-        "ECOM.BO": "E.com Infotech India Ltd.",
-        "ENCORE.BO": "Encore Software Ltd.",
-        "ESTAR.BO": "E.STAR INFOTECH LTD.",
-        "EUROSOFTAL.BO": "EUROPEAN SOFTWARE ALLIANCES LT",
-        "FCSSOFT.NS": "FCS SOFTWARE SOLUT INR1",
-        "FCSSOFT.BO": "FCS Software Solutions Limited",
-        "FUNNY.BO": "Funny Software Limited",
-        "GOPLEEIN.BO": "Goplee Infotech Ltd.",
-        "GSS-BE.NS": "GSS INFOTECH LTD INR10",
-        "GSS.BO": "GSS INFOTECH LTD.",
-        "IBINFO.BO": "IB Infotech Enterprises Limited",
-        "INDINFO.BO": "Indian Infotech & Software Ltd.",
-        "INDOCITY.BO": "Indo-City Infotech Limited",
-        "INFODRIVE.BO": "INFO-DRIVE SOFTWARE LTD.",
-        "INSOE.BO": "Innovation Software Exports Ltd.",
-        "IQINF.BO": "IQ INFOTECH LTD.",
-        "KEDIN.BO": "KEDIA INFOTECH LTD.",
-        "KELLTONTEC.NS": "Kellton Tech Solutions Limited",
-        "LCCINFOTEC-BE.NS": "LCC INFOTECH INR2",
-        "LCCINFOTEC.NS": "LCC INFOTECH INR2",
-        "LCCINFOTEC.BO": "LCC INFOTECH LTD.",
-        "LEENEE.BO": "Lee & Nee Softwares (Exports) Ltd.",
-        "MAARSOFTW.BO": "MAARS SOFTWARE INTERNATIONAL L",
-        "MELSTAR.NS": "Melstar Information Technologies Limited",
-        "MONINFO.BO": "MONALISA INFOTECH LTD.",
-        "NEXUSSOF.BO": "NEXUS SOFTWARE LTD.",
-        "NUCLEUS.BO": "NUCLEUS SOFTWARE EXPORTS LTD.",
-        "OFSS.NS": "Oracle Financial Services Software Limited",
-        "OMNIAX.BO": "Omni Ax's Software Limited",
-        "PARLESOFT.BO": "Parle Software Limited",
-        "PERSISTENT.NS": "Persistent Systems Limited",
-        "PFLINFOTC.BO": "PFL Infotech Ltd",
-        "POLARIS.NS": "Polaris Consulting & Services Limited",
-        "QPRO.BO": "QPRO INFOTECH LTD.",
-        "RANSISOF.BO": "RANSI SOFTWARE (INDIA) LTD.",
-        "RSSOFTWARE.BO": "R.S.SOFTWARE INDIA LTD.",
-        "SANKHYAIN.BO": "Sankhya Infotech Ltd.",
-        "SANVAN.BO": "SANVAN SOFTWARE LTD.",
-        "SARITASO.BO": "SARITA SOFTWARE & INDUSTRIES L",
-        "SCINTSOFT.BO": "SCINTILLA SOFTWARE TECHNOLOGY",
-        "SHELLIN.BO": "SHELL INFOTECH LTD.",
-        "SIBARSOF.BO": "SIBAR SOFTWARE SERVICES (INDIA",
-        "SILICON.BO": "Silicon Valley Infotech Limited",
-        "SOFTTECHGR.NS": "SOFTWARE TECH GP INR10",
-        "SOFTTECHGR.BO": "SOFTWARE TECHNOLOGY GROUP INTE",
-        "SONATSOFTW.NS": "SONATA SOFTWARE INR1",
-        "SONATSOFTW.BO": "SONATA SOFTWARE LTD.",
-        "SONATSOFTW.NS": "Sonata Software Limited",
-        "SRGINFOTEC-BE.NS": "SRGINFOTECH (INDIA) LTD.",
-        "SSLFINANCE.BO": "ARCHANA SOFTWARE LTD.",
-        "SVAMSOF.BO": "Svam Software Ltd.",
-        "SYSTELIN.BO": "SYSTEL INFOTECH LTD.",
-        "TELESYS.BO": "TELESYS SOFTWARE LTD.",
-        "TERASOFT.BO": "Tera Software Ltd.",
-        "TRANSCON.BO": "TRANSCON RESEARCH & INFOTECH L",
-        "UNISH.BO": "Unisys Softwares & Holdings Industries Limited",
-        "VALUEMART.BO": "Valuemart Info Technologies Ltd.",
-        "WASHISOF.BO": "WASHINGTON SOFTWARES LTD.",
-        "WATSSOFT.BO": "WATSON SOFTWARE LTD.",
-        "ZENITHINFO.BO": "ZENITH INFOTECH LTD.",
-        "ZIGMASOF.BO": "ZIGMA SOFTWARE LTD."
-    },
-
-    "CATV Systems": {
-        "DISHTV.NS": "Dish TV India Limited",
-        "HATHWAY.NS": "Hathway Cable & Datacom Limited",
-        "HINDUJAVEN.NS": "Hinduja Ventures Limited",
-        "ORTEL.NS": "Ortel Communications Limited"
-    },
-
-    "Cement & Aggregates": {
-        "AMBUJACEM.BO": "AMBUJA CEMENTS LTD.",
-        "ANDHRACEMT.NS": "ANDHRA CEMENTS INR10",
-        "ANDHRACEMT.BO": "ANDHRA CEMENTS LTD.",
-        "BHEEMACEM.BO": "Bheema Cements Ltd",
-        "BURNPUR.NS": "BURNPUR CEMENT LTD INR10",
-        "BURNPUR.BO": "Burnpur Cement Ltd.",
-        "BVCL.BO": "Barak Valley Cement Ltd.",
-        "DECCANCE.BO": "Deccan Cements Ltd.",
-        "FEROCON.BO": "FERRO CONCRETE CO.(INDIA) LTD.",
-        "GANGCEM.BO": "GANGOTRI CEMENT LTD.",
-        "GSCLCEMENT.BO": "GUJARAT SIDHEE CEMENT LTD.",
-        "HEIDELBERG.NS": "HEIDELBERGCEMENT INDIA LIMITED",
-        "HEIDELBERG.BO": "HEIDELBERGCEMENT INDIA LTD.",
-        "HEMACEM.BO": "HEMADRI CEMENTS LTD.",
-        "INDCEMCAP.BO": "India Cements Capital Ltd.",
-        "INDIACEM.BO": "The India Cements Limited",
-        "ITDCEM.BO": "ITD Cementation India Limited",
-        "JKCEMENT.NS": "JK CEMENT LIMITED",
-        "JKCEMENT.BO": "J.K.CEMENT LTD.",
-        "JKLAKSHMI.BO": "JK Lakshmi Cement Limited",
-        "KATWAUD.BO": "Shri Keshav Cements and Infra Limited",
-        "KLYNCEM.BO": "Kalyanpur Cements Ltd.",
-        "LKSMCEM.BO": "LAKSHMI CEMENT & CERAMICS LTD.",
-        "MAHNDCM.BO": "MAHENDRA CEMENTS LTD.",
-        "MANGLMCEM.BO": "MANGALAM CEMENT LTD.",
-        "NIRAJ.BO": "Niraj Cement Structurals Ltd",
-        "NIRMANC.BO": "NIRMAN CEMENTS LTD.",
-        "ORIENTCEM.NS": "ORIENT CEMENT LTD INR1",
-        "ORIENTCEM.BO": "ORIENT CEMENT LTD",
-        "PANCHCE.BO": "PANCHAMAHAL CEMENT LTD.",
-        "PRCEM.BO": "P.R.CEMENTS LTD.",
-        "PRISMCEM.BO": "Prism Cement Limited",
-        "RAMCOCEM.NS": "RAMCO CEMENTS(THE) INR1",
-        "RAMCOCEM.BO": "THE RAMCO CEMENTS LIMITED",
-        "RAMCOCEM.NS": "The Ramco Cements Limited",
-        "RCCEMEN.BO": "RCC CEMENTS LTD.",
-        "SAGCEM.NS": "SAGAR CEMENTS LIMITED",
-        "SAGCEM.BO": "SAGAR CEMENTS LTD.",
-        "SAGCEM.NS": "Sagar Cements Limited",
-        "SANGHAS.BO": "SANGHVI ASBESTOS CEMENTS LTD.",
-        "SAURASHCEM.BO": "Saurashtra Cement Ltd.",
-        "SFCL.BO": "STAR FERRO AND CEMENT LTD",
-        "SHIVACEM.BO": "Shiva Cement Ltd.",
-        "SHREDIGCEM.BO": "SHREE DIGVIJAY CEMENT CO.LTD.",
-        "SHREECEM.BO": "Shree Cement Limited",
-        "SOMANCM.BO": "SOMANI CEMENT COMPANY LTD.",
-        "SRICC.BO": "Sri Chakra Cement Limited",
-        "TRINETRA.BO": "TRINETRA CEMENT LTD.",
-        "UDAICEMENT.BO": "UDAIPUR CEMENT WORKS LTD.",
-        "VAICC.BO": "Vaishno Cement Company Limited",
-        "VARDHMAN.BO": "VARDHMAN CONCRETE LIMITED"
-    },
-
-    "Chemicals - Major Diversified": {
-        "ABCIL.NS": "ADITYA BIRLA CHEMICALS (INDIA)",
-        "ABCIL.BO": "Aditya Birla Chemicals (India) Limited",
-        "ABCIL.NS": "Aditya Birla Chemicals (India) Limited",
-        "ADARCHM.BO": "ADARSH CHEMICALS & FERTILIZERS",
-        "ADVPETR-B.BO": "Advance Petrochemicals Ltd.",
-        "ALKYLAMINE.BO": "ALKYL AMINES CHEMICALS LTD.",
-        "ANDHRAPET.BO": "ANDHRA PETROCHEMICALS LTD.",
-        "ANDHRSUGAR.NS": "The Andhra Sugars Limited",
-        "ASAHISONG.NS": "Asahi Songwon Colors Limited",
-        "ASIANPAINT.BO": "Asian Paints Limited",
-        "ASSAPET.BO": "ASSAM PETROCHEMICALS LTD.",
-        "ASTEC.NS": "Astec LifeSciences Limited",
-        "ATUL.NS": "Atul Ltd",
-        "BARIUMC.BO": "BARIUM CHEMICALS LTD.",
-        "BASF.NS": "BASF India Limited",
-        "BEPL.NS": "Bhansali Engineering Polymers Limited",
-        "BERGEPAINT.NS": "BERGER PAINTS (I) LIMITED",
-        "BERGEPAINT.BO": "Berger Paints India Limited",
-        "BHAGCHEM.BO": "Bhagiradha Chemicals & Industries Ltd.",
-        "BODALCHEM.NS": "BODAL CHEMICALS INR2.00",
-        "BODALCHEM.BO": "Bodal Chemicals Ltd.",
-        "BOMDYEING.NS": "BOMBAY DYEING & MFG COMPANY LIM",
-        "BOMDYEING.BO": "BOMBAY DYEING & MFG.CO.LTD.",
-        "CANVYCH.BO": "CANVAY CHEMICALS LTD.",
-        "CAPRO.BO": "Caprolactam Chemicals Limited",
-        "CHAMBLFERT.BO": "CHAMBAL FERTILISERS & CHEMICAL",
-        "CHDCHEM.BO": "CHD Chemicals Limited",
-        "CHEMBOND.BO": "Chembond Chemicals Ltd.",
-        "CHIPLUN.BO": "CHIPLUN FINE CHEMICALS LTD.",
-        "CITURGIA.BO": "CITURGIA BIOCHEMICALS LTD.",
-        "CLNINDIA.BO": "CLARIANT CHEMICALS (INDIA) LTD",
-        "CNOVAPETRO.BO": "CIL NOVA PETROCHEMICALS LTD.",
-        "CONTCHM.BO": "Continental Chemicals Limited",
-        "DAIKAFFI.BO": "Daikaffil Chemicals India Limited",
-        "DCW.NS": "DCW Limited",
-        "DEEPAKFERT.BO": "Deepak Fertilisers And Petrochemicals Corporation Limited",
-        "DHARAMSI.BO": "Dharamsi Morarji Chemical Co. Ltd.",
-        "DHARSUGAR.NS": "DHARANI SUGARS & CHEMICALS LIMI",
-        "DHARSUGAR.BO": "DHARANI SUGARS & CHEMICALS LTD",
-        "DIAMINESQ.BO": "Diamines & Chemicals Ltd",
-        "DICIND.NS": "DIC India Limited",
-        "DRAVIND.BO": "DRAVYA INDUSTRIAL CHEMICALS LT",
-        "DUJODPPR.BO": "Dujodwala Paper Chemicals Ltd.",
-        "EMPEESUG.BO": "EMPEE SUGARS & CHEMICALS LTD.",
-        "FACT.NS": "FERTILIZERS AND CHEMICALS TRAVA",
-        "FACT.BO": "FERTILIZERS & CHEMICALS TRAVAN",
-        "FCL.NS": "FINEOTEX CHEMICAL INR2",
-        "FCL.BO": "FINEOTEX CHEMICAL LTD.",
-        "FCL.NS": "Fineotex Chemical Limited",
-        "FOSECOIND.NS": "Foseco India Limited",
-        "GARODCH.BO": "GARODIA CHEMICALS LTD.",
-        "GHCL.NS": "GHCL Limited",
-        "GNFC.BO": "Gujarat Narmada Valley Fertilizers & Chemicals Limited",
-        "GOODYEAR.BO": "GOODYEAR INDIA LTD.",
-        "GSFC.BO": "Gujarat State Fertilizers & Chemicals Ltd.",
-        "GSLNOVA.BO": "GSL Nova Petrochemicals Limited",
-        "GUJALKALI.BO": "Gujarat Alkalies and Chemicals Limited",
-        "GUJALKALI.NS": "Gujarat Alkalies and Chemicals Limited",
-        "GUJFLUORO.BO": "Gujarat Fluorochemicals Limited",
-        "GUJFLUORO.NS": "Gujarat Fluorochemicals Limited",
-        "GULPOLY.NS": "Gulshan Polyols Limited",
-        "HARLETH.BO": "Haryana Leather Chemicals, Ltd.",
-        "HARSCHM.BO": "HARSHVARDHAN CHEMICALS & MINER",
-        "HCIL.NS": "HIMADRI CHEMICALS AND INDUSTRIE",
-        "HCIL.NS": "Himadri Speciality Chemical Limited",
-        "HIKAL.NS": "Hikal Limited",
-        "HOCL.NS": "HINDUSTAN ORGANIC CHEMICALS LIM",
-        "HOCL.BO": "HINDUSTAN ORGANIC CHEMICALS LT",
-        "HOCL.NS": "Hindustan Organic Chemicals Limited",
-        "IGPL.NS": "IG PETROCHEMICALS LIMITED",
-        "IGPL.BO": "I G PETROCHEMICALS LTD.",
-        "INDELTC.BO": "INDIAN ELECTRO CHEMICALS LTD.",
-        "INDGELA.BO": "India Gelatine & Chemicals Ltd.",
-        "INDIAGLYCO.NS": "India Glycols Limited",
-        "INDOBORAX.BO": "Indo Borax & Chemicals Ltd.",
-        "INDUNISS.BO": "INDU NISSAN OXO-CHEMICAL INDUS",
-        "ISHANCH.BO": "ISHAN DYES & CHEMICALS LTD.",
-        "JAYCH.BO": "Jayshree Chemicals Ltd.",
-        "JAYSYN.BO": "Jaysynth Dyestuff India Ltd.",
-        "JOCIL.NS": "Jocil Limited",
-        "KAMAR.BO": "KAMAR CHEMICALS & INDUSTRIES L",
-        "KANORICHEM.BO": "KANORIA CHEMICALS & INDUSTRIES",
-        "KANORICHEM.NS": "Kanoria Chemicals & Industries Limited",
-        "KANSAINER.NS": "KANSAI NEROLAC PAINTS LIMITED",
-        "KANSAINER.BO": "KANSAI NEROLAC PAINTS LTD.",
-        "KEDIACHE.BO": "KEDIA CHEMICAL INDUSTRIES LTD.",
-        "KHAICHEM.BO": "Khaitan Chemicals & Fertilizers Ltd.",
-        "KILBURNC.BO": "Kilburn Chemicals Limited",
-        "KINGCHD.BO": "KINGS CHEMICALS & DISTILLERIES",
-        "KOTHARIPET.NS": "Kothari Petrochemicals Limited",
-        "KREBSBIO.BO": "Krebs Biochemicals & Industries Ltd",
-        "LAFFANSQ.BO": "Laffans Petrochemicals Limited",
-        "LIMECHM.BO": "Lime Chemicals Limited",
-        "LORDSCH.BO": "LORDS CHEMICALS LTD.",
-        "MAFATDY.BO": "MAFATLAL DYES & CHEMICALS LTD.",
-        "MAHENPET.BO": "MAHENDRA PETROCHEMICALS LTD.",
-        "MANALIPETC.BO": "MANALI PETROCHEMICAL LTD.",
-        "MANALIPETC.NS": "Manali Petrochemicals Limited",
-        "MASCH.BO": "MASTER CHEMICALS LTD.",
-        "MEHTARB.BO": "MEHTA RUBBER CHEMICALS LTD.",
-        "MUNKCHM.BO": "MUNAK CHEMICALS LTD.",
-        "NAVINFLUOR.NS": "Navin Fluorine International Limited",
-        "NOCIL.NS": "NOCIL Limited",
-        "NPNTCHM.BO": "NARIMAN POINT CHEMICAL INDUSTR",
-        "OMKARCHEM.NS": "OMKAR SPECIALITY CHEMICALS LIMI",
-        "OMKARCHEM.BO": "OMKAR SPECIALITY CHEMICALS LTD",
-        "OMNDE.BO": "OMNI DYE-CHEM EXPORTS LTD.",
-        "ORGCOAT.BO": "Organic Coatings Ltd.",
-        "ORIACID.BO": "ORION ACIDS & CHEMICALS LTD.",
-        "ORIENTCQ.BO": "Oriental Carbon & Chemicals Limited",
-        "PACL.BO": "Punjab Alkalies and Chemicals Ltd.",
-        "PHILIPCARB.NS": "Phillips Carbon Black Limited",
-        "PINKCHM.BO": "PINKY CHEMICALS LTD.",
-        "PNTXCHM.BO": "PAINTEX CHEMICALS (BOMBAY) LTD",
-        "PODARPIGQ.BO": "Poddar Pigments Limited",
-        "PONDYOXIDE.BO": "PONDY OXIDES & CHEMICALS LTD.",
-        "PRATIKSH.BO": "Pratiksha Chemicals Limited",
-        "PUNJABCHEM.BO": "PUNJAB CHEMICALS AND CROP PROT",
-        "PUNJABCHEM.NS": "Punjab Chemicals and Crop Protection Limited",
-        "RAIN.NS": "Rain Industries Limited",
-        "RAJSREESUG.BO": "RAJSHREE SUGARS & CHEMICALS LT",
-        "RAMAPETRO.BO": "RAMA PETROCHEMICALS LTD.",
-        "RCF.BO": "Rashtriya Chemicals And Fertilizers Limited",
-        "REFEX.NS": "Refex Industries Limited",
-        "REFNOL.BO": "Refnol Resins & Chemicals Ltd.",
-        "RENCHEM.BO": "RENCAL CHEMICALS (INDIA) LTD.",
-        "RGNTCHM.BO": "REGENT CHEMICALS LTD.",
-        "RMCHEM.BO": "RAM MINERALS AND CHEMICALS LIM",
-        "ROCKHARD.BO": "ROCK HARD PETROCHEMICAL INDUST",
-        "RSPETRO.BO": "R.S.PETROCHEMICALS LTD.",
-        "SAPANCHEM.BO": "Sapan Chemicals Ltd.",
-        "SARCHEM.BO": "SARANG CHEMICALS LTD.",
-        "SARIPNT.BO": "SARIKA PAINTS LTD.",
-        "SATALMS.BO": "SAATAL KATTHA & CHEMICALS LTD.",
-        "SHABCHM.BO": "SHABA CHEMICALS LTD.",
-        "SHACIDS.BO": "SHREE ACIDS & CHEMICALS LTD.",
-        "SHALPAINTS.NS": "SHALIMAR PAINTS LIMITED",
-        "SHALPAINTS.BO": "SHALIMAR PAINTS LTD.",
-        "SHALPAINTS.NS": "Shalimar Paints Limited",
-        "SHDYECH.BO": "SHREEJI DYE-CHEM LTD.",
-        "SHENTRA.BO": "SHENTRACON CHEMICALS LTD.",
-        "SHHARICH.BO": "Shree Hari Chemicals Export Limited",
-        "SHREEPUSHK.BO": "Shree Pushkar Chemicals & Fert",
-        "SHREEPUSHK.NS": "Shree Pushkar Chemicals & Fertilisers Limited",
-        "SHRISHM.BO": "SHRISHMA FINE CHEMICALS & PHAR",
-        "SMDYECH.BO": "SM DYECHEM LTD.",
-        "SOUTHMG.BO": "Southern Magnesium and Chemicals Limited",
-        "SPANDYE.BO": "SPAN DYESTUFF INDUSTRIES LTD.",
-        "SPIC.NS": "SOUTHERN PETROCHEMICALS INDUSTR",
-        "SPIC.BO": "SOUTHERN PETROCHEMICALS LTD.",
-        "SREERAYA.BO": "Sree Rayalaseema Alkalies & Allied Chemicals Ltd.",
-        "SRHHYPOLTD.NS": "Sree Rayalaseema Hi-Strength Hypo Limited",
-        "SUDARSCHEM.BO": "SUDARSHAN CHEMICAL INDUSTRIES",
-        "SUKHJITS.BO": "Sukhjit Starch & Chemicals Ltd.",
-        "SUMEXCH.BO": "SUMEX CHEMICALS LTD.",
-        "SUNITEE.BO": "Sunitee Chemicals Ltd.",
-        "SUNSHIEL.BO": "Sunshield Chemicals Ltd.",
-        "SUPPETRO.NS": "Supreme Petrochem Limited",
-        "SURCHIN.BO": "Surabhi Chemicals and Investments Ltd.",
-        "SYNTHCHEM.BO": "SYNTHETICS & CHEMICALS LTD.",
-        "TAINWALCHM.BO": "TAINWALA CHEMICALS & PLASTICS",
-        "TATACHEM.BO": "Tata Chemicals Limited",
-        "TATACHEM.NS": "Tata Chemicals Limited",
-        "TIRUMALCHM.BO": "THIRUMALAI CHEMICALS LTD.",
-        "TIRUSTA.BO": "Tirupati Starch & Chemicals Ltd.",
-        "TNPETRO.NS": "Tamilnadu Petroproducts Limited",
-        "TUTIALKA.BO": "Tuticorin Alkali Chemicals and Fertilisers Limited",
-        "ULTRAMAR.BO": "Ultramarine & Pigments Ltd.",
-        "VIDHIDYE.BO": "Vidhi Dyestuffs Manufacturing Ltd.",
-        "VINATIORGA.NS": "Vinati Organics Limited",
-        "VINYLINDIA.NS": "VINYL CHEMICALS(IN INR1",
-        "VINYLINDIA.BO": "VINYL CHEMICALS (INDIA) LTD.",
-        "VIPULDYE.BO": "Vipul Dye Chem Ltd.",
-        "VISHNU.NS": "VISHNU CHEMICALS L INR10",
-        "VISHNU.BO": "Vishnu Chemicals Limited",
-        "VITACHM-B.BO": "VITARA CHEMICALS LTD.",
-        "ZSAMPACH.BO": "SAMPADA CHEMICALS LTD.",
-        "ZSOMESCE.BO": "SOMESHWARA CEMENTS & CHEMICALS"
-    },
-
-    "Communication Equipment": {
-        "AKSHOPTFBR.NS": "Aksh Optifibre Limited",
-        "ASTRAMICRO.NS": "Astra Microwave Products Limited",
-        "DLINKINDIA.NS": "D-Link (India) Limited",
-        "GEMINI.NS": "Gemini Communication Limited",
-        "GTLINFRA.NS": "GTL Infrastructure Limited",
-        "HFCL.NS": "Himachal Futuristic Communications Limited",
-        "ITI.NS": "ITI Limited",
-        "KAVVERITEL.NS": "Kavveri Telecom Products Limited",
-        "MRO-TEK.NS": "MRO-TEK Realty Limited",
-        "NELCO.NS": "Nelco Limited",
-        "PARACABLES.NS": "Paramount Communications Limited",
-        "SHYAMTEL.NS": "Shyam Telecom Limited",
-        "SMARTLINK.NS": "Smartlink Network Systems Limited",
-        "SPICEMOBI.NS": "Spice Mobility Limited",
-        "STRTECH.NS": "Sterlite Technologies Limited",
-        "TNTELE.NS": "Tamilnadu Telecommunications Limited",
-        "VINDHYATEL.NS": "Vindhya Telelinks Limited"
-    },
-
-    "Communication Technology": {
-        "AISHWARYA.BO": "Aishwarya Technologies and Telecom Limited",
-        "FINCOM.BO": "Fintech Communication Limited",
-        "SASKEN.BO": "Sasken Communication Technologies Limited"
-    },
-
-    "Computer Based Systems": {
-        "CEREBRAINT.NS": "Cerebra Integrated Technologies Limited",
-        "HCL-INSYS.NS": "HCL Infosystems Limited",
-        "TVSELECT.NS": "TVS Electronics Limited"
-    },
-
-    "Confectioners": {
-        "BAJAJHIND.NS": "Bajaj Hindusthan Sugar Limited",
-        "BALRAMCHIN.NS": "Balrampur Chini Mills Limited",
-        "BANARISUG.NS": "Bannari Amman Sugars Limited",
-        "DALMIASUG.NS": "Dalmia Bharat Sugar and Industries Limited",
-        "DWARKESH.NS": "Dwarikesh Sugar Industries Limited",
-        "EIDPARRY.NS": "E.I.D.-Parry (India) Limited",
-        "KCPSUGIND.NS": "K.C.P. Sugar and Industries Corporation Limited",
-        "KHAITANLTD.NS": "Khaitan (India) Limited",
-        "KMSUGAR.NS": "K M Sugar Mills Limited",
-        "KOTARISUG.NS": "Kothari Sugars and Chemicals Limited",
-        "MAWANASUG.NS": "Mawana Sugars Limited",
-        "OUDHSUG.NS": "The Oudh Sugar Mills Limited",
-        "PARRYSUGAR.NS": "Parrys Sugar Industries Limited",
-        "PONNIERODE.NS": "Ponni Sugars (Erode) Limited",
-        "RAJSREESUG.NS": "Rajshree Sugars and Chemicals Limited",
-        "RANASUG.NS": "Rana Sugars Limited",
-        "RENUKA.NS": "Shree Renuka Sugars Limited",
-        "SAKHTISUG.NS": "Sakthi Sugars Limited",
-        "SIMBHALS.NS": "Simbhaoli Sugars Limited",
-        "SKMEGGPROD.NS": "SKM Egg Products Export (India) Limited",
-        "THIRUSUGAR.NS": "Thiru Arooran Sugars Limited",
-        "TRIVENI.NS": "Triveni Engineering & Industries Limited",
-        "UGARSUGAR.NS": "The Ugar Sugar Works Limited",
-        "UPERGANGES.NS": "Upper Ganges Sugar & Industries Limited"
-    },
-
-    "Conglomerates": {
-        "3MINDIA.NS": "3M India Limited",
-        "ABIRLANUVO.NS": "Aditya Birla Nuvo Limited",
-        "ALCHEM.NS": "Alchemist Limited",
-        "BALMLAWRIE.NS": "Balmer Lawrie & Co. Limited",
-        "DCMSHRIRAM.NS": "DCM Shriram Limited",
-        "HOTELRUGBY.NS": "Hotel Rugby Limited",
-        "MANAKSIA.NS": "Manaksia Limited",
-        "SHK.NS": "S H Kelkar and Company Limited",
-        "WELENT.NS": "Welspun Enterprises Limited"
-    },
-
-    "Copper": {
-        "CUBEXTUB.NS": "Cubex Tubings Limited",
-        "HINDCOPPER.NS": "Hindustan Copper Limited",
-        "PRECWIRE.NS": "Precision Wires India Ltd."
-    },
-
-    "Credit Services": {
-        "ALFL.BO": "Abhinav Leasing & Finance Limi",
-        "AMULEAS.BO": "Amulya Leasing & Finance Ltd.",
-        "ANANDCR.BO": "ANAND CREDIT LTD.",
-        "APOORVA.BO": "Apoorva Leasing Finance & Inve",
-        "APPLECREDT.BO": "APPLE CREDIT CORPORATION LTD.",
-        "ARIAC.BO": "Arihant Avenues & Credit Limited",
-        "ASHIKACR.BO": "ASHIKA CREDIT CAPITAL LTD.",
-        "BAJFINANCE.NS": "Bajaj Finance Limited",
-        "BALFC.BO": "Baid Leasing & Finance Co Ltd",
-        "BHAGYFN.BO": "Bhagyashree Leasing & Finance Ltd",
-        "BLFL.BO": "Boston Leasing and Finance Ltd",
-        "BRIJLEAS.BO": "Brijlaxmi Leasing & Finance Ltd.",
-        "CAPF.NS": "Capital First Limited",
-        "CARERATING.NS": "CREDIT ANALYSIS AND RESEARCH LI",
-        "CGCL.NS": "Capri Global Capital Limited",
-        "CHOLAFIN.NS": "Cholamandalam Investment and Finance Company Limited",
-        "CONCRETE.BO": "CONCRETE CREDIT LIMITED",
-        "DELTALTD.BO": "DELTA LEASING & FINANCE LTD.",
-        "DEVKI.BO": "Devki Leasing & Finance Ltd",
-        "EKAMLEA.BO": "Ekam Leasing & Finance Company Ltd",
-        "EMERALD.BO": "Emerald Leasing Finance & Inve",
-        "FINCR.BO": "Finalysis Credit & Guarantee Co. Ltd.",
-        "GANDLEA.BO": "GANDHINAGAR LEASING & FINANCE",
-        "GDLLEAS.BO": "GDL Leasing & Finance Ltd",
-        "GEETANJ.BO": "Geetanjali Credit And Capital",
-        "GLFL.NS": "Gujarat Lease Financing Limited",
-        "GOLDLEG.BO": "Golden Legand Leasing and Finance Limited",
-        "GOWRALE.BO": "Gowra Leasing & Finance Ltd.",
-        "GUJCCPP.BO": "GUJ CREDITPP",
-        "GUJCRED.BO": "Gujarat Credit Corporation Limited",
-        "HBLEAS.BO": "HB Leasing & Finance Co. Ltd.",
-        "IDFC.NS": "IDFC Limited",
-        "IFCI.NS": "IFCI Limited",
-        "IITL.NS": "Industrial Investment Trust Limited",
-        "INDIAHOME.BO": "India Home Loan Limited",
-        "INDOCRED.BO": "Indo Credit Capital Ltd",
-        "JAGSONFI.BO": "Jagsonpal Finance & Leasing Ltd",
-        "JAYBHCR.BO": "Jayabharat Credit Ltd",
-        "JHACC.BO": "Jhaveri Credits & Capital Ltd.",
-        "KWALITY.BO": "Kwality Credit & Leasing Ltd",
-        "KWALITYCL.BO": "KWALITY CREDIT & LEASING LTD.",
-        "KZLFIN.BO": "KZ Leasing & Finance Ltd.",
-        "L&TFH.NS": "L&T Finance Holdings Limited",
-        "LKSMITR.BO": "LAKSHMI TRADE CREDITS LTD.",
-        "M&MFIN.NS": "Mahindra & Mahindra Financial Services Limited",
-        "MAGMA.NS": "Magma Fincorp Limited",
-        "MANAPPURAM.NS": "Manappuram Finance Limited",
-        "MANCREDIT.BO": "MANGAL CREDIT AND FINCORP LTD.",
-        "MUTHOOTFIN.NS": "Muthoot Finance Limited",
-        "NICCOUCO.BO": "Nicco Uco Alliance Credit Limited",
-        "OCTAL.BO": "Octal Credit Capital Ltd.",
-        "ORACLECR.BO": "Oracle Credit Limited",
-        "PALCRED.BO": "Pal Credit & Capital Limited",
-        "PARNAMI.BO": "PARNAMI CREDITS LTD",
-        "PFC.NS": "Power Finance Corporation Limited",
-        "RECLTD.NS": "Rural Electrification Corporation Limited",
-        "RLFL.BO": "RAMCHANDRA LEASING & FINANCE L",
-        "SATIN-.NS": "SATIN CREDIT CARE NETWORK LTD S",
-        "SATIN-BE.NS": "Satin Credit Net Ltd",
-        "SATIN-BL.NS": "SATIN CREDIT CARE INR10",
-        "SATIN-BT.NS": "SATIN CREDIT CARE INR10",
-        "SATIN.NS": "SATIN CREDIT CARE INR10",
-        "SATIN-IL.NS": "SATIN CREDIT CARE INR10",
-        "SATIN-IQ.NS": "SATIN CREDIT CARE INR10",
-        "SATIN-RL.NS": "SATIN CREDIT CARE INR10",
-        "SATIN.BO": "SATIN CREDITCARE NETWORK LIMIT",
-        "SATIN.NS": "Satin Creditcare Network Limited",
-        "SCC.BO": "Scintilla Commercial & Credit",
-        "SEINV.NS": "S.E. Investments Limited",
-        "SHRINIWAS.BO": "Shri Niwas Leasing and Finance",
-        "SHRIRAMCIT.NS": "Shriram City Union Finance Limited",
-        "SHUBHRA.BO": "SHUBHRA LEASING FINANCE AND IN",
-        "SHVFL.BO": "SHREEVATSAA FINANCE & LEASING",
-        "SMCREDT.BO": "SMC CREDITS LTD.",
-        "SRTRANSFIN.NS": "Shriram Transport Finance Company Limited",
-        "SUNDARMFIN.NS": "Sundaram Finance Limited",
-        "TCIFINANCE.NS": "TCI Finance Limited",
-        "TFCILTD.NS": "Tourism Finance Corporation of India Limited",
-        "UNITDCR.BO": "United Credit Ltd",
-        "VHL.NS": "Vardhman Holdings Limited",
-        "VOLLF.BO": "Voltaire Leasing & Finance Ltd."
-    },
-
-    "Data Storage Devices": {
-        "EUROMULTI.NS": "Euro Multivision Limited",
-        "MOSERBAER.NS": "Moser Baer India Limited"
-    },
-
-    "Department Stores": {
-        "SHOPERSTOP.NS": "Shoppers Stop Limited",
-        "V2RETAIL.NS": "V2 Retail Limited",
-        "VMART.NS": "V-Mart Retail Limited"
-    },
-
-    "Diversified Electronics": {
-        "ALACRIEL.BO": "ALACRITY ELECTRONICS LTD.",
-        "APARINDS.NS": "Apar Industries Limited",
-        "ASIANELEC-BZ.NS": "ASIAN ELECTRONIC LTD",
-        "ASIANELEC.BO": "ASIAN ELECTRONICS LTD.",
-        "BEELE.BO": "BEE ELECTRONIC MACHINES LTD.",
-        "BEL.BO": "Bharat Electronics Limited",
-        "BHAGYNAGAR.NS": "Bhagyanagar India Limited",
-        "CENTUM.NS": "CENTUM ELECTRONICS INR10",
-        "CENTUM.BO": "Centum Electronics Limited",
-        "CENTUM.NS": "Centum Electronics Limited",
-        "CORDSCABLE.NS": "Cords Cable Industries Limited",
-        "DENORA.NS": "De Nora India Limited",
-        "DLTNCBL.BO": "Delton Cables Limited",
-        "ELITE-IT.NS": "Elite Conductors Limited",
-        "EVEREADY.NS": "Eveready Industries India Limited",
-        "FINCABLES.NS": "FINOLEX CABLES LIMITED",
-        "FINCABLES.BO": "Finolex Cables Ltd.",
-        "FINCABLES.NS": "Finolex Cables Limited",
-        "FINCABLES6.BO": "FINCABLES6.BO",
-        "GEMCABLE.BO": "GEM CABLES & CONDUCTORS LTD.",
-        "GENUSPOWER.NS": "Genus Power Infrastructures Limited",
-        "GRCABLE.BO": "GR Cables Ltd.",
-        "GUJPE.BO": "GUJARAT PERSTORP ELECTRONICS L",
-        "GUJPOLYA.BO": "Gujarat Poly Avx Electronics Ltd.",
-        "HBLPOWER.NS": "HBL Power Systems Limited",
-        "HEG.NS": "HEG Limited",
-        "HINDWRS.BO": "Hindustan Wires Limited",
-        "HIRECT.NS": "Hind Rectifiers Limited",
-        "INDOTECH.NS": "Indo Tech Transformers Limited",
-        "JCTEL.NS": "JCT ELECTRONICS INR1.00",
-        "JCTEL.BO": "JCT ELECTRONICS LTD.",
-        "JCTEL.NS": "JCT Electronics Limited",
-        "KEI.NS": "KEI Industries Limited",
-        "KHNDHER.BO": "KHANDELWAL HERMANN ELECTRONICS",
-        "LALITPL.BO": "LALIT POLYMERS & ELECTRONICS L",
-        "LINAKS.BO": "Linaks Microelectronics Ltd.",
-        "MIC.BO": "MIC Electronics Limited",
-        "MIC.NS": "MIC Electronics Limited",
-        "MIRCELECTR.NS": "MIRC ELECTRONICS INR1",
-        "MIRCELECTR.BO": "MIRC ELECTRONICS LTD.",
-        "MONEL.BO": "MONICA ELECTRONICS LTD.",
-        "NIPPOBATRY.NS": "Indo National Limited",
-        "PANELEC.BO": "Pan Electronics India Ltd.",
-        "PEARLELEC.BO": "MYSTIC ELECTRONICS LIMITED",
-        "PELTD.BO": "Positive Electronics Limited",
-        "PRECISIO.BO": "Precision Electronics Ltd.",
-        "PRECWIRE.BO": "Precision Wires India Ltd.",
-        "PROCAL.BO": "Procal Electronics India Ltd",
-        "PSCABLE.BO": "PASHUPATI CABLES LTD.",
-        "RAMRAT.BO": "Ram Ratna Wires Ltd",
-        "REXNORD.BO": "Rexnord Electronics and Controls Limited",
-        "SALZER.BO": "Salzer Electronics Limited",
-        "SALZERELEC.NS": "SALZER ELECTRONICS INR10",
-        "SALZERELEC.NS": "SALZER ELECTRONICS INR10",
-        "SAMTEL.NS": "Samtel Color Limited",
-        "SATKAR.BO": "SATKAR ELECTRONICS LTD.",
-        "SHARODW.BO": "SHAKTI RODS & WIRES LTD.",
-        "SHWALEL.BO": "SHAW WALLACE ELECTRONICS LTD.",
-        "STARELE.BO": "STAR PRECISION ELECTRONICS (IN",
-        "TELECABL.BO": "TELEPHONE CABLES LTD.",
-        "TRENDELEC.BO": "Trend Electronics Ltd",
-        "UNIVCABLES-BE.NS": "UNIVCABLES NPP130599 DEPO",
-        "UNIVCABLES.NS": "UNIVERSAL CABLES INR10",
-        "UNIVCABLES.BO": "UNIVERSAL CABLES LTD.",
-        "UNIVCABLES6.BO": "UNIVCABLES6.BO",
-        "VARDWIR.BO": "VARDHAMAN WIRES & POLYMERS LTD",
-        "VETO.BO": "VETO SWITCHGEARS AND CABLES LI",
-        "VETO.NS": "Veto Switchgears and Cables Limited",
-        "WIREFABR.BO": "Wires & Fabriks (S.A.) Limited",
-        "ZICOM.NS": "ZICOM ELECTRONIC SECURITY SYSTE"
-    },
-
-    "Diversified Machinery": {
-        "ABB.NS": "ABB India Limited",
-        "ADORWELD.NS": "Ador Welding Limited",
-        "AIAENG.NS": "AIA Engineering Limited",
-        "AKARTOOL.BO": "Akar Tools Ltd.",
-        "AMARAJABAT.NS": "Amara Raja Batteries Limited",
-        "BBL.NS": "Bharat Bijlee Limited",
-        "BEML.NS": "BEML Limited",
-        "BHEL.NS": "Bharat Heavy Electricals Limited",
-        "BILPOWER.NS": "Bilpower Limited",
-        "CUMMINSIND.NS": "Cummins India Limited",
-        "DELTAMAGNT.NS": "Delta Magnets Limited",
-        "DIAPOWER.NS": "Diamond Power Infrastructure Limited",
-        "EASUNREYRL.NS": "Easun Reyrolle Limited",
-        "ECEIND.NS": "ECE Industries Limited",
-        "EIMCOELECO.NS": "Eimco Elecon (India) Limited",
-        "EKC.NS": "Everest Kanto Cylinder Limited",
-        "ELECON.NS": "Elecon Engineering Company Limited",
-        "ELGIEQUIP.BO": "ELGI Equipments Limited",
-        "ELGIEQUIP.NS": "ELGI Equipments Limited",
-        "EMCO.NS": "EMCO Limited",
-        "EON.NS": "Eon Electric Limited",
-        "GEINDSYS.NS": "GEI Industrial Systems Limited",
-        "GOLDINFRA.NS": "Goldstone Infratech Limited",
-        "GRAPHITE.NS": "Graphite India Limited",
-        "GREAVESCOT.NS": "Greaves Cotton Limited",
-        "HAVELLS.NS": "Havells India Limited",
-        "HERCULES.NS": "Hercules Hoists Limited",
-        "HINDEVER.BO": "Hindustan Everest Tools Limited",
-        "HITTCO.BO": "Hittco Tools Limited",
-        "HONAUT.NS": "Honeywell Automation India Limited",
-        "HONDAPOWER.NS": "Honda Siel Power Products Limited",
-        "IFBIND.NS": "IFB Industries Limited",
-        "INDLMETER.NS": "IMP Powers Limited",
-        "INGERRAND.NS": "Ingersoll-Rand (India) Limited",
-        "INOXWIND.NS": "Inox Wind Limited",
-        "KABRAEXTRU.NS": "Kabra Extrusiontechnik Limited",
-        "KCP.NS": "The KCP Limited",
-        "KECL.NS": "Kirloskar Electric Company Limited",
-        "KIRLOSBROS.NS": "Kirloskar Brothers Limited",
-        "KIRLOSENG.NS": "Kirloskar Oil Engines Limited",
-        "KOATOOLIN.BO": "KOA Tools India Limited",
-        "KSBPUMPS.NS": "KSB Pumps Limited",
-        "LAXMIMACH.NS": "Lakshmi Machine Works Limited",
-        "LOKESHMACH.NS": "Lokesh Machines Limited",
-        "LOYAL.BO": "Loyal Equipments Limited",
-        "LYNMC.BO": "Lynx Machinery & Commercials Ltd",
-        "MANUGRAPH.NS": "Manugraph India Limited",
-        "MINTAGE.BO": "MINTAGE ELECTRO EQUIPMENTS LTD",
-        "MIVENMACH.BO": "Miven Machine Tools Ltd",
-        "NEPCMICON.NS": "NEPC India Limited",
-        "NICCO.NS": "Nicco Corporation Limited",
-        "OTOKLIN.BO": "OTOKLIN PLANTS & EQUIPMENTS LT",
-        "PAEL.NS": "PAE Limited",
-        "PREMIER.NS": "Premier Limited",
-        "REMIPRO.BO": "REMI PROCESS PLANT & MACHINERY",
-        "REVATHI.NS": "REVATHI EQUIPMENT INR10",
-        "REVATHI.BO": "REVATHI EQUIPMENT LTD.",
-        "SANGHVIFOR.NS": "Sanghvi Forging & Engineering Limited",
-        "SCHNEIDER.NS": "Schneider Electric Infrastructure Limited",
-        "SHAKTIPUMP.NS": "Shakti Pumps (India) Limited",
-        "SHANTIGEAR.NS": "Shanthi Gears Limited",
-        "SIEMENS.NS": "Siemens Limited",
-        "SKFINDIA.NS": "SKF India Limited",
-        "SOLCT.BO": "Solid Carbide Tools Ltd",
-        "SOLIMAC.BO": "Solitaire Machine Tools Limited",
-        "STERTOOLS.NS": "STERLING TOOLS LIMITED",
-        "STERTOOLS.BO": "STERLING TOOLS LTD.",
-        "SUZLON.NS": "Suzlon Energy Limited",
-        "SWISSGLA.BO": "Swiss Glasscoat Equipments Limited",
-        "TAPARIA.BO": "TAPARIA TOOLS LTD.",
-        "TARAPUR.NS": "Tarapur Transformers Limited",
-        "TDPOWERSYS.NS": "TD Power Systems Limited",
-        "TEXRAIL.NS": "Texmaco Rail & Engineering Limited",
-        "THERMAX.NS": "Thermax Limited",
-        "TIL.NS": "TIL Limited",
-        "TIMKEN.NS": "Timken India Limited",
-        "TODAYS.BO": "Today's Writing Instruments Limited",
-        "TRF.NS": "TRF Limited",
-        "TRIDETOOL.BO": "TRIDENT TOOLS LTD.",
-        "TRIL.NS": "Transformers & Rectifiers (India) Limited",
-        "TRITURBINE.NS": "Triveni Turbine Limited",
-        "UNIDT.BO": "United Drilling Tools Ltd",
-        "VESUVIUS.NS": "Vesuvius India Limited",
-        "VOLTAMP.NS": "Voltamp Transformers Limited",
-        "VXLINSTR.BO": "VXL INSTRUMENTS LTD.",
-        "WINDMACHIN.NS": "Windsor Machines Limited",
-        "ZJEETMAC.BO": "JEET MACHINE TOOLS LTD."
-    },
-
-    "Diversified Utilities": {
-        "ADANIPOWER.NS": "Adani Power Limited",
-        "BFUTILITIE.BO": "BF UTILITIES LTD.",
-        "CESC.NS": "CESC Limited",
-        "INDOSOLAR.NS": "Indosolar Limited",
-        "JPPOWER.NS": "Jaiprakash Power Ventures Limited",
-        "JSWENERGY.NS": "JSW Energy Limited",
-        "KEC.NS": "KEC International Limited",
-        "LITL.NS": "Lanco Infratech Limited",
-        "NTPC.NS": "NTPC Limited",
-        "PTC.NS": "PTC India Limited",
-        "RPOWER.NS": "Reliance Power Limited",
-        "RTNINFRA.NS": "RattanIndia Infrastructure Limited",
-        "SURANASOL.NS": "Surana Solar Limited",
-        "SURANAT&P.NS": "Surana Telecom and Power Limited",
-        "SWELECTES.NS": "Swelect Energy Systems Limited",
-        "TATAPOWER.NS": "The Tata Power Company Limited",
-        "UJAAS.NS": "Ujaas Energy Ltd.",
-        "WEBELSOLAR.NS": "Websol Energy System Limited",
-        "XLENERGY.NS": "XL Energy Limited"
-    },
-
-    "Drug Manufacturers - Major": {
-        "AARTIDRUGS.NS": "AARTI DRUGS LTD INR10",
-        "AARTIDRUGS.BO": "AARTI DRUGS LTD.",
-        "AARTIDRUGS.NS": "Aarti Drugs Limited",
-        "ABBOTINDIA.NS": "Abbott India Limited",
-        "ADDLP.BO": "ADD-LIFE PHARMA LTD.",
-        "AJANTPHARM.BO": "AJANTA PHARMA LTD.",
-        "AJANTPHARM.NS": "Ajanta Pharma Limited",
-        "ANKURDRUGS.BO": "ANKUR DRUGS & PHARMA LTD.",
-        "ANUHPHR.BO": "Anuh Pharma Ltd.",
-        "APLLTD.BO": "ALEMBIC PHARMACEUTICALS LTD.",
-        "AREYDRG.BO": "Aarey Drugs & Pharmaceuticals Ltd.",
-        "ASTRAZEN.BO": "AstraZeneca Pharma India Limited",
-        "ASTRAZEN.NS": "AstraZeneca Pharma India Limited",
-        "AUROPHARMA.BO": "AUROBINDO PHARMA LTD.",
-        "BACPHAR.BO": "Bacil Pharma Ltd",
-        "BAFNAPHARM.BO": "BAFNA PHARMACEUTICALS LTD.",
-        "BAFNAPHARM.NS": "Bafna Pharmaceuticals Limited",
-        "BALPHARMA.BO": "BAL PHARMA LTD.",
-        "BERLDRG.BO": "Beryl Drugs Ltd.",
-        "BIOFILCHEM.BO": "BIOFIL CHEMICALS & PHARMACEUTI",
-        "BLISSGVS.BO": "Bliss Gvs Pharma Limited",
-        "BLISSGVS.NS": "Bliss Gvs Pharma Limited",
-        "BROOKS.NS": "Brooks Laboratories Limited",
-        "CHEMOPH.BO": "Chemo Pharma Laboratories Ltd.",
-        "CIPLA.NS": "Cipla Limited",
-        "COMBDRG.BO": "Combat Drugs Limited",
-        "CONCORD.BO": "Concord Drugs Limited",
-        "DISHMAN.BO": "Dishman Pharmaceuticals and Chemicals Ltd.",
-        "EBEPH.BO": "EBERS PHARMACEUTICALS LTD.",
-        "ELDERPHARM.NS": "ELDER PHARMA LTD.",
-        "ELDERPHARM.BO": "Elder Pharmaceuticals Limited",
-        "ELDERPHARM.NS": "Elder Pharmaceuticals Limited",
-        "ELEGNPH.BO": "ELEGANT PHARMACEUTICALS LTD.",
-        "EPICENZY.BO": "EPIC ENZYMES PHARMACEUTICALS",
-        "EUPHARMLAB.BO": "EUPHARMA LABORATORIES LTD.",
-        "FDC.NS": "FDC Limited",
-        "FREDUN.BO": "Fredun Pharmaceuticals Limited",
-        "GANGAPHARM.BO": "Ganga Pharmaceuticals Limited",
-        "GLAXO.BO": "GLAXOSMITHKLINE PHARMACEUTICAL",
-        "GLAXO.NS": "GlaxoSmithkline Pharmaceuticals Limited",
-        "GLENMARK.NS": "GLENMARK PHARMACEUTICALS LIMITE",
-        "GLENMARK.BO": "Glenmark Pharmaceuticals Ltd.",
-        "GODAVARI.BO": "Godavari Drugs Ltd.",
-        "GRANHPH.BO": "GRAN HEAL PHARMA LTD.",
-        "GRANULES.NS": "Granules India Limited",
-        "HESTERBIO.NS": "Hester Biosciences Limited",
-        "HITCHDR.BO": "HI-TECH DRUGS LTD.",
-        "INDSWFTLAB.NS": "Ind-Swift Laboratories Limited",
-        "IOLCP.NS": "IOL CHEMICALS AND PHARMACEUTICA",
-        "IOLCP.BO": "IOL CHEMICALS & PHARMACEUTICAL",
-        "ISHITADR.BO": "Ishita Drugs & Industries Ltd",
-        "JAGSNPHARM.NS": "JAGSONPAL PHARMACE INR5",
-        "JAGSNPHARM.BO": "JAGSONPAL PHARMACEUTICALS LTD.",
-        "JAGSNPHARM.NS": "Jagsonpal Pharmaceuticals Limited",
-        "JBCHEPHARM.NS": "JB CHEMICALS & PHARMACEUTICALS",
-        "JBCHEPHARM.BO": "J.B.CHEMICALS & PHARMACEUTICAL",
-        "JBCHEPHARM.NS": "J. B. Chemicals & Pharmaceuticals Limited",
-        "JENBURPH.BO": "Jenburkt Pharmaceuticals Ltd.",
-        "JINDONL.BO": "Kashyap Tele-Medicines Limited",
-        "JKPHARMA.BO": "J.K.PHARMACHEM LTD.",
-        "JUBILANT.NS": "Jubilant Life Sciences Limited",
-        "KABRADG.BO": "Kabra Drugs Limited",
-        "KAPPH.BO": "Kappac Pharma Ltd.",
-        "KAPRIPH.BO": "KAPRINAS PHARMACEUTICALS & CHE",
-        "KILITCH.NS": "KILITCH DRUGS (INDIA) LIMITED",
-        "KILITCH.BO": "KILITCH DRUGS (INDIA) LTD.",
-        "KILITCH.NS": "Kilitch Drugs (India) Limited",
-        "KOPDRLT.BO": "KOPRAN DRUGS",
-        "KOPRAN.NS": "Kopran Limited",
-        "LIFELINE.BO": "LIFELINE DRUGS & PHARMA LTD.",
-        "LINCOLN.NS": "LINCOLN PHARMA LTD INR10",
-        "LINCOLN.NS": "LINCOLN PHARMA LTD INR10",
-        "LINCOPH.BO": "Lincoln Pharmaceuticals Ltd.",
-        "LINKPH.BO": "Link Pharma Chem Ltd.",
-        "MANGALAM.NS": "MANGALAM DRUGS & O INR10",
-        "MANGALAM.BO": "Mangalam Drugs & Organics Limited",
-        "MARKSANS.BO": "Marksans Pharma Ltd.",
-        "MARKSANS.NS": "Marksans Pharma Limited",
-        "MESPHAR-B.BO": "MESCO PHARMACEUTICALS LTD.",
-        "MHNAVPH.BO": "MANAV PHARMA LTD.",
-        "MOONDRUG.BO": "MOON DRUGS LTD.",
-        "MOREPENLAB.NS": "Morepen Laboratories Limited",
-        "NAGDRUG.BO": "NAGARJUNA DRUGS LTD.",
-        "NATCOPHARM.NS": "NATCO PHARMA LTD INR2",
-        "NATCOPHARM.BO": "NATCO PHARMA LTD.",
-        "NATCOPHARM.NS": "Natco Pharma Limited",
-        "NECLIFE.NS": "Nectar Lifesciences Limited",
-        "NORRIS.BO": "NORRIS MEDICINES LTD.",
-        "OMKARPH.BO": "OMKAR PHARMACHEM LTD.",
-        "ORCHIDCHEM.NS": "ORCHID CHEMICALS & PHARMACEUTIC",
-        "ORCHIDCHEM.BO": "Orchid Pharma Limited",
-        "ORCHIDPHAR.NS": "ORCHID PHARMA LTD INR10",
-        "ORCHIDPHAR.BO": "Orchid Pharma Limited",
-        "ORCHIDPHAR.NS": "Orchid Pharma Limited",
-        "PANDRUG.BO": "PAN DRUGS LTD.",
-        "PARABDRUGS.NS": "PARABOLIC DRUGS INR10(DEMAT)",
-        "PARABDRUGS.BO": "PARABOLIC DRUGS LTD",
-        "PARENTLD.BO": "Parenteral Drugs (India) Limited",
-        "PCICHEM.BO": "P.C.I.CHEMICALS AND PHARMACEUT",
-        "PDPL.NS": "Parenteral Drugs (India) Limited",
-        "PEL.NS": "Piramal Enterprises Limited",
-        "PENTAPH.BO": "PENTA PHARMADYES LTD.",
-        "PFIZER.NS": "Pfizer Limited",
-        "PHARMAID.BO": "Pharmaids Pharmaceuticals Ltd.",
-        "PLETHICO-BE.NS": "PLETHICO PHARMA INR10",
-        "PLETHICO-BZ.NS": "PLETHICO PHARMACE LIMITED",
-        "PLETHICO.BO": "Plethico Pharmaceuticals Limited",
-        "PLETHICO.NS": "Plethico Pharmaceuticals Limited",
-        "POLARPH.BO": "POLAR PHARMA INDIA LTD.",
-        "PRISMMEDI.BO": "PRISM MEDICO AND PHARMACY LTD.",
-        "RELISH.BO": "Relish Pharmaceuticals Limited",
-        "RICHLNP.BO": "RICHLINE PHARMA LTD.",
-        "RINADRG.BO": "RATNA DRUGS LTD.",
-        "SAMRATPH.BO": "Samrat Pharmachem Limited",
-        "SANDUPHQ.BO": "Sandu Pharmaceuticals Limited",
-        "SHARONBIO.BO": "Sharon Bio Medicine Limited",
-        "SHARONBIO.NS": "Sharon Bio-Medicine Ltd.",
-        "SHASUNPHAR.NS": "SHASUN PHARMACEUTICALS LIMITED",
-        "SHYAAXPH.BO": "SHREE YAAX PHARMA & COSMETICS",
-        "SMSPHABBPH.BO": "SMSPHARMA*",
-        "SMSPHARMA.NS": "SMS PHARMACEUTICALS LIMITED",
-        "SMSPHARMA.BO": "SMS Pharmaceuticals Limited",
-        "SMSPHARMA.NS": "SMS Pharmaceuticals Limited",
-        "STDMDCH.BO": "STANDARD MEDICAL & PHARMACEUTI",
-        "SUNPHARMA.NS": "SUN PHARMACEUTICALS INDUSTRIES",
-        "SUNPHARMA.BO": "Sun Pharmaceutical Industries Limited",
-        "SUNPHARMA4.BO": "SUNPHARMA4.BO",
-        "SUPHA.BO": "SUPRIYA PHARMACEUTICALS LTD.",
-        "SURYAPHARM-BZ.NS": "SURYA PHARMACEUTICAL LTD.",
-        "SURYAPHARM.BO": "SURYA PHARMACEUTICAL LTD.",
-        "SWORDNSH.BO": "SWORD & SHIELD PHARMA LTD.",
-        "TOHELPH.BO": "TOHEAL PHARMACHEM LTD.",
-        "TORNTPHARM.NS": "TORRENT PHARMACEUTICALS LIMITED",
-        "TORNTPHARM.BO": "TORRENT PHARMACEUTICALS LTD.",
-        "TORNTPHARM.NS": "Torrent Pharmaceuticals Limited",
-        "TWILITAKA.BO": "Twilight Litaka Pharma Limited",
-        "UNICHEMLAB.NS": "Unichem Laboratories Limited",
-        "VELVINT.BO": "VELVETTE INTERNATIONAL PHARMA",
-        "VENKPHR.BO": "Venkat Pharma Ltd",
-        "VENMAX.BO": "VENMAX DRUGS AND PHARMACEUTICA",
-        "VENUSREM.NS": "Venus Remedies Limited",
-        "VISTAPH.BO": "Vista Pharmaceuticals Limited",
-        "VYSLIPH.BO": "VYSALI PHARMACEUTICALS LTD.",
-        "WANBURY.NS": "Wanbury Limited",
-        "WELCURE.BO": "Welcure Drugs & Pharmaceuticals Ltd.",
-        "WOCKPHARMA.NS": "Wockhardt Limited",
-        "ZILLOPH.BO": "ZILLION PHARMACHEM LTD."
-    },
-
-    "Drugs - Generic": {
-        "ALEMBICLTD.NS": "Alembic Limited",
-        "ALKEM.NS": "Alkem Laboratories Limited",
-        "ALPA.NS": "Alpa Laboratories Limited",
-        "AMRUTANJAN.NS": "Amrutanjan Health Care Limited",
-        "APLLTD.NS": "Alembic Pharmaceuticals Limited",
-        "AUROPHARMA.NS": "Aurobindo Pharma Limited",
-        "BALPHARMA.NS": "Bal Pharma Limited",
-        "CADILAHC.NS": "Cadila Healthcare Limited",
-        "DIVISLAB.NS": "Divi's Laboratories Limited",
-        "DRREDDY.NS": "Dr. Reddy's Laboratories Limited",
-        "GLENMARK.NS": "Glenmark Pharmaceuticals Limited",
-        "GUFICBIO.NS": "Gufic Biosciences Limited",
-        "INDOCO.NS": "Indoco Remedies Limited",
-        "INDSWFTLTD.NS": "Ind-Swift Limited",
-        "IOLCP.NS": "IOL Chemicals and Pharmaceuticals Limited",
-        "IPCALAB.NS": "Ipca Laboratories Limited",
-        "LUPIN.NS": "Lupin Limited",
-        "MANGALAM.NS": "Mangalam Drugs & Organics Limited",
-        "MERCK.NS": "Merck Limited",
-        "NEULANDLAB.NS": "Neuland Laboratories Limited",
-        "PARABDRUGS.NS": "Parabolic Drugs Limited",
-        "PIRPHYTO.NS": "Piramal Phytocare Limited",
-        "RPGLIFE.NS": "RPG Life Sciences Limited",
-        "SHILPAMED.NS": "Shilpa Medicare Limited",
-        "SPARC.NS": "Sun Pharma Advanced Research Company Limited",
-        "STAR.NS": "Strides Shasun Limited",
-        "SUNPHARMA.NS": "Sun Pharmaceutical Industries Limited",
-        "SUVEN.NS": "Suven Life Sciences Limited",
-        "SYNCOM.NS": "Syncom Healthcare Limited",
-        "THEMISMED.NS": "Themis Medicare Limited"
-    },
-
-    "Education & Training Services": {
-        "APTECHT.NS": "Aptech Limited",
-        "CAREERP.NS": "Career Point Limited",
-        "COMPUSOFT.NS": "Compucom Software Limited",
-        "DMCEDU.BO": "DMC EDUCATION LTD",
-        "EDUCOMP.NS": "Educomp Solutions Limited",
-        "EVERONN.NS": "EVERONN EDUCATION LIMITED",
-        "EVERONN.BO": "Everonn Education Limited",
-        "EVERONN.NS": "Everonn Education Limited",
-        "GREYCELLS.BO": "Greycells Education Ltd",
-        "IECEDU.BO": "IEC Education Ltd",
-        "JOINTECAED.BO": "JOINTECA EDUCATION SOLUTIONS L",
-        "LCCINFOTEC.NS": "LCC Infotech Limited",
-        "MTEDUCARE.NS": "MT Educare Limited",
-        "NAVNETEDUL.NS": "NAVNEET EDUCATION INR2",
-        "NAVNETEDUL.BO": "NAVNEET EDUCATION LIMITED",
-        "SESL.BO": "Sylph Education Solutions Limi",
-        "TREEHOUSE.BO": "TREE HOUSE EDUCATION & ACCESSO",
-        "TREEHOUSE.NS": "Tree House Education & Accessories Limited",
-        "UMESLTD.NS": "Usha Martin Education & Solutions Limited",
-        "VATSAEDU.BO": "VATSA EDUCATIONS LTD.",
-        "VIRTUALG.BO": "VIRTUAL GLOBAL EDUCATION LTD.",
-        "VISUINTL.NS": "Ed & Tech international Limited",
-        "ZEELEARN.NS": "Zee Learn Limited",
-        "ZENTEC.NS": "Zen Technologies Limited"
-    },
-
-    "Electric Utilities": {
-        "ADANIPOWER.BO": "Adani Power Limited",
-        "ADANIPOWER6.BO": "ADANIPOWER6.BO",
-        "ADANITRANS.NS": "Adani Transmissions Limited",
-        "AIL.NS": "GE Power India Limited",
-        "AMALGAM.BO": "AMALGAMATED ELECTRICITY CO.LTD",
-        "AMTL.NS": "Advance Metering Technology Limited",
-        "ANKITMETAL.BO": "ANKIT METAL & POWER LTD.",
-        "BAJAJELEC.BO": "BAJAJ ELECTRICALS LTD.",
-        "BAROELE.BO": "BARODA ELECTRIC METERS LTD.",
-        "BCP.BO": "B.C. POWER CONTROLS LTD",
-        "BHEL.BO": "Bharat Heavy Electricals Ltd.",
-        "BILPOWER-BE.NS": "BILPOWER LTD INR10(DEMAT)",
-        "BILPOWER.NS": "BILPOWER LIMITED",
-        "BILPOWER.BO": "BILPOWER LTD.",
-        "BIRLAPOWER-BZ.NS": "BIRLA POWER SOL. LTD",
-        "BIRLAPOWER.BO": "Birla Power Solutions Limited",
-        "CLASELE.BO": "CLASSIC ELECTRICALS LTD.",
-        "CROMPGREAV.BO": "CG POWER AND INDUSTRIAL SOLNS L",
-        "CROMPGREAV.NS": "CG Power and Industrial Solutions Limited",
-        "DIAPOWER.BO": "DIAMOND POWER INFRASTRUCTURE L",
-        "DPSCLTD.NS": "India Power Corporation Limited",
-        "ECGIL.BO": "ELECTRIC CONTROL GEAR (INDIA)",
-        "EMPOWER.BO": "EMPOWER INDIA LTD.",
-        "ENERGYDEV.NS": "Energy Development Company Limited",
-        "EON.NS": "EON ELECTRIC LTD INR5",
-        "EON.BO": "EON ELECTRIC LTD.",
-        "FEDDERLOYD.BO": "FEDDERS ELECTRIC AND ENG LTD",
-        "FEDDERLOYD.NS": "Fedders Electric and Engineering Limited",
-        "GALADA.BO": "Galada Power And Telecommunication Limited",
-        "GENUSPOWER.NS": "GENUS POWER INFRA INR1",
-        "GENUSPOWER.BO": "GENUS POWER INFRASTRUCTURES LT",
-        "GIPCL.BO": "Gujarat Industries Power Co. Ltd.",
-        "GIPCL.NS": "Gujarat Industries Power Company Limited",
-        "GPIL.NS": "GODAWARI POWER AND ISPAT LIMITE",
-        "GPIL.BO": "Godawari Power & Ispat Ltd.",
-        "GREENPOWER.NS": "ORIENT GREEN POWER INR10",
-        "GREENPOWER.BO": "ORIENT GREEN POWER COMPANY LTD",
-        "GREENPOWER.NS": "Orient Green Power Company Limited",
-        "GVKPIL.NS": "GVK POWER & INFRASTRUCTURE LIMI",
-        "GVKPIL.BO": "GVK Power & Infrastructure Limited",
-        "HONDAPOWER.BO": "HONDA SIEL POWER PRODUCTS LTD.",
-        "INDLMETER.BO": "IMP POWERS LTD.",
-        "INDNIPPON.BO": "INDIA NIPPON ELECTRICALS LTD.",
-        "INDOWIND.NS": "Indowind Energy Limited",
-        "INDSILHYD.BO": "Indsil Hydro Power and Manganese Ltd.",
-        "IPOWER.BO": "I Power Solutions India Ltd",
-        "JINDALSTEL.BO": "JINDAL STEEL & POWER LTD.",
-        "JPPOWER.BO": "Jaiprakash Power Ventures Limited",
-        "JPPOWER6.BO": "JPPOWER6.BO",
-        "JYOTISTRUC.NS": "Jyoti Structures Limited",
-        "KALPATPOWR.BO": "KALPATARU POWER TRANSMISSION L",
-        "KALPATPOWR.NS": "Kalpataru Power Transmission Limited",
-        "KANIKAIN.BO": "Kanika Infrastructure & Power Ltd.",
-        "KARMAENG.NS": "Karma Energy Limited",
-        "KAYPOWR.BO": "Kay Power And Paper Limited",
-        "KECL.NS": "KIRLOSKAR ELECTRIC COMPANY LIMI",
-        "KECL.BO": "KIRLOSKAR ELECTRIC COMPANY LTD",
-        "KHAITANELE.NS": "KHAITAN ELECTRICAL INR10",
-        "KHAITANELE.BO": "KHAITAN ELECTRICALS LTD.",
-        "KLKELEC.BO": "KLK Electrical Ltd",
-        "KSK.NS": "KSK Energy Ventures Limited",
-        "KULKPOWT.BO": "Kulkarni Power Tools Ltd.",
-        "KUSUMEL.BO": "KUSAM ELECTRICAL INDUSTRIES LT",
-        "LLOYDELENG.BO": "LEEL ELECTRICALS LIMITED",
-        "LLOYDELENG.NS": "LEEL Electricals Limited",
-        "MSPL.BO": "MSP STEEL & POWER LTD.",
-        "NAGPI.BO": "Nagpur Power & Industries Ltd.",
-        "NBVENTURES.NS": "Nava Bharat Ventures Limited",
-        "NHPC.NS": "NHPC Limited",
-        "POWERGRID.NS": "POWER GRID CORPORATION OF INDIA",
-        "POWERGRID-IL.NS": "POWER GRID CORP INR10",
-        "POWERGRID.BO": "Power Grid Corporation of India Limited",
-        "POWERGRID.NS": "Power Grid Corporation of India Limited",
-        "POWERGRID4.BO": "POWERGRID4.BO",
-        "POWERMECH.NS": "POWER MECH PROJECT INR10",
-        "POWERMECH.BO": "Power Mech Projects Limited",
-        "POWERSOF.BO": "POWERSOFT GLOBAL SOLUTIONS LTD",
-        "RATHIST.BO": "Rathi Steel and Power Ltd",
-        "REILELEC.BO": "REIL ELECTRICALS INDIA LTD.",
-        "RELINFRA.NS": "Reliance Infrastructure Limited",
-        "RPOWER.BO": "Reliance Power Limited",
-        "RPOWER4.BO": "RPOWER4.BO",
-        "RTNPOWER.NS": "RATTANINDIA POWER INR10",
-        "RTNPOWER.BO": "RATTANINDIA POWER LTD.",
-        "RTNPOWER.NS": "RattanIndia Power Limited",
-        "RTSPOWR.BO": "RTS Power Corporation Ltd.",
-        "S&SPOWER.BO": "S&S POWER SWITCHGEAR LTD.",
-        "SCHNEIDER.NS": "SCHNEIDER ELECTRIC INFRASTRUCTU",
-        "SCHNEIDER.BO": "SCHNEIDER ELECTRIC INFRASTRUCT",
-        "SEPOWER.NS": "S.E. POWER LIMITED",
-        "SEPOWER.BO": "S.E. POWER LTD.",
-        "SEPOWER.NS": "S. E. Power Limited",
-        "SJVN.NS": "SJVN Limited",
-        "STERPOW.BO": "STERLING POWERGENSYS LTD",
-        "STERS.BO": "Sterling Powergensys Limited",
-        "SURANAT&P.BO": "SURANA TELECOM AND POWER LIMIT",
-        "SURYACHAKRA.BO": "Suryachakra Power Corporation Limited",
-        "TATAPOWER.BO": "The Tata Power Company Limited",
-        "THAES.BO": "Thana Electric Supply Company Ltd.",
-        "TORNTPOWER.BO": "TORRENT POWER LTD.",
-        "TORNTPOWER.NS": "Torrent Power Limited",
-        "TORNTPOWER6.BO": "TORNTPOWER6.BO",
-        "TOYAMAQ.BO": "TOYAMA ELECTRIC LTD.",
-        "TRELCHE-B.BO": "TECIL CHEMICALS & HYDRO POWER",
-        "TRNSPEN.BO": "TRANSPOWER ENGINEERING LTD.",
-        "TUMUSEL.BO": "TUMUS ELECTRIC CORPORATION LTD",
-        "VENUSPOWR.BO": "VENUS POWER VENTURES (INDIA) L",
-        "VIKASHMET.BO": "VIKASH METAL & POWER LTD."
-    },
-
-    "Electronic Equipment": {
-        "BAJAJELEC.NS": "Bajaj Electricals Limited",
-        "BPL.NS": "BPL Limited",
-        "BUTTERFLY.NS": "Butterfly Gandhimathi Appliances Limited",
-        "KHAITANELE.NS": "Khaitan Electricals Limited",
-        "MIRCELECTR.NS": "MIRC Electronics Limited",
-        "NOESISIND.NS": "Noesis Industries Limited",
-        "PGEL.NS": "PG Electroplast Limited",
-        "PHOENIXLL.NS": "Phoenix Lamps Limited",
-        "SALORAINTL.NS": "Salora International Limited",
-        "SYMPHONY.NS": "Symphony Limited",
-        "VALUEIND.NS": "Value Industries Limited",
-        "VGUARD.NS": "V-Guard Industries Limited",
-        "VIDEOIND.NS": "Videocon Industries Limited",
-        "WHIRLPOOL.NS": "Whirlpool of India Limited"
-    },
-
-    "Electronics Wholesale": {
-        "SHILPI.NS": "Shilpi Cable Technologies Limited"
-    },
-
-    "Entertainment - Diversified": {
-        "ADLABS.BO": "Adlabs Entertainment Limited",
-        "ADLABS.NS": "Adlabs Entertainment Limited",
-        "ASIANFILMS.BO": "ASIAN FILMS PRODUCTION & DISTR",
-        "BAGFILMS.NS": "B.A.G. Films and Media Limited",
-        "BALAJITELE.BO": "Balaji Telefilms Ltd.",
-        "BALAJITELE.NS": "Balaji Telefilms Limited",
-        "CINEVISTA.NS": "Cinevista Limited",
-        "CNEL.BO": "CHANNEL NINE ENTERTAINMENT LTD",
-        "COSMOFILMS.BO": "Cosmo Films Limited",
-        "CREATIVEYE.NS": "Creative Eye Limited",
-        "CREATIVW.BO": "CREATIVE WORLD TELEFILMS LTD.",
-        "DIVINEENT.BO": "DIVINE ENTERTAINMENT LTD",
-        "DQE.NS": "DQ ENTERTAINMENT (INTERNATIONAL",
-        "DQE.BO": "DQ Entertainment (International) Limited",
-        "ENCASH.BO": "Encash Entertainment Limited",
-        "ENIL.BO": "Entertainment Network (India) Ltd.",
-        "EROSMEDIA.NS": "Eros International Media Limited",
-        "FASTRAENT.BO": "Fast Track Entertainment Ltd.",
-        "GLOBALFIL.BO": "GLOBAL FILMS & BROADCASTING LT",
-        "GLORY.BO": "GLORY POLYFILMS LTD.",
-        "GLXYENT.BO": "Galaxy Entertainment Corporation Limited",
-        "GVFILM.BO": "GV Films Limited",
-        "HINPHOT.BO": "HINDUSTAN PHOTO FILMS MFG.CO.L",
-        "INOXLEISUR.NS": "Inox Leisure Limited",
-        "JINDALPOLY.NS": "JINDAL POLY FILMS LIMITED",
-        "JINDALPOLY.BO": "JINDAL POLY FILMS LTD.",
-        "KSERASERA.NS": "KSS Limited",
-        "MIDVAL.BO": "MIDVALLEY ENTERTAINMENT LTD.",
-        "MTZPOLY.BO": "MTZ POLYFILMS LTD.",
-        "MUKTAARTS.NS": "Mukta Arts Limited",
-        "NAHARPOLY.NS": "NAHAR POLY FILMS LIMITED",
-        "NAHARPOLY.BO": "NAHAR POLYFILMS LTD.",
-        "PADMALAYAT.BO": "PADMALAYA TELEFILMS LTD.",
-        "PBFL.BO": "P. B. Films Limited",
-        "PFOCUS.NS": "Prime Focus Limited",
-        "PNC.NS": "Pritish Nandy Communications Ltd",
-        "POOJAENT.BO": "POOJA ENTERTAINMENT AND FILMS",
-        "PVR.NS": "PVR Limited",
-        "RADAAN.NS": "Radaan Mediaworks India Limited",
-        "REGAL.BO": "Regal Entertainment & Consultants Ltd.",
-        "SAREGAMA.NS": "Saregama India Limited",
-        "SHEMAROO.BO": "SHEMAROO ENTERTAINMENT LIMITED",
-        "SHEMAROO.NS": "Shemaroo Entertainment Limited",
-        "TIPSINDLTD.NS": "Tips Industries Limited",
-        "UFO.NS": "UFO MOVIEZ INDIA INR10",
-        "UFO.BO": "UFO Moviez India Limited",
-        "UFO.NS": "UFO Moviez India Limited",
-        "VISIONCINE.BO": "VISION CINEMAS LTD.",
-        "ZEEL.BO": "ZEE ENTERTAINMENT ENTERPRISES"
-    },
-
-    "Farm & Construction Machinery": {
-        "ACE.NS": "Action Construction Equipment Limited",
-        "ESCORTS.NS": "Escorts Limited",
-        "GOVAI.BO": "GOOD VALUE IRRIGATION LTD.",
-        "GUJAPOLLO.NS": "Gujarat Apollo Industries Limited",
-        "HMT.NS": "HMT Limited",
-        "JISLDVREQS.NS": "Jain Irrigation Systems Limited",
-        "JISLJALEQS.NS": "JAIN IRRIGATION INR2",
-        "JISLJALEQS.NS": "Jain Irrigation Systems Limited",
-        "MOVILEX.BO": "MOVILEX IRRIGATION LTD.",
-        "RAIPF.BO": "Raj Irrigation Pipes & Fittings Ltd.",
-        "REVATHI.NS": "Revathi Equipment Limited",
-        "RUNGTAIR.BO": "Rungta Irrigation Limited",
-        "SANGHVIMOV.NS": "Sanghvi Movers Limited",
-        "VSTTILLERS.BO": "V.S.T.TILLERS TRACTORS LTD.",
-        "VSTTILLERS.NS": "V.S.T. Tillers Tractors Limited"
-    },
-
-    "Farm Products": {
-        "AGRIMONY.BO": "AGRIMONY COMMODITIES LTD",
-        "AGRODUTCH.NS": "Agro Dutch Industries Limited",
-        "AMRAAGRI.BO": "Amraworld Agrico Ltd.",
-        "ANANDAMRUB.NS": "The Anandam Rubber Company Limited",
-        "ANDHRSUGAR.NS": "THE ANDHRA SUGARS LIMITED",
-        "ANDHRSUGAR.BO": "ANDHRA SUGARS LTD.",
-        "ASHOKCT.BO": "ASHOKA COTSEEDS LTD.",
-        "ASIANTNE.BO": "Asian Tea & Exports Ltd.",
-        "ASSAMCO.NS": "Assam Company India Limited",
-        "BAJAJHIND.BO": "Bajaj Hindusthan Sugar Limited",
-        "BANARISUG.BO": "BANNARI AMMAN SUGARS LTD.",
-        "BANSTEA.BO": "BANSISONS TEA INDUSTRIES LTD.",
-        "BBTC.NS": "The Bombay Burmah Trading Corporation, Limited",
-        "CHOWGULSTM.BO": "CHOWGULE STEAMSHIPS LTD.",
-        "COFFEEDAY.NS": "COFFEE DAY ENTERPR INR10",
-        "COFFEEDAY.BO": "Coffee Day Enterprises Limited",
-        "DALMIASUG.NS": "DALMIA BHARAT SUGAR AND INDUSTR",
-        "DALMIASUG.BO": "DALMIA BHARAT SUGAR AND INDUST",
-        "DHAMPURE.BO": "Dhampure Speciality Sugars Ltd.",
-        "DHAMPURSUG.BO": "DHAMPUR SUGAR MILLS LTD.",
-        "DHAMPURSUG.NS": "Dhampur Sugar Mills Limited",
-        "DHAMSUGR.BO": "DHAMPUR SUGAR (KASHIPUR) LTD.",
-        "DHARSUGAR.NS": "Dharani Sugars and Chemicals Limited",
-        "DHUNTEAIND.BO": "Dhunseri Tea & Industries Ltd",
-        "DIANATEA.BO": "Diana Tea Company Limited",
-        "DTIL-BE.NS": "Dhunseri Tea & Ind. Ltd.",
-        "DTIL.NS": "DHUNSERI TEA & IND INR10",
-        "DTIL.NS": "DHUNSERI TEA & IND INR10",
-        "DWARKESH-BE.NS": "DWARIKESH SUGAR IN INR10",
-        "DWARKESH.NS": "DWARIKESH SUGAR INDUSTRIES LIMI",
-        "DWARKESH.BO": "Dwarikesh Sugar Industries Limited",
-        "EASTSUGIND.BO": "EASTERN SUGAR & INDUSTRIES LTD",
-        "GAYATRI.BO": "Gayatri Sugars Ltd.",
-        "GENERAAGRI.BO": "GENERA AGRI CORP LTD.",
-        "GESHIPBBPH.BO": "GREATEAST*",
-        "GIRDSGA.BO": "GIRDHARILAL SUGAR & ALLIED IND",
-        "GREENFIRE.NS": "GREEN FIRE AGRI CO INR1",
-        "GREENFIRE.BO": "GREEN FIRE AGRI COMMODITIES LT",
-        "GWALSUG.BO": "GWALIOR SUGAR CO.LTD.",
-        "HANSUGAR.BO": "SHREE HANUMAN SUGAR & INDUSTRI",
-        "HANUMAN.BO": "HANUMAN TEA CO.LTD.",
-        "HARRMALAYA.NS": "Harrisons Malayalam Limited",
-        "HINDUST.BO": "HINDUSTAN AGRIGENETICS LTD.",
-        "INDSUGA.BO": "INDIA SUGARS & REFINERIES LTD.",
-        "JAMESWARREN.BO": "JAMES WARREN TEA LTD",
-        "JAYSHREETEA.BO": "Jay Shree Tea & Industries Ltd.",
-        "JAYSREETEA.NS": "JAYSHREE TEA INR5",
-        "JAYSREETEA.NS": "JAYSHREE TEA INR5",
-        "JOONKTOLL.BO": "Joonktollee Tea & Industries Limited",
-        "KAKATCEM.BO": "KAKATIYA CEMENT SUGAR & INDUST",
-        "KAMALAT.BO": "KAMALA TEA CO.LTD.",
-        "KANCOTEA.BO": "KANCO TEA & INDUSTRIES LTD.",
-        "KCPSUGIND.BO": "KCP Sugar & Industries Corp Ltd.",
-        "KGL.NS": "Karuturi Global Limited",
-        "KMSUGAR-BE.NS": "KM SUGAR MILLS LTD INR2",
-        "KMSUGAR.NS": "KM SUGAR MILLS LTD INR2",
-        "KMSUGAR.BO": "KM Sugar Mills Ltd.",
-        "KSCL.NS": "Kaveri Seed Company Limited",
-        "LEDOTEA.BO": "Ledo Tea Company Ltd.",
-        "LONTE.BO": "Longview Tea Company Ltd.",
-        "MAWANASUG.BO": "Mawana Sugars Limited",
-        "MSL.BO": "Mangalam Seeds Limited",
-        "MUKTA.BO": "Mukta Agriculture Limited",
-        "NAGAAGRI.BO": "Nagarjuna Agrichem Limited",
-        "NARSM.BO": "NARAINGARH SUGAR MILLS LTD.",
-        "NKIND.NS": "N.K Industries Limited",
-        "NORBTEAEXP-BE.NS": "NORBEN TEA &EXPORTS LTD",
-        "NORBTEAEXP.BO": "NORBEN TEA & EXPORTS LTD.",
-        "NORBTEAEXP.NS": "Norben Tea & Exports Ltd",
-        "OMEAG.BO": "Omega Ag-Seeds (Punjab) Ltd.",
-        "OUDHSUG.BO": "OUDH SUGAR MILLS LTD.",
-        "PARRYSUGAR.NS": "PARRYS SUGAR INDUS INR10",
-        "PARRYSUGAR.BO": "PARRYS SUGAR INDUSTRIES LTD.",
-        "PERIATEA-BE.NS": "PERIATEA-BE.NS",
-        "PERIATEA.NS": "Peria Karamalai Tea & Produce Co. Ltd.",
-        "PICCASUG.BO": "Piccadily Sugar & Allied Industries Limited",
-        "PKTEA-BE.NS": "The P K Tea Prod Co Ltd",
-        "PKTEA.NS": "The Peria Karamalai Tea and Produce Company Limited",
-        "POCHIRAJU.NS": "Pochiraju Industries Limited",
-        "PONNIERODE.NS": "PONNI SUGARS ERODE INR10.00",
-        "PONNIERODE.BO": "PONNI SUGARS (ERODE) LTD.",
-        "PRUDMOULI.BO": "PRUDENTIAL SUGAR CORPORATION L",
-        "RANASUG.BO": "Rana Sugars Ltd.",
-        "RAVALSUGAR.BO": "RAVALGAON SUGAR FARM LTD.",
-        "RENUKA.NS": "SHREE RENUKA SUGARS LIMITED",
-        "RENUKA.BO": "Shree Renuka Sugars Limited",
-        "RIGASUG.BO": "Riga Sugar Co. Ltd.",
-        "RUCHINFRA.NS": "Ruchi Infrastructure Limited",
-        "SAKHTISUG.NS": "SAKTHI SUGARS LIMITED",
-        "SAKHTISUG.BO": "SAKTHI SUGARS LTD.",
-        "SAKUMA.NS": "Sakuma Exports Limited",
-        "SANWARIA.NS": "Sanwaria Agro Oils Limited",
-        "SBECSUG.BO": "SBEC Sugar Limited",
-        "SCINDIA.BO": "SCINDIA STEAM NAVIGATION CO.LT",
-        "SHIVAGR.BO": "Shivagrico Implements Ltd.",
-        "SIMBHALS.BO": "Simbhaoli Sugars Limited",
-        "SIMBHSUGAR.NS": "SIMBHAOLI SUGARS LIMITED",
-        "SITASHREE.NS": "Sita Shree Food Products Limited",
-        "SKSUGAR.BO": "SAKTHISUGAR",
-        "SMADL.BO": "Shri Mahalaxmi Agricultural De",
-        "STEL.NS": "STEL Holdings Limited",
-        "TATACOFFEE.BO": "Tata Coffee Ltd.",
-        "TEAMLEASE.BO": "TeamLease Services Limited",
-        "TEATIME.BO": "TEA TIME LTD.",
-        "TERAI.BO": "Terai Tea Company Limited",
-        "THIRUSUGAR.BO": "THIRU AROORAN SUGARS LTD.",
-        "TYROON.BO": "Tyroon Tea Co. Ltd.",
-        "UGARSUGAR-BE.NS": "UGAR SUGAR WORKS INR1",
-        "UGARSUGAR.BO": "UGAR SUGAR WORKS LTD.",
-        "UNITEDTEA.NS": "UNITED NILGIRI TEA INR10",
-        "UPERGANGES.BO": "UPPER GANGES SUGAR & INDUSTRIE",
-        "USHERAGRO.NS": "Usher Agro Limited",
-        "UTTAMSUGAR.NS": "UTTAM SUGAR MILLS INR10",
-        "UTTAMSUGAR.BO": "UTTAM SUGAR MILLS LTD.",
-        "UTTAMSUGAR.NS": "Uttam Sugar Mills Limited",
-        "VENUSUG.BO": "VENUS SUGAR LTD.",
-        "WARRENTEA.BO": "WARREN TEA LTD."
-    },
-
-    "Financial Services": {
-        "ABIRAFN.BO": "Abirami Financial Services India Ltd",
-        "ACFSL.BO": "AMRAPALI CAPITAL AND FINANCE S",
-        "ACTIONFI.BO": "Action Financial Services India Ltd",
-        "ADMANUM.BO": "Ad-Manum Finance Ltd",
-        "ALPSMOTOR.BO": "ALPS MOTOR FINANCE LTD",
-        "AMARNATH.BO": "SRI AMARNATH FINANCE LIMITED",
-        "ANJANIFIN.BO": "Anjani Finance Ltd.",
-        "APPLEFIN.BO": "Apple Finance Limited",
-        "ARAVALIS.BO": "Aravali Securities & Finance Ltd.",
-        "ARMANFIN.BO": "Arman Financial Services Ltd",
-        "ARYAMAN.BO": "Aryaman Financial Services Limited",
-        "ASITCFIN.BO": "Asit C Mehta Financial Services Limited",
-        "ATHENA.BO": "ATHENA FINANCIAL SERVICES LTD.",
-        "AUTORIDFIN.BO": "AUTORIDERS FINANCE LTD.",
-        "AVAILFC.BO": "Available Finance Ltd",
-        "BAJFINANCE.BO": "BAJAJ FINANCE LIMITED",
-        "BAJRFIN.BO": "BAJRANG FINANCE LTD.",
-        "BANASFN.BO": "BANAS FINANCE LTD.",
-        "BHARAT.BO": "Bharat Bhushan Finance & Commodity Brokers Ltd.",
-        "BIRLACAP.BO": "Birla Capital & Financial Services Limited",
-        "CAPMANFI.BO": "Capman Financials Ltd.",
-        "CCFCL.BO": "CLASSIC GLOBAL FINANCE & CAPIT",
-        "CEEJAY.BO": "Ceejay Finance Ltd.",
-        "CIFCO.BO": "CIFCO FINANCE LTD.",
-        "CINDRELL.BO": "Cindrella Financial Services Ltd",
-        "CITIPOR.BO": "Citi Port Financial Services Limited",
-        "CNSDSEC.BO": "CSL Finance Limited",
-        "CONFINT.BO": "CONFIDENCE FINANCE AND TRADING",
-        "CREDNFN.BO": "CREDENTIAL FINANCE LTD.",
-        "CSLFINANCE.BO": "CSL Finance Limited",
-        "CUBIFIN.BO": "Cubical Financial Services Ltd.",
-        "CUPIDTR.BO": "Cupid Trades & Finance Ltd.",
-        "DATABASE.BO": "DATABASE FINANCE LTD.",
-        "DCMFINSERV.BO": "DCM FINANCIAL SERVICES LTD.",
-        "DFL.BO": "Decillion Finance Ltd.",
-        "DFLINFRA.BO": "DFL INFRASTRUCTURE FINANCE LTD",
-        "DHARFIN.BO": "Dharani Finance Ltd.",
-        "DHOOTIN.BO": "Dhoot Industrial Finance Ltd.",
-        "DKARTAV.BO": "DEE KARTAVYA FINANCE LTD.",
-        "EDELWEISS.NS": "EDELWEISS FINANCIAL SERVICES LI",
-        "EDELWEISS.BO": "Edelweiss Financial Services Limited",
-        "EFSLBBPH.BO": "Edelweiss Financial Services L",
-        "EMKAY.BO": "EMKAY GLOBAL FINANCIAL SERVICE",
-        "ENBETRD.BO": "ENBEE TRADE & FINANCE LTD.",
-        "ESCORTSFIN.BO": "ESCORTS FINANCE LTD.",
-        "EXPLICITFIN.BO": "Explicit Finance Limited",
-        "FINANTECH.NS": "FINANCIAL TECHNOLOGIES (INDIA)",
-        "FINKURVE.BO": "FINKURVE FINANCIAL SERVICES LT",
-        "FIRFIN.BO": "First Financial Services Limited",
-        "FIVEX.BO": "FIVE X FINANCE & INVESTMENT LT",
-        "FLFININ.BO": "PL FINANCE & INVESTMENT LTD.",
-        "FMEC.BO": "F MEC INTERNATIONAL FINANCIAL",
-        "FORTUNEF.BO": "Fortune Financial Services (India) Limited",
-        "FRONTFN.BO": "FRONTLINE FINANCIAL SERVICES L",
-        "GALADAFIN.BO": "Galada Finance Limited",
-        "GALAXCP.BO": "Galaxy Consolidated Finance Limited",
-        "GANONTR.BO": "GANON TRADING FINANCE CO.LTD.",
-        "GAZIFIN.BO": "GAZI FINANCIAL SERVICES & INVE",
-        "GBFL.BO": "Goenka Business & Finance Limi",
-        "GBLINFRA.BO": "GLOBAL INFRATECH & FINANCE LIM",
-        "GEEFC.BO": "Geefcee Finance Limited",
-        "GEOJITBNPP.BO": "GEOJIT BNP PARIBAS FINANCIAL S",
-        "GEOJITBNPP.NS": "Geojit Financial Services Limited",
-        "GFLFIN.BO": "GFL FINANCIALS INDIA LIMITED",
-        "GILADAFINS.BO": "Gilada Finance & Investments L",
-        "GLANCE.BO": "Glance Finance Ltd.",
-        "GOLECHA.BO": "Golechha Global Finance Ltd.",
-        "GREENCREST.BO": "GREENCREST FINANCIAL SERVICES",
-        "GRUH.BO": "GRUH FINANCE LTD.",
-        "GSBFIN.BO": "Gsb Finance Ltd",
-        "GUJSTATFIN-BT.NS": "GUJARAT STATE FINANCIAL CORPORA",
-        "GUJSTATFIN.BO": "GUJARAT STATE FINANCIAL CORPOR",
-        "HARAFIN.BO": "HARYANA FINANCIAL CORPORATION",
-        "HASTIFIN.BO": "Hasti Finance Ltd.",
-        "IFINSER.BO": "INTERACTIVE FINANCIAL SERVICES",
-        "IFSL.BO": "Integrated Financial Services Limited",
-        "IMCFINA.BO": "IMC FINANCE LTD.",
-        "INCFS.BO": "INCAP FINANCIAL SERVICES LTD.",
-        "INDERGR.BO": "Indergiri Finance Ltd.",
-        "INDOASIAF.BO": "Indo Asia Finance Limited",
-        "INSTAF.BO": "INSTA FINANCE LIMITED",
-        "INTEGFIN.BO": "INTEGRATED FINANCE COMPANY LTD",
-        "INTERFAC.BO": "Interface Financial Services Limited",
-        "INTRGLB.BO": "Inter Globe Finance Ltd.",
-        "JJFINCOR.BO": "JJ Finance Corporation Ltd",
-        "JMFINANCIL.NS": "JM FINANCIAL INR1",
-        "JMFINANCIL.BO": "JM FINANCIAL LTD.",
-        "JUMBFNL.BO": "JUMBO FINANCE LTD.",
-        "KAILASH.BO": "Kailash Auto Finance Ltd",
-        "KAPILRAJ.BO": "Kapil Raj Finance Ltd.",
-        "KARAFIN.BO": "KARAN FINANCE LTD.",
-        "KARNAVATI.BO": "Karnavati Finance Limited",
-        "KENFIN.BO": "Ken Financial Services Ltd",
-        "KIEVFIN.BO": "KIEV FINANCE LTD.",
-        "KIFS.BO": "KIFS FINANCIAL SERVICES LTD.",
-        "KJMCFIN.BO": "KJMC Financial Services Ltd.",
-        "KOTHARIFIN.BO": "KOTHARI WORLD FINANCE LTD.",
-        "KUBERFN.BO": "KUBER AUTO GENERAL FINANCE & L",
-        "KUMPFIN.BO": "Kumbhat Financial Services Ltd.",
-        "L&TFH.NS": "L&T FINANCE HOLDINGS LIMITED",
-        "L&TFH.BO": "L&T FINANCE HOLDINGS LTD.",
-        "LADDERUP.BO": "Ladderup Finance Limited",
-        "LEADFIN.BO": "Lead Financial Services Ltd.",
-        "LFIC.NS": "LAKSHMI FINANCE & INR10",
-        "LIBORDFIN.BO": "LIBORD FINANCE LTD",
-        "LIVERPO.BO": "LIVERPOOL FINANCE LTD.",
-        "LKPFIN.BO": "LKP Finance Limited",
-        "LKPFINABBPH.BO": "LKPFINANCE*",
-        "LLOYDFIN.BO": "LLOYDS FINANCE LTD.",
-        "LLOYDFIN.NS": "LLOYDS FINANCE INR10",
-        "M&MFIN.BO": "MAHINDRA & MAHINDRA FINANCIAL",
-        "MADHURC.BO": "Madhur Capital & Finance Limited",
-        "MAFATLAFIN.BO": "MAFATLAL FINANCE CO.LTD.",
-        "MAGANTR.BO": "MAGNANIMOUS TRADE & FINANCE LT",
-        "MANAPPURAM.NS": "MANAPPURAM FINANCE LIMITED",
-        "MANAPPURAM.BO": "MANAPPURAM FINANCE LTD.",
-        "MANGIND.BO": "MANGALAM INDUSTRIAL FINANCE LT",
-        "MANSIFIN.BO": "Mansi Finance (Chennai) Ltd.",
-        "MARGOFIN.BO": "MARGO FINANCE LIMITED",
-        "MARVEL.BO": "Marvel Capital & Finance (India) Ltd.",
-        "MAX.BO": "Max Financial Services Limited",
-        "MAX.NS": "Max Financial Services Limited",
-        "MEHIF.BO": "Mehta Integrated Finance Limited",
-        "MFSL.BO": "Max Financial Services Limited",
-        "MICROSEC.NS": "MICROSEC FINANCIAL SERVICES LIM",
-        "MINDAFIN.BO": "Minda Finance Limited",
-        "MINOLTAF.BO": "MINOLTA FINANCE LTD.",
-        "MISHKAFIN.BO": "MISHKA FINANCE AND TRADING LTD",
-        "MNPLFIN.BO": "Manipal Finance Corp Ltd.",
-        "MODFC.BO": "MODEL FINANCIAL CORPORATION LT",
-        "MONGIPA.BO": "MOONGIPA CAPITAL FINANCE LTD.",
-        "MORARKFI.BO": "Morarka Finance Limited",
-        "MOTILALOFS.BO": "MOTILAL OSWAL FINANCIAL SERVIC",
-        "MOTOGENFIN-BE.NS": "MOTOR & GENERAL FINANCE L",
-        "MOTOGENFIN.BO": "MOTOR & GENERAL FINANCE LTD.",
-        "MUKESHB.BO": "Mukesh Babu Financial Services Limited",
-        "MUKUIND.BO": "MUKUNDA INDUSTRIAL FINANCE LTD",
-        "MUNOTHFI.BO": "Munoth Financial Services Limited",
-        "MUTHOOTFIN.BO": "MUTHOOT FINANCE LTD.",
-        "NAHARCAP.BO": "Nahar Capital and Financial Services Limited",
-        "NALINLEA.BO": "Nalin Lease Finance Ltd.",
-        "NCCFIN.BO": "NCC Finance Limited",
-        "NCLRESE.BO": "NCL Research and Financial Services Limited",
-        "NFIL.BO": "Nishtha Finance And Investment",
-        "NGRJFIN-B.BO": "NAGARJUNA FINANCE LTD.",
-        "NIKKIGL.BO": "Nikki Global Finance Limited",
-        "NPRFIN.BO": "Npr Finance Ltd.",
-        "OFSS.NS": "ORACLE FINANCIAL SERVICES SOFTW",
-        "OFSS.BO": "ORACLE FINANCIAL SERVICES SOFT",
-        "OLYMTFI.BO": "OLYMPIC MANAGEMENT & FINANCIAL",
-        "OPTIFIN.BO": "Optimus Finance Limited",
-        "PARAGONF.BO": "Paragon Finance Ltd.",
-        "PFC.NS": "POWER FINANCE CORPORATION LIMIT",
-        "PFC.BO": "Power Finance Corporation Limited",
-        "PFS.BO": "PTC INDIA FINANCIAL SERVICES L",
-        "PLUSFIN.BO": "PLUS FINANCE LTD.",
-        "PREMINT.BO": "PREMIUM INTERNATIONAL FINANCE",
-        "PRESOFI.BO": "PREM SOMANI FINANCIAL SERVICES",
-        "PRISMFN.BO": "PRISM FINANCE LTD.",
-        "PROLINSO.BO": "PROLINE SOFTWARE & FINANCE LTD",
-        "RAHILIN.BO": "RAHIL INVESTMENT & FINANCE LTD",
-        "RAJATH.BO": "RAJATH FINANCE LIMITED",
-        "RAUNAFI.BO": "RAUNAQ FINANCE LTD.",
-        "RBGUPTA.BO": "R.B.GUPTA FINANCIALS LTD.",
-        "RFSL.BO": "Richfield Financial Services L",
-        "RISHABFIN.BO": "Rishab Financial Services Ltd",
-        "ROSELABS.BO": "Roselabs Finance Limited",
-        "RRFIN.BO": "RR Financial Consultants Limited",
-        "RTFL.BO": "Real Touch Finance Limited",
-        "SAHLIBHFI.BO": "Shalibhadra Finance Limited",
-        "SAIJEEV.BO": "SAI JEEVADHARA FINANCE LIMITED",
-        "SAINIK.BO": "Sainik Finance & Industries Ltd.",
-        "SAKTHIFIN.BO": "SAKTHI FINANCE LTD.",
-        "SAVFI.BO": "Savani Financials Ltd.",
-        "SHRIRAMCIT.NS": "SHRIRAM CITY UNION FINANCE LIMI",
-        "SHRIRAMCIT.BO": "SHRIRAM CITY UNION FINANCE LTD",
-        "SICAPIT.BO": "SI CAPITAL & FINANCIAL SERVICE",
-        "SIELFNS.BO": "Siel Financial Services Ltd.",
-        "SKSMICRO.BO": "SKS MICROFINANCE LTD.",
-        "SKSMICRO.NS": "Bharat Financial Inclusion Limited",
-        "SODFC.BO": "Som Datt Finance Corp Ltd",
-        "SREINFRA.BO": "SREI Infrastructure Finance Limited",
-        "SRGSFL.BO": "S R G SECURITIES FINANCE LTD",
-        "SRSFIN.BO": "SRS FINANCE LTD",
-        "SRTRANSFI.NS": "Shriram Transport Finance Co. Ltd.",
-        "SRTRANSFIN.BO": "SHRIRAM TRANSPORT FINANCE CO.L",
-        "SSPNFIN.BO": "SSPN Finance Limited",
-        "STERHFN.BO": "STERLING HOLIDAY FINANCIAL SER",
-        "STRLGUA.BO": "STERLING GUARANTY & FINANCE LT",
-        "SUCHITRA.BO": "Suchitra Finance & Trading Com",
-        "SUNDARMFIN.NS": "SUNDARAM FINANCE LIMITED",
-        "SUNDARMFIN.BO": "Sundaram Finance Limited",
-        "SUNFI.BO": "SUNFLEX FINANCE & INVESTMENTS",
-        "SURYAKR.BO": "SURYAKRIPA FINANCE LTD.",
-        "TARCF.BO": "TARRIF CINE & FINANCE LTD.",
-        "TCFCFINQ.BO": "TCFC Finance Ltd.",
-        "TCIFINANCE.NS": "TCI FINANCE LTD INR10",
-        "TCIFINANCE.BO": "TCI FINANCE LTD.",
-        "TFCILTD.BO": "TOURISM FINANCE CORPORATION OF",
-        "TFL.BO": "Transwarranty Finance Limited",
-        "TFSL.BO": "Typhoon Financial Services Lim",
-        "THIRDFIN.BO": "Thirdwave Financial Intermediaries Limited",
-        "TOKYOFIN.BO": "Tokyo Finance Ltd.",
-        "TRANSFIN.BO": "Trans Financial Resources Limited",
-        "TRANSPEKF.BO": "Optimus Finance Limited",
-        "TRCFIN.BO": "TRC Financial Services Ltd.",
-        "TRIUMPIN.BO": "TRIUMPH INTERNATIONAL FINANCE",
-        "UPASAFN.BO": "Upasana Finance Ltd",
-        "UPSURGE.BO": "Upsurge Investment and Finance Limited",
-        "USHAKIRA.BO": "Ushakiran Finance Limited",
-        "VARAHI.BO": "VARAHI DIAMONDS & FINANCE LTD.",
-        "VBDESAI.BO": "V. B. Desai Financial Services Limited",
-        "VFL.BO": "VIJI FINANCE LTD",
-        "VISAGAR.BO": "VISAGAR FINANCIAL SERVICES LTD",
-        "VISHWAFIN.BO": "VISHWAMITRA FINANCIAL SERVICES",
-        "VLSFINANCE.BO": "VLS FINANCE LTD.",
-        "WALLFORT.BO": "Wallfort Financial Services Limited",
-        "WILLIMFI.BO": "Williamson Financial Services Limited",
-        "WSFIN.BO": "Wall Street Finance Ltd.",
-        "YASTF.BO": "YASH TRADING & FINANCE LTD.",
-        "ZGOLDHOL.BO": "SRI CHAKRA FINANCIAL SERVICES",
-        "ZMILGFIN.BO": "MILGRAY FINANCE & INVESTMENT L",
-        "ZSAMPKTR.BO": "SAMPARK TRADING & FINANCE LTD.",
-        "ZSANCHTR.BO": "SANCHANA TRADING & FINANCE LTD",
-        "ZSHERAPR.BO": "SHERATON PROPERTIES & FINANCE",
-        "ZSIMCOTR.BO": "SIMCO TRADING & FINANCE CO.LTD",
-        "ZSIYARPO.BO": "SIYARAM PODDAR FINANCE & TRADI",
-        "ZSUBWAYF.BO": "Subway Finance & Investment Co., Ltd.",
-        "ZWARDENC.BO": "WARDEN CONSTRUCTION & FINANCE"
-    },
-
-    "Food - Major Diversified": {
-        "AAYUSH.BO": "Aayush Food And Herbs Limited",
-        "ADFFOODS.NS": "ADF FOODS LIMITED",
-        "ADFFOODS.BO": "ADF FOODS LTD.",
-        "ADFFOODS.NS": "ADF Foods Limited",
-        "AMISNFD.BO": "AMISON FOODS LTD.",
-        "ASIFOOD.BO": "ASIAN FOOD PRODUCTS LTD.",
-        "ATFL.NS": "Agro Tech Foods Limited",
-        "BRITANNIA.NS": "Britannia Industries Limited",
-        "CCL.NS": "CCL Products (India) Limited",
-        "CHORDIA.BO": "Chordia Food Products Limited",
-        "DAAWAT.BO": "LT Foods Limited",
-        "DAAWAT.NS": "LT Foods Limited",
-        "DFM.BO": "DFM Foods Limited",
-        "EBFL.BO": "ESTEEM BIO ORGANIC FOOD PROCES",
-        "EFPL.BO": "ECO FRIENDLY FOOD PROCESSING P",
-        "ENKTEXFOOD.BO": "ENKAY TEXFOODS INDUSTRIES LTD.",
-        "FARMAXIND.NS": "Farmax India Limited",
-        "FLEXFO.BO": "Flex Foods Ltd.",
-        "FOODSIN.BO": "Foods & Inns Ltd.",
-        "FORFOOD.BO": "FORTUNE FOODS LTD.",
-        "GAEL.NS": "Gujarat Ambuja Exports Limited",
-        "GOKUL.NS": "Gokul Refoils & Solvent Ltd",
-        "GOKULAGRO.NS": "Gokul Agro Resources Limited",
-        "GOLDCOINHF.BO": "GOLD COIN HEALTH FOODS LTD",
-        "GSKCONS.NS": "GlaxoSmithKline Consumer Healthcare Limited",
-        "HATSUN.NS": "Hatsun Agro Product Limited",
-        "HERITGFOOD.NS": "HERITAGE FOODS LTD INR10",
-        "HERITGFOOD.BO": "Heritage Foods Limited",
-        "HIMALFD.BO": "Himalchuli Food Products Limited",
-        "HMGRFOD.BO": "HIMGIRI FOODS LTD.",
-        "HNDFDS.BO": "Hindustan Foods Limited",
-        "INDOASIAP.BO": "Indo-Asian Foods and Commodities Limited",
-        "JRFOODS.BO": "JR Foods Ltd.",
-        "JUBLFOOD.BO": "Jubilant FoodWorks Limited",
-        "JVLAGRO.NS": "JVL Agro Industries Limited",
-        "KMGMILK.BO": "KMG MILK FOOD LTD.",
-        "KOHINOOR.NS": "KOHINOOR FOODS LIMITED",
-        "KOHINOOR.BO": "Kohinoor Foods Ltd.",
-        "KOHINOOR.NS": "Kohinoor Foods Limited",
-        "KRBL.NS": "KRBL Limited",
-        "KWALITY.NS": "Kwality Limited",
-        "LANYARD.BO": "LANYARD FOODS LTD.",
-        "MAHAANF.BO": "Mahaan Foods Limited",
-        "MCLEODRUSS.NS": "McLeod Russel India Limited",
-        "MILKSPL.BO": "MILK SPECIALITIES LTD.",
-        "MISHTANN.BO": "Mishtann Foods Limited",
-        "MLKFOOD.BO": "Milkfood Ltd.",
-        "MLKPIL.BO": "MILK PARTNERS INDIA LIMITED",
-        "NESTLEIND.NS": "Nestlé India Limited",
-        "NHCFOODS.BO": "NHC FOODS LTD.",
-        "NIMBUSFOO.BO": "Nimbus Foods Industries Ltd",
-        "OVOBELE.BO": "OVOBEL FOODS LTD.",
-        "PRABHAT.NS": "PRABHAT DAIRY LTD INR10",
-        "PRABHAT.BO": "Prabhat Dairy Limited",
-        "PRABHAT.NS": "Prabhat Dairy Limited",
-        "PRESTIG.BO": "PRESTIGE FOODS LTD.",
-        "RAASIENT.BO": "Anjani Foods Limited",
-        "RAJOIL.NS": "Raj Oil Mills Limited",
-        "RASOYPR.NS": "Rasoya Proteins Limited",
-        "RCLFOODS.BO": "RCL FOODS LIMITED",
-        "REIAGROLTD.NS": "REI Agro Limited",
-        "RIVERDAL.BO": "RIVERDALE FOODS LTD.",
-        "RMIFOOD.BO": "RMI FOODS LTD.",
-        "ROSSELLIND.NS": "Rossell India Limited",
-        "RUCHISOYA.NS": "Ruchi Soya Industries Limited",
-        "SHAHFOOD.BO": "Shah Foods Limited",
-        "SITASHREE-BE.NS": "SITA SHREE FOOD PR INR10",
-        "SITASHREE.NS": "SITA SHREE FOOD PRODUCTS LIMITE",
-        "SITASHREE.BO": "Sita Shree Food Products Ltd.",
-        "SOURCENTRL.BO": "SOURCE NATURAL FOODS & HERBAL",
-        "SPARKFD.BO": "SPARKLE FOODS LTD.",
-        "SPECFOOD.BO": "Spectrum Foods Ltd.",
-        "SUPDF.BO": "SUPERSTAR DISTILLERIES & FOODS",
-        "SURFI.BO": "Suryo Foods & Industries Ltd",
-        "TARAI.BO": "Tarai Foods Ltd",
-        "TATACOFFEE.NS": "Tata Coffee Limited",
-        "TATAGLOBAL.NS": "Tata Global Beverages Limited",
-        "TEMPTFD.BO": "TEMPTATION FOODS LTD.",
-        "TRANSFD.BO": "TRANSGLOBE FOODS LTD.",
-        "VADIDAI.BO": "Vadilal Dairy International Ltd.",
-        "VADILALIND.NS": "Vadilal Industries Limited",
-        "VGPRFOO.BO": "VEGEPRO FOODS & FEEDS LTD.",
-        "VIDHIDYE.NS": "Vidhi Specialty Food Ingredients Limited",
-        "VIMALOIL.NS": "Vimal Oil & Foods Limited",
-        "VINTAFD.BO": "VINTAGE FOODS & INDUSTRIES LTD"
-    },
-
-    "Food Wholesale": {
-        "ANIKINDS.NS": "Anik Industries Limited",
-        "HERITGFOOD.NS": "Heritage Foods Limited"
-    },
-
-    "Gas Utilities": {
-        "ABCGAS.BO": "ABC Gas (International) Ltd.",
-        "ALANGIND.BO": "Alang Industrial Gases Limited",
-        "ALERPTR.BO": "ALERT PETROGAS LTD.",
-        "BHAGGAS.BO": "Bhagawati Gas Ltd",
-        "EASTERNGAS.BO": "Eastern Gases Limited",
-        "ELLENBARR.BO": "Ellenbarrie Industrial Gases Ltd.",
-        "EXPOGAS.BO": "Expo Gas Containers Ltd.",
-        "GAGAN.BO": "Gagan Gases Limited",
-        "GAIL.NS": "GAIL (India) Limited",
-        "GSPL.NS": "Gujarat State Petronet Limited",
-        "GUJGAS.BO": "Gujarat Gas Limited",
-        "GUJGASLTD-BE.NS": "Gujarat Gas Limited",
-        "GUJGASLTD.NS": "GUJARAT GAS LIMITE INR10 NEW",
-        "GUJGASLTD.NS": "GUJARAT GAS LIMITE INR10 NEW",
-        "GUJRATGAS.BO": "Gujarat Gas Company Limited",
-        "GUJRATGAS6.BO": "GUJRATGAS6.BO",
-        "IGL.BO": "Indraprastha Gas Limited",
-        "IGL.NS": "Indraprastha Gas Limited",
-        "MEGASOFT.NS": "MEGASOFT LIMITED",
-        "MEGASOFT.BO": "Megasoft Ltd.",
-        "RAJGASES.BO": "Rajasthan Gases Limited",
-        "ZSOUTGAS.BO": "SOUTHERN GAS LTD."
-    },
-
-    "General Building Materials": {
-        "ACC.NS": "ACC Limited",
-        "AMBUJACEM.NS": "Ambuja Cements Limited",
-        "ANDHRACEMT.NS": "Andhra Cements Limited",
-        "AROGRANITE.NS": "Aro Granite Industries Limited",
-        "ASIANTILES.NS": "Asian Granito India Limited",
-        "BEARDSELL.NS": "Beardsell Limited",
-        "BINANIIND.NS": "Edayar Zinc Limited",
-        "BIRLACORPN.NS": "Birla Corporation Limited",
-        "BURNPUR.NS": "Burnpur Cement Limited",
-        "BVCL.NS": "Barak Valley Cements Limited",
-        "CARBORUNIV.NS": "Carborundum Universal Limited",
-        "CENTURYTEX.NS": "Century Textiles and Industries Limited",
-        "CERA.NS": "Cera Sanitaryware Limited",
-        "DALMIABHA.NS": "Dalmia Bharat Limited",
-        "DECCANCE.NS": "Deccan Cements Limited",
-        "ELECTCAST.NS": "Electrosteel Castings Limited",
-        "EUROCERA.NS": "Euro Ceramics Limited",
-        "EVERESTIND.NS": "Everest Industries Limited",
-        "GRASIM.NS": "Grasim Industries Limited",
-        "GREENPLY.NS": "Greenply Industries Limited",
-        "GRINDWELL.NS": "Grindwell Norton Limited",
-        "GSCLCEMENT.NS": "Gujarat Sidhee Cement Limited",
-        "HEIDELBERG.NS": "HeidelbergCement India Limited",
-        "HIL.NS": "HIL Limited",
-        "HSIL.NS": "HSIL Limited",
-        "IFGLREFRAC.NS": "IFGL Refractories Limited",
-        "INDIACEM.NS": "The India Cements Limited",
-        "JENSONICOL.NS": "Jenson & Nicholson (India) Limited",
-        "JKCEMENT.NS": "J.K. Cement Limited",
-        "JKLAKSHMI.NS": "JK Lakshmi Cement Limited",
-        "KAJARIACER.NS": "Kajaria Ceramics Limited",
-        "KAKATCEM.NS": "Kakatiya Cement Sugar and Industries Limited",
-        "MADHAV.NS": "Madhav Marbles and Granites Limited",
-        "MANGLMCEM.NS": "Mangalam Cement Limited",
-        "MURUDCERA.NS": "Murudeshwar Ceramics Limited",
-        "NCLIND.NS": "NCL Industries Limited",
-        "NITCO.NS": "Nitco Limited",
-        "OCL.NS": "OCL India Limited",
-        "ORIENTALTL.NS": "Oriental Trimex Limited",
-        "ORIENTBELL.NS": "Orient Bell Limited",
-        "ORIENTCEM.NS": "Orient Cement Limited",
-        "PRISMCEM.NS": "Prism Cement Limited",
-        "RAMCOIND.NS": "Ramco Industries Limited",
-        "REGENCERAM.NS": "Regency Ceramics Limited",
-        "SANGHIIND.NS": "Sanghi Industries Limited",
-        "SEZAL.NS": "Sejal Glass Limited",
-        "SFCL.NS": "Star Ferro and Cement Limited",
-        "SHREECEM.NS": "Shree Cement Limited",
-        "SICAGEN.NS": "Sicagen India Limited",
-        "SINTEX.NS": "Sintex Industries Limited",
-        "SOMANYCERA.NS": "Somany Ceramics Limited",
-        "ULTRACEMCO.NS": "UltraTech Cement Limited",
-        "VISAKAIND.NS": "Visaka Industries Limited"
-    },
-
-    "General Contractors": {
-        "A2ZINFRA.BO": "A2Z INFRA ENGINEERING LIMITED",
-        "A2ZINFRA.NS": "A2Z Infra Engineering Limited",
-        "AAKARENG.BO": "AAKAR ENGINEERING & MANUFACTUR",
-        "ACE.BO": "Action Construction Equipment Ltd",
-        "AHLUCONT.NS": "Ahluwalia Contracts (India) Limited",
-        "AIAENG.BO": "AIA Engineering Ltd.",
-        "ANNTHMS.BO": "ANANTHI CONSTRUCTIONS LTD.",
-        "ANSALHSG.BO": "Ansal Housing & Construction Ltd.",
-        "ARTSONEN.BO": "Artson Engineering Ltd.",
-        "ASHOKA.NS": "Ashoka Buildcon Limited",
-        "ATHCON.BO": "Athena Constructions Limited",
-        "AUSTENG.BO": "Austin Engineering Company Limited",
-        "AXISCADES.NS": "AXISCADES Engineering Technologies Limited",
-        "BAFEG.BO": "BAFFIN ENGINEERING PROJECTS LT",
-        "BCHL.BO": "BHANOT CONSTRUCTION & HOUSING",
-        "BEPL.NS": "BHANSALI ENGINEERING POLYMERS L",
-        "BEPL.BO": "Bhansali Engineering Polymers Ltd.",
-        "BFUTILITIE.NS": "BF Utilities Limited",
-        "BGRENERGY.NS": "BGR Energy Systems Limited",
-        "BHAGEENG.BO": "BHAGHEERATHA ENGINEERING LTD.",
-        "BLKASHYAP.NS": "B.L. Kashyap and Sons Limited",
-        "BRADYM.BO": "Brady & Morris Engineering Company Limited",
-        "BSLIMITED.NS": "BS Limited",
-        "CANDC.NS": "C & C CONSTRUCTIONS LIMITED",
-        "CANDC.BO": "C & C Constructions Limited",
-        "CANDC.NS": "C & C Constructions Limited",
-        "CCCL.BO": "Consolidated Construction Consortium Limited",
-        "CCCL.NS": "Consolidated Construction Consortium Limited",
-        "CONCON.BO": "CONTINENTAL CONSTRUCTION LTD.",
-        "COROENGG.BO": "COROMANDEL ENGINEERING COMPANY",
-        "COVENSP-B.BO": "COVENTRY SPRING & ENGINEERING",
-        "CRIMSON.BO": "CRIMSON METAL ENGINEERING COMP",
-        "ELECON.NS": "ELECON ENGINEERING INR2 (POST S",
-        "ELECON.BO": "Elecon Engineering Company Limited",
-        "ENGINERSIN.NS": "Engineers India Limited",
-        "ERAINFRA.BO": "Era Infra Engineering Limited",
-        "ERAINFRA.NS": "Era Infra Engineering Limited",
-        "EXCEL.NS": "Excel Realty N Infra Limited",
-        "GAMMONIND.NS": "Gammon India Limited",
-        "GARNET.BO": "Garnet Construction Ltd.",
-        "GAYAPROJ.NS": "Gayatri Projects Limited",
-        "GCCL.BO": "GCCL CONSTRUCTION & REALITIES",
-        "GISOLUTION-BE.NS": "GI ENGINEERING SOLUTIONS LTD IN",
-        "GISOLUTION.NS": "GI ENGINEERING SOL INR10",
-        "GISOLUTION.BO": "GI ENGINEERING SOLUTIONS LTD.",
-        "GISOLUTION.NS": "GI Engineering Solutions Limited",
-        "GTV.BO": "GTV Engineering Limited",
-        "HCC.BO": "Hindustan Construction Company Limited",
-        "HCC.NS": "Hindustan Construction Company Limited",
-        "HINDDORROL.NS": "Hindustan Dorr-Oliver Limited",
-        "IL&FSENGG.BO": "IL&FS ENGINEERING AND CONSTRUC",
-        "IL&FSENGG.NS": "IL&FS Engineering and Construction Company Limited",
-        "INDIANHUME.NS": "The Indian Hume Pipe Company Limited",
-        "INTEGRAEN.BO": "INTEGRA ENGINEERING INDIA LTD.",
-        "ISGEC.BO": "ISGEC HEAVY ENGINEERING LTD.",
-        "ITDCEM.NS": "ITD Cementation India Limited",
-        "IVRCLINFRA.NS": "IVRCL Limited",
-        "JAIHINDPRO.NS": "Jaihind Projects Limited",
-        "JKIL.NS": "J. Kumar Infraprojects Limited",
-        "JMCPROJECT.NS": "JMC Projects (India) Limited",
-        "JOGENG.BO": "JOG ENGINEERING LTD.",
-        "JOSTS.BO": "Josts Engineering Company Ltd",
-        "JPASSOCIAT.NS": "Jaiprakash Associates Limited",
-        "KAMANWALA.BO": "Kamanwala Housing Construction Limited.",
-        "KAUSHALYA.NS": "Kaushalya Infrastructure Development Corporation Limited",
-        "KEDIACN.BO": "Kedia Construction Co., Ltd.",
-        "KINETICENG.BO": "KINETIC ENGINEERING LTD.",
-        "KLBRENG-B.BO": "Kilburn Engineering Limited",
-        "KNRCON.BO": "KNR Constructions Limited.",
-        "KNRCON.NS": "KNR Constructions Limited",
-        "KRISHNAENG.NS": "KRISHNA ENGINEERING WORKS LTD.",
-        "KRISHNAENG.BO": "KRISHNA ENGINEERING WORKS LTD.",
-        "KRISHNAENG.NS": "KRISHNA ENGINEERING WORKS LTD.",
-        "LABHCON.BO": "LABH CONSTRUCTION LTD.",
-        "LOKHSG.BO": "Lok Housing & Constructions Ltd.",
-        "LT.NS": "Larsen & Toubro Limited",
-        "MADHUCON.NS": "Madhucon Projects Limited",
-        "MALVICAE.BO": "MALVICA ENGINEERING LTD.",
-        "MANINFRA.BO": "Man Infraconstruction Limited",
-        "MANINFRA.NS": "Man Infraconstruction Limited",
-        "MANJEERA.BO": "Manjeera Constructions Ltd.",
-        "MBECL.BO": "MCNALLY BHARAT ENGINEERING COM",
-        "MBECL.NS": "McNally Bharat Engineering Company Limited",
-        "MBLINFRA.NS": "MBL Infrastructures Limited",
-        "MUKANDENGG.NS": "Mukand Engineers Limited",
-        "NAVBLDR.BO": "Navkar Builders Ltd.",
-        "NBCC.NS": "NBCC (India) Limited",
-        "NCC.NS": "NCC Limited",
-        "NOIDATOLL.NS": "Noida Toll Bridge Company Limited",
-        "OJASASSET.BO": "OJAS ASSET RECONSTRUCTION COMP",
-        "OMMETALS.NS": "Om Metals Infraprojects Limited",
-        "PATELENG.BO": "PATEL ENGINEERING LTD.",
-        "PATELENG.NS": "Patel Engineering Limited",
-        "PBAINFRA.NS": "PBA Infrastructure Limited",
-        "PEPL.BO": "PEARL ENGINEERING POLYMERS LTD",
-        "PETRONENGG.BO": "PETRON ENGINEERING CONSTRUCTIO",
-        "PETRONENGG.NS": "Petron Engineering Construction Limited",
-        "POWERMECH.NS": "Power Mech Projects Limited",
-        "PRAJIND.NS": "Praj Industries Limited",
-        "PRAKASHCON.NS": "Prakash Constrowell Limited",
-        "PRATIBHA.NS": "Pratibha Industries Limited",
-        "PUNJLLOYD.NS": "Punj Lloyd Limited",
-        "PUROHITCON.BO": "Purohit Construction Limited",
-        "PURVA.NS": "Puravankara Limited",
-        "RAMKY.NS": "Ramky Infrastructure Limited",
-        "RASANDIK.BO": "Rasandik Engineering Industries India Ltd.",
-        "REMISIN.BO": "REMI SALES & ENGINEERING LTD.",
-        "RIIL.NS": "Reliance Industrial Infrastructure Limited",
-        "ROLCOEN.BO": "Rolcon Engineering Company Limited",
-        "RPPINFRA.NS": "RPP Infra Projects Limited",
-        "SADBHAV.BO": "Sadbhav Engineering, Ltd.",
-        "SADBHAV.NS": "Sadbhav Engineering Limited",
-        "SADBHIN.NS": "Sadbhav Infrastructure Project Limited",
-        "SATELENG.BO": "Satellite Engineering Ltd.",
-        "SHAHCON.BO": "SHAH CONSTRUCTION CO.LTD.",
-        "SHAILY.BO": "Shaily Engineering Plastics Limited",
-        "SHRIRAMEPC.NS": "Shriram EPC Limited",
-        "SHUKUN.BO": "SHUKUN CONSTRUCTION LTD.",
-        "SIMPLEX.NS": "Simplex Projects Limited",
-        "SIMPLEXINF.NS": "Simplex Infrastructures Limited",
-        "SKC.BO": "Sri Krishna Constructions (Ind",
-        "SKIL.NS": "SKIL Infrastructure Limited",
-        "SKIPPER.NS": "Skipper Limited",
-        "SPMLINFRA.NS": "SPML Infra Limited",
-        "SSFORMT.BO": "S.S. Forgings & Engineering Limited",
-        "SUNILHITEC.NS": "Sunil Hitech Engineers Limited",
-        "SUPRAJIT.NS": "SUPRAJIT ENGINEERING LIMITED",
-        "SUPRAJIT.BO": "SUPRAJIT ENGINEERING LTD.",
-        "SUPREMEINF.NS": "Supreme Infrastructure India Limited",
-        "TALBROSENG.BO": "TALBROS ENGINEERING LIMITED",
-        "TANTIACON.NS": "Tantia Constructions Limited",
-        "TANTIACONS.NS": "TANTIA CONSTRUCTIONS LIMITED",
-        "TANTIACONS.BO": "TANTIA CONSTRUCTIONS LTD.",
-        "TANTIACONS.NS": "Tantia Constructions Limited",
-        "TARMAT.NS": "Tarmat Limited",
-        "TECHNO.NS": "Techno Electric & Engineering Company Limited",
-        "TECHNOFAB.NS": "Technofab Engineering Limited",
-        "TEXRAIL.BO": "TEXMACO RAIL & ENGINEERING LTD",
-        "THEJO-SM.NS": "THEJO ENGINEERING INR10",
-        "TRIVENI.BO": "TRIVENI ENGINEERING & INDUSTRI",
-        "TVOLCON.BO": "TIVOLI CONSTRUCTION LTD.",
-        "UBENGG-BZ.NS": "UB ENGINEERING LTD",
-        "UBENGG.BO": "UB ENGINEERING LTD.",
-        "UNITY.NS": "Unity Infraprojects Limited",
-        "VALECHAENG.BO": "VALECHA ENGINEERING LTD.",
-        "VALECHAENG.NS": "Valecha Engineering Limited",
-        "VIJSHAN.BO": "Vijay Shanthi Builders Limited",
-        "VIKSHEN.BO": "VIKSIT ENGINEERING LTD.",
-        "VISWVIS.BO": "VISHVA VISHAL ENGINEERING LTD.",
-        "VJLAXMIE.BO": "Veejay Lakshmi Engineering Works Limited",
-        "VKSPL.NS": "VKS Projects Limited",
-        "VOLTAS.NS": "Voltas Limited",
-        "VORACON.BO": "VORA CONSTRUCTIONS LTD.",
-        "WALCHANNAG.NS": "Walchandnagar Industries Limited",
-        "WELPLACE.BO": "GENERIC ENGINEERING CONSTR&PROJ",
-        "ZBHILENG.BO": "BHILAI ENGINEERING CORPORATION",
-        "ZGOLKOND.BO": "GOLKONDA ENGINEERING ENTERPRIS",
-        "ZNILKENG.BO": "NILKANTH ENGINEERING LTD.",
-        "ZSNEHCON.BO": "SNEH CONSTRUCTION LTD."
-    },
-
-    "Gold": {
-        "SHIRPUR-G.NS": "Shirpur Gold Refinery Limited"
-    },
-
-    "Grocery Stores": {
-        "REISIXTEN.NS": "REI Six Ten Retail Limited"
-    },
-
-    "Heavy Construction": {
-        "ADHBHUTIN.BO": "Adhbhut Infrastructure Ltd.",
-        "AINFRA.BO": "A Infrastructure Limited",
-        "ANANDPROJ.BO": "ANAND PROJECTS LTD",
-        "ANNAINFRA.BO": "Anna Infrastructure Ltd",
-        "ANUBHAV.BO": "Anubhav Infrastructure Limited",
-        "ARAMUSK.BO": "ARAMUSK INFRASTRUCTURE INVESTM",
-        "ARSSINFRA.BO": "ARSS Infrastructure Projects Limited",
-        "ARSSINFRA.NS": "ARSS Infrastructure Projects Limited",
-        "ARTEFACT.BO": "Artefact Projects Ltd",
-        "ASAHINFRA.BO": "Asahi Infrastructure & Projects Ltd.",
-        "ATLANTA.NS": "Atlanta Limited",
-        "ATLINFRA.BO": "ATLANTA INFRASTRUCTURE AND FIN",
-        "ATVPR.BO": "ATV Projects India, Ltd.",
-        "AUSTRAL.BO": "Greenearth Resources and Projects Ltd",
-        "BASILINF.BO": "Basil Infrastructure Projects Ltd.",
-        "BIDL.BO": "BHAGYODAYA INFRASTRUCTURE DEVE",
-        "BRAHMINFRA.BO": "BRAHMAPUTRA INFRASTRUCTURE LTD",
-        "CRANEINFRA.BO": "Crane Infrastructure Limited",
-        "DELINFRA.BO": "DELMA INFRASTRUCTURE LIMITED",
-        "DIAMANT.BO": "DIAMANT INFRASTRUCTURE LIMITED",
-        "ELDERPG.BO": "Elder Projects Ltd.",
-        "EMAMIINFRA.BO": "EMAMI INFRASTRUCTURE LTD.",
-        "EMPORIS.BO": "EMPORIS PROJECTS LIMITED",
-        "EXELON.BO": "Exelon Infrastructure Ltd",
-        "GAMMNINFRA.BO": "GAMMON INFRASTRUCTURE PROJECTS",
-        "GAMMNINFRA.NS": "Gammon Infrastructure Projects Limited",
-        "GAYAPROJ.BO": "Gayatri Projects Limited",
-        "GCCLINP.BO": "GCCL INFRASTRUCTURE & PROJECTS",
-        "GLOBALCA.BO": "Global Capital Market & Infrastructures Ltd",
-        "GMRINFRA.NS": "GMR INFRASTRUCTURE LIMITED",
-        "GMRINFRA.BO": "GMR Infrastructure Limited",
-        "GMRINFRA.NS": "GMR Infrastructure Limited",
-        "GPTINFRA.BO": "GPT INFRAPROJECTS LTD.",
-        "GTLINFRA.BO": "GTL Infrastructure Ltd.",
-        "HAZOOR.BO": "Hazoor Multi Projects Ltd",
-        "HECINFRA-IT.NS": "HEC Infra Projects Ltd",
-        "HECPROJECT-SM.NS": "HEC INFRA PROJECTS INR10",
-        "IITLPROJ.BO": "IITL PROJECTS LIMITED",
-        "IL&FSTRANS.NS": "IL&FS Transportation Networks Limited",
-        "INDOPACIF.BO": "Indo Pacific Projects Limited",
-        "INDOPACIFIC.BO": "INDO PACIFIC PROJECTS LIMITED",
-        "IRB.NS": "IRB Infrastructure Developers Limited",
-        "JAIHINDPRO.NS": "JAIHIND PROJECTS LIMITED",
-        "JAIHINDPRO.BO": "JAIHIND PROJECTS LTD.",
-        "JAINCO.BO": "Jainco Projects (India) Limited",
-        "JKIL.BO": "J.Kumar Infraprojects Limited",
-        "JMCPROJECT.BO": "JMC PROJECTS (INDIA) LTD.",
-        "JPINFRATEC.NS": "Jaypee Infratech Limited",
-        "JTAPARIA.BO": "J. TAPARIA PROJECTS LTD",
-        "KAUSHALYA.NS": "KAUSHALYA INFRASTRUCTURE DEVELO",
-        "KCLINFRA.BO": "KCL Infra Projects Limited",
-        "MADHUCON.BO": "MADHUCON PROJECTS LTD.",
-        "MAINFRA.BO": "Maruti Infrastructure Limited",
-        "MAPLLEINF.BO": "MAPLLE INFRAPROJECTS LTD.",
-        "MARGPROIN.BO": "Marg Projects And Infrastructure Ltd.",
-        "MAXHEIGHTS.BO": "MAXHEIGHTS INFRASTRUCTURE LTD.",
-        "MBLINFRA.NS": "MBL INFRASTRUCTURES LIMITED",
-        "MBLINFRA.BO": "MBL Infrastructures Limited",
-        "MEFCOM.BO": "Vishvas Projects Limited",
-        "MEP.NS": "MEP INFRASTRUCTURE INR10",
-        "MEP.NS": "MEP Infrastructure Developers Limited",
-        "MMSINFRA.BO": "MMS INFRASTRUCTURE LTD",
-        "NAKSHTRINF.BO": "NAKSHATRA INFRASTRUCTURE LTD.",
-        "NEWINFRA.BO": "NEWTIME INFRASTRUCTURE LIMITED",
-        "NILA.BO": "Nila Infrastructures Ltd",
-        "NIMBSPROJ.BO": "NIMBUS PROJECTS LTD.",
-        "NIVINFRA.BO": "NIVYAH INFRASTRUCTURE & TELECO",
-        "NORTHPR.BO": "NORTHERN PROJECTS LTD.",
-        "NUMUP.BO": "NUMERO UNO PROJECTS LTD.",
-        "OCENINFR.BO": "OCEAN INFRASTRUCTURE LTD.",
-        "OCTAVE.BO": "PERFECT-OCTAVE MEDIA PROJECTS",
-        "OMMETALS.NS": "OM METALS INFRAPROJECTS LIMITED",
-        "OMMETALS.BO": "OM METALS INFRAPROJECTS LTD.",
-        "PBAINFRA.BO": "Pba Infrastructure Ltd.",
-        "PITHMST.BO": "Nardhana Infrastructure Limited",
-        "PNCINFRA.NS": "PNC Infratech Limited",
-        "PRESTIGE-IL.NS": "PRESTIGE ESTATES PROJECTS LIMIT",
-        "PRESTIGE.BO": "PRESTIGE ESTATES PROJECTS LTD.",
-        "PSITINFRA.BO": "PS IT INFRASTRUCTURE & SERVICE",
-        "PURVA.NS": "PURAVANKARA PROJECTS LIMITED",
-        "PURVA.BO": "Puravankara Projects Limited",
-        "RAJINFRA.BO": "RAJESWARI INFRASTRUCTURE LIMIT",
-        "RAMKY.NS": "RAMKY INFRASTRUCTURE LIMITED",
-        "RAMKY.BO": "RAMKY INFRASTRUCTURE LTD.",
-        "RAMSONS.BO": "Ramsons Projects Limited",
-        "RELINFRA.BO": "Reliance Infrastructure Ltd",
-        "RIIL.BO": "Reliance Industrial Infrastructure Limited",
-        "ROCPROJ.BO": "ROCKLINE PROJECT LTD.",
-        "RPPINFRA.BO": "RPP INFRA PROJECTS LTD.",
-        "RTNINFRA.BO": "RATTANINDIA INFRASTRUCTURE LTD",
-        "RUCHINFRA-BE.NS": "RUCHI INFRASTRUCTURE LTD",
-        "RUCHINFRA.BO": "RUCHI INFRASTRUCTURE LTD.",
-        "SADBHIN.BO": "Sadbhav Infrastructure Project",
-        "SANCIA.BO": "SANCIA GLOBAL INFRAPROJECTS LI",
-        "SCANPRO.BO": "SCAN PROJECTS LTD.",
-        "SEAGOLD.BO": "Sea Gold Infrastructure Limited",
-        "SFPIL.BO": "SQUARE FOUR PROJECTS INDIA LIM",
-        "SHREERAM.BO": "Shree Ram Urban Infrastructure, Ltd.",
-        "SIMPLEX.BO": "Simplex Projects Ltd.",
-        "SIMPLEXINF.BO": "SIMPLEX INFRASTRUCTURES LTD.",
-        "SIPL.BO": "SHELTER INFRA PROJECTS LTD.",
-        "SIPROJECTS.BO": "South India Projects Ltd.",
-        "SIPTL.BO": "SHARANAM INFRAPROJECT AND TRAD",
-        "SKIL-BE.NS": "SKIL INFRASTRUCTURE LTD.",
-        "SKIL.BO": "SKIL Infrastructure Limited",
-        "SOFTBPO.BO": "IDream Film Infrastructure Company Ltd",
-        "SRSREAL.BO": "SRS REAL INFRASTRUCTURE LTD.",
-        "STLSTRINF.BO": "Steel Strips Infrastructures Limited",
-        "SUPREMEINF.BO": "Supreme Infrastructure India Ltd",
-        "SWAGRUHA.BO": "SWAGRUHA INFRASTRUCTURE LTD.",
-        "TARANG.BO": "TARANG PROJECTS & CONSULTANT L",
-        "TEXINFRA.BO": "TEXMACO INFRASTRUCTURE & HOLDI",
-        "TPROJECT.BO": "THIRANI PROJECTS LTD",
-        "UNITY.NS": "UNITY INFRAPROJECTS LIMITED",
-        "UNITY.BO": "Unity Infraprojects Limited",
-        "VASINFRA.BO": "Vas Infrastructure Limited",
-        "VKSPL.NS": "VKS PROJECTS LTD INR1",
-        "VKSPL.BO": "VKS PROJECTS LTD.",
-        "VSFPROJ.BO": "VSF Projects Limited",
-        "YOGISUNG.BO": "Yogi Infra Projects Limited",
-        "YURANUS.BO": "YURANUS INFRASTRUCTURE LTD"
-    },
-
-    "Home Furnishings & Fixtures": {
-        "BLUESTARCO.NS": "Blue Star Limited",
-        "JIKIND.NS": "JIK Industries Limited",
-        "LAOPALA.NS": "La Opala RG Limited",
-        "ORIENTPPR.NS": "Orient Paper & Industries Limited",
-        "PILITA.NS": "PIL ITALICA LIFESTYLE LIMITED",
-        "RUSHIL.NS": "Rushil Décor Limited",
-        "TTKPRESTIG.NS": "TTK Prestige Limited"
-    },
-
-    "Hospitals": {
-        "APOLLOHOSP.NS": "Apollo Hospitals Enterprise Limited",
-        "FORTIS.NS": "Fortis Healthcare Limited",
-        "HCG.NS": "HealthCare Global Enterprises Limited",
-        "INDRAMEDCO.NS": "Indraprastha Medical Corporation Limited",
-        "NH.NS": "Narayana Hrudayalaya Limited",
-        "PTL.NS": "PTL Enterprises Limited"
-    },
-
-    "Independent Oil & Gas": {
-        "HINDOILEXP.NS": "Hindustan Oil Exploration Company Limited",
-        "OIL.NS": "Oil India Limited",
-        "SELAN.NS": "Selan Exploration Technology Limited",
-        "SVOGL.NS": "SVOGL Oil Gas and Energy Limited"
-    },
-
-    "Industrial Equipment Wholesale": {
-        "LGBFORGE.NS": "LGB Forge Limited",
-        "RKFORGE.NS": "Ramkrishna Forgings Limited",
-        "UNIVCABLES.NS": "Universal Cables Limited"
-    },
-
-    "Industrial Metals & Minerals": {
-        "20MICRONS.NS": "20 Microns Limited",
-        "ABAN.BO": "ABAN OFFSHORE LTD.",
-        "ADANIENT.NS": "Adani Enterprises Limited",
-        "ADHUNIK.NS": "ADHUNIK METALIKS LIMITED",
-        "ADHUNIK.BO": "Adhunik Metaliks Limited",
-        "AHMEDFORG.NS": "Metalyst Forgings Limited",
-        "AIML.BO": "ALLIANCE INTEGRATED METALIKS L",
-        "AKASHDEEP.BO": "AKASHDEEP METAL INDUSTRIES LIM",
-        "ALCOBMT-B.BO": "ALCOBEX METALS LTD.",
-        "ALICON.BO": "ALICON CASTALLOY LIMITED",
-        "ALKALI.NS": "ALKALI METALS LIMITED",
-        "ALKALI.BO": "Alkali Metals Ltd.",
-        "ALLMEPR.BO": "ALL METAL PROCESS INDUSTRIES L",
-        "ALMONDZ.BO": "Avonmore Capital & Management Services Limited",
-        "ALUMECO.BO": "Golkonda Aluminium Extrusions Limited",
-        "ARCUTTIP.BO": "Arcuttipore Tea Co Ltd",
-        "ASHAPURMIN.NS": "Ashapura Minechem Limited",
-        "ASIANAL-B.BO": "ASIAN ALLOYS LTD.",
-        "AUSTRAL.NS": "Greenearth Resources & Projects Limited",
-        "AVONMORE.BO": "AVONMORE CAPITAL & MANAGEMENT",
-        "BALASORE.BO": "Balasore Alloys Limited",
-        "BFFL.BO": "Bangalore Fort Farms Limited",
-        "BHAGWNME.BO": "Bhagwandas Metals Ltd.",
-        "BHRKALM.BO": "Bhoruka Aluminium Limited",
-        "BIMETAL.BO": "Bimetal Bearings Limited",
-        "BMAL.BO": "BOTHRA METALS & ALLOYS LTD.",
-        "BOMSS.BO": "Bombay Swadeshi Stores Ltd.",
-        "COALINDIA.BO": "COAL INDIA LTD.",
-        "COALINDIA.NS": "Coal India Limited",
-        "COREEDUTEC6.BO": "COREEDUTEC6.BO",
-        "DOLPHINOFF.NS": "DOLPHIN OFFSHORE ENTERPRISES (I",
-        "DOLPHINOFF.BO": "DOLPHIN OFFSHORE ENTERPRISES (",
-        "DRLCOME.BO": "LA TIM Metal & Industries Ltd.",
-        "DUKEOFS.BO": "Duke Offshore Ltd",
-        "EMETALSI.BO": "E-METALS INDIA LTD.",
-        "ENNORE.BO": "Ennore Coke Limited",
-        "ESSDEE.BO": "Ess Dee Aluminium Limited",
-        "EXOTICCOAL.BO": "EXOTIC COAL LTD.",
-        "FACORALL.BO": "Facor Alloys Ltd.",
-        "FERROALL.BO": "Ferro Alloys Corp. Ltd.",
-        "FOSCL.BO": "FUTURISTIC OFFSHORE SERVICES &",
-        "GAL.NS": "GYSCOAL ALLOYS LIMITED",
-        "GAL.BO": "GYSCOAL ALLOYS LTD.",
-        "GALLANTT.NS": "GALLANTT METAL LIMITED",
-        "GALLANTT.BO": "Gallantt Metal Ltd.",
-        "GALORE.BO": "GALORE PRINTS INDUSTRIES LTD.",
-        "GLOBOFFS.BO": "GLOBAL OFFSHORE SERVICES LTD.",
-        "GMDCLTD.NS": "Gujarat Mineral Development Corporation Limited",
-        "GMETCOAL.BO": "GUJARAT METALLIC COAL & COKE L",
-        "GOLKONDA.BO": "Golkonda Aluminium Extrusions",
-        "GTOFFSHORE.BO": "GOL OFFSHORE LTD.",
-        "GUJNRECOKE.NS": "Gujarat NRE Coke Ltd.",
-        "HARME.BO": "HARIYANA METALS LTD.",
-        "HILTON.BO": "Hilton Metal Forging Limitied",
-        "HINDALUMI.BO": "Hind Aluminium Industries Ltd",
-        "HINDCOPPER.NS": "HINDUSTAN COPPER LIMITED",
-        "HINDCOPPER.BO": "HINDUSTAN COPPER LTD.",
-        "HINDZINC.NS": "HINDUSTAN ZINC LIMITED",
-        "HINDZINC.BO": "Hindustan Zinc Ltd.",
-        "HINDZINC.NS": "Hindustan Zinc Limited",
-        "HINDZINC4.BO": "HINDZINC4.BO",
-        "HISARMET.BO": "Hisar Metal Industries Ltd.",
-        "IMFA.NS": "INDIAN METALS & FERRO ALLOYS LI",
-        "IMFA.BO": "Indian Metals & Ferro Alloys Limited",
-        "IMPEXFERRO.NS": "Impex Ferro Tech Limited",
-        "INDWIRE-B.BO": "INDORE WIRE CO.LTD.",
-        "JEYPORE.BO": "Jeypore Sugar Company Ltd.",
-        "JEYPORE.NS": "Jeypore Sugar Company Ltd.",
-        "JHAGCOP.BO": "JHAGADIA COPPER LTD.",
-        "KAJARIR.BO": "KIC Metaliks Ltd.",
-        "KENNAMET.BO": "Kennametal India Limited",
-        "KORE.BO": "Kore Foods Limited",
-        "KOTHARIPRO.NS": "Kothari Products Limited",
-        "LATIMMETAL.BO": "La Tim Metal & Industries Limi",
-        "MAANALU.BO": "MAAN ALUMINIUM LTD.",
-        "MAITHANALL.BO": "MAITHAN ALLOYS LTD.",
-        "MANAKALUCO-BE.NS": "Manak Aluminium Co. Ltd.",
-        "MANAKALUCO.NS": "MANAKSIA ALUMINIUM INR1",
-        "MANAKALUCO.NS": "MANAKSIA ALUMINIUM INR1",
-        "MANAKCOAT-BE.NS": "Man Coat Metal & Ind Ltd",
-        "MANGCHEFER.NS": "MANGALORE CHEMICALS & FERTILIZE",
-        "MANGCHEFER.BO": "MANGALORE CHEMICALS & FERTILIZ",
-        "MERCATOR.NS": "Mercator Limited",
-        "MERMETL.BO": "Mercury Metals Limited",
-        "METAI.BO": "METALMAN INDUSTRIES LTD.",
-        "METALCO.BO": "Metal Coatings (india) Ltd",
-        "METALFORGE.NS": "METALYST FORGINGS INR10",
-        "METALFORGE.BO": "METALYST FORGINGS LIMITED",
-        "METKORE.NS": "METKORE ALLOYS & INDUSTRIES LIM",
-        "METKORE.BO": "METKORE ALLOYS & INDUSTRIES LT",
-        "METKORE.NS": "Metkore Alloys & Industries Limited",
-        "MEWATZI.BO": "Mewat Zinc Ltd.",
-        "MMTC.NS": "MMTC Limited",
-        "MNKALCOLTD.BO": "Manaksia Aluminium Company Ltd",
-        "MNKCMILTD.BO": "Manaksia Coated Metals & Indus",
-        "MODISNME.BO": "Modison Metals Ltd.",
-        "MOIL.NS": "MOIL Limited",
-        "MOREPENLAB.NS": "MOREPEN LABORATORI INR2",
-        "MOREPENLAB.BO": "Morepen Laboratories Ltd.",
-        "MRPL.NS": "MANGALORE REFINERY AND PETROCHE",
-        "MRPL.BO": "Mangalore Refinery and Petrochemicals Limited",
-        "MYSORPETRO.BO": "MYSORE PETRO CHEMICALS LTD.",
-        "MYSPAPE.BO": "The Mysore Paper Mills Limited",
-        "NATIONALUM.BO": "NATIONAL ALUMINIUM CO.LTD.",
-        "NCOPPER-BE.NS": "NISSAN COPPER LTD INR10",
-        "NCOPPER-BZ.NS": "NISSAN COPPER LIMITED",
-        "NCOPPER.BO": "NISSAN COPPER LTD.",
-        "NCOPPER.NS": "Nissan Copper Limited",
-        "NDMETAL.BO": "ND Metal Industries Ltd",
-        "NITINALOY.BO": "Nitin Alloys Global Ltd.",
-        "OMMETALS6.BO": "OMMETALS6.BO",
-        "ORISSAMINE.NS": "The Orissa Minerals Development Company Limited",
-        "PADALPO.BO": "PADMANABH ALLOYS & POLYMERS LT",
-        "PALCO.BO": "Palco Metals Limited",
-        "PENNARALUM.BO": "PENNAR ALUMINIUM CO.LTD.",
-        "PHILCORP.BO": "Kore Foods Limited",
-        "PRADPME.BO": "Pradeep Metals Limited",
-        "PRESHAMET.BO": "PRESHA METALLURGICAL LTD.",
-        "RAJMINC.BO": "RAJENDRA MINING SPARES CO.LTD.",
-        "RANJEEV.BO": "Ranjeev Alloys Ltd",
-        "RATNAMANI.BO": "RATNAMANI METALS & TUBES LTD.",
-        "RMMIL.NS": "Resurgere Mines & Minerals India Limited",
-        "ROSEZIN.BO": "ROSE ZINC LTD.",
-        "RUCHISTR.BO": "Ruchi Strips & Alloys Ltd.",
-        "SACHEMT.BO": "Sacheta Metals Limited",
-        "SHAHALLOYS-BE.NS": "SHAH ALLOYS INR10",
-        "SHAHALLOYS.NS": "SHAH ALLOYS INR10",
-        "SHAHALLOYS.BO": "SHAH ALLOYS LTD.",
-        "SHAQUAK.BO": "SHANTANU SHEOREY AQUAKULT LTD.",
-        "SHBAJRG.BO": "Shri Bajrang Alloys Ltd.",
-        "SHBCLQ.BO": "Shivalik Bimetal Controls Limited",
-        "SHNALUM.BO": "SHREE NARMADA ALUMINIUM INDUST",
-        "SHPOMMT.BO": "SHREE POMANI METALS & ALLOYS L",
-        "SHREMETAL.BO": "SHREE METALLOYS LTD.",
-        "SIDVIME.BO": "SIDDHI VINAYAK METAL COMPANY L",
-        "SILCAL.BO": "SILCAL METALLURGICAL LTD.",
-        "SMPL.NS": "SPLENDID METAL PRO INR10",
-        "SMPL.BO": "Splendid Metal Products Limite",
-        "SRMCL.BO": "Sri Ramakrishna Mills (Coimbatore) Limited",
-        "STCINDIA.NS": "The State Trading Corporation of India Limited",
-        "STOREONE.NS": "STORE ONE RETAIL INR10",
-        "STOREONE.BO": "Store One Retail India Ltd",
-        "SUNZI.BO": "SUNRISE ZINC LTD.",
-        "SURYODAL.BO": "SURYODAYA ALLO-METAL POWDERS L",
-        "TATAMETALI.NS": "TATA METALIKS LIMITED",
-        "TATAMETALI.BO": "Tata Metaliks Limited",
-        "TENTIMETAL.BO": "Tentiwala Metal Products Limit",
-        "UNIABEXAL.BO": "Uni Abex Alloy Products Ltd.",
-        "UNIMETA.BO": "UNI-METAL ALLOYS LTD.",
-        "UNISON.BO": "UNISON METALS LTD",
-        "UNIVPRIM.BO": "Universal Prime Aluminium Ltd.",
-        "VBCFERROQ.BO": "VBC Ferro Alloys Limited",
-        "VEDL.NS": "Vedanta Limited",
-        "WEIZFOREX.BO": "WEIZMANN FOREX LTD.",
-        "XOINFO.BO": "Saral Mining Limited",
-        "ZWINMOTR.BO": "WINMORE SILK MILLS LTD."
-    },
-
-    "Industrial Products": {
-        "AADIIND.BO": "Aadi Industries Limited",
-        "AARTIIND.NS": "AARTI INDUSTRIES LIMITED",
-        "AARTIIND.BO": "AARTI INDUSTRIES LTD.",
-        "ACCLAIM.BO": "ACCLAIM INDUSTRIES LIMITED",
-        "ACKNIT.BO": "Acknit Industries Limited",
-        "ADDIND.BO": "Addi Industries Limited",
-        "ADHUNIKIND.BO": "ADHUNIK INDUSTRIES LTD",
-        "ADVIK.BO": "ADVIK INDUSTRIES LIMITED",
-        "AGARIND.NS": "AGARWAL INDUSTRIAL INR10",
-        "AGARIND.BO": "Agarwal Industrial Corporation Ltd",
-        "AGIOPAPER.BO": "Agio Paper & Industries Ltd",
-        "AHIMSA-SI.NS": "AHIMSA INDUSTRIES INR10",
-        "AHIMSA-SL.NS": "AHIMSA INDUSTRIES INR10",
-        "AHIMSA-SM.NS": "AHIMSA INDUSTRIES INR10",
-        "AHIMSA-SO.NS": "AHIMSA INDUSTRIES INR10",
-        "AHIMSA-SP.NS": "AHIMSA INDUSTRIES INR10",
-        "AHIMSA-SQ.NS": "AHIMSA INDUSTRIES INR10",
-        "AHIMSA-ST.NS": "AHIMSA INDUSTRIES INR10",
-        "AICHAMP.BO": "AI CHAMPDANY INDUSTRIES LTD.",
-        "AIRL.BO": "Anubhav Industrial Resources L",
-        "ALANSCOTT.BO": "Alan Scott Industries Ltd.",
-        "ALOKTEXT.NS": "ALOK INDUSTRIES LIMITED",
-        "ALOKTEXT.BO": "ALOK INDUSTRIES LTD.",
-        "ALPININ-B.BO": "ALPINE INDUSTRIES LTD.",
-        "ALPSINDUS.NS": "ALPS INDUSTRIES LIMITED",
-        "ALPSINDUS.BO": "ALPS INDUSTRIES LTD.",
-        "AMARDEE.BO": "Amradeep Industries Ltd",
-        "AMBARPIL.BO": "Ambar Protein Industries Limit",
-        "AMDIND.BO": "AMD INDUSTRIES LTD.",
-        "AMFORG.BO": "Amforge Industries Limited",
-        "AMRAPLIN.BO": "Amrapali Industries Ltd.",
-        "ANARINDUS.BO": "ANAR INDUSTRIES LTD.",
-        "ANGIND.NS": "ANG INDUSTRIES LTD INR10",
-        "ANGIND.BO": "ANG INDUSTRIES LIMITED",
-        "ANIKINDS-BE.NS": "ANIK INDUSTRIES INR10",
-        "ANIKINDS.BO": "Anik Industries Limited",
-        "ANSINDUS.BO": "ANS INDUSTRIES LTD",
-        "APARINDS.BO": "APAR INDUSTRIES LTD.",
-        "APCOTEXIND.NS": "APCOTEX INDUSTRIES LIMITED",
-        "APCOTEXIND.BO": "APCOTEX INDUSTRIES LTD.",
-        "APMIN.BO": "APM Industries",
-        "ARCEEIN.BO": "Arcee Industries Ltd.",
-        "ARCHIDPLY.BO": "Archidply Industries Limited",
-        "ARENTERP.BO": "RAJDARSHAN INDUSTRIES LTD.",
-        "AREXMIS.BO": "Arex Industries Ltd.",
-        "ARHTIND.BO": "ARHAT INDUSTRIES LTD.",
-        "ARIHANTIND.BO": "ARIHANT INDUSTRIES LTD.",
-        "AROGRANITE.BO": "ARO GRANITE INDUSTRIES LTD.",
-        "ASAHIIND.BO": "ASAHI INDUSTRIES LIMITED",
-        "ASHCONIUL.BO": "ASHCO NIULAB INDUSTRIES LTD.",
-        "ASIANVE.BO": "ASIAN VEGPRO INDUSTRIES LTD.",
-        "ASINSTR.BO": "ASEAN INDUSTRIAL STRUCTURES LT",
-        "ASSOSTNB.BO": "Associated Stone Industries (Kotah) Ltd.",
-        "AVIVA.BO": "Aviva Industries Limited",
-        "AVNCPRN.BO": "AVON INDUSTRIES LTD.",
-        "AXTEL.BO": "Axtel Industries Ltd",
-        "BALAJIIND.BO": "BALAJI INDUSTRIAL CORPORATION",
-        "BALKRISIND-BE.NS": "BALKRISHNA INDUSTRIES LTD",
-        "BALKRISIND.NS": "BALKRISHNA INDUSTRIES LIMITED",
-        "BALKRISIND.BO": "BALKRISHNA INDUSTRIES LTD.",
-        "BALLARPUR.BO": "BALLARPUR INDUSTRIES LTD.",
-        "BCL.BO": "BCL Industries and Infrastruct",
-        "BDH.BO": "BDH Industries Ltd.",
-        "BECKONIN.BO": "Beckons Industries Ltd.",
-        "BEDMUTHA.NS": "BEDMUTHA INDUSTRIES LIMITED",
-        "BEDMUTHA.BO": "BEDMUTHA INDUSTRIES LTD.",
-        "BELAIND.BO": "BELAPUR INDUSTRIES LTD.",
-        "BHAGERIA.BO": "Bhageria Industries Limited",
-        "BHAGIL.BO": "Bhageria Industries Limited",
-        "BHORIND.BO": "BHOR INDUSTRIES LTD.",
-        "BHUTI.BO": "BHUVAN TRIPURA INDUSTRIES LTD.",
-        "BILINDU.BO": "BIL INDUSTRIES LTD.",
-        "BINANIIND.BO": "BINANI INDUSTRIES LTD.",
-        "BKV.BO": "BKV Industries Ltd.",
-        "BLACKROSE.BO": "Black Rose Industries Ltd",
-        "BLJIGAL.BO": "BALAJI GALVANISING INDUSTRIES",
-        "BLOIN.BO": "Bloom Industries Limited",
-        "BLUECHIPT.BO": "Blue Chip Tex Industries Ltd",
-        "BONINDL.BO": "Bonanza Industries Limited",
-        "BRITANNIA.BO": "Britannia Industries Limited",
-        "CARNATIN.BO": "Carnation Industries Limited",
-        "CEETAIN.BO": "CEETA INDUSTRIES LTD.",
-        "CENLUB.BO": "Cenlub Industries Limited",
-        "CETHARI.BO": "CETHAR INDUSTRIES LTD.",
-        "CHARMS.BO": "Charms Industries Ltd",
-        "CHENFERRO.BO": "CHENNAI FERROUS INDUSTRIES LIM",
-        "CHHATTIND.BO": "Chhattisgarh Industries Limited",
-        "CHPLIND.BO": "CHPL Industries Ltd.",
-        "CORDSCABLE.BO": "CORDS CABLE INDUSTRIES LTD.",
-        "COSBOARD.BO": "Cosboard Industries Ltd.",
-        "CTRNIND.BO": "CENTRON INDUSTRIAL ALLIANCE LT",
-        "CYBELEIND.BO": "Cybele Industries Ltd",
-        "DALMIAIN.BO": "DALMIA INDUSTRIES LTD.",
-        "DAMOINDUS.BO": "DAMODAR INDUSTRIES LTD.",
-        "DCMSRMIND.BO": "DCM SHRIRAM INDUSTRIES LTD.",
-        "DEEPIND.BO": "Deep Industries Ltd",
-        "DELTA.BO": "Delta Industrial Resources Lim",
-        "DETRIND.BO": "DETROIT INDUSTRIES LTD.",
-        "DEWRUBB-B.BO": "DEWAN RUBBER INDUSTRIES LTD.",
-        "DHARI.BO": "DHARNENDRA INDUSTRIES LTD.",
-        "DHOOTIND.BO": "Dhoot Industries Ltd.",
-        "DILIGENT.BO": "DILIGENT INDUSTRIES LTD.",
-        "DIVYAJYQ.BO": "Divya Jyoti Industries Ltd",
-        "DOLLEX.BO": "Dollex Industries Ltd.",
-        "DONEAR.NS": "DONEAR INDUSTRIES INR2",
-        "DONEAR.BO": "Donear Industries Limited",
-        "DRIND.BO": "D.R.INDUSTRIES LTD.",
-        "DUNCANSLTD-BE.NS": "DUNCANS INDUSTRIES INR10",
-        "DUNCANSLTD.NS": "DUNCANS INDUSTRIES INR10",
-        "DUNCANSLTD.BO": "DUNCANS INDUSTRIES LTD.",
-        "DUNCANSLTD.NS": "Duncans Industries Limited",
-        "DYNAMIND.BO": "Dynamic Industries Ltd.",
-        "DYNIDUS-B.BO": "DYNAVOX INDUSTRIES LTD.",
-        "EASTSILK.BO": "Eastern Silk Industries Ltd.",
-        "ECEIND.NS": "ECE INDUSTRIES LIMITED",
-        "ECOBOAR.BO": "Ecoboard Industries, Ltd.",
-        "EIDRELE.BO": "EIDER ELECTRONICS INDUSTRIES L",
-        "ELANGO.BO": "Elango Industries Ltd.",
-        "ELDEHSG.BO": "Eldeco Housing and Industries Limited",
-        "ELEMARB.BO": "Elegant Marbles & Grani Industries Ltd.",
-        "EMMBI.BO": "EMMBI INDUSTRIES LTD",
-        "EMPIND.BO": "Empire Industries Limited",
-        "EMTEXIND.BO": "EMTEX INDUSTRIES (I) LTD.",
-        "ESTER.NS": "ESTER INDUSTRIES LIMITED",
-        "ESTER.BO": "ESTER INDUSTRIES LTD.",
-        "EUREKAI.BO": "Eureka Industries Ltd.",
-        "EUROTEXIND.NS": "EUROTEX INDUSTRIES INR10",
-        "EVEREADY.BO": "EVEREADY INDUSTRIES INDIA LTD.",
-        "EVERESTIND.BO": "EVEREST INDUSTRIES LTD.",
-        "EXCELINDUS.BO": "EXCEL INDUSTRIES LTD.",
-        "EXIDEIND.NS": "EXIDE INDUSTRIES LIMITED",
-        "EXIDEIND.BO": "Exide Industries Limited",
-        "EXIDEIND6.BO": "EXIDE INDUSTRIES LTD",
-        "FARRYIND.BO": "Farry Industries Limited",
-        "FIEMIND.NS": "FIEM INDUSTRIES LIMITED",
-        "FIEMIND.BO": "Fiem Industries Ltd.",
-        "FINOLEXIND.BO": "Finolex Industries Limited",
-        "FINPIPE.NS": "Finolex Industries Limited",
-        "FIRSTWIN.BO": "First Winner Industries Limited",
-        "FOCUSIRL.BO": "FOCUS INDUSTRIAL RESOURCES LTD",
-        "GARLNIN.BO": "GARLON POLYFAB INDUSTRIES LTD.",
-        "GARWAMAR.BO": "Garware Marine Industries Ltd.",
-        "GBL.BO": "GBL INDUSTRIES LIMITED",
-        "GEOLOGI.BO": "GEOLOGGING INDUSTRIES LTD.",
-        "GJTAQFD.BO": "GUJARAT AQUA INDUSTRIES LTD.",
-        "GLOBALI.BO": "GLOBAL INDUSTRIES LTD.",
-        "GODREJIND.BO": "Godrej Industries Ltd.",
-        "GODREJIND.NS": "Godrej Industries Limited",
-        "GOMIND.BO": "GOM INDUSTRIES LTD.",
-        "GORANIN.BO": "Gorani Industries Ltd",
-        "GRASIM.NS": "GRASIM INDUSTRIES LIMITED",
-        "GRASIM-IL.NS": "GRASIM INDUSTRIES INR2",
-        "GRASIM.BO": "Grasim Industries Limited",
-        "GRATEXI.BO": "Gratex Industries Limited",
-        "GREENLAM-BE.NS": "Greenlam Industries Ltd.",
-        "GREENPLY.BO": "Greenply Industries Limited",
-        "GRNLAMIND.BO": "Greenlam Industries Ltd",
-        "GRWESIN.BO": "GREAT WESTERN INDUSTRIES LTD.",
-        "GTNIND.NS": "GTN Industries Limited",
-        "GTNINDS.BO": "GTN Industries Limited",
-        "GUJAPOLLO-.BO": "GUJARAT APOLLO INDUSTRIES LTD.",
-        "GUJAPOLLO.BO": "GUJARAT APOLLO INDUSTRIES LTD.",
-        "GUJCARB.BO": "Gujarat Carbon & Industries Ltd.",
-        "GUJCRAFT.BO": "Gujarat Craft Industries Ltd.",
-        "GUJRAFIA.BO": "Gujarat Raffia Industries Ltd.",
-        "HARDCAS.BO": "Hardcastle & Waud Manufacturing Company Ltd",
-        "HEMINDI.BO": "HEMAKUTA INDUSTRIAL INVESTMENT",
-        "HIGHL.BO": "HIGHLAND INDUSTRIES LTD.",
-        "HINDALCO.BO": "Hindalco Industries Ltd.",
-        "HINDIND.BO": "Hind Industries Ltd",
-        "HITKARIIN.BO": "HITKARI INDUSTRIES LTD.",
-        "ICIL.BO": "INDO COUNT INDUSTRIES LTD.",
-        "IFBIND.BO": "IFB Industries Ltd.",
-        "IGLFXPL-B.BO": "INDO GULF INDUSTRIES LTD.",
-        "IITL.NS": "INDUSTRIAL INVESTMENT TRUST LIM",
-        "IITL.BO": "Industrial Investment Trust Limited",
-        "INANI.BO": "Inani Marbles & Industries Limited",
-        "INCORPI.BO": "INTERCORP INDUSTRIES LTD.",
-        "INDPRUD.BO": "Industrial & Prudential Investment Company Ltd.",
-        "INDRAIND.BO": "Indra Industries Ltd.",
-        "INFRAIND.BO": "Infra Industries Ltd.",
-        "INNOIND.BO": "INNOVENTIVE INDUSTRIES LTD.",
-        "INNOIND.NS": "Innoventive Industries Limited",
-        "ISPLIND.BO": "ISPL INDUSTRIES LTD.",
-        "ITL.BO": "ITL Industries Limited",
-        "JAGAJITIND.BO": "JAGATJIT INDUSTRIES LTD.",
-        "JAIBALAJI.NS": "JAI BALAJI INDUSTRIES LIMITED",
-        "JAIBALAJI.BO": "Jai Balaji Industries Ltd.",
-        "JAIDIND.BO": "JAIDKA INDUSTRIES LTD.",
-        "JAIMI.BO": "JAI MATA INDUSTRIES LTD.",
-        "JAINMARMO.BO": "Jain Marmo Industries Ltd.",
-        "JAIPAN.BO": "Jaipan Industries Ltd",
-        "JASCH.BO": "Jasch Industries Ltd.",
-        "JAYNECOIND.BO": "JAYASWAL NECO INDUSTRIES LTD.",
-        "JBFIND.BO": "JBF Industries Limited",
-        "JEMINDU.BO": "JEM INDUSTRIES LTD.",
-        "JIKIND-BE.NS": "JIK INDUSTRIES INR10",
-        "JIKIND.BO": "JIK INDUSTRIES LTD.",
-        "JINDRILL.BO": "Jindal Drilling & Industries Limited",
-        "JOLYPLS.BO": "Jolly Plastic Industries Ltd.",
-        "JPTRLES.BO": "JUPITER INDUSTRIES & LEASING L",
-        "JRIIIL.BO": "JRI INDUSTRIES & INFRASTRUCTUR",
-        "JSLINDL.BO": "JSL INDUSTRIES LTD.",
-        "JUBLINDS.BO": "JUBILANT INDUSTRIES LTD.",
-        "KABSON.BO": "Kabsons Industries Limited",
-        "KALPVIND.BO": "KALPAVRIKSHA INDUSTRIES LTD.",
-        "KANANIIND.NS": "KANANI INDUSTRIES LIMITED",
-        "KANANIIND.BO": "Kanani Industries Ltd",
-        "KANELIND.BO": "KANEL INDUSTRIES LIMITED",
-        "KARANWO.BO": "Manor Estates and Industries Limited",
-        "KARMA.BO": "KARMA INDUSTRIES LTD.",
-        "KAVITIND.BO": "KAVIT INDUSTRIES LIMITED",
-        "KAYCEEI.BO": "Kaycee Industries Ltd.",
-        "KEERTHI.BO": "Keerthi Industries Limited",
-        "KEI.BO": "KEI INDUSTRIES LTD.",
-        "KEMROCK.NS": "KEMROCK INDUSTRIES INR10",
-        "KESORAMIND-BE.NS": "KESORAM INDUSTRIES INR10",
-        "KESORAMIND-BZ.NS": "KESORAM INDUSTRIES LTD",
-        "KESORAMIND.NS": "KESORAM INDUSTRIES LIMITED",
-        "KESORAMIND.BO": "Kesoram Industries Ltd.",
-        "KESWASY.BO": "KESWANI SYNTHETICS INDUSTRIES",
-        "KEWIND.BO": "Kew Industries Ltd.",
-        "KGNIND.BO": "KGN Industries Ltd.",
-        "KHODIYAR.BO": "KHODIYAR INDUSTRIES LTD.",
-        "KIRIINDUS.BO": "KIRI INDUSTRIES LTD.",
-        "KIRLFER.BO": "Kirloskar Ferrous Industries Limited",
-        "KIRLOSIND.NS": "KIRLOSKAR INDUSTRIES LIMITED",
-        "KIRLOSIND.BO": "KIRLOSKAR INDUSTRIES LTD",
-        "KITPLYIND-BZ.NS": "KITPLY INDUSTRIES LTD",
-        "KKALPANAIND.BO": "KKALPANA INDUSTRIES (INDIA) LT",
-        "KLIFESTYL.BO": "K-LIFESTYLE & INDUSTRIES LIMIT",
-        "KOTIC.BO": "KOTHARI INDUSTRIAL CORPORATION",
-        "KRIPIND.BO": "KRIPTOL INDUSTRIES LTD.",
-        "KRITIIND.BO": "Kriti Industries (India) Ltd.",
-        "KRYPTONQ.BO": "Krypton Industries Ltd.",
-        "KSLIND.BO": "KSL and Industries Ltd",
-        "KUMARWI.BO": "Kumar Wire Cloth Manufacturing Co. Ltd.",
-        "KUNSTOFF.BO": "Kunststoffe Industries",
-        "KUTCSAL.BO": "KUTCH SALT & ALLIED INDUSTRIES",
-        "KUWERIN.BO": "Kuwer Industries Limited",
-        "LANESEDA.BO": "LAN ESEDA INDUSTRIES LTD.",
-        "LESHAIND.BO": "LESHA INDUSTRIES LTD.",
-        "LINEARPO.BO": "Linear Industries Limited",
-        "LINKH.BO": "LINKHOUSE INDUSTRIES LTD.",
-        "LNIND.BO": "LN INDUSTRIES INDIA LTD.",
-        "LSIND.BO": "LS INDUSTRIES LTD.",
-        "LUMAXIND.NS": "LUMAX INDUSTRIES LIMITED",
-        "LUMAXIND.BO": "Lumax Industries Limited",
-        "LUXIND.NS": "LUX INDUSTRIES LTD INR2",
-        "LUXIND.BO": "LUX Industries Limited",
-        "MADHUDIN.BO": "Madhusudan Industries Ltd.",
-        "MADHURIND.BO": "Madhur Industries Ltd",
-        "MAFATIND.BO": "Mafatlal Industries Limited",
-        "MAGIN.BO": "MAGAN INDUSTRIES LTD.",
-        "MAGNSRB.BO": "MAGNUS RUBBER INDUSTRIES LTD.",
-        "MAHANIN.BO": "Mahan Industries Ltd.",
-        "MAHAVIRIND.BO": "MAHAVIR INDUSTRIES LIMITED",
-        "MAISF.BO": "Archon Industries Limited",
-        "MAJESIN.BO": "MAJESTIC INDUSTRIES LTD.",
-        "MANAKINDLTD.BO": "Manaksia Industries Limited",
-        "MANAKINDST-BE.NS": "Manaksia Industries Ltd",
-        "MANDHANA.BO": "Mandhana Industries Limited",
-        "MANINDS.NS": "MAN INDUSTRIES (INDIA) LIMITED",
-        "MANINDS.BO": "MAN INDUSTRIES (INDIA) LTD.",
-        "MANPAIN.BO": "MANSAROVER PAPER & INDUSTRIES",
-        "MAPROIN.BO": "Mapro Industries Ltd.",
-        "MARIN.BO": "MARVEL INDUSTRIES LTD.",
-        "MARTELI.BO": "MARUTI TELSTAR INDUSTRIES LTD.",
-        "MAVIIND.BO": "Mavi Industries Ltd",
-        "MAXWELL.NS": "MAXWELL INDUSTRIES INR2",
-        "MHMLIND.BO": "MH MILLS & INDUSTRIES LTD.",
-        "MIDFIELD.BO": "MIDFIELD INDUSTRIES LTD.",
-        "MIDINDIA.BO": "MID INDIA INDUSTRIES LTD.",
-        "MIHIKA.BO": "Mihika Industries Ltd.",
-        "MINALIND.BO": "MINAL INDUSTRIES LIMITED",
-        "MINDAIND.NS": "MINDA INDUSTRIES LIMITED",
-        "MINDAIND.BO": "MINDA INDUSTRIES LTD.",
-        "MINDAIND.NS": "Minda Industries Limited",
-        "MNIL.BO": "Mega Nirman & Industries Limit",
-        "MODECEM.BO": "MODERN CEMENT INDUSTRIES LTD.",
-        "MOHITE.BO": "MOHITE INDUSTRIES LIMITED",
-        "MOHITIND.NS": "MOHIT INDUSTRIES INR10",
-        "MOHITIND.BO": "Mohit Industries Limited",
-        "MONNETIN.BO": "Monnet Industries Ltd",
-        "MONTA.BO": "MONTARI INDUSTRIES LTD.",
-        "MOONB.BO": "MOONBEAM INDUSTRIES LTD.",
-        "MORINOV.BO": "MORINDA OVERSEAS INDUSTRIES LT",
-        "MORYOIND.BO": "MORYO INDUSTRIES LTD.",
-        "MOTMIND.BO": "MOTHER MIRA INDUSTRIES LTD.",
-        "MOUNTSHIQ.BO": "Mount Shivalik Industries Ltd",
-        "MRGNIND.BO": "MORGAN INDUSTRIES LTD.",
-        "MSLIND.BO": "MSL INDUSTRIES LTD.",
-        "MTZIND.BO": "MTZ INDUSTRIES LTD.",
-        "MURLIIND.NS": "MURLI INDUSTRIES INR2",
-        "MURLIIND.BO": "MURLI INDUSTRIES LTD.",
-        "MURLIIND.NS": "Murli Industries Ltd.",
-        "NAHARINDUS.BO": "NAHAR INDUSTRIAL ENTERPRISES L",
-        "NARANGIN.BO": "NARANG INDUSTRIES LTD.",
-        "NATFLASK.BO": "NATIONAL FLASK INDUSTRIES LTD.",
-        "NATGENI.BO": "National General Industries Limited",
-        "NATPLAS.BO": "National Plastic Industries Ltd.",
-        "NATPLY.BO": "NATIONAL PLYWOOD INDUSTRIES LT",
-        "NCLIND.NS": "NCL INDUSTRIES LIMITED",
-        "NCLIND.BO": "NCL Industries Limited",
-        "NEIL.BO": "Neil Industries Ltd.",
-        "NGIND.BO": "N.G. Industries Limited",
-        "NIBL-BE.NS": "NRB INDUSTRIAL BEA INR2",
-        "NIBL.NS": "NRB INDUSTRIAL BEA INR2",
-        "NIBL.BO": "NRB INDUSTRIAL BEARINGS LTD.",
-        "NIMBUSI.BO": "NIMBUS INDUSTRIES LTD.",
-        "NITINFIRE.BO": "Nitin Fire Protection Industries Limited",
-        "NITININ.BO": "NITIN INDUSTRIES LTD.",
-        "NKIND.BO": "NK Industries Ltd.",
-        "NOESISIND.NS": "NOESIS INDUSTRIES INR10",
-        "NOESISIND.BO": "NOESIS INDUSTRIES LIMITED",
-        "NRAGRINDQ.BO": "NR Agarwal Industries Ltd",
-        "NTCIND.BO": "NTC INDUSTRIES LTD.",
-        "NVCMIND.BO": "NAVCOM INDUSTRIES LTD.",
-        "OBIL.BO": "OCEANAA BIOTEK INDUSTRIES LTD",
-        "OLYMPTX.BO": "Olympia Industries Ltd.",
-        "OMNITEX.BO": "Omnitex Industries (India) Limited",
-        "ORIENTPPR.NS": "ORIENT PAPER & INDUSTRIES LIMIT",
-        "ORIENTPPR.BO": "ORIENT PAPER & INDUSTRIES LTD.",
-        "ORINTIN.BO": "ORIENTAL INDUSTRIAL INVESTMENT",
-        "OSIAIND.BO": "OSIAN INDUSTRIES LTD.",
-        "OXFORDIN.BO": "Oxford Industries Ltd",
-        "PACIFICI.BO": "Pacific Industries Limited",
-        "PACT.BO": "Pact Industries Ltd.",
-        "PADMAIND.BO": "Padmanabh Industries Ltd",
-        "PAGEIND.BO": "Page Industries Limited",
-        "PANAFIC.BO": "PANAFIC INDUSTRIALS LTD",
-        "PANCM.BO": "Panyam Cements & Mineral Industries Ltd.",
-        "PANIDPR.BO": "Panther Industrial Products Ltd",
-        "PARTIND.BO": "Parth Industries Limited",
-        "PDUMJEIND.BO": "PUDUMJEE INDUSTRIES LTD.",
-        "PENIND.BO": "PENNAR INDUSTRIES LTD.",
-        "PGIL.BO": "PEARL GLOBAL INDUSTRIES LIMITE",
-        "PIDILITIND.BO": "Pidilite Industries Limited",
-        "PIIND.BO": "P.I.INDUSTRIES LTD.",
-        "POCHIRAJU.BO": "Pochiraju Industries Ltd.",
-        "POLARIND.BO": "POLAR INDUSTRIES LTD.",
-        "PRABHAVIN.BO": "Prabhav Industries Ltd.",
-        "PRAJIND.BO": "Praj Industries Ltd.",
-        "PRAKASH.NS": "PRAKASH INDUSTRIES LIMITED",
-        "PRAKASH.BO": "PRAKASH INDUSTRIES LTD.",
-        "PRATIBHA.NS": "PRATIBHA INDUSTRIES LIMITED",
-        "PRATIBHA.BO": "Pratibha Industries Ltd.",
-        "PREMRIN.BO": "PREMIER INDUSTRIES (INDIA) LTD",
-        "PRETLEA.BO": "PRETTO LEATHER INDUSTRIES LTD.",
-        "PRIMAIN.BO": "PRIMA INDUSTRIES LTD.",
-        "PRIMIND.BO": "Prime Industries Ltd.",
-        "PROTCHEM.BO": "PROTCHEM INDUSTRIES (INDIA) LT",
-        "PRSRIND.BO": "PARASRAMPURIA INDUSTRIES LTD.",
-        "PTCIL.BO": "PTC Industries Ltd.",
-        "PUSHPIN.BO": "PUSHPSONS INDUSTRIES LTD.",
-        "RADIXIND.BO": "RADIX INDUSTRIES (INDIA) LIMIT",
-        "RAGHAVIN.BO": "RAGHAV INDUSTRIES LTD.",
-        "RAIN.NS": "RAIN INDUSTRIES LT INR2",
-        "RAIN.BO": "Rain Industries Limited",
-        "RAJLXIN.BO": "RAJLAXMI INDUSTRIES LTD.",
-        "RAJPACK.BO": "Raj Packaging Industries Ltd.",
-        "RAJRAYON.BO": "RAJ RAYON INDUSTRIES LIMITED",
-        "RAJTUBE.BO": "Rajasthan Tube Manufacturing Company Ltd",
-        "RAJVIR.BO": "Rajvir Industries Ltd",
-        "RAMCOIND.BO": "Ramco Industries Limited",
-        "RAMSARUP.BO": "Ramsarup Industries Ltd.",
-        "RATANGLI.BO": "RATAN GLITTER INDUSTRIES LTD.",
-        "REFEX.NS": "REFEX INDUSTRIES L INR10",
-        "REFEX.BO": "Refex Industries Limited",
-        "RELCHEMQ.BO": "Reliance Chemotex Industries Limited",
-        "RELIANCE.BO": "RELIANCE INDUSTRIES LTD.",
-        "RELICAB.BO": "Relicab Cable Manufacturing Li",
-        "REMSONSIN.NS": "Remsons Industries Limited",
-        "REMSONSIND.BO": "REMSONS INDUSTRIES LTD.",
-        "RESPONIND.BO": "Responsive Industries Limited",
-        "RICHAIND.BO": "Richa Industries Ltd",
-        "RIIL.NS": "RELIANCE INDUSTRIAL INFRASTRUCT",
-        "RNBIND.BO": "RNB INDUSTRIES LTD.",
-        "ROOFITIND.BO": "ROOFIT INDUSTRIES LTD.",
-        "ROOPAIND.BO": "Roopa Industries Ltd.",
-        "RPIL.BO": "Ritesh Properties and Industries Ltd.",
-        "RUCHISOYA.BO": "Ruchi Soya Industries Limited",
-        "SAB.BO": "SAB INDUSTRIES LIMITED",
-        "SAFARIND.BO": "Safari Industries India Ltd.",
-        "SAFFRON.BO": "SAFFRON INDUSTRIES LIMITED",
-        "SAGRSLK.BO": "SAGAR SILK INDUSTRIES LTD.",
-        "SAHYADRI.BO": "Sahyadri Industries Ltd",
-        "SAINDUS.BO": "SAI INDUSTRIES LTD.",
-        "SALGUTI.BO": "Salguti Industries Limited",
-        "SAMINDUS.NS": "SAM Industries Limited",
-        "SAMINDUS.BO": "SAM INDUSTRIES LTD.",
-        "SAMINDUS.NS": "Sam Industries Ltd",
-        "SANGHIIND.BO": "SANGHI INDUSTRIES LTD.",
-        "SARDAPLY.BO": "Sarda Plywood Industries",
-        "SARTHAKIND.NS": "Sarthak Industries Ltd",
-        "SARTHAKIND.BO": "SARTHAK INDUSTRIES LTD.",
-        "SARUPINDUS.BO": "SARUP INDUSTRIES LTD.",
-        "SATIA.BO": "SATIA INDUSTRIES LIMITED",
-        "SATINDLTD.BO": "Sat Industries Limited",
-        "SAVERA.BO": "SAVERA INDUSTRIES LTD.",
-        "SAVERA.NS": "Savera Industries Limited",
-        "SCOPEIND.BO": "SCOPE INDUSTRIES (INDIA) LIMIT",
-        "SELMCL.NS": "SEL MANUFACTURING COMPANY LIMIT",
-        "SELMCL.BO": "SEL Manufacturing Company Limited",
-        "SENBO.BO": "Senbo Industries Limited",
-        "SERIND.BO": "Ser Industries Ltd",
-        "SEVENHILL.BO": "SEVEN HILL INDUSTRIES LIMITED",
-        "SEYAIND.BO": "SEYA INDUSTRIES LTD.",
-        "SHALIWIR.BO": "Shalimar Wires Industries Ltd",
-        "SHAMROIN.BO": "SHAMROCK INDUSTRIAL CO.LTD.",
-        "SHARPIND.BO": "Sharp Industries Ltd.",
-        "SHBENZO.BO": "SHREE BENZOPHEN INDUSTRIES LTD",
-        "SHERVANI.BO": "Shervani Industrial Syndicate Ltd",
-        "SHESHAINDS.BO": "SHESHADRI INDUSTRIES LIMITED",
-        "SHINDL.BO": "SHARAT INDUSTRIES LTD.",
-        "SHREEIN.BO": "SHREE INDUSTRIES LTD.",
-        "SHREGRN.BO": "SHREEJI INDUSTRIES LTD.",
-        "SHREYANIND.NS": "SHREYANS INDUSTRIES LIMITED",
-        "SHREYANIND.BO": "SHREYANS INDUSTRIES LTD.",
-        "SHRICON.BO": "Shricon Industries Ltd.",
-        "SHRIGANG.BO": "SHRI GANG INDUSTRIES AND ALLIE",
-        "SHRMFGC.BO": "Shree Manufacturing Company Limited",
-        "SHRUBER.BO": "SHREE RUBBER INDUSTRIES LTD.",
-        "SHVFERT.BO": "SFL INDUSTRIES LTD.",
-        "SIEL.BO": "SUPERIOR INDUSTRIAL ENTERPRISE",
-        "SIGNET.NS": "SIGNET INDUSTRIES INR1",
-        "SIGNET.NS": "SIGNET INDUSTRIES INR1",
-        "SIGNETIND.BO": "SIGNET INDUSTRIES LIMITED",
-        "SIICL.BO": "Shreenath Industrial Investmen",
-        "SIL.BO": "STANDARD INDUSTRIES LTD.",
-        "SIMCOIN.BO": "SIMCO INDUSTRIES LTD.",
-        "SINTEX.BO": "Sintex Industries Limited",
-        "SIPIND.BO": "SIP Industries Ltd.",
-        "SKPMIL.BO": "Shree Krishna Paper Mills & Industries Ltd.",
-        "SKYIND.BO": "Sky Industries Limited",
-        "SMILAX.BO": "SMILAX INDUSTRIES LIMITED",
-        "SOMAPPR.BO": "Soma Papers and Industries Limited",
-        "SOMPLAST.BO": "SOMPLAST LEATHER INDUSTRIES LT",
-        "SOURCEIND.BO": "SOURCE INDUSTRIES (INDIA) LTD.",
-        "SPECTRA.BO": "Spectra Industries Ltd.",
-        "SPENTEX.BO": "Spentex Industries Limited",
-        "SPLIL.NS": "SPL INDUSTRIES LTD INR10",
-        "SPLIL.BO": "Spl Industries Ltd",
-        "SRIKAND.BO": "SRI SKANDAN INDUSTRIES LTD.",
-        "SRIKPRIND.BO": "SRI KPR INDUSTRIES LTD.",
-        "SRIND.BO": "S R Industries Limited",
-        "SRIVASAV.BO": "SRI VASAVI INDUSTRIES LTD.",
-        "SRK.BO": "S R K INDUSTRIES LTD.",
-        "SRNEDYE.BO": "SERENE INDUSTRIES LTD.",
-        "SSIND-B1.BO": "S&S INDUSTRIES & ENTERPRISES L",
-        "STOVACQ.BO": "Stovec Industries, Ltd.",
-        "STURDY.BO": "Sturdy Industries Ltd",
-        "STYLAMIND.BO": "STYLAM INDUSTRIES LIMITED",
-        "SUDAI.BO": "Sudal Industries Limited",
-        "SUDAR-BE.NS": "SUDAR INDUSTRIES L INR10",
-        "SUDAR.BO": "SUDAR INDUSTRIES LTD.",
-        "SUDIN.BO": "Sudev Industries Ltd.",
-        "SUDTIND-B.BO": "Suditi Industries Ltd.",
-        "SUJANAUNI.BO": "SUJANA UNIVERSAL INDUSTRIES LT",
-        "SUMEETINDS.NS": "SUMEET INDUSTRIES INR10",
-        "SUMEETINDS.BO": "SUMEET INDUSTRIES LTD.",
-        "SUMERUIND.BO": "Sumeru Industries Ltd.",
-        "SUNCITY.BO": "SUNCITY INDUSTRIES LTD.",
-        "SUNILTX.BO": "Sunil Industries Limited",
-        "SUNRINV.BO": "SUNRISE INDUSTRIAL TRADERS LTD",
-        "SUPERTEX.BO": "Supertex Industries Ltd.",
-        "SUPREMEIND.NS": "SUPREME INDUSTRIES INR2",
-        "SUPREMEIND.BO": "The Supreme Industries Limited",
-        "SURANAIND-BE.NS": "SURANA INDUSTRIES INR10",
-        "SURANAIND.BO": "SURANA INDUSTRIES LTD.",
-        "SURBHIN.BO": "SURBHI INDUSTRIES LTD.",
-        "SURINDL.BO": "SURYA INDUSTRIAL CORPORATION L",
-        "SURJIND.BO": "SURAJ INDUSTRIES LTD.",
-        "SWADEIN.BO": "Swadeshi Industries & Leasing Ltd.",
-        "SYBLY.BO": "Sybly Industries Ltd.",
-        "TAIIND.BO": "Tai Industries Limited",
-        "TANFACIND.BO": "TANFAC INDUSTRIES LTD.",
-        "TCIIND.BO": "TCI Industries Ltd.",
-        "TEXELIN.BO": "TEXEL INDUSTRIES LTD.",
-        "TEXPI.BO": "Texplast Industries Ltd.",
-        "TI.BO": "TILAKNAGAR INDUSTRIES LTD.",
-        "TIPSINDLTD.NS": "TIPS INDUSTRIES LIMITED",
-        "TIPSINDLTD.BO": "TIPS INDUSTRIES LTD.",
-        "TIRIN.BO": "Tirupati Industries (India) Limited",
-        "TRIJAL.BO": "Trijal Industries Limited",
-        "TRISHAKT.BO": "Trishakti Electronics & Industries Ltd.",
-        "TRPATFB.BO": "TIRUPATI FIBRES & INDUSTRIES L",
-        "TSL.BO": "TSL Industries Limited",
-        "TWINSTAR.BO": "Twinstar Industries Ltd.",
-        "TYCHE.BO": "Tyche Industries Ltd",
-        "UBEINDL.BO": "UBE INDUSTRIES LTD.",
-        "UFMINDL.BO": "UFM INDUSTRIES LTD.",
-        "UNIPLY.NS": "UNIPLY INDUSTRIES INR10",
-        "UNIPLY.BO": "Uniply Industries Ltd.",
-        "UNIROYAL.BO": "Uniroyal Industries Limited",
-        "UNOINDL.BO": "UNNO INDUSTRIES LTD.",
-        "UNTTEMI.BO": "United Leasing & Industries Ltd",
-        "UTLINDS.BO": "UTL INDUSTRIES LIMITED",
-        "VADILALIND.BO": "VADILAL INDUSTRIES LTD.",
-        "VALSONQ.BO": "Valson Industries Ltd.",
-        "VALUEIND.NS": "VALUE INDUSTRIES LIMITED",
-        "VALUEIND.BO": "VALUE INDUSTRIES LTD.",
-        "VAMA.BO": "Vama Industries Ltd.",
-        "VARDHINDQ.BO": "Vardhman Industries Limited",
-        "VARUN.BO": "Varun Industries Limited",
-        "VASWANI-BE.NS": "VASWANI INDUSTRIES LTD INR10",
-        "VASWANI.BO": "VASWANI INDUSTRIES LTD.",
-        "VBCIND.BO": "VBC Industries Ltd.",
-        "VBIND.BO": "V B INDUSTRIES LIMITED",
-        "VERTICLIND.BO": "VERTICAL INDUSTRIES LTD",
-        "VGUARD.BO": "V-Guard Industries Limited",
-        "VHCLINDUS.BO": "VHCL INDUSTRIES LTD.",
-        "VIAANINDUS.BO": "Viaan Industries Limited",
-        "VIDEOIND.NS": "VIDEOCON INDUSTRIES LIMITED",
-        "VIDEOIND.BO": "VIDEOCON INDUSTRIES LTD.",
-        "VIPIND.BO": "VIP Industries Limited",
-        "VIRAT.BO": "Virat Industries Ltd",
-        "VIRATCRA.BO": "Virat Crane Industries Ltd.",
-        "VIRTIND.BO": "VIRTUAL INDUSTRIES LTD.",
-        "VISAKAIND.BO": "VISAKA INDUSTRIES LTD.",
-        "VIVIDIND.BO": "Vivid Global Industries Limited",
-        "VMS.BO": "VMS INDUSTRIES LTD.",
-        "VSTIND.BO": "VST INDUSTRIES LTD.",
-        "VTXIND.BO": "VTX INDUSTRIES LIMITED",
-        "VYAPAR.BO": "Vyapar Industries Ltd.",
-        "WALCHANNAG.NS": "WALCHANDNAGAR INDUSTRIES LIMITE",
-        "WALCHANNAG.BO": "WALCHANDNAGAR INDUSTRIES LTD.",
-        "WERTERNIN.BO": "WESTERN INDUSTRIES LTD.",
-        "WSI.NS": "WS Industries (India)",
-        "WSIND.BO": "WS Industries (India)",
-        "YKMIND.BO": "YKM INDUSTRIES LTD."
-    },
-
-    "Information Technology Services": {
-        "3IINFOTECH.NS": "3i Infotech Limited",
-        "7SEAS.BO": "7SEAS TECHNOLOGIES LTD",
-        "7TEC.BO": "Saven Technologies Limited",
-        "ABLBIO.BO": "ABL Bio-Technologies Ltd.",
-        "ACCELYA.NS": "Accelya Kale Solutions Limited",
-        "ACCENTECH.BO": "Accentia Technologies, Ltd.",
-        "ACROPETAL-BE.NS": "ACROPETAL TECHNOLO INR10",
-        "ACROPETAL.NS": "ACROPETAL TECHNOLOGIES LIMITED",
-        "ACROPETAL.BO": "ACROPETAL TECHNOLOGIES LTD.",
-        "ACROPETAL.NS": "Acropetal Technologies Limited",
-        "ADORFO.BO": "Ador Fontech Ltd.",
-        "ADSL.NS": "ALLIED DIGITAL SER INR5",
-        "ADSL.BO": "Allied Digital Services Ltd.",
-        "ADSL.NS": "Allied Digital Services Ltd",
-        "ADVMULT.BO": "ADVANCE MULTITECH LTD.",
-        "ADVPOWER.BO": "ADVANCE POWERINFRA TECH LIMITE",
-        "AFL.NS": "Accel Frontline Limited",
-        "AGRITECH-BE.NS": "Agri-Tech (India) Limited",
-        "AGRITECH.NS": "AGRI-TECH (INDIA) INR10",
-        "AGRITECH.BO": "AGRI- TECH (INDIA) LTD",
-        "ALLSEC.NS": "ALLSEC TECHNOLOGIE INR10",
-        "ALLSEC.BO": "Allsec Technologies Limited",
-        "ALPHA.BO": "Alpha Hi-Tech Fuel Ltd.",
-        "AMTEKINDI.NS": "Castex Technologies Limited",
-        "AMTL.BO": "ADVANCE METERING TECHNOLOGY LT",
-        "APEXINT.BO": "APEX INTERTECH LTD.",
-        "APTECHBBPH.BO": "APTECHLTD*",
-        "APTECHT.BO": "APTECH LTD.",
-        "APTECHT6.BO": "APTECHT6.BO",
-        "ARCOTECH.NS": "ARCOTECH LTD INR10",
-        "ARCOTECH.BO": "Arcotech Ltd",
-        "ARCPR.BO": "Arrow Greentech Limited",
-        "ARROWCOAT.NS": "ARROW GREENTECH LI INR10",
-        "ARROWCOAT.NS": "ARROW GREENTECH LI INR10",
-        "ASMTEC.BO": "ASM Technologies Ltd.",
-        "ASTRAL.BO": "Astral Poly Technik Limited",
-        "ATCOM.BO": "ATCOM TECHNOLOGIES LTD.",
-        "ATFL.NS": "AGRO TECH FOODS LIMITED",
-        "ATFL.BO": "AGRO TECH FOODS LTD.",
-        "ATHENAGLO.BO": "Athena Global Technologies Lim",
-        "AURUMSOFT.BO": "AURUM SOFT SYSTEMS LIMITED",
-        "AVANCE.BO": "Avance Technologies Limited",
-        "AVINF.BO": "AVINASH INFORMATION TECHNOLOGI",
-        "BALATECGL.BO": "Bala Techno Global Ltd.",
-        "BALATECIN.BO": "Bala Techno Industries Limited .",
-        "BALTE.BO": "Balurghat Technologies Ltd.",
-        "BASANTGL.BO": "Basant Agro Tech (India) Limited",
-        "BATHINAT.BO": "BATHINA TECHNOLOGIES (INDIA) L",
-        "BGIL.BO": "Bgil Films & Technologies Limited",
-        "BGRENERGY.NS": "BGR ENERGY SYSTEMS LIMITED",
-        "BGRENERGY.BO": "BGR Energy Systems Limited",
-        "BILENERGY.NS": "BIL ENERGY SYSTEMS INR1",
-        "BILENERGY.BO": "BIL ENERGY SYSTEMS LTD.",
-        "BINDALAGRO.NS": "OSWAL GREENTECH LI INR10",
-        "BINDALAGRO.BO": "Oswal Greentech Limited",
-        "BIRLAPREC.BO": "Birla Precision Technologies Ltd",
-        "BIRMT.BO": "BIRMINGHAM THERMOTECH LTD.",
-        "BIRSHLEDU.BO": "Birla Shloka Edutech Ltd",
-        "BITL.BO": "BRONZE INFRA-TECH LTD.",
-        "BLUECLOUDS.BO": "Blue Cloud Softech Solutions L",
-        "BOSTONBIO.BO": "BOSTON BIO SYSTEMS LTD.",
-        "BTTL.BO": "Bhilwara Technical Textiles Ltd",
-        "CAMSONBIO.BO": "Camson Bio Technologies Limited",
-        "CAPRICORN.BO": "CAPRICORN SYSTEMS GLOBAL SOLUT",
-        "CASTEXTECH-BE.NS": "CASTEX TECHNOLOGIES LTD.",
-        "CASTEXTECH.NS": "CASTEX TECHNOLOGIE INR2",
-        "CASTEXTECH.BO": "CASTEX TECHNOLOGIES LIMITED",
-        "CASTRON.BO": "CASTRON TECHNOLOGIES LTD.",
-        "CATECH.BO": "Cat Technologies Ltd.",
-        "CENTERAC.BO": "CENTERAC TECHNOLOGIES LTD.",
-        "CEREBRAINT.BO": "CEREBRA INTEGRATED TECHNOLOGIE",
-        "CHEMCEL.BO": "CHEMCEL BIO-TECH LTD.",
-        "CHEMTECH.BO": "CHEMTECH INDUSTRIAL VALVES LTD",
-        "CIGNITI.BO": "CIGNITI TECHNOLOGIES LTD.",
-        "CIGNITITEC.NS": "CIGNITI TECHNOLOGI INR10",
-        "CIGNITITEC.NS": "CIGNITI TECHNOLOGI INR10",
-        "COMFINTE.BO": "Comfort Intech Ltd",
-        "COMMEXTECH.BO": "COMMEX TECHNOLOGY LIMITED",
-        "COMPUDYNE.BO": "COMPUDYNE WINFOSYSTEMS LTD.",
-        "COMPUTECH.BO": "COMPUTECH INTERNATIONAL LTD.",
-        "COREEDUTEC-BZ.NS": "CORE EDUCATION & TECH LTD",
-        "COREEDUTEC.NS": "CORE EDUCATION & TECHNOLOGIES L",
-        "COREEDUTEC.BO": "CORE EDUCATION & TECHNOLOGIES",
-        "COREEDUTEC.NS": "CORE Education and Technologies Limited",
-        "CSIL.BO": "Circuit Systems India Ltd",
-        "CSJTEC.BO": "CSJ TECHNOLOGIES LTD.",
-        "CTE-BE.NS": "CAMBRIDGE TECH ENT INR10",
-        "CTE.NS": "CAMBRIDGE TECHNOLOGY ENTERPRISE",
-        "CTE.BO": "Cambridge Technology Enterprises Limited",
-        "CTE.NS": "Cambridge Technology Enterprises Limited",
-        "CURATECH.NS": "CURA TECHNOLOGIES INR10",
-        "CURATECH.BO": "CURA TECHNOLOGIES LTD.",
-        "CYBERTECH.NS": "CyberTech Systems and Software Limited",
-        "CYIENT.NS": "Cyient Limited",
-        "DANLAW.BO": "Danlaw Technologies India Limited",
-        "DATAPRO.BO": "DATAPRO INFORMATION TECHNOLOGY",
-        "DESIGNAU.BO": "DESIGN AUTO SYSTEMS LTD.",
-        "DHANUKA.BO": "Dhanuka Agritech Ltd",
-        "DHANUS.BO": "Dhanus Technologies Limited",
-        "DIAMOND.BO": "DIAMOND INFOSYSTEMS LTD.",
-        "DIGIMULT.BO": "DIGITAL MULTIFORMS LTD.",
-        "DSSL.BO": "DYNACONS SYSTEMS & SOLUTIONS L",
-        "DSSL.NS": "Dynacons Systems & Solutions Limited",
-        "DYNAMATECH.NS": "DYNAMATIC TECHNOLO INR10",
-        "DYNAMATECH.BO": "DYNAMATIC TECHNOLOGIES LTD.",
-        "DYNATECH-BE.NS": "DYNACONS TECHNOLOG INR1",
-        "DYNATECH.NS": "DUCON INFRATECHNOL INR1",
-        "DYNATECH.BO": "DUCON INFRATECHNOLOGIES LTD",
-        "DYNATECH.NS": "Ducon Infratechnolgies Limited",
-        "EASTBUILD.BO": "EAST BUILDTECH LTD.",
-        "EDSERV.BO": "EDSERV SOFTSYSTEMS LTD.",
-        "ELEFLOR.BO": "Elegant Floriculture & Agrotech (India) Limited",
-        "ELNET.BO": "Elnet Technologies Ltd.",
-        "EMEDTECH.BO": "EMED.COM TECHNOLOGIES LTD",
-        "ENVCLEN.BO": "ENVIRO-CLEAN SYSTEMS LTD.",
-        "EONOUR.BO": "EONOUR TECHNOLOGIES LTD.",
-        "ERPSOFT.BO": "ERP Soft Systems Ltd",
-        "FCSSOFT.NS": "FCS Software Solutions Limited",
-        "FINANTECH.BO": "63 MOONS TECHNOLOGIES LTD",
-        "FINANTECH6.BO": "FINANTECH6.BO",
-        "FIRSTOBJ.BO": "Firstobject Technologies Ltd",
-        "FLORENCE.BO": "FLORENCE INVESTECH LIMITED",
-        "GEINDSYS.BO": "GEI Industrial Systems Ltd.",
-        "GEMOIL.BO": "GEMMIA OILTECH (INDIA) LTD.",
-        "GENESYS.NS": "Genesys International Corporation Limited",
-        "GLOBT.BO": "GLOBAL INFRASTRUCTURE & TECHNO",
-        "GLODYNE-BZ.NS": "GLODYNE TECHNOSERVE LTD.",
-        "GLODYNE.BO": "Glodyne Technoserve Limited",
-        "GLODYNE.NS": "Glodyne Technoserve Limited",
-        "GOLDINFRA.NS": "GOLDSTONE INFRATECH LIMITED",
-        "GOLDINFRA.BO": "Goldstone Infratech Ltd.",
-        "GOLDTECH.NS": "GOLDSTONE TECHNOLOGIES LT",
-        "GOLDTECH.BO": "Goldstone Technologies Ltd.",
-        "GOLDTECH.NS": "Goldstone Technologies Limited",
-        "GSS.NS": "GSS Infotech Limited",
-        "GTCLM.BO": "GTCL MOBILE-COM TECHNOLOGY LTD",
-        "GTEIT.BO": "G-Tech Info-Training Ltd.",
-        "GTL.NS": "GTL Limited",
-        "GUJMEDI.BO": "GUJARAT MEDITECH LTD.",
-        "HARBORNE.BO": "HARBOR NETWORK SYSTEMS LTD.",
-        "HARITASEAT.NS": "HARITA SEATING SYSTEMS LIMITED",
-        "HARITASEAT.BO": "HARITA SEATING SYSTEMS LTD.",
-        "HBLPOWER.BO": "HBL POWER SYSTEMS LTD.",
-        "HCL-INSYS.NS": "HCL INFOSYSTEMS INR2",
-        "HCL-INSYS.BO": "HCL INFOSYSTEMS LTD.",
-        "HCLTECH.BO": "HCL Technologies Ltd.",
-        "HCLTECH.NS": "HCL Technologies Limited",
-        "HEALTHTECH.BO": "HEALTHFORE TECHNOLOGIES LTD.",
-        "HELIOSMATH-BE.NS": "HELIOS & MATHINFTECH LTD.",
-        "HELIOSMATH-BZ.NS": "HELIOS & MATHINFTECH LTD.",
-        "HELIOSMATH.NS": "helios and matheson information technology limited",
-        "HEXAWARE.NS": "HEXAWARE TECHNOLOGIES LIMITED",
-        "HEXAWARE.BO": "Hexaware Technologies Limited",
-        "HEXAWARE.NS": "Hexaware Technologies Limited",
-        "HITECH-SM.NS": "HI TECH PIPES LTD INR10",
-        "HITECHGEAR.BO": "The Hi-Tech Gears Ltd",
-        "HITECHIJEW.BO": "HITECHI JEWELLERY INDUSTRIES L",
-        "HITECHPLAS.BO": "HITECH CORPORATION LTD",
-        "HITECHPLAS.NS": "Hitech Corporation Limited",
-        "HOVS.NS": "HOV Services Limited",
-        "HYPERSOFT.BO": "HYPERSOFT TECHNOLOGIES LIMITED",
-        "IDISL.BO": "INTERGRATED DIGITAL INFO SERVI",
-        "IKFTECH.BO": "IKF Technologies Ltd.",
-        "IMPEXFERRO.BO": "IMPEX FERRO TECH LTD.",
-        "INDOTECH.NS": "INDO TECH TRANSFORMERS LIMITED",
-        "INDOTECH.BO": "Indo Tech Transformers Limited",
-        "INDOVATION.BO": "INDOVATION TECHNOLOGIES LTD.",
-        "INFINITE.NS": "Infinite Computer Solutions (India) Limited",
-        "INFOBEANS-IT.NS": "InfoBeans Tech Ltd",
-        "INFORTEC.BO": "Informed Technologies India Ltd",
-        "INFRONICS.BO": "INFRONICS SYSTEMS LTD",
-        "INFY.NS": "Infosys Limited",
-        "INNOVTEC.BO": "Innovative Tech Pack Ltd.",
-        "INTECH.BO": "Integrated Technologies Ltd",
-        "INTEGHIT.BO": "Integrated Hitech Ltd.",
-        "INTELLECT.NS": "Intellect Design Arena Limited",
-        "INTENTECH.BO": "Intense Technologies Ltd.",
-        "INTERDIGI.BO": "Interworld Digital Ltd.",
-        "ISFT.BO": "Intrasoft Technologies Ltd.",
-        "ITIL.BO": "INFORMATION TECHNOLOGIES (INDI",
-        "IYKOTHITE.BO": "Iykot Hitech Toolroom Limited",
-        "IZMO.NS": "IZMO Limited",
-        "JARITEX.BO": "Kintech Renewables Limited",
-        "JISLDVREQS.BO": "JAIN IRRIGATION SYSTEMS LTD.",
-        "JISLJALEQS.BO": "JAIN IRRIGATION SYSTEMS LTD.",
-        "JKAGRI.BO": "Florence Investech Limited",
-        "JPINFRATEC.BO": "Jaypee Infratech Limited",
-        "JSTL.BO": "Jeevan Scientific Technology L",
-        "KAASHYAP.BO": "KAASHYAP TECHNOLOGIES LTD.",
-        "KABRAEXTRU.BO": "KABRA EXTRUSIONTECHNIK LTD.",
-        "KELENRG.BO": "Keltech Energies Limited",
-        "KELLTONTEC.BO": "KELLTON TECH SOLUTIONS LTD.",
-        "KERNEX.BO": "Kernex Microsystems India Ltd",
-        "KINGFA.BO": "Kingfa Science & Technology (I",
-        "KNDENGT.BO": "KND ENGINEERING TECHNOLOGIES L",
-        "KOHINOORT.BO": "Kohinoor Techno Engineers Limited",
-        "KPIT.BO": "KPIT TECHNOLOGIES LIMITED",
-        "KPIT.NS": "KPIT Technologies Limited",
-        "KRISOEL.BO": "KRISONS ELECTRONIC SYSTEMS LTD",
-        "KUBERFL.BO": "KUBER FLORITECH LTD.",
-        "LAKSELEC.BO": "Lakshmi Electrical Control Systems Ltd",
-        "LIPPISYS.BO": "Lippi Systems Ltd.",
-        "LITL.BO": "Lanco Infratech Limited",
-        "LUMAXAUTO.BO": "LUMAX AUTOMOTIVE SYSTEMS LTD.",
-        "LUMAXTECH.NS": "LUMAX AUTO TECHNOLOGIES LIMITED",
-        "LUMAXTECH.BO": "Lumax Auto Technologies Limited",
-        "LUMITECH.BO": "Luminaire Technologies Ltd.",
-        "M3GLOBAL.BO": "NIYOGIN FINTECH LIMITED",
-        "MAESTROM.BO": "Maestros Mediline Systems Ltd",
-        "MANGASOF.BO": "Mangalya Soft-Tech Ltd.",
-        "MANNA.BO": "MANNA GLASS-TECH INDUSTRIES LT",
-        "MARSONS.BO": "Advance Powerinfra Tech Ltd",
-        "MASL.BO": "MAX ALERT SYSTEMS LTD.",
-        "MASTEK.NS": "Mastek Limited",
-        "MAXIMAA.BO": "Maximaa Systems Limited",
-        "MDHITCH.BO": "MADRAS HI-TECH CIRCUITS LTD.",
-        "MELSTAR-BE.NS": "MELSTAR INFORMATION TECH",
-        "MELSTAR.BO": "Melstar Information Technologies Ltd.",
-        "MHLXMIRU.BO": "Mahalaxmi Rubtech Ltd",
-        "MICROTECH.BO": "MICRO TECHNOLOGIES (INDIA) LTD",
-        "MILLENCY.BO": "MILLENNIUM CYBERTECH LTD.",
-        "MINDTREE.NS": "Mindtree Limited",
-        "MIRCH.BO": "Mirch Technologies Ltd.",
-        "MOLDTEK.BO": "Mold Tek Technologies Ltd",
-        "MOSCHIP.BO": "MosChip Semiconductor Technology Limited",
-        "MOTHERSUMI.BO": "Motherson Sumi Systems Ltd.",
-        "MPFSL.BO": "MPF Systems Limited",
-        "MPHASIS.NS": "MphasiS Limited",
-        "MYMTECH.BO": "MYM TECHNOLOGIES LTD.",
-        "NAGTECH.BO": "Nagarjuna Agri Tech Ltd",
-        "NAISARG.BO": "NAISARGIK AGRITECH (INDIA) LTD",
-        "NAMTECHELE.BO": "NAMTECH ELECTRONIC DEVICES LTD",
-        "NARMP.BO": "Narmada Macplast Drip Irrigation Systems Limited",
-        "NATPLASTI.BO": "National Plastic Technologies Ltd",
-        "NAVALTC.BO": "NAVAL TECHNOPLAST INDUSTRIES L",
-        "NEELKATEC.BO": "Neelkanth Technologies Ltd.",
-        "NETVIS.BO": "NETVISION WEB TECHNOLOGIES LTD",
-        "NETVISTAIT.BO": "NETVISTA INFORMATION TECHNOLOG",
-        "NEXCEN.BO": "NEXCEN SOFTECH LTD.",
-        "NEXUSCOMMO.BO": "Nexus Commodities & Technologi",
-        "NGCT-BE.NS": "NORTHGATE COM TECH INR10",
-        "NGCT.NS": "NORTHGATE COM TECH INR10",
-        "NIITLTD.NS": "NIIT Limited",
-        "NIITTECH.BO": "NIIT Technologies Limited",
-        "NIITTECH.NS": "NIIT Technologies Limited",
-        "NNTL.BO": "N2N TECHNOLOGIES LIMITED",
-        "NOELA.BO": "NOEL AGRITECH LTD.",
-        "NUCLEUS.NS": "Nucleus Software Exports Limited",
-        "NUTECGLOB.BO": "Nutech Global Ltd.",
-        "NUTECH.BO": "Nu Tech Corporate Services Ltd",
-        "ODYSSEY.BO": "Odyssey Technologies Limited",
-        "OFSTECH.BO": "OFS Technologies Limited",
-        "OMEGAIN.BO": "Omega Interactive Technologies Limited",
-        "OMNITECH.BO": "Omnitech Infosolutions Limited",
-        "OMNITECH.NS": "Omnitech Infosolutions Ltd",
-        "ONTRACK.BO": "Ontrack Systems Limited",
-        "ONWARDTEC.BO": "ONWARD TECHNOLOGIES LTD.",
-        "ONWARDTEC.NS": "Onward Technologies Limited",
-        "OONE.BO": "OBJECTONE INFORMATION SYSTEMS",
-        "OTML.BO": "ONESOURCE TECHMEDIA LTD.",
-        "PACKTEC.BO": "PACKTECH INDUSTRIES LTD.",
-        "PADMINIT.BO": "PADMINI TECHNOLOGIES LTD.",
-        "PALRED.BO": "PALRED TECHNOLOGIES LIMITED",
-        "PALRED.NS": "Palred Technologies Limited",
-        "PALREDTECH-BE.NS": "Palred Technologies Ltd",
-        "PALREDTECH.NS": "PALRED TECHNOLOGIE INR10",
-        "PALREDTECH.NS": "PALRED TECHNOLOGIE INR10",
-        "PALSOFT.BO": "Palsoft Infosystems Ltd.",
-        "PANORAMUNI.NS": "Panoramic Universal Limited",
-        "PCS.BO": "PCS Technology Limited",
-        "PERSISTENT.BO": "Persistent Systems Limited",
-        "PNCINFRA.NS": "PNC INFRATECH LTD INR2",
-        "PNCINFRA.BO": "PNC Infratech Limited",
-        "PNTASOL-B.BO": "PENTAFOUR SOLEC TECHNOLOGY LTD",
-        "POLTC.BO": "Polygenta Technologies Limited",
-        "PRESSURS.BO": "Pressure Sensitive Systems (India) Ltd.",
-        "PRITHVISO.NS": "Prithvi Softech Limited",
-        "PRITHVISOF.NS": "PRITHVI SOFTECH LTD INR10",
-        "PROTODEV.BO": "Proto Developers & Technologies Limited",
-        "QUANTBUILD.BO": "QUANTUM BUILD-TECH LTD",
-        "QUANTDIA.BO": "Quantum Digital Vision India Ltd.",
-        "QUEST.BO": "QUEST SOFTECH (INDIA) LTD",
-        "QUICKHEAL.BO": "Quick Heal Technologies Limite",
-        "QUICKHEAL.NS": "Quick Heal Technologies Limited",
-        "QUINTEGRA.NS": "Quintegra Solutions Limited",
-        "RACLGEAR.BO": "RACL Geartech Limited",
-        "RAMCOSYS.BO": "Ramco Systems Limited",
-        "RAMCOSYS.NS": "Ramco Systems Limited",
-        "RASHELAG.BO": "Rashel Agrotech Limited",
-        "RATHIGRA.BO": "Rathi Graphic Technologies Ltd.",
-        "RAUNAQAU.BO": "RACL Geartech Limited",
-        "RCIIND.BO": "RCI INDUSTRIES & TECHNOLOGIES",
-        "RDEVCAB.BO": "Rishabhdev Technocable Limited",
-        "REDEXPR.BO": "Redex Protech Ltd.",
-        "REDINGTON.NS": "Redington (India) Limited",
-        "RELICTEC.BO": "Relic Technologies Ltd.",
-        "REMIELEK.BO": "REMI ELEKTROTECHNIK LIMITED",
-        "RISHITECH.BO": "RISHI TECHTEX LTD.",
-        "RJBIOTECH.BO": "R J BIO-TECH LTD",
-        "ROHITFERRO.NS": "ROHIT FERRO-TECH INR10",
-        "ROHITFERRO.BO": "Rohit Ferro-Tech Limited",
-        "ROLTA.NS": "Rolta India Limited",
-        "RSYSTEMBBPH.BO": "R Systems International Limite",
-        "RSYSTEMINT.BO": "R SYSTEMS INTERNATIONAL LTD.",
-        "RSYSTEMS.NS": "R Systems International Limited",
-        "RUDRAKSH.BO": "RUDRAKSH CAP-TECH LTD.",
-        "SAGARSYST.BO": "SAGAR SYSTECH LTD.",
-        "SAKSOFT.NS": "Saksoft Limited",
-        "SANTETX.BO": "SANRHEA TECHNICAL TEXTILES LTD",
-        "SARDAINF.BO": "SARDA INFORMATION TECHNOLOGY L",
-        "SASHWAT.BO": "SASHWAT TECHNOCRATS LIMITED",
-        "SBECSYS.BO": "SBEC SYSTEMS (INDIA) LTD.",
-        "SBTL.BO": "Southern Online Bio Technologies Ltd.",
-        "SCAGRO.BO": "SC Agrotech Limited",
-        "SECEARTH.BO": "SECURE EARTH TECHNOLIGIES LTD.",
-        "SELAN.BO": "Selan Exploration Technology Limited",
-        "SERVOTEC.BO": "Servotech Engineering Industries Ltd.",
-        "SESHACHAL.BO": "Seshachal Technologies Ltd",
-        "SHEETALB.BO": "SHEETAL BIO-AGRO TECH LTD.",
-        "SHELINT.BO": "SC Agrotech Limited",
-        "SHILCTECH.BO": "Shilchar Technologies Limited",
-        "SHILPI.BO": "SHILPI CABLE TECHNOLOGIES LTD.",
-        "SHIVAMAUTO.BO": "SHIVAM AUTOTECH LTD.",
-        "SHOTI.BO": "SHONKH TECHNOLOGIES INTERNATIO",
-        "SHREERAMA.BO": "Shree Rama Multi-Tech Ltd.",
-        "SHUKDTA.BO": "SHUKLA DATA TECHNICS LTD.",
-        "SIKA.BO": "Sika Interplant Systems Ltd.",
-        "SILINFRA.BO": "SILVERPOINT INFRATECH LTD",
-        "SILVERLINE.BO": "SILVERLINE TECHNOLOGIES LTD.",
-        "SINDUVA.BO": "SINDU VALLEY TECHNOLOGIES LTD.",
-        "SMARTLINK.BO": "Smartlink Network Systems Limited",
-        "SMSTECH.BO": "SMS TECHSOFT (INDIA) LIMITED",
-        "SOFCOM.BO": "SOFCOM SYSTEMS LIMITED",
-        "SOFTECH.BO": "Softech Infinium Solutions Limited",
-        "SOFTRAKT.BO": "SOFTRAK TECHNOLOGY EXPORTS LTD",
-        "SOFTTECHGR-BE.NS": "SOFTTECHGRNPP070100",
-        "SOFTTECHGR.NS": "STG Lifecare Limited",
-        "SOFTTECHGR6.BO": "SOFTTECHGR6.BO",
-        "SONASTEER.BO": "SONA KOYO STEERING SYSTEMS LTD",
-        "SOTL.NS": "SAVITA OIL TECHNOLOGIES LIMITED",
-        "SOTL.BO": "Savita Oil Technologies Limited",
-        "SPARC.BO": "Sparc Systems Ltd.",
-        "SPARCSYS.BO": "SPARC SYSTEMS LTD.",
-        "SPHEREGSL.NS": "Sphere Global Services Limited",
-        "SPLTECHNO.BO": "SPL TECHNOCHEM LTD.",
-        "SRIMT.BO": "SRIVEN MULTI-TECH LTD.",
-        "STARCOM.BO": "STARCOM INFORMATION TECHNOLOGY",
-        "STARLIT.BO": "Starlit Power Systems Limited",
-        "STNPP.BO": "SOFT TECH PP",
-        "STRTECH.NS": "STERLITE TECHNOLOGIES LIMITED",
-        "STRTECH.BO": "Sterlite Technologies Limited",
-        "SUNILHITEC.NS": "SUNIL HITECH ENGIN INR1",
-        "SUNILHITEC.BO": "Sunil Hitech Engineers Ltd.",
-        "SUNTECHNO.BO": "SUN TECHNO OVERSEAS LTD.",
-        "SWAGRO.BO": "SWARNAJYOTHI AGROTECH & POWER",
-        "SWELECTES.BO": "SWELECT ENERGY SYSTEMS LIMITED",
-        "SWITCHTE.BO": "Switching Technologies Gunther Ltd.",
-        "SYLPH.BO": "Sylph Technologies Ltd.",
-        "TAKE.NS": "TAKE Solutions Limited",
-        "TCS.NS": "Tata Consultancy Services Limited",
-        "TDPOWERSYS.BO": "T D POWER SYSTEMS LTD.",
-        "TECHCON.BO": "TECHNOJET CONSULTANTS LTD.",
-        "TECHFOR.BO": "Techno Forge Limited",
-        "TECHIN-BE.NS": "TECHINDIA NIRMAN LIMITED",
-        "TECHIN.NS": "TECHINDIA NIRMAN L INR10",
-        "TECHIN.BO": "TECHIN",
-        "TECHM.BO": "Tech Mahindra Limited",
-        "TECHM.NS": "Tech Mahindra Limited",
-        "TECHNO.NS": "TECHNO ELECTRIC & ENGINEERING C",
-        "TECHNO.BO": "TECHNO ELECTRIC AND ENGINEERIN",
-        "TECHNOFAB.NS": "TECHNOFAB ENGINEERING LIMITED",
-        "TECHNOFAB.BO": "Technofab Engineering Limited",
-        "TECHNVISN.BO": "TECHNVISION VENTURES LTD.",
-        "TECHTREK.BO": "TECHTREK INDIA LTD.",
-        "TECPO.BO": "Techtran Polylenses Ltd.",
-        "TECPRO-BE.NS": "TECPRO SYSTEMS LTD INR10",
-        "TECPRO-BZ.NS": "TECPRO SYSTEMS LTD",
-        "TECPRO.NS": "TECPRO SYSTEMS LIMITED",
-        "TECPRO.BO": "TECPRO SYSTEMS LTD.",
-        "TECPRO.NS": "Tecpro Systems Limited",
-        "TELEDATAIT.BO": "TELEDATA TECHNOLOGY SOLUTIONS",
-        "TIIL.NS": "TECHNOCRAFT INDUSTRIES (INDIA)",
-        "TIIL.BO": "Technocraft Industries (India) Ltd.",
-        "TIMETECHNO.BO": "TIME TECHNOPLAST LTD.",
-        "TIMETECHNO6.BO": "TIMETECHNO6.BO",
-        "TPLPLAST.BO": "TPL Plastech Limited",
-        "TPLPLASTEH.NS": "TPL PLASTECH LTD. INR10",
-        "TPLPLASTEH.NS": "TPL PLASTECH LTD. INR10",
-        "TRANSAG.BO": "TRANS AGRO TECH LTD.",
-        "TRATF.BO": "TRANS TECHNO FOODS LTD.",
-        "TRICOM.NS": "Tricom India Limited",
-        "TRIGYN.NS": "TRIGYN TECHNOLOGIE INR10",
-        "TRIGYN.BO": "TRIGYN TECHNOLOGIES LTD.",
-        "TRILLENT.BO": "TRILLENIUM TECHNOLOGIES LTD.",
-        "TRILOGIC.BO": "TRILOGIC DIGITAL MEDIA LTD.",
-        "TRINITY.BO": "TRINITY BIO-TECH LTD.",
-        "TURBO.BO": "TURBOTECH ENGINEERING LTD.",
-        "TUTIS.BO": "Tutis Technologies Ltd",
-        "UCALFUEL.BO": "Ucal Fuel Systems Ltd.",
-        "ULTRACEMCO.BO": "ULTRATECH CEMENT LTD.",
-        "UNITECH.NS": "UNITECH LIMITED",
-        "UNITECH.BO": "Unitech Ltd.",
-        "UNITINT.BO": "Unitech International Ltd",
-        "USGTECH.BO": "USG TECH SOLUTIONS LTD.",
-        "VAGHANI.BO": "Vaghani Techno-Build Limited",
-        "VANTECH-B.BO": "VANTECH INDUSTRY LTD.",
-        "VANTEL.BO": "VANTEL TECHNOLOGIES LTD.",
-        "VEDAVAAG.BO": "VEDAVAAG SYSTEMS LTD.",
-        "VIKASECO.NS": "VIKAS ECOTECH LIMI INR1",
-        "VIKASECO.BO": "Vikas EcoTech Limited",
-        "VIKASGLOB.NS": "Vikas EcoTech Limited",
-        "VINSFRJ.BO": "VINSARI FRUITECH LTD.",
-        "VIRTUALS.BO": "Virtualsoft Systems Ltd",
-        "VISESHINFO.NS": "MPS Infotecnics Limited",
-        "VISHPAP.BO": "VISHAL PAPERTECH (INDIA) LTD.",
-        "VISUINTL.BO": "Ed & Tech international Limited",
-        "VIVOBIOT.BO": "VIVO BIO TECH LTD.",
-        "VJIL.BO": "Athena Global Technologies Limited",
-        "VOLGAAIR.BO": "VOLGA AIR TECHNICS LTD.",
-        "WABAG.BO": "VA TECH WABAG LTD.",
-        "WIPRO.NS": "Wipro Limited",
-        "WWTECHHOL.BO": "W W TECHNOLOGY HOLDINGS LTD.",
-        "XCHANGING.NS": "Xchanging Solutions Limited",
-        "ZDIGIELE.BO": "DIGITAL ELECTRONICS LTD.",
-        "ZENOTECH.BO": "Zenotech Laboratories Limited",
-        "ZENSARTEC.NS": "Zensar Technologies Limited",
-        "ZENSARTECH.BO": "ZENSAR TECHNOLOGIES LTD.",
-        "ZENSARTECH.NS": "Zensar Technologies Limited",
-        "ZENTEC-BE.NS": "Zen Technologies Limited",
-        "ZENTEC.NS": "ZEN TECHNOLOGIES INR1",
-        "ZENTEC.BO": "Zen Technologies Ltd.",
-        "ZENTECBBPH.BO": "ZEN TECH*",
-        "ZENTECHBBPH.BO": "ZENTECH*",
-        "ZICOM.BO": "Zicom Electronic Security Systems Limited",
-        "ZYLOG.BO": "Zylog Systems Limited"
-    },
-
-    "Internet Information Providers": {
-        "ISFT.NS": "IntraSoft Technologies Limited",
-        "LYCOS.NS": "Lycos Internet Limited",
-        "NAUKRI.NS": "Info Edge (India) Limited",
-        "NET4.NS": "Net 4 India Limited"
-    },
-
-    "Investment Brokerage - National": {
-        "AASHEESH.BO": "AASHEESH SECURITIES LTD.",
-        "ABHIJIT.BO": "Abhijit Trading Co. Ltd.",
-        "ALKASEC.BO": "Alka Securities Ltd.",
-        "ALMONDZ.NS": "Almondz Global Securities Limited",
-        "ALNATRD.BO": "ALNA TRADING & EXPORTS LTD.",
-        "ALORA.BO": "Alora Trading Company Limited",
-        "ALSL.BO": "ALACRITY SECURITIES LTD",
-        "AMANITRA.BO": "Amani Trading & Exports Ltd.",
-        "AMARSEC.BO": "AMARNATH SECURITIES LTD",
-        "AMITSEC.BO": "Amit Securities Limited",
-        "ARISE.BO": "Arihant's Securities Limited",
-        "ARTKPOW.BO": "Artech Power & Trading Limited",
-        "ASWTR.BO": "AASWA TRADING & EXPORTS LTD.",
-        "AUSOMENT.NS": "Ausom Enterprise Limited",
-        "BAMPSL.BO": "Bampsl Securities Ltd.",
-        "BBTC.NS": "BOMBAY BURMAH TRADING CORPORATI",
-        "BBTC.BO": "BOMBAY BURMAH TRADING CORP.LTD",
-        "BERYLSE.BO": "Beryl Securities Ltd",
-        "BETALA.BO": "BETALA GLOBAL SECURITIES LTD.",
-        "BIRLAMONEY.NS": "Aditya Birla Money Limited",
-        "BLBLIMITED.NS": "BLB Limited",
-        "BLUECHIP.NS": "Blue Chip India Limited",
-        "BNRSEC.BO": "BN Rathi Securities Ltd.",
-        "BRIDGESE.BO": "Bridge Securities Limited",
-        "BRINDHL.BO": "BRINDABAN HOLDINGS & TRADING L",
-        "CARERATING.NS": "CARE Ratings Limited",
-        "CHOKSEC.BO": "Chokhani Securities Ltd.",
-        "CILSEC.BO": "CIL Securities Limited",
-        "CONSOFINVT.NS": "Consolidated Finvest & Holdings Limited",
-        "CRISIL.NS": "CRISIL Limited",
-        "CSL.BO": "Continental Securities Limited",
-        "DAULAT.BO": "Daulat Securities Ltd",
-        "DBSTOCKBRO.NS": "DB (International) Stock Brokers Ltd",
-        "DEVITRD.BO": "DEVINSU TRADING LTD.",
-        "DHUNINV.NS": "Dhunseri Investments Limited",
-        "DPL.NS": "Dhunseri Petrochem Limited",
-        "DWITIYA.BO": "DWITIYA TRADING LTD",
-        "EDELWEISS.NS": "Edelweiss Financial Services Limited",
-        "EFFTXT.BO": "EFFINGO TEXTILE & TRADING LIMI",
-        "EMKAY.NS": "Emkay Global Financial Services Limited",
-        "ESSARSEC.BO": "ESSAR SECURITIES LTD",
-        "FRONTSEC.BO": "Frontline Securities Ltd.",
-        "FUTURSEC.BO": "Futuristic Securities Limited",
-        "GAJANANSEC.BO": "GAJANAN SECURITIES SERVICES LT",
-        "GCMCOMM.BO": "GCM COMMODITY & DERIVATIVES LT",
-        "GCMSECU.BO": "GCM SECURITIES LTD",
-        "GDTRAGN.BO": "G.D.TRADING & AGENCIES LTD.",
-        "GLOBSEC.BO": "Global Securities Ltd",
-        "GRANDMA.BO": "GRANDMA TRADING & AGENCIES LTD",
-        "GSLSEC.BO": "Gsl Securities Ltd",
-        "HBSTOCK.NS": "HB Stockholdings Limited",
-        "HINDSECR.BO": "Hind Securities & Credits Limi",
-        "IBVENTURES.NS": "Indiabulls Ventures Limited",
-        "ICRA.NS": "ICRA Limited",
-        "IIFL.NS": "IIFL Holdings Limited",
-        "IKAB.BO": "Ikab Securities & Investment Limited",
-        "INANISEC.BO": "Inani Securities Ltd.",
-        "INDOTHAI.NS": "INDO THAI SECURITIES LIMITED",
-        "INDOTHAI.BO": "INDO THAI SECURITIES LTD.",
-        "INDOTHAI.NS": "Indo Thai Securities Limited",
-        "INVENTURE.NS": "INVENTURE GROWTH & SECURITIES L",
-        "INVENTURE.BO": "INVENTURE GROWTH & SECURITIES",
-        "INVENTURE.NS": "Inventure Growth & Securities Limited",
-        "JMFINANCIL.NS": "JM Financial Limited",
-        "JPTSEC.BO": "JPT Securities Ltd.",
-        "KAYEL.BO": "Kayel Securities Ltd.",
-        "KEYCORPSER.NS": "Keynote Corporate Services Limited",
-        "KHANDSE.BO": "Khandwala Securities Limited",
-        "KHANDSE.NS": "Khandwala Securities Limited",
-        "KRISHNACAP.BO": "Krishna Capital And Securities",
-        "LIBORD.BO": "LIBORD SECURITIES LTD.",
-        "LOHIASEC.BO": "Lohia Securities Ltd.",
-        "MACK.BO": "MACK TRADING CO.LTD.",
-        "MADHUSE.BO": "Madhusudan Securities Ltd.",
-        "MAHSHRE.BO": "MAHASHREE TRADING LTD.",
-        "MALTC.BO": "Malabar Trading Company Ltd.",
-        "MARUTISE.BO": "Maruti Securities Ltd",
-        "MATHEWE.BO": "Mathew Easow Research Securities Ltd.",
-        "MCDHOLDING.NS": "McDowell Holdings Limited",
-        "MCX-IL.NS": "MULTI COMMODITY EX INR10",
-        "MCX.BO": "MULTI COMMODITY EXCHANGE OF IN",
-        "MEHSECU.BO": "MEHTA SECURITIES LTD.",
-        "MODEX.BO": "MODEX INTERNATIONAL SECURITIES",
-        "MOONGIPASEC.BO": "Moongipa Securities Ltd.",
-        "MRUTR.BO": "MRUGESH TRADING LTD.",
-        "MSECURI.BO": "MS SECURITIES LTD.",
-        "MYMONEY.BO": "My Money Securities Ltd.",
-        "NAM.BO": "NAM SECURITIES LTD",
-        "NAYSAA.BO": "Naysaa Securities Limited",
-        "NDASEC.BO": "NDA Securities Ltd.",
-        "OASISEC.BO": "Oasis Securities Ltd.",
-        "ONELIFECAP.NS": "Onelife Capital Advisors Limited",
-        "PEETISEC.BO": "Peeti Securities Ltd",
-        "PHTRADING.BO": "PH TRADING LTD.",
-        "PRECTRA.BO": "PRECIOUS TRADING & INVESTMENTS",
-        "PRIMESECU.BO": "PRIME SECURITIES LTD.",
-        "PRIMESECU.NS": "Prime Securities Limited",
-        "PUNCTRD.BO": "PUNCTUAL TRADING LTD.",
-        "RANJITSE.BO": "RANJIT SECURITIES LTD.",
-        "RAVINDT.BO": "RAVINDRA TRADING & AGENCIES LT",
-        "RELIGARE.NS": "Religare Enterprises Limited",
-        "REMITR.BO": "REMI SECURITIES LTD.",
-        "RRSECUR.BO": "R. R. Securities Ltd",
-        "SAFALSEC.BO": "SAFAL SECURITIES LTD",
-        "SARLCRD.BO": "SARLA CREDIT & SECURITIES LTD.",
-        "SHARDUL.BO": "Shardul Securities Ltd.",
-        "SHIKHARLETR.BO": "SHIKHAR LEASING & TRADING LTD.",
-        "SHREESEC.BO": "Shree Securities Ltd.",
-        "SHYAMHO.BO": "SHYAMAL HOLDINGS & TRADING LTD",
-        "SKPSEC.BO": "SKP Securities Limited",
-        "SMPLXTR.BO": "Simplex Trading & Agencies Ltd.",
-        "SOUTHPO.BO": "SOUTH POLE SECURITIES LTD.",
-        "STCINDIA.NS": "THE STATE TRADING CORPORATION O",
-        "STCINDIA.BO": "STATE TRADING CORPORATION OF I",
-        "STELLANT.BO": "STELLANT SECURITIES (INDIA) LT",
-        "SUCHTRD.BO": "SUCHAK TRADING LTD.",
-        "SUJALA.BO": "Sujala Trading & Holding Ltd.",
-        "SUMMITSEC.BO": "SUMMIT SECURITIES LTD.",
-        "SUMMITSEC.NS": "Summit Securities Limited",
-        "SUNBRIGHT.BO": "SUNBRIGHT STOCK BROKING LTD.",
-        "SWAGTAM.BO": "Swagatam Trading & Services Li",
-        "SWRNASE.BO": "Swarna Securities Limited",
-        "SYMBIOX.BO": "Symbiox Investment & Trading C",
-        "SYTIXSE.BO": "SYSTEMATIX SECURITIES LTD.",
-        "TATAINVEST.NS": "Tata Investment Corporation Limited",
-        "TITANSEC.BO": "Titan Securities Limited",
-        "TRIOMERC.BO": "TRIO MERCANTILE & TRADING LTD.",
-        "UNICRSE.BO": "Universal Credit and Securities Limited",
-        "UNIWSEC.BO": "UNIWORTH SECURITIES LTD.",
-        "VERTEX.BO": "Vertex Securities Limited",
-        "VIKALPS.BO": "Vikalp Securities Limited",
-        "VINTAGES.BO": "Vintage Securities Ltd.",
-        "VISJYTR.BO": "VISHVJYOTI TRADING LTD.",
-        "VISTR.BO": "VISHVPRABHA TRADING LTD.",
-        "VLSFINANCE.NS": "VLS Finance Limited",
-        "WEIZFOREX.NS": "Weizmann Forex Limited",
-        "WORTH.BO": "WORTH INVESTMENT & TRADING CO",
-        "ZARDIINV.BO": "ARDI INVESTMENT & TRADING LTD.",
-        "ZEXDONTR.BO": "Exdon Trading Company Limited",
-        "ZHEMHOLD.BO": "HEM HOLDINGS & TRADING LTD.",
-        "ZKOVALIN.BO": "KOVALAM INVESTMENT & TRADING C",
-        "ZMANSOON.BO": "MANSOON TRADING CO.LTD.",
-        "ZMULTIPU.BO": "MULTIPURPOSE TRADING & AGENCIE",
-        "ZNEWSAGA.BO": "NEW SAGAR TRADING CO.LTD.",
-        "ZNIVITRD.BO": "NIVI TRADING LTD.",
-        "ZSURYODI.BO": "SURYODAYA INVESTMENT & TRADING",
-        "ZSVARAJT.BO": "SVARAJ TRADING & AGENCIES LTD.",
-        "ZSVTRADI.BO": "S.V.TRADING & AGENCIES LTD.",
-        "ZVINADTR.BO": "VINADITYA TRADING CO.LTD."
-    },
-
-    "Jewelry Stores": {
-        "AJIL.BO": "ATLAS JEWELLERY INDIA LIMITED",
-        "ALKADIA.BO": "Alka Diamond Industries Limited",
-        "CLASSIC-BE.NS": "CLASSIC DIAMONDS (I) LTD",
-        "CLASSIC-BZ.NS": "CLASSIC DIAMONDS (I) LTD",
-        "CLASSIC.NS": "CLASSIC DIAMONDS (INDIA) LIMITE",
-        "CLASSIC.BO": "CLASSIC DIAMONDS (INDIA) LTD.",
-        "CLASSIC.NS": "Classic Diamonds (India)",
-        "DDIL.BO": "Deep Diamond India Limited",
-        "ENCHANTE.BO": "ENCHANTE JEWELLERY LTD.",
-        "FLAWLESD.BO": "FLAWLESS DIAMOND (INDIA) LTD.",
-        "GEMSI.BO": "Gemstone Investments Limited",
-        "GITANJALI.NS": "GITANJALI GEMS LIMITED",
-        "GITANJALI.BO": "Gitanjali Gems Ltd.",
-        "GITANJALI.NS": "Gitanjali Gems Limited",
-        "GOENKA-BZ.NS": "GOENKA DIAMOND&JEWELS LTD",
-        "GOENKA.BO": "GOENKA DIAMOND & JEWELS LTD.",
-        "GOENKA.NS": "Goenka Diamond and Jewels Limited",
-        "GOLDIAM.NS": "Goldiam International Limited",
-        "GOLKUNDIA.BO": "Golkunda Diamonds & Jewellery Limited",
-        "INTERDIA.BO": "INTERNATIONAL DIAMOND SERVICES",
-        "KDDL.NS": "KDDL Limited",
-        "LADIAMO.BO": "Laser Diamonds Ltd",
-        "LYPSAGEMS.NS": "LYPSA GEMS & JEWEL INR10",
-        "LYPSAGEMS.BO": "LYPSA GEMS & JEWELLERY LTD",
-        "LYPSAGEMS.NS": "Lypsa Gems & Jewellery Limited",
-        "MINID.BO": "Mini Diamonds (India) Limited",
-        "NARBADA.BO": "Narbada Gems And Jewellery Ltd",
-        "PCJEWELLER.NS": "PC Jeweller Limited",
-        "PJL.BO": "Patdiam Jewellery Limited",
-        "PROFDIA.BO": "PROFESSIONAL DIAMONDS LTD.",
-        "RAJESHEXPO.NS": "Rajesh Exports Limited",
-        "RJL.BO": "Renaissance Jewellery Ltd.",
-        "RJL.NS": "Renaissance Jewellery Limited",
-        "SGJHL.BO": "Shree Ganesh Jewellery House (I) Limited",
-        "SGJHL.NS": "Shree Ganesh Jewellery House (I) Limited",
-        "SHEETAL.BO": "Sheetal Diamonds Ltd",
-        "SHRENUJ.NS": "Shrenuj & Company Limited",
-        "SHUKJEW.BO": "Shukra Jewellery Limited",
-        "SOVERDIA.BO": "Sovereign Diamonds Ltd",
-        "SRSLTD.NS": "SRS Limited",
-        "SUNRAJDI.BO": "Sunraj Diamond Exports Ltd.",
-        "SURANACORP.NS": "Surana Corporation Limited",
-        "SWARNSAR.BO": "Swarnsarita Gems Limited",
-        "TARAJEWELS.NS": "Tara Jewels Limited",
-        "TBZ.NS": "Tribhovandas Bhimji Zaveri Limited",
-        "THANGAMAYL.BO": "THANGAMAYIL JEWELLERY LTD",
-        "THANGAMAYL.NS": "Thangamayil Jewellery Limited",
-        "TITAN.NS": "Titan Company Limited",
-        "UDAYJEW.BO": "Uday Jewellery Industries Limi",
-        "VAIBHAVGBL.NS": "Vaibhav Global Limited",
-        "WHITEDIA.BO": "White Diamond Industries Ltd.",
-        "WINSOMEDJ.BO": "WINSOME DIAMONDS AND JEWELLERY",
-        "ZODJRDMKJ.NS": "Zodiac-JRD-MKJ Limited"
-    },
-
-    "Life Insurance": {
-        "MFSL.NS": "Max Financial Services Limited"
-    },
-
-    "Lodging": {
-        "ADVANIHOTR.NS": "ADVANI HOTELS & RE INR2.00",
-        "ADVANIHOTR.BO": "ADVANI HOTELS & RESORTS (INDIA",
-        "ADVANIHOTR.NS": "Advani Hotels & Resorts (India) Limited",
-        "AHLEAST.BO": "ASIAN HOTELS (EAST) LTD.",
-        "AHLEAST.NS": "Asian Hotels (East) Limited",
-        "AHLWEST.BO": "ASIAN HOTELS (WEST) LTD.",
-        "AHLWEST.NS": "Asian Hotels (West) Limited",
-        "APOLSINHOT-BE.NS": "Apollo Sindoori Hotels Li",
-        "APOLSINHOT.NS": "Apollo Sindoori Hotels Limited",
-        "ARUNAHTEL.BO": "ARUNA HOTELS LTD.",
-        "ASIANHOTNR.NS": "ASIAN HOTELS(NORTH INR10",
-        "ASIANHOTNR.BO": "ASIAN HOTELS (NORTH) LIMITED",
-        "ASIANHOTNR.NS": "Asian Hotels (North) Limited",
-        "BALAJHOTEL.BO": "BALAJI HOTELS & ENTERPRISES LT",
-        "BENARAS.BO": "Benares Hotels Limited",
-        "BESTEAST.BO": "Best Eastern Hotels Ltd.",
-        "BLUECOAST-BE.NS": "BLUE COAST HOTELS INR10",
-        "BLUECOAST.NS": "BLUE COAST HOTELS INR10",
-        "BLUECOAST.BO": "BLUE COAST HOTELS LTD.",
-        "BLUECOAST.NS": "Blue Coast Hotels Limited",
-        "CINDHO.BO": "Cindrella Hotels Ltd.",
-        "DOLPHOT.BO": "DOLPHIN HOTELS LTD.",
-        "EIHAHOTELS.BO": "EIH ASSOCIATED HOTELS LTD.",
-        "EIHAHOTELS.NS": "EIH Associated Hotels Limited",
-        "EIHOTEL.NS": "EIH Limited",
-        "FOMEHOT.BO": "Fomento Resorts & Hotels Limited",
-        "GUJHOTE.BO": "Gujarat Hotels Ltd.",
-        "HOTELEELA.NS": "Hotel Leelaventure Limited",
-        "HOWARHO.BO": "Howard Hotels Limited",
-        "IDHOTIN.BO": "IDEAL HOTELS & INDUSTRIES LTD.",
-        "INDHOTEL.BO": "INDIAN HOTELS CO.LTD.",
-        "INDHOTEL.NS": "The Indian Hotels Company Limited",
-        "JAMEHOT.BO": "James Hotels Ltd",
-        "JINDHOT.BO": "Jindal Hotels Ltd",
-        "KAMATHOTEL.NS": "KAMAT HOTELS (I) LIMITED",
-        "KAMATHOTEL.BO": "KAMAT HOTELS (INDIA) LTD.",
-        "KAMATHOTEL.NS": "Kamat Hotels (India) Limited",
-        "LEWATERIN.BO": "LE WATERINA RESORTS & HOTELS L",
-        "LORDSHOTL.BO": "LORDS ISHWAR HOTELS LIMITED",
-        "NEELKNT.BO": "NEELKANTH MOTELS & HOTELS LTD.",
-        "ORIENTHOT.NS": "ORIENTAL HOTELS LIMITED",
-        "ORIENTHOT.BO": "Oriental Hotels Limited",
-        "ORIENTHOT.NS": "Oriental Hotels Limited",
-        "PECOS.BO": "PECOS Hotels And Pubs Limited",
-        "POLOHOT.BO": "Polo Hotels Ltd.",
-        "RASRESOR.BO": "Ras Resorts & Apart Hotels Ltd",
-        "RAYALEMA.BO": "Royale Manor Hotels & Industries Ltd.",
-        "ROHLTD.BO": "Royal Orchid Hotels Limited",
-        "ROHLTD.NS": "Royal Orchid Hotels Limited",
-        "SAYAJIHOTL.BO": "SAYAJI HOTELS LTD.",
-        "SINCLAIR.BO": "Sinclairs Hotels Limited",
-        "SUNLAKE.BO": "SUNLAKE RESORTS & HOTELS LTD.",
-        "TAJGVK.BO": "TAJGVK Hotels & Resorts Limited",
-        "TAJGVK.NS": "TAJGVK Hotels & Resorts Limited",
-        "TGBHOTELS.BO": "TGB BANQUETS AND HOTELS LTD.",
-        "TGBHOTELS.NS": "TGB Banquets And Hotels Limited",
-        "TGBHOTELS6.BO": "TGBHOTELS6.BO",
-        "THEBYKE.NS": "The Byke Hospitality Limited",
-        "TULIPSTA.BO": "Tulip Star Hotels Ltd",
-        "UGHOR.BO": "U G Hotels & Resorts Ltd.",
-        "UPHOT.BO": "UP Hotels Ltd.",
-        "VELHO.BO": "Velan Hotels Ltd",
-        "VICEROY.BO": "VICEROY HOTELS LTD.",
-        "VICEROY.NS": "Viceroy Hotels Limited"
-    },
-
-    "Lumber, Wood Production": {
-        "ARCHIDPLY.NS": "Archidply Industries Limited",
-        "CENTURYPLY.NS": "Century Plyboards (India) Limited",
-        "MANGTIMBER.NS": "Mangalam Timber Products Limited",
-        "UNIPLY.NS": "Uniply Industries Limited"
-    },
-
-    "Machine Tools & Accessories": {
-        "ESABINDIA.NS": "ESAB India Limited",
-        "LAKPRE.NS": "Lakshmi Precision Screws Limited",
-        "NIBL.NS": "NRB Industrial Bearings Limited",
-        "STERTOOLS.NS": "Sterling Tools Limited",
-        "TIIL.NS": "Technocraft Industries (India) Limited",
-        "WENDT.NS": "Wendt (India) Limited"
-    },
-
-    "Major Airlines": {
-        "INDIGO.BO": "InterGlobe Aviation Limited",
-        "INDIGO.NS": "InterGlobe Aviation Limited",
-        "JAGSONAI.BO": "Jagson Airlines Ltd.",
-        "JETAIRWAYS.BO": "Jet Airways (India) Ltd.",
-        "JETAIRWAYS.NS": "Jet Airways (India) Limited",
-        "KFA-BZ.NS": "KINGFISHER AIRLINES LTD",
-        "KFA.BO": "Kingfisher Airlines Limited",
-        "TANAA.BO": "Taneja Aerospace and Aviation Limited"
-    },
-
-    "Major Integrated Oil & Gas": {
-        "CAIRN.NS": "Cairn India Limited",
-        "ONGC.NS": "Oil and Natural Gas Corporation Limited"
-    },
-
-    "Medical Appliances & Equipment": {
-        "OPTOCIRCUI.NS": "Opto Circuits (India) Ltd"
-    },
-
-    "Medical Instruments & Supplies": {
-        "POLYMED.NS": "Poly Medicure Limited"
-    },
-
-    "Medical Laboratories & Research": {
-        "LALPATHLAB.NS": "Dr. Lal PathLabs Limited",
-        "VIMTALABS.NS": "Vimta Labs Limited"
-    },
-
-    "Medical Services": {
-        "APOLLOHOSP.NS": "APOLLO HOSPITALS INR5",
-        "APOLLOHOSP.BO": "Apollo Hospitals Enterprise Ltd.",
-        "BYKE.NS": "THE BYKE HOSPITALI INR10",
-        "BYKE.NS": "THE BYKE HOSPITALI INR10",
-        "CADILAHC.BO": "Cadila Healthcare Limited",
-        "CBCSL.BO": "ARAMBHAN HOSPITALITY SERVICES L",
-        "CCHHL.BO": "COUNTRY CLUB HOSPITALITY AND H",
-        "CDRMEDI.BO": "CDR MEDICAL INDUSTRIES LTD.",
-        "CMMHOSP.BO": "Chennai Meenakshi Multispeciality Hospital Ltd.",
-        "COREPARENT.BO": "CORE HEALTHCARE LTD.",
-        "DOLPHMED.BO": "Dolphin Medical Services Ltd.",
-        "DRAGARWQ.BO": "Dr. Agarwal's Eye Hospital Limited",
-        "FORTIS.NS": "FORTIS HEALTHCARE LIMITED",
-        "FORTIS.BO": "Fortis Healthcare Limited",
-        "FORTISMLR.BO": "FORTIS MALAR HOSPITALS LIMITED",
-        "GRAVISSHO.BO": "Graviss Hospitality Limited",
-        "HCG.BO": "HealthCare Global Enterprises",
-        "INDRAMEDCO.NS": "INDRAPRASTHA MEDICAL CORPORATIO",
-        "INDRAMEDCO.BO": "Indraprastha Medical Corp. Ltd.",
-        "ISHMS.BO": "ISHWAR MEDICAL SERVICES LTD.",
-        "KMCSHIL.BO": "KMC Speciality Hospitals (India) Ltd.",
-        "KOVAI.BO": "KOVAI MEDICAL CENTER & HOSPITA",
-        "KOVAI.NS": "Kovai Medical Center & Hospital Ltd.",
-        "LOTUSEYE.NS": "LOTUS EYE CARE HOSPITAL LIMITED",
-        "LOTUSEYE.BO": "Lotus Eye Hospital and Institute Limited",
-        "LOTUSEYE.NS": "Lotus Eye Hospital and Institute Limited",
-        "RGNYMIS.BO": "Regency Hospital Limited",
-        "SECHE.BO": "Secunderabad Healthcare Ltd.",
-        "SHARMEH.BO": "SHARMA EAST INDIA HOSPITALS &",
-        "STGUJHS.BO": "STERLING (GUJARAT) HOSPITALS L",
-        "SUNLOC.BO": "SUNIL HEALTHCARE LTD",
-        "SUPREME.BO": "SUPREME HOLDINGS & HOSPITALITY",
-        "SYNCOM.NS": "SYNCOM HEALTHCARE LIMITED",
-        "TEJNAKSH.BO": "Tejnaksh Healthcare Limited",
-        "THEBYKE.BO": "THE BYKE HOSPITALITY LTD.",
-        "TOTEX.BO": "Total Hospitality Limited",
-        "TTKHEALTH.BO": "TTK HEALTHCARE LTD.",
-        "TTKHLTCARE.NS": "TTK HEALTHCARE INR10",
-        "TTKHLTCARE.NS": "TTK HEALTHCARE INR10",
-        "ZENITHHE.BO": "Zenith Healthcare Ltd"
-    },
-
-    "Metal Fabrication": {
-        "ALICON.NS": "Alicon Castalloy Limited",
-        "ARCOTECH.NS": "Arcotech Limited",
-        "BILENERGY.NS": "Bil Energy Systems Limited",
-        "ELECTHERM.NS": "Electrotherm (India) Limited",
-        "GANDHITUBE.NS": "Gandhi Special Tubes Limited",
-        "GOODLUCK.NS": "Goodluck India Limited",
-        "GRAVITA.NS": "Gravita India Limited",
-        "HILTON.NS": "Hilton Metal Forging Limited",
-        "MAHINDCIE.NS": "Mahindra CIE Automotive Limited",
-        "METALFORGE.NS": "Metalyst Forgings Limited",
-        "MMFL.NS": "MM Forgings Limited",
-        "NELCAST.NS": "Nelcast Limited",
-        "ORIENTREF.NS": "Orient Refractories Limited",
-        "PENPEBS.NS": "Pennar Engineered Building Systems Limited",
-        "PSL.NS": "PSL Limited",
-        "ROHITFERRO.NS": "Rohit Ferro-Tech Limited",
-        "SGFL.NS": "Shree Ganesh Forgings Limited",
-        "SRIPIPES.NS": "Srikalahasthi Pipes Limited",
-        "ZENITHBIR.NS": "Zenith Birla (India) Limited"
-    },
-
-    "Miscellaneous - BSE Listed": {
-        "$ARLABNC.BO": "ARLABS(80NC)",
-        "$BURRB51.BO": "BURR BROWN I",
-        "$DCMTOYN.BO": "DCM TOYOTA N",
-        "$MODWONC.BO": "MOD.WOOL(CIS",
-        "$PENTFCD.BO": "PENTAF PR-FC",
-        "$PHOEQWA.BO": "PHOENIX-E-W",
-        "$SHENTCH.BO": "SHENTR CHEMI",
-        "$SHRAM89.BO": "SHREE RAM 19",
-        "$THAPA41.BO": "THAPAR ISP-B",
-        "$THAPA42.BO": "THAPAR IS-BP",
-        "$THISP42.BO": "THAPAR ISPAT",
-        "1STCUS.BO": "FIRST CUSTODIAN FUND (INDIA) L",
-        "20MICRONS.BO": "20 MICRONS LTD.",
-        "21STCENMGM.BO": "TWENTYFIRST CENTURY MANAGEMENT",
-        "3MINDIA.BO": "3M INDIA LTD.",
-        "3MINDIA6.BO": "3MINDIA6.BO",
-        "4THGEN.BO": "FOURTH GENERATION INFORMATION",
-        "A2ZMES6.BO": "A2ZMES6.BO",
-        "AAGAMCAP.BO": "AAGAM CAPITAL LTD.",
-        "AANCHALISP.BO": "Aanchal Ispat Limited",
-        "AARCOM.BO": "AAR COMMERCIAL COMPANY LIMITED",
-        "AARYAGLOBL.BO": "AARYA GLOBAL SHARES AND SECURI",
-        "ABACUS.BO": "ABACUS COMPUTERS LTD.",
-        "ABB.BO": "ABB India Limited",
-        "ABB4.BO": "ABB4.BO",
-        "ABBOTINDIA.BO": "ABBOTT INDIA LTD.",
-        "ABCBEARS.BO": "ABC Bearings Ltd.",
-        "ABCINDQ.BO": "ABC India Limited",
-        "ABEEINF.BO": "ABEE INFO-CONSUMABLES LTD.",
-        "ABG.BO": "Starlog Enterprises Limited",
-        "ABGSHIP.BO": "ABG Shipyard Limited",
-        "ABHICAP.BO": "Abhinav Capital Services Ltd",
-        "ABHIFIN.BO": "Abhishek Finlease limited",
-        "ABHISHEK.BO": "ABHISHEK CORPORATION LTD.",
-        "ABIRLANUVO.BO": "ADITYA BIRLA NUVO LTD.",
-        "ABMKNO.BO": "ABM Knowledgeware Limited",
-        "ACC.BO": "ACC Limited",
-        "ACC4.BO": "ACC4.BO",
-        "ACCEL.BO": "Accel Transmatic Ltd.",
-        "ACCELYA.BO": "ACCELYA KALE SOLUTIONS LIMITD",
-        "ACCURATE.BO": "Accurate Transformers Ltd.",
-        "ACEEDU.BO": "ACE EDUTREND LTD.",
-        "ACEMEN.BO": "ACE MEN ENGG WORKS LIMITED",
-        "ACIASIA.BO": "Allied Computers International (Asia) Ltd.",
-        "ACIIN.BO": "ACI Infocom Ltd",
-        "ACME.BO": "Acme Resources Limited",
-        "ACROW.BO": "Acrow India Ltd.",
-        "ACRYSIL.BO": "Acrysil Ltd.",
-        "ADAMCO.BO": "ADAM COMSOF LTD.",
-        "ADANIENT.BO": "ADANI ENTERPRISES LTD.",
-        "ADANITRANS.BO": "Adani Transmission Limited",
-        "ADARSH.BO": "ADARSH MERCANTILE LTD",
-        "ADARSHPL.BO": "Adarsh Plant Protect Ltd.",
-        "ADCC.BO": "ADCC Infocad Limited",
-        "ADCON.BO": "Adcon Capital Services Limited",
-        "ADHARSHILA.BO": "ADHARSHILA CAPITAL SERVICES LI",
-        "ADHUSYN.BO": "ADHUNIK SYNTHETICS LTD.",
-        "ADIEXRE.BO": "Adinath Exim Resources Ltd",
-        "ADIFINCHM.BO": "ADI FINECHEM LTD.",
-        "ADINATHBI.BO": "Adinath Bio-labs Ltd.",
-        "ADIRASA.BO": "Adi Rasayan Limited",
-        "ADITYA.BO": "Aditya Ispat Ltd.",
-        "ADITYAINF.BO": "ADITYA INFO-SOFT LTD.",
-        "ADITYASP.BO": "Aditya Spinners Limited",
-        "ADITYPL.BO": "ADITYPL.BO",
-        "ADORMUL.BO": "Ador Multiproducts Ltd",
-        "ADORWELD.BO": "ADOR WELDING LTD.",
-        "ADSDIAG.BO": "Ahluwalia Contracts (India) Limited",
-        "ADSLBBPH.BO": "ALLIEDDIG*",
-        "ADTYFRG.BO": "Aditya Forge Ltd",
-        "ADVANTA.BO": "Advanta Limited",
-        "ADVENT.BO": "Advent Computer Services Ltd.",
-        "ADVIKLA.BO": "Advik Laboratories Ltd.",
-        "ADVLIFE.BO": "ADVANCE LIFESTYLES LTD.",
-        "ADVNCMIC.BO": "Advanced Micronic Devices Ltd.",
-        "AECENTP.BO": "AEC ENTERPRISES LTD.",
-        "AEGISLOBBPH.BO": "AEGIS LOGIS*",
-        "AEGISLOGBB.BO": "AEGIS LOGIS",
-        "AEL.BO": "Amba Enterprises Ltd.",
-        "AFEL.BO": "A.F. ENTERPRISES LTD",
-        "AFL.BO": "Accel Frontline Limited",
-        "AFTEK.BO": "AFTEK LTD.",
-        "AFTEK6.BO": "AFTEK6.BO",
-        "AGCNET.BO": "AGC NETWORKS LIMITED",
-        "AGIIL.BO": "AGI Infra Limited",
-        "AHLUCONT.BO": "Ahluwalia Contracts (India) Limited",
-        "AHURAWE.BO": "AHURA WELDING ELECTRODE MANUFA",
-        "AIIL.BO": "Authum Investment & Infrastruc",
-        "AIL6.BO": "AIL6.BO",
-        "AIMCOPEST.BO": "AIMCO PESTICIDES LTD.",
-        "AIMLBBPH.BO": "AIML*",
-        "AIPCL.BO": "AIPCL",
-        "AJANTSOY.BO": "Ajanta Soya Limited",
-        "AJBRO.BO": "A.J.BROTHERS LTD.",
-        "AJCON.BO": "Ajcon Global Services Ltd.",
-        "AJEL.BO": "Ajel Limited",
-        "AJWAFUN.BO": "Ajwa Fun World & Resort Ltd",
-        "AKARLAMIN.BO": "AKAR LAMINATORS LTD.",
-        "AKASAGC.BO": "AKASH AGENCIES LTD.",
-        "AKCAPIT.BO": "A. K. Capital Services Limited",
-        "AKSCHEM.BO": "AksharChem India Ltd",
-        "AKSHOPTFBR.BO": "Aksh Optifibre Limited",
-        "AKSPINTEX.BO": "A.K. Spintex Ltd.",
-        "AKZOINDIA.BO": "AKZO NOBEL INDIA LIMITED",
-        "AKZOINDIA6.BO": "AKZOINDIA6.BO",
-        "ALACRIHS.BO": "ALACRITY HOUSING LTD.",
-        "ALANGMR-B.BO": "ALANG MARINE LTD.",
-        "ALANKIT.BO": "ALANKIT",
-        "ALBERTDA.BO": "Albert David Limited",
-        "ALBK6.BO": "ALBK6.BO",
-        "ALCHCORP.BO": "Alchemist Corporation Limited",
-        "ALCHEM.BO": "ALCHEMIST LTD.",
-        "ALEMBICBBPH.BO": "ALEMBIC LTD*",
-        "ALEMBICLTD.BO": "Alembic Ltd.",
-        "ALEXCON.BO": "ALEXCON FOAMCAST LTD.",
-        "ALFAICA.BO": "Alfa ICA (India) Ltd.",
-        "ALFATRAN.BO": "Alfa Transformers Limited",
-        "ALFAVIO.BO": "Alfavision Overseas (India) Limited",
-        "ALFREDHE.BO": "Alfred Herbert India Ltd.",
-        "ALKA.BO": "Alka India Ltd.",
-        "ALKEM.BO": "Alkem Laboratories Limited",
-        "ALLSOFT.BO": "ALLSOFT CORPORATION LTD.",
-        "ALOKTEXT6.BO": "ALOKTEXT6.BO",
-        "ALPA.BO": "Alpa Laboratories Ltd",
-        "ALPGRAPH.BO": "Alpha Graphic India Ltd.",
-        "ALPHAGEO.BO": "Alphageo (India) Limited",
-        "ALPICFIN.BO": "ALPICFIN.BO",
-        "ALPINFN.BO": "ALPINE CAPITAL SERVICES LTD.",
-        "ALPSINFO.BO": "ALPS INFOSYS LTD.",
-        "ALSAMRN-B.BO": "ALSA MARINE & HARVESTS LTD.",
-        "ALUFLUOR.BO": "Alufluoride Ltd",
-        "AMAL.BO": "Amal Ltd",
-        "AMAR.BO": "AMAR REMEDIES LTD.",
-        "AMAR6.BO": "AMAR6.BO",
-        "AMARAJABAT.BO": "AMARA RAJA BATTERIES LTD.",
-        "AMARAJABAT6.BO": "AMARAJABAT6.BO",
-        "AMBALALSA.BO": "Ambalal Sarabhai Enterprises Ltd.",
-        "AMBICAAGAR.BO": "AMBICA AGARBATHIES & AROMA IND",
-        "AMBIT.BO": "Ambitious Plastomac Co. Ltd.",
-        "AMBITION.BO": "Ambition Mica Limited",
-        "AMBJELE.BO": "AMBJELE.BO",
-        "AMCOIND.BO": "Amco India Ltd.",
-        "AMICOMP.BO": "AMI COMPUTERS (I) LTD.",
-        "AMITINT.BO": "Amit International Ltd.",
-        "AMRAFIN.BO": "Amrapali Fincap Limited",
-        "AMRITCORP.BO": "Amrit Corp. Ltd",
-        "AMRUTANJAN.BO": "AMRUTANJAN HEALTH CARE LTD.",
-        "ANANROT.BO": "ANANT ROTOSPIN LTD.",
-        "ANANTRAJ.BO": "Anant Raj Limited",
-        "ANDREWYU.BO": "Andrew Yule & Company Ltd.",
-        "ANGL.BO": "ANGELS ENTERPRISES LTD",
-        "ANILLTD.BO": "ANIL LTD.",
-        "ANISHAIMPEX.BO": "ANISHA IMPEX LTD",
-        "ANJANI.BO": "Anjani Synthetics Ltd.",
-        "ANKIN.BO": "Anka India Ltd",
-        "ANKUSHFI.BO": "Ankush Finstock Ltd.",
-        "ANSALAPI.BO": "ANSAL PROPERTIES & INFRASTRUCT",
-        "ANSALAPI6.BO": "ANSALAPI6.BO",
-        "ANSALBU.BO": "Ansal Buildwell Ltd.",
-        "ANSALHBBPH.BO": "ANSALH*",
-        "ANSHNCO.BO": "Anshuni Commercials Limited",
-        "ANUJEWL.BO": "ANUGRAHA JEWELLERS LTD.",
-        "ANULABS.BO": "Ameya Laboratories Ltd",
-        "ANUPMAL.BO": "ANUP MALLEABLE LTD.",
-        "APCOTEXBBPH.BO": "APCOTEX IND*",
-        "APIS.BO": "APIS INDIA LTD.",
-        "APLAB.BO": "APLAB Ltd.",
-        "APLAPOLLO.BO": "APL APOLLO TUBES LTD.",
-        "APLAYA.BO": "Aplaya Creations Limited",
-        "APOLLOFI.BO": "Apollo Finvest (India) Limited",
-        "APOLLOHOSP4.BO": "APOLLOHOSP4.BO",
-        "APOWERTOOL.BO": "CONSORTEX KARL DOELITZCH (INDI",
-        "APTANN.BO": "ANDHRA PRADESH TANNERIES LTD.",
-        "APTEAML.BO": "APTE AMALGAMATIONS LTD.",
-        "APUNKA.BO": "Apunka Invest Commercial Limit",
-        "AQUA6.BO": "AQUA6.BO",
-        "ARCHIES.BO": "Archies Ltd.",
-        "ARCHIES6.BO": "ARCHIES6.BO",
-        "ARCHITORG.BO": "ARCHIT ORGANOSYS LTD.",
-        "ARFIN.BO": "Arfin India Limited",
-        "ARHNTTO.BO": "ARIHANT TOURNESOL LTD.",
-        "ARIHANT.BO": "ARIHANT FOUNDATIONS & HOUSING",
-        "ARIHANT6.BO": "ARIHANT6.BO",
-        "ARIHANTCOT.BO": "ARIHANTCOT.BO",
-        "ARIHANTRED.BO": "ARIHANT THREADS LTD.",
-        "ARIHCAPM.BO": "Arihant Capital Markets Limited",
-        "ARISINT.BO": "ARIS INTERNATIONAL LTD.",
-        "ARLABS.BO": "ARLABS.BO",
-        "ARNAVCORP.BO": "ARNAV CORPORATION LTD.",
-        "ARNMNTX.BO": "ARNMNTX.BO",
-        "ARNPROC.BO": "ARUN PROCESSORS LTD.",
-        "AROCSIL.BO": "AROCHEM SILVASSA LTD.",
-        "AROGRANBBPH.BO": "ARO GRANITE*",
-        "AROMAENT.BO": "AROMA ENTERPRISES (INDIA) LTD.",
-        "ARONICOMM.BO": "Aroni Commercials Limited",
-        "ARORAFIB.BO": "Arora Fibres",
-        "ARSHIYA.BO": "Arshiya Ltd",
-        "ARSPP.BO": "ARCHANA S PP",
-        "ARTIBIOIN.BO": "ARTILLEGENCE BIO-INNOVATIONS L",
-        "ARUMUGA.BO": "SRI ARUMUGA ENTERPRISE LIMITED",
-        "ARUNODAY.BO": "ARUNODAY MILLS LTD.",
-        "ARVIND.BO": "Arvind Limited",
-        "ARVINDIN.BO": "Arvind International Ltd.",
-        "ARVINDREM.BO": "Arvind Remedies Ltd",
-        "ARVRTRI.BO": "AVTIL ENTERPRISE LTD",
-        "ARYACAPM.BO": "Aryaman Capital Markets Limite",
-        "ASAHIINDIA6.BO": "ASAHIINDIA6.BO",
-        "ASAHISONG.BO": "ASAHI SONGWON COLORS LTD.",
-        "ASBUSIN.BO": "ASBUSIN.BO",
-        "ASCENTEX.BO": "ASCENT EXIM (INDIA) LTD.",
-        "ASEEMG.BO": "ASEEM GLOBAL LTD.",
-        "ASFLORA.BO": "ASIAN FLORA LTD.",
-        "ASHAPURMIN.BO": "ASHAPURA MINECHEM LTD.",
-        "ASHCAP.BO": "Ashirwad Capital Limited",
-        "ASHIANA.BO": "ASHIANA HOUSING LTD.",
-        "ASHIMASYN.BO": "ASHIMA LTD.",
-        "ASHIS.BO": "Ashiana Ispat Ltd",
-        "ASHISHPO.BO": "Ashish Polyplast Ltd",
-        "ASHOKA.BO": "ASHOKA BUILDCON LTD.",
-        "ASHOKALC.BO": "Ashok Alco-Chem Ltd",
-        "ASHOKLEY.BO": "Ashok Leyland Limited",
-        "ASHOKLEY4.BO": "ASHOKLEY4.BO",
-        "ASHOKRE.BO": "Ashoka Refineries Limited",
-        "ASHRAM.BO": "Ashram Online.com Ltd.",
-        "ASHUTPM.BO": "Tridev InfraEstates Ltd",
-        "ASIACAP.BO": "ASIA CAPITAL LIMITED",
-        "ASIANBRG.BO": "ASIAN BEARINGS LTD.",
-        "ASIANTILES.BO": "Asian Granito India Limited",
-        "ASIAPAK.BO": "ASIA PACK LTD.",
-        "ASL.BO": "ARIHANT SUPERSTRUCTURES LIMITE",
-        "ASSAMBR.BO": "ASSAMBROOK LTD.",
-        "ASSAMCO.BO": "Assam Company India Ltd",
-        "ASSMRMO.BO": "ASSOCIATED MARMO & GRANITES LT",
-        "ASTAR.BO": "Asian Star Company Limited",
-        "ASTEC.BO": "Astec LifeSciences Limited",
-        "ASTRAMICRO.BO": "ASTRA MICROWAVE PRODUCTS LTD.",
-        "ASUTENT.BO": "ASUTOSH ENTERPRISES LTD.",
-        "ASYAINFO.BO": "ASYA INFOSOFT LIMITED",
-        "ATHARVENT.BO": "Atharv Enterprises Limited",
-        "ATISHAY.BO": "Atishay Limited",
-        "ATLANTA.BO": "Atlanta Ltd.",
-        "ATLANTADEV.BO": "ATLANTA DEVCON LIMITED",
-        "ATLANTSP.BO": "ATLANTSP.BO",
-        "ATLASCYCLE.BO": "ATLAS CYCLES (HARYANA) LTD.",
-        "ATNINTER.BO": "ATN INTERNATIONAL LTD.",
-        "ATUL.BO": "ATUL LTD.",
-        "ATWL.BO": "ACE TOURS WORLDWIDE LTD",
-        "AUNDEIND.BO": "AUNDE INDIA LIMITED",
-        "AURIONPRO.BO": "aurionPro Solutions Limited",
-        "AUROCOK.BO": "Auroma Coke Ltd.",
-        "AUROLAB.BO": "Auro Laboratories Ltd.",
-        "AUSOMENT.BO": "Ausom Enterprise Ltd",
-        "AUSTENGBBPH.BO": "AUSTIN ENGG*",
-        "AVANTBBPH.BO": "AVANTEL*",
-        "AVANTEBBPH.BO": "AVANTE LTD*",
-        "AVANTEL.BO": "Avantel Ltd",
-        "AVANTI.BO": "AVANTI FEEDS LTD.",
-        "AVIPHOT.BO": "AVI Photochem Ltd",
-        "AVONCORP.BO": "Avon Corporation Ltd",
-        "AVONLIFE.BO": "Avon Lifesciences Limited",
-        "AVONMERC.BO": "AVON MERCANTILE LTD.",
-        "AVONORG.BO": "Avon Lifesciences Limited",
-        "AVTNPL.BO": "AVT Natural Products Limited",
-        "AXISCADES.BO": "AXISCADES",
-        "AXISCAP.BO": "Elixir Capital Limited",
-        "AXISGOLD.BO": "AXIS MUTUAL FUND - AXIS GOLD E",
-        "AXONFIN.BO": "AXONFIN.BO",
-        "AYMSYNTEX.BO": "AYM Syntex Limited",
-        "AYOME.BO": "AYOKI MERCANTILE LTD.",
-        "AYPLAMI.BO": "AYEPEE LAMITUBES LTD.",
-        "AZUREEXIM.BO": "AZURE EXIM SERVICES LTD.",
-        "BABA.BO": "Baba Arts Ltd.",
-        "BAGADIA.BO": "Bagadia Colourchem Ltd.",
-        "BAGALKOT.BO": "BAGALKOT UDYOG LTD.",
-        "BAJAJCORP.BO": "Bajaj Corp Limited",
-        "BAJAJFINSV.BO": "BAJAJ FINSERV LTD.",
-        "BAJAJHLDNG.BO": "BAJAJ HOLDINGS & INVESTMENT LT",
-        "BAJGLOB.BO": "BAJAJ GLOBAL LTD.",
-        "BALAMINES.BO": "BALAJI AMINES LTD.",
-        "BALJHOT.BO": "BALJ HOT ENT",
-        "BALLARPUR6.BO": "BALLARPUR6.BO",
-        "BALMLAWRIE.BO": "BALMER LAWRIE & CO.LTD.",
-        "BALRAMCHIN.BO": "Balrampur Chini Mills Limited",
-        "BALRAMCHIN6.BO": "BALRAMCHIN6.BO",
-        "BANARBEADS.BO": "BANARAS BEADS LTD.",
-        "BANCOINDIA.BO": "BANCO PRODUCTS (INDIA) LTD.",
-        "BANG.BO": "Bang Overseas Ltd.",
-        "BANSWRAS.BO": "Banswara Syntex Ltd.",
-        "BARODARY.BO": "BARODA RAYON CORPORATION LTD.",
-        "BAROEXT.BO": "BARODA EXTRUSION LTD.",
-        "BARTRONICS.BO": "Bartronics India Limited",
-        "BASF.BO": "BASF India Limited",
-        "BASF6.BO": "BASF6.BO",
-        "BATAINDIA.BO": "BATA INDIA LTD.",
-        "BATAINDIA4.BO": "BATAINDIA4.BO",
-        "BATLIBOI.BO": "Batliboi Ltd.",
-        "BAYERCROP.BO": "BAYER CROPSCIENCE LTD.",
-        "BAYERCROP6.BO": "BAYERCROP6.BO",
-        "BBL.BO": "Bharat Bijlee Limited",
-        "BCBFL.BO": "PYXIS FINVEST LIMITED",
-        "BCCFIN.BO": "Hemang Resources Limited",
-        "BCCFUBA.BO": "Bcc Fuba India Ltd",
-        "BCLENTERPR.BO": "BCL Enterprises Limited",
-        "BCLFRG---.BO": "BCL FORGINGS LTD.",
-        "BCMLBBPH.BO": "BALRAMCHIN*",
-        "BCPAL.BO": "BIRDHI CHAND PANNALAL AGENCIES",
-        "BEARDSELL.BO": "BEARDSELL LIMITED",
-        "BECREL.BO": "BEST & CROMPTON ENGG.LTD.",
-        "BEEYU.BO": "Beeyu Overseas Ltd.",
-        "BELLGRP.BO": "GRAPHIC CHARTS LTD.",
-        "BEMHY.BO": "Bemco Hydraulics Ltd.",
-        "BEML.BO": "BEML Limited",
-        "BENGALASM.BO": "Bengal & Assam Company Ltd.",
-        "BENTCOM.BO": "BENTLEY COMMERCIAL ENTERPRISES",
-        "BENZOCH.BO": "Benzo Petro International Ltd.",
-        "BESCOLT.BO": "BESCO LTD.",
-        "BETACOR.BO": "BETA CORPORATION LTD.",
-        "BETXIND.BO": "BETEX INDIA LTD.",
-        "BHAGWOX.BO": "BHAGWATI OXYGEN LTD.",
-        "BHAGYINBBPH.BO": "BHAGYA INL*",
-        "BHAGYNAGAR.BO": "BHAGYANAGAR INDIA LTD.",
-        "BHANDERI.BO": "BHANDERI INFRACON LTD",
-        "BHARATFORG.BO": "Bharat Forge Limited",
-        "BHARATGEAR.BO": "BHARAT GEARS LTD.",
-        "BHARATIDIL.BO": "Bharati Defence and Infrastruc",
-        "BHARATRAS.BO": "BHARAT RASAYAN LTD.",
-        "BHARATSE.BO": "Bharat Seats Ltd.",
-        "BHARATWIRE.BO": "Bharat Wire Ropes Limited",
-        "BHARLIN.BO": "BHARAT LINE LTD.",
-        "BHARTIARTL.BO": "Bharti Airtel Limited",
-        "BHARTIARTL6.BO": "BHARTIARTL6.BO",
-        "BHARTISHIP.BO": "BHARTISHIP.BO",
-        "BHEL6.BO": "BHEL6.BO",
-        "BHILSPIN.BO": "Bhilwara Spinners Ltd.",
-        "BHILTEX.BO": "Bhilwara Tex-Fin Ltd.",
-        "BHUSANSTL6.BO": "BHUSANSTL6.BO",
-        "BI.BO": "Bilcare Ltd.",
-        "BIBCL.BO": "Bharat Immunologicals & Biologicals Corp. Ltd.",
-        "BIHRFOC.BO": "BIHAR FOUNDRY & CASTINGS LTD.",
-        "BIJHANS.BO": "BIJOY HANS LTD.",
-        "BIL.BO": "Bhartiya International Ltd.",
-        "BILATOR.BO": "BILATI (ORISSA) LTD.",
-        "BILCARE6.BO": "BILCARE6.BO",
-        "BILCONTI.BO": "BILCONTI.BO",
-        "BILINDS.BO": "BHUPENDRAIND",
-        "BINASYN.BO": "BINACA SYNTHETIC RESINS LTD.",
-        "BINNY.BO": "Binny Limited",
-        "BINNYMILLS.BO": "BINNY MILLS LTD.",
-        "BIOCON.BO": "Biocon Limited",
-        "BIOPAC.BO": "Biopac India Corp. Ltd.",
-        "BIOWIN.BO": "BIOWIN.BO",
-        "BIRLACORPN.BO": "BIRLA CORPORATION LTD.",
-        "BIRLACOT.BO": "Birla Cotsyn (India) Limited",
-        "BIRLAMONEY.BO": "ADITYA BIRLA MONEY LTD.",
-        "BIRLAPAC.BO": "BIRLA PACIFIC MEDSPA LTD.",
-        "BIRLATR.BO": "Birla Transasia Carpets Limited",
-        "BISIL.BO": "Bisil Plast Limited",
-        "BITS.BO": "Bits Ltd.",
-        "BJDUP.BO": "B.J.DUPLEX BOARDS LTD.",
-        "BKDUPLEX.BO": "B.K.DUPLEX BOARD LTD.",
-        "BLAZONMRB.BO": "BLAZON MARBLES LIMITED",
-        "BLBLEND.BO": "BLUE BLENDS",
-        "BLBLIMITED.BO": "BLB LTD.",
-        "BLBLNDS.BO": "BLUE BLENDS",
-        "BLCISER.BO": "BLUE CIRCLE SERVICES LTD.",
-        "BLCISER6.BO": "BLCISER6.BO",
-        "BLEBLNI.BO": "BLUBLEND IND",
-        "BLKASHYAP.BO": "B L Kashyap & Sons Limited",
-        "BLOOM.BO": "Bloom Dekor Limited",
-        "BLUBLND-B.BO": "Blue Blends (India) Ltd.",
-        "BLUCHIP.BO": "Bluechip Stockspin Ltd.",
-        "BLUEBIRD.BO": "BLUE BIRD (INDIA) LTD.",
-        "BLUECHIP.BO": "BLUE CHIP INDIA LTD.",
-        "BLUEDART.BO": "Blue Dart Express Ltd.",
-        "BLUEDART6.BO": "BLUEDART6.BO",
-        "BLUESTARCO.BO": "BLUE STAR LTD.",
-        "BLUESTARCO6.BO": "BLUESTARCO6.BO",
-        "BMBMUMG.BO": "BMB Music & Magnetics Limited",
-        "BNALTD.BO": "B&A Ltd.",
-        "BNANJEN.BO": "B.nanji Enterprises Ltd",
-        "BNKCAP.BO": "BNK Capital Markets Ltd.",
-        "BNL.BO": "Beekay Niryat Limited",
-        "BNRUDY.BO": "BNR Udyog Ltd.",
-        "BOBSHELL.BO": "BOBSHELL ELECTRODES LTD.",
-        "BOMBPOT.BO": "BOMBAY POTTERIES & TILES LTD.",
-        "BOMBWIR.BO": "BOMBAY WIRE ROPES LTD.",
-        "BOMOXY-B1.BO": "Bombay Oxygen Corporation Limited",
-        "BORAX.BO": "Borax Morarji Limited",
-        "BOROSILBBPH.BO": "BOROSIL*",
-        "BOSCHBBPH.BO": "BOSCH LTD*",
-        "BOSCHLTD.BO": "BOSCH LTD.",
-        "BOSCHLTD4.BO": "BOSCHLTD4.BO",
-        "BOSTONTEK.BO": "BOSTON TEKNOWSYS (INDIA) LTD",
-        "BPCAP.BO": "B. P. CAPITAL LTD",
-        "BPL.BO": "BPL Limited",
-        "BPTEX.BO": "BLUE PEARL TEXSPIN LIMITED",
-        "BRAHMANAN.BO": "Brahmanand Himghar Ltd.",
-        "BRANDHOUSE6.BO": "BRANDHOUSE6.BO",
-        "BRFL6.BO": "BRFL6.BO",
-        "BRIGADE.BO": "Brigade Enterprises Ltd.",
-        "BRIGHTBR.BO": "Bright Brothers Limited",
-        "BRITANNIA6.BO": "BRITANNIA6.BO",
-        "BRITBRBBPH.BO": "BRIGHT BRO*",
-        "BROADCAST.BO": "Broadcast Initiatives Ltd.",
-        "BROOKS.BO": "BROOKS LABORATORIES LTD.",
-        "BRPL.BO": "BANSAL ROOFING PRODUCTS LTD",
-        "BRUSHMAN.BO": "Brushman (India) Limited",
-        "BSILTD.BO": "BSI LTD.",
-        "BSL.BO": "BSL Limited",
-        "BSLFEFS1DG.BO": "BIRLA SUN LIFE MUTUAL FUND - B",
-        "BSLFEFS1DN.BO": "BIRLA SUN LIFE MUTUAL FUND - B",
-        "BSLFEFS1RG.BO": "BIRLA SUN LIFE MUTUAL FUND- BI",
-        "BSLFEFS1RN.BO": "BIRLA SUN LIFE MUTUAL FUND- BI",
-        "BSLFEFS2DG.BO": "BIRLA SUN LIFE MUTUAL FUND- B",
-        "BSLFEFS2DN.BO": "BIRLA SUN LIFE MUTUAL FUND- B",
-        "BSLFEFS2RG.BO": "BIRLA SUN LIFE MUTUAL FUND- BI",
-        "BSLFEFS2RN.BO": "BIRLA SUN LIFE MUTUAL FUND- BI",
-        "BSLFEFS3DG.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS3DN.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS3RG.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS3RN.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS4DG.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS4DN.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS4RG.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS4RN.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS5DG.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS5DN.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS5RG.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS5RN.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS6DG.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS6DN.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS6RG.BO": "Birla Sun Life Mutual Fund",
-        "BSLFEFS6RN.BO": "Birla Sun Life Mutual Fund",
-        "BSLGOLDETF.BO": "BIRLA SUN LIFE MUTUAL FUND - B",
-        "BSLIMITED.BO": "BS LTD.",
-        "BUDGEBUDGE.BO": "BUDGE BUDGE COMPANY LIMITED",
-        "BUTTERFLY.BO": "BUTTERFLY GANDHIMATHI APPLIANC",
-        "BWLLTD.BO": "BWL LTD.",
-        "CADILAHC6.BO": "CADILAHC6.BO",
-        "CAIRN.BO": "Cairn India Limited",
-        "CAIRN4.BO": "CAIRN4.BO",
-        "CAIRNBBPH.BO": "CAIRN*",
-        "CALCOM.BO": "Calcom Visions Ltd.",
-        "CALSREF.BO": "Cals Refineries Limited",
-        "CAMEXLTD.BO": "Camex Ltd.",
-        "CAMLINFIN.BO": "CAMLIN FINE SCIENCES LTD.",
-        "CAMPHOR.BO": "Camphor & Allied Products Ltd.",
-        "CANFINHOME.BO": "Can Fin Homes Ltd.",
-        "CAPF.BO": "CAPITAL FIRST LTD.",
-        "CAPFIN.BO": "Capfin India Limited",
-        "CAPITALT.BO": "Capital Trust Ltd.",
-        "CAPPIPES.BO": "Captain Pipes Limited",
-        "CAPPL.BO": "Caplin Point Laboratories Ltd",
-        "CAPRIHANS.BO": "CAPRIHANS INDIA LTD.",
-        "CARBORUNIV.BO": "Carborundum Universal Limited",
-        "CARBORUNIV6.BO": "CARBORUNIV6.BO",
-        "CAREERP.BO": "CAREER POINT LTD.",
-        "CARERATING.BO": "CARE Ratings Limited",
-        "CAREWELL.BO": "CAREWELL.BO",
-        "CARONA.BO": "CARONA LTD.",
-        "CASTROLIND.BO": "CASTROL INDIA LTD.",
-        "CCL.BO": "CCL PRODUCTS (INDIA) LTD.",
-        "CCLINTER.BO": "CCL International Limited",
-        "CDRHLTH.BO": "CDR HEALTH CARE LTD.",
-        "CEATFIN.BO": "CEATFIN.BO",
-        "CEATLTD.BO": "CEAT LTD.",
-        "CEBBCO.BO": "COMMERCIAL ENGINEERS & BODY BU",
-        "CELESTIAL.BO": "Celestial Biolabs Ltd.",
-        "CELUPRO.BO": "CELLULOSE PRODUCTS OF INDIA LT",
-        "CENTENKA.BO": "Century Enka Ltd.",
-        "CENTEXT.BO": "CENTURY EXTRUSIONS LTD.",
-        "CENTPROV.BO": "The Central Provinces Railways Company Limited",
-        "CENTRUM.BO": "Centrum Capital Limited",
-        "CENTURYPLY.BO": "CENTURY PLYBOARDS (I) LTD.",
-        "CERA.BO": "CERA SANITARYWARE LTD.",
-        "CESC.BO": "CESC Limited",
-        "CESC4.BO": "CESC4.BO",
-        "CESL.BO": "CES LIMITED",
-        "CGCL.BO": "CAPRI GLOBAL CAPITAL LIMITED",
-        "CGIMPEX.BO": "C.G.IMPEX LTD.",
-        "CHABRASP.BO": "CHHABRA SPINNERS LTD.",
-        "CHAININ.BO": "CHAIN IMPEX LTD.",
-        "CHAMPFIN.BO": "CHAMPION FINSEC LTD.",
-        "CHANDRAP.BO": "Chandra Prabhu International Ltd.",
-        "CHBRE51.BO": "CHAM BR DIST",
-        "CHEMFALKAL.BO": "CHEMFAB ALKALIS LTD.",
-        "CHEMIESYNT.BO": "Chemiesynth (Vapi) Limited",
-        "CHEMXSC.BO": "CHEMXSC.BO",
-        "CHENNPETRO6.BO": "CHENNPETRO6.BO",
-        "CHETAKS.BO": "CHETAK SPINTEX LTD.",
-        "CHEVIOT.BO": "Cheviot Co. Ltd.",
-        "CHISEL.BO": "CHISEL & HAMMER (MOBEL) LIMITE",
-        "CHITRTX.BO": "Chitradurga Spintex Limited",
-        "CHLLTD.BO": "CHL Ltd.",
-        "CHMBBRW.BO": "Chambal Breweries & Distilleries Ltd",
-        "CHOICEIN.BO": "Choice International Limited",
-        "CHOKGLB.BO": "CHOKHANI GLOBAL EXPRESS LTD.",
-        "CHOKINT.BO": "CHOKHANI INTERNATIONAL LTD.",
-        "CHOKSI.BO": "Choksi Imaging Ltd.",
-        "CHOKSILA.BO": "Choksi Laboratories Ltd",
-        "CHOKSITUQ.BO": "CHOKSI TUBE CO.LTD.",
-        "CHOLAFIN.BO": "CHOLAMANDALAM INVESTMENT AND F",
-        "CHROMATIC.BO": "CHROMATIC INDIA LTD.",
-        "CIL.BO": "Citizen Infoline Ltd.",
-        "CIMMCO.BO": "Cimmco Ltd",
-        "CINELINE.BO": "CINELINE INDIA LIMITED",
-        "CINEVISTA.BO": "CINEVISTA LTD.",
-        "CIPLA.BO": "Cipla Limited",
-        "CIPLA6.BO": "CIPLA6.BO",
-        "CISTRO.BO": "Cistro Telelink Ltd",
-        "CITL.BO": "Consecutive Investments & Trad",
-        "CITYLIF.BO": "CITY LIFTS (INDIA) LTD.",
-        "CITYMAN.BO": "Cityman Ltd",
-        "CITYONLINE.BO": "City Online Services Limited",
-        "CJGEL.BO": "C.J. Gelatine Products Ltd.",
-        "CLARICH.BO": "CLARICH.BO",
-        "CLARIND.BO": "CLARO INDIA LTD.",
-        "CLARIS.BO": "CLARIS LIFESCIENCES LTD.",
-        "CLASPRS.BO": "CLASSIC PRESS (INTERNATIONAL)",
-        "CLLIMITED.BO": "Crescent Leasing Limited",
-        "CMAHENDRA6.BO": "CMAHENDRA6.BO",
-        "CMC.BO": "CMC Limited",
-        "CMI.BO": "CMI Limited",
-        "CMIFPE.BO": "CMI FPE Ltd",
-        "CML.BO": "CREATIVE MERCHANTS LTD",
-        "CMMQ.BO": "CMM BROADCASTING NETWORK LTD.",
-        "CNIRESLTD.BO": "CNI Research Ltd",
-        "CNSDSECBBPH.BO": "CONSOL SEC*",
-        "COARO.BO": "Coastal Roadways Limited",
-        "COASTCORP.BO": "COASTAL CORPORATION LTD.",
-        "COCHINM.BO": "Cochin Minerals & Rutile Ltd.",
-        "COCHMAL.BO": "COCHIN MALABAR ESTATES & INDUS",
-        "COLINZ.BO": "Colinz Laboratories Ltd.",
-        "COLPAL.BO": "COLGATE-PALMOLIVE (INDIA) LTD.",
-        "COLPAL4.BO": "COLGATE-PALMOLIVE (INDIA) LTD",
-        "COMCL.BO": "COMFORT COMMOTRADE LTD.",
-        "COMDI.BO": "CDI International Limited",
-        "COMFINCAP.BO": "COMFORT FINCAP LTD.",
-        "COMPSKIL.BO": "COMPUTERSKILL LTD.",
-        "COMPUAGE.BO": "Compuage Infocom Ltd.",
-        "COMPUPN.BO": "Computer Point Ltd.",
-        "CONART.BO": "Conart Engineers Limited",
-        "CONCOR.BO": "Container Corporation of India Ltd.",
-        "CONCOR4.BO": "CONCOR4.BO",
-        "CONCURINF.BO": "CONCURRENT (INDIA) INFRASTRUCT",
-        "CONEQUE.BO": "CONDEQUIP ENGINEERS (INDIA) LT",
-        "CONTICON.BO": "Continental Controls Ltd.",
-        "CONTILI.BO": "Contil India Ltd",
-        "CONTROLPR.BO": "Control Print Ltd",
-        "CORAL-HUB.BO": "CORAL HUB LIMITED",
-        "CORALAB.BO": "Coral Laboratories Limited",
-        "COROMANDEL.BO": "COROMANDEL INTERNATIONAL LTD.",
-        "COSCO.BO": "Cosco (India) Limited",
-        "COSMOFE.BO": "Cosmo Ferrites Limited",
-        "COUNCODOS.BO": "Country Condo'S Limited",
-        "COVIDH.BO": "COVIDH",
-        "COX&KINGS.BO": "COX & KINGS LIMITED",
-        "CPECLTD.BO": "CPEC LTD.",
-        "CPL.BO": "CAPTAIN POLYPLAST LTD",
-        "CPSEETF.BO": "CPSE ETF",
-        "CRANESSOFT6.BO": "CRANESSOFT6.BO",
-        "CRANEX.BO": "Cranex Limited",
-        "CRAVATEX.BO": "Cravatex Limited",
-        "CRBARIH.BO": "ARIHANT MANGAL GROWTH SCHEME-C",
-        "CRBSHAR.BO": "CRB SHARE CUSTODIAN SERVICES L",
-        "CRDFINL.BO": "CREDENTI FIN",
-        "CREATIVE.BO": "Creative Eye Ltd.",
-        "CREATIVEYE.BO": "CREATIVE EYE LTD.",
-        "CREDENCE.BO": "CREDENCE SOUND & VISION LTD.",
-        "CRESSAN.BO": "Cressanda Solutions Ltd.",
-        "CREST.BO": "CREST",
-        "CRESTANI.BO": "Crest Animation Studios Limited",
-        "CREWBOS.BO": "Crew B.O.S. Products Limited",
-        "CREWBOS6.BO": "CREWBOS6.BO",
-        "CRISIL.BO": "CRISIL Limited",
-        "CRISIL6.BO": "CRISIL6.BO",
-        "CRISILBBPH.BO": "CRISIL*",
-        "CRMFGETF.BO": "CANARA ROBECO MUTUAL FUND - CA",
-        "CROMAKM.BO": "CROMAKEM LTD.",
-        "CROMPGREAV6.BO": "CROMPGREAV6.BO",
-        "CROMPTBBPH.BO": "CROMPTONGRE*",
-        "CROWNTOURS.BO": "CROWN TOURS LTD",
-        "CRSTCHM.BO": "Crestchem Limited",
-        "CSSTECH.BO": "COSYN Limited",
-        "CSURGSU.BO": "Centenial Surgical Suture, Ltd.",
-        "CTIL.BO": "CTIL LTD.",
-        "CTL.BO": "CAPITAL TRADE LINKS LTD",
-        "CUB6.BO": "CUB6.BO",
-        "CUBEXTUB.BO": "CUBEX TUBINGS LTD.",
-        "CUMMINSIND.BO": "CUMMINS INDIA LTD.",
-        "CUPID.BO": "Cupid Ltd.",
-        "CURESPEC.BO": "CURE SPECTS LASERS LTD.",
-        "CVILINFRA.BO": "CVIL INFRA LTD.",
-        "CYBERMAT.BO": "CybermateInfotek Limited",
-        "CYBERSPACE.BO": "CYBERSPACE INFOSYS LTD.",
-        "CYIENT.BO": "CYIENT LIMITED",
-        "D3YRCEEDDP.BO": "DSP BlackRock Mutual Fund",
-        "D3YRCEEDG.BO": "DSP BlackRock Mutual Fund",
-        "D3YRCEERDP.BO": "DSP BlackRock Mutual Fund",
-        "D3YRCEERG.BO": "DSP BlackRock Mutual Fund",
-        "DABUR.BO": "Dabur India Ltd.",
-        "DAICHI.BO": "Dai-Ichi Karkaria Limited",
-        "DAICHIBBPH.BO": "DAI ICH KAR*",
-        "DAL.BO": "dynamic Archistructures Limite",
-        "DALMIABHA.BO": "DALMIA BHARAT LTD.",
-        "DARJEELING.BO": "Darjeeling Ropeway Company Lim",
-        "DATAMATICS.BO": "DATAMATICS GLOBAL SERVICES LTD",
-        "DATARSW-B.BO": "DATAR SWITCHGEAR LTD.",
-        "DAZZEL.BO": "Dazzel Confindive Ltd.",
-        "DBCORP.BO": "D. B. Corp Limited",
-        "DBSTOCKBRO.BO": "DB (INTERNATIONAL) STOCK BROKE",
-        "DCHL6.BO": "DCHL6.BO",
-        "DCHLBBPH.BO": "DECCAN CHR*",
-        "DCM.BO": "DCM Ltd.",
-        "DCMSHRIRAM.BO": "DCM SHRIRAM LIMITED",
-        "DCMSLBBPH.BO": "DCMSL*",
-        "DCW.BO": "DCW Limited",
-        "DECANBRG.BO": "Deccan Bearings Ltd",
-        "DECNGOLD.BO": "Deccan Gold Mines Ltd",
-        "DECOMIC.BO": "Deco-Mica Limited",
-        "DECPO.BO": "Deccan Polypacks Ltd.",
-        "DEEPAKFERT6.BO": "DEEPAKFERT6.BO",
-        "DEEPAKNI.BO": "Deepak Nitrite Ltd.",
-        "DEEPAKSP.BO": "Deepak Spinners Limited",
-        "DELTACORP.BO": "Delta Corp Limited",
-        "DELTAMAGNT.BO": "DELTA MAGNETS LTD.",
-        "DELTAPO.BO": "DELTA POLYSTERS LTD.",
-        "DELTRON.BO": "Deltron Ltd.",
-        "DEN.BO": "DEN Networks Limited",
-        "DEN6.BO": "DEN6.BO",
-        "DENISCHEM.BO": "DENIS CHEM LAB LTD",
-        "DENORA.BO": "De Nora India Limited",
-        "DERPC.BO": "Mitshi India Limited",
-        "DESHRAK.BO": "Desh Rakshak Aushdhalaya Limited",
-        "DEVFA.BO": "DEV FASTENERS LTD.",
-        "DEVIKA.BO": "Dharti Proteins Ltd",
-        "DEVINE.BO": "Devine Impex Limited",
-        "DHABRIYA.BO": "Dhabriya Polywood Limited",
-        "DHANADACO.BO": "DHANADA CORPORATION LTD.",
-        "DHANCOT.BO": "Dhanlaxmi Cotex Ltd.",
-        "DHANLEELA.BO": "DHANLEELA INVESTMENTS & TRADIN",
-        "DHANROTO.BO": "Dhanalaxmi Roto Spinners Ltd",
-        "DHANUKACOM.BO": "DHANUKA COMMERCIAL LTD",
-        "DHENUBUILD.BO": "DHENU BUILDCON INFRA LTD.",
-        "DHINDIA.BO": "D&H INDIA LTD",
-        "DHPIND.BO": "DHP India Ltd",
-        "DHRUVCA.BO": "Dhruva Capital Services Ltd.",
-        "DHRUVES.BO": "Dhruv Estates Ltd.",
-        "DHTUFRG.BO": "DHATU FORGE LTD.",
-        "DHYANAFIN.BO": "DHYANA FINSTOCK LTD",
-        "DICIND.BO": "DIC INDIA LTD.",
-        "DIGJAM.BO": "Digjam Ltd",
-        "DIL.BO": "Dil Ltd.",
-        "DION.BO": "DION GLOBAL SOLUTIONS LTD.",
-        "DISAQ.BO": "Disa India Ltd",
-        "DITCO.BO": "Decorous Investment and Tradin",
-        "DIVISLAB.BO": "Divi's Laboratories Limited",
-        "DIVISLAB4.BO": "DIVISLAB4.BO",
-        "DIVSHKT.BO": "Divyashakti Granites Ltd.",
-        "DJSSS.BO": "Djs Stock & Shares Ltd",
-        "DLF.BO": "DLF Limited",
-        "DLF4.BO": "DLF4.BO",
-        "DLINKINDIA.BO": "D-LINK (INDIA) LTD",
-        "DOONVAL.BO": "DOON VALLEY RICE LTD.",
-        "DOTCOM.BO": "DOT COM GLOBAL LTD.",
-        "DOWELWE.BO": "DOWELLS ELEKTRO WERKE LTD.",
-        "DPL.BO": "DPL",
-        "DRDATSONS.BO": "DR.DATSONS LABS LIMITED",
-        "DREDGECORP.BO": "DREDGING CORPORATION OF INDIA",
-        "DRREDDY.BO": "Dr. Reddy's Laboratories Ltd.",
-        "DRSABHP.BO": "DR. SABHARWALS MFG. LABS. LTD",
-        "DSKULKARNI6.BO": "DSKULKARNI6.BO",
-        "DUCTA.BO": "DUCK TARPAULINS LTD.",
-        "DUJOHN.BO": "DUJOHN LABORATORIES LTD.",
-        "DUNE.BO": "Dune Mercantile Ltd.",
-        "DUNLOP-B1.BO": "DUNLOP India Ltd.",
-        "DUROPACK.BO": "Duro Pack Limited",
-        "DYNAVSN.BO": "Dynavision Ltd.",
-        "DYNMICR.BO": "DYNAMIC MICROSTEPPERS LTD.",
-        "DYNPRO.BO": "Dynemic Products Limited",
-        "EASTRED.BO": "Eastern Treads Ltd.",
-        "EASUNREYRL.BO": "EASUN REYROLLE LTD.",
-        "ECLERX.BO": "eClerx Services Limited",
-        "ECLERX6.BO": "ECLERX6.BO",
-        "ECLERXBBPH.BO": "ECLERX*",
-        "ECOPLAST.BO": "Ecoplast Limited",
-        "ECORECO.BO": "ECO RECYCLING LTD.",
-        "EDDYCUR.BO": "EDDY CURRENT CONTROLS (I) LTD.",
-        "EDL.BO": "Empee Distilleries Limited",
-        "EDSL.BO": "EDYNAMICS SOLUTIONS LTD.",
-        "EDUCOMP.BO": "Educomp Solutions Limited",
-        "EDUEXEL.BO": "EDUEXEL INFOTAINMENT LIMITED",
-        "EICHERMOT6.BO": "EICHERMOT6.BO",
-        "EIDPARRY.BO": "E.I.D.- Parry (India) Limited",
-        "EIDPARRY6.BO": "EIDPARRY6.BO",
-        "EIHOTEL.BO": "EIH LTD.",
-        "EIMCOELECO.BO": "EIMCO ELECON (INDIA) LTD.",
-        "EKC.BO": "Everest Kanto Cylinder Limited",
-        "ELANTAS.BO": "ELANTAS Beck India Limited",
-        "ELBEE.BO": "ELBEE SERVICES LTD.",
-        "ELCONFN.BO": "ELCONFN.BO",
-        "ELDERHCL.BO": "Elder Health Care Limited",
-        "ELDERPHARM6.BO": "ELDERPHARM6.BO",
-        "ELECTCAST6.BO": "ELECTCAST6.BO",
-        "ELECTHERM.BO": "ELECTROTHERM (INDIA) LTD.",
-        "ELEXT.BO": "ELECTREX (INDIA) LTD.",
-        "ELFORGE.BO": "El Forge Ltd.",
-        "ELIXIR.BO": "Elixir Capital Limited",
-        "ELPROINTL.BO": "ELPRO INTERNATIONAL LTD.",
-        "ELQPO.BO": "ELQUE POLYESTERS LTD.",
-        "ELTROL.BO": "ELTROL LTD.",
-        "EMAINDIA.BO": "EMA India Ltd.",
-        "EMAMILTD.BO": "EMAMI LTD.",
-        "EMCO.BO": "EMCO Limited",
-        "EMERGY.BO": "EMERGY PHAARMA LTD.",
-        "EMKAR.BO": "EMKAY AROMATICS LTD.",
-        "EMMSONS.BO": "Emmsons International Limited",
-        "EMPHOTR.BO": "EMPHOTR.BO",
-        "ENGINERSIN.BO": "ENGINEERS INDIA LTD.",
-        "ENGINERSIN6.BO": "ENGINERSIN6.BO",
-        "ENJNATF.BO": "ENJAYES NATURAL FLAVOURS LTD.",
-        "ENKEIWHEL.BO": "ENKEI WHEELS (INDIA) LTD.",
-        "ENSOSECUT.BO": "ENSO SECUTRACK LTD.",
-        "ENTEGRA.BO": "Entegra Ltd",
-        "ENTRINT.BO": "Enterprise International Limited",
-        "ENVAIREL.BO": "Envair Electrodyne Ltd.",
-        "EONBBPH.BO": "EONELEC*",
-        "EPCIN.BO": "EPC Industrie Ltd.",
-        "EPSOMPRO.BO": "Epsom Properties Ltd",
-        "ERABUILD.BO": "ERA BUILDSYS LIMITED",
-        "ERAINFRA6.BO": "ERAINFRA6.BO",
-        "ESABINDIA.BO": "ESAB India Limited",
-        "ESARIND.BO": "Esaar India Ltd",
-        "ESCORTS.BO": "Escorts Limited",
-        "ESCORTS6.BO": "ESCORTS6.BO",
-        "ESKAY.BO": "Eskay K'n'IT (India) Limited",
-        "ESQRMON.BO": "ESQUIRE MONEY GUARANTEES LTD.",
-        "ESSDEE6.BO": "ESSDEE6.BO",
-        "ESSELPRO.BO": "Essel Propack Limited",
-        "ESSJSYN.BO": "ESSJAY SYNTHETICS LTD.",
-        "ESSMCAT.BO": "ESSEM CATALYST LTD.",
-        "ESTPP.BO": "ESTAR INFOPP",
-        "ETIL.BO": "Econo Trade (India) Limited",
-        "ETPCORP.BO": "ETP CORPORATION LTD.",
-        "ETT.BO": "ETT LTD",
-        "EUROMULTI.BO": "EURO MULTIVISION LTD.",
-        "EVERESTO.BO": "Everest Organics Limited",
-        "EVERLON.BO": "Everlon Synthetics Ltd",
-        "EVINIX.BO": "EVINIX ACCESSORIES LTD.",
-        "EXCAST.BO": "EXCEL CASTRONICS LIMITED",
-        "EXCELCROP.BO": "EXCEL CROP CARE LTD.",
-        "EXTCO.BO": "Extol Commercial Ltd",
-        "FABWRT.BO": "FABWRTH IND",
-        "FACTENT.BO": "Fact Enterprise Ltd",
-        "FAGBEARING.BO": "Fag Bearings India Ltd.",
-        "FAIRDSY.BO": "Fairdeal Filaments Ltd",
-        "FARMAXIND.BO": "Farmax India Limited",
-        "FAZE3Q.BO": "Faze Three Ltd.",
-        "FDC.BO": "FDC Limited",
-        "FDC6.BO": "FDC6.BO",
-        "FDCLTDBBPH.BO": "FDC LIMITED*",
-        "FEDERALBNK6.BO": "FEDERALBNK6.BO",
-        "FEINDIALTD.BO": "FE (INDIA) LTD",
-        "FENOPLAS.BO": "Fenoplast Ltd.",
-        "FERVENTSYN.BO": "FERVENT SYNERGIES LTD.",
-        "FFPL.BO": "Foundry Fuel Products Ltd.",
-        "FGP.BO": "FGP Ltd.",
-        "FIBERWEB.BO": "Fiberweb (India) Ltd.",
-        "FILAMENT.BO": "FILAMENTS INDIA LTD.",
-        "FILATEX.BO": "Filatex India Ltd.",
-        "FILTRA.BO": "Filtra Consultants and Enginee",
-        "FILTRON.BO": "FILTRON ENGINEERS LTD.",
-        "FINAVENT.BO": "Finaventure Capital Limited",
-        "FINELINE.BO": "Fine-Line Circuits Limited",
-        "FINPIPE6.BO": "FINPIPE6.BO",
-        "FIRSTLEASE.BO": "First Leasing Company of India Ltd.",
-        "FISCHER.BO": "Fischer Chemic Ltd.",
-        "FLEETWL.BO": "FLEETWELD (INDIA) LTD.",
-        "FLEXITUFF.BO": "FLEXITUFF INTERNATIONAL LTD.",
-        "FLUIDOM.BO": "Fluidomat Ltd.",
-        "FMGOETZE.BO": "FEDERAL-MOGUL GOETZE (INDIA) L",
-        "FMNL.BO": "FUTURE MARKET NETWORKS LTD.",
-        "FORBESCO.BO": "Forbes & Company Limited",
-        "FORINTL.BO": "FORTUNE INTERNATIONAL LTD.",
-        "FOSECOIND.BO": "FOSECO INDIA LTD.",
-        "FRASER.BO": "Fraser And Company Limited",
-        "FRL4.BO": "FRL4.BO",
-        "FRL6.BO": "FRL6.BO",
-        "FRLDVR.BO": "FUTURE ENTERPRISES LTD",
-        "FRONTCAP.BO": "FRONTIER CAPITAL LIMITED",
-        "FRONTCORP.BO": "Frontline Corporation Limited",
-        "FRONTIER.BO": "Frontier Informatics Limited",
-        "FRONTSP.BO": "Frontier Springs Ltd.",
-        "FRSHTRP.BO": "Freshtrop Fruits Limited",
-        "FRUTION.BO": "FRUITION VENTURE LTD",
-        "FSL.BO": "Firstsource Solutions Limited",
-        "FUFITIN.BO": "Fusion Fittings (I) Limited",
-        "FUTSOL.BO": "FUTURISTIC SOLUTIONS LTD.",
-        "FUTURAPOLY.BO": "FUTURA POLYESTERS LTD.",
-        "GABRIEL.BO": "Gabriel India Limited",
-        "GAGANPO.BO": "GAGAN POLYCOT INDIA LTD.",
-        "GAIL.BO": "GAIL (India) Limited",
-        "GAIL4.BO": "GAIL4.BO",
-        "GAILBBPH.BO": "GAIL*",
-        "GAJRA.BO": "Gajra Bevel Gears Ltd.",
-        "GALLISPAT.BO": "GALLANTT ISPAT LTD.",
-        "GALLOPENT.BO": "GALLOPS ENTERPRISE LTD.",
-        "GALXBRG.BO": "GALAXY BEARINGS LTD.",
-        "GAMIE.BO": "Gamma Infoway Exalt Ltd.",
-        "GAMMONIND.BO": "Gammon India Limited",
-        "GAMMONIND6.BO": "GAMMONIND6.BO",
-        "GANDHHO.BO": "Gandhinagar Enterprise Limited",
-        "GANDHITUBE.BO": "GANDHI SPECIAL TUBES LTD.",
-        "GANECOS.BO": "GANESHA ECOSPHERE LTD.",
-        "GANESHBE.BO": "Ganesh Benzoplast",
-        "GANESHHOUC.BO": "GANESH HOUSING CORPORATION LTD",
-        "GANFNDR.BO": "GANESH FOUNDRY & CASTINGS LTD.",
-        "GARDENSILK.BO": "Garden Silks Mills Ltd.",
-        "GARGFUR.BO": "Garg Furnace Ltd",
-        "GARNETINT.BO": "Garnet International Limited",
-        "GARWALLROP.BO": "Garware-Wall Ropes Ltd.",
-        "GARWARBBPH.BO": "GARWAREWAL*",
-        "GARWARPOLY.BO": "Garware Polyester Limited",
-        "GARWSYN.BO": "Garware Synthetics Limited",
-        "GATI.BO": "Gati Ltd",
-        "GAYATRIBI.BO": "Gayatri BioOrganics Limited",
-        "GCMCAPI.BO": "GCM CAPITAL ADVISORS LTD",
-        "GCVSERV.BO": "GCV SERVICES LIMITED",
-        "GDL.BO": "Gateway Distriparks Limited",
-        "GDL6.BO": "GDL6.BO",
-        "GEE.BO": "GEE Limited",
-        "GEECEEBBPH.BO": "GEECEEVEN*",
-        "GEMINIBBPH.BO": "GEMINI COM*",
-        "GEMSPIN.BO": "Gem Spinners India Ltd.",
-        "GENELEC.BO": "GENELEC LTD.",
-        "GENESYS.BO": "Genesys International Corporation Limited",
-        "GENIUSCO.BO": "Genus Commu Trade Ltd",
-        "GENNEX.BO": "Gennex Laboratories Limited",
-        "GEODESIC.BO": "GEODESIC LTD.",
-        "GEODESIC6.BO": "GEODESIC6.BO",
-        "GEODLTDBBPH.BO": "GEOD LTD*",
-        "GEOMETRIC.BO": "Geometric Limited",
-        "GEOMETRIC6.BO": "GEOMETRIC6.BO",
-        "GGDANDE.BO": "GG Dandekar Machine Works Ltd.",
-        "GGGRAN.BO": "Gee Gee Granites Ltd.",
-        "GHCL.BO": "GHCL Limited",
-        "GILLANDERS.BO": "GILLANDERS ARBUTHNOT & CO.LTD.",
-        "GILLETTE.BO": "Gillette India Limited",
-        "GILTPKG.BO": "GILT PACK LTD.",
-        "GINISILK.BO": "Gini Silk Mills Limited",
-        "GINNIFILA.BO": "GINNI FILAMENTS LTD.",
-        "GIRIRAJ.BO": "GIRIRAJ PRINT PLAST LTD.",
-        "GIRNFIB.BO": "GIRNAR FIBRES LTD.",
-        "GITNJLIBBPH.BO": "GITANJALI GE",
-        "GKB.BO": "GKB Ophthalmics Ltd",
-        "GKCONS.BO": "G.K. Consultants Limited",
-        "GLDTORE.BO": "GOLDEN TOURIST RESORTS AND DEV",
-        "GLEITLAI.BO": "GLEITLAGER (INDIA) LTD.",
-        "GLFL.BO": "Gujarat Lease Financing Limited",
-        "GLITTEKG.BO": "Glittek Granites Ltd.",
-        "GLOBAL.BO": "GLOBAL LAND MASTERS CORPORATIO",
-        "GLOBALVECT.BO": "GLOBAL VECTRA HELICORP LTD.",
-        "GLOBSYN.BO": "GLOBAL SYNTEX (BHILWARA) LTD.",
-        "GLOBUSCON.BO": "GLOBUS CONSTRUCTORS & DEVELOPE",
-        "GLOBUSSPR.BO": "Globus Spirits Ltd.",
-        "GLODYNE6.BO": "GLODYNE6.BO",
-        "GLOKNIT.BO": "GLOBAL KNITFAB LTD.",
-        "GLOSTER.BO": "GLOSTER LTD",
-        "GMBREW.BO": "GM Breweries Ltd",
-        "GMDCLTD6.BO": "GMDCLTD6.BO",
-        "GMLM.BO": "Gaurav Mercantile Limited",
-        "GMM.BO": "GMM Pfaudler Ltd.",
-        "GMRINFRA4.BO": "GMRINFRA4.BO",
-        "GNRL.BO": "GUJARAT NATURAL RESOURCES LIMI",
-        "GOACARBON.BO": "GOA CARBON LTD.",
-        "GOAFRUT.BO": "GOA FRUIT SPECIALITIES LTD.",
-        "GOCLCORP.BO": "GOCL Corporation Limited",
-        "GODFRYPHLP.BO": "Godfrey Phillips India Limited",
-        "GODFRYPHLP6.BO": "GODFRYPHLP6.BO",
-        "GODREJIND4.BO": "GODREJIND4.BO",
-        "GODREJPROP.BO": "GODREJ PROPERTIES LTD",
-        "GOGIACAP.BO": "Gogia Capital Services Ltd.",
-        "GOLCA.BO": "Golden Carpets Ltd",
-        "GOLDBEES.BO": "GOLDMAN SACHS GOLD EXCHANGE TR",
-        "GOLDCORP.BO": "GOLDCREST CORPORATION LIMITED",
-        "GOLDENGOEN.BO": "GOLDEN GOENKA FINCORP LIMITED",
-        "GOLDENPROP.BO": "GOLDENPROP.BO",
-        "GOLDENTOBC.BO": "GOLDEN TOBACCO LTD.",
-        "GOLDIAM.BO": "GOLDIAM INTERNATIONAL LTD.",
-        "GOLDIMBBPH.BO": "GOLDIAM INT*",
-        "GOLDLINE.BO": "GOLD LINE INTERNATIONAL FINVES",
-        "GOLDMUL.BO": "GOLD MULTIFAB LTD.",
-        "GOLDSHARE.BO": "UTI Mutual Fund - UTI-Gold Exchange Traded Fund",
-        "GONTER.BO": "Gontermann-Peipers (India) Limited",
-        "GOODLUC.BO": "Goodluck India Limited",
-        "GOODRICKE.BO": "GOODRICKE GROUP LTD.",
-        "GOPALA.BO": "Gopala Polyplast Ltd.",
-        "GOTHIPL.BO": "Gothi Plascon (India) Limited",
-        "GOYALASS.BO": "GOYAL ASSOCIATES LTD.",
-        "GPCL.BO": "Gala Print City Limited",
-        "GPL.BO": "Grandeur Products Limited",
-        "GRADBBPH.BO": "GRADIENTE",
-        "GRADIENTE.BO": "GRADIENTE INFOTAINMENT LTD.",
-        "GRANDFONRY.BO": "GRAND FOUNDRY LTD.",
-        "GRANULES.BO": "Granules India Limited",
-        "GRAPHITE.BO": "Graphite India Ltd.",
-        "GRAUWEIL.BO": "Grauer & Weil (India) Ltd.",
-        "GRAVITA.BO": "GRAVITA INDIA LTD.",
-        "GRAVITY.BO": "Gravity (India) Limited",
-        "GREAVESCOT6.BO": "GREAVESCOT6.BO",
-        "GREENFIELD.BO": "MUDUNURU LIMITED",
-        "GRFLDCO.BO": "GREENFIELD CORP.LTD.",
-        "GRINDWELL.BO": "GRINDWELL NORTON LTD.",
-        "GRMOVER.BO": "GRM Overseas Ltd.",
-        "GROVY.BO": "Grovy India Limited",
-        "GRPLTD.BO": "GRP LTD.",
-        "GSFC6.BO": "GSFC6.BO",
-        "GSKCONS6.BO": "GSKCONS6.BO",
-        "GSLINDL.BO": "GSL (INDIA) LTD.",
-        "GSPL.BO": "Gujarat State Petronet Limited",
-        "GSPL4.BO": "GSPL4.BO",
-        "GTL.BO": "GTL Ltd.",
-        "GUJARTH.BO": "GUJARAT ARTH LTD.",
-        "GUJBOROS.BO": "Gujarat Borosil Limited",
-        "GUJBP.BO": "GUJARAT BULK PACKS LTD.",
-        "GUJCMDS.BO": "Gujchem Distillers India Ltd",
-        "GUJCONT.BO": "GUJARAT CONTAINERS LTD.",
-        "GUJCOTEX.BO": "Gujarat Cotex Ltd.",
-        "GUJCYPROM.BO": "GUJARAT CYPROMET LTD.",
-        "GUJFILA.BO": "GUJARAT FILAMENTS LTD.",
-        "GUJFISC.BO": "GUJARAT FISCON LTD.",
-        "GUJFLUORO6.BO": "GUJFLUORO6.BO",
-        "GUJINJEC.BO": "GUJARAT INJECT (KERALA) LTD.",
-        "GUJINTRX.BO": "Gujarat Intrux Limited",
-        "GUJINV.BO": "Gujarat Investa Ltd.",
-        "GUJNFLY.BO": "Gujarat Narmada Flyash Company Limited",
-        "GUJNRECOKE.BO": "GUJARAT NRE COKE LTD.",
-        "GUJNRECOKE6.BO": "GUJNRECOKE6.BO",
-        "GUJNREDVR.BO": "GUJARAT NRE COKE LTD",
-        "GUJPETR.BO": "Gujarat Petrosynthese Ltd.",
-        "GUJRFTO.BO": "GUJARAT REFRACTORIES LTD.",
-        "GUJTERC.BO": "Gujarat Terce Laboratories Ltd.",
-        "GUJTEXSP.BO": "GUJARAT TEXSPIN LTD.",
-        "GUJTHEM.BO": "Gujarat Themis Biosyn Ltd.",
-        "GUJTLRM.BO": "Gujarat Toolroom Limited",
-        "GUJWDGE.BO": "GUJARAT WEDGE WIRE SCREENS LTD",
-        "GULCHEM.BO": "Genus Prime Infra Limited",
-        "GULPOLY.BO": "Gulshan Polyols Limited",
-        "GUPTCIN.BO": "AXIS RAIL INDIA LTD",
-        "GUPTSYN.BO": "Gupta Synthetics Ltd.",
-        "GVKPIL6.BO": "GVKPIL6.BO",
-        "GWPLPIP.BO": "GWALIOR POLYPIPES LTD.",
-        "HANJFIB.BO": "HANJER FIBRES LTD.",
-        "HANSFLN.BO": "HANSAFLON PLASTO CHEM LTD.",
-        "HARCR.BO": "HARIG CRANKSHAFTS LTD.",
-        "HARI.BO": "HARI.BO",
-        "HARIGOV.BO": "HARI GOVIND INTERNATIONAL LTD.",
-        "HARRMALAYA.BO": "HARRISONS MALAYALAM LTD.",
-        "HARTNCO.BO": "HARTNCO.BO",
-        "HARVIC.BO": "HARVIC MANAGEMENT SERVICES (IN",
-        "HARYANATEX.BO": "HARYANA TEXPRINTS (OVERSEAS) L",
-        "HARYNACAP.BO": "Haryana Capfin Limited",
-        "HATHWAY.BO": "Hathway Bhawani Cabletel and Datacom Ltd.",
-        "HATHWAYB.BO": "HATHWAY BHAWANI CABLETEL & DAT",
-        "HAVELLS.BO": "Havells India Ltd.",
-        "HAWAENG.BO": "Hawa Engineers ltd.",
-        "HAWKINCOOK.BO": "HAWKINS COOKERS LTD.",
-        "HCLTD.BO": "HIND COMMERCE LIMITED",
-        "HDBK.BO": "HDBK.BO",
-        "HDFCMFGETF.BO": "HDFC MUTUAL FUND - HDFC GOLD E",
-        "HDFCNIFETF.BO": "HDFC Mutual Fund",
-        "HDFNFTYINAV.BO": "i-NAV HDFC NIFTY",
-        "HDFSNSXINAV.BO": "i-NAV HDFC SENSEX",
-        "HDIL4.BO": "HDIL4.BO",
-        "HDIL6.BO": "HDIL6.BO",
-        "HEERAISP.BO": "Heera Ispat Ltd",
-        "HEG.BO": "HEG Limited",
-        "HEG6.BO": "HEG6.BO",
-        "HEGLTDBBPH.BO": "HEGLTD*",
-        "HELIOSMATH.BO": "HELIOS & MATHESON INFORMATION",
-        "HELPAGE.BO": "Helpage Finlease Ltd.",
-        "HEMANG.BO": "HEMANG RESOURCES LIMITED",
-        "HEMORGANIC.BO": "HEMO ORGANIC LIMITED",
-        "HERCULES.BO": "Hercules Hoists Limited",
-        "HEROMOTOCO.BO": "HERO MOTOCORP LTD.",
-        "HEXATRADEX.BO": "HEXA TRADEX LTD.",
-        "HFEFBDD.BO": "HDFC Mutual Fund",
-        "HFEFBDG.BO": "HDFC Mutual Fund",
-        "HFEFBRD.BO": "HDFC Mutual Fund",
-        "HFEFBRG.BO": "HDFC Mutual Fund",
-        "HFEFDD.BO": "HDFC Mutual Fund",
-        "HFEFDG.BO": "HDFC Mutual Fund",
-        "HFEFRD.BO": "HDFC Mutual Fund",
-        "HFEFRG.BO": "HDFC Mutual Fund",
-        "HGS.BO": "HINDUJA GLOBAL SOLUTIONS LTD.",
-        "HIGHGROUND.BO": "HIGH GROUND ENTERPRISE LTD",
-        "HIGHSTREE.BO": "HIGH STREET FILATEX LTD.",
-        "HIKAL.BO": "Hikal Limited",
-        "HIL.BO": "HIL LTD.",
-        "HIMATSEIDE.BO": "Himatsingka Seide Ltd.",
-        "HIMFIBP.BO": "Himachal Fibres Ltd.",
-        "HIMFINC.BO": "HIMGIRI FINCAP LTD.",
-        "HIMGRANI.BO": "Himalaya Granites Ltd.",
-        "HIMIN.BO": "Himalya International Ltd.",
-        "HINAFIL.BO": "HINAFIL INDIA LTD.",
-        "HINCOMBBPH.BO": "HINDUST COM*",
-        "HINDADH.BO": "Hindustan Adhesives Limited",
-        "HINDALCO6.BO": "HINDALCO6.BO",
-        "HINDAPL.BO": "HINDUSTAN APPLIANCES LTD.",
-        "HINDBIO.BO": "Hindustan Bio Sciences Ltd.",
-        "HINDCOMPOS.BO": "HINDUSTAN COMPOSITES LTD.",
-        "HINDDORROL.BO": "HINDUSTAN DORR-OLIVER LTD.",
-        "HINDHARD.BO": "Hindustan Hardy Spicer Ltd.",
-        "HINDMILL.BO": "HINDOOSTAN MILLS LTD.",
-        "HINDSYNTEX.BO": "HIND SYNTEX LTD.",
-        "HINDTIN.BO": "Hindustan Tin Works Ltd.",
-        "HINDUJAFO.BO": "Hinduja Foundries Limited",
-        "HINDUNILVR.BO": "HINDUSTAN UNILEVER LTD.",
-        "HINFLUR.BO": "Hindustan Fluorocarbons Ltd.",
-        "HIPOLIN.BO": "Hipolin Limited",
-        "HIRAN.BO": "Hiran Orgochem Ltd",
-        "HIRECT.BO": "HIND RECTIFIERS LTD.",
-        "HITACHIHOM.BO": "HITACHI HOME AND LIFE SOLUTION",
-        "HITKARICH.BO": "HITKARI CHINA LTD.",
-        "HITKITGLO.BO": "Hit Kit Global Solutions Ltd.",
-        "HKT.BO": "H.K.Trade International Limite",
-        "HMT.BO": "HMT Ltd.",
-        "HNDTRAN.BO": "HNDTRAN.BO",
-        "HNGSNGBEES.BO": "GOLDMAN SACHS MUTUAL FUND",
-        "HOTELEELA.BO": "Hotel Leelaventure Limited",
-        "HOTELEELA6.BO": "HOTELEELA6.BO",
-        "HOTELRUGBY.BO": "HOTEL RUGBY LTD.",
-        "HOTLINET.BO": "HOTLINE TELETUBE & COMPONENTS",
-        "HOTLSILV.BO": "HS India Limited",
-        "HOVBBPH.BO": "HOV SERV ICES*",
-        "HOVS.BO": "HOV Services Limited",
-        "HRBFLOR.BO": "HRB FLORICULTURE LTD.",
-        "HRGESSDD2.BO": "HDFC MUTUAL FUND - HDFC RAJIV",
-        "HRGESSDG2.BO": "HDFC MUTUAL FUND - HDFC RAJIV",
-        "HRGESSRD2.BO": "HDFC MUTUAL FUND - HDFC RAJIV",
-        "HRGESSRG2.BO": "HDFC MUTUAL FUND - HDFC RAJIV",
-        "HRMNYCP.BO": "Harmony Capital Services Limited",
-        "HRYNSHP.BO": "Hariyana Ship Breakers Ltd.",
-        "HSIL.BO": "HSIL Limited",
-        "HUBTOWN.BO": "HUBTOWN LTD.",
-        "HULTDBBPH.BO": "HIND UNI LT*",
-        "HYDROSBBPH.BO": "HYDRO S&S*",
-        "HYTONE.BO": "HYTONE TEXSTYLES LTD.",
-        "IAG.BO": "IAG COMPANY LTD.",
-        "IBWSL.BO": "SORIL HOLDINGS AND VENTURES LIM",
-        "ICDSLTD.BO": "ICDS LTD.",
-        "ICIBBPH.BO": "ICI INDIA",
-        "ICL.BO": "Indo Cotspin Limited",
-        "ICRA.BO": "ICRA Limited",
-        "ICRA6.BO": "ICRA6.BO",
-        "ICSA.BO": "ICSA (INDIA) LTD.",
-        "ICSILBBPH.BO": "ICSIL*",
-        "ICSL.BO": "Integrated Capital Services Lt",
-        "IDBIGOLD.BO": "IDBI MUTUAL FUND - IDBI GOLD E",
-        "IDEA.BO": "Idea Cellular Ltd.",
-        "IDEA6.BO": "IDEA6.BO",
-        "IDEALCAR.BO": "IDEAL CARPETS LTD.",
-        "IDEAOPT.BO": "IDEAL TEXBUILD LIMITED",
-        "IDFC.BO": "IDFC Limited",
-        "IDFC6.BO": "IDFC6.BO",
-        "IDFCEOS2DD.BO": "IDFC MUTUAL FUND - IDFC EQUITY",
-        "IDFCEOS2RD.BO": "IDFC MUTUAL FUND- IDFC EQUITY",
-        "IDFCEOS3DD.BO": "IDFC MUTUAL FUND - IDFC EQUITY",
-        "IDFCEOS3RD.BO": "IDFC MUTUAL FUND- IDFC EQUITY",
-        "IDI.BO": "IDI LTD.",
-        "IDM.BO": "International Data Management Ltd",
-        "IFCI.BO": "IFCI Limited",
-        "IFGLREFRAC.BO": "IFGL REFRACTORIES LTD.",
-        "IFINSEC.BO": "INDIA FINSEC LTD.",
-        "IFLPROMOT.BO": "IFL Promoters Limited",
-        "IFMIMPX.BO": "IFM Impex Global Limited",
-        "IFSLLTD.BO": "IFSL LTD.",
-        "IIFL6.BO": "IIFL6.BO",
-        "IIFLBBPH.BO": "IIFL*",
-        "IMCAP.BO": "IM+ CAPITALS LIMITED",
-        "INCAP.BO": "Incap Ltd.",
-        "INCEN.BO": "INCEN.BO",
-        "INCON.BO": "Incon Engineers Ltd",
-        "INDAGEVIN.BO": "INDAGE VINTNERS LTD.",
-        "INDAGIV.BO": "Ind Agiv Commerce Ltd",
-        "INDBULBBPH.BO": "INDBULL*",
-        "INDECOM.BO": "INDIA E-COMMERCE LTD.",
-        "INDHOTEL6.BO": "INDHOTEL6.BO",
-        "INDIAGLYCO.BO": "INDIA GLYCOLS LTD.",
-        "INDIANACRY.BO": "INDIAN ACRYLICS LTD.",
-        "INDIANB6.BO": "INDIANB6.BO",
-        "INDIANHUME.BO": "INDIAN HUME PIPE CO.LTD.",
-        "INDIANVSH.BO": "IndiaNivesh Ltd.",
-        "INDICAP.BO": "INDITRADE CAPITAL LIMITED",
-        "INDINFRA.BO": "INDIA INFRASPACE LTD.",
-        "INDITALIA.BO": "INDITALIA REFCON LTD.",
-        "INDOAMIN.BO": "Indo Amines Ltd.",
-        "INDOBCLBBPH.BO": "INDOBCL*",
-        "INDOBONIT.BO": "Indo Bonito Multinational Ltd.",
-        "INDOBRIT.BO": "INDOBRIT.BO",
-        "INDOCO.BO": "Indoco Remedies Limited",
-        "INDOEURO.BO": "INDO EURO INDCHEM LTD.",
-        "INDOGLOBAL.BO": "Indo-Global Enterprises Limite",
-        "INDOKEM.BO": "Indokem Limited",
-        "INDORAMA.BO": "INDO RAMA SYNTHETICS (INDIA) L",
-        "INDPLYF.BO": "INDPLYF.BO",
-        "INDPOLYS.BO": "INDIA POLYSPIN LTD.",
-        "INDRUBR.BO": "INDRUBR.BO",
-        "INDSOYA.BO": "INDSOYA LTD.",
-        "INDSUCR.BO": "Indian Sucrose Ltd.",
-        "INDSWFTLAB.BO": "IND-SWIFT LABORATORIES LTD.",
-        "INDSWFTLTD.BO": "IND-SWIFT LTD.",
-        "INDUSFILA.BO": "Indus Fila Limited",
-        "INDUSINDBK6.BO": "INDUSINDBK6.BO",
-        "INDUSNET.BO": "INDUS NETWORKS LTD.",
-        "INDXTRA.BO": "Indian Extractions Ltd",
-        "INFINITBBPH.BO": "INFINITE*",
-        "INFINITE.BO": "Infinite Computer Solutions (India) Ltd.",
-        "INFRAQUEST.BO": "INFRAQUEST INTERNATIONAL LTD.",
-        "INFRAQUESTP.BO": "INFRAQUEST",
-        "INFRATEL.BO": "BHARTI INFRATEL LTD.",
-        "INFY.BO": "Infosys Limited",
-        "INFY4.BO": "INFY4.BO",
-        "INFY6.BO": "INFY6.BO",
-        "INGERMS.BO": "INGERMS.BO",
-        "INGERRAND.BO": "INGERSOLL-RAND (INDIA) LTD.",
-        "INGERRAND6.BO": "INGERRAND6.BO",
-        "INHOUPROD.BO": "In House Productions Limited",
-        "INIFTY.BO": "ICICI PRUDENTIAL MUTUAL FUND -",
-        "INLACGR.BO": "INLAC GRANSTON LTD.",
-        "INLANPR.BO": "INLAND PRINTERS LTD.",
-        "INLCM.BO": "The Indian Link Chain Manufactures Ltd.",
-        "INNOCORP.BO": "Innocorp Ltd",
-        "INNOVENT.BO": "INNOVENTIVE VENTURE LTD.",
-        "INNOVIS.BO": "INNOVISION E-COMMERCE LTD.",
-        "INOXLEISUR.BO": "Inox Leisure Limited",
-        "INRADIA.BO": "INDIA RADIATORS LTD.",
-        "INSECTICID.BO": "INSECTICIDES (INDIA) LTD.",
-        "INSILCO.BO": "Insilco Ltd.",
-        "INTCAPM.BO": "Integra Capital Management Ltd.",
-        "INTECCAP.BO": "Intec Capital Ltd.",
-        "INTEGFD.BO": "Integrated Proteins Ltd.",
-        "INTEGRAL.BO": "INTEGRAL KNIT CO.LTD.",
-        "INTEGSW.BO": "INTEGRA SWITCHGEAR LTD.",
-        "INTELLADV.BO": "INTELLIVATE CAPITAL ADVISORS L",
-        "INTELLECT.BO": "INTELLECT DESIGN ARENA LIMITED",
-        "INTLCOMBQ.BO": "International Combustion (India) Ltd.",
-        "INTLCONV.BO": "International Conveyors Ltd",
-        "INTLHOME.BO": "INTERNATIONAL HOMETEX LTD.",
-        "INTRA.BO": "Indtradeco Limited",
-        "INTRCRF.BO": "INTERCRAFT LTD.",
-        "INVICTA.BO": "Invicta Meditek Limited",
-        "IOB4.BO": "IOB4.BO",
-        "IOLN.BO": "IOL NETCOM LTD.",
-        "IOLN6.BO": "IOLN6.BO",
-        "IONEXCHANG.BO": "ION EXCHANGE (INDIA) LTD.",
-        "IOSYSTEM.BO": "IO System Limited",
-        "IPCALAB.BO": "Ipca Laboratories Limited",
-        "IPCALABBBPH.BO": "IPCA LAB*",
-        "IPPL.BO": "KOTIA ENTERPRISES LTD",
-        "IPRINGLTD.BO": "IP RINGS LTD.",
-        "IPRU2262.BO": "ICICI PRUDENTIAL MUTUAL FUND -",
-        "IPRU2263.BO": "ICICI PRUDENTIAL MUTUAL FUND -",
-        "IPRU2296.BO": "IPRU2296.BO",
-        "IPRU2365.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2366.BO": "IPRU2366.BO",
-        "IPRU2401.BO": "ICICI PRUDENTIAL GROWTH FUND S",
-        "IPRU2428.BO": "ICICI PRUDENTIAL GROWTH FUND S",
-        "IPRU2487.BO": "ICICI PRUDENTIAL VALUE FUND SE",
-        "IPRU2488.BO": "ICICI PRUDENTIAL VALUE FUND SE",
-        "IPRU2511.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2530.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2586.BO": "IPRU2586.BO",
-        "IPRU2591.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2598.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2619.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2626.BO": "IPRU2626.BO",
-        "IPRU2639.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2640.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2670.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2693.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2708.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2715.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2721.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2722.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2735.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2755.BO": "ICICI Prudential Mutual Fund",
-        "IPRU2767.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8462.BO": "ICICI PRUDENTIAL MUTUAL FUND -",
-        "IPRU8463.BO": "ICICI PRUDENTIAL MUTUAL FUND -",
-        "IPRU8496.BO": "IPRU8496.BO",
-        "IPRU8565.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8566.BO": "IPRU8566.BO",
-        "IPRU8601.BO": "ICICI PRUDENTIAL GROWTH FUND S",
-        "IPRU8628.BO": "ICICI PRUDENTIAL GROWTH FUND S",
-        "IPRU8687.BO": "ICICI PRUDENTIAL VALUE FUND SE",
-        "IPRU8688.BO": "ICICI PRUDENTIAL VALUE FUND SE",
-        "IPRU8711.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8730.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8788.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8793.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8800.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8821.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8828.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8841.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8842.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8872.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8895.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8910.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8917.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8923.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8937.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8938.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8957.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8958.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8968.BO": "ICICI Prudential Mutual Fund",
-        "IPRU8969.BO": "ICICI Prudential Mutual Fund",
-        "IRB4.BO": "IRB4.BO",
-        "ISFL.BO": "ISF LIMITED",
-        "ISGECBBPH.BO": "ISGECBBPH",
-        "ISHWATR.BO": "ISHWARSHAKTI HOLDINGS & TRADER",
-        "ISMTLTD.BO": "ISMT LTD.",
-        "ISPATPROF.BO": "ISPAT PROFILES INDIA LTD.",
-        "ISTLTD.BO": "IST Limited",
-        "ISTRNETWK.BO": "ISTREET NETWORK LIMITED",
-        "ITC.BO": "ITC Limited",
-        "ITC4.BO": "ITC4.BO",
-        "ITHL.BO": "International Travel House Limited",
-        "ITI.BO": "ITI Limited",
-        "IVP.BO": "IVP Ltd.",
-        "IVRCLINFRA.BO": "IVRCL Limited",
-        "IZMO.BO": "IZMO Limited",
-        "JAGANLAM.BO": "Jagan Lamps Ltd.",
-        "JAGDAMD.BO": "JAGDAMD.BO",
-        "JAGPRO.BO": "VERONICA PRODUCTION LTD",
-        "JAGRAN.BO": "Jagran Prakashan Ltd",
-        "JAICORPLTD.BO": "JAI CORP LTD.",
-        "JAICORPLTD6.BO": "JAICORPLTD6.BO",
-        "JAIHINDS.BO": "Jaihind Synthetics Limited",
-        "JAINEX.BO": "Jainex Aamcol Ltd.",
-        "JAINSTUDIO.BO": "JAIN STUDIOS LTD.",
-        "JALPAC.BO": "JALPAC INDIA LTD.",
-        "JATTAINDUS.BO": "JATTASHANKAR INDUSTIES LTD.",
-        "JAVNTPR.BO": "Jayavant Products Limited",
-        "JAYAMEL.BO": "Jayant Mercantile Co. Ltd.",
-        "JAYATMA.BO": "Jayatma Spinners Limited",
-        "JAYBARMARU.BO": "JAY BHARAT MARUTI LTD.",
-        "JAYKAY.BO": "JAYKAY ENTERPRISES LTD.",
-        "JAYUSH.BO": "Jay Ushin Limited",
-        "JBFIND6.BO": "JBFIND6.BO",
-        "JBFINDBBPH.BO": "JBFIND*",
-        "JCLLITD.BO": "JCL LTD.",
-        "JCTLTD.BO": "JCT Ltd.",
-        "JDORGOCHEM.BO": "JD ORGOCHEM LTD.",
-        "JEL.BO": "Jyotirgamya Enterprises Limite",
-        "JENSONICOL.BO": "JENSON & NICHOLSON (INDIA) LTD",
-        "JETINFRA.BO": "Jet Infraventure Limited",
-        "JETKINGQ.BO": "Jetking Infotrain Limited",
-        "JFLABS.BO": "JFLABS.BO",
-        "JHS.BO": "JHS Svendgaard Laboratories Ltd.",
-        "JINDALPHOT.BO": "JINDAL PHOTO LTD.",
-        "JINDALSAW.BO": "JINDAL SAW LTD.",
-        "JINDALSTEL4.BO": "JINDALSTEL4.BO",
-        "JINDCAP.BO": "Jindal Capital Ltd.",
-        "JINDCOT.BO": "JINDAL COTEX LTD.",
-        "JINDLPOBBPH.BO": "JINDAL POLY*",
-        "JINDWORLD.BO": "JINDAL WORLDWIDE LTD.",
-        "JISLJALEQS6.BO": "JISLJALEQS6.BO",
-        "JIYAECO.BO": "Jiya Eco-Products Limited",
-        "JKLAKBBPH.BO": "JKLAKSHMI*",
-        "JKLAKSHMI6.BO": "JKLAKSHMI6.BO",
-        "JLMORI.BO": "J. L. Morison (India) Limited",
-        "JMFINANCIL6.BO": "JMFINANCIL6.BO",
-        "JMGCORP.BO": "JMG Corporation Limited",
-        "JMPCAST.BO": "JMP CASTINGS LTD.",
-        "JOINDRE.BO": "Joindre Capital Services Ltd.",
-        "JOLLYRID.BO": "JOLLY RIDES LTD.",
-        "JOLYMER.BO": "JOLLY MERCHANDISE LTD.",
-        "JPASSOCIAT.BO": "JAIPRAKASH ASSOCIATES LTD.",
-        "JPASSOCIAT6.BO": "JPASSOCIAT6.BO",
-        "JPOLYINVST.BO": "JINDAL POLY INVESTMENT AND FIN",
-        "JSHL.BO": "JLA Infraville Shoppers Limite",
-        "JSL.BO": "Jindal Stainless Limited",
-        "JSL6.BO": "JSL6.BO",
-        "JSLHISAR.BO": "Jindal Stainless (Hisar) Limit",
-        "JSPLBBPH.BO": "JSPL*",
-        "JTLINFRA.BO": "JTL INFRA LTD.",
-        "JUBILANT.BO": "JUBILANT LIFE SCIENCES LIMITED",
-        "JUMBO.BO": "JUMBO BAG LTD.",
-        "JUNIORBEES.BO": "Goldman Sachs Mutual Fund - Goldman Sachs Nifty Junior Exchange Traded Scheme",
-        "JUPITER.BO": "JUPITER BIOSCIENCE LTD.",
-        "JUSTDIAL.BO": "JUST DIAL LTD.",
-        "JYOTHYLAB.BO": "Jyothy Laboratories Limited",
-        "JYOTI.BO": "Jyoti Ltd.",
-        "JYOTIOVR.BO": "Jyoti Overseas Ltd",
-        "JYOTIRES.BO": "Jyoti Resins & Adhesives Ltd.",
-        "JYOTISTRUC.BO": "JYOTI STRUCTURES LTD.",
-        "JYOTPOL.BO": "JYOTI POLY VINYL LTD.",
-        "KACHCHH.BO": "Kachchh Minerals Ltd.",
-        "KACL.BO": "KAISER CORPORATION LIMITED",
-        "KAIRA.BO": "Kaira Can Company Limited",
-        "KAJALSY.BO": "KAJAL SYNTHETICS & SILK MILLS",
-        "KALECONBBPH.BO": "KALECONSUL*",
-        "KALINDEE.BO": "KALINDEE RAIL NIRMAN (ENGINEER",
-        "KALINDEE6.BO": "KALINDEE6.BO",
-        "KALPACOMME.BO": "Kalpa Commercial Limited",
-        "KALYANIFRG.BO": "KALYANI FORGE LTD.",
-        "KAMAOVR.BO": "KAMAL OVERSEAS LTD.",
-        "KAMDHENU.BO": "Kamdhenu Limited",
-        "KAMRLAB.BO": "Kamron Laboratories Ltd.",
-        "KANCHAN.BO": "KANCHAN INTERNATIONAL LTD.",
-        "KANCHI.BO": "Kanchi Karpooram Ltd.",
-        "KANCOENT.BO": "Kanco Enterprises Ltd.",
-        "KANOPLA.BO": "KANORIA PLASCHEM LTD.",
-        "KANORIABBPH.BO": "KANORIA*",
-        "KANPRPLA.BO": "Kanpur Plastipack Ltd",
-        "KANSAFB.BO": "KANSAL FIBRES LTD.",
-        "KAPASHI.BO": "KAPASHI COMMERCIALS LTD.",
-        "KAPILCO.BO": "Kapil Cotex Ltd.",
-        "KARNAALF.BO": "KARNAVATI ALFA INTERNATIONAL L",
-        "KARTAVYA.BO": "KARTAVYA.BO",
-        "KARUNACAB.BO": "GLOBUS CORPORATION LTD.",
-        "KARURKCP.BO": "KARUR K.C.P.PACKKAGINGS LTD.",
-        "KASHIRAM.BO": "Kashiram Jain and Company Limi",
-        "KAUSAMBI.BO": "KAUSAMBI VANIJYA LTD",
-        "KAYA.BO": "Kaya Limited",
-        "KBSINDIA.BO": "KBS INDIA LIMITED",
-        "KCL.BO": "Kabra Commercial Limited",
-        "KCP.BO": "The KCP Limited",
-        "KCSL.BO": "KARNIMATA COLD STORAGE LTD",
-        "KDDL.BO": "KDDL Limited",
-        "KDJHRL.BO": "KDJ HOLIDAYSCAPES AND RESORTS",
-        "KDML.BO": "Khemani Distributors & Marketi",
-        "KEC.BO": "KEC INTERNATIONAL LTD.",
-        "KEDIAVA.BO": "KEDIA VANASPATI LTD.",
-        "KELVINFIN.BO": "KELVIN FINCAP LTD",
-        "KEMISTAR.BO": "KEMISTAR CORPORATION LIMITED",
-        "KEMP.BO": "Kemp & Co. Ltd",
-        "KEMROCK6.BO": "KEMROCK6.BO",
-        "KENGI.BO": "KENGOLD (INDIA) LTD.",
-        "KERALAYUR.BO": "Kerala Ayurveda Ltd.",
-        "KESARENT.BO": "KESAR ENTERPRISES LTD.",
-        "KESARPE.BO": "Kesar Petroproducts Limited",
-        "KESORAMIND6.BO": "KESORAMIND6.BO",
-        "KEYCORP.BO": "KEY CORP LTD.",
-        "KEYCORPSER.BO": "KEYNOTE CORPORATE SERVICES LTD",
-        "KFA6.BO": "KFA6.BO",
-        "KFBL.BO": "Kothari Fermentation & Biochem Limited",
-        "KGDENIM.BO": "KG Denim Ltd.",
-        "KGL.BO": "KARUTURI GLOBAL LTD.",
-        "KGNENT.BO": "KGN ENTERPRISES LTD.",
-        "KGNIND6.BO": "KGNIND6.BO",
-        "KGPETRO.BO": "K G Petrochem Ltd",
-        "KHAITANLTD.BO": "Khaitan (India) Ltd.",
-        "KHATAU.BO": "KHATAU MAKANJI SPG.& WVG.CO.LT",
-        "KHEMGLB.BO": "KHEMSONS GLOBAL LTD.",
-        "KHODAY.BO": "Khoday India Limited",
-        "KHOOBSURAT.BO": "KHOOBSURAT LTD",
-        "KIDUJA.BO": "Kiduja India Ltd",
-        "KIL.BO": "Kamdhenu Limited",
-        "KILLICK.BO": "KILLICK NIXON LTD.",
-        "KILPEST.BO": "Kilpest India Ltd.",
-        "KINETRU.BO": "KINETIC TRUST LTD.",
-        "KIRANPR.BO": "Kiran Print Pack Ltd",
-        "KIRANSY-B.BO": "KIRAN SYNTEX LTD.",
-        "KIRANVYPAR.BO": "KIRAN VYAPAR LTD",
-        "KIRLOSBROS.BO": "KIRLOSKAR BROTHERS LTD.",
-        "KIRLPNU.BO": "Kirloskar Pneumatic Company Ltd",
-        "KIROILBBPH.BO": "KIRLOSKAR*",
-        "KISAN.BO": "Kisan Mouldings Limited",
-        "KJINTFD.BO": "K.J.INTERNATIONAL LTD.",
-        "KJMCCORP.BO": "KJMC CORPORATE ADVISORS (INDIA",
-        "KKFIN.BO": "K K Fincorp Limited",
-        "KKUMTFN.BO": "KMF LTD.",
-        "KLBRENGBBPH.BO": "KILBURN ENG*",
-        "KLGCAP.BO": "Klg Capital Services Ltd",
-        "KLGSYSTEL.BO": "KLG SYSTEL LTD.",
-        "KLRF.BO": "KLRF LTD.",
-        "KMCAPIT.BO": "KM CAPITAL LTD.",
-        "KOFFBREAK.BO": "Koffee Break Pictures Limited",
-        "KOHINOORBRO.BO": "Kohinoor Broadcasting Corporation Ltd.",
-        "KOKUYOCMLN.BO": "KOKUYO CAMLIN LTD.",
-        "KONARKSY.BO": "Konark Synthetic, Ltd.",
-        "KONGINT.BO": "KONGARAR INTEGRATED FIBRES LTD",
-        "KOPRAN.BO": "Kopran Limited",
-        "KOPRAN6.BO": "KOPRAN6.BO",
-        "KOTAKGOLD.BO": "Kotak Mahindra Mutual Fund - Kotak Gold ETF",
-        "KOTAKNIFTY.BO": "Kotak Mahindra Mutual Fund - Kotak Nifty ETF",
-        "KOTAKNIFTY2.BO": "KOTAKNIFTY2.BO",
-        "KOTHARIPRO.BO": "Kothari Products Ltd",
-        "KOTHSOY.BO": "KOTHSOY.BO",
-        "KPIT4.BO": "KPIT4.BO",
-        "KPRMILL.BO": "K.P.R. Mill Limited",
-        "KRBL.BO": "KRBL Limited",
-        "KRBLBBPH.BO": "KRBL*",
-        "KREMSPN.BO": "KAREEMS SPUN SILK LTD.",
-        "KREONFIN.BO": "Kreon Finnancial Services Ltd",
-        "KRIINFRA.BO": "KRIDHAN INFRA LIMITED",
-        "KRISFEP.BO": "Krishna Ferro Products Limited",
-        "KRISSYN.BO": "KRISHNA SYNTHETICS LTD.",
-        "KRITINUT.BO": "Kriti Nutrients Ltd",
-        "KRMINT-.BO": "KRM INTERNATIONAL LTD.",
-        "KSBPUMPS.BO": "KSB Pumps Limited",
-        "KSCL.BO": "Kaveri Seed Company Limited",
-        "KSE.BO": "KSE LTD.",
-        "KSERASERA.BO": "KSS LIMITED",
-        "KSERASERA6.BO": "KSERASERA6.BO",
-        "KSK6.BO": "KSK6.BO",
-        "KTIL.BO": "KESAR TERMINALS & INFRASTRUCTU",
-        "KTKKIGFD.BO": "Kotak Mahindra Mutual Fund",
-        "KTKKIGFDD.BO": "Kotak Mahindra Mutual Fund",
-        "KTKKIGFG.BO": "Kotak Mahindra Mutual Fund",
-        "KTKKIGFGD.BO": "Kotak Mahindra Mutual Fund",
-        "KTKSENSEX.BO": "Kotak Mahindra Mutual Fund - Kotak Sensex ETF",
-        "KUBERJI.BO": "Kuber Udyog Limited",
-        "KUMAKAIND.BO": "KUMAKA INDUSTIES LTD.",
-        "KUMARCO.BO": "KUMARS COTEX LTD.",
-        "KUNALOVE.BO": "KUNAL OVERSEAS LTD.",
-        "KUSHAL.BO": "KUSHAL TRADELINK LTD",
-        "KYRALANDS.BO": "KYRA LANDSCAPES LIMITED",
-        "LACTOSE.BO": "Lactose (India) Ltd.",
-        "LAHOTIOV.BO": "Lahoti Overseas Limited",
-        "LAKHANI.BO": "LAKHANI INDIA LTD.",
-        "LAKHOTIA.BO": "LAKHOTIA POLYESTERS (INDIA) LT",
-        "LAKPRE.BO": "LAKSHMI PRECISION SCREWS LTD.",
-        "LAKSHMIMIL.BO": "LAKSHMI MILLS COMPANY LTD.",
-        "LALPATHLAB.BO": "Dr. Lal Pathlabs Limited",
-        "LANDMARC.BO": "Landmarc Leisure Corporation Limited",
-        "LAOPALA.BO": "La Opala RG Limited",
-        "LAURLOR.BO": "LAUREL ORGANICS LTD.",
-        "LAXMIMACH.BO": "LAKSHMI MACHINE WORKS LTD.",
-        "LAXMIMACH6.BO": "LAXMIMACH6.BO",
-        "LEAFIN.BO": "LEAFIN INDIA LTD.",
-        "LGBBROSLTD.BO": "L.G.BALAKRISHNAN & BROS.LTD.",
-        "LGBFORGE.BO": "LGB FORGE LTD.",
-        "LIBERAL.BO": "LIBERAL FINLEASE LTD.",
-        "LIBERTSHOE.BO": "LIBERTY SHOES LTD.",
-        "LICNETFN50.BO": "LIC MF EXHGE TRADED FUND-NIFTY",
-        "LICNETFSEN.BO": "LIC MF EXCHNG TRADED FUND-SENS",
-        "LICNFNHGP.BO": "LIC MF EXHNGE TRADED FUND NIFT",
-        "LICNFR2D1.BO": "LIC MF RGESS FUND SR-2 DRT PL",
-        "LICNFR2DP.BO": "LIC MF RGESS FUND SR-2 REG PL",
-        "LICNFR2G1.BO": "LIC MF RGESS FUND SR-2 DRT PLN",
-        "LICNFR2GP.BO": "LIC MF RGESS FUND SR- 2 REG PL",
-        "LICNFR3D.BO": "LIC MF RGESS SR-3 RG PLN-DVD P",
-        "LICNFR3D1.BO": "LIC MF RGESS FUND SR-3 DRT PL-",
-        "LICNFR3G.BO": "LIC MF RGESS FUND SR-3-REG PL",
-        "LICNFR3G1.BO": "LIC MF RGESS FUND SR-3-DRT PL",
-        "LINDEINDIA.BO": "LINDE INDIA LIMITED",
-        "LINDEINDIA6.BO": "LINDEINDIA6.BO",
-        "LINKSONI.BO": "Linkson International Limited",
-        "LINTAS.BO": "LINTAS MERCANTILE LTD.",
-        "LIQUIDBEES.BO": "GOLDMAN SACHS LIQUID EXCHANGE",
-        "LITL6.BO": "LITL6.BO",
-        "LLORF.BO": "LLOYD ROCKFIBRES LTD.",
-        "LLOYDELENG6.BO": "LLOYDELENG6.BO",
-        "LML.BO": "LML Ltd.",
-        "LOGIXMICRO6.BO": "LOGIXMICRO6.BO",
-        "LOHIAPL.BO": "LOHIA POLYESTER LTD.",
-        "LOKESHMACH.BO": "LOKESH MACHINES LTD.",
-        "LOOKS.BO": "LOOKS HEALTH SERVICES LIMITED",
-        "LORDSCHLO.BO": "Lords Chloro Alkali Limited",
-        "LOTUSCHO.BO": "Lotus Chocolate Company Limited",
-        "LOVABLE.BO": "LOVABLE LINGERIE LTD.",
-        "LT.BO": "LARSEN & TOUBRO LTD.",
-        "LUDLOWJUT.BO": "Ludlow Jute & Specialities Ltd.",
-        "LUPIN$QF.BO": "LUPIN LTD",
-        "LUPIN.BO": "Lupin Limited",
-        "LUSTRTI.BO": "LUSTRE TILES LTD.",
-        "LWSKNIT.BO": "LWS KNITWEAR LTD.",
-        "LYCOS.BO": "Lycos Internet Limited",
-        "LYKALABS.BO": "LYKA LABS LTD.",
-        "LYKISLTD.BO": "LYKIS LIMITED",
-        "LYONSCO.BO": "LYONS CORPORATE MARKET LTD.",
-        "M&M.BO": "MAHINDRA & MAHINDRA LTD.",
-        "M100.BO": "MOTILAL OSWAL MUTUAL FUND - MO",
-        "M50.BO": "MOTILAL OSWAL MUTUAL FUND",
-        "MAAJTL.BO": "MAA JAGDAMBE TRADELINKS LIMITE",
-        "MAALFNC.BO": "MAA LEAFIN & CAPITAL LTD.",
-        "MAARSOFTW6.BO": "MAARSOFTW6.BO",
-        "MACKINN.BO": "MACKINNON MACKENZIE & CO.LTD.",
-        "MADHAV.BO": "MADHAV MARBLES & GRANITES LTD.",
-        "MAESTROBBPH.BO": "Maestros Medi*",
-        "MAFLU.BO": "MAFATLAL LUBRICANTS LTD.",
-        "MAGMA.BO": "MAGMA FINCORP LTD.",
-        "MAGMA6.BO": "MAGMA6.BO",
-        "MAGNACOL.BO": "MAGNA COLORS LTD.",
-        "MAGNAELQ.BO": "Magna Electro Castings Ltd.",
-        "MAGNUM.BO": "Magnum Limited",
-        "MAGNUML.BO": "MAGNUM LTD.",
-        "MAHABIR.BO": "SVP HOUSING LTD",
-        "MAHACORP.BO": "MAHARASHTRA CORPORATION LTD.",
-        "MAHAINV.BO": "Millennium Online Solutions (India) Limited",
-        "MAHALXSE.BO": "Mahalaxmi Seamless Ltd.",
-        "MAHAN.BO": "Mahanivesh (India) Limited",
-        "MAHAPEXLTD.BO": "MAHA RASHTRA APEX CORPORATION",
-        "MAHAPOL.BO": "Maharashtra Polybutenes Ltd.",
-        "MAHAREM.BO": "MAHAVIR ADVANCED REMEDIES LTD.",
-        "MAHAV.BO": "Mahavir Impex Ltd.",
-        "MAHAXPO.BO": "MAHARASHTRA EXPLOSIVES LTD.",
-        "MAHSCOOTER.BO": "Maharashtra Scooters Ltd.",
-        "MAHSEAMBBPH.BO": "MAHSEAM*",
-        "MAHSEAMLES.BO": "Maharashtra Seamless Limited",
-        "MAKERSL.BO": "Makers Laboratories Limited",
-        "MALLCOM.BO": "MALLCOM (INDIA) LTD.",
-        "MANAKSIA.BO": "Manaksia Limited",
-        "MANGALW.BO": "MANGALWEDHA SUN-SOYA LTD.",
-        "MANGTIMBER.BO": "MANGALAM TIMBER PRODUCTS LTD.",
-        "MANORG.BO": "MANGALAM ORGANICS LIMITED",
-        "MANSCRP.BO": "MANSAROVARPA",
-        "MANUGRAPH.BO": "MANUGRAPH INDIA LTD.",
-        "MARALOVER.BO": "MARAL OVERSEAS LTD.",
-        "MARATHR.BO": "Marathwada Refractories Ltd.",
-        "MARG.BO": "MARG LTD.",
-        "MARICO.BO": "Marico Limited",
-        "MARIS.BO": "Maris Spinners Ltd.",
-        "MARUTI.BO": "Maruti Suzuki India Limited",
-        "MARVINY.BO": "MARVEL VINYLS LTD.",
-        "MASCONGLO.BO": "MASCON GLOBAL LTD.",
-        "MASTEK.BO": "Mastek Limited",
-        "MASTEK6.BO": "MASTEK6.BO",
-        "MASTEKLBBPH.BO": "MASTEKLTD*",
-        "MASTERTR.BO": "Master Trust Limited",
-        "MATRUTR.BO": "ABANS ENTERPRISES LIMITED",
-        "MAYARAS.BO": "MAYA RASAYAN LTD.",
-        "MAYASPN.BO": "MAYA SPINNERS LTD.",
-        "MAYHO.BO": "MAYHO.BO",
-        "MAYUKH.BO": "Mayukh Dealtrade Limited",
-        "MAYUR.BO": "Mayur Leather Products Ltd.",
-        "MAYURFL.BO": "MAYUR FLOORINGS LTD.",
-        "MAYURUNIQ.BO": "MAYUR UNIQUOTERS LTD.",
-        "MAZDALTD.BO": "Mazda Ltd",
-        "MAZDAPR.BO": "MAZDA PROPERTIES LTD.",
-        "MBPARIKH.BO": "M.B. Parikh Finstocks Limited",
-        "MCCHRLS-B.BO": "Mac Charles (India) Ltd.",
-        "MCCIL.BO": "M.C.C.INVESTMENT & LEASING CO.",
-        "MCLEODRUSS.BO": "MCLEOD RUSSEL INDIA LTD.",
-        "MCSLTD.BO": "MCS Limited",
-        "MCX6.BO": "MCX6.BO",
-        "MDINDUCTO.BO": "M.D. Inducto Cast Limited",
-        "MDRNSUT-B.BO": "MODERN DENIM LTD.",
-        "MDRNSYN-B.BO": "MODERN SYNTEX (INDIA) LTD.",
-        "MDRNTHR-B.BO": "MODERN THREADS (INDIA) LTD.",
-        "MDRPTRO.BO": "MADRAS PETRO-CHEM LTD.",
-        "MDTERYT-B.BO": "MODERN TERRY TOWELS LTD.",
-        "MEDICAPQ.BO": "Medi-Caps Limited",
-        "MEDINOV.BO": "Medinova Diagnostic Services Limited",
-        "MEFCOMCAP.BO": "Mefcom Capital Markets Limited",
-        "MEGACOR.BO": "Mega Corporation Ltd.",
-        "MEGFI.BO": "MEGA FIN (INDIA) LTD.",
-        "MEGH.BO": "Meghmani Organics Limited",
-        "MEGLON.BO": "MEGLON INFRA-REAL (INDIA) LTD.",
-        "MEGRISOFT.BO": "Megri Soft Limited",
-        "MEL.BO": "Meenakshi Enterprises Ltd.",
-        "MENNPIS.BO": "Menon Pistons Ltd.",
-        "MENONBE.BO": "Menon Bearings Ltd.",
-        "MERCATOR.BO": "MERCATOR LTD.",
-        "MERCATOR6.BO": "MERCATOR6.BO",
-        "MERCK.BO": "Merck Ltd.",
-        "MERCKBBPH.BO": "MERCKLTD*",
-        "MERCTRD.BO": "MERCURY TRADE LINKS LTD.",
-        "MERCURYLAB.BO": "Mercury Laboratories Limited",
-        "METROGLOBL.BO": "METROGLOBAL LIMITED",
-        "METROOV.BO": "METROPOLI OVERSEAS LTD.",
-        "MEUSEKARA.BO": "MEUSE KARA & SUNGRACE MAFATLAL",
-        "MEWARPOL.BO": "Mewar Polytex Limited",
-        "MFLINDIA.BO": "MFL INDIA LTD.",
-        "MFSINTRCRP.BO": "MFS INTERCORP LTD.",
-        "MGOLD.BO": "MOTILAL OSWAL MOST SHARES GOLD",
-        "MHECKMT.BO": "MOHATTA & HECKEL LTD.",
-        "MHGTCXT.BO": "MAHAGANESH TEXPRO LTD.",
-        "MHRIL.BO": "Mahindra Holidays and Resorts India Ltd.",
-        "MHSGRMS.BO": "Mahasagar Travels Ltd.",
-        "MHTSULF-B.BO": "MEHTA SULFITES (INDIA) LTD.",
-        "MICROMT.BO": "MICRO FORGE (INDIA) LTD.",
-        "MICROPL-B.BO": "MICRO PLANTAE LTD.",
-        "MICROSE.BO": "MICROSE INDIA LTD.",
-        "MIDESTI-B.BO": "MIDEAST (INDIA) LTD.",
-        "MIDINFRA.BO": "MIDAS INFRA TRADE LIMITED",
-        "MIDWEST.BO": "MIDWEST GOLD LTD.",
-        "MIHIJAM.BO": "MIHIJAM VANASPATI LTD.",
-        "MILESTONE.BO": "Milestone Global Ltd",
-        "MINDACORP.BO": "Minda Corporation Limited",
-        "MINDTECK.BO": "Mindteck (India) Limited",
-        "MINDTREE.BO": "MindTree Limited",
-        "MINDTREE4.BO": "MINDTREE LTD",
-        "MINDVISCAP.BO": "MINDVISION CAPITAL LTD",
-        "MINFY.BO": "Mahaveer Infoway Limited",
-        "MINISOFT.BO": "MINI SOFT LTD.",
-        "MIRZAINT.BO": "MIRZA INTERNATIONAL LTD.",
-        "MISHKA.BO": "Mishka Exim Limited",
-        "MITL.BO": "MAHADUSHI INTERNATIONAL TRADE",
-        "MITSHI.BO": "Mitshi India Limited",
-        "MJCO.BO": "MAJESCO LIMITED",
-        "MKEL.BO": "MATRA KAUSHAL ENTERPRISE LIMIT",
-        "MKEXIM.BO": "M.K. Exim (India) Limited",
-        "MKTCREAT.BO": "Market Creators Limited",
-        "MMFL.BO": "M.M.FORGINGS LTD.",
-        "MMLF.BO": "MONEY MASTERS LEASING & FINANC",
-        "MMTC.BO": "MMTC Ltd.",
-        "MMTC4.BO": "MMTC4.BO",
-        "MNAKSIABBPH.BO": "MANAKSIA LT*",
-        "MNYRPLA-B.BO": "MANIYAR PLAST LTD.",
-        "MODAIRY.BO": "Modern Dairies Limited",
-        "MODERN.BO": "Modern India Ltd",
-        "MODI.BO": "PINCON LIFESTYLE LTD",
-        "MODIHOOV.BO": "MODI HOOVER INTERNATIONAL LTD.",
-        "MODINATUR.BO": "MODI NATURALS LIMITED",
-        "MODINSU.BO": "MODERN INSULATORS LTD.",
-        "MODIPON.BO": "Modipon Ltd.",
-        "MODISTO.BO": "MODISTO.BO",
-        "MODITHR.BO": "MODI TELE FIBRES LTD.",
-        "MODMA.BO": "MODERN MALLEABLES LTD.",
-        "MODRNSH.BO": "Modern Shares & Stockbrokers Ltd",
-        "MODWOOL.BO": "Modella Woollens Limited",
-        "MOH.BO": "MOH LTD.",
-        "MONARCH.BO": "Monarch Networth Capital Limit",
-        "MONETBBPH.BO": "MONNETISP*",
-        "MONEYCF.BO": "MONEYCF.BO",
-        "MONNETISPA6.BO": "MONNETISPA6.BO",
-        "MONOT.BO": "Monotype India Ltd.",
-        "MONOZYM.BO": "MONOZYME INDIA LTD.",
-        "MONSANTO.BO": "Monsanto India Limited",
-        "MONSANTO6.BO": "MONSANTO6.BO",
-        "MORGANITE.BO": "Morganite Crucible India Ltd",
-        "MOSERBAER.BO": "Moser-Baer India Ltd.",
-        "MOTILALBBPH.BO": "MOTILALOFS*",
-        "MOVINGPI.BO": "Moving Picture Co. (India) Ltd.",
-        "MPCOSEMB.BO": "MIPCO SEAMLESS RINGS (GUJARAT)",
-        "MPHASIS.BO": "MphasiS Limited",
-        "MPHASIS6.BO": "MPHASIS6.BO",
-        "MPILCORPL.BO": "MPIL Corporation Limited",
-        "MPSLTD.BO": "MPS Limited",
-        "MPTELE.BO": "M.P.TELELINKS LTD.",
-        "MRF.BO": "MRF Ltd.",
-        "MRPL6.BO": "MRPL6.BO",
-        "MRSS.BO": "Majestic Research Services and",
-        "MRUTIOR--.BO": "MARUTI ORGANICS LTD.",
-        "MSCTC.BO": "Mardia Samyoung Capillary Tubes Company Ltd.",
-        "MSRINDIA.BO": "MSR INDIA LTD.",
-        "MTEDUCARE.BO": "MT EDUCARE LTD.",
-        "MTNL.BO": "Mahanagar Telephone Nigam Limited",
-        "MUDITFN.BO": "Mudit Finlease Ltd.",
-        "MUKANDENGG.BO": "MUKAND ENGINEERS LTD.",
-        "MUKANDLTD.BO": "Mukand Limited",
-        "MUKATPIP.BO": "Mukat Pipes Ltd",
-        "MUKPP.BO": "MUKTA ART PP",
-        "MUKSTRI.BO": "Mukesh Strips Ltd",
-        "MUKSYNT.BO": "MUKUND SYNTEX LTD.",
-        "MUKTAARTS.BO": "Mukta Arts Ltd",
-        "MUL.BO": "MAURIA UDYOG LIMITED",
-        "MULCOFF.BO": "MULTICOLOUR OFFSET LTD.",
-        "MULLER.BO": "Muller & Phipps (India) Limited",
-        "MULTIARC.BO": "MULTI-ARC INDIA LTD.",
-        "MULTIBASE.BO": "Multibase India Ltd",
-        "MUNCAPM.BO": "Munoth Capital Market Limited",
-        "MUNISFG.BO": "MUNIS FORGE LTD.",
-        "MUNJALSHOW.BO": "MUNJAL SHOWA LTD.",
-        "MURABLK.BO": "MURABLACK INDIA LTD.",
-        "MUTHTFN.BO": "Muthoot Capital Services Ltd.",
-        "MVCOTSP.BO": "MV COTSPIN LTD.",
-        "MVL.BO": "MVL Limited",
-        "MWTEXX.BO": "MW UNITEXX LTD.",
-        "N100.BO": "MOTILAL OSWAL MOST SHARES NASD",
-        "NACHKNIT.BO": "NACHMO KNITEX LTD.",
-        "NAGREEKCAP.BO": "NAGREEKA CAPITAL & INFRASTRUCT",
-        "NAINAMS.BO": "NAINA SEMICONDUCTOR LTD.",
-        "NAKODA.BO": "NAKODA LIMITED",
-        "NARPROP.BO": "Narendra Properties Ltd.",
-        "NATCAPSUQ.BO": "Natural Capsules Ltd.",
-        "NATECO.BO": "Natco Economicals Limited",
-        "NATFIT.BO": "NATIONAL FITTINGS LIMITED",
-        "NATHBIOGEN.BO": "NATH BIO-GENES (INDIA) LTD",
-        "NATHUEC.BO": "Natura Hue Chem Ltd.",
-        "NATIONALUM6.BO": "NATIONALUM6.BO",
-        "NATIONSTD.BO": "NATIONAL STANDARD (INDIA) LTD.",
-        "NATNSWI.BO": "NATIONAL SWITCHGEARS LTD.",
-        "NATPEROX.BO": "National Peroxide Limited",
-        "NATRAJPR.BO": "Natraj Proteins Ltd.",
-        "NAUKRI.BO": "Info Edge (India) Limited",
-        "NAUKRI6.BO": "NAUKRI6.BO",
-        "NAVIGANT.BO": "Navigant Corporate Advisors Li",
-        "NAVINFLUOR.BO": "NAVIN FLUORINE INTERNATIONAL L",
-        "NAVKARCORP.BO": "Navkar Corporation Limited",
-        "NAVKETAN.BO": "Navketan Merchants Limited",
-        "NBCC.BO": "NBCC (India) Limited",
-        "NBFOOT.BO": "NB Footwear Limited",
-        "NCC.BO": "NCC LIMITED",
-        "NCJINPP.BO": "NCJ INTER PP",
-        "NDL.BO": "NANDAN DENIM LIMITED",
-        "NECCLTD.BO": "NORTH EASTERN CARRYING CORPORA",
-        "NECLIFE.BO": "Nectar Lifesciences Limited",
-        "NEELKAN.BO": "Neelkanth Rockminerals Ltd.",
-        "NEHAINT.BO": "NEHA INTERNATIONAL LTD.",
-        "NELCAST.BO": "Nelcast Limited",
-        "NELCO.BO": "Nelco Limited",
-        "NEOCORP.BO": "Neo Corp International Ltd",
-        "NEOINFRA.BO": "NEO INFRACON LTD.",
-        "NEPCMICON.BO": "NEPC INDIA LTD.",
-        "NESCO.BO": "NESCO LTD.",
-        "NESTLEIND.BO": "NESTLE INDIA LTD.",
-        "NESTLEIND6.BO": "NESTLEIND6.BO",
-        "NET4.BO": "NET4.BO",
-        "NETLINK.BO": "Netlink Solutions India Ltd",
-        "NETTLINX.BO": "Nettlinx Ltd",
-        "NETWORK.BO": "Network Limited",
-        "NETWORK186.BO": "NETWORK186.BO",
-        "NETWORTH.BO": "Monarch Networth Capital Limited",
-        "NEULANDLAB.BO": "NEULAND LABORATORIES LTD.",
-        "NEWEVER.BO": "NEWEVER TRADE WINGS LTD",
-        "NEWMKTADV.BO": "NEW MARKETS ADVISORY LTD.",
-        "NEXXOFT.BO": "Nexxoft Infotel Ltd",
-        "NEYCERI.BO": "NEYCER INDIA LTD.",
-        "NEYVELILIG.BO": "Neyveli Lignite Corporation Limited",
-        "NGARJNG.BO": "NAGARJUNA GRANITES LTD.",
-        "NGLFINE.BO": "NGL Fine-Chem Ltd.",
-        "NH.BO": "Narayana Hrudayalaya Limited",
-        "NHPC.BO": "NHPC Ltd.",
-        "NICCO.BO": "NICCO CORPORATION LTD.",
-        "NICCOPAR.BO": "Nicco Parks & Resorts Limited",
-        "NIDHGRN.BO": "Nidhi Granites Limited",
-        "NIFTYBEES.BO": "Goldman Sachs Mutual Fund - Goldman Sachs Nifty Exchange Traded Scheme",
-        "NIFTYEES.BO": "Edelweiss ETF- Nifty 50",
-        "NIHARINF.BO": "Nihar Info Global Ltd",
-        "NIITLTD.BO": "NIIT LTD.",
-        "NIKHILAD.BO": "Nikhil Adhesives Ltd.",
-        "NILACHAL.BO": "NILACHAL REFRACTORIES LTD.",
-        "NILE.BO": "Nile Ltd.",
-        "NILKAMAL.BO": "Nilkamal Limited",
-        "NIPPOBATRY.BO": "INDO-NATIONAL LTD.",
-        "NIRAVCOM.BO": "Nirav Commercials Limited",
-        "NIRLON.BO": "Nirlon Ltd.",
-        "NITCO.BO": "Nitco Limited",
-        "NITESHEST.BO": "NITESH ESTATES LTD",
-        "NITINBBPH.BO": "NITINFIRE*",
-        "NITINFIRE6.BO": "NITINFIRE6.BO",
-        "NITINSPIN.BO": "Nitin Spinners Ltd.",
-        "NITTAGELA.BO": "Nitta Gelatin India Limited",
-        "NMDC.BO": "NMDC LTD.",
-        "NOBLEXP.BO": "Noble Explochem Ltd.",
-        "NOCIL.BO": "NOCIL Limited",
-        "NOGMIND.BO": "Neogem India Ltd.",
-        "NOIDATOLL.BO": "NOIDA TOLL BRIDGE COMPANY LTD.",
-        "NOIMC.BO": "Noida Medicare Centre Ltd",
-        "NOL.BO": "NATIONAL OXYGEN LTD.",
-        "NORTHLINK.BO": "Northlink Fiscal And Capital S",
-        "NOVAGOLD.BO": "NovaGold Petro Resources Ltd",
-        "NOVARTIND.BO": "NOVARTIS INDIA LTD.",
-        "NOVARTIND6.BO": "NOVARTIND6.BO",
-        "NRBBEARING.BO": "NRB BEARINGS LTD.",
-        "NRC.BO": "NRC Ltd.",
-        "NRINTER.BO": "NR International Ltd.",
-        "NTPC.BO": "NTPC Ltd.",
-        "NUBALIN.BO": "NUBAL (INDIA) LTD.",
-        "NUCHEM.BO": "NUCHEM LTD.",
-        "NUMEM.BO": "NUMECH EMBALLAGE LTD.",
-        "NUTEK.BO": "Nu Tek India Ltd",
-        "NUTRA.BO": "NUTRAPLUS INDIA LTD",
-        "NUTRICIRCLE.BO": "Nutricircle Limited",
-        "NUWAY.BO": "NUWAY ORGANIC NATURALS INDIA L",
-        "NYLOFIL.BO": "NYLOFIL.BO",
-        "NYSSACORP.BO": "NYSSA CORPORATION LIMITED",
-        "OASIS.BO": "OASIS TRADELINK LTD",
-        "OBRSESY.BO": "Overseas Synthetics Ltd.",
-        "OCL.BO": "OCL India Limited",
-        "ODYCORP.BO": "Odyssey Corporation Ltd",
-        "OFSS6.BO": "OFSS6.BO",
-        "OKPLA.BO": "OK Play India Limited",
-        "OLPCL.BO": "OLYMPIC CARDS LTD.",
-        "OLYCAP.BO": "OLYMPIA CAPITALS LTD.",
-        "OMANSH.BO": "OMANSH ENTERPRISES LTD",
-        "OMAXE.BO": "Omaxe Ltd.",
-        "OMEGALAB.BO": "OMEGALAB.BO",
-        "OMKAR.BO": "Omkar Overseas Ltd",
-        "ONELIFECAP.BO": "ONELIFE CAPITAL ADVISORS LTD.",
-        "ONGC4.BO": "ONGC4.BO",
-        "ONIDA.BO": "ONIDA.BO",
-        "ONIDSAK.BO": "ONIDA SAKA LTD.",
-        "ONMOBBBPH.BO": "ONMOBGLO",
-        "OPCHAINS.BO": "O. P. Chains Limited",
-        "OPTIEMUS.BO": "OPTIEMUS INFRACOM LTD",
-        "OPTOCIRCUI.BO": "OPTO CIRCUITS (INDIA) LTD.",
-        "OPTOCIRCUI6.BO": "OPTOCIRCUI6.BO",
-        "ORBITCORP.BO": "ORBIT CORPORATION LTD.",
-        "ORBITPL.BO": "ORBIT POLYESTER LTD.",
-        "OREXTR.BO": "ORISSA EXTRUSIONS LTD.",
-        "ORGINFO.BO": "ORG INFORMATICS LTD.",
-        "ORICON.BO": "Oricon Enterprises Limited",
-        "ORIENTABRA.BO": "ORIENT ABRASIVES LTD.",
-        "ORIENTALTL.BO": "ORIENTAL TRIMEX LTD.",
-        "ORIENTBELL.BO": "ORIENT BELL LIMITED",
-        "ORIENTLTD.BO": "ORIENT PRESS LTD.",
-        "ORIENTREF.BO": "ORIENT REFRACTORIES LTD.",
-        "ORIENTTR.BO": "ORIENT TRADELINK LTD.",
-        "ORIQUAL.BO": "ORIQUAL.BO",
-        "ORIREME.BO": "ORIENTAL REMEDIES & HERBALS LT",
-        "ORNTSYN.BO": "ORNTSYN.BO",
-        "OROSMITHS.BO": "OROSIL SMITHS INDIA LTD.",
-        "ORTIN.BO": "Ortin Laboratories Ltd.",
-        "ORTINLAABS.BO": "ORTIN LABORATORIES LTD",
-        "ORVENPR.BO": "Oriental Veneer Products Ltd.",
-        "OSCARGLO.BO": "Oscar Global Ltd.",
-        "OSEASPR.BO": "OSEASPRE CONSULTANTS LTD.",
-        "OSWALEA.BO": "OSWAL LEASING LTD.",
-        "OSWALOR.BO": "Oswal Overseas Limited",
-        "OTCO.BO": "OTCO International Ltd.",
-        "OXIDE.BO": "OXIDES & SPECIALITIES LTD.",
-        "OZONEWORLD.BO": "Ozone World Limited",
-        "PAEL.BO": "PAE Ltd.",
-        "PANACEABBPH.BO": "PANACEA BIO*",
-        "PANACEABIO.BO": "Panacea Biotec Ltd.",
-        "PANAMABBPH.BO": "PANAMA*",
-        "PANAMAPET.BO": "PANAMA PETROCHEM LTD.",
-        "PANASONIC.BO": "Panasonic Appliances India Company Limited",
-        "PANCARBON.BO": "PANASONIC CARBON INDIA CO.LTD.",
-        "PANCHSHEEL.BO": "PANCHSHEEL ORGANICS LTD.",
-        "PANINDIAC.BO": "PAN India Corporation Ltd.",
-        "PANJON.BO": "PANJON LTD.",
-        "PANKAJPIYUS.BO": "Pankaj Piyush Trade & Inv. Ltd",
-        "PANKAJPOLY.BO": "PANKAJ POLYPACK LTD.",
-        "PANORAMUNI.BO": "PANORAMIC UNIVERSAL LTD.",
-        "PAPERPROD.BO": "Huhtamaki PPL Limited",
-        "PARAL.BO": "Parekh Aluminex Limited",
-        "PARASPETRO.BO": "PARAS PETROFILS LTD.",
-        "PARDI.BO": "PAREKH DISTRIBUTORS LTD.",
-        "PAREKHPLAT.BO": "PAREKH PLATINUM LTD.",
-        "PARHOSG.BO": "PARTH HOUSING AND ESTATE DEVEL",
-        "PARIKSHA.BO": "Pariksha Fin-Invest-Lease Limi",
-        "PARINFRA.BO": "PARAB INFRA LIMITED",
-        "PARMCOS-B.BO": "Paramount Cosmetics (India) Limited",
-        "PARNAXLAB.BO": "PARNAX LAB LTD.",
-        "PARSHWANA.BO": "PARSHWANATH CORPORATION LTD.",
-        "PARSOLI.BO": "PARSOLI CORPORATION LTD.",
-        "PARTANI.BO": "Partani Appliances Limited",
-        "PARTHAL.BO": "Parth Alluminium Limited",
-        "PASCHIM.BO": "PASCHIM PETROCHEM LTD.",
-        "PASHUSEO.BO": "PASHUPATI SEOHUNG LTD.",
-        "PASUFIN.BO": "Pasupati Fincap Ltd.",
-        "PASUPTAC.BO": "Pasupati Acrylon Ltd.",
-        "PATELSAI.BO": "Patels Airtemp (India) Limited",
-        "PATIDAR.BO": "PATIDAR BUILDCON LIMITED",
-        "PATSPINLTD.BO": "PATSPIN INDIA LTD.",
-        "PAUSHAKLTD.BO": "Paushak Limited",
-        "PBMPOLY.BO": "PBM Polytex Limited",
-        "PCCOSMA.BO": "Pee Cee Cosma Sope Ltd.",
-        "PCJEWELLER.BO": "PC JEWELLER LTD.",
-        "PCPROD.BO": "PC Products India Limited",
-        "PEL.BO": "PIRAMAL ENTERPRISES LTD.",
-        "PENARINBBPH.BO": "PENNAR IND*",
-        "PENINLAND.BO": "PENINSULA LAND LTD.",
-        "PENINLAND6.BO": "PENINLAND6.BO",
-        "PENNARBBPH.BO": "PENNARIND*",
-        "PENPEBS.BO": "Pennar Engineered Building Sys",
-        "PENTAGLO.BO": "PENTAGON GLOBAL SOLUTIONS LTD.",
-        "PENTFOR-B.BO": "PENTAFOUR PRODUCTS LTD.",
-        "PERFEPA.BO": "Perfectpac Ltd.",
-        "PERMAGN.BO": "Permanent Magnets Limited",
-        "PERVASIVE.BO": "Pervasive Commodities Limited",
-        "PETRONET.BO": "Petronet LNG Ltd.",
-        "PFIZER.BO": "Pfizer Limited",
-        "PFIZER6.BO": "PFIZER6.BO",
-        "PFOCUS.BO": "Prime Focus Limited",
-        "PGEL.BO": "PG ELECTROPLAST LTD.",
-        "PGHH.BO": "PROCTER & GAMBLE HYGIENE & HEA",
-        "PGHH6.BO": "PGHH6.BO",
-        "PGINDST.BO": "PG INDUSTRY LTD.",
-        "PHCAP.BO": "PH Capital Ltd.",
-        "PHELAPP.BO": "PHELIX APPLIANCES LTD.",
-        "PHILIPCARB.BO": "PHILLIPS CARBON BLACK LTD.",
-        "PHOENIXLL.BO": "PHOENIX LAMPS LIMITED",
-        "PHOENIXLTD.BO": "THE PHOENIX MILLS LTD",
-        "PHOENIXTN.BO": "PHOENIX TOWNSHIP LTD",
-        "PHOENXINTL.BO": "PHOENIX INTERNATIONAL LTD.",
-        "PHOTON.BO": "Photon Capital Advisors Ltd.",
-        "PHOTOQUP.BO": "Photoquip India Ltd.",
-        "PHRMASI.BO": "Phaarmasia Limited",
-        "PHYTO.BO": "Phyto Chem (India) Limited",
-        "PILITA.BO": "Pil Italica Lifestyle Limited",
-        "PINCON.BO": "Pincon Spirit Limited",
-        "PINEANIM.BO": "PINE ANIMATION LIMITED",
-        "PIONDIST.BO": "PIONEER DISTILLERIES LTD.",
-        "PIONEEREMB.BO": "PIONEER EMBROIDERIES LTD.",
-        "PIONRINV.BO": "Pioneer Investcorp Limited",
-        "PIPAVAVDOC.BO": "RELIANCE DEFENCE AND ENGINEERIN",
-        "PIPAVAVDOC6.BO": "PIPAVAVDOC6.BO",
-        "PIRPHYTO.BO": "PIRAMAL PHYTOCARE LIMITED",
-        "PITHP.BO": "Pithampur Poly Products Ltd",
-        "PITTILAM.BO": "PITTI LAMINATIONS LTD.",
-        "PIXTRANS.BO": "Pix Transmissions Ltd.",
-        "PLASTIBLEN.BO": "PLASTIBLENDS INDIA LTD.",
-        "PLATINUM.BO": "PLATINUM CORPORATION LTD.",
-        "PMCFIN.BO": "PMC FINCORP LIMITED",
-        "PML.BO": "Paul Merchants Ltd.",
-        "PMTELELIN.BO": "PM Telelinnks Ltd",
-        "PNBGILTS.BO": "PNB Gilts Ltd.",
-        "PNC6.BO": "PNC6.BO",
-        "PNTKYOR.BO": "Pentokey Organy (India) Limited",
-        "PNTSF6.BO": "PNTSF6.BO",
-        "PODDARBBPH.BO": "PODDAR PIG*",
-        "POEL.BO": "POCL ENTERPRISES LTD",
-        "POKARNA.BO": "Pokarna Ltd.",
-        "POLSON.BO": "Polson Ltd.",
-        "POLYCHEM.BO": "Polychem Ltd.",
-        "POLYCHMP.BO": "Polymechplast Machines, Ltd.",
-        "POLYCON.BO": "Polycon International Ltd.",
-        "POLYMAC.BO": "POLYMAC THERMOFORMERS LTD",
-        "POLYMED.BO": "POLY MEDICURE LTD.",
-        "POLYPLEX.BO": "Polyplex Corporation Limited",
-        "POLYTEX.BO": "POLYTEX INDIA LTD.",
-        "POPULARES.BO": "Popular Estate Management Ltd.",
-        "PRADIP.BO": "Pradip Overseas Limited",
-        "PRAENG.BO": "PRAJAY ENGINEERS SYNDICATE LTD",
-        "PRAGBOS.BO": "Prag Bosimi Synthetics Ltd.",
-        "PRAJIND6.BO": "PRAJIND6.BO",
-        "PRAJINDBBPH.BO": "PRAJIND",
-        "PRAKASHCON.BO": "PRAKASH CONSTROWELL LTD.",
-        "PRAKSOV.BO": "PRAKASH SOLVENT EXTRACTIONS LT",
-        "PRALE.BO": "PRAKASH LEASING LTD.",
-        "PRAMANC.BO": "PRAMAN CAPITAL MARKET SERVICES",
-        "PRAMFIN.BO": "PRAMADA FINVEST LTD.",
-        "PRATIK.BO": "Pratik Panels Ltd.",
-        "PRAVEEN.BO": "PRAVEEN PROPERTIES LTD.",
-        "PRECAM.BO": "Precision Camshafts Limited",
-        "PRECISION.BO": "Precision Containeurs Limited",
-        "PREMCAP.BO": "Premier Capital Services Limited",
-        "PREMCO.BO": "Premco Global Ltd.",
-        "PREMEXPLQ.BO": "Premier Explosives Limited",
-        "PREMIER.BO": "Premier Ltd.",
-        "PREMIERPOL.BO": "PREMIER POLYFILM LTD.",
-        "PREMIND.BO": "PREMIND.BO",
-        "PREMKUT.BO": "PREM KUTIR ESTATES & PROPERTIE",
-        "PREMPIPES.BO": "PREMIER PIPES LTD.",
-        "PREMSYN.BO": "Premier Synthetics Ltd.",
-        "PRERINFRA.BO": "Prerna Infrabuild Limited",
-        "PRESISH.BO": "PRESISH.BO",
-        "PRESYNT.BO": "PREMIER SYNT",
-        "PRICOL.BO": "Pricol Ltd.",
-        "PRIMECAPM.BO": "PRIME CAPITAL MARKET LTD.",
-        "PRIMEPT.BO": "PRIME PETRO PRODUCTS LTD.",
-        "PRIMSOL.BO": "PRIME SOLVENT EXTRACTIONS LTD.",
-        "PRISMER.BO": "PRISMER.BO",
-        "PRISMINFO.BO": "Prism Informatics Ltd.",
-        "PRITHVI.BO": "Prithvi Information Solutions Limited",
-        "PRITHVISOF.BO": "PRITHVI EXCHANGE(INDIA) LTD",
-        "PRIYADSP.BO": "Priyadarsini Limited",
-        "PRIYALT.BO": "Priya Ltd.",
-        "PRIYANK.BO": "PRIYANKA UDYOG LTD.",
-        "PRIYFAB.BO": "PRIYADARSHINI FABS LTD.",
-        "PRMRPRT.BO": "PREMIER PROTEINS LTD.",
-        "PRMRVNY-B.BO": "PREMIER VINYL FLOORING LTD.",
-        "PROAIMENT.BO": "Proaim Enterprises Limited",
-        "PROFINC.BO": "Pro Fin Capital Services Ltd.",
-        "PROVEST.BO": "PROVESTMENT SERVICES LTD.",
-        "PROVOGE.BO": "PROVOGUE (INDIA) LTD.",
-        "PROVOGUBBPH.BO": "PROVOGUEIND*",
-        "PROZONINTU.BO": "PROZONINTU",
-        "PRSNTIN.BO": "PRASHANT INDIA LTD.",
-        "PRSRSYN-B.BO": "PARASRAMPURIA SYNTHETICS LTD.",
-        "PRSYNLT.BO": "PARAS SYN LT",
-        "PRSYNP1.BO": "PARAS SYN PP",
-        "PRWOLEN.BO": "Prakash Woollen & Synthetic Mills Limited",
-        "PSL.BO": "PSL LTD.",
-        "PSTL.BO": "PYRAMID SAIMIRA THEATRE LTD.",
-        "PTC.BO": "PTC India Limited",
-        "PTC6.BO": "PTC INDIA LTD",
-        "PTL.BO": "PTL Enterprises Limited",
-        "PULSRIN.BO": "PULSAR INTERNATIONAL LTD.",
-        "PUNEETRE.BO": "Rishiroop Limited",
-        "PUNFIBR.BO": "PUNJAB FIBRES LTD.",
-        "PUNITCO.BO": "Punit Commercials Ltd.",
-        "PUNJLLOYD.BO": "Punj Lloyd Ltd.",
-        "PUNJLLOYD4.BO": "PUNJLLOYD4.BO",
-        "PUNSUMI.BO": "PUNSUMI INDIA LTD.",
-        "PUNWOOLC.BO": "Punjab Woolcombers Limited",
-        "PURITY.BO": "Purity Flex Pack Ltd",
-        "PURSHOTTAM.BO": "PURSHOTTAM INVESTOFIN LTD",
-        "PURVA6.BO": "PURVA6.BO",
-        "PUSHPA.BO": "PUSHPANJALI FLORICULTURE LTD.",
-        "PVR.BO": "PVR Limited",
-        "PVRBBPH.BO": "PVR LTD*",
-        "PVVINFRA.BO": "PVV Infra Limited",
-        "PWASML.BO": "Prakash Woollen & Synthetic Mi",
-        "PYXISFIN.BO": "Pyxis Finvest Limited",
-        "QGOLDHALF.BO": "Quantum Mutual Fund - Quantum Gold Fund",
-        "QNIFTY.BO": "Quantum Mutual Fund - Quantum Index Fund",
-        "QUASAR.BO": "QUASAR INDIA LTD",
-        "QUINTEGRA.BO": "Quintegra Solutions Limited",
-        "RAAJMEDI.BO": "RAAJ MEDISAFE INDIA LTD.",
-        "RADGLOBAL.BO": "RADFORD GLOBAL LIMITED",
-        "RADICO.BO": "Radico Khaitan Ltd.",
-        "RADICO6.BO": "RADICO6.BO",
-        "RADRO.BO": "RADIANT ROTOGRAVURE LTD.",
-        "RAGHAVAEPL.BO": "RAGHAVA ESTATES AND PROPERTIES",
-        "RAGHUNAT.BO": "Raghunath International Ltd.",
-        "RAGHUSYN.BO": "Raghuvir Synthetics Ltd.",
-        "RAGHUTOB.BO": "R T C L Limited",
-        "RAHME.BO": "Rahul Merchandising Limited",
-        "RAIN6.BO": "RAIN6.BO",
-        "RAINBOWDQ.BO": "Rainbow Denim Ltd.",
-        "RAINBOWF.BO": "Rainbow Foundations Limited",
-        "RAINBRE.BO": "RAINBRE.BO",
-        "RAINCOBBPH.BO": "RAIN",
-        "RAIREKMOH.BO": "RAI SAHEB REKHCHAND MOHOTA SPG",
-        "RAJABAH.BO": "RAJA BAHADUR INTERNATIONAL LTD",
-        "RAJDHNIL.BO": "Allied Herbals Limited",
-        "RAJESHEXPO4.BO": "RAJESHEXPO4.BO",
-        "RAJGLOWIR.BO": "Rajratan Global Wire Limited",
-        "RAJKOTINV.BO": "Rajkot Investment Trust Limite",
-        "RAJKSYN.BO": "Rajkamal Synthetics Ltd.",
-        "RAJMALL.BO": "RAJESH MALLEABLES LTD.",
-        "RAJOOENG.BO": "Rajoo Engineers Ltd.",
-        "RAJPALAYAM.BO": "RAJAPALAYAM MILLS LTD.",
-        "RAJPOLY.BO": "RAJASTHAN POLYESTERS LTD.",
-        "RAJPUTANA.BO": "Rajputana Investment and Finan",
-        "RAJSOLV.BO": "RAJESH SOLVEX LTD.",
-        "RAJSPTR.BO": "Rajasthan Petro Synthetics Limited",
-        "RALEGRA.BO": "Ravileela Granites Ltd.",
-        "RALLIS.BO": "Rallis India Limited",
-        "RAMAPHO.BO": "Rama Phosphates Limited",
-        "RAMAVISION.BO": "RAMA VISION LTD.",
-        "RAMCOSUP.BO": "RAMCO SUPER LEATHERS LTD.",
-        "RAMGOPOLY.BO": "RAMGOPAL POLYTEX LTD.",
-        "RAMINFO.BO": "Raminfo Limited",
-        "RAMMA.BO": "Rammaica (India) Ltd.",
-        "RAMSTEL.BO": "RAMS TRANSFORMERS LTD.",
-        "RANBAXY.BO": "Ranbaxy Laboratories Ltd.",
-        "RANDER.BO": "Rander Corporation Ltd.",
-        "RANEENGINE.BO": "RANE ENGINE VALVE LTD.",
-        "RANKLIN.BO": "Ranklin Solutions Ltd.",
-        "RAPICUT.BO": "Rapicut Carbides Ltd.",
-        "RASIELEC.BO": "Rasi Electrodes Ltd.",
-        "RASOI.BO": "Rasoi Ltd.",
-        "RASOYPR.BO": "Rasoya Proteins Limited",
-        "RASSIREF.BO": "Raasi Refractories Ltd.",
-        "RATHIBAR.BO": "Rathi Bars Limited",
-        "RATHISPA.BO": "RATHI ISPAT LTD.",
-        "RATVA.BO": "RATTAN VANASPATI LTD.",
-        "RAUNAQEPC.BO": "Raunaq EPC International Limit",
-        "RAUNAQINTL.BO": "RAUNAQINTL.BO",
-        "RAVRAJI.BO": "RAVRAJ IMPEX LTD.",
-        "RAYLA.BO": "Raymed Labs Ltd.",
-        "RAYMOND.BO": "Raymond Limited",
-        "RAYMOND6.BO": "RAYMOND6.BO",
-        "RBL.BO": "RANE BRAKE LINING LTD.",
-        "RCAPBUILAD.BO": "RELIANCE MUTUAL FUND- RELIANCE",
-        "RCAPBUILAG.BO": "RELIANCE MUTUAL FUND- RELIANCE",
-        "RCAPBUILBD.BO": "RELIANCE MUTUAL FUND- RELIANCE",
-        "RCAPBUILBG.BO": "RELIANCE MUTUAL FUND- RELIANCE",
-        "RCAPBUILCD.BO": "Reliance Mutual Fund",
-        "RCAPBUILCG.BO": "Reliance Mutual Fund",
-        "RCAPBULADD.BO": "RELIANCE MUTUAL FUND - RELIANC",
-        "RCAPBULADG.BO": "RELIANCE MUTUAL FUND- RELIANCE",
-        "RCAPBULBDD.BO": "RELIANCE MUTUAL FUND - RELIANC",
-        "RCAPBULBDG.BO": "RELIANCE MUTUAL FUND- RELIANCE",
-        "RCAPBULCDD.BO": "Reliance Mutual Fund",
-        "RCAPBULCDG.BO": "Reliance Mutual Fund",
-        "RCBFIIAD.BO": "Reliance Mutual Fund",
-        "RCBFIIADD.BO": "Reliance Mutual Fund",
-        "RCBFIIADG.BO": "Reliance Mutual Fund",
-        "RCBFIIAG.BO": "Reliance Mutual Fund",
-        "RCBFIIBD.BO": "Reliance Mutual Fund",
-        "RCBFIIBDD.BO": "Reliance Mutual Fund",
-        "RCBFIIBDG.BO": "Reliance Mutual Fund",
-        "RCBFIIBG.BO": "Reliance Mutual Fund",
-        "RCBFIICD.BO": "Reliance Mutual Fund",
-        "RCBFIICDD.BO": "Reliance Mutual Fund",
-        "RCBFIICDG.BO": "Reliance Mutual Fund",
-        "RCBFIICG.BO": "Reliance Mutual Fund",
-        "RCBFIIIAD.BO": "Reliance Mutual Fund",
-        "RCBFIIIAG.BO": "Reliance Mutual Fund",
-        "RCBFIIIAX.BO": "Reliance Mutual Fund",
-        "RCBFIIIAZ.BO": "Reliance Mutual Fund",
-        "RCCL.BO": "Rajasthan Cylinders & Containe",
-        "RCL.BO": "Radhagobind Commercial Limited",
-        "RCLEDIIADD.BO": "RELIANCE CLOSE ENDED EQUITY FU",
-        "RCLEDIIADG.BO": "RELIANCE CLOSE ENDED EQUITY FU",
-        "RCLEDPLADD.BO": "RELIANCE MUTUAL FUND - RELIANC",
-        "RCLEDPLADG.BO": "RELIANCE MUTUAL FUND- RELIANCE",
-        "RCLEDPLBDD.BO": "RELIANCE MUTUAL FUND - RELIANC",
-        "RCLEDPLBDG.BO": "RELIANCE MUTUAL FUND- RELIANCE",
-        "RCLENDIIAD.BO": "RELIANCE CLOSE ENDED EQUITY FU",
-        "RCLENDIIAG.BO": "RELIANCE CLOSE ENDED EQUITY FU",
-        "RCLENDPLAD.BO": "RELIANCE MUTUAL FUND- RELIANCE",
-        "RCLENDPLAG.BO": "RELIANCE MUTUAL FUND- RELIANCE",
-        "RCLENDPLBD.BO": "RELIANCE MUTUAL FUND- RELIANCE",
-        "RCLENDPLBG.BO": "RELIANCE MUTUAL FUND- RELIANCE",
-        "RDBRL.BO": "RDB RASAYANS LTD.",
-        "RDEL.BO": "Reliance Defence and Engineeri",
-        "REALSTR.BO": "Real Strips Limited",
-        "RECLTD.BO": "Rural Electrification Corporation Limited",
-        "RECLTD4.BO": "RECLTD4.BO",
-        "REDINGTON.BO": "Redington (India) Ltd.",
-        "REGENTRP.BO": "Regent Enterprises Limited",
-        "REGTRUS.BO": "Regency Trust Ltd.",
-        "RELAXO.BO": "Relaxo Footwears Limited",
-        "RELCAPITAL.BO": "Reliance Capital Limited",
-        "RELCNX100.BO": "RELIANCE MUTUAL FUND - R SHARE",
-        "RELCNXINAV.BO": "i-NAV RELIANCE CNX100",
-        "RELGOLD.BO": "Reliance Mutual Fund - R* Shares Gold ETF",
-        "RELGOLDINAV.BO": "i-NAV RELIANCE GOLD",
-        "RELIANCE4.BO": "RELIANCE4.BO",
-        "RELIGARE.BO": "Religare Enterprises Limited",
-        "RELINDBBPH.BO": "RELIANCIND*",
-        "RELINFBBPH.BO": "RELINFBBPH*",
-        "RELNFTYINAV.BO": "i-NAV RELIANCE NIFTY",
-        "RELNIFTY.BO": "RELIANCE MUTUAL FUND - R SHARE",
-        "RELSENSEX.BO": "Reliance Mutual Fund",
-        "RELSIND.BO": "RELSON INDIA LTD.",
-        "RELSNSXINAV.BO": "i-NAV RELIANCE SENSEX",
-        "REMIEDEL.BO": "Remi Edelstahl Tubulars Ltd",
-        "RENUKA6.BO": "RENUKA6.BO",
-        "REPRO.BO": "Repro India Limited",
-        "RESONANCE.BO": "Resonance Specialties Limited",
-        "RESPONSINF.BO": "RESPONSE INFORMATICS LTD",
-        "RETIFNL.BO": "REALTIME FINLEASE LTD.",
-        "REVAORG.BO": "REVATI ORGANICS LTD.",
-        "RFLINT.BO": "RFL International Ltd",
-        "RGCEL.BO": "Real Growth Commercial Enterpr",
-        "RGF.BO": "RGF Capital Markets Limited",
-        "RHNISTR.BO": "ROHINI STRIPS LTD.",
-        "RHUTUDY.BO": "RHUTU UDYOG (INDIA) LTD.",
-        "RICHUNV.BO": "RICH UNIVERSE NETWORK LTD.",
-        "RICOHQ.BO": "Ricoh India Limited",
-        "RIDDHI.BO": "Riddhi Siddhi Gluco Biols Limited",
-        "RIDHISYN.BO": "RIDHI SYNTHETICS LTD.",
-        "RIR.BO": "Ruttonsha International Rectifier Ltd.",
-        "RISAINTL.BO": "RISA INTERNATIONAL LTD.",
-        "RISHILASE.BO": "Rishi Laser Ltd",
-        "RISHIROOP.BO": "Rishiroop Limited",
-        "RITESHIN.BO": "Ritesh International Ltd.",
-        "RJKMRFR.BO": "Rajkumar Forge Ltd.",
-        "RJNIEXT.BO": "TROMBO EXTRACTIONS LTD",
-        "RJSHAH.BO": "R.J.SHAH & CO.LTD.",
-        "RKDL.BO": "RAVI KUMAR DISTILLERIES LTD.",
-        "RKFORGE.BO": "Ramkrishna Forgings Limited",
-        "RLF.BO": "RLF Ltd.",
-        "RLL.BO": "ROSELABS LTD.",
-        "RMCL.BO": "Radha Madhav Corp. Ltd.",
-        "RML.BO": "RANE (MADRAS) LTD.",
-        "RMMIL.BO": "RESURGERE MINES & MINERALS IND",
-        "RNBDENIMS.BO": "R&B DENIMS LTD",
-        "RNRL.BO": "RELIANCE NATURAL RESOURCES LTD",
-        "ROCKONENT.BO": "Rockon Enterprises Limited",
-        "ROCKONFIN.BO": "ROCKONFIN.BO",
-        "ROCKTHR.BO": "ROCKLAND THERMIONICS LTD.",
-        "ROLLT.BO": "Rollatainers Limited",
-        "ROLTA.BO": "Rolta India Limited",
-        "ROPLAS.BO": "ROPLAS (INDIA) LTD.",
-        "ROSEMER.BO": "ROSE MERC.LTD.",
-        "ROSSELLIND.BO": "ROSSELL INDIA LTD.",
-        "ROTO.BO": "Roto Pumps Limited",
-        "ROYALCU.BO": "Royal Cushion Vinyl Products",
-        "ROYALIND.BO": "ROYAL INDIA CORPORATION LIMITE",
-        "RPGLIFE.BO": "RPG LIFE SCIENCES LTD.",
-        "RSCINT.BO": "RSC International Ltd",
-        "RSCORP.BO": "R.S CORPORATION LTD.",
-        "RSWM.BO": "RSWM LTD.",
-        "RUBFILA.BO": "Rubfila International Limited",
-        "RUBRAME.BO": "RUBRA MEDICAMENTS LTD.",
-        "RUBYMILLS.BO": "RUBY MILLS LTD.",
-        "RUBYTEL.BO": "PANACHE INNOVATIONS LIMITED",
-        "RUIAAQA.BO": "RUIA AQUACULTURE FARMS LTD.",
-        "RUPA.BO": "RUPA & COMPANY LTD.",
-        "RUPALAM.BO": "RUPAL LAMINATES LTD.",
-        "RUSHIL.BO": "RUSHIL DECOR LTD.",
-        "RUSODAY.BO": "RUSODAY.BO",
-        "RUTRINT.BO": "RUTRON INTERNATIONAL LTD.",
-        "SAAGRR.BO": "SAAG RR INFRA LTD.",
-        "SABOOBR.BO": "Saboo Brothers Limited",
-        "SABOOSOD.BO": "Saboo Sodium Chloro Ltd.",
-        "SABTN.BO": "SRI ADHIKARI BROTHERS TELEVISI",
-        "SACHI.BO": "SACHS INDIA LTD.",
-        "SADBHAV6.BO": "SADBHAV6.BO",
-        "SADHNANIQ.BO": "Sadhana Nitro Chem Ltd.",
-        "SAENTER.BO": "South Asian Enterprises Limited",
-        "SAFALHBS.BO": "SAFAL HERBS LIMITED",
-        "SAGARPROD.BO": "SAGAR PRODUCTIONS LIMITED",
-        "SAGRSOY-B.BO": "SAGAR SOYA PRODUCTS LTD.",
-        "SAHARAHOUS.BO": "Sahara Housingfina Corporation Limited",
-        "SAIBABA.BO": "SAI BABA INVESTMENT AND COMMER",
-        "SAICAPI.BO": "SAI CAPITAL LTD.",
-        "SAICOM.BO": "SAIANAND COMMERCIAL LIMITED",
-        "SAINTGOBAIN.BO": "Saint-Gobain Sekurit India Limited",
-        "SAKSOFT.BO": "Saksoft Limited",
-        "SAL.BO": "SANGAM ADVISORS LTD.",
-        "SALONACOT.BO": "SALONA COTSPIN LTD.",
-        "SALORAINTL.BO": "SALORA INTERNATIONAL LTD.",
-        "SAMKRG.BO": "Samkrg Pistons and Rings Limited",
-        "SAMLEPU.BO": "SAM LEASECO LTD.",
-        "SAMPRE.BO": "Sampre Nutritions Ltd.",
-        "SAMSPIN.BO": "SAMRAT SPINNERS LTD.",
-        "SAMTEL.BO": "Samtel Color Ltd.",
-        "SAMTELIN.BO": "Samtel India Limited",
-        "SAMYAKINT.BO": "Samyak International Limited",
-        "SANBLUE.BO": "SANBLUE CORPORATION LTD.",
-        "SANCF.BO": "SANCHAY FINVEST LTD.",
-        "SANCTRN.BO": "Sanco Trans Ltd.",
-        "SANDESH.BO": "The Sandesh Limited",
-        "SANDESHBBPH.BO": "SANDESH LTD*",
-        "SANDPLAST.BO": "Sand Plast India Ltd",
-        "SANDURL.BO": "SANDUR LAMINATES LTD.",
-        "SANGAMIND.BO": "SANGAM (INDIA) LTD.",
-        "SANGFROID.BO": "Sang Froid Labs (India) Limite",
-        "SANGHCO.BO": "Sanghi Corporate Services Limited",
-        "SANGHIPOLY.BO": "SANGHI POLYESTERS LTD.",
-        "SANGHVIFOR.BO": "SANGHVI FORGING AND ENGINEERIN",
-        "SANGHVIMOV.BO": "SANGHVI MOVERS LTD.",
-        "SANHP.BO": "SANGAM HEALTH CARE PRODUCTS LT",
-        "SANIM.BO": "SANYO IMPEX LTD.",
-        "SANINFRA.BO": "SANMIT INFRA LIMITED",
-        "SANJIVIN.BO": "Sanjivani Paranteral Ltd.",
-        "SANOFI.BO": "SANOFI INDIA LTD",
-        "SANTASPN.BO": "Santaram Spinners Ltd.",
-        "SANTOSHF.BO": "Santosh Fine Fab Ltd",
-        "SANTOWIN.BO": "SANTOWIN CORPORATION LTD.",
-        "SARAFSO.BO": "SARAF SONS (TRADERS) LTD.",
-        "SAREGAMA.BO": "Saregama India Ltd",
-        "SARLAPOLY.BO": "SARLA PERFORMANCE FIBERS LTD.",
-        "SARTHAKGL.BO": "Sarthak Global Ltd.",
-        "SARVODYA.BO": "SARVODAYA LABS LTD.",
-        "SARVOTTAM.BO": "Sarvottam Finvest Limited",
-        "SASKNBBPH.BO": "SASKEN COM*",
-        "SATELINFO.BO": "SATELLITE INFOCONCEPTS LTD",
-        "SATHAISPAT.BO": "SATHAVAHANA ISPAT LTD.",
-        "SATRAPROP.BO": "Satra Properties India Ltd",
-        "SAUMYA.BO": "Saumya Consultants Ltd.",
-        "SAUMYACAP.BO": "SAUMYA CAPITAL LIMITED",
-        "SAVINFOCO.BO": "Savant Infocomm Ltd.",
-        "SAWABUSI.BO": "Sawaca Business Machines Limited",
-        "SB&TINTL.BO": "SB & T INTERNATIONAL LTD.",
-        "SB&TINTL6.BO": "SB&TINTL6.BO",
-        "SBBJ6.BO": "SBBJ6.BO",
-        "SBCL.BO": "Synergy Bizcon Limited",
-        "SBIGETS.BO": "SBI Mutual Fund - SBI-ETF Gold",
-        "SBISENSEX.BO": "SBI MUTUAL FUND - SBI ETF SENS",
-        "SBL.BO": "SIDDARTH BUSINESSES LTD",
-        "SBT6.BO": "SBT6.BO",
-        "SCANDENT.BO": "SCANDENT IMAGING LIMITED",
-        "SCANORG.BO": "SCAN ORGANICS LTD.",
-        "SCANPGEOM.BO": "Scanpoint Geomatics Ltd",
-        "SCFL.BO": "Shyam Century Ferrous Limited",
-        "SCHABLON.BO": "Schablona India Ltd",
-        "SCI4.BO": "SCI4.BO",
-        "SCI6.BO": "SCI6.BO",
-        "SCL.BO": "Sunshine Capital Ltd.",
-        "SCOOTER.BO": "Scooters India Ltd.",
-        "SCTL.BO": "Suncare Traders Limited",
-        "SDBL.BO": "SOM DISTILLERIES & BREWERIES L",
-        "SEAGUL.BO": "SEAGULL LEAFIN LTD.",
-        "SEAMECLTD.BO": "Seamec Limited",
-        "SEASONF.BO": "Seasons Furnishings Ltd",
-        "SECALS.BO": "SECALS LTD.",
-        "SEL.BO": "SANATHNAGAR ENTERPRISES LIMITE",
-        "SELANBBPH.BO": "SELAN EXPLO*",
-        "SELLWIN.BO": "SELLWIN TRADERS LIMITED",
-        "SENINFO.BO": "SENTHIL INFOTEK LTD",
-        "SEOFIDD.BO": "SBI Mutual Fund",
-        "SEOFIDR.BO": "SBI Mutual Fund",
-        "SEOFIGD.BO": "SBI Mutual Fund",
-        "SEOFIGR.BO": "SBI Mutual Fund",
-        "SEOFIIDD.BO": "SBI Mutual Fund",
-        "SEOFIIDR.BO": "SBI Mutual Fund",
-        "SEOFIIGD.BO": "SBI Mutual Fund",
-        "SEOFIIGR.BO": "SBI Mutual Fund",
-        "SEPSL.BO": "SEPSL.BO",
-        "SEQPP.BO": "SEQ SOFT PP",
-        "SEQSOFT.BO": "SEQUELSOFT INDIA LTD.",
-        "SEQUELE.BO": "Sequel e-Routers Ltd.",
-        "SEQUENT.BO": "SEQUENT SCIENTIFIC LTD.",
-        "SETFBSE100.BO": "SBI ETF BSE 100 ETF",
-        "SFLINTER.BO": "SFL International Limited",
-        "SGARRES.BO": "SAGAR TOURIST RESORTS LTD.",
-        "SGFL.BO": "SHREE GANESH FORGINGS LTD.",
-        "SGL.BO": "STL GLOBAL LTD.",
-        "SHAILJA.BO": "Shailja Commercial Trade Frenz",
-        "SHAKTIGAS.BO": "SHRI SHAKTI LPG LTD.",
-        "SHAKTIPR.BO": "Shakti Press Limited",
-        "SHAKTIPUMP.BO": "SHAKTI PUMPS (INDIA) LTD.",
-        "SHALIINF.BO": "SHALIBHADRA INFOSEC LTD.",
-        "SHALPRO.BO": "Shalimar Productions Limited",
-        "SHAMKENC.BO": "SHAMKEN COTSYN LTD.",
-        "SHAMKMUL.BO": "SHAMKEN MULTIFAB LTD.",
-        "SHAMKNSPIN.BO": "SHAMKEN SPINNERS LTD.",
-        "SHANINT.BO": "SHAAN INTERWELL (INDIA) LTD.",
-        "SHANTIGEAR.BO": "SHANTHI GEARS LTD.",
-        "SHARDACROP.BO": "Sharda Cropchem Limited",
-        "SHARIABEES.BO": "Goldman Sachs Mutual Fund - Goldman Sachs CNX Nifty Shariah Index Exchange Traded Scheme",
-        "SHARP.BO": "Sharp India Ltd.",
-        "SHARPRIN.BO": "Sharp Scan & Prints Limited",
-        "SHASUNPHAR.BO": "SHASUNPHAR.BO",
-        "SHAWGELTIN.BO": "NARMADA GELATINES LTD.",
-        "SHAYONA.BO": "SHAYONA PETROCHEM LTD.",
-        "SHBEARI.BO": "SHRAM BEARIN",
-        "SHBEREN.BO": "SHRIRAM BEARINGS LTD.",
-        "SHBHAGV.BO": "SHRI BHAGAVATI BRIGHT BARS LTD",
-        "SHEENA.BO": "SHEENA.BO",
-        "SHELMER.BO": "SHELL MERCANTILE CORP.LTD.",
-        "SHETR.BO": "Shetron Ltd.",
-        "SHGANEL.BO": "SHREE GANESH ELASTOPLAST LTD.",
-        "SHGANES.BO": "SHREE GANESH KNIT (INDIA) LTD.",
-        "SHGOVTR.BO": "SHREE SURGOVIND TRADELINK LTD.",
-        "SHIKHAR.BO": "SHIKHAR CONSULTANTS LTD.",
-        "SHILGRAVQ.BO": "Shilp Gravures Limited",
-        "SHILPAMED.BO": "SHILPA MEDICARE LTD.",
-        "SHILPLA.BO": "SHILPAX LABORATORIES LTD.",
-        "SHIRPUR-G.BO": "SHIRPUR GOLD REFINERY LTD.",
-        "SHIVA.BO": "Shivansh Finserv Limited",
-        "SHIVALIK.BO": "Shivalik Rasayan Ltd.",
-        "SHIVANA.BO": "SHIVANI VANASPATI LTD.",
-        "SHIVGAR.BO": "SHIVGARH RESORTS LTD.",
-        "SHIVKAMAL.BO": "Shivkamal Impex Limited",
-        "SHIVKRUPA.BO": "Shivkrupa Machineries and Engi",
-        "SHIVMED.BO": "Shiva Medicare Limited",
-        "SHK.BO": "S H Kelkar and Company Limited",
-        "SHLAKSHMI.BO": "Shri Lakshmi Cotsyn Limited",
-        "SHOPERSTOP.BO": "Shoppers Stop Limited",
-        "SHRAJSYNQ.BO": "Shree Rajasthan Syntex Ltd.",
-        "SHRDAIS.BO": "Sharda Ispat Limited",
-        "SHREEASHTA.BO": "SHREE ASHTAVINAYAK CINE VISION",
-        "SHREEASHTA6.BO": "SHREEASHTA6.BO",
-        "SHREEJAL.BO": "Shreejal Info Hubs Ltd",
-        "SHREEJIPHOS.BO": "SHREEJI PHOSPHATE LTD.",
-        "SHREEPAC.BO": "Shree Pacetronix Ltd",
-        "SHREETULSI.BO": "SHREE TULSI ONLINE.COM LTD.",
-        "SHRENTH.BO": "Proaim Enterprises Limited",
-        "SHRENUJ.BO": "Shrenuj & Company Limited",
-        "SHRGLTR.BO": "Shree Global Tradefin Limited",
-        "SHRIASTER.BO": "SHRI ASTER SILICATES LIMITED",
-        "SHRIBCL.BO": "Shri Bholanath Carpets Limited",
-        "SHRIDINBBPH.BO": "SHRIDIN*",
-        "SHRIDINE.BO": "Shri Dinesh Mills Limited",
-        "SHRIKRISH.BO": "Shri Krishna Devcon Limited",
-        "SHRIRAMEPC.BO": "Shriram EPC Limited",
-        "SHRUSYN.BO": "SHRUTI SYNTHETIC LTD.",
-        "SHSAINA.BO": "SHRI SAINATH PROTEINS LTD.",
-        "SHVSUIT.BO": "SHIVA SUITINGS LTD.",
-        "SHYAM.BO": "VENTURA GUARANTY LTD.",
-        "SHYAMAINFO.BO": "SHYAMA INFOSYS LTD.",
-        "SICAGEN.BO": "Sicagen India Limited",
-        "SICL.BO": "SUVIDHA INFRAESTATE CORPORATIO",
-        "SIDDHATUBE.BO": "SIDDHARTHA TUBES LTD.",
-        "SIEMENS.BO": "Siemens Limited",
-        "SIKOZY.BO": "Sikozy Realtors Ltd",
-        "SILKTEX.BO": "SILKTEX LTD.",
-        "SILSPL.BO": "SILSPL",
-        "SILVERO.BO": "SILVER OAK COMMERCIAL LTD.",
-        "SILVOAK.BO": "Silver Oak India Ltd.",
-        "SIMMOND.BO": "Simmonds-Marshall Ltd",
-        "SIMPLEXCAS.BO": "SIMPLEX CASTINGS LTD.",
-        "SIMPLXMIL.BO": "Simplex Mills Company Limited",
-        "SIMRAN.BO": "Simran Farms Ltd",
-        "SINDHUTRAD.BO": "SINDHU TRADE LINKS LIMITED",
-        "SINGER.BO": "Singer India Ltd.",
-        "SINNAR.BO": "Sinnar Bidi Udyog Ltd.",
-        "SIRISLT-B.BO": "SIRIS LTD.",
-        "SIROHIA.BO": "Sirohia & Sons Limited",
-        "SITAENT.BO": "Sita Enterprises Limited",
-        "SITICABLE.BO": "SITI CABLE NETWORK LTD.",
-        "SIYSIL.BO": "SIYARAM SILK MILLS LTD.",
-        "SJCORP.BO": "SJ Corporation Ltd.",
-        "SJVN.BO": "SJVN Limited",
-        "SKFINDIA.BO": "SKF INDIA LTD.",
-        "SKFL.BO": "SATKAR FINLEASE LTD",
-        "SKIPPER.BO": "SKIPPER LTD",
-        "SKP.BO": "SHRI KRISHNA PRASADAM LTD",
-        "SKRABUL.BO": "Shukra Bullions Ltd.",
-        "SKSMICRO6.BO": "SKSMICRO6.BO",
-        "SKSNFAB.BO": "S KUMAR SNFB",
-        "SKSYNFA.BO": "SKUMAR SYNFA",
-        "SKSYNFB.BO": "S KUM SYN",
-        "SKUMAR.BO": "S. Kumars Online Ltd.",
-        "SKUMARF.BO": "S KUMARSYNFB",
-        "SKUMARN.BO": "S. Kumars Nationwide Ltd.",
-        "SKUMARN6.BO": "SKUMARN6.BO",
-        "SKUMSNB.BO": "S KUMAR SNFB",
-        "SKUMSNF.BO": "SKUMAR SYNFA",
-        "SKUMSYF.BO": "S KUMARSNFAB",
-        "SKUMSYN.BO": "SKUMARSYNFAB",
-        "SKYLMILAR.BO": "Skyline Millars Ltd.",
-        "SKYSS.BO": "Skypak Service Specialists Ltd.",
-        "SMFIL.BO": "SMITHS & FOUNDERS (INDIA) LIMI",
-        "SMIFS.BO": "SMIFS Capital Markets Limited",
-        "SML.BO": "Soni Medicare Limited",
-        "SMLISUZU.BO": "SML ISUZU LIMITED",
-        "SMRUTHI.BO": "Smruthi Organics Limited",
-        "SNGHLSW-B.BO": "SINGHAL SWAROOP ISPAT LTD.",
-        "SNL.BO": "SNL Bearings Ltd.",
-        "SNOWCEMIND.BO": "SNOWCEM INDIA LTD.",
-        "SOASMUS.BO": "SOUTH ASIAN MUSHROOMS LTD.",
-        "SOBHA.BO": "Sobha Limited",
-        "SOBME.BO": "SOBHAGYA MERCHANTILE LTD.",
-        "SOCRUSBIO.BO": "SOCRUS BIO SCIENCES LIMITED",
-        "SOFTSOL.BO": "Softsol India Ltd.",
-        "SOFTSOLBBPH.BO": "SOFTSOL IND*",
-        "SOLIDCO.BO": "SOLID CONTAINERS LTD.",
-        "SOLIDSTON.BO": "Solid Stone Company Limited",
-        "SOMICONV.BO": "Somi Conveyor Beltings Ltd.",
-        "SONAL.BO": "Sonal Mercantile Limited",
-        "SONALAD.BO": "Sonal Adhesives Ltd",
-        "SONCLOC.BO": "SONELL CLOCKS & GIFTS LTD.",
-        "SONUSYN.BO": "SONU SYNTHETICS LTD.",
-        "SOUNDCRAFT.BO": "SOUNDCRAFT.BO",
-        "SOUTHFUEL.BO": "SOUTHERN FUEL LTD.",
-        "SOUTLAT.BO": "SOUTHERN LATEX LTD.",
-        "SPACEAGE.BO": "Spaceage Products Limited",
-        "SPANCO.BO": "Spanco Ltd",
-        "SPANCOPP.BO": "SPANC TELESY",
-        "SPANDIAQ.BO": "Span Divergent Limited",
-        "SPCAPIT.BO": "S P Capital Financing Ltd.",
-        "SPELS.BO": "SPEL Semiconductor Limited",
-        "SPENTA.BO": "Spenta International Limited",
-        "SPHEREGSL.BO": "Sphere Global Services Ltd",
-        "SPICEJET.BO": "SpiceJet Limited",
-        "SPICEMBBPH.BO": "SPICEMBBPH",
-        "SPICEMOBI.BO": "SPICE MOBILITY LIMITED",
-        "SPICEMOBI6.BO": "SPICEMOBI6.BO",
-        "SPISYS.BO": "Spisys Limited",
-        "SPMLINFRA.BO": "SPML INFRA LIMITED",
-        "SPRMPETBBPH.BO": "SUPREME PET*",
-        "SPS.BO": "SPS FINQUEST LTD",
-        "SPSINT.BO": "SPS International Ltd.",
-        "SQL.BO": "SQL STAR INTERNATIONAL LTD.",
-        "SQLST6.BO": "SQLST6.BO",
-        "SQSBFSI.BO": "SQSBFSI",
-        "SRAMSET.BO": "Shriram Asset Management Company Ltd",
-        "SRANGMARK.BO": "Shree Rang Mark Travels Limited",
-        "SRDAPRT.BO": "Sarda Proteins Ltd.",
-        "SRECR.BO": "SREECHEM RESINS LTD.",
-        "SREEL.BO": "SREELEATHERS LTD.",
-        "SREEL2.BO": "SREEL2.BO",
-        "SREIFPP.BO": "SREI PP2.5PD",
-        "SREINFRA6.BO": "SREINFRA6.BO",
-        "SRESTHA.BO": "Srestha Finvest Limited",
-        "SRF.BO": "SRF LTD.",
-        "SRFBBPH.BO": "SRF LIMITED*",
-        "SRHHYPOLTD.BO": "SREE RAYALASEEMA HI-STRENGTH H",
-        "SRHSYNT.BO": "SRH SYNTHETICS LTD.",
-        "SRIMSPG.BO": "SRI MALINI S",
-        "SRINANDAA.BO": "SRI NANDAA SPINNERS LTD.",
-        "SRINF51.BO": "SREI INTERNA",
-        "SRINIHAT.BO": "Srinivasa Hatcheries Limited",
-        "SRIOMTR.BO": "Emergent Global Edu and Services Limited",
-        "SRIPIPES.BO": "Srikalahasthi Pipes Limited",
-        "SRIVAJRA.BO": "Sri Vajra Granites Limited",
-        "SROGNGM.BO": "SRI GANAPATHY MILLS CO.LTD.",
-        "SRSLTD.BO": "SRS LTD.",
-        "SSDUNC.BO": "Schrader Duncan Limited",
-        "SSK.BO": "SSK Lifestyles Limited",
-        "SSLEL.BO": "Sir Shadi Lal Enterprises Limited",
-        "SSORGS.BO": "S.S. Organics Limited",
-        "SSPDL.BO": "SSPDL Ltd",
-        "STAMPEDE.BO": "STAMPEDE CAPITAL LIMITED",
-        "STAN.BO": "STANDARD CHARTERED PLC",
-        "STANCAP.BO": "Standard Capital Markets Limited",
-        "STANPACK.BO": "Stanpacks (India) Limited",
-        "STANROS.BO": "STANROSE MAFATLAL INVESTMENTS",
-        "STAR.BO": "Strides Shasun Limited",
-        "STARDELTA.BO": "STAR DELTA TRANSFORMERS LIMITE",
-        "STARLITE.BO": "Starlite Components Ltd.",
-        "STARLOG.BO": "Starlog Enterprises Limited",
-        "STARVOX.BO": "STARVOX.BO",
-        "STCINDIA6.BO": "STCINDIA6.BO",
-        "STCORP.BO": "S & T Corporation Limited",
-        "STDBAT.BO": "STANDARD BATTERIES LTD.",
-        "STDSFAC.BO": "STANDARD SURFACTANTS LTD.",
-        "STDSHOE.BO": "STANDARD SHOE SOLE AND MOULD (",
-        "STEERINTER.BO": "Sterling International Enterprises Ltd.",
-        "STELCOST.BO": "STELCO STRIPS LTD.",
-        "STELLAR.BO": "STELLAR CAPITAL SERVICES LTD",
-        "STEP2COR.BO": "Step Two Corporation Limited",
-        "STERLINH.BO": "Sterling Holiday Resorts (India) Limited",
-        "STERLINH6.BO": "STERLINH6.BO",
-        "STERSPN.BO": "STERLING SPINNERS LTD.",
-        "STERWEB.BO": "STERLING WEBNET LTD.",
-        "STEWARTQ.BO": "Stewarts & Lloyds Of India Ltd.",
-        "STIGRAN.BO": "STI GRANITE INDIA LTD.",
-        "STILESI.BO": "STILES INDIA LTD.",
-        "STINDIA.BO": "STI INDIA LTD.",
-        "STIPROD.BO": "STI PRODUCTS INDIA LTD.",
-        "STOCKNET.BO": "STOCKNET INTERNATIONAL LTD.",
-        "STONEIN.BO": "Stone India Ltd.",
-        "STOTZBL.BO": "STOTZ-BLACKSMITHS LTD.",
-        "STRGRENWO.BO": "Sterling Green Woods Limited",
-        "STRLKAL.BO": "STERLING KALKSAND BRICKS LTD.",
-        "STSERV.BO": "S.T. SERVICES LIMITED",
-        "SUBEX.BO": "SUBEX LTD.",
-        "SUBHTEX.BO": "SUBH TEX (INDIA) LTD",
-        "SUBROS.BO": "Subros",
-        "SUBSM.BO": "Subhash Silk Mills Limited",
-        "SUCROSA.BO": "Super Crop Safe Ltd",
-        "SUGALDAM.BO": "Sugal & Damani Share Brokers Ltd",
-        "SUJANATWR.BO": "Sujana Towers Limited",
-        "SUJANATWR6.BO": "SUJANATWR6.BO",
-        "SULABEN.BO": "SULABH ENGINEERS & SERVICES LT",
-        "SUMANMOTEL.BO": "SUMAN MOTELS LTD.",
-        "SUMEDHA.BO": "Sumedha Fiscal Services Limited",
-        "SUNASIAN.BO": "SUNRISE ASIAN LIMITED",
-        "SUNCITYSY.BO": "Suncity Synthetics Ltd.",
-        "SUNCLAYLTD.BO": "SUNDARAM-CLAYTON LTD.",
-        "SUNDARAM.BO": "Sundaram Multi Pap Ltd.",
-        "SUNDRMBRAK.BO": "Sundaram Brake Linings Ltd.",
-        "SUNDRMFAST.BO": "Sundram Fasteners Limited",
-        "SUNDRMFAST6.BO": "SUNDRMFAST6.BO",
-        "SUNGOLD.BO": "Sungold Capital Ltd.",
-        "SUNINFO.BO": "SUN INFOWAYS LTD.",
-        "SUNKU.BO": "SUNKU.BO",
-        "SUNSHINE.BO": "SUN AND SHINE WORLDWIDE LTD.",
-        "SUNSOUI.BO": "Sun Source (india) Ltd",
-        "SUPER.BO": "SUPER SALES INDIA LTD.",
-        "SUPERBAK.BO": "Super Bakers (India) Ltd.",
-        "SUPERHOUSE.BO": "SUPERHOUSE LTD.",
-        "SUPERIA.BO": "SUPERIA.BO",
-        "SUPERSYN.BO": "SUPER SYNCOTEX (INDIA) LTD.",
-        "SUPPETRO.BO": "SUPREME PETROCHEM LTD.",
-        "SUPRATRE.BO": "SUPRA TRENDS LIMITED",
-        "SUPRDOM.BO": "SUPER DOMESTIC MACHINES LTD.",
-        "SUPSOXL.BO": "SUPERIOR SOX LTD.",
-        "SUPTANERY.BO": "SUPER TANNERY LIMITED",
-        "SURAJ.BO": "Suraj Products Ltd.",
-        "SURAJLTD.BO": "SURAJ LTD.",
-        "SURANACORP.BO": "SURANA CORPORATION LTD.",
-        "SURFUNC.BO": "SURYA FUN CITY LTD.",
-        "SURYAINDIA.BO": "Surya India Limited",
-        "SURYAROSNI.BO": "Surya Roshni Limited",
-        "SURYNGRF.BO": "SFL International Limited",
-        "SUVEN.BO": "Suven Life Sciences Limited",
-        "SUYOG.BO": "SUYOG TELEMATICS LTD",
-        "SVAINDIA.BO": "SVA INDIA LTD.",
-        "SVARTCORP.BO": "SWASTI VINAYAKA ART AND HERITA",
-        "SVCRES.BO": "SVC Resources Ltd.",
-        "SVCSUPE.BO": "SVC Superchem Limited",
-        "SVGLOBAL.BO": "S V GLOBAL MILL LTD.",
-        "SWADPOL.BO": "Swadeshi Polytex Ltd.",
-        "SWARAJENG.BO": "Swaraj Engines Ltd.",
-        "SWASTIVI.BO": "Swasti Vinayaka Synthetics Limited",
-        "SWASURF.BO": "SWASTIK SURFACTANTS LTD.",
-        "SWORDEDGE.BO": "SWORD-EDGE COMMERCIALS LIMITED",
-        "SWSURFC.BO": "SW SURFACTNT",
-        "SXETF.BO": "HDFC Mutual Fund",
-        "SYMPHONY.BO": "Symphony Limited",
-        "SYNCOM.BO": "Syncom Formulations India Ltd",
-        "SYNCOMF.BO": "SYNCOM FORMULATIONS (INDIA) LT",
-        "SYNERGY.BO": "SYNERGY COSMETICS (EXIM) LTD.",
-        "SYNGENE.BO": "Syngene International Limited",
-        "SYSCHEM.BO": "Syschem India Ltd.",
-        "SYSTMTXC.BO": "Systematix Corporate Services Limited",
-        "TAAZAINT.BO": "Taaza International Ltd",
-        "TAKE.BO": "Take Solutions Ltd.",
-        "TAKSHEEL.BO": "TAKSHEEL SOLUTIONS LTD.",
-        "TALWALKARS.BO": "TALWALKARS BETTER VALUE FITNES",
-        "TAMBOLI.BO": "Tamboli Capital Limited",
-        "TAMJAIM.BO": "Tamilnadu Jai Bharath Mills Ltd.",
-        "TAMO.BO": "TAMO.BO",
-        "TAMRMIL.BO": "TAMARAI MILLS LTD.",
-        "TANLA.BO": "Tanla Solutions Limited",
-        "TARAJEWELS.BO": "TARA JEWELS LTD.",
-        "TARAPUR.BO": "TARAPUR TRANSFORMERS LTD",
-        "TARINI.BO": "TARINI INTERNATIONAL LTD",
-        "TARMAT.BO": "TARMAT LTD.",
-        "TASHIND.BO": "Tashi India Limited",
-        "TASTYBIT.BO": "Tasty Bite Eatables Ltd.",
-        "TATAELXSI.BO": "Tata Elxsi Limited",
-        "TATAGLOBAL4.BO": "TATAGLOBAL4.BO",
-        "TATAYODOGA.BO": "TAYO ROLLS LTD.",
-        "TATIAGLOB.BO": "Tatia Global Venture Ltd.",
-        "TAVERNIER.BO": "TAVERNIER RESOURCES LIMI",
-        "TBZ.BO": "TRIBHOVANDAS BHIMJI ZAVERI LTD",
-        "TCMLMTD.BO": "TCM Limited",
-        "TCS6.BO": "TCS6.BO",
-        "TEEM.BO": "TEEM LABORATORIES LTD.",
-        "TEJINFOWAY.BO": "TEJ INFOWAYS LIMITED",
-        "TELECANOR.BO": "TeleCanor Global Ltd",
-        "TELEDATAGL.BO": "TELEDATA INFORMATICS LTD.",
-        "TELEMARINE.BO": "TELEDATA MARINE SOLUTIONS LTD.",
-        "TERRAFORM.BO": "TERRAFORM MAGNUM LTD.",
-        "TERRAREAL.BO": "TERRAFORM REALSTATE LIMITED",
-        "TERRUZZI.BO": "TERRUZZI",
-        "TERRYFB.BO": "TERRYFAB (INDIA) LTD.",
-        "TERRYGOL.BO": "TERRYGOLD (INDIA) LTD.",
-        "TEXMOPIPES.BO": "Texmo Pipes and Products Limited",
-        "TFLL.BO": "Tirupati Fin-Lease Ltd.",
-        "THACKER.BO": "THACKER & CO.LTD.",
-        "THAKRAL.BO": "Thakral Services India Ltd.",
-        "THAPARC.BO": "THAPAR CONCAST LTD.",
-        "THEMISMED.BO": "THEMIS MEDICARE LTD.",
-        "THERMAX.BO": "Thermax Ltd.",
-        "THERMAX6.BO": "THERMAX6.BO",
-        "THOMASCOOK.BO": "Thomas Cook (India) Limited",
-        "THOMASCOOK6.BO": "THOMASCOOK6.BO",
-        "THOMASCOTT.BO": "THOMAS SCOTT (INDIA) LIMITED",
-        "THPRISP-B.BO": "THAPAR ISPAT LTD.",
-        "TIGLOB.BO": "T & I Global Limited",
-        "TIJARIA.BO": "TIJARIA POLYPIPES LTD.",
-        "TIL.BO": "TIL Limited",
-        "TILAKFIN.BO": "TILAKFIN.BO",
-        "TIMBOR.BO": "TIMBOR HOME LTD.",
-        "TIMESGTY.BO": "TIMES GUARANTY LTD.",
-        "TIMEX.BO": "Timex Group India Limited",
-        "TIMEXPS.BO": "TIMEX NCRPS",
-        "TIMKEN.BO": "Timken India Limited",
-        "TINNAFN.BO": "TINNA FINEX LTD.",
-        "TINPLATE.BO": "The Tinplate Company Of India Limited",
-        "TIPSBBPH.BO": "TIPS INDUST",
-        "TIRFOAM.BO": "Tirupati Foam Limited",
-        "TIRSARJ.BO": "Tirupati Sarjan Limited",
-        "TIRUFIN.BO": "Tirupati Fincorp Limited",
-        "TIRUPATIINK.BO": "TIRUPATI INKS LTD.",
-        "TITAN.BO": "Titan Company Limited",
-        "TITAN6.BO": "TITAN6.BO",
-        "TKNOMIN.BO": "TKNOMIN.BO",
-        "TMTIND-B1.BO": "TMT (INDIA) LTD.",
-        "TNPETRO.BO": "Tamilnadu Petroproducts Ltd.",
-        "TOBUENT.BO": "Justride Enterprises Limited",
-        "TOKYOPLAST.BO": "TOKYO PLAST INTERNATIONAL LTD.",
-        "TOPCAPP.BO": "TOP CASSE PP",
-        "TORNTPHARM6.BO": "TORNTPHARM6.BO",
-        "TORRCABS.BO": "TORRCABS.BO",
-        "TOWASOK.BO": "TOWA SOKKI LTD.",
-        "TPINDIA.BO": "TPI INDIA LTD.",
-        "TRABI.BO": "Transgene Biotek Ltd.",
-        "TRADWIN.BO": "Trade Wings Limited",
-        "TRAMEDI.BO": "Trans Medicare Limited",
-        "TRANOCE.BO": "TRANSOCEANIC PROPERTIES LTD.",
-        "TRANSASIA.BO": "Trans Asia Corporation Ltd",
-        "TRANSCHEM.BO": "TRANSCHEM LTD.",
-        "TRANSCOR.BO": "Transcorp International Limited",
-        "TRANSPEK.BO": "Transpek Industry Limited",
-        "TRANSRIN.BO": "TRANSTREAM INDIA.COM LTD.",
-        "TRENT.BO": "Trent Ltd.",
-        "TRF.BO": "TRF Limited",
-        "TRIAFIN.BO": "TRIA FINE-CHEM LTD.",
-        "TRIBHSG.BO": "Tribhuvan Housing Limited",
-        "TRICOM.BO": "Tricom India Limited",
-        "TRICOMFRU.BO": "TRICOM FRUIT PRODUCTS LIMITED",
-        "TRIDENT.BO": "TRIDENT LTD.",
-        "TRIL.BO": "Transformers & Rectifiers (India) Limited",
-        "TRIMURTHI.BO": "Trimurthi Limited",
-        "TRINITYLEA.BO": "TRINITY LEAGUE INDIA LTD.",
-        "TRIPEXO.BO": "TRIPEXO.BO",
-        "TRIPR.BO": "Triochem Products Limited",
-        "TRITON.BO": "Triton Corp Limited",
-        "TRITONV.BO": "Triton Valves Ltd",
-        "TRITRADE.BO": "TRINITY TRADELINK LIMITED",
-        "TRITURBINE.BO": "TRIVENI TURBINE LTD.",
-        "TRIVENIENT.BO": "TRIVENI ENTERPRISES LTD",
-        "TRUPTWI.BO": "TRUPTI TWISTERS LTD.",
-        "TSPIRITUAL.BO": "T Spiritual World Ltd",
-        "TTIENT.BO": "TTI ENTERPRISE LTD",
-        "TTKHEBBPH.BO": "TTK HEALTH*",
-        "TTKPRESTIG.BO": "TTK PRESTIGE LTD.",
-        "TTL.BO": "TT Limited",
-        "TTML.BO": "Tata Teleservices (Maharashtra) Limited",
-        "TUBEINVEST6.BO": "TUBEINVEST6.BO",
-        "TULASEEBIOE.BO": "TULASEE BIO-ETHANOL LTD.",
-        "TULSI.BO": "Tulsi Extrusions Limited",
-        "TULSYAN.BO": "Tulsyan NEC Ltd.",
-        "TWIROST.BO": "TWIN ROSES TRADES & AGENCIES L",
-        "TWL.BO": "TITAGARH WAGONS LTD.",
-        "TWPL.BO": "TWPL.BO",
-        "UBHOLDINGS.BO": "UNITED BREWERIES (HOLDINGS) LT",
-        "UBHOLDINGS6.BO": "UBHOLDINGS6.BO",
-        "UBL.BO": "UNITED BREWERIES LTD.",
-        "UBL6.BO": "UBL6.BO",
-        "UCILLEA.BO": "UCIL LEASING LTD.",
-        "UFLEX.BO": "Uflex Limited",
-        "UFLEX6.BO": "UFLEX6.BO",
-        "ULTRACAB.BO": "Ultracab (India) Limited",
-        "UMAMAHM.BO": "UMA MAHESWARI MILLS LTD.",
-        "UMANGDAIR.BO": "Umang Dairies Ltd",
-        "UMIYA.BO": "Umiya Tubes Limited",
-        "UNICHEMLAB.BO": "Unichem Laboratories Limited",
-        "UNICHEMLAB6.BO": "UNICHEM LABORATORIES LTD",
-        "UNICORN.BO": "UNICORN.BO",
-        "UNIIN.BO": "UNIWORTH INTERNATIONAL LTD.",
-        "UNIMERQ.BO": "Unimers India Ltd.",
-        "UNIMININ.BO": "Unimin India Limited",
-        "UNIMOVR.BO": "Unimode Overseas Limited",
-        "UNIONBE.BO": "UNION BEARINGS (INDIA) LTD.",
-        "UNIPHOS.BO": "Uniphos Enterprises Ltd.",
-        "UNIQUEO.BO": "Unique Organics Ltd.",
-        "UNIRLEA.BO": "UNIROLL LEATHER INDIA LTD.",
-        "UNISHIRE.BO": "UNISHIRE URBAN INFRA LTD",
-        "UNITDSPR.BO": "United Spirits Limited",
-        "UNITEDINT.BO": "UNITED INTERACTIVE LTD.",
-        "UNIVARTS.BO": "Universal Arts Ltd.",
-        "UNIVSTAR.BO": "Universal Starch Chem Allied Ltd.",
-        "UNIWORTH.BO": "Uniworth Ltd.",
-        "UNJHAFOR.BO": "Unjha Formulations Limited",
-        "UPL.BO": "UPL LIMITED",
-        "UPLBBPH.BO": "UPL*",
-        "UPLIMEC.BO": "U.P.LIME-CHEM LTD.",
-        "UPMINRL.BO": "U.P.MINERAL PRODUCTS LTD.",
-        "URJAGLOBA.BO": "Urja Global Ltd",
-        "USHAINDIA.BO": "USHA (INDIA) LTD.",
-        "USHAIRN.BO": "USHAIRN.BO",
-        "USHAISPAT.BO": "USHAISPAT.BO",
-        "USHDI.BO": "Ushdev International Limited",
-        "UTINIFTETF.BO": "UTI Mutual Fund",
-        "UTISENSETF.BO": "UTI Mutual Fund",
-        "UTLTD.BO": "UT Ltd.",
-        "UVBOARDS.BO": "UV Boards Ltd.",
-        "UVDRHOR.BO": "UNITED VAN DER HORST LTD.",
-        "VADILENT.BO": "Vadilal Enterprises Ltd",
-        "VAIBHAVGBL.BO": "VAIBHAV GLOBAL LTD",
-        "VAISHNAVI.BO": "VAISHNAVI GOLD LIMITED",
-        "VAJRABE.BO": "VAJRA BEARINGS LTD.",
-        "VAKRANGEE.BO": "VAKRANGEE LIMITED",
-        "VALCOMBBPH.BO": "VALIANTCOM*",
-        "VALLABH.BO": "VALLABH POLY-PLAST INTERNATION",
-        "VALLEY.BO": "Valley Magnesite Company Limit",
-        "VALLYAB.BO": "VALLEY ABRASIVES LTD.",
-        "VANDANA.BO": "VANDANA KNITWEAR LTD.",
-        "VANICOM.BO": "Vani Commercials Limited",
-        "VANTAGE.BO": "Vantage Corporate Services Ltd.",
-        "VAPIPPR.BO": "Vapi Enterprise Limited",
-        "VARDHCH.BO": "Vardhaman Laboratories Ltd.",
-        "VARDMNPOLY.BO": "VARDHMAN POLYTEX LTD.",
-        "VARUNME.BO": "VARUN MERCANTILE LTD.",
-        "VARUNPP.BO": "VARUN SHIPNG",
-        "VASCONEQ.BO": "VASCON ENGINEERS LTD",
-        "VATCO.BO": "VATSA CORPORATIONS LTD.",
-        "VATSAMUS.BO": "VATSA MUSIC LTD.",
-        "VCCLLTD.BO": "VCCL Ltd.",
-        "VCKCAP.BO": "VCK Capital Market Services Limited",
-        "VCU.BO": "VCU DATA MANAGEMENT LTD",
-        "VEDL.BO": "VEDANTA LIMITED",
-        "VEERHEALTH.BO": "VEERHEALTH CARE LIMITED",
-        "VEGETABLE.BO": "Vegetable Products Limited.",
-        "VELJAN.BO": "Veljan Denison Limited",
-        "VENKYS.BO": "Venky's (India) Limited",
-        "VENLONENT.BO": "Venlon Enterprises Limited",
-        "VENUSREM.BO": "VENUS REMEDIES LTD.",
-        "VENUSUNI.BO": "Venus Universal Ltd",
-        "VERITAS.BO": "Veritas (India) Ltd.",
-        "VEROLAB.BO": "VERONICA LABORATORIES LTD.",
-        "VESUVIUS.BO": "Vesuvius India Limited",
-        "VGCL.BO": "Vibrant Global Capital Limited",
-        "VIBROSO.BO": "VIBROS ORGANICS LTD.",
-        "VICTENT.BO": "VICTORIA ENTERPRISES LTD.",
-        "VICTMILL.BO": "The Victoria Mills Limited",
-        "VIJSOLX.BO": "Vijay Solvex Ltd",
-        "VIKASGRAN.BO": "Vikas Granaries Ltd",
-        "VIKASWSP.BO": "Vikas WSP Limited",
-        "VIKRAMTH.BO": "Vikram Thermo (India) Ltd",
-        "VIMTALABS.BO": "VIMTA LABS LTD.",
-        "VINATIORGA.BO": "VINATI ORGANICS LTD.",
-        "VINAYAKPOL.BO": "VINAYAK POLYCON INTERNATIONAL",
-        "VINCARDS.BO": "VINTAGE CARDS & CREATIONS LTD.",
-        "VINDHYATEL.BO": "VINDHYA TELELINKS LTD.",
-        "VINRKLB.BO": "Rekvina Laboratories Limited",
-        "VINTRON.BO": "Vintron Informatics Ltd",
-        "VINVANI.BO": "VINAYAK VANIJYA LTD.",
-        "VINYOFL.BO": "Vinyoflex Ltd.",
-        "VIPCORP.BO": "VIPCORP.BO",
-        "VIPPYSP.BO": "Vippy Spinpro Ltd.",
-        "VIPUL.BO": "Vipul Ltd",
-        "VIRALSYN.BO": "VIRALSYN.BO",
-        "VIRGOGLOB.BO": "Virgo Global Limited",
-        "VIRINCHI.BO": "Virinchi Limited",
-        "VIRNICHIQ.BO": "Virinchi Limited",
-        "VIRPP.BO": "VIRINCHI PP",
-        "VISESHINFO.BO": "VISESH INFOTECNICS LTD.",
-        "VISHALBL.BO": "Vishal Bearings Limited",
-        "VISHCHR.BO": "VISHAL CHAIRS LTD.",
-        "VISHMEL.BO": "Vishal Malleables Ltd.",
-        "VISIONCO.BO": "Vision Corporation Ltd.",
-        "VISIONLTD.BO": "VISION ORGANICS LTD.",
-        "VIVIDHA.BO": "Visagar Polytex Ltd.",
-        "VIVIMEDLAB.BO": "VIVIMED LABS LTD.",
-        "VJTFEDU.BO": "VJTF EDUSERVICES LTD.",
-        "VJYKMCT.BO": "VIJAYKUMAR MILLS LTD.",
-        "VKAL.BO": "Vantage Knowledge Academy Limi",
-        "VKSPP.BO": "V K SOFT PP",
-        "VLL.BO": "Virat Leasing Limited",
-        "VMV.BO": "VMV Holidays Limited",
-        "VOLPLAST.BO": "VOLPLAST LTD.",
-        "VOLTAMP.BO": "Voltamp Transformers Limited",
-        "VOLTAS.BO": "Voltas Ltd.",
-        "VOLTAS6.BO": "VOLTAS6.BO",
-        "VRL.BO": "VASUNDHARA RASAYANS LTD",
-        "VRWODAR.BO": "VR Woodart Ltd.",
-        "VSDCONF.BO": "VSD CONFIN LTD.",
-        "VTMLTD.BO": "VTM LTD.",
-        "WABCOINDIA.BO": "WABCO INDIA LTD.",
-        "WAGEND.BO": "WAGEND INFRA VENTURE LIMITED",
-        "WALCHPF.BO": "Walchand Peoplefirst Limited",
-        "WANBURY.BO": "Wanbury Ltd.",
-        "WEBELSE.BO": "WEBEL SEN CAPACITORS LTD.",
-        "WEIZFIN.BO": "WEIZMANN FINCORP LTD.",
-        "WEIZMANIND.BO": "WEIZMANN LTD.",
-        "WELCORP.BO": "WELSPUN CORP LIMITED",
-        "WELENT.BO": "WELSPUN ENTERPRISES LIMTED",
-        "WELINV.BO": "WELSPUN INVESTMENTS AND COMMER",
-        "WELLESLEY.BO": "WELLESLEY CORPORATION LTD.",
-        "WELLNESS.BO": "WELLNESS NONI LTD.",
-        "WELLWININD.BO": "WELLWIN INDUSTRY LTD.",
-        "WELSPSY.BO": "AYM Syntex Limited",
-        "WELSPUNIND.BO": "Welspun India Ltd.",
-        "WELTI.BO": "Welterman International Limited",
-        "WENDT.BO": "Wendt (India) Limited",
-        "WEPSOLN.BO": "WEP SOLUTIONS LTD.",
-        "WESTE.BO": "Western India Shipyard Limited",
-        "WESTLEIRES.BO": "WEST LEISURE RESORTS LTD",
-        "WHBRADY.BO": "WH Brady & Company Limited",
-        "WHEELS.BO": "Wheels India Limited",
-        "WHIRLPOOL.BO": "Whirlpool of India Limited",
-        "WHITELIO.BO": "Bombay Talkies Ltd",
-        "WHITHAL.BO": "WHITE HALL COMMERCIAL CO.LTD.",
-        "WILFI.BO": "WILWAYFORT INDIA LTD.",
-        "WILLAMAGOR.BO": "WILLIAMSON MAGOR & COMPANY LTD",
-        "WILLARD.BO": "WILLARD INDIA LTD.",
-        "WIMPLAST.BO": "WIM PLAST LTD.",
-        "WINROC.BO": "WINRO COMMERCIAL (INDIA) LTD.",
-        "WINSOMBR.BO": "Winsome Breweries Limited",
-        "WINTAC.BO": "Wintac Ltd.",
-        "WINYCOMM.BO": "WINY COMMERCIAL AND FISCAL SER",
-        "WIPRO.BO": "Wipro Ltd.",
-        "WIPRO6.BO": "WIPRO6.BO",
-        "WISEC.BO": "Wisec Global Limited",
-        "WMINIMT.BO": "WESTERN MINISTIL LTD.",
-        "WOCKPHARMA.BO": "WOCKHARDT LTD.",
-        "WOMENSNEXT.BO": "WOMENS NEXT LOUNGERIES LTD",
-        "WONDERLA.BO": "WONDERLA HOLIDAYS LTD",
-        "WOODSVILA.BO": "WOODSVILLA LTD.",
-        "WOOLWAY.BO": "WOOLWAYS (INDIA) LTD.",
-        "WPIL.BO": "WPIL Limited",
-        "XCHANGING.BO": "XCHANGING SOLUTIONS LTD.",
-        "XPROINDIA.BO": "XPRO INDIA LTD.",
-        "YANTRA.BO": "YANTRA NATURAL RESOURCES LTD.",
-        "YASHMGM.BO": "Yash Management and Satellite Ltd.",
-        "YASHRAJC.BO": "Yashraj Containeurs Ltd",
-        "YNPYMN.BO": "YENEPOYA MINERALS & GRANITES L",
-        "YOGIPLY.BO": "YOGI POLYESTERS LTD.",
-        "YOGYA.BO": "Yogya Enterprises Limited",
-        "YUKEN.BO": "Yuken India Limited",
-        "YULEFIN.BO": "YULE FINANCING & LEASING CO.LT",
-        "YUVINTL.BO": "YUVRAJ INTERNATIONAL LTD.",
-        "YUVRAAJHPL.BO": "YUVRAAJ HYGIENE PRODUCTS LTD.",
-        "ZAMBISLK.BO": "AMBIKA SILK MILLS LTD.",
-        "ZANUKCOM.BO": "Anukaran Commercial Enterprises Ltd.",
-        "ZARCOLEA.BO": "ARCO LEASING LTD.",
-        "ZBALGHOL.BO": "BALGOPAL HOLDING & TRADERS LTD",
-        "ZBIHAAIR.BO": "BIHAR AIR PRODUCTS LTD.",
-        "ZBINTXPP.BO": "Binayak Tex Processors Limited",
-        "ZDHJERK.BO": "Dhanvantri Jeevan Rekha Ltd",
-        "ZEEENTBBPH.BO": "ZEE ENT*",
-        "ZEELEARN.BO": "ZEE LEARN LTD.",
-        "ZENCAP.BO": "ZENITH CAPITALS LTD.",
-        "ZENIFIB.BO": "Zenith Fibres Ltd.",
-        "ZENITHBIR.BO": "ZENITH BIRLA (INDIA) LTD.",
-        "ZENITHCOMP.BO": "ZENITH COMPUTERS LTD.",
-        "ZENITHSTL.BO": "ZENITHSTL.BO",
-        "ZFSTEERING.BO": "Z.F.STEERING GEAR (INDIA) LTD.",
-        "ZGAEKWAR.BO": "GAEKWAR MILLS LTD.",
-        "ZGOVPOOX.BO": "GOVIND POY OXYGEN LTD.",
-        "ZHINDBRE.BO": "ZHINDBRE.BO",
-        "ZHINDHSG.BO": "HINDUSTAN HOUSING CO.LTD.",
-        "ZHINUDYP.BO": "HINDUSTHAN UDYOG LTD.",
-        "ZINDUCIN.BO": "INDUCON INDIA LTD.",
-        "ZKHANDEN.BO": "Khandelwal Extractions Ltd.",
-        "ZKHATAUE.BO": "KHATAU EXIM LTD.",
-        "ZNIVEMER.BO": "Nivedita Mercantile & Financing Ltd.",
-        "ZODJRDMKJ.BO": "ZODIAC-JRD-MKJ LTD.",
-        "ZPARAPLY.BO": "PARASRAMPURIA POLYAMIDES LTD.",
-        "ZPESTICI.BO": "PESTICIDES & BREWERIES LTD.",
-        "ZPPOLYSA.BO": "Planter's Polysacks Limited",
-        "ZSANMCOM.BO": "SANMITRA COMMERCIAL LTD.",
-        "ZSARACOM.BO": "SARASWATI COMMERCIAL (INDIA) L",
-        "ZSARVAMA.BO": "SARVAMANGAL MERCANTILE CO.LTD.",
-        "ZSATYASL.BO": "SATYAM SILK MILLS LTD.",
-        "ZSOMAIYO.BO": "SOMAIYA ORGANICS (INDIA) LTD.",
-        "ZSPEEDCO.BO": "SPEEDAGE COMMERCIALS LTD.",
-        "ZSWASTSA.BO": "SWASTIK SAFE DEPOSIT & INVESTM",
-        "ZUARIGLOB.BO": "ZUARI GLOBAL LTD.",
-        "ZVVNMFG.BO": "VVN MFG.& INVESTA LTD.",
-        "ZYDEN.BO": "Zyden Gentec Ltd.",
-        "ZYDUSWELL.BO": "Zydus Wellness Limited",
-        "ZYDUSWELL6.BO": "ZYDUSWELL6.BO"
-    },
-
-    "Miscellaneous - NSE Listed": {
-        "3RDROCK.NS": "3RD ROCK MULTIMEDI INR10",
-        "549-MF.NS": "SUNDARAM ASSET MAN TOP 100 III(",
-        "A2ZINFRA.NS": "A2Z INFRA ENGINEER INR10",
-        "ABHISHEK.NS": "Abhishek Corporation Ltd",
-        "ABIRLANUVO.NS": "ADITYA BIRLA NUVO LIMITED",
-        "ACCELYA.NS": "ACCELYA KALE SOLUT INR10",
-        "ADANITRANS-BE.NS": "Adani Transmission Ltd",
-        "ADANITRANS.NS": "ADANI TRANSMISS.IN INR1",
-        "ADI.NS": "ADI FINECHEM LTD INR10",
-        "ADI.NS": "ADI FINECHEM LTD INR10",
-        "ADLABS.NS": "ADLABS ENTERTAINME INR10",
-        "ADVANTA.NS": "Advanta Limited",
-        "AFL.NS": "ACCEL FRONTLINE LIMITED",
-        "AFTEK-BE.NS": "AFTEK-BE.NS",
-        "AFTEK-BZ.NS": "AFTEK LIMITED",
-        "AFTEK.NS": "Aftek Limited",
-        "AICHAMP.NS": "AI CHAMPDANY INDUS INR5",
-        "AIFL.NS": "ASHAPURA INTIMATES INR10",
-        "AKZOINDIA.NS": "AKZO NOBEL INDIA LIMITED",
-        "ALANKIT.NS": "ALANKIT LIMITED INR1",
-        "ALKEM.NS": "ALKEM LAB LTD INR2",
-        "ALMONDZ.NS": "ALMONDZ GLOBAL SEC INR6",
-        "ALPA-BE.NS": "ALPA LABORATORIES INR10",
-        "ALPA.NS": "ALPA LABORATORIES INR10",
-        "ALPHAGEO.NS": "ALPHAGEO (INDIA) LIMITED",
-        "ALPINEHOU-BE.NS": "ALPINEHOU-BE.NS",
-        "ALSTOMT&D.NS": "GE T&D India Limited",
-        "AMARAJABAT.NS": "AMARA RAJA BATTERI INR1",
-        "AMRUTANJAN-BE.NS": "AMRUTANJAN HEALTH INR2",
-        "AMRUTANJAN.NS": "AMRUTANJAN HEALTH CARE LIMITED",
-        "AMTEKINDIA-BE.NS": "AMTEK INDIA LIMITED",
-        "AMTL.NS": "ADVANCE METERING T INR5",
-        "ANSALAPI.NS": "ANSAL PROPERTIES & INFRASTRUCTU",
-        "ANTGRAPHIC-BE.NS": "ANTARCTICA LIMITED",
-        "ANTGRAPHIC.NS": "ANTARCTICA LIMITED INR1",
-        "APLAB-BE.NS": "APLAB-BE.NS",
-        "APOLSINHOT.NS": "APOLLO SINDOORI HO INR10",
-        "ARCHIES.NS": "ARCHIES LIMITED",
-        "ARIHANT.NS": "ARIHANT FOUNDATION INR10(DEMAT)",
-        "AROGRANITE.NS": "ARO GRANITE INDUS INR10",
-        "ARVINDREM-BZ.NS": "ARVIND REMEDIES LIMITED",
-        "ARVINDREM.NS": "ARVIND REMEDIES LIMITED",
-        "ARVINDREM.NS": "Arvind Remedies Limited",
-        "ARVINFRA-BE.NS": "ARVIND INFRASTRUCT INR10",
-        "ARVINFRA.NS": "ARVIND INFRASTRUCT INR10",
-        "ASAHISONG-BE.NS": "ASAHI SONGWON COLO INR10",
-        "ASHAPURMIN.NS": "ASHAPURA MINE CHEM INR2",
-        "ASHIMASYN.NS": "ASHIMA INR10",
-        "ASIL-BE.NS": "ASIL-BE.NS",
-        "ASTEC.NS": "ASTEC LIFESCIENCES LIMITED",
-        "ATNINTER-BE.NS": "ATNINTER-BE.NS",
-        "ATNINTER.NS": "ATN INTERNATIONAL INR4.00",
-        "AURIONPRO.NS": "AURIONPRO SOLUTIONS LIMITED",
-        "AUSOMENT-BE.NS": "AUSOM ENTERPRISE INR10",
-        "AVANTIFEED.NS": "AVANTI FEEDS INR2",
-        "AVANTIFEED.NS": "AVANTI FEEDS INR2",
-        "AVTNPL.NS": "AVT NATURAL PRODUCTS LIMITED",
-        "AXISCADES.NS": "AXISCADES ENGINEER INR10",
-        "AXISGOLD.NS": "Axis Gold ETF",
-        "BAJAJFINS.NS": "BAJAJ FINSERV LIMITED",
-        "BALRAMCHIN.NS": "BALRAMPUR CHINI MI INR1",
-        "BANARBEADS.NS": "BANARAS BEADS LTD INR10",
-        "BANG-BE.NS": "BANG OVERSEAS LTD INR10",
-        "BANKBARODA-IL.NS": "BK OF BARODA INR2",
-        "BARTRONICS.NS": "BARTRONICS INDIA L INR10",
-        "BASML.NS": "BANNARI AMMAN SPIN INR10",
-        "BBL.NS": "BHARAT BIJLEE LIMITED",
-        "BDR.NS": "BDR BUILDCON LTD INR10",
-        "BDR-IT.NS": "BDR Buildcon Limited",
-        "BEARDSELL-BE.NS": "BEARDSELL LTD INR10",
-        "BEARDSELL-BL.NS": "BEARDSELL LTD INR10",
-        "BEARDSELL-BT.NS": "BEARDSELL LTD INR10",
-        "BEARDSELL.NS": "BEARDSELL LTD INR2",
-        "BEARDSELL-IL.NS": "BEARDSELL LTD INR10",
-        "BEARDSELL-RL.NS": "BEARDSELL LTD INR10",
-        "BEML.NS": "BEML LIMITED",
-        "BGLOBAL-BE.NS": "BHARATIYA GLOBAL I INR10",
-        "BHAGERIA.NS": "BHAGERIA INDUSTRIE INR5",
-        "BHAGYNAGAR.NS": "BHAGYANAGAR INDIA INR2",
-        "BHARTISHIP-BZ.NS": "BHARATI SHIPYARD LTD.",
-        "BHARTISHIP.NS": "BHARATI SHIPYARD LTD.",
-        "BIL.NS": "BHARTIYA INTERNATIONAL LIMITED",
-        "BINDALAGRO-BE.NS": "OSWAL CHEM & FERT-DEP SET",
-        "BIOCON.NS": "BIOCON LIMITED",
-        "BIOCON.NS": "Biocon Limited",
-        "BIRLACOT-BE.NS": "BIRLA COTSYN (INDI INR1",
-        "BIRLAERIC-BE.NS": "BIRLA ERICSON LTD.",
-        "BIRLAERIC.NS": "Birla Cable Limited",
-        "BIRLAMONEY.NS": "ADITYA BIRLA MONEY INR1",
-        "BLBLIMITED.NS": "BLB INR1",
-        "BLUEBLENDS-BE.NS": "BLUE BLENDS (I) LTD",
-        "BLUEBLENDS.NS": "BLUE BLENDS (INDIA INR10",
-        "BLUEBLENDS.NS": "BLUE BLENDS (INDIA INR10",
-        "BLUECHIP-BE.NS": "BLUE CHIP INDIA LTD.",
-        "BNPCPGII-MF.NS": "BNP PARIBAS MF CAPITAL PRT ORIE",
-        "BODHTREE-BE.NS": "BODHTREE-BE.NS",
-        "BOSCHLTD.NS": "BOSCH LIMITED",
-        "BPL.NS": "BPL LIMITED",
-        "BROADCAST.NS": "BROADCAST INITIATI INR10",
-        "BROADCAST.NS": "Broadcast Initiatives Limited",
-        "BSL.NS": "BSL LIMITED",
-        "BSLCAP19RG-MF.NS": "BIRLA SUN LIFE ASS CAPITAL PRT",
-        "BSLCAP21RG-MF.NS": "BIRLA SUN LIFE MUT CAPITAL PR O",
-        "BSLELFS5RG-MF.NS": "BIRLA SUN LIFE MUT EMERGING LEA",
-        "BSLFEFS2RG-MF.NS": "BIRLA SUN LIFE MUT FOCUSED EQ 2",
-        "BSLFTPLLRG-MF.NS": "BIRLA SUN LIFE ASS FIXED TERM P",
-        "BSLFTPLVDG-MF.NS": "BIRLA SUN LIFE MUT FTP LV 1099D",
-        "BSLGOLDETF.NS": "Birla Sun Life Gold ETF",
-        "BSLNIFTY.NS": "BIRLA SUN LIFE ASS NIFTY GROWTH",
-        "BSLNIFTY.NS": "Birla Sun Life Nifty ETF",
-        "BSLRGES1RD-MF.NS": "BIRLA SUN LIFE ASS SERIES 1-REG",
-        "BSLRGES1RG-MF.NS": "BIRLA SUN LIFE ASS SERIES 1-REG",
-        "BVCL.NS": "BARAK VALLEY CEMEN INR10",
-        "CAIRN.NS": "CAIRN INDIA LIMITED",
-        "CAMLINFINE.NS": "CAMLIN FINE SCIENC INR1",
-        "CAMLINFINE.NS": "CAMLIN FINE SCIENC INR1",
-        "CANFINHOME.NS": "CANFIN HOMES INR10",
-        "CAPLIPOINT.NS": "CAPLIN POINT LABOR INR2",
-        "CAPLIPOINT.NS": "CAPLIN POINT LABOR INR2",
-        "CARBORUNIV.NS": "CARBORUNDUM UNIVERSAL LIMITED",
-        "CASTROLIND.NS": "CASTROL INDIA INR5",
-        "CCHHL.NS": "COUNTRY CLUB HOSPI INR2",
-        "CEBBCO.NS": "COMMERCIAL ENGINEERS & BODY BUI",
-        "CELESTIAL.NS": "CELESTIAL BIOLABS LIMITED",
-        "CENTEXT.NS": "CENTURY EXTRUSIONS LIMITED",
-        "CERA.NS": "CERA SANITARYWARE LIMITED",
-        "CEREBRAINT.NS": "CEREBRA INTEGRATED INR10",
-        "CGCL.NS": "CAPRI GLOBAL CAPIT INR2",
-        "CHEMFALKAL.NS": "CHEMFAB ALKALIS LIMITED",
-        "CHOLAFIN.NS": "CHOLAMANDALAM INVESTMENT AND FI",
-        "CHROMATIC.NS": "CHROMATIC INDIA LIMITED",
-        "CIMMCO.NS": "Cimmco Limited",
-        "CIPLA.NS": "CIPLA LIMITED",
-        "CMC.NS": "CMC Limited",
-        "CNOVAPETRO-BE.NS": "CIL NOVA PETROCHEM INR10",
-        "CNOVAPETRO.NS": "CIL NOVA PETROCHEM INR10",
-        "CONSOFINVT.NS": "CONSOLIDATED FINVE INR10",
-        "CORDSCABLE.NS": "CORDS CABLE INDUST INR10",
-        "COROMANDEL.NS": "COROMANDEL INTERNATIONAL LIMITE",
-        "CPSEETF.NS": "RELIANCE NIPPON LI CPSE ETF*",
-        "CPSEETF.NS": "Goldman Sachs CPSE ETF",
-        "CREATIVEYE.NS": "CREATIVE EYE LTD INR10",
-        "CREST.NS": "CREST VENTURES INR10",
-        "CRESTANI-BZ.NS": "CREST COMM NPP251099DEPO",
-        "CRMFGETF.NS": "CANARA ROBECO MF GOLD ETF",
-        "CRMFGETF.NS": "Canara Robeco Gold ETF",
-        "CUBEXTUB-BE.NS": "CUBEXTUBINGS-ROLLSETT",
-        "CUBEXTUB.NS": "CUBEX TUBINGS INR10",
-        "CUMMINSIND.NS": "CUMMINS INDIA INR2",
-        "CYIENT.NS": "CYIENT LIMITED INR5",
-        "DATAMATICS.NS": "DATAMATICS GLOBAL INR5",
-        "DBCORP-IL.NS": "D B CORP LTD INR10",
-        "DCMSHRIRAM.NS": "DCM SHRIRARM LTD INR2",
-        "DEEPAKNTR.NS": "DEEPAK NITRITE INR2",
-        "DELTACORP.NS": "DELTA CORP LIMITED",
-        "DELTAMAGNT.NS": "DELTA MAGNETS LTD INR10",
-        "DENORA.NS": "DE NORA INDIA INR10",
-        "DICIND.NS": "DIC INDIA LIMITED",
-        "DIGJAM.NS": "Digjam Limited",
-        "DPL.NS": "DHUNSERI PETROCHEM INR10(DEMAT",
-        "DPSCLTD.NS": "DPSC LIMITED",
-        "DRDATSONS.NS": "DR.DATSONS LABS LT INR10",
-        "DRDATSONS.NS": "Dr.Datsons Labs Limited",
-        "DREDGECORP.NS": "DREDGING CORPORATION OF INDIA L",
-        "DRREDDY.NS": "DR. REDDY'S LABORATORIES LIMITE",
-        "DSKULKARNI.NS": "D.S. KULKARNI DEVE INR10",
-        "DSSL.NS": "DYNACONS SYS SOLUT INR10",
-        "DWSFMP66RG-MF.NS": "DEUTSCHE ASSET MGM DWS FMP SR 6",
-        "DWSHYD13GP-MF.NS": "DEUTSCHE ASSET MGM DWS HYBRID F",
-        "DWSMIDRD-MF.NS": "DEUTSCHE MUTUAL FU MID CAP 1 RE",
-        "EASTSILK.NS": "EASTERN SILK IND INR2",
-        "EASUNREYRL.NS": "EASUN REYROLLE LTD INR2",
-        "ECLERX.NS": "ECLERX SERVICES LIMITED",
-        "EIDPARRY.NS": "EID PARRY INDIA LIMITED",
-        "EIMCOELECO-BE.NS": "EIMCO ELECON(I)LTD",
-        "EIMCOELECO.NS": "EIMCO ELECON INDIA INR10 (100%",
-        "EKC.NS": "EVEREST KANTO CYLINDER LIMITED",
-        "ELDERPHARM-BE.NS": "ELDER PHARM INR10(DEMAT)",
-        "ELDERPHARM-BZ.NS": "ELDER PHARM INR10(DEMAT)",
-        "ELECTHERM.NS": "ELECTROTHERM (INDI INR10",
-        "ELFORGE-BE.NS": "ELFORGE-BE.NS",
-        "EMAMIINFRA.NS": "EMAMI INFRASTRUCTU INR2",
-        "EMCO.NS": "EMCO LIMITED",
-        "EMKAY.NS": "EMKAY GLOBAL FIN INR10",
-        "EMKAYTOOLS-SM.NS": "EMKAY TAPS AND CUT INR10",
-        "ENGINERSIN.NS": "ENGINEERS INDIA LIMITED",
-        "ENTEGRA-BE.NS": "ENTEGRA INFRASTRUC INR10",
-        "ENTEGRA.NS": "ENTEGRA INFRASTRUC INR10",
-        "ENTEGRA.NS": "Entegra Limited",
-        "ERAINFRA-BE.NS": "ERAINFRA-BE.NS",
-        "ERAINFRA-BZ.NS": "ERA INFRA ENGINEER INR2(DEMAT)",
-        "ESSELPACK.NS": "Essel Propack Limited",
-        "EUROCERA-BE.NS": "EUROCERA-BE.NS",
-        "EUROMULTI-BE.NS": "EURO MULTIVISION L INR10",
-        "EUROMULTI.NS": "EURO MULTIVISION L INR10",
-        "FAGBEARING.NS": "FAG BEARINGS INDIA LIMITED",
-        "FAGBEARING.NS": "Schaeffler India Limited",
-        "FARMAXIND-BE.NS": "FARMAX INDIA LTD INR1",
-        "FDC.NS": "FDC LIMITED",
-        "FIRSTLEASE-BZ.NS": "FIRST LEASING CO OF INDIA",
-        "FLFL.NS": "FUTURE LIFESTYLE F INR2",
-        "FMNL.NS": "FUTURE MKT NETWORK INR10",
-        "FOURTHDIM-SM.NS": "FOURTH DIMENSION S INR10",
-        "FRL.NS": "FUTURE ENTERPRISES INR2",
-        "FRL.NS": "Future Enterprises Limited",
-        "FRLDVR.NS": "FUTURE ENTERPRISES INR2 'B' (BO",
-        "FRLDVR.NS": "FUTURE ENTERPRISES INR2 'B' (BO",
-        "GAIL.NS": "GAIL (INDIA) LIMITED",
-        "GALLISPAT.NS": "GALLANTT ISPAT LIMITED",
-        "GAMMNINFRA.NS": "GAMMON INFRASTRUCT INR2",
-        "GANECOS.NS": "GANESHA ECOSPHERE INR10",
-        "GANESHHOUC.NS": "GANESH HOUSING CP INR10(DEMAT)",
-        "GARDENSIL.NS": "Garden Silks Mills Ltd.",
-        "GARWALLROP.NS": "GARWARE WALL ROPES INR10",
-        "GEMINI.NS": "GEMINI COMM LTD INR1",
-        "GENUSPAPER-BE.NS": "Genus P&B Limited",
-        "GEOJITBNPP.NS": "GEOJIT BNP PARIBAS INR1",
-        "GEOMETRIC.NS": "GEOMETRIC LIMITED",
-        "GEOMETRIC.NS": "Geometric Limited",
-        "GHCL.NS": "GHCL LIMITED",
-        "GILLANDERS.NS": "GILLANDERS ARBUTHN INR10",
-        "GILLETTE.NS": "GILLETTE INDIA LIMITED",
-        "GINNIFILA.NS": "GINNI FILAMENTS LIMITED",
-        "GIRRESORTS.NS": "GIR NATUREVIEW RES INR10",
-        "GIRRESORTS-IT.NS": "GIR Natureview Resort Ltd",
-        "GKWLIMITED.NS": "GKW LIMITED INR10",
-        "GLFL.NS": "GUJARAT LEASE INR10",
-        "GLOBALVECT-BE.NS": "GLOBAL VECTRA HELI INR10",
-        "GLOBALVECT.NS": "GLOBAL VECTRA HELI INR10",
-        "GLODYNE-BE.NS": "GLODYNE-BE.NS",
-        "GOACARBON.NS": "GOA CARBON LIMITED",
-        "GOCLCORP.NS": "GOCL CORPORATION L INR2",
-        "GOCLCORP.NS": "GOCL CORPORATION L INR2",
-        "GOLDBEES.NS": "GOLDMAN SACHS GOLD GOLD EXCH TR",
-        "GOLDBEES.NS": "Goldman Sachs Gold BeES ETF",
-        "GOLDENTOBC.NS": "GOLDEN TOBACCO LTD INR10 (DEMAT",
-        "GOLDIAM.NS": "GOLDIAM INTERNATIONAL LIMITED",
-        "GOLDSHARE.NS": "UTI Gold ETF",
-        "GOODLUCK.NS": "GOODLUCK INDIA LTD INR2",
-        "GRAVITA.NS": "GRAVITA INDIA LIMITED",
-        "GREENLAM.NS": "GREENLAM INDUSTRIE INR5",
-        "GREENLAM.NS": "GREENLAM INDUSTRIE INR5",
-        "GRPLTD.NS": "GRP LTD INR10 (DEMAT)",
-        "GSCLCEMENT.NS": "GUJARAT SIDHEE CEM INR10 (NEW)",
-        "GSFC-IL.NS": "GUJARAT STATE FER INR2(POST SUB",
-        "GTL.NS": "GTL LIMITED",
-        "GUJNREDVR.NS": "GUJARAT NRE COKE LIMITED",
-        "GUJNREDVR.NS": "Gujarat NRE Coke Ltd.",
-        "GULFCORP.NS": "GULFCORP.NS",
-        "H37027ARG4-MF.NS": "HDFC ASSET MANAGEM FMP 370D AUG",
-        "H37131JDG2-MF.NS": "HDFC ASSET MANAGEM FMP 371D JUN",
-        "HATHWAY-IL.NS": "HATHWAY CABLE & DA INR2",
-        "HAVELLS.NS": "HAVELLS INDIA LIMITED",
-        "HBSTOCK.NS": "HB STOCKHOLDINGS INR10",
-        "HCPO36MORG-MF.NS": "HDFC MUTUAL FUND SR I-36M OCT 2",
-        "HCPO36MSRG-MF.NS": "HDFC MUTUAL FUND CAP PRO 36M RE",
-        "HDFCMFGETF.NS": "HDFC Gold ETF",
-        "HDFCNIFETF.NS": "HDFC MUTUAL FUND NIFTY ETF",
-        "HDFCNIFETF.NS": "HDFC Nifty ETF",
-        "HDFCSENETF.NS": "HDFC MUTUAL FUND SENSEX ETF",
-        "HDFCSENETF.NS": "HDFC Sensex ETF",
-        "HELIOSMATH.NS": "HELIOS AND MATHESON INFORMATION",
-        "HERCULES.NS": "HERCULES HOISTS LIMITED",
-        "HEXATRADEX.NS": "HEXA TRADEX LTD INR2",
-        "HGS.NS": "HINDUJA GLOBAL SOLUTIONS LIMITE",
-        "HIKAL.NS": "HIKAL LIMITED",
-        "HINDSYNTEX.NS": "HIND SYNTEX INR10",
-        "HINDUNILVR.NS": "HINDUSTAN UNILEVER INR1",
-        "HITACHIHOM.NS": "HITACHI HOME AND LIFE SOLUTIONS",
-        "HITACHIHOM.NS": "Johnson Controls - Hitachi Air Conditioning India Limited",
-        "HNGSNGBEES.NS": "RELIANCE NIPPON LI RELIANCE ETF",
-        "HNGSNGBEES.NS": "Goldman Sachs Hang Seng BeES ETF",
-        "HOTELRUGBY.NS": "HOTEL RUGBY LTD INR10",
-        "HRGESSRD1-MF.NS": "HDFC ASSET MANAGEM SR 1-FEB 201",
-        "HRGESSRG1-MF.NS": "HDFC ASSET MANAGEM SR 1-FEB 201",
-        "HRGESSRG2-MF.NS": "HDFC MUTUAL FUND HDFC-RAJ GANDH",
-        "HSIL.NS": "HSIL LIMITED",
-        "IBULHSGFIN.NS": "INDIABULLS HOUSING INR2",
-        "IBVENTURES.NS": "INDIABULLS VENTURE INR2",
-        "IBWSL.NS": "INDIABULLS WHOLESALE SERVICES L",
-        "ICNX100.NS": "ICICI PRUDENTIAL A ICICI PRUDEN",
-        "ICNX100.NS": "ICICI Prudential Nifty100 ETF",
-        "ICSA.NS": "ICSA (INDIA) LIMITED",
-        "IDBIGOLD.NS": "IDBI MUTUAL FUND IDBI GOLD ETF",
-        "IDBIGOLD.NS": "IDBI Gold ETF",
-        "IDEA.NS": "IDEA CELLULAR LIMITED",
-        "IDFC-IL.NS": "IDFC LIMITED INR10",
-        "IDR1ADP-MF.NS": "IDBI ASSET MGMT SR I PLAN A-DIV",
-        "IDR1AGD-MF.NS": "IDBI ASSET MGMT SR I PLAN A-GRO",
-        "IFCI.NS": "IFCI LIMITED",
-        "IGOLD.NS": "ICICI PRUDENTIAL A GOLD EXCHANG",
-        "IGOLD.NS": "ICICI Prudential GOLD ETF",
-        "INDIGO.NS": "INTERGLOBE AVIATIO INR10",
-        "INDORAMA.NS": "INDO RAMA SYNTHETICS (INDIA) LI",
-        "INDSWFTLAB.NS": "IND-SWIFT LABORATORIES LIMITED",
-        "INDSWFTLTD-BE.NS": "IND-SWIFT LIMITED",
-        "INDSWFTLTD.NS": "IND SWIFT LTD INR2",
-        "INDTERRAIN.NS": "INDIAN TERRAIN FAS INR2",
-        "INDUSFILA-BE.NS": "INDUS FILA LIMITED",
-        "INDUSFILA-BZ.NS": "INDUS FILA LIMITED",
-        "INDUSFILA.NS": "Indus Fila Limited",
-        "INFRABEES.NS": "RELIANCE NIPPON LI RELIANCE ETF",
-        "INFRATEL.NS": "BHARTI INFRATEL LIMITED",
-        "INIFTY.NS": "ICICI PRUDENTIAL A NIFTY",
-        "INIFTY.NS": "ICICI Prudential Nifty ETF",
-        "INNOIND-BZ.NS": "INNOVENTIVE IND LTD",
-        "INOXLEISUR.NS": "INOX LEISURE LIMITED",
-        "INOXWIND.NS": "INOX INDIA LIMITED INR10",
-        "INSECTICI.NS": "Insecticides (India) Limited",
-        "INSECTICID.NS": "INSECTICIDES (INDIA) LIMITED",
-        "INTELLECT.NS": "INTELLECT DESIGN A INR5",
-        "IPAPPM.NS": "INTERNATIONAL PAPE INR10",
-        "IPCALAB.NS": "IPCA LABORATORIES LIMITED",
-        "IPCALAB-IL.NS": "IPCA LABORATORIES INR2",
-        "IPGETF.NS": "ICICI Prudential GOLD ETF",
-        "IPRU-8484-MF.NS": "ICICIPRAMC - IPRU-8484",
-        "IPRU2262-MF.NS": "ICICI PRUDENTIAL A EQUITY SAVIN",
-        "IPRU2317-MF.NS": "ICICI PRUDENTIAL A 73 830D J RE",
-        "IPRU2580-MF.NS": "ICICI PRUDENTIAL A CAP PRO ORIE",
-        "ISENSEX.NS": "ICICI PRUDENTIAL A ICICI PRUDEN",
-        "ISENSEX.NS": "ICICI PRUDENTIAL A ICICI PRUDEN",
-        "ISFT-BE.NS": "ISFT-BE.NS",
-        "ISMTLTD.NS": "ISMT LTD INR5",
-        "ITC.NS": "ITC LIMITED",
-        "IVC.NS": "IL&FS INVESTMENT MANAGERS LIMIT",
-        "IVRCLINFRA.NS": "IVRCL LIMITED",
-        "IZMO.NS": "IZMO LIMITED INR10",
-        "JAICORPLTD.NS": "JAI CORP LIMITED",
-        "JAINSTUDIO-BE.NS": "JAIN STUDIOS LTD",
-        "JAINSTUDIO.NS": "JAIN STUDIOS INR10",
-        "JAYNECOIND.NS": "JAYASWAL NECO IND INR10",
-        "JENSONICOL.NS": "JENSON & NICHOLSON INR2",
-        "JHS-BZ.NS": "JHS SVEND. LAB. LTD",
-        "JHS.NS": "JHS SVEND. LAB. LTD",
-        "JINDALSAW.NS": "JINDAL SAW LTD INR2(DEMAT)",
-        "JINDCOT.NS": "JINDAL COTEX LIMITED",
-        "JPOLYINVST.NS": "JINDAL POLY INV & INR10",
-        "JSL-BE.NS": "JINDAL STAINLESS INR2",
-        "JSWHL.NS": "JSW HOLDINGS LIMIT INR10",
-        "JUMBO-BZ.NS": "JUMBO-BZ.NS",
-        "JUNIORBEES.NS": "NIFTY JR BENCHMARK ETF",
-        "JUNIORBEES.NS": "Goldman Sachs Junior BeES ETF",
-        "JUSTDIAL.NS": "JUST DIAL LTD INR10",
-        "JUSTDIAL.NS": "Just Dial Limited",
-        "JYOTISTRUC.NS": "JYOTI STRUCTURES INR2",
-        "KABRAEXTRU.NS": "KABRA EXTRUSIONTEC INR5.00",
-        "KALINDEE.NS": "KALINDEE RAIL NIRMAN (ENGINEERS",
-        "KALINDEE.NS": "Kalindee Rail Nirman (Engineers) Limited",
-        "KALYANIFRG-BE.NS": "KALYANI FORGE INR10",
-        "KALYANIFRG.NS": "KALYANI FORGE INR10",
-        "KAYA-BE.NS": "Kaya Limited",
-        "KAYA.NS": "KAYA LIMITED INR10",
-        "KEC.NS": "KEC INTERNATIONAL INR2",
-        "KERNEX-BE.NS": "KERNEX MICROSYSTEM INR10",
-        "KESARENT.NS": "KESAR ENTERPRISES LIMITED",
-        "KESARENT.NS": "Kesar Enterprises Limited",
-        "KEYCORPSER-BE.NS": "KEYNOTECORPORATE",
-        "KEYCORPSER.NS": "KEYNOTE CORPORATE SERVICES LIMI",
-        "KHAITANLTD-BE.NS": "KHAITAN (INDIA) LTD. INR10",
-        "KHAITANLTD.NS": "KHAITAN (INDIA)LTD INR10",
-        "KHANDSE.NS": "KHANDWALA SEC LTD INR10",
-        "KICL.NS": "KALYANI INVESTMENT COMPANY LIMI",
-        "KIL.NS": "Kamdhenu Limited",
-        "KIRLOSBROS.NS": "KIRLOSKAR BROTHERS INR2",
-        "KOTAKBANK-IL.NS": "KOTAK MAHINDRA BAN INR5",
-        "KOTAKGOLD.NS": "Kotak Gold ETF",
-        "KOTAKNIFTY.NS": "KOTAK MAHINDRA ASS KOTAK NIFTY",
-        "KOTAKNIFTY.NS": "Kotak Nifty ETF",
-        "KOTAKNV20.NS": "KOTAK MAHINDRA ASS KOTAK NV 20",
-        "KOTAKNV20.NS": "Kotak NV 20 ETF",
-        "KOTHARIPET.NS": "KOTHARI PETROCHEM INR10",
-        "KPRMILL.NS": "K.P.R. MILL LIMITED",
-        "KRIDHANINF.NS": "KRIDHAN INFRA LIMI INR2",
-        "KRIDHANINF.NS": "KRIDHAN INFRA LIMI INR2",
-        "KRISHNAENG-BE.NS": "KRISHNAENGGWORKS",
-        "KRISHNAENG-BZ.NS": "KRISHNAENGGWORKS",
-        "KSCL.NS": "KAVERI SEED COMPANY LIMITED",
-        "KSCL-IL.NS": "KAVERI SEED COMPAN INR2",
-        "KSE-BE.NS": "KSE-BE.NS",
-        "KSERASERA-BE.NS": "KSS LTD INR1",
-        "KTIL.NS": "KESAR TERMINALS & INFRASTRUCTUR",
-        "KTKNV20ETF.NS": "KOTAKMAMC - KTKNV20ETF",
-        "KWALITY.NS": "KWALITY LIMITED",
-        "LAKSHMIFIN-BE.NS": "LAKSHMIFIN-BE.NS",
-        "LALPATHLAB.NS": "DR LAL PATHLABS LT INR10",
-        "LAXMIMACH.NS": "LAKSHMI MACHINE WORKS LIMITED",
-        "LFIC-BE.NS": "Lakshmi Fin Ind Corp Ltd",
-        "LGBFORGE.NS": "LGB FORGE LIMITED",
-        "LICNETFGSC.NS": "LIC MUTUAL FUND G-SEC LONG TERM",
-        "LICNETFGSC.NS": "LIC MUTUAL FUND G-SEC LONG TERM",
-        "LICNETFN50.NS": "LIC MUTUAL FUND ETF- NIFTY 50-",
-        "LICNFENGP.NS": "LICNAMC - LICNFENGP",
-        "LICNFENGP.NS": "LIC MF ETF Nifty 50",
-        "LICNMFET.NS": "LICNAMC - LICNMFET",
-        "LINDEINDIA.NS": "LINDE INDIA LTD INR10",
-        "LIQUIDBEES.NS": "Goldman Sachs Liquid BeES ETF",
-        "LOVABLE.NS": "LOVABLE LINGERIE LIMITED",
-        "LPDC.NS": "LANDMARK PROP DEV INR1",
-        "LT.NS": "LARSEN & TOUBRO LIMITED",
-        "LTMFXTG-MF.NS": "L&T MUTUAL FUND FMP GRWT OPT 03",
-        "LUPIN-IL.NS": "LUPIN LTD INR2",
-        "LYCOS.NS": "LYCOS INTERNET LTD INR2",
-        "LYKALABS.NS": "LYKA LABS LIMITED",
-        "M100.NS": "MOST SHARES M100 ETF",
-        "M100.NS": "Motilal Oswal MOSt Shares Midcap 100 ETF",
-        "M50.NS": "MOTILAL OSWAL FINA GROWTH UNITS",
-        "M50.NS": "Motilal Oswal MOSt Shares M50 ETF",
-        "MAGMA.NS": "MAGMA FINCORP LIMITED",
-        "MAGNUM.NS": "MAGNUM VENTURES LT INR10",
-        "MAJESCO-BE.NS": "Majesco Limited",
-        "MAJESCO.NS": "MAJESCO LIMITED INR5",
-        "MAJESCO.NS": "MAJESCO LIMITED INR5",
-        "MANAKCOAT.NS": "MANAKSIA COATED ME INR1",
-        "MANAKCOAT.NS": "MANAKSIA COATED ME INR1",
-        "MANAKINDST.NS": "MANAKSIA INDUSTRIE INR1",
-        "MANAKINDST.NS": "MANAKSIA INDUSTRIE INR1",
-        "MANALIPETC.NS": "MANALI PETROCHEMS INR5",
-        "MANGTIMBER.NS": "MANGALAM TIMBER INR10",
-        "MARALOVER.NS": "MARAL OVERSEAS LIMITED",
-        "MARUTI-IL.NS": "MARUTI SUZUKI IND INR5",
-        "MASTEK-BE.NS": "MASTEK - DEPO SETT",
-        "MC6RD-MF.NS": "SUNDARAM ASSET MAN SELECT MICRO",
-        "MCDOWELL-N.NS": "UNITED SPIRITS INR10",
-        "MCDOWELL-N.NS": "UNITED SPIRITS INR10",
-        "MCLEODRUSS.NS": "MCLEOD RUSSEL INDIA LIMITED",
-        "MEGH.NS": "MEGHMANI ORGANICS LIMITED",
-        "MELSTAR.NS": "MELSTAR INFORMATIO INR10",
-        "MENONBE.NS": "MENON BEARINGS LTD INR1",
-        "MERCATOR.NS": "MERCATOR LIMITED",
-        "MERCK.NS": "MERCK LIMITED",
-        "MHRIL.NS": "MAHINDRA HOLIDAYS & RESORTS IND",
-        "MINDACORP.NS": "MINDA CORP LTD INR2",
-        "MIRZAINT.NS": "MIRZA INTERNATIONAL LIMITED",
-        "MITCON-SM.NS": "MITCON CONSU & ENG INR10",
-        "MMFL.NS": "MM FORGINGS LIMITED",
-        "MONSANTO.NS": "MONSANTO INDIA LIMITED",
-        "MONTECARLO.NS": "MONTE CARLO FASHIO INR10",
-        "MOSERBAER.NS": "MOSER-BAER (I) LIMITED",
-        "MOTHERSUMI.NS": "MOTHERSON SUMI SYS INR1",
-        "MOTILALOFS.NS": "MOTILAL OSWAL FINA INR1",
-        "MPSLTD.NS": "MPS LTD INR10",
-        "MRF.NS": "MRF LIMITED",
-        "MTEDUCARE.NS": "MT EDUCARE LIMITED",
-        "MUKANDLTD.NS": "MUKAND LIMITED",
-        "MUKANDLTD-P1.NS": "MUKAND 0.01 % CUM RED PRF INR10",
-        "MUKTAARTS.NS": "MUKTA ARTS LIMITED",
-        "MUTHOOTCAP.NS": "MUTHOOT CAPITAL SE INR10",
-        "MUTHOOTCAP.NS": "MUTHOOT CAPITAL SE INR10",
-        "MVL.NS": "MVL LTD INR1",
-        "N100.NS": "Motilal Oswal MOSt Shares NASDAQ 100 ETF",
-        "NAGREEKCAP.NS": "NAGREEKA CAPITAL & INR5",
-        "NAGREEKCAP.NS": "NAGREEKA CAPITAL & INR5",
-        "NAHARINDUS.NS": "NAHAR IND ENTERPRI INR10",
-        "NAKODA.NS": "NAKODA LTD INR5",
-        "NATHBIOGEN-BE.NS": "Nath Bio-Genes (I) Ltd",
-        "NATHBIOGEN.NS": "NATH BIO-GENES (IN INR10",
-        "NAUKRI.NS": "INFO EDGE INR10",
-        "NAVINFLUOR.NS": "NAVIN FLUORINE INT INR2",
-        "NAVKARCORP.NS": "NAVKAR CORPORATION INR10",
-        "NDL.NS": "NANDAN DENIM LTD INR10",
-        "NECLIFE.NS": "NECTAR LIFESCIENCES LIMITED",
-        "NELCAST.NS": "NELCAST LIMITED",
-        "NELCO.NS": "NELCO LIMITED",
-        "NEOCORP-BE.NS": "NEOCORP-BE.NS",
-        "NEPCMICON-BE.NS": "NEPC INDIA LTD",
-        "NESCO.NS": "NESCO LIMITED",
-        "NESTLEIND.NS": "NESTLE INDIA LIMITED",
-        "NEULANDLAB.NS": "NEULAND LABORATORIES LIMITED",
-        "NEYVELILIG.NS": "Neyveli Lignite Corporation Limited",
-        "NGCT.NS": "Spacenet Enterprises India Limited",
-        "NH.NS": "NARAYANA HRUDAYALA INR10",
-        "NICCO-BE.NS": "NICCO CORPN INR2",
-        "NICCO.NS": "NICCO CORPN INR2",
-        "NIFTYBEES.NS": "NIFTY BMARK EXCH. TRD FND",
-        "NIFTYBEES.NS": "Goldman Sachs Nifty BeES ETF",
-        "NIFTYEES.NS": "EDELWEISS MUTUAL F EDELWEISS ET",
-        "NIFTYEES.NS": "Edelweiss ETF - Nifty 50",
-        "NIITLTD.NS": "NIIT LIMITED",
-        "NILAINFRA.NS": "NILA INFRASTRUCTUR INR1",
-        "NILAINFRA.NS": "NILA INFRASTRUCTUR INR1",
-        "NILKAMAL.NS": "NILKAMAL LIMITED",
-        "NITCO.NS": "NITCO LIMITED",
-        "NITESHEST.NS": "NITESH ESTATES LIMITED",
-        "NITINFIRE.NS": "NITIN FIRE PROTECTION INDUSTRIE",
-        "NITINSPIN.NS": "NITIN SPINNERS LIMITED",
-        "NOCIL.NS": "NOCIL LIMITED",
-        "NOIDATOLL.NS": "NOIDA TOLL BRIDGE COMPANY LIMIT",
-        "NRBBEARING.NS": "NRB BEARING LIMITED",
-        "NRC-BZ.NS": "NRC LIMITED",
-        "OCCL.NS": "ORIENTAL CARB & CH INR10",
-        "OMAXE.NS": "OMAXE LIMITED",
-        "ONELIFECAP.NS": "ONELIFE CAPITAL ADVISORS LIMITE",
-        "OPAL-SM.NS": "OPAL LUXURY TIME P INR10",
-        "OPTOCIRCUI.NS": "OPTO CIRCUITS (INDIA) LIMITED",
-        "ORICONENT.NS": "ORICON ENTERPRISES INR2",
-        "ORICONENT.NS": "ORICON ENTERPRISES INR2",
-        "ORIENTABRA.NS": "ORIENT ABRASIVES INR1 (POST SUB",
-        "ORIENTALTL-BE.NS": "ORIENTAL TRIMEX LTD INR10",
-        "ORIENTALTL.NS": "ORIENTAL TRIMEX INR10",
-        "ORIENTBANK.NS": "ORIENTAL BK OF COM INR10",
-        "ORIENTBELL.NS": "ORIENT BELL LIMITED",
-        "ORIENTLTD.NS": "ORIENT PRESS LTD INR10",
-        "ORIENTREF.NS": "ORIENT REFRACTORIES LIMITED",
-        "ORTEL.NS": "ORTEL COMMUNICATIO INR10",
-        "ORTINLABSS-BE.NS": "Ortin Laboratories Ltd",
-        "ORTINLABSS.NS": "ORTIN LABORATORIES INR10",
-        "ORTINLABSS.NS": "ORTIN LABORATORIES INR10",
-        "PALRED.NS": "PALRED.NS",
-        "PANAMAPET.NS": "PANAMA PETROCHEM LIMITED",
-        "PANASONIC.NS": "Panasonic Appliances India Company Limited",
-        "PANCHSHEE.NS": "PANCHSHEE.NS",
-        "PANCHSHEEL.NS": "Panchsheel Organics Ltd",
-        "PANORAMUNI.NS": "PANORAMIC UNIVERSL INR5",
-        "PARACABLES.NS": "PARAMOUNT COMMUNIC INR2",
-        "PARAL-BZ.NS": "PAREKH ALUM. LTD",
-        "PARAPRINT-BE.NS": "PARAMOUNT PRINTPACK LTD",
-        "PARASPETRO-BE.NS": "PARAS PETROFILS LTD.",
-        "PARASPETRO.NS": "PARAS PETROFILS LT INR1",
-        "PATSPINLTD.NS": "PATSPIN INDIA INR10",
-        "PCJEWELLER.NS": "PC JEWELLER LIMITE INR10",
-        "PDSMFL.NS": "PDS MULTINATIONAL INR10",
-        "PDUMJEIND.NS": "PUDUMJEE INDUSTRIE INR2",
-        "PENINLAND.NS": "PENINSULA LAND LIMITED",
-        "PENPEBS-BE.NS": "Pennar Eng Bldg Sys Ltd",
-        "PENPEBS-BL.NS": "PENNAR ENGINEERED INR10",
-        "PENPEBS-BT.NS": "PENNAR ENGINEERED INR10",
-        "PENPEBS.NS": "PENNAR ENGINEERED INR10",
-        "PENPEBS-IL.NS": "PENNAR ENGINEERED INR10",
-        "PENPEBS-IQ.NS": "PENNAR ENGINEERED INR10",
-        "PENPEBS-RL.NS": "PENNAR ENGINEERED INR10",
-        "PEPL.NS": "PEARL ENG POL INR10(POST RECON)",
-        "PERFECT-SM.NS": "PERFECT INFRAENGIN INR10",
-        "PETRONET.NS": "PETRONET LNG LIMITED",
-        "PETRONET-IL.NS": "PETRONET LNG INR10",
-        "PFOCUS.NS": "PRIME FOCUS LIMITED",
-        "PFRL.NS": "ADITYA BIRLA FASH INR10",
-        "PGEL.NS": "PG ELECTROPLAST LIMITED",
-        "PHILIPCARB.NS": "PHILLIPS CARBON BLACK LIMITED",
-        "PHOENIXLL.NS": "PHOENIX LAMPS LTD INR10(DEMAT)",
-        "PHOENIXLTD.NS": "PHOENIX MILLS INR2",
-        "PIDILITIND.NS": "PIDILITE INDUSTRIE INR1(POST SU",
-        "PILANIINVS.NS": "PILANI INVESTMENT INR10.00",
-        "PILIND.NS": "PILIND.NS",
-        "PILIND.NS": "PIL Italica Lifestyle Limited",
-        "PILITA.NS": "PIL ITALICA LIFEST INR1",
-        "PIONDIST.NS": "PIONEER DISTILLERI INR10",
-        "PIONEEREMB.NS": "PIONEER EMBROID LT INR10",
-        "PIPAVAVDOC.NS": "RELIANCE DEFENCE AND ENGINEERIN",
-        "PIRPHYTO.NS": "PIRAMAL PHYTOCARE INR10",
-        "PKTEA.NS": "PERIA KARAMALAI TE INR10",
-        "PNC.NS": "PRITISH NANDY COMM INR10",
-        "PNEUMATIC.NS": "PNEUMATIC HOLDINGS INR10",
-        "POLYMED.NS": "POLY MEDICURE LIMITED",
-        "POLYPLEX.NS": "POLYPLEX CORPORATION LIMITED",
-        "PRADIP.NS": "PRADIP OVERSEAS LT INR10",
-        "PRAKASHCON.NS": "PRAKASH CONSTROWEL INR1",
-        "PRECOT.NS": "PRECOT MERIDIAN LIMITED",
-        "PREMIERPOL-BE.NS": "PREMIER POLYFILM L INR5",
-        "PREMIERPOL.NS": "PREMIER POLYFILM L INR5",
-        "PRESSMN.NS": "PRESSMAN ADVERTISI INR2",
-        "PRICOL.NS": "PRICOL LIMITED",
-        "PRICOL.NS": "Pricol Limited prior to merger with Pricol Pune Limited",
-        "PRITHVI-BZ.NS": "PRITHVI INFO. SOLN. LTD.",
-        "PROZONINTU.NS": "PROZONE INTU PROPE INR2",
-        "PSL-BE.NS": "PSL LIMITED",
-        "PSL.NS": "PSL LIMITED",
-        "QGOLDHALF.NS": "Quantum Gold ETF",
-        "QNIFTY.NS": "Quantum Index ETF",
-        "QUINTEGRA.NS": "QUINTEGRA SOLUTIONS LTD.",
-        "RADICO.NS": "RADICO KHAITAN LIMITED",
-        "RADICO.NS": "Radico Khaitan Limited",
-        "RAIREKMOH.NS": "RAI SAHEB REKHCHAN INR10",
-        "RAJPALAYA.NS": "Rajapalayam Mills Ltd.",
-        "RAJSREESUG.NS": "RAJSHREE SUG &CHEM INR10",
-        "RAJTV.NS": "RAJ TEL NETWORK INR5",
-        "RAMSARUP-BE.NS": "RAMSARUP INDUSTRIE INR10",
-        "RANBAXY.NS": "Ranbaxy Laboratories Ltd.",
-        "RANKLIN.NS": "Ranklin Solutions Ltd.",
-        "RASOYPR.NS": "RASOYA PROTEINS LI INR1",
-        "RBL.NS": "RANE BRAKE LINING LIMITED",
-        "RD366D38RG-MF.NS": "SBI MUTUAL FUND DEBT 366D 38 RE",
-        "RDAFTIIIDG-MF.NS": "RELIANCE MUTUAL FD DUAL ADVANTA",
-        "RDAFTIIPAG-MF.NS": "RELIANCE CAPITAL A RELIANCE DA",
-        "REDINGTON.NS": "REDINGTON (INDIA) LIMITED",
-        "RELAXO.NS": "RELAXO FOOTWEARS LIMITED",
-        "RELCNX100.NS": "RELIANCE MUTUAL FD RELIANCE ETF",
-        "RELCNX100.NS": "R* Shares CNX 100 ETF",
-        "RELCONS.NS": "RELIANCE MUTUAL FD RELIANCE ETF",
-        "RELCONS.NS": "R*Shares Consumption ETF",
-        "RELDIVOPP.NS": "RELIANCE MUTUAL FD RELIANCE ETF",
-        "RELGOLD.NS": "RELIANCE CAPITAL A R SHARES GOL",
-        "RELGOLD.NS": "R* Shares Gold ETF",
-        "RELGRNIFTY.NS": "RELIGARE MUTUAL FD NIFFTY ETF",
-        "RELGRNIFTY.NS": "Invesco India Nifty ETF",
-        "RELIGAREGO.NS": "INVESCO MUTUAL FUND",
-        "RELIGAREGO.NS": "Invesco India Gold ETF",
-        "RELNIFTY.NS": "RELIANCE MUTUAL FD R NIFTY DIVI",
-        "RELNIFTY.NS": "R* Shares Nifty ETF",
-        "RELNV20.NS": "RELIANCE NIPPON LI RELIANCE ETF",
-        "RELNV20.NS": "R*Shares NV20 ETF",
-        "REPRO.NS": "REPRO INDIA LIMITED",
-        "RFXXII29GR-MF.NS": "RELIANCE CAPITAL A FHF XXI SER",
-        "RKDL.NS": "RAVI KUMAR DISTILLERIES LIMITED",
-        "RMCL.NS": "RADHA MADHAV CORP INR10",
-        "RMMIL.NS": "RESURGERE MINES & MINERALS LIMI",
-        "RPGLIFE.NS": "RPG LIFE SCIENCES LIMITED",
-        "RSDFSA27GR-MF.NS": "SBIAMC - RSDFSA27GR",
-        "RTNINFRA.NS": "RATTANINDIA INFRAS INR2",
-        "RUPA.NS": "RUPA & COMPANY LIMITED",
-        "SABERORGA.NS": "SABERO ORGANICS GUJRAT",
-        "SABTN.NS": "SRI ADHIKARI BROTHERS TELEVISIO",
-        "SADBHIN.NS": "SADBHAV INFRA PROJ INR10",
-        "SAKSOFT.NS": "SAKSOFT LIMITED",
-        "SALONACOT.NS": "SALONA COTSPIN INR10",
-        "SALORAINTL.NS": "SALORA INTL INR10",
-        "SAMBHAAV-BE.NS": "SAMBHAAV-BE.NS",
-        "SAMTEL-BE.NS": "SAMTEL COLOR LTD",
-        "SAMTEL.NS": "SAMTEL COLOUR INR10",
-        "SANCO-SM.NS": "SANCO IND LIMITED INR10",
-        "SANGAMIND.NS": "SANGAM (INDIA) LIMITED",
-        "SANGHIIND-BE.NS": "SANGHIINDUS ROLL SETT",
-        "SANGHVIMOV.NS": "SANGHVI MOVERS INR2.00",
-        "SANOFI.NS": "Sanofi India Limited",
-        "SATHAISPAT.NS": "SATHAVAHANA ISPAT LIMITED",
-        "SAYAJIHOT.NS": "SAYAJIHOT.NS",
-        "SAYAJIHOTL-BE.NS": "SAYAJIHOTL-BE.NS",
-        "SB&TINTL.NS": "SB & T INTL LTD INR10",
-        "SC2RD-MF.NS": "SUNDARAM MUTUAL FU SEL SMALL CA",
-        "SC3RG-MF.NS": "SUNDARAM ASSET MAN SELECT SMALL",
-        "SDAFIIIGR-MF.NS": "SBI MUTUAL FUND SBI DUAL ADVANT",
-        "SDBL.NS": "SOM DISTIL & BREW INR10",
-        "SEAMECLTD.NS": "SEAMEC LIMITED",
-        "SETFGOLD.NS": "SBI MUTUAL FUND SBI-ETF GOLD",
-        "SETFGOLD.NS": "SBI MUTUAL FUND SBI-ETF GOLD",
-        "SETFNIF50.NS": "SBI MUTUAL FUND SBI-ETF NIFTY 5",
-        "SETFNIF50.NS": "SBI MUTUAL FUND SBI-ETF NIFTY 5",
-        "SETFNIFBK.NS": "SBI MUTUAL FUND SBI-ETF NIFTY B",
-        "SETFNIFBK.NS": "SBI MUTUAL FUND SBI-ETF NIFTY B",
-        "SETFNIFJR.NS": "SBIAMC - SETFNIFJR",
-        "SETFNIFTY.NS": "SBIAMC - SETFNIFTY",
-        "SETFNN50.NS": "SBI MUTUAL FUND SBI-ETF NIFTY N",
-        "SETFNN50.NS": "SBI MUTUAL FUND SBI-ETF NIFTY N",
-        "SFCL-BE.NS": "SFCL-BE.NS",
-        "SFCL.NS": "STAR FERRO AND CEM INR1",
-        "SGFL-BE.NS": "SHREE GANESH FORG INR10",
-        "SGFL.NS": "SHREE GANESH FORG INR10",
-        "SGL-BE.NS": "STL GLOBAL LTD INR10",
-        "SGL.NS": "STL GLOBAL LTD INR10",
-        "SHAIVAL-SM.NS": "SHAIVAL REALITY LT INR10",
-        "SHANTIGEAR.NS": "SHANTHI GEARS INR1",
-        "SHARDACROP.NS": "SHARDA CROPCHEM INR10",
-        "SHARIABEES.NS": "BENCHMARK MUTUAL SHARIAH BENCHM",
-        "SHARIABEES.NS": "Goldman Sachs Shariah BeES ETF",
-        "SHEMAROO.NS": "SHEMAROO ENTERTAIN INR10",
-        "SHIRPUR-G.NS": "SHIRPUR GOLD REFINERY LIMITED",
-        "SHIV-VANI.NS": "SHIV-VANI.NS",
-        "SHK.NS": "S H KELKAR AND COM INR10",
-        "SHLAKSHMI-BE.NS": "SHRI LAKSHMI COTSYN LTD",
-        "SHLAKSHMI-BZ.NS": "SHRI LAKSHMI COTSYN LTD",
-        "SHLAKSHMI.NS": "SHRI LAKSHMI COTSYN LTD.",
-        "SHLAKSHMI.NS": "Shri Lakshmi Cotsyn Limited",
-        "SHOPERSTOP.NS": "SHOPPERS STOP INR5",
-        "SHREEPUSHK-BE.NS": "Shre Push Chem & Fert Ltd",
-        "SHREEPUSHK.NS": "SHREE PUSHKAR CHEM INR10",
-        "SHREERAMA.NS": "SHREE RAMA MULTI INR5",
-        "SHREYAS-BE.NS": "SHREYAS-BE.NS",
-        "SHRIASTER.NS": "SHRI ASTER SILICAT INR10",
-        "SHRIRAMEPC.NS": "SHRIRAM EPC LIMITED",
-        "SHYAMCENT-BE.NS": "Shyam Century Ferrous Ltd",
-        "SHYAMCENT.NS": "SHYAM CENTURY FERR INR1",
-        "SHYAMCENT.NS": "SHYAM CENTURY FERR INR1",
-        "SIIL-SM.NS": "SUPREME (INDIA) IM INR10",
-        "SIL.NS": "STANDARD INDS INR5",
-        "SIMPLEXCA.NS": "SIMPLEX CASTINGS LTD.",
-        "SIMPLEXINF.NS": "SIMPLEX INFRASTRUC INR2",
-        "SITICABLE.NS": "SITI Networks Limited",
-        "SIYSIL.NS": "SIYARAM SILK MILLS LIMITED",
-        "SKFINDIA.NS": "SKF INDIA LIMITED",
-        "SKIL.NS": "SKIL INFRASTRUCTUR INR10",
-        "SKIPPER.NS": "SKIPPER LTD INR1",
-        "SKMEGGPROD.NS": "SKM EGG PRODUCTS INR10",
-        "SKUMARSYN.NS": "S. Kumars Nationwide Ltd.",
-        "SKUMARSYNF-BZ.NS": "S KUMARS NATIONWIDE LTD",
-        "SMCSRIIIRD-MF.NS": "SUNDARAM MUTUAL FU MICROCAP III",
-        "SMCSRVIRD-MF.NS": "SUNDARAM ASSET MAN MICRO CAP VI",
-        "SMCSRVIRG-MF.NS": "SUNDARAM ASSET MAN MICRO CAP VI",
-        "SMCSRVRD-MF.NS": "SUNDARAM ASSET MAN MICRO CAP V",
-        "SMCSRVRG-MF.NS": "SUNDARAM ASSET MAN MICRO CAP V",
-        "SMMITCON.NS": "SMMITCON.NS",
-        "SMMOMAI.NS": "SMMOMAI.NS",
-        "SMOPAL.NS": "SMOPAL.NS",
-        "SMSANCO.NS": "SMSANCO.NS",
-        "SMSIIL.NS": "SMSIIL.NS",
-        "SMTHEJO.NS": "SMTHEJO.NS",
-        "SMVETO.NS": "SMVETO.NS",
-        "SOBHA.NS": "SOBHA LIMITED",
-        "SOUISPAT.NS": "SOUTHERN ISPAT & ENGY LTD INR10",
-        "SPHEREGSL.NS": "SPHERE GLOBAL SERV INR10",
-        "SPICEMOBI.NS": "SPICE MOBILITY LTD INR3",
-        "SPYL-BE.NS": "SHEKHAWATI POLY INR1",
-        "SQSBFSI.NS": "SQS INDIA BFSI LTD INR10",
-        "SREEL.NS": "SREELEATHERS LTD INR10",
-        "SRGINFOTEC.NS": "PAN INDIA CORP INR10",
-        "SRGINFOTEC.NS": "PAN INDIA CORP INR10",
-        "SRHHYPOLTD.NS": "SREE RAYALASEEMA H INR10",
-        "SRICHAMUN.NS": "SRICHAMUN.NS",
-        "SRICHAMUND.NS": "Chamundeswari Sug Ltd",
-        "SRIPIPES.NS": "SRIKALAHASTHI PIPE INR10",
-        "SSLT.NS": "SSLT.NS",
-        "SSLT.NS": "Vedanta Limited",
-        "STAN-DR.NS": "STANDARD CHART PLC IDR EACH REP",
-        "STAR-IL.NS": "STRIDES SHASUN LTD INR10",
-        "STINDIA-BE.NS": "STI INDIA LTD",
-        "STINDIA.NS": "STI INDIA INR10",
-        "STOREONE.NS": "SORIL Infra Resources Limited",
-        "STYABS.NS": "INEOS STYROLUTION INR10",
-        "SUBEX.NS": "SUBEX LIMITED",
-        "SUJANATWR.NS": "NEUEON TOWERS LTD",
-        "SUJANATWR.NS": "Neueon Towers Limited",
-        "SUNDARAM-BE.NS": "SUNDARAM-BE.NS",
-        "SUNDRMBRAK.NS": "SUNDARAM BRAKE LININGS LIMITED",
-        "SUPER.NS": "Super Sales India Ltd.",
-        "SUPERHOUSE.NS": "SUPERHOUSE LTD INR10",
-        "SURYAJYOTI.NS": "SURYAJYOTI SPG MIL INR10",
-        "SYMPHONY.NS": "SYMPHONY LIMITED",
-        "SYNGENE.NS": "SYNGENE INTERNATIO INR10",
-        "SYNGENE.NS": "Syngene International Limited",
-        "TANLA.NS": "TANLA SOLUTIONS LIMITED",
-        "TATAINVEST.NS": "TATA INVESTMENT CORPORATION LIM",
-        "TCPLTD-BE.NS": "TCPLTD-BE.NS",
-        "TCPLTD.NS": "TCP Limited",
-        "TELEDATAI.NS": "TELEDATAI.NS",
-        "TEXMOPIPES.NS": "TEXMO PIPES & PROD INR10",
-        "TFL.NS": "TRANSWARRANTY FINA INR10",
-        "TGBHOTELS.NS": "TGB BANQUETS AND H INR10(DEMAT)",
-        "THANGAMAYL.NS": "THANGAMAYIL JEWELL INR10",
-        "THEMISMED-BE.NS": "THEMIS MEDICARE LT INR10",
-        "THEMISMED.NS": "THEMIS MEDICARE LT INR10",
-        "THERMAX.NS": "THERMAX LIMITED",
-        "THOMASCOOK.NS": "THOMAS COOK (INDIA) LIMITED",
-        "THOMASCOTT-BE.NS": "THOMAS SCOTT (INDI INR10",
-        "THOMASCOTT.NS": "THOMAS SCOTT (INDI INR10",
-        "TIJARIA-BE.NS": "TIJARIA POLYPIPES LTD INR10",
-        "TIL.NS": "TIL LIMITED",
-        "TIMBOR-BE.NS": "TIMBOR HOME LTD INR10",
-        "TIMBOR-BZ.NS": "TIMBOR HOME LIMITED",
-        "TIMBOR.NS": "Timbor Home Limited",
-        "TIMESGTY.NS": "TIMES GUARANTY LIMITED",
-        "TIMKEN.NS": "TIMKEN INDIA LIMITED",
-        "TINPLATE.NS": "THE TINPLATE COMPANY OF INDIA L",
-        "TITAN-IL.NS": "TITAN COMPANY LIMITED",
-        "TODAYS-BE.NS": "TODAY'S WRITING PRODUCTS",
-        "TODAYS.NS": "TODAYS WRITING INS INR10",
-        "TOKYOPLAST.NS": "TOKYO PLAST INTL INR10",
-        "TRICOM-BE.NS": "TRICOM INDIA LTD INR2",
-        "TTL.NS": "TT LTD INR10",
-        "TTML.NS": "TATA TELESERVICES (MAHARASHTRA)",
-        "UBHOLDINGS.NS": "UNITED BREWERIES (HOLDINGS) LIM",
-        "UFLEX.NS": "UFLEX LIMITED",
-        "UFTFGR12PX-MF.NS": "UTI MUTUAL FUND FTI XII-X 1096D",
-        "UMANGDAIRY.NS": "UMANG DAIRIES INR5",
-        "UMANGDAIRY.NS": "UMANG DAIRIES INR5",
-        "UNIENTER.NS": "Uniphos Enterprises Ltd.",
-        "UPL.NS": "UPL LIMITED INR2",
-        "URRAP19P10-MF.NS": "UTI ASSET MANAGEME FTI XIX X 10",
-        "UTCPOSRGR1-MF.NS": "UTI MUTUAL FUND CAP PRO OR IV-I",
-        "UTIFEFRGR1-MF.NS": "UTI MUTUAL FUND FEF-S-I-1100D R",
-        "UTIFEFRGR2-MF.NS": "UTI ASSET MANAGEME FOCUS EQTY I",
-        "UTINIFTETF.NS": "UTI MUTUAL FUND UTI NIFTY ETF",
-        "UTINIFTETF.NS": "UTI Nifty ETF",
-        "UTISENSETF.NS": "UTI MUTUAL FUND UTI- SENSEX ETF",
-        "UTISENSETF.NS": "UTI Sensex ETF",
-        "UTRGESSDDP-MF.NS": "UTI MUTUAL FUND RGSS DIRECT DIV",
-        "UTRGESSRGR-MF.NS": "UTI MUTUAL FUND RGSS RET GROWTH",
-        "VAIBHAVGBL.NS": "VAIBHAV GLOBAL LTD INR10",
-        "VAKRANGEE.NS": "VAKRANGEE LTD INR1",
-        "VALECHAENG.NS": "VALECHA ENGINEERIN INR10",
-        "VARDHACRLC.NS": "VARDHMAN ACRYLICS INR10",
-        "VARDMNPOLY.NS": "VARDHMAN POLYTEX INR10",
-        "VARUN-BZ.NS": "VARUN INDUS. LTD.",
-        "VASCONEQ.NS": "VASCON ENGINEERS LIMITED",
-        "VEDL.NS": "VEDANTA LIMITED INR1",
-        "VENKEYS.NS": "Venky's (India) Limited",
-        "VENUSREM.NS": "VENUS REMEDIES LIMITED",
-        "VETO-SM.NS": "VETO SWITCHGEARS A INR10",
-        "VIKASHMET.NS": "VIKASHMET.NS",
-        "VIMTALABS.NS": "VIMTA LABS LIMITED",
-        "VINATIORGA.NS": "VINATI ORGANICS INR2",
-        "VINDHYATEL.NS": "VINDHYA TELELINKS LIMITED",
-        "VIPULLTD.NS": "VIPUL LTD INR1",
-        "VISESHINFO-BE.NS": "VISESH INFO NPP231299 DEP",
-        "VISESHINFO.NS": "VISESH INFOTECNICS INR1",
-        "VISUINTL-BE.NS": "VISU INTERNATIONAL INR10",
-        "VISUINTL.NS": "VISU INTERNATIONAL INR10",
-        "VIVIDHA.NS": "VISAGAR POLYTEX INR1",
-        "VIVIMEDLAB.NS": "VIVIMED LABS LIMITED",
-        "VLSFINANCE.NS": "VLS FIN LTD INDIA INR10",
-        "VOLTAMP.NS": "VOLTAMP TRANSFORMERS LIMITED",
-        "VSTTILLERS.NS": "VST TILLERS TRACT INR10",
-        "VTMLTD.NS": "VTM Limted",
-        "VTXIND-BE.NS": "VTXIND-BE.NS",
-        "VTXIND.NS": "VTXIND.NS",
-        "WABCOINDIA.NS": "WABCO INDIA LIMITED",
-        "WANBURY-BE.NS": "WANBURY LTD INR10",
-        "WB3RG-MF.NS": "SUNDARMAMC - WB3RG",
-        "WEIZMANIND.NS": "WEIZMANN INR10",
-        "WELENT.NS": "WELSPUN ENTERPRISE INR10",
-        "WELPROJ.NS": "WELSPUN ENTERPRISE INR10",
-        "WELSYNTEX.NS": "WELSPUN SYNTEX",
-        "WELSYNTEX.NS": "WELSPUN SYNTEX",
-        "WHIRLPOOL.NS": "WHIRLPOOL OF INDIA LIMITED",
-        "WILLAMAGOR.NS": "WILLIAMSON MAGOR & COMPANY LIMI",
-        "WOCKPHARMA.NS": "WOCKHARDT INR5",
-        "WONDERLA.NS": "WONDERLA HOLIDAYS INR10",
-        "XCHANGING.NS": "XCHANGING SOLUTIONS LIMITED",
-        "ZEEL-P1.NS": "ZEE ENTERTAIN ENT 6% CUM RED NO",
-        "ZEELEARN.NS": "ZEE LEARN LIMITED",
-        "ZENITHBIR.NS": "ZENITH BIRLA(INDIA INR10",
-        "ZENITHCOMP.NS": "Zenith Computers Limited",
-        "ZYDUSWELL.NS": "ZYDUS WELLNESS LIMITED"
-    },
-
-    "Money Center Banks": {
-        "ALBK.BO": "ALLAHABAD BANK",
-        "ALBK.NS": "Allahabad Bank",
-        "ANDHRABANK.BO": "Andhra Bank",
-        "ANDHRABANK.NS": "Andhra Bank",
-        "AXISBANK-IL.NS": "AXIS BANK INR2",
-        "AXISBANK.BO": "AXIS Bank Limited",
-        "AXISBANK.NS": "Axis Bank Limited",
-        "BANKA.BO": "BANKA (INDIA) LTD.",
-        "BANKBARODA.BO": "BANK OF BARODA",
-        "BANKBARODA.NS": "Bank of Baroda",
-        "BANKBEES.NS": "BENCHMARK BANKBEES",
-        "BANKBEES.BO": "Goldman Sachs Mutual Fund - Goldman Sachs Banking Index Exchange Traded Scheme",
-        "BANKBEES.NS": "Goldman Sachs Bank BeES ETF",
-        "BANKINDIA.BO": "BANK OF INDIA",
-        "BANKINDIA.NS": "Bank of India Limited",
-        "CANBK.BO": "CANARA BANK",
-        "CANBK.NS": "Canara Bank",
-        "CENTRALBK.NS": "CENTRAL BANK OF INDIA",
-        "CENTRALBK.BO": "Central Bank of India",
-        "CENTRALBK.NS": "Central Bank of India",
-        "CORPBANK.BO": "Corporation Bank",
-        "CORPBANK.NS": "Corporation Bank",
-        "CUB.BO": "CITY UNION BANK LTD.",
-        "CUB.NS": "City Union Bank Limited",
-        "DCBBANK.NS": "DCB BANK LIMITED INR10",
-        "DCBBANK.BO": "DCB BANK LIMITED",
-        "DCBBANK.NS": "DCB Bank Limited",
-        "DCBBANK6.BO": "DCBBANK6.BO",
-        "DENABANK.NS": "DENA BANK",
-        "DENABANK.BO": "Dena Bank Ltd.",
-        "DENABANK.NS": "Dena Bank",
-        "DHANBANK.BO": "Dhanlaxmi Bank Limited",
-        "DHANBANK.NS": "Dhanlaxmi Bank Limited",
-        "EBANK.NS": "Edelweiss ETF - Nifty Bank",
-        "FEDERALBNK.NS": "THE FEDERAL BANK LIMITED",
-        "FEDERALBNK.BO": "FEDERAL BANK LTD.",
-        "FEDERALBNK.NS": "The Federal Bank Limited",
-        "HDFCBANK-IL.NS": "HDFC BANK INR2",
-        "HDFCBANK.BO": "HDFC Bank Limited",
-        "HDFCBANK.NS": "HDFC Bank Limited",
-        "HDFCBANK6.BO": "HDFCBANK6.BO",
-        "ICICIBANK.NS": "ICICI BANK LIMITED",
-        "ICICIBANK.BO": "ICICI Bank Ltd.",
-        "ICICIBANK.NS": "ICICI Bank Limited",
-        "ICICIBANK6.BO": "ICICIBANK6.BO",
-        "IDBI.NS": "IDBI BANK LIMITED",
-        "IDBI.BO": "IDBI Bank Limited",
-        "IDBI.NS": "IDBI Bank Limited",
-        "IDFCBANK-BE.NS": "IDFC Bank Limited",
-        "IDFCBANK.NS": "IDFC BANK LTD INR10",
-        "IDFCBANK.BO": "IDFC Bank Limited",
-        "IDFCBANK.NS": "IDFC Bank Limited",
-        "INDBANK.NS": "INDBANK MERCHANT BANKING SERVIC",
-        "INDBANK.BO": "INDBANK MERCHANT BANKING SERVI",
-        "INDBNK.BO": "Ind. Bank Housing Ltd",
-        "INDIANB.BO": "Indian Bank",
-        "INDIANB.NS": "Indian Bank",
-        "INDUSINDBK.NS": "INDUSIND BANK INR10",
-        "INDUSINDBK-IL.NS": "INDUSIND BANK INR10",
-        "INDUSINDBK.BO": "IndusInd Bank Limited",
-        "INDUSINDBK.NS": "IndusInd Bank Limited",
-        "IOB.BO": "Indian Overseas Bank",
-        "IOB.NS": "Indian Overseas Bank",
-        "J&KBANK.NS": "THE JAMMU & KASHMIR BANK LIMITE",
-        "J&KBANK.BO": "JAMMU & KASHMIR BANK LTD.",
-        "J&KBANK.NS": "The Jammu and Kashmir Bank Limited",
-        "KARURVYSYA.BO": "KARUR VYSYA BANK LTD.",
-        "KARURVYSYA.NS": "The Karur Vysya Bank Limited",
-        "KOTAKBANK.BO": "Kotak Mahindra Bank Limited",
-        "KOTAKBANK.NS": "Kotak Mahindra Bank Limited",
-        "KOTAKBANK6.BO": "KOTAKBANK6.BO",
-        "KOTAKBKETF.NS": "KOTAK MAHINDRA MF BANKING DIV P",
-        "KOTAKBKETF.NS": "Kotak Banking ETF",
-        "KOTAKPSUBK.BO": "Kotak Mahindra Mutual Fund - Kotak PSU Bank ETF",
-        "KOTAKPSUBK.NS": "Kotak PSU Bank ETF",
-        "KTKBANK.BO": "Karnataka Bank Ltd.",
-        "KTKBANK.NS": "The Karnataka Bank Limited",
-        "KTKBANK6.BO": "KTKBANK6.BO",
-        "LAKSHVILAS.BO": "The Lakshmi Vilas Bank Limited",
-        "LAKSHVILAS.NS": "The Lakshmi Vilas Bank Limited",
-        "MAHABANK.BO": "Bank of Maharashtra",
-        "MAHABANK.NS": "Bank of Maharashtra",
-        "MYSOREBANK.BO": "STATE BANK OF MYSORE",
-        "MYSOREBANK.NS": "State Bank of Mysore",
-        "MYSOREBANK6.BO": "MYSOREBANK6.BO",
-        "ORIENTBANK.BO": "ORIENTAL BANK OF COMMERCE",
-        "ORIENTBANK.NS": "Oriental Bank of Commerce",
-        "ORIENTBANK6.BO": "ORIENTBANK6.BO",
-        "PNB.NS": "PUNJAB NATL BANK INR2",
-        "PNB-IL.NS": "PUNJAB NATL BANK INR2",
-        "PNB.BO": "Punjab National Bank",
-        "PNB.NS": "Punjab National Bank",
-        "PSB.NS": "PUNJAB & SIND BANK",
-        "PSB.BO": "PUNJAB & SIND BANK",
-        "PSB.NS": "Punjab & Sind Bank",
-        "PSUBNKBEES.NS": "GOLDMAN SACHS PS PSU BANK BENCH",
-        "PSUBNKBEES.BO": "Goldman Sachs Mutual Fund - Goldman Sachs PSU Bank Exchange Traded Scheme",
-        "PSUBNKBEES.NS": "Goldman Sachs PSU Bank BeES ETF",
-        "RELBANK.BO": "Reliance Mutual Fund - Reliance Banking Fund",
-        "RELBANK.NS": "R* Shares Banking ETF",
-        "RELBANKINAV.BO": "i-NAV RELIANCE BANK",
-        "SBBJ.BO": "State Bank of Bikaner & Jaipur",
-        "SBBJ.NS": "State Bank of Bikaner & Jaipur",
-        "SBIN.BO": "STATE BANK OF INDIA",
-        "SBIN.NS": "State Bank of India",
-        "SBT.BO": "State Bank of Travancore",
-        "SBT.NS": "State Bank of Travancore",
-        "SETFBANK.NS": "SBIAMC - SETFBANK",
-        "SOUTHBANK.BO": "SOUTH INDIAN BANK LTD.",
-        "SOUTHBANK.NS": "The South Indian Bank Limited",
-        "SYNDIBANK.NS": "SYNDICATE BANK",
-        "SYNDIBANK.BO": "Syndicate Bank",
-        "SYNDIBANK.NS": "Syndicate Bank",
-        "UCOBANK.BO": "UCO BANK",
-        "UCOBANK.NS": "UCO Bank",
-        "UCOBANK4.BO": "UCOBANK4.BO",
-        "UNIONBANK.BO": "Union Bank of India",
-        "UNIONBANK.NS": "Union Bank of India",
-        "UNITEDBNK.BO": "United Bank of India",
-        "UNITEDBNK.NS": "United Bank of India",
-        "VIJAYABANK.NS": "VIJAYA BANK INR10",
-        "VIJAYABANK.BO": "Vijaya Bank Ltd.",
-        "VIJAYABANK.NS": "Vijaya Bank",
-        "VIJAYABANK4.BO": "VIJAYABANK4.BO",
-        "VIJAYABANK6.BO": "VIJAYABANK6.BO",
-        "YESBANK.NS": "YES BANK LIMITED",
-        "YESBANK.BO": "Yes Bank Limited",
-        "YESBANK.NS": "Yes Bank Limited",
-        "YESBANK4.BO": "YESBANK4.BO"
-    },
-
-    "Mortgage Investment": {
-        "ASHFL.BO": "Akme Star Housing Finance Limi",
-        "CANFINHOME.NS": "Can Fin Homes Limited",
-        "CORALFINAC.BO": "CORAL INDIA FINANCE & HOUSING",
-        "DHFL.BO": "DEWAN HOUSING FINANCE CORPORAT",
-        "DHFL.NS": "Dewan Housing Finance Corporation Limited",
-        "GICHSGFIN.NS": "GIC HOUSING FINANCE LIMITED",
-        "GICHSGFIN.BO": "GIC HOUSING FINANCE LTD.",
-        "GICHSGFIN.NS": "GIC Housing Finance Limited",
-        "GRUH.NS": "GRUH Finance Limited",
-        "HDFC.NS": "HOUSING DEVELOPMENT FINANCE COR",
-        "HDFC.BO": "Housing Development Finance Corporation Limited",
-        "HDFC.NS": "Housing Development Finance Corporation Limited",
-        "IBULHSGFIN.BO": "INDIABULLS HOUSING FINANCE LTD",
-        "IBULHSGFIN.NS": "Indiabulls Housing Finance Limited",
-        "INTERHG.BO": "International Housing Finance Corporation Limited",
-        "LICHSGFIN.NS": "LIC HOUSING FINANCE LIMITED",
-        "LICHSGFIN.BO": "LIC Housing Finance Ltd.",
-        "LICHSGFIN.NS": "LIC Housing Finance Limited",
-        "MANRAJH.BO": "Manraj Housing Finance Limited",
-        "MEHTAHG.BO": "Mehta Housing Finance Ltd.",
-        "PFS.NS": "PTC India Financial Services Limited",
-        "REPCOHOME.NS": "REPCO HOME FINANCE INR10",
-        "REPCOHOME.BO": "REPCO HOME FINANCE LTD.",
-        "REPCOHOME.NS": "Repco Home Finance Limited",
-        "SBIHOMEFIN.BO": "SBI HOME FINANCE LTD.",
-        "SREINFRA.NS": "SREI Infrastructure Finance Limited",
-        "SRGHFL.BO": "SRG HOUSING FINANCE LTD.",
-        "TFL.NS": "Transwarranty Finance Limited",
-        "VAXHS.BO": "Vax Housing Finance Corporation Ltd."
-    },
-
-    "Multimedia & Graphics Software": {
-        "DQE.NS": "DQ Entertainment (International) Limited"
-    },
-
-    "Oil & Gas Drilling & Exploration": {
-        "ABAN.NS": "Aban Offshore Limited",
-        "JINDRILL.NS": "Jindal Drilling & Industries Limited"
-    },
-
-    "Oil & Gas Equipment & Services": {
-        "ALPHAGEO.NS": "Alphageo (India) Limited",
-        "DEEPIND.NS": "Deep Industries Limited",
-        "DOLPHINOFF.NS": "Dolphin Offshore Enterprises (India) Limited",
-        "GTOFFSHORE.NS": "GOL Offshore Limited",
-        "OILCOUNTUB.NS": "Oil Country Tubular Limited"
-    },
-
-    "Oil & Gas Operations": {
-        "ASIANOI.BO": "Asian Oilfield Services Ltd.",
-        "BPCL.BO": "Bharat Petroleum Corp. Ltd.",
-        "CHAKVEG.BO": "CHAKAN VEGOILS LTD.",
-        "CHENNPETRO.BO": "Chennai Petroleum Corporation Ltd",
-        "CONFIPET.BO": "Confidence Petroleum India Ltd.",
-        "CONTPTR.BO": "Continental Petroleums Ltd.",
-        "CORAGRO.BO": "COROMANDEL AGRO PRODUCTS & OIL",
-        "COVENTRY.BO": "Coventry Coil-o-Matic Haryana Limited",
-        "DARSHAN.BO": "DARSHAN OILS LTD.",
-        "ESSAROIL.BO": "Essar Oil Ltd.",
-        "ESSAROIL.NS": "Essar Oil Ltd.",
-        "ESSAROIL4.BO": "ESSAROIL4.BO",
-        "GOKUL-BE.NS": "GOKUL REFOILS & SO INR2",
-        "GOKUL.NS": "GOKUL REFOILS AND SOLVENT LIMIT",
-        "GOKUL.BO": "Gokul Refoils And Solvent Limited",
-        "GUJFOIL.BO": "Gujarat Foils Ltd.",
-        "GULFOILLUB.NS": "GULF OIL LUBRICANT INR2",
-        "GULFOILLUB.BO": "GULF OIL LUBRICANTS INDIA LTD",
-        "GULFPETRO.NS": "GP PETROLEUMS LTD INR5",
-        "GULFPETRO.BO": "GP PETROLEUMS LTD",
-        "HINDOILEXP.BO": "Hindustan Oil Exploration Company Limited",
-        "HINDOILEXP6.BO": "HINDOILEXP6.BO",
-        "HINDPETRO.NS": "HINDUSTAN PETROLEUM CORPORATION",
-        "HINDPETRO.BO": "HINDUSTAN PETROLEUM CORPORATIO",
-        "HINDPETRO.NS": "Hindustan Petroleum Corporation Limited",
-        "ICCON.BO": "ICCON OIL & SPECIALITIES LTD.",
-        "IGC.BO": "IGC Foils Limited",
-        "INTLNKP.BO": "Interlink Petroleum Ltd.",
-        "INTSTOIL.BO": "Inter State Oil Carrier Ltd.",
-        "IOC.BO": "Indian Oil Corporation Limited",
-        "KIRLOSENG.NS": "KIRLOSKAR OIL ENGINES LIMITED",
-        "KIRLOSENG.BO": "KIRLOSKAR OIL ENGINES LTD.",
-        "KSOILS.BO": "K.S.OILS LTD.",
-        "KSOILS.NS": "KS Oils Ltd.",
-        "KSOILS6.BO": "KSOILS6.BO",
-        "MNSGOIL.BO": "MANSINGHKA OIL PRODUCTS LTD.",
-        "MOIL.BO": "MOIL LTD.",
-        "MOTOROLSP.BO": "MOTOROL SPECIALITY OILS LTD.",
-        "NAGAROIL.NS": "NAGARJUNA OIL REFI INR1",
-        "OIL.BO": "Oil India Limited",
-        "OIL6.BO": "OIL6.BO",
-        "OILCOUNTUB.BO": "OIL COUNTRY TUBULAR LTD.",
-        "OLYOI.BO": "Olympic Oil Industries Ltd.",
-        "ONGC.NS": "OIL & NATURAL GAS CORPORATION L",
-        "ONGC.BO": "Oil and Natural Gas Corp. Ltd.",
-        "PGFOILQ.BO": "P G Foils Limited",
-        "POONADAL.BO": "Poona Dal & Oil Industries Ltd.",
-        "RAJOIL-BE.NS": "RAJ OIL MILLS LTD INR10",
-        "RAJOIL.BO": "Raj Oil Mills Limited",
-        "SAHPETRO.NS": "GP Petroleums Limited",
-        "SANWARIA.BO": "Sanwaria Agro Oils Limited",
-        "SHIV-VANI.NS": "SVOGL Oil Gas and Energy Limited",
-        "SHRAJOI.BO": "SHRI RAJIVLOCHAN OIL EXTRACTIO",
-        "SVOGL.NS": "SVOGL OIL GAS AND INR10",
-        "SVOGL.BO": "SVOGL Oil Gas And Energy Limit",
-        "SYNTHFO.BO": "Synthiko Foils Ltd.",
-        "TIDEWATER.BO": "TIDE WATER OIL (INDIA) LTD.",
-        "VIMALOIL.NS": "VIMAL OIL & FOOD INR10",
-        "VIMALOIL.BO": "VIMAL OIL & FOODS LTD."
-    },
-
-    "Oil & Gas Refining & Marketing": {
-        "BPCL.NS": "Bharat Petroleum Corporation Limited",
-        "CHENNPETRO.NS": "Chennai Petroleum Corporation Limited",
-        "GULFOILLUB.NS": "Gulf Oil Lubricants India Limited",
-        "GULFPETRO.NS": "GP Petroleums Limited",
-        "IOC.NS": "Indian Oil Corporation Limited",
-        "MRPL.NS": "Mangalore Refinery and Petrochemicals Limited",
-        "NAGAROIL.BO": "NAGARJUNA OIL REFINERY LTD.",
-        "NAGAROIL.NS": "Nagarjuna Oil Refinery Limited",
-        "PANAMAPET.NS": "Panama Petrochem Limited",
-        "PETRONET.NS": "Petronet LNG Limited",
-        "RELIANCE.NS": "Reliance Industries Limited",
-        "TIDEWATER.NS": "Tide Water Oil Co. (India), Ltd."
-    },
-
-    "Packaging & Containers": {
-        "AMDIND.NS": "AMD Industries Limited",
-        "ANTGRAPHIC.NS": "Antarctica Limited",
-        "COSMOFILMS.NS": "Cosmo Films Limited",
-        "EMMBI.NS": "Emmbi Industries Limited",
-        "ESSDEE.NS": "Ess Dee Aluminium Limited",
-        "HINDNATGLS.NS": "Hindusthan National Glass & Industries Limited",
-        "NAHARPOLY.NS": "Nahar Poly Films Limited",
-        "ORIENTLTD.NS": "Orient Press Limited",
-        "PAPERPROD.NS": "Huhtamaki PPL Limited",
-        "PARAPRINT.NS": "Paramount Printpackaging Limited",
-        "PDMJEPAPER.NS": "Pudumjee Paper Products Limited",
-        "PEARLPOLY.NS": "Pearl Polymers Limited",
-        "POLYPLEX.NS": "Polyplex Corporation Limited",
-        "RMCL.NS": "Radha Madhav Corporation Limited",
-        "SHREERAMA.NS": "Shree Rama Multi-Tech Limited",
-        "TIMETECHNO.NS": "Time Technoplast Limited",
-        "UFLEX.NS": "Uflex Limited"
-    },
-
-    "Paper & Paper Products": {
-        "APTPACK.BO": "APT PACKAGING LTD.",
-        "ARMSPAPER.BO": "Arms Paper Ltd",
-        "AURANPAP.BO": "Aurangabad Paper Mills Limited",
-        "BALLARPUR.NS": "Ballarpur Industries Limited",
-        "BAPACK.BO": "B&A PACKAGING INDIA LIMITED",
-        "BGPL.BO": "BIO GREEN PAPERS LTD",
-        "CHADPAP.BO": "CHADHA PAPERS LTD.",
-        "ELLOPAP.BO": "ELLORA PAPER MILLS LTD.",
-        "EMAMIPAP.BO": "Emami Paper Mills Ltd.",
-        "GANGAPA.BO": "GANGA PAPERS INDIA LTD.",
-        "GENUSPAPER.NS": "GENUS PAPER AND BO INR10",
-        "GENUSPAPER.BO": "GENUS PAPER & BOARDS LIMITED",
-        "GENUSPAPER.NS": "Genus Paper & Boards Limited",
-        "GYTRIPA.BO": "GAYATRI TISSUE & PAPERS LTD.",
-        "IPAPPM.BO": "INTERNATIONAL PAPER APPM LIMIT",
-        "IPAPPM.NS": "International Paper APPM Limited",
-        "JKPAPER.NS": "JK PAPER LIMITED",
-        "JKPAPER.BO": "JK PAPER LTD.",
-        "JKPAPER.NS": "JK Paper Limited",
-        "JMDEPACKR.BO": "JMDE PACKAGING & REALTIES LTD.",
-        "KALPAPER.BO": "Kalptaru Papers Ltd",
-        "KUANTUM.BO": "KUANTUM PAPERS LTD.",
-        "MAGNUM.NS": "Magnum Ventures Limited",
-        "MALUPAPER.NS": "MALU PAPER MILLS LIMITED",
-        "MALUPAPER.BO": "Malu Paper Mills Ltd.",
-        "MALUPAPER.NS": "Malu Paper Mills Limited",
-        "MOHITPPR.BO": "Mohit Paper Mills Limited",
-        "MOLDTKPAC.NS": "MOLD-TEK PACKAGING INR5",
-        "MOLDTKPAC.BO": "MOLD-TEK PACKAGING LIMITED",
-        "MOLDTKPAC.NS": "Mold-Tek Packaging Limited",
-        "MUKPA.BO": "MUKERIAN PAPERS LTD.",
-        "NATHPULP.BO": "NATH PULP & PAPER MILLS LTD.",
-        "NAYAPAP.BO": "NAYAGARA PAPER PRODUCTS (INDIA",
-        "NEPCPAPER.BO": "NEPC PAPER & BOARD LTD.",
-        "NIRVIKARA-BE.NS": "Nirvikara Paper Mills Ltd",
-        "NIRVIKARA.NS": "NIRVIKARA PAPER MI INR10",
-        "NIRVIKARA.NS": "Balkrishna Paper Mills Limited",
-        "PARAPRINT.BO": "PARAMOUNT PRINTPACKAGING LTD.",
-        "PDMJEPAPER.BO": "Pudumjee Paper Products Limite",
-        "PDUMJEPULP.NS": "PUDUMJEE PULP & PA INR2.00",
-        "PDUMJEPULP.BO": "PUDUMJEE PULP & PAPER MILLS LT",
-        "PDUMJEPULP.NS": "Pudumjee Pulp & Paper Mills Limited",
-        "PITAMBER.BO": "PITAMBAR COATED PAPERS LTD.",
-        "RAINBOWPAP.NS": "RAINBOW PAPERS LIMITED",
-        "RAINBOWPAP.BO": "RAINBOW PAPERS LTD.",
-        "RAINBOWPAP.NS": "Rainbow Papers Limited",
-        "RAMANEWS.NS": "Shree Rama Newsprint Limited",
-        "RAMAPPR-B.BO": "Rama Paper Mills Ltd.",
-        "RAMAPULP.BO": "Rama Pulp and Papers Limited",
-        "RANAMOH.BO": "RANA MOHENDRA PAPERS LTD.",
-        "RUCHIRA.BO": "Ruchira Papers Ltd.",
-        "RUCHIRA.NS": "Ruchira Papers Limited",
-        "SANPA.BO": "Sangal Papers Ltd",
-        "SAPPL.BO": "Shree Ajit Pulp And Paper Ltd.",
-        "SARDAPPR.BO": "Sarda Papers Limited",
-        "SAURAPB-B.BO": "SAURASHTRA PAPER & BOARD MILLS",
-        "SERVALL.NS": "SERVALAKSHMI PAPER INR10",
-        "SERVALL.BO": "SERVALAKSHMI PAPER LTD.",
-        "SERVALL.NS": "Servalakshmi Paper Limited",
-        "SESHAPAPER.BO": "SESHASAYEE PAPER & BOARDS LTD.",
-        "SESHAPAPER.NS": "Seshasayee Paper and Boards Limited",
-        "SHBHAWPA.BO": "Shree Bhawani Paper Mills Ltd.",
-        "SHIVAPPR.BO": "SHIVA PAPER MILLS LTD.",
-        "SHJAGDM.BO": "Shree Jagdambe Paper Mills Ltd.",
-        "SHKARTP.BO": "Shree Karthik Papers Ltd.",
-        "SHREAMBP.BO": "SHREE AMBESHWAR PAPER MILLS LT",
-        "SHREEAJIT.BO": "Shree Ajit Pulp & Paper limited",
-        "SHREYANIND.NS": "Shreyans Industries Limited",
-        "SHRVINDPPR.BO": "SHREE VINDHYA PAPER MILLS LTD.",
-        "SIMPLXPAP.BO": "Simplex Papers Ltd.",
-        "SIRPAPER-BZ.NS": "SIRPUR PAPER MILLS LTD",
-        "SIRPAPER.BO": "SIRPUR PAPER MILLS LTD.",
-        "SIRPAPER.NS": "Sirpur Paper Mills Ltd.",
-        "SPECIAPP.BO": "Speciality Papers Ltd.",
-        "SREESAKHTI.BO": "Sree Sakthi Paper Mills Limited",
-        "SRPML.BO": "Shree Rajeshwaranand Paper Mills Ltd.",
-        "STARPAPER.BO": "STAR PAPER MILLS LTD.",
-        "STARPAPER.NS": "Star Paper Mills Limited",
-        "STHINPA.BO": "The South India Paper Mills Limited",
-        "SUNDARAM.NS": "Sundaram Multi Pap Limited",
-        "SUPRBPA.BO": "SUPERB PAPERS LTD.",
-        "TCPLPACK.BO": "TCPL Packaging Limited",
-        "TNPL.NS": "Tamil Nadu Newsprint and Papers Limited",
-        "VICTORYPP.BO": "VICTORY PAPER & BOARDS (INDIA)",
-        "WLPACKP.BO": "WELL PACK PAPERS & CONTAINERS",
-        "WSTCSTPAPR.NS": "WEST COAST PAPER M INR2.00",
-        "WSTCSTPAPR.BO": "West Coast Paper Mills Limited",
-        "WSTCSTPAPR.NS": "West Coast Paper Mills Limited",
-        "YASHPPR.BO": "Yash Papers Limited"
-    },
-
-    "Personal Products": {
-        "BAJAJCORP.NS": "Bajaj Corp Limited",
-        "COLPAL.NS": "Colgate-Palmolive (India) Limited",
-        "DABUR.NS": "Dabur India Limited",
-        "EMAMILTD.NS": "Emami Limited",
-        "FCEL.NS": "FUTURE CONSUMER EN INR6",
-        "FCEL.NS": "Future Consumer Limited",
-        "GILLETTE.NS": "Gillette India Limited",
-        "GODREJCP.NS": "GODREJ CONSUMER PRODUCTS LIMITE",
-        "GODREJCP.BO": "Godrej Consumer Products Limited",
-        "GODREJCP.NS": "Godrej Consumer Products Limited",
-        "GSKCONS.BO": "GLAXOSMITHKLINE CONSUMER HEALT",
-        "HINDUNILVR.NS": "Hindustan Unilever Limited",
-        "JHS.NS": "JHS Svendgaard Laboratories Limited",
-        "JYOTHYLAB.NS": "Jyothy Laboratories Limited",
-        "KAYA.NS": "Kaya Limited",
-        "MARICO.NS": "Marico Limited",
-        "PGHH.NS": "Procter & Gamble Hygiene and Health Care Limited",
-        "ZYDUSWELL.NS": "Zydus Wellness Limited"
-    },
-
-    "Property & Casualty Insurance": {
-        "BAJAJFINSV.NS": "Bajaj Finserv Limited"
-    },
-
-    "Property Management": {
-        "AJMERA.NS": "Ajmera Realty & Infra India Limited",
-        "ANANTRAJ.NS": "Anant Raj Limited",
-        "ANSALHSG.NS": "Ansal Housing & Construction Limited",
-        "BRIGADE.NS": "Brigade Enterprises Limited",
-        "CINELINE.NS": "Cineline India Limited",
-        "EMAMIINFRA.NS": "Emami Infrastructure Limited",
-        "FMNL.NS": "Future Market Networks Limited",
-        "IBREALEST.NS": "Indiabulls Real Estate Limited",
-        "MOTOGENFIN.NS": "The Motor & General Finance Limited",
-        "OBEROIRLTY.NS": "Oberoi Realty Limited",
-        "PDUMJEIND.NS": "Pudumjee Industries Limited",
-        "TEXINFRA.NS": "Texmaco Infrastructure & Holdings Limited"
-    },
-
-    "Publishing - Newspapers": {
-        "CORNE.BO": "CORAL NEWSPRINTS LTD.",
-        "CYBERMEDIA.NS": "Cyber Media (India) Limited",
-        "DBCORP.NS": "D. B. Corp Limited",
-        "HMVL.NS": "Hindustan Media Ventures Limited",
-        "HTMEDIA.NS": "HT Media Limited",
-        "INFOMEDIA.NS": "Infomedia Press Limited",
-        "JAGRAN.NS": "Jagran Prakashan Limited",
-        "MPSLTD.NS": "MPS Limited",
-        "NAVNETEDUL.NS": "Navneet Education Limited",
-        "NEXTMEDIA.NS": "Next Mediaworks Limited",
-        "NOVAPUB.BO": "NOVA PUBLICATIONS INDIA LTD",
-        "RAMANEWS.BO": "SHREE RAMA NEWSPRINT LTD.",
-        "RREALTY.BO": "REAL NEWS & VIEWS LTD",
-        "SAMBHAAV.NS": "Sambhaav Media Limited",
-        "SANDESH.NS": "The Sandesh Limited",
-        "TNPL.NS": "TAMIL NADU NEWSPRINT & PAPERS L",
-        "TNPL.BO": "Tamil Nadu Newsprint and Papers Limited"
-    },
-
-    "Railroads": {
-        "CEBBCO.NS": "Commercial Engineers & Body Builders Co Limited",
-        "NECCLTD.NS": "North Eastern Carrying Corporation Limited",
-        "TWL.NS": "Titagarh Wagons Limited",
-         "RVNL.NS": "Rail Vikas Nigam Limited",
-        "IRFC.NS": "Indian Rail Finance Corp",
-        "IRCON.NS": "Ircon international",
-         "IRCTC.NS": "IRCTC"
-     
-
-    },
-
-    "Real Estate Development": {
-        "AJMERA.BO": "Ajmera Realty & Infra India Limited",
-        "ALPINEHOU.BO": "ALPINE HOUSING DEVELOPMENT COR",
-        "ANSALAPI.NS": "Ansal Properties & Infrastructure Limited",
-        "AREALTY.BO": "Alchemist Realty Limited",
-        "ARIHANT.NS": "Arihant Foundations & Housing Limited",
-        "ASHIANA.NS": "Ashiana Housing Limited",
-        "BBREALTY.BO": "B&B REALTY LIMITED",
-        "BFLDEV.BO": "BFL Developers Limited.",
-        "BHARATAGRI.BO": "BHARAT AGRI FERT & REALTY LTD.",
-        "BRANDREAL.BO": "Brand Realty Services Ltd.",
-        "BSELINFRA.BO": "BSEL Infrastructure Realty Limited",
-        "BSELINFRA.NS": "BSEL Infrastructure Realty Limited",
-        "CHDDLTD.BO": "CHD Developers Limited",
-        "CITADEL.BO": "CITADEL REALTY AND DEVELOPERS",
-        "COUNCODOS.NS": "Country Condo'S Limited",
-        "DBREALTY.BO": "DB Realty Ltd",
-        "DBREALTY.NS": "DB Realty Ltd",
-        "DBREALTY6.BO": "DBREALTY6.BO",
-        "DLF.NS": "DLF Limited",
-        "DSKULKARNI.BO": "D.S.KULKARNI DEVELOPERS LTD.",
-        "DSKULKARNI.NS": "D.S. Kulkarni Developers Limited",
-        "DUGARHOU.BO": "DUGAR HOUSING DEVELOPMENTS LTD",
-        "EXCEL.NS": "EXCEL REALTY N INF INR10",
-        "EXCEL.BO": "EXCEL REALTY N INFRA LTD.",
-        "EXCELINFO.NS": "Excel Realty N Infra Limited",
-        "FUNWTRD.BO": "FUNWORLD & TOURISM DEVELOPMENT",
-        "GANESHHOUC.NS": "Ganesh Housing Corporation Limited",
-        "GEECEE.NS": "GeeCee Ventures Limited",
-        "GMDCLTD.BO": "GUJARAT MINERAL DEVELOPMENT CO",
-        "GODREJPROP.NS": "Godrej Properties Limited",
-        "GYANDEV.BO": "GYAN DEVELOPERS & BUILDERS LTD",
-        "HBESD.BO": "HB Estate Developers Ltd.",
-        "HDIL.NS": "HOUSING DEVELOPMENT AND INFRAST",
-        "HDIL.BO": "Housing Development & Infrastructure Limited",
-        "HDIL.NS": "Housing Development and Infrastructure Limited",
-        "HINDC.BO": "HINDUSTAN DEVELOPMENT CORPORAT",
-        "HUBTOWN.NS": "Hubtown Limited",
-        "IBREALEST.BO": "Indiabulls Real Estate Limited",
-        "INDLEASE.BO": "India Lease Development Limited",
-        "INDTONER.BO": "Indian Toners & Developers Ltd.",
-        "IRB.BO": "IRB Infrastructure Developers Limited",
-        "ITDC.BO": "INDIA TOURISM DEVELOPMENT CORP",
-        "JOYREALTY.BO": "Joy Realty Ltd",
-        "KAUSHALYA.BO": "Kaushalya Infrastructure Development Corporation Limited",
-        "KMFBLDR.BO": "KMF Builders & Developers Ltd",
-        "KOLTEPATIL.NS": "KOLTE - PATIL DEVELOPERS LIMITE",
-        "KOLTEPATIL.BO": "KOLTE-PATIL DEVELOPERS LTD.",
-        "KOLTEPATIL.NS": "Kolte-Patil Developers Limited",
-        "LPDC.BO": "LANDMARK PROPERTY DEVELOPMENT",
-        "LPDC.NS": "Landmark Property Development Company Limited",
-        "MAHLIFE.NS": "MAHINDRA LIFESPACE DEVELOPERS L",
-        "MAHLIFE.BO": "MAHINDRA LIFESPACE DEVELOPERS",
-        "MAHLIFE.NS": "Mahindra Lifespace Developers Limited",
-        "MANVIJAY.BO": "Manvijay Development Company L",
-        "MARATHON.BO": "Marathon Nextgen Realty Ltd",
-        "MATRAREAL.BO": "Matra Realty Ltd",
-        "MEP.BO": "MEP Infrastructure Developers",
-        "MONNETPRO.BO": "MONNET PROJECT DEVELOPERS LTD.",
-        "MRO-TEK.NS": "MRO-TEK REALTY LTD INR5",
-        "MRO-TEK.BO": "MRO-TEK Realty Limited",
-        "MROTEKBBPH.BO": "MRO-TEK Realty Limited",
-        "MVL.NS": "MVL Limited",
-        "NITESHEST.NS": "Nitesh Estates Limited",
-        "OBEROIRLTY.BO": "OBEROI REALTY LTD.",
-        "OMAXE.NS": "Omaxe Limited",
-        "ORBITCORP.NS": "Orbit Corporation Limited",
-        "ORISSAMINE.BO": "ORISSA MINERALS DEVELOPMENT CO",
-        "PANIND.BO": "Pan India Resort and Land Development Limited",
-        "PARSVNATH.BO": "Parsvnath Developers Limited",
-        "PARSVNATH.NS": "Parsvnath Developers Limited",
-        "PENINLAND.NS": "Peninsula Land Limited",
-        "PHOENIXLTD.NS": "The Phoenix Mills Limited",
-        "PODDAR.BO": "Poddar Housing and Development",
-        "PRAENG.NS": "Prajay Engineers Syndicate Limited",
-        "PRESTIGE.NS": "Prestige Estates Projects Limited",
-        "PRIMEPRO.BO": "Prime Property Development Corporation Ltd.",
-        "PRIMEURB.BO": "PRIME URBAN DEVELOPMENT INDIA",
-        "PROZONINTU.NS": "Prozone Intu Properties Limited",
-        "PVP.NS": "PVP Ventures Limited",
-        "RADHEDE.BO": "Radhe Developers (India) Ltd.",
-        "RAJSAN.BO": "RAJSANKET REALTY LIMITED",
-        "RDBRIL.BO": "RDB REALTY & INFRASTRUCTURE LT",
-        "REGALIAA.BO": "Regaliaa Realty Ltd.",
-        "RODIUM.BO": "RODIUM REALTY LIMITED",
-        "SHRISTI.BO": "Shristi Infrastructure Development Corporation Ltd.",
-        "SIMPLXREA.BO": "Simplex Realty Limited",
-        "SOBHA.NS": "Sobha Limited",
-        "SRDL.BO": "SUNSTAR REALTY DEVELOPMENT LTD",
-        "SRL.BO": "SAMRUDDHI REALTY LTD.",
-        "SUNTECK.BO": "Sunteck Realty Limited",
-        "SUNTECK.NS": "Sunteck Realty Limited",
-        "TCIDEVELOP.NS": "TCI DEVELOPERS LTD INR10",
-        "TCIDEVELOP.BO": "TCI DEVELOPERS LTD.",
-        "TCIDEVELOP.NS": "TCI Developers Limited",
-        "TECHIN.NS": "Techindia Nirman Limited",
-        "THAKDEV.BO": "Thakkers Developers Ltd",
-        "TULIVE.BO": "Tulive Developers Ltd.",
-        "UNIQEST.BO": "UNIQUE ESTATES DEVELOPMENTS CO",
-        "UNITECH.NS": "Unitech Limited",
-        "VIPUL.NS": "Vipul Limited",
-        "VKJINFRA.BO": "VKJ INFRADEVELOPERS LTD",
-        "WESTLIFE.BO": "WESTLIFE DEVELOPMENT LTD.",
-        "ZANDUREALT.NS": "ZANDU REALTY LIMITED",
-        "ZANDUREALT.BO": "ZANDU REALTY LIMITED",
-        "ZANDUREALT.NS": "Zandu Realty Limited"
-    },
-
-    "Recreational Goods, Other": {
-        "ATLASCYCLE.NS": "Atlas Cycles (Haryana) Limited",
-        "COX&KINGS.NS": "Cox & Kings Limited",
-        "JINDALPHOT.NS": "Jindal Photo Limited",
-        "KANANIIND.NS": "Kanani Industries Limited",
-        "TALWALKARS.NS": "Talwalkars Better Value Fitness Limited",
-        "THOMASCOOK.NS": "Thomas Cook (India) Limited",
-        "WONDERLA.NS": "Wonderla Holidays Limited"
-    },
-
-    "Renewable Energy": {
-        "ENEPRO.BO": "ENERGY PRODUCTS (INDIA) LTD.",
-        "ENERGYDEV-BE.NS": "ENERGY DEV CO LTD INR10(DEMAT)",
-        "ENERGYDEV.BO": "ENERGY DEVELOPMENT COMPANY LTD",
-        "EPIC.BO": "Epic Energy Ltd",
-        "GITARENEW.BO": "GITA RENEWABLE ENERGY LIMITED",
-        "HIGHENE.BO": "High Energy Batteries (India) Ltd.",
-        "INDOSOLAR.BO": "INDOSOLAR LTD.",
-        "INDOWIND-BE.NS": "INDOWIND ENERGY INR10",
-        "INDOWIND.BO": "Indowind Energy Limited",
-        "INOXWIND.BO": "Inox Wind Limited",
-        "JAYENGY.BO": "JAY ENERGY AND S.ENERGIES LTD.",
-        "JSWENERGY.BO": "JSW Energy Limited",
-        "JSWENERGY6.BO": "JSWENERGY6.BO",
-        "KARMAENG.BO": "KARMA ENERGY LTD.",
-        "KPEL.BO": "K.P. Energy Limited",
-        "KRATOSENER.BO": "KRATOS ENERGY & INFRASTRUCTURE",
-        "KSK.NS": "KSK ENERGY VENTURES LIMITED",
-        "KSK.BO": "KSK Energy Ventures Limited",
-        "LAKSHMIEFL.NS": "LAKSHMI ENERGY & F INR2",
-        "LAKSHMIEFL.NS": "LAKSHMI ENERGY & F INR2",
-        "LAKSHMIO.BO": "Lakshmi Energy and Foods Ltd.",
-        "LLOYDSME.BO": "LLOYDS METALS AND ENERGY LTD.",
-        "MICROEN.BO": "MICROENERGY (INDIA) LTD.",
-        "MONNETISPA.BO": "MONNET ISPAT & ENERGY LTD.",
-        "PANAENERG.BO": "Panasonic Energy India Company Limited",
-        "PEIL.BO": "Premier Energy and Infrastructure Limited",
-        "SARDAEN.BO": "Sarda Energy & Minerals Limited",
-        "SIENERGY.BO": "SINNER ENERGY INDIA LIMITED",
-        "SMENER.BO": "SM Energy Teknik & Electronics Ltd.",
-        "SOLARFM.BO": "SOLAR FARMACHEM LTD.",
-        "SOLARINDS.BO": "SOLAR INDUSTRIES INDIA LTD.",
-        "SOLARINDS.NS": "Solar Industries India Limited",
-        "SOUISPAT.BO": "SOUTHERN ISPAT AND ENERGY LTD",
-        "SRMENERGY.BO": "SRM Energy Ltd",
-        "SURANASOL.NS": "SURANA SOLAR LTD INR5",
-        "SURANASOL.BO": "SURANA SOLAR LTD.",
-        "SUZLON.BO": "Suzlon Energy Limited",
-        "SWANENERGY.BO": "SWAN ENERGY LTD.",
-        "SWOEF.BO": "SWOJAS ENERGY FOODS LTD.",
-        "UJAAS.NS": "UJAAS ENERGY LTD INR1",
-        "UJAAS.BO": "UJAAS ENERGY LIMITED",
-        "VAKPOWINF.BO": "IND RENEWABLE ENERGY LTD",
-        "VEERENRGY.BO": "Veer Energy & Infrastructure Ltd",
-        "WEBELSOLAR.NS": "WEBSOL ENERGY SYST INR10",
-        "WEBELSOLAR.BO": "WEBSOL ENERGY SYSTEM LTD.",
-        "WINDMACHIN.NS": "WINDSOR MACHINES INR2",
-        "WINDMACHIN.BO": "WINDSOR MACHINES LTD.",
-        "WOMENNET.BO": "Pagaria Energy Limited",
-        "XLENERGY.BO": "XL ENERGY LTD.",
-        "ZENER.BO": "ZENERGY LTD."
-    },
-
-    "Residential Construction": {
-        "BDR.NS": "BDR Buildcon Limited",
-        "VIJSHAN.NS": "Vijay Shanthi Builders Limited"
-    },
-
-    "Resorts & Casinos": {
-        "CCHHL.NS": "Country Club Hospitality & Holidays Limited",
-        "DELTACORP.NS": "Delta Corp Limited",
-        "GIRRESORTS.NS": "GIR Natureview Resorts Limited",
-        "MHRIL.NS": "Mahindra Holidays & Resorts India Limited"
-    },
-
-    "Restaurants": {
-        "COFFEEDAY.NS": "Coffee Day Enterprises Limited",
-        "INDAGERES.BO": "INDAGE RESTAURANTS AND LEISURE",
-        "JUBLFOOD.NS": "Jubilant FoodWorks Limited",
-        "SPECIALITY.BO": "SPECIALITY RESTAURANTS LTD.",
-        "SPECIALITY.NS": "Speciality Restaurants Limited",
-        "VIDLI.BO": "Vidli Restaurants Limited"
-    },
-
-    "Retail - Apparel & Accessories": {
-        "ARVINFRA.BO": "ARVIND SMARTSPACES LTD",
-        "ARVINFRA.NS": "Arvind SmartSpaces Limited",
-        "BRANDHOUSE-BZ.NS": "BRANDHOUSE RETAILS LTD",
-        "BRANDHOUSE.NS": "BRANDHOUSE RETAILS INR10",
-        "BRANDHOUSE.BO": "BRANDHOUSE RETAILS LTD.",
-        "BRANDHOUSE.NS": "BRANDHOUSE RETAILS INR10",
-        "CANTABIL.NS": "CANTABIL RETAIL INDIA LIMITED",
-        "CANTABIL.BO": "CANTABIL RETAIL INDIA LTD.",
-        "KOUTONS.BO": "KOUTONS RETAIL INDIA LTD.",
-        "MARBU.BO": "Martin Burn Ltd",
-        "RCRL.BO": "RCL RETAIL LTD.",
-        "REISIXTEN.BO": "REI Six Ten Retail Limited",
-        "SMARTFIN.BO": "Smart Finsec Limited",
-        "SMARTLINK6.BO": "SMARTLINK6.BO",
-        "SUPREMETEX-BE.NS": "SUPREME TEX MART INR5",
-        "SUPREMETEX.NS": "SUPREME TEX MART INR5",
-        "SUPREMETEX.BO": "SUPREME TEX MART LTD.",
-        "SWASTIKA.BO": "Swastika Investmart Limited",
-        "UMESLTD.NS": "USHA MARTIN EDU INR1",
-        "UMESLTD.BO": "USHA MARTIN EDUCATION & SOLUTI",
-        "USHAMART.BO": "USHA MARTIN LTD.",
-        "V2RETAIL-BE.NS": "V2 RETAIL LTD INR10",
-        "V2RETAIL.BO": "V2 RETAIL LTD.",
-        "VALUEMAR.BO": "VALUEMART RETAIL SOLUTIONS LTD",
-        "VMART.NS": "V-MART RETAIL LTD INR10",
-        "VMART-IL.NS": "V-MART RETAIL LIMITED",
-        "VMART.BO": "V-MART RETAIL LTD."
-    },
-
-    "Rubber & Plastics": {
-        "AMNPLST.BO": "Amines & Plasticizers Ltd.",
-        "ANANDAMRUB.NS": "THE ANANDAM RUBBER INR10",
-        "APCOTEXIND.NS": "Apcotex Industries Limited",
-        "APOLLOTYRE.NS": "Apollo Tyres Limited",
-        "ASTRAL.NS": "Astral Poly Technik Limited",
-        "AVI.BO": "Avi Polymers Ltd.",
-        "AXELPOLY.BO": "Axel Polymers Ltd",
-        "BALKRISIND.NS": "Balkrishna Industries Limited",
-        "CEATLTD.NS": "CEAT Limited",
-        "DUTRON.BO": "Dutron Polymers Limited",
-        "ELGIRUBCO.NS": "ELGI RUBBER COMPANY LIMITED",
-        "ELGIRUBCO.NS": "Elgi Rubber Company Limited",
-        "ESTER.NS": "Ester Industries Limited",
-        "FLEXITUFF.NS": "Flexituff International Limited",
-        "GOVINDRU.BO": "Govind Rubber Ltd.",
-        "GRPLTD.NS": "GRP Limited",
-        "HARPOLY.BO": "HARSH POLYMERS (INDIA) LTD.",
-        "HLTNRUB.BO": "HILTON RUBBERS LTD.",
-        "INDAG.BO": "Indag Rubber Limited",
-        "INTETHR.BO": "INTEGRATED THERMOPLASTICS LTD.",
-        "JAICORPLTD.NS": "Jai Corp Limited",
-        "JAUSPOL.BO": "Jauss Polymers Limited",
-        "JUBLINDS.NS": "Jubilant Industries Limited",
-        "KANDHAR.BO": "KANDHARI RUBBERS LTD.",
-        "KCCLPLASTC.BO": "KCCL PLASTIC LTD.",
-        "KEMROCK.NS": "Kemrock Industries and Exports Limited",
-        "KESORAMIND.NS": "Kesoram Industries Limited",
-        "KKPLASTICK.BO": "Kkalpana Plastick Limited",
-        "LEHAR.BO": "Lawreshwar Polymers Ltd.",
-        "LINCPEN.NS": "LINC PEN & PLASTIC INR10",
-        "LINCPEN.NS": "LINC PEN & PLASTIC INR10",
-        "LINCPENQ.BO": "Linc Pen & Plastics Limited",
-        "MACPLASQ.BO": "Machino Plastics Limited",
-        "MIDLANDP.BO": "MIDLAND PLASTICS LTD.",
-        "MIDPOLY.BO": "MIDLAND POLYMERS LTD.",
-        "MMRUBBR-B.BO": "MM Rubber Co. Ltd.",
-        "MODIRUBBER.BO": "MODI RUBBER LTD.",
-        "MPL.BO": "MPL PLASTICS LTD.",
-        "MRF.NS": "MRF Limited",
-        "NILKAMAL.NS": "Nilkamal Limited",
-        "NOBPOL.BO": "NOBLE POLYMERS LIMITED",
-        "PANKAJPO.BO": "Pankaj Polymers Ltd",
-        "PEARLPOLY.NS": "PEARL POLYMERS LIMITED",
-        "PEARLPOLY.BO": "PEARL POLYMERS LTD.",
-        "PETPLST.BO": "PET PLASTICS LTD.",
-        "PITTILAM.NS": "Pitti Laminations Limited",
-        "POLYLINK.BO": "Polylink Polymers ( India ) Limited",
-        "PREMIERPOL.NS": "Premier Polyfilm Ltd.",
-        "PRIMAPLA.BO": "Prima Plastics Ltd.",
-        "PROMACT.BO": "Promact Plastics Limited",
-        "RESPONIND.NS": "Responsive Industries Limited",
-        "RISHIRUB.BO": "Rishiroop Rubber (International) Ltd.",
-        "RUBBERPR.BO": "The Rubber Products Limited",
-        "SHRJAGP.BO": "Shri Jagdamba Polymers Ltd.",
-        "SIGNETIND.NS": "Signet Industries Limited",
-        "SKIPLAS.BO": "SKIP PLASTICS LTD.",
-        "SUPREMEIND.NS": "The Supreme Industries Limited",
-        "SURYOPLA.BO": "SURYODAYA PLASTICS LTD.",
-        "TAINWALCHM.NS": "Tainwala Chemicals and Plastics (India) Limited",
-        "TEXMOPIPES.NS": "Texmo Pipes and Products Limited",
-        "TIJARIA.NS": "Tijaria Polypipes Limited",
-        "TINNARUBR.BO": "TINNA RUBBER AND INFRASTRUCTUR",
-        "TIRTPLS.BO": "TIRTH PLASTIC LTD.",
-        "TOKYOPLAST.NS": "Tokyo Plast International Limited",
-        "TULSI.NS": "Tulsi Extrusions Limited",
-        "TVSSRICHAK.NS": "TVS Srichakra",
-        "UNQTYMI.BO": "Union Quality Plastics Limited",
-        "USHMAPL.BO": "USHMA POLYMERS LTD.",
-        "VAMSHIRU.BO": "Vamshi Rubber Limited",
-        "VENTRON.BO": "VENTRON POLYMERS LTD.",
-        "VIRPOLY.BO": "VIRGO POLYMERS (INDIA) LTD.",
-        "WOPOLIN.BO": "WOPOLIN PLASTICS LTD."
-    },
-
-    "Scientific & Technical Instruments": {
-        "BARTRONICS.NS": "Bartronics India Limited"
-    },
-
-    "Security & Protection Services": {
-        "NITINFIRE.NS": "Nitin Fire Protection Industries Limited",
-        "ZICOM.NS": "Zicom Electronic Security Systems Limited"
-    },
-
-    "Shipping": {
-        "AARVEEDEN.BO": "AARVEE DENIMS & EXPORTS LTD.",
-        "ADANIPORTS.BO": "ADANI PORTS AND SPECIAL ECONOM",
-        "ADANIPORTS.NS": "Adani Ports and Special Economic Zone Limited",
-        "ADANIPORTS6.BO": "ADANIPORTS6.BO",
-        "AEGISCHEM.NS": "Aegis Logistics Limited",
-        "AEGISLOG.BO": "Aegis Logistics Limited",
-        "AGRMARI.BO": "AGRI-MARINE EXPORTS LTD.",
-        "ALCARGOBBPH.BO": "ALLCARGOLO*",
-        "ALLCARGO.BO": "Allcargo Logistics Limited",
-        "APCL.BO": "Anjani Portland Cement Limited",
-        "AQUA.BO": "AQUA LOGISTICS LTD",
-        "ASINPET.BO": "Asian Petroproducts & Exports Limited",
-        "ASISL.BO": "ASIS LOGISTICS LIMITED",
-        "BHANDHOS.BO": "Bhandari Hosiery Exports Ltd.",
-        "BRIPORT.BO": "Brilliant Portfolios Ltd.",
-        "CEENIK.BO": "Ceenik Exports (India) Ltd.",
-        "CHAMANSEQ.BO": "Chaman Lal Setia Exports Ltd.",
-        "CHARMGR.BO": "CHARMINAR GRANITES EXPORTS LTD",
-        "CHLOGIST.BO": "Chartered Logistics Ltd.",
-        "CMAHENDRA-BZ.NS": "C.MAHENDRA EXPORTS LTD",
-        "CMAHENDRA.BO": "C. MAHENDRA EXPORTS LTD.",
-        "CMAHENDRA.NS": "C. Mahendra Exports Limited",
-        "CORPOCO.BO": "Corporate Courier and Cargo Ltd",
-        "DEVHARI.BO": "Devhari Exports (India) Limite",
-        "DREDGECORP.NS": "Dredging Corporation of India Limited",
-        "DUPONTS.BO": "DUPONT SPORTSWEAR LTD.",
-        "DYNAMICP.BO": "Dynamic Portfolio Management & Services Ltd.",
-        "ESSARPORT.NS": "ESSAR PORTS LIMITED",
-        "ESSARSHPNG.NS": "ESSAR SHIPPING POR INR10",
-        "ESSARSHPNG.BO": "ESSAR SHIPPING LTD.",
-        "ESSARSHPNG.NS": "Essar Shipping Limited",
-        "EUROASIA.BO": "EURO ASIA EXPORTS LTD.",
-        "EUROTEXIND.BO": "EUROTEX INDUSTRIES & EXPORTS L",
-        "GAEL.NS": "GUJARAT AMBUJA EXPORTS LIMITED",
-        "GAEL.BO": "Gujarat Ambuja Exports Limited",
-        "GALAGEX.BO": "GALAXY AGRICO EXPORTS LTD.",
-        "GESHIP.BO": "The Great Eastern Shipping Company Limited",
-        "GESHIP.NS": "The Great Eastern Shipping Company Limited",
-        "GLOBOFFS.NS": "Global Offshore Services Limited",
-        "GOKEX.BO": "GOKALDAS EXPORTS LTD.",
-        "GPPL.BO": "GUJARAT PIPAVAV PORT LTD.",
-        "GPPL.NS": "Gujarat Pipavav Port Limited",
-        "HARIAEXPO.BO": "HARIA EXPORTS LTD.",
-        "HBPOR.BO": "HB Portfolio Limited",
-        "IDFCEOS1DD.BO": "IDFC EQUITY OPPORTUNITY- SERIE",
-        "IDFCEOS1RD.BO": "IDFC EQUITY OPPORTUNITY- SERIE",
-        "IL&FSTRAN.NS": "IL&FS Transportation Networks Limited",
-        "IL&FSTRANS.BO": "IL&FS TRANSPORTATION NETWORKS",
-        "INTRLNK.BO": "INTERLINK EXPORTS LTD.",
-        "INTRUBI.BO": "INTEGRATED RUBIAN EXPORTS LTD.",
-        "JJEXPO.BO": "JJ Exporters Ltd.",
-        "KEMROCK.BO": "KEMROCK INDUSTRIES & EXPORTS L",
-        "KLTHRAE.BO": "KOLUTHARA EXPORTS LTD.",
-        "KNIWE.BO": "KNITWORTH EXPORTS LTD.",
-        "MACINTR.BO": "MACRO (INTERNATIONAL) EXPORTS",
-        "MAGNA.BO": "Magna Industries And Exports Ltd.",
-        "MIDEASTP.BO": "Mideast Portfolio Management Limited",
-        "MRNCRGO.BO": "MARINE CARGO COMPANY LTD.",
-        "NAGREEKEXP.NS": "NAGREEKA EXPORTS INR5",
-        "NAGREEKEXP.BO": "NAGREEKA EXPORTS LTD.",
-        "NAMASTEXP.BO": "NAMASTE EXPORTS LTD.",
-        "NATUSTO.BO": "NATURAL STONE EXPORTS LTD.",
-        "NEPTEXP.BO": "NEPTUNE EXPORTS LTD.",
-        "ORBTEXP.NS": "ORBIT EXPORTS LTD INR10",
-        "ORBTEXP.BO": "Orbit Exports Ltd.",
-        "ORINEXP.BO": "ORIND EXPORTS LTD.",
-        "PATINTLOG.BO": "Patel Integrated Logistics Limited",
-        "POLYSPIN.BO": "Polyspin Exports Ltd.",
-        "PROGRESV.BO": "Progressive Extractions & Exports Limited",
-        "RAJESHEXPO.NS": "RAJESH EXPORTS INR1",
-        "RAJESHEXPO.BO": "RAJESH EXPORTS LTD.",
-        "RELDIVOPP.NS": "R*Shares Dividend Opportunities ETF",
-        "ROXY.BO": "ROXY EXPORTS LIMITED",
-        "RTEXPO.BO": "RT Exports Ltd.",
-        "SAKUMA.BO": "SAKUMA EXPORTS LTD.",
-        "SANEX.BO": "SANTOGEN EXPORTS LTD.",
-        "SATYA.BO": "SATYA MINERS & TRANSPORTERS LT",
-        "SCI.BO": "The Shipping Corporation of India Limited",
-        "SCI.NS": "The Shipping Corporation of India Limited",
-        "SEAMECLTD.NS": "Seamec Limited",
-        "SGLOBEX.BO": "SG GLOBAL EXPORTS LTD.",
-        "SHIAE.BO": "SHIVAM APPERALS EXPORT LTD.",
-        "SHREYAS.BO": "SHREYAS SHIPPING & LOGISTICS L",
-        "SHREYAS.NS": "Shreyas Shipping and Logistics Limited",
-        "SICAL.BO": "Sical Logistics Ltd.",
-        "SIVI.BO": "SIDDHI VINAYAK SHIPPING CORPOR",
-        "SKMEGGPROD.BO": "SKM EGG PRODUCTS EXPORT (INDIA",
-        "SKSLOGLTD.BO": "Shahi Shipping Limited",
-        "SNOWMAN.NS": "SNOWMAN LOGISTICS INR10",
-        "SNOWMAN.BO": "SNOWMAN LOGISTICS LTD",
-        "SPORTKING.BO": "Sportking India Ltd.",
-        "SRTRANSFIN.NS": "SHRIRAM TRANSPORT INR10",
-        "SUBHLTR.BO": "SUBHLAXMI EXPORTS LTD.",
-        "SUNDYEX.BO": "Sunday Exports Ltd",
-        "SUNGRAN.BO": "SUN GRANITE EXPORT LIMITED",
-        "SVRNAQU.BO": "SUVARNA AQUA FARM & EXPORTS LT",
-        "TCI.BO": "Transport Corp. of India Ltd.",
-        "THPAPEX.BO": "THAPAR EXPORTS LTD.",
-        "TIGERLOGS.BO": "TIGER LOGISTICS (INDIA) LTD",
-        "TOWELIN.BO": "TOWELS INDIA EXPORTS LTD.",
-        "UNIPORT.BO": "UNIPORT COMPUTERS LTD.",
-        "UNRYLMA.BO": "Uniroyal Marine Exports Ltd.",
-        "VARUNSHIP-BZ.NS": "VARUN SHIPPING INR10",
-        "VARUNSHIP.BO": "Varun Shipping Co. Ltd.",
-        "VARUNSHIP.NS": "Varun Shipping Co. Ltd.",
-        "VISHALEXPO.BO": "VISHAL EXPORTS OVERSEAS LTD.",
-        "VRLLOG.NS": "VRL LOGISTICS LTD INR10",
-        "VRLLOG.BO": "VRL Logistics Limited",
-        "WEALTH-SM.NS": "WEALTH FIRST PORTF INR10",
-        "WWLEATH.BO": "Worldwide Leather Exports Limited",
-        "YORKEXP.BO": "YORK EXPORTS LTD.",
-        "ZENITHEXPO.NS": "ZENITH EXPORTS LTD INR10",
-        "ZENITHEXPO.BO": "ZENITH EXPORTS LTD."
-    },
-
-    "Specialty Chemicals": {
-        "AARTIIND.NS": "Aarti Industries Limited",
-        "AGARIND.NS": "Agarwal Industrial Corporation Ltd.",
-        "AKZOINDIA.NS": "Akzo Nobel India Limited",
-        "ALKALI.NS": "Alkali Metals Limited",
-        "ALKYLAMINE.NS": "Alkyl Amines Chemicals Limited",
-        "ASIANPAINT.NS": "Asian Paints Limited",
-        "AVTNPL.NS": "AVT Natural Products Limited",
-        "BALAMINES.NS": "Balaji Amines Limited",
-        "BERGEPAINT.NS": "Berger Paints India Limited",
-        "BODALCHEM.NS": "Bodal Chemicals Limited",
-        "CASTROLIND.NS": "Castrol India Limited",
-        "CHEMFALKAL.NS": "Chemfab Alkalis Limited",
-        "CHROMATIC.NS": "Chromatic India Limited",
-        "CLNINDIA.NS": "Clariant Chemicals (India) Limited",
-        "EXCELINDUS.NS": "Excel Industries Limited",
-        "GOACARBON.NS": "Goa Carbon Limited",
-        "IGPL.NS": "I G Petrochemicals Limited",
-        "IVP.NS": "IVP Limited",
-        "JAYAGROGN.NS": "Jayant Agro-Organics Limited",
-        "JINDALPOLY.NS": "Jindal Poly Films Limited",
-        "KANSAINER.NS": "Kansai Nerolac Paints Limited",
-        "KIRIINDUS.NS": "Kiri Industries Limited",
-        "LINDEINDIA.NS": "Linde India Limited",
-        "OMKARCHEM.NS": "Omkar Speciality Chemicals Limited",
-        "ORIENTABRA.NS": "Orient Abrasives Limited",
-        "PIDILITIND.NS": "Pidilite Industries Limited",
-        "PLASTIBLEN.NS": "Plastiblends India Ltd.",
-        "SHRIASTER.NS": "Shri Aster Silicates Limited",
-        "SOTL.NS": "Savita Oil Technologies Limited",
-        "SUDARSCHEM.NS": "Sudarshan Chemical Industries Limited",
-        "TIRUMALCHM.NS": "Thirumalai Chemicals Limited",
-        "VIKASECO.NS": "Vikas EcoTech Limited",
-        "VINYLINDIA.NS": "Vinyl Chemicals India Ltd.",
-        "VISHNU.NS": "Vishnu Chemicals Limited",
-        "VIVIMEDLAB.NS": "Vivimed Labs Limited",
-        "XPROINDIA.NS": "Xpro India Limited"
-    },
-
-    "Specialty Retail, Other": {
-        "ARCHIES.NS": "Archies Limited"
-    },
-
-    "Staffing & Outsourcing Services": {
-        "HGS.NS": "Hinduja Global Solutions Limited",
-        "TEAMLEASE.NS": "TeamLease Services Limited"
-    },
-
-    "Steel & Iron": {
-        "$USIRO52.BO": "USHA IRON &F",
-        "ADHUNIK.NS": "Adhunik Metaliks Limited",
-        "AHMDSTE.BO": "Ahmedabad Steelcraft Ltd.",
-        "AMLSTEEL-BE.NS": "AMLSTEEL-BE.NS",
-        "ANILSPL.BO": "Anil Special Steel Industries Ltd.",
-        "ANKITMETAL.NS": "Ankit Metal & Power Limited",
-        "APLAPOLLO.NS": "APL Apollo Tubes Limited",
-        "ASHSI.BO": "Ashirwad Steels & Industries Ltd.",
-        "BAJAJST.BO": "Bajaj Steel Industries Ltd.",
-        "BEDMUTHA.NS": "Bedmutha Industries Limited",
-        "BEEKAY.BO": "Beekay Steel Industries Ltd.",
-        "BELLARYS.BO": "BELLARY STEELS & ALLOYS LTD.",
-        "BENGALS.BO": "BENGAL STEEL INDUSTRIES LTD.",
-        "BHARATWIRE.NS": "Bharat Wire Ropes Limited",
-        "BHUSANSTL.NS": "BHUSHAN STEEL LIMITED",
-        "BHUSANSTL.BO": "BHUSHAN STEEL LTD.",
-        "BHUSANSTL.NS": "Bhushan Steel Limited",
-        "BHUWALST.BO": "Bhuwalka Steel Industries Limited",
-        "BIHSPONG.BO": "Bihar Sponge Iron Ltd.",
-        "CHASBRT.BO": "CHASE BRIGHT STEEL LTD.",
-        "DASL.BO": "Deepti Alloy Steel Limited",
-        "DINIRST.BO": "DINA IRON & STEEL LTD.",
-        "ECSTSTL.BO": "Eastcoast Steel Limited",
-        "ELECTCAST.BO": "ELECTROSTEEL CASTINGS LTD.",
-        "ENSSI.BO": "Ensa Steel Industries Ltd.",
-        "ESL.NS": "ELECTROSTEEL STEELS LIMITED",
-        "ESL.BO": "ELECTROSTEEL STEELS LTD.",
-        "ESL.NS": "Electrosteel Steels Limited",
-        "FACORSTE.BO": "Facor Steels Ltd.",
-        "GAL.NS": "Gyscoal Alloys Limited",
-        "GALLANTT.NS": "Gallantt Metal Limited",
-        "GALLISPAT.NS": "Gallantt Ispat Limited",
-        "GANGOTRI.BO": "Gangotri Iron & Steel Co., Ltd.",
-        "GHANS.BO": "GHANSHYAM STEEL WORKS LTD.",
-        "GISL.BO": "GANGOTRI IRON & STEEL COMPANY",
-        "GOPAIST.BO": "Gopal Iron & Steels Company Gujarat Ltd",
-        "GPIL.NS": "Godawari Power & Ispat Limited",
-        "GRHMFRT-B.BO": "GRAHAM FIRTH STEEL PRODUCTS LT",
-        "HARSTEEL.BO": "HARYANA STEEL & ALLOYS LTD.",
-        "IBRIGST.BO": "INDIAN BRIGHT STEEL CO.LTD.",
-        "ICVLSTEELS.BO": "SUPREMEX SHINE STEELS LTD",
-        "IMFA.NS": "Indian Metals and Ferro Alloys Limited",
-        "INDCTST.BO": "Inducto Steels Limited",
-        "INERTIAST.BO": "INERTIA STEEL LTD.",
-        "ISMTLTD.NS": "ISMT Limited",
-        "ISWL.BO": "India Steel Works Limited",
-        "JAIBALAJI.NS": "Jai Balaji Industries Limited",
-        "JAYNECOIND.NS": "Jayaswal Neco Industries Limited",
-        "JINDALSAW.NS": "Jindal Saw Limited",
-        "JINDALSTEL.NS": "JINDAL STEEL & PWR INR1.00",
-        "JINDALSTEL.NS": "Jindal Steel & Power Limited",
-        "JSL.NS": "Jindal Stainless Limited",
-        "JSLHISAR.NS": "Jindal Stainless (Hisar) Limited",
-        "JSWSTEEL-P1.NS": "JSW STEEL LTD INR10 10% CUM RED",
-        "JSWSTEEL-P2.NS": "JSW STEEL LTD 0.01% PRF 15/03/1",
-        "JSWSTEEL.BO": "JSW STEEL LTD.",
-        "JSWSTEEL.NS": "JSW Steel Limited",
-        "JSWSTEEL6.BO": "JSWSTEEL6.BO",
-        "KAMDHENU.NS": "Kamdhenu Limited",
-        "KANSHST.BO": "Kanishk Steel Industries Ltd.",
-        "KSL.NS": "KALYANI STEELS LIMITED",
-        "KSL.BO": "KALYANI STEELS LTD.",
-        "KSL.NS": "Kalyani Steels Limited",
-        "KUSIS.BO": "KUSUM IRON & STEEL LTD.",
-        "MAHASTEEL.BO": "Mahamaya Steel Industries Ltd.",
-        "MAHSEAMLES.NS": "Maharashtra Seamless Limited",
-        "MAITHANALL.NS": "Maithan Alloys Limited",
-        "MALHOST.BO": "MALHOTRA STEEL INDUSTRIES LTD.",
-        "MALVI.BO": "MALVIKA STEEL LTD.",
-        "MANAKSTEEL-BE.NS": "Manaksia Steels Ltd",
-        "MANAKSTEEL.NS": "MANAKSIA STEELS LT INR1",
-        "MANAKSTEEL.NS": "MANAKSIA STEELS LT INR1",
-        "MANAKSTELTD.BO": "Manaksia Steels Limited",
-        "MANINDS.NS": "Man Industries (India) Limited",
-        "MDRNSTL.BO": "Modern Steels Ltd.",
-        "MEENST.BO": "MEENAKSHI STEEL INDUSTRIES LTD",
-        "MONNETISPA.NS": "Monnet Ispat and Energy Limited",
-        "MRMGAST.BO": "MARMAGOA STEELS LTD.",
-        "MSPL.NS": "MSP Steel & Power Limited",
-        "MUKANDLTD.NS": "Mukand Limited",
-        "MUKESTL.BO": "Mukesh Steels Ltd",
-        "NATNLSTEEL-BE.NS": "NATIONAL STEEL & AGRO IND",
-        "NATNLSTEEL.NS": "NATIONAL STEEL & A INR10",
-        "NATNLSTEEL.BO": "NATIONAL STEEL & AGRO INDUSTRI",
-        "NATNLSTEEL.NS": "National Steel and Agro Industries Limited",
-        "NMDC.NS": "NMDC Limited",
-        "NOVIS.BO": "Nova Iron & Steel Ltd.",
-        "OISL.NS": "OCL IRON AND STEEL LIMITED",
-        "OISL.BO": "OCL IRON AND STEEL LTD.",
-        "OISL.NS": "OCL Iron & Steel Limited",
-        "ORISSASP.BO": "Orissa Sponge Iron And Steel Limited",
-        "PANCHMAHQ.BO": "Panchmahal Steels, Ltd.",
-        "PENIND.NS": "Pennar Industries Limited",
-        "PITTSIRON.BO": "PITTSBURGH IRON & STEELS LTD.",
-        "PIYUSHT.BO": "PIYUSH STEELS LTD.",
-        "POTENTIAL.BO": "BEST STEEL LOGISTICS LTD",
-        "PRAKASH.NS": "Prakash Industries Limited",
-        "PRAKASHSTL.NS": "PRAKASH STEELAGE LIMITED",
-        "PRAKASHSTL.BO": "PRAKASH STEELAGE LTD.",
-        "PRAKASHSTL.NS": "Prakash Steelage Limited",
-        "PRATRAJ.BO": "PARTAP RAJASTHAN SPECIAL STEEL",
-        "PRSTEEL.BO": "PROGRESSIVE STEELS (INDIA) LTD",
-        "RAMASTEEL-BE.NS": "Rama Steel Tubes Limited",
-        "RAMASTEEL.NS": "RAMA STEEL TUBES INR5",
-        "RAMASTEEL.BO": "Rama Steel Tubes Limited",
-        "RAMASTEEL.NS": "Rama Steel Tubes Limited",
-        "RAMSARUP.NS": "Ramsarup Industries Limited",
-        "RATNAMANI.NS": "Ratnamani Metals & Tubes Limited",
-        "RISHDIGA.BO": "Rishabh Digha Steel & Allied Products Ltd.",
-        "RMGALLOY.BO": "RMG ALLOY STEEL LIMITED",
-        "RMISTEL.BO": "RMI STEELS LTD.",
-        "SAIL.BO": "Steel Authority of India Limited",
-        "SAIL.NS": "Steel Authority of India Limited",
-        "SALSTEEL.BO": "S.A.L. Steel Limited",
-        "SALSTEEL.NS": "S.A.L. Steel Limited",
-        "SANDUMA.BO": "The Sandur Manganese & Iron Ores Limited",
-        "SARDAEN.NS": "Sarda Energy & Minerals Limited",
-        "SATHAISPAT.NS": "Sathavahana Ispat Limited",
-        "SCANSTL.BO": "Scan Steels Limited",
-        "SHAHALLOYS.NS": "Shah Alloys Limited",
-        "SIRHIND.BO": "SIRHIND STEEL LTD.",
-        "SMPL.NS": "Splendid Metal Products Limited",
-        "SPSL.BO": "Shree Precoated Steels Limited",
-        "SRYSTLT.BO": "SRIYANSH STEEL LTD.",
-        "SSWL.BO": "STEEL STRIPS WHEELS LTD.",
-        "SSWRL.BO": "Shree Steel Wire Ropes Ltd.",
-        "STEELCAS.BO": "Steelcast Ltd",
-        "STEELCO.BO": "Steelco Gujarat Ltd.",
-        "STEELTUBES.BO": "STEEL TUBES OF INDIA LTD.",
-        "STEELXIND.BO": "Steel Exchange India Ltd.",
-        "STRIPMT.BO": "STEEL STRIPS LTD.",
-        "SUJANAUNI.NS": "Sujana Universal Industries Limited",
-        "SUNFLAG.BO": "SUNFLAG IRON & STEEL CO.LTD.",
-        "SUNFLAG.NS": "Sunflag Iron And Steel Company Limited",
-        "SUPERFORGE.BO": "SUPER FORGINGS & STEELS LTD.",
-        "SURANAIND.NS": "Surana Industries Limited",
-        "SURYAROSNI.NS": "Surya Roshni Limited",
-        "SWETAST.BO": "SWEATAMBER STEEL LTD.",
-        "TATAMETALI.NS": "Tata Metaliks Limited",
-        "TATASPONGE.NS": "TATA SPONGE IRON INR10",
-        "TATASPONGE.BO": "Tata Sponge Iron Limited",
-        "TATASPONGE.NS": "Tata Sponge Iron Limited",
-        "TATASTEEL.NS": "TATA STEEL LIMITED",
-        "TATASTEEL.BO": "TATA STEEL LTD.",
-        "TATASTEEL.NS": "Tata Steel Limited",
-        "TINPLATE.NS": "The Tinplate Company Of India Limited",
-        "TNSTLTU.BO": "Tamilnadu Steel Tubes Ltd.",
-        "USHAMART.NS": "Usha Martin Limited",
-        "UTTAMSTL.BO": "UTTAM GALVA STEELS LTD.",
-        "UTTAMSTL.NS": "Uttam Galva Steels Limited",
-        "UTTAMVALUE.NS": "UTTAM VALUE STEELS INR1",
-        "UTTAMVALUE.BO": "UTTAM VALUE STEELS LTD.",
-        "UTTAMVALUE.NS": "Uttam Value Steels Limited",
-        "VALLABHSQ.BO": "Vallabh Steels Limited",
-        "VASWANI.NS": "Vaswani Industries Limited",
-        "VIDIRMT.BO": "VIDARBHA IRON & STEEL CORPORAT",
-        "VISASTEEL.BO": "VISA Steel Ltd.",
-        "VISASTEEL.NS": "VISA Steel Limited",
-        "VISHWAST.BO": "VISHWAS STEELS LTD.",
-        "VSSL.NS": "VARDHMAN SPECIAL STEELS LIMITED",
-        "VSSL.BO": "VARDHMAN SPECIAL STEELS LTD.",
-        "VSSL.NS": "Vardhman Special Steels Limited",
-        "WELCORP.NS": "Welspun Corp Limited",
-        "ZPRBHSTE.BO": "PRABHU STEEL INDUSTRIES LTD.",
-        "ZWELCAST.BO": "Welcast Steels Ltd."
-    },
-
-    "Technical & System Software": {
-        "8KMILES.NS": "8K Miles Software Services Limited",
-        "BGLOBAL.NS": "Bharatiya Global Infomedia Limited",
-        "CALSOFT.NS": "California Software Company Limited",
-        "FINANTECH.NS": "63 Moons Technologies Limited",
-        "ICSA.NS": "ICSA (India) Limited",
-        "KERNEX.NS": "Kernex Microsystems (India) Limited",
-        "MEGASOFT.NS": "Megasoft Limited",
-        "RSSOFTWARE.NS": "R. S. Software (India) Limited",
-        "SASKEN.NS": "Sasken Technologies Limited",
-        "SQSBFSI.NS": "SQS India BFSI Limited",
-        "SUBEX.NS": "Subex Limited",
-        "TANLA.NS": "Tanla Solutions Limited",
-        "TATAELXSI.NS": "Tata Elxsi Limited",
-        "TRIGYN.NS": "Trigyn Technologies Limited",
-        "VAKRANGEE.NS": "Vakrangee Limited",
-        "ZYLOG.NS": "Zylog Systems Limited"
-    },
-
-    "Textile - Apparel Clothing": {
-        "ABFRL.BO": "Aditya Birla Fashion and Retai",
-        "ABFRL.NS": "Aditya Birla Fashion and Retail Limited",
-        "AIFL.BO": "ASHAPURA INTIMATES FASHION LTD",
-        "AIFL.NS": "Ashapura Intimates Fashion Limited",
-        "AMSONS.BO": "Amsons Apparels Limited",
-        "ANSHUS.BO": "ANSHUS CLOTHING LTD.",
-        "BANG.NS": "Bang Overseas Limited",
-        "BELLACASA.BO": "Bella Casa Fashion & Retail Li",
-        "BRFL.BO": "Bombay Rayon Fashion Limited",
-        "BRFL.NS": "Bombay Rayon Fashions Limited",
-        "CANTABIL.NS": "Cantabil Retail India Limited",
-        "CELEBRITY.NS": "CELEBRITY FASHIONS INR10",
-        "CELEBRITY.BO": "Celebrity Fashions Limited",
-        "CELEBRITY.NS": "Celebrity Fashions Limited",
-        "ELAND.NS": "E-LAND APPAREL LTD INR10",
-        "ELAND.BO": "E-Land Apparel Limited",
-        "EUROLED.BO": "Euro Leder Fashion Ltd.",
-        "FILATFASH.BO": "Filatex Fashions Limited",
-        "FLFL.BO": "FUTURE LIFESTYLE FASHIONS LTD",
-        "FRONTBUSS.BO": "Inanna Fashion and Trends Limited",
-        "GIVO.BO": "Meyer Apparel Limited",
-        "GOKEX.NS": "Gokaldas Exports Limited",
-        "HARIAAPL.BO": "HARIA APPARELS LTD",
-        "INDIANCARD.BO": "INDIAN CARD CLOTHING CO.LTD.",
-        "INDTERRAIN.BO": "INDIAN TERRAIN FASHIONS LTD.",
-        "INDTERRAIN.NS": "Indian Terrain Fashions Limited",
-        "INTEGRA-BE.NS": "INTEGRA GARMENTS A INR3",
-        "INTEGRA.NS": "INTEGRA GARMENTS A INR3",
-        "INTEGRA.NS": "Integra Garments and Textiles Limited",
-        "KAMADGIRI.BO": "KAMADGIRI FASHION LTD.",
-        "KITEX.NS": "KITEX GARMENTS LIMITED",
-        "KITEX.BO": "KITEX GARMENTS LTD.",
-        "KITEX.NS": "Kitex Garments Limited",
-        "KKCL.BO": "Kewal Kiran Clothing Limited",
-        "KKCL.NS": "Kewal Kiran Clothing Limited",
-        "KPRMILL.NS": "K.P.R. Mill Limited",
-        "LOVABLE.NS": "Lovable Lingerie Limited",
-        "LUXIND.NS": "Lux Industries Limited",
-        "MANDHANA.NS": "Mandhana Industries Limited",
-        "MAXWELL.BO": "VIP CLOTHING LTD",
-        "MAXWELL.NS": "VIP Clothing Limited",
-        "MOMAI-SM.NS": "MOMAI APPARELS LTD INR10",
-        "MONTECARLO.BO": "Monte Carlo Fashions Limited",
-        "MONTECARLO.NS": "Monte Carlo Fashions Limited",
-        "OXEMBAP.BO": "OXEMBERG APPARELS LTD.",
-        "PAGEIND.NS": "Page Industries Limited",
-        "PDSMFL.BO": "PDS MULTINATIONAL FASHIONS LIM",
-        "PDSMFL.NS": "PDS Multinational Fashions Limited",
-        "PFRL.NS": "Aditya Birla Fashion and Retail Limited",
-        "PGIL.NS": "Pearl Global Industries Limited",
-        "PROVOGE.NS": "Provogue (India) Limited",
-        "RUPA.NS": "Rupa & Company Limited",
-        "SAMTEX.BO": "Samtex Fashions Ltd.",
-        "SELMCL.NS": "SEL Manufacturing Company Limited",
-        "SIDDHEGA.BO": "SIDDHESWARI GARMENTS LTD.",
-        "SPICEISL.BO": "Spice Islands Apparels Ltd.",
-        "SPLIL.NS": "SPL Industries Limited",
-        "SUDAR.NS": "Sudar Industries Limited",
-        "THOMASCOTT.NS": "Thomas Scott (India) Limited",
-        "ZODIACLOTH.NS": "ZODIAC CLOTHING COMPANY LIMITED",
-        "ZODIACLOTH.BO": "ZODIAC CLOTHING CO.LTD.",
-        "ZODIACLOTH.NS": "Zodiac Clothing Company Limited"
-    },
-
-    "Textile - Apparel Footwear & Accessories": {
-        "BANARBEADS.NS": "Banaras Beads Limited",
-        "BATAINDIA.NS": "Bata India Limited",
-        "BIL.NS": "Bhartiya International Limited",
-        "LIBERTSHOE.NS": "Liberty Shoes Limited",
-        "MIRZAINT.NS": "Mirza International Limited",
-        "RELAXO.NS": "Relaxo Footwears Limited",
-        "SREEL.NS": "Sreeleathers Limited",
-        "SUPERHOUSE.NS": "Superhouse Limited",
-        "VIPIND.NS": "VIP Industries Limited"
-    },
-
-    "Textile Industrial": {
-        "AANANDALAK.BO": "Aananda Lakshmi Spinning Mills",
-        "AARVEEDEN.NS": "Aarvee Denims and Exports Limited",
-        "ACIL.BO": "ACIL Cotton Industries Ltd",
-        "ADINATH.BO": "Adinath Textiles Ltd",
-        "AICHAMP.NS": "AI Champdany Industries Limited",
-        "ALOKTEXT.NS": "Alok Industries Limited",
-        "ALPSINDUS.NS": "Alps Industries Limited",
-        "ALSTONE.BO": "Alstone Textiles (India) Ltd",
-        "AMARJOTHI.BO": "AMARJOTHI SPINNING MILLS LTD.",
-        "AMBIKCO.BO": "Ambika Cotton Mills Ltd.",
-        "AMBIKCO.NS": "Ambika Cotton Mills Limited",
-        "ARROWTEX.NS": "ARROW TEXTILES LTD INR10",
-        "ARROWTEX.BO": "Arrow Textiles Ltd.",
-        "ARROWTEX.NS": "Arrow Textiles Limited",
-        "ARVIND.NS": "Arvind Limited",
-        "ASHIMASYN.NS": "Ashima Limited",
-        "ASHNOOR.BO": "Ashnoor Textile Mills Ltd.",
-        "ASIL.NS": "AMIT SPINNING IND INR5.00",
-        "ASIL.BO": "AMIT SPINNING INDUSTRIES LTD.",
-        "ASIL.NS": "Amit Spinning Industries Limited",
-        "AYMSYNTEX.NS": "AYM Syntex Limited",
-        "BAFNASP.BO": "BAFNA SPINNING MILLS & EXPORTS",
-        "BANSWRAS.NS": "Banswara Syntex Limited",
-        "BASML.BO": "BANNARI AMMAN SPINNING MILLS L",
-        "BASML.NS": "Bannari Amman Spinning Mills Limited",
-        "BENGALT.BO": "Bengal Tea & Fabrics Ltd.",
-        "BHAGCOT.BO": "BHAGWATI COTTONS LTD.",
-        "BHATEXT.BO": "BHARAT TEXTILES & PROOFING IND",
-        "BIJLTEX.BO": "BIJLEE TEXTILES LTD.",
-        "BIRLACOT.NS": "Birla Cotsyn (India) Limited",
-        "BOMDYEING.NS": "The Bombay Dyeing and Manufacturing Company Limited",
-        "BSL.NS": "BSL Limited",
-        "CENTENKA.NS": "Century Enka Limited",
-        "CENTURYTEX.BO": "Century Textiles and Industries Limited",
-        "CHANDNI.BO": "CHANDNI TEXTILES ENGINEERING I",
-        "CITIZYN.BO": "Citizen Yarns Limited",
-        "CNOVAPETRO.NS": "CIL Nova Petrochemicals Limited",
-        "CTCOTTON.BO": "CT COTTON YARN LTD.",
-        "DCM.NS": "DCM Limited",
-        "DHANFAB.BO": "Dhanlaxmi Fabrics Ltd.",
-        "DHARTEX.BO": "DHAR TEXTILE MILLS LTD.",
-        "DIVINUS.BO": "DIVINUS FABRICS LTD",
-        "DONEAR.NS": "Donear Industries Limited",
-        "EASTSILK.NS": "Eastern Silk Industries Limited",
-        "ELAND.NS": "E-Land Apparel Limited",
-        "EUROTEXIND.NS": "Eurotex Industries and Exports Limited",
-        "EVERTEX.BO": "EVERGREEN TEXTILES LIMITED",
-        "FILATEX.NS": "Filatex India Limited",
-        "FIRSTWIN.NS": "First Winner Industries Limited",
-        "FLORATX.BO": "Flora Textiles Ltd",
-        "GANGOTRI-BE.NS": "GANGOTRI TEXTILE INR5(POST SUBD",
-        "GANGOTRI.NS": "GANGOTRI TEXTILE INR5(POST SUBD",
-        "GANGOTRI.NS": "Gangotri Textiles Limited",
-        "GARDENSILK.NS": "Garden Silk Mills Limited",
-        "GARWALLROP.NS": "Garware-Wall Ropes Limited",
-        "GILLANDERS.NS": "Gillanders Arbuthnot and Company Limited",
-        "GINNIFILA.NS": "Ginni Filaments Limited",
-        "GNDHISP.BO": "GANDHIDHAM SPINNING & MANUFACT",
-        "GOKAKTEX.BO": "Gokak Textiles Ltd.",
-        "GOLDTXT.BO": "GOLDWON TEXTILES LTD.",
-        "GREAVESCOT.NS": "GREAVES COTTON LIMITED",
-        "GREAVESCOT.BO": "GREAVES COTTON LTD.",
-        "GTNTEX.NS": "GTN TEXTILES INR10",
-        "GTNTEX.BO": "GTN Textiles Ltd.",
-        "GTNTEX.NS": "GTN Textiles Limited",
-        "HANILERA.BO": "HANIL ERA TEXTILES LTD.",
-        "HANUNG.BO": "Hanung Toys and Textiles Limited",
-        "HANUNG.NS": "Hanung Toys and Textiles Limited",
-        "HIMATSEIDE.NS": "Himatsingka Seide Limited",
-        "HINDSYNTEX.NS": "Hind Syntex Limited",
-        "HISARSP.BO": "Hisar Spinning Mills Ltd.",
-        "HITESTX.BO": "HITESH TEXTILE MILLS LTD.",
-        "HPCOTTON.BO": "HP Cotton Textile Mills Ltd.",
-        "ICIL.NS": "Indo Count Industries Limited",
-        "INDIANCARD.NS": "The Indian Card Clothing Company Limited",
-        "INDORAMA.NS": "Indo Rama Synthetics (India) Limited",
-        "INTEGRA.BO": "INTEGRA GARMENTS AND TEXTILES",
-        "JAGJANANI.BO": "Jagjanani Textiles Ltd.",
-        "JAMSHRI.BO": "The Jamshri Ranjitsinghji Spinning and Weaving Mills Company Limited",
-        "JAYBFAB.BO": "JAYBHARAT FABRICS MILLS LTD.",
-        "JAYTEX.BO": "Jaybharat Textiles And Real Estate Limited",
-        "JBFIND.NS": "JBF Industries Limited",
-        "JINDCOT.NS": "Jindal Cotex Limited",
-        "JINDWORLD.NS": "Jindal Worldwide Limited",
-        "JUNCTION.BO": "Junction Fabrics and Apparels",
-        "KAKTEX.BO": "Kakatiya Textiles Ltd.",
-        "KALLAM.BO": "Kallam Spinning Mills Ltd.",
-        "KANDAGIRI.BO": "KANDAGIRI SPINNING MILLS LTD.",
-        "KATRSPG.BO": "Katare Spinning Mills Ltd.",
-        "KCTXL-B1.BO": "K.C.TEXTILES LTD.",
-        "KFL.BO": "KAVITA FABRICS LTD.",
-        "KHTRFIB.BO": "Khator Fibre & Fabrics Limited",
-        "KRISHFAB.BO": "KRISHANA FABRICS LIMITED",
-        "LAMBODHARA.NS": "LAMBODHARA TEXTILE INR5",
-        "LAMBODHARA.BO": "Lambodhara Textiles Ltd",
-        "LAMBODHARA.NS": "Lambodhara Textiles Limited",
-        "LDTXL.BO": "L.D.TEXTILE INDUSTRIES LTD.",
-        "LOYALTEX.BO": "Loyal Textile Mills Limited",
-        "MALWACOTT-BE.NS": "MALWA COTTON SPG. MILLS L",
-        "MALWACOTT.BO": "MALWA COTTON SPINNING MILLS LT",
-        "MALWACOTT.NS": "Malwa Cotton Spinning Mills Limited",
-        "MARALOVER.NS": "Maral Overseas Limited",
-        "MAYURUNIQ.NS": "Mayur Uniquoters Limited",
-        "MINAXI.BO": "Minaxi Textiles Ltd.",
-        "MKDOTEX.BO": "MIKADO TEXTILE INDUSTRIES LTD.",
-        "MOHITIND.NS": "Mohit Industries Limited",
-        "MORARJEE.NS": "MORARJEE TEXTILES INR7",
-        "MORARJEE.BO": "MORARJEE TEXTILES LTD.",
-        "MORARJEE.NS": "Morarjee Textiles Limited",
-        "NAGREEKEXP.NS": "Nagreeka Exports Limited",
-        "NAHARINDUS.NS": "Nahar Industrial Enterprises Limited",
-        "NAHARSPING.BO": "NAHAR SPINNING MILLS LTD.",
-        "NAHARSPING.NS": "Nahar Spinning Mills Ltd",
-        "NAKODA.NS": "Nakoda Limited",
-        "NDL.NS": "Nandan Denim Limited",
-        "NEPCTEX.BO": "NEPC TEXTILES LTD.",
-        "NITINSPIN.NS": "Nitin Spinners Ltd.",
-        "NIWASSP.BO": "NIWAS SPINNING MILLS LTD.",
-        "OASISTEX.BO": "OASIS TEXTILES LTD.",
-        "ORBTEXP.NS": "Orbit Exports Limited",
-        "OSSWM.BO": "Oswal Spinning and Weaving Mills Limited",
-        "OSWAYRN.BO": "Oswal Yarns Ltd.",
-        "PADAMCO.BO": "Padam Cotton Yarns Limited",
-        "PARASPETRO.NS": "Paras Petrofils Ltd",
-        "PASARI.BO": "Pasari Spinning Mills Ltd",
-        "PASUSPG.BO": "Pasupati Spinning & Weaving Mills Limited",
-        "PATSPINLTD.NS": "Patspin India Limited",
-        "PERSCAR.BO": "PERSIAN CARPET & TEXTILES LTD.",
-        "PIONEEREMB.NS": "Pioneer Embroideries Limited",
-        "PRADIP.NS": "Pradip Overseas Limited",
-        "PRANAVSP.BO": "Pranavaditya Spinning Mills Limited",
-        "PRECOT.NS": "Precot Meridian Limited",
-        "RADHIKAS.BO": "RADHIKA SPINNING MILLS LTD.",
-        "RAIREKMOH.NS": "The Rai Saheb Rekhchand Mohota Spinning & Weaving Mills Ltd.",
-        "RAJRAYON.NS": "Raj Rayon Industries Limited",
-        "RAJVIR.NS": "Rajvir Industries Limited",
-        "RAVISPN.BO": "RAVI SPINNING LTD.",
-        "RAYMOND.NS": "Raymond Limited",
-        "RIBATEX.BO": "Riba Textiles Limited",
-        "RISHYRN.BO": "Rishab Special Yarns Limited",
-        "ROSETEX.BO": "ROSEKAMAL TEXTILES LTD.",
-        "RSLTEXTIL.BO": "RSL TEXTILES (INDIA) LTD.",
-        "RSWM.NS": "RSWM Limited",
-        "RUBYMILLS.NS": "The Ruby Mills Limited",
-        "RUNEECHA.BO": "RUNEECHA TEXTILES LTD.",
-        "SAJJNT.BO": "SAJJAN TEXTILES MILLS LTD.",
-        "SALEMTX.BO": "SALEM TEXTILES LTD.",
-        "SALONACOT.NS": "Salona Cotspin Limited",
-        "SAMBANDAM.BO": "SAMBANDAM SPINNING MILLS LTD.",
-        "SAMBANDAM.NS": "Sambandam Spinning Mills Ltd.",
-        "SANGAMIND.NS": "Sangam (India) Limited",
-        "SARLAPOLY.NS": "Sarla Performance Fibers Limited",
-        "SBFL.BO": "Shree Bhavya Fabrics Limited",
-        "SEASONST.BO": "Seasons Textiles Limited",
-        "SGL.NS": "STL Global Limited",
-        "SHARDFI.BO": "Sharad Fibres and Yarn Processors Limited",
-        "SHIVTEX.BO": "SHIVA TEXYARN LTD.",
-        "SHIVTEX.NS": "Shiva Texyarn Limited",
-        "SHRSHATEX.BO": "SHREE SHALEEN TEXTILES LIMITED",
-        "SIL.NS": "Standard Industries Limited",
-        "SIYSIL.NS": "Siyaram Silk Mills Limited",
-        "SLSTLQ.BO": "Sri Lakshmi Saraswathi Textiles (Arni) Limited",
-        "SNSTEXTIL.BO": "SNS Textiles Ltd.",
-        "SOMATEX-BE.NS": "SOMA TEXTILE INUSTRIES LT",
-        "SOMATEX.NS": "SOMA TEXTILE & IND INR10",
-        "SOMATEX.BO": "Soma Textiles & Industries Limited",
-        "SOMATEX.NS": "Soma Textiles & Industries Limited",
-        "SPENTEX.NS": "Spentex Industries Limited",
-        "SPYL.BO": "SHEKHAWATI POLY-YARN LTD.",
-        "SPYL.NS": "Shekhawati Poly-Yarn Limited",
-        "SRF.NS": "SRF Limited",
-        "SRIMALI.BO": "SRI MALINI SPINNING MILLS LTD.",
-        "SRINACHA.BO": "Sri Nachammai Cotton Mills Limited",
-        "SRJTC.BO": "SRI JAYALAKSHMI SPINNING MILLS",
-        "STINDIA.NS": "STI India Limited",
-        "SUMEETINDS.NS": "Sumeet Industries Limited.",
-        "SUPERSPIN.NS": "SUPER SPINNING INR1",
-        "SUPERSPIN.BO": "SUPER SPINNING MILLS LTD.",
-        "SUPERSPIN.NS": "Super Spinning Mills Limited",
-        "SUPREMETEX.NS": "Supreme Tex Mart Limited",
-        "SURATEX.BO": "Surat Textile Mills Limited",
-        "SURYAAMBA.BO": "Suryaamba Spinning Mills Ltd",
-        "SURYAJYOTI.BO": "SURYAJYOTI SPINNING MILLS LTD.",
-        "SURYAJYOTI.NS": "Suryajyoti Spinning Mills Limited",
-        "SURYALA.BO": "Suryalata Spinning Mills Limited",
-        "SURYALAXMI.BO": "SURYALAKSHMI COTTON MILLS LTD.",
-        "SURYALAXMI.NS": "Suryalakshmi Cotton Mills Limited",
-        "SURYVANSP.BO": "Suryavanshi Spinning Mills Limited",
-        "SUTLEJTEX.NS": "SUTLEJ TEXTILES AND INDUSTRIES",
-        "SUTLEJTEX.BO": "Sutlej Textiles and Industries Ltd.",
-        "SUTLEJTEX.NS": "Sutlej Textiles and Industries Limited",
-        "SWANENERGY.NS": "Swan Energy Limited",
-        "TAICHONG.BO": "TAI CHONBANG TEXTILE INDUSTRIE",
-        "THAMBBI.BO": "Thambbi Modern Spinning Mills Ltd",
-        "THEWEST.BO": "WESTERN INDIA COTTONS LTD.",
-        "TRIDENT.NS": "Trident Limited",
-        "TTL.NS": "T.T. Limited",
-        "TUNITEX.BO": "Tuni Textile Mills Ltd.",
-        "UNITEDTE.BO": "United Textiles Limited",
-        "UNIWORTHT.BO": "UNIWORTH TEXTILES LTD.",
-        "VANASTEX.BO": "VANASTHALI TEXTILE INDUSTRIES",
-        "VARDHACRLC.NS": "Vardhman Acrylics Limited",
-        "VARDMNPOLY.NS": "Vardhman Polytex Limited",
-        "VEENATX.BO": "VEENA TEXTILES LTD.",
-        "VENTURA.BO": "Ventura Textiles Ltd.",
-        "VERTEXSPG.BO": "Vertex Spinning Limited",
-        "VIJAYTX.BO": "Vijay Textiles Ltd.",
-        "VISHAL.BO": "VISHAL FABRICS LTD",
-        "VIVIDHA.NS": "Visagar Polytex Limited",
-        "VOGUETEX.BO": "VOGUE TEXTILES LTD.",
-        "VOITHPAPR.BO": "Voith Paper Fabrics India Limited",
-        "VOLTM.BO": "Volant Textile Mills Limited",
-        "VTL.NS": "VARDHMAN TEXTILES LIMITED",
-        "VTL.BO": "VARDHMAN TEXTILES LTD.",
-        "VTL.NS": "Vardhman Textiles Limited",
-        "VTL6.BO": "VARDHMAN TEXTILES LIMTED",
-        "WEIZMANIND.NS": "Weizmann Limited",
-        "WELINV.NS": "Welspun Investments and Commercials Limited",
-        "WELSPUNIND.NS": "Welspun India Limited",
-        "WHELTEX.BO": "Wheel & Axle Textiles Ltd",
-        "WINSOME-BE.NS": "WINSOME YARNS LTD INR10",
-        "WINSOME.BO": "WINSOME YARNS LTD.",
-        "WINSOME.NS": "Winsome Yarns Limited",
-        "WINSOMTX.BO": "Winsome Textile Industries Ltd.",
-        "YARNSYN.BO": "Yarn Syndicate Limited",
-        "ZENITHEXPO.NS": "Zenith Exports Limited"
-    },
-
-    "Tobacco Products, Other": {
-        "GODFRYPHLP.NS": "Godfrey Phillips India Limited",
-        "GOLDENTOBC.NS": "Golden Tobacco Limited",
-        "ITC.NS": "ITC Limited",
-        "VSTIND.NS": "VST Industries Limited"
-    },
-
-    "Transportation Services": {
-        "BALMERL-B.BO": "BALMER LAWRIE FREIGHT CONTAINE",
-        "TRANSFRE.BO": "Trans Freight Containers Limited"
-    },
-
-    "Trucking": {
-        "VRLLOG.NS": "VRL Logistics Limited"
-    },
-
-    "Waste Management": {
-        "GANECOS.NS": "Ganesha Ecosphere Limited",
-        "WABAG.NS": "VA Tech Wabag Limited"
-    },
-
-    "Water Utilities": {
-        "NCCBLUE.BO": "NCC BLUE WATER PRODUCTS LTD.",
-        "WATERBASE.BO": "WATERBASE LTD."
-    },
-
-    "Wireless Communications": {
-        "ADCINDIA.BO": "ADC INDIA COMMUNICATIONS LIMIT",
-        "BHARTIARTL.NS": "Bharti Airtel Limited",
-        "CINERAD.BO": "Cinerad Communications Ltd.",
-        "DALALSTCOM.BO": "DSJ COMMUNICATIONS LTD.",
-        "EIDERTELE.BO": "EIDER TELECOM LTD.",
-        "EMGEECA.BO": "Emgee Cables & Communications Ltd",
-        "ESSKAY.BO": "ESSKAY TELECOM LTD.",
-        "GEMINI.BO": "GEMINI COMMUNICATION LTD.",
-        "HFCL.BO": "Himachal Futuristic Communications Ltd.",
-        "IDEA.NS": "Idea Cellular Limited",
-        "INFRATEL.NS": "Bharti Infratel Limited",
-        "INTELSOFT.BO": "INTEGRA TELECOMMUNICATION & SO",
-        "KAVVERITEL.NS": "KAVVERI TELECOM PR INR10",
-        "KAVVERITEL.BO": "KAVVERI TELECOM PRODUCTS LTD.",
-        "METSL.BO": "MAESTROS ELECTRONICS & TELECOM",
-        "MOBILTEL.BO": "Mobile Telecommunications Ltd.",
-        "MTNL.NS": "Mahanagar Telephone Nigam Limited",
-        "MUNOTHI.BO": "Munoth Communication Ltd",
-        "NUTEK.NS": "Nu Tek India Limited",
-        "ODVDC.BO": "ODYSSEY VIDEO COMMUNICATIONS L",
-        "ONMOBILE.NS": "ONMOBILE GLOBAL LIMITED",
-        "ONMOBILE.BO": "OnMobile Global Limited",
-        "ONMOBILE.NS": "OnMobile Global Limited",
-        "ORTEL.BO": "Ortel Communications Limited",
-        "PARACABLES.BO": "PARAMOUNT COMMUNICATIONS LTD.",
-        "PNC.BO": "Pritish Nandy Communications Ltd.",
-        "PUNJCOMMU.BO": "Punjab Communications Ltd.",
-        "RCOM.BO": "Reliance Communications Ltd.",
-        "RCOM.NS": "Reliance Communications Limited",
-        "SAWACA.BO": "SAWACA COMMUNICATION LTD.",
-        "SGNTE.BO": "SGN Telecoms Ltd.",
-        "SHYAMTEL.BO": "SHYAM TELECOM LTD.",
-        "SKYLIDTE.BO": "SKYLID TELECOMMUNICATION LTD.",
-        "SUPRTELE.BO": "Supreme Telecom & Network India Limited",
-        "TATACOMM.BO": "Tata Communications Limited",
-        "TATACOMM.NS": "Tata Communications Limited",
-        "TNTELE.NS": "TAMILNADU TELECOMM INR10",
-        "TNTELE.BO": "Tamilnadu Telecommunications Limited",
-        "TTML.NS": "Tata Teleservices (Maharashtra) Limited",
-        "TULIP-BZ.NS": "TULIP TELECOM LIMITED",
-        "TULIP.BO": "Tulip Telecom Limited",
-        "VALIANT.BO": "Valiant Communications Limited",
-        "VITALCOMM.BO": "VITAL COMMUNICATIONS LTD.",
-        "WEBLCOM.BO": "WEBEL COMMUNICATION INDUSTRIES"
-    }
-
-}
+@st.cache_resource
+def load_indian_stocks(path=INDIAN_STOCKS_PATH):
+    """Load the stock universe once per process"""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
 
+INDIAN_STOCKS = load_indian_stocks()
 
 
 # ============================================================================
@@ -10005,6 +694,21 @@ INDUSTRY_TO_SECTOR = {
     "Textile Industrial": "Textiles"
 }
 
+# Representative industry for a yfinance sector when the stock's industry is unknown
+YF_SECTOR_TO_INDUSTRY = {
+    'Technology': 'Information Technology Services',
+    'Financial Services': 'Money Center Banks', 
+    'Healthcare': 'Drug Manufacturers - Major',
+    'Industrials': 'Diversified Machinery',
+    'Energy': 'Oil & Gas Operations',
+    'Consumer Cyclical': 'Auto Manufacturers - Major',
+    'Consumer Defensive': 'Food - Major Diversified',
+    'Basic Materials': 'Steel & Iron',
+    'Communication Services': 'Wireless Communications',
+    'Real Estate': 'Real Estate Development',
+    'Utilities': 'Electric Utilities'
+}
+
 # Fallback sector benchmarks
 SECTOR_BENCHMARKS = {
     'Financial Services': {'pe': 15.0, 'pb': 2.0, 'roe': 16.0, 'ev_ebitda': 10.0},
@@ -10019,13 +723,246 @@ SECTOR_BENCHMARKS = {
     'Other': {'pe': 20.0, 'pb': 2.5, 'roe': 15.0, 'ev_ebitda': 12.0}
 }
 
+# ============================================================================
+# RATE LIMITING
+# ============================================================================
+# Process-wide yfinance request budget (sustained rate and burst allowance)
+YF_REQUESTS_PER_SECOND = 4.0
+YF_BURST_SIZE = 8
+
+class TokenBucketRateLimiter:
+    """Thread-safe token bucket shared by every yfinance call in the process"""
+    
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = float(burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+        self.total_requests = 0
+        self.total_wait = 0.0
+    
+    def _refill(self, now):
+        elapsed = now - self._last_refill
+        self._tokens = min(self.burst, self._tokens + elapsed * self.rate)
+        self._last_refill = now
+    
+    def acquire(self):
+        """Take one token, sleeping only when the budget is exhausted. Returns seconds waited."""
+        with self._lock:
+            self._refill(time.monotonic())
+            # Reserve the token up front so concurrent callers queue behind each other
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+            self.total_requests += 1
+            self.total_wait += wait
+        
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+    
+    def available(self):
+        """Tokens in the bucket right now (negative while callers are queued)"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+    
+    def current_wait(self):
+        """Seconds a new caller would have to wait right now"""
+        with self._lock:
+            self._refill(time.monotonic())
+            return max(0.0, (1 - self._tokens) / self.rate)
+    
+    def stats(self):
+        """Snapshot of limiter metrics for display"""
+        current_wait = self.current_wait()
+        with self._lock:
+            return {
+                'current_wait': current_wait,
+                'total_requests': self.total_requests,
+                'total_wait': self.total_wait,
+                'avg_wait': self.total_wait / self.total_requests if self.total_requests else 0.0
+            }
+
+@st.cache_resource
+def get_rate_limiter(rate=YF_REQUESTS_PER_SECOND, burst=YF_BURST_SIZE):
+    """Single limiter instance shared across reruns and Streamlit sessions"""
+    return TokenBucketRateLimiter(rate, burst)
+
+# ============================================================================
+# REQUEST COALESCING
+# ============================================================================
+class SingleFlight:
+    """Coalesces concurrent calls for the same key into one execution whose result every caller shares"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight = {}  # key -> Future
+        self.executed = 0
+        self.shared = 0
+    
+    def do(self, key, func):
+        """Run func() unless a call for key is already in flight, in which case wait for its result"""
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+            else:
+                self.shared += 1
+        
+        if not leader:
+            # Re-raises the leader's exception, if any
+            return future.result()
+        
+        try:
+            future.set_result(func())
+        except BaseException as e:
+            # Followers must be released even when the leader is interrupted (e.g. a Streamlit rerun)
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+                self.executed += 1
+        return future.result()
+    
+    def stats(self):
+        """Executed and coalesced call counts"""
+        with self._lock:
+            return {'executed': self.executed, 'shared': self.shared, 'in_flight': len(self._in_flight)}
+
+@st.cache_resource
+def get_single_flight():
+    """Single coalescing layer shared across reruns and Streamlit sessions"""
+    return SingleFlight()
+
+# ============================================================================
+# STALE-WHILE-REVALIDATE
+# ============================================================================
+# Expired entries are still served for this long while a background refresh replaces them
+SWR_MAX_STALE = 24 * 3600
+# Daemon threads running background refreshes
+SWR_REFRESH_WORKERS = 2
+# Seconds before a key whose background refresh failed is tried again
+SWR_RETRY_INTERVAL = 300
+
+class BackgroundRefresher:
+    """Daemon worker pool running keyed refreshes, each key queued at most once
+
+    Workers are daemon threads, so refreshes still queued never hold up
+    process exit.
+    """
+    
+    def __init__(self, workers=SWR_REFRESH_WORKERS):
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = set()
+        self._failed_at = {}
+        self.completed = 0
+        self.failures = 0
+        for i in range(workers):
+            threading.Thread(target=self._work, name=f"swr-refresh-{i}", daemon=True).start()
+    
+    def submit(self, key, refresh):
+        """Queue refresh() unless the key is already pending or failed recently; True if queued"""
+        with self._lock:
+            if key in self._pending or time.time() - self._failed_at.get(key, 0) < SWR_RETRY_INTERVAL:
+                return False
+            self._pending.add(key)
+        self._queue.put((key, refresh))
+        return True
+    
+    def _work(self):
+        while True:
+            key, refresh = self._queue.get()
+            try:
+                refreshed = refresh() is not None
+            except Exception:
+                refreshed = False
+            
+            with self._lock:
+                self._pending.discard(key)
+                if refreshed:
+                    self.completed += 1
+                    self._failed_at.pop(key, None)
+                else:
+                    self.failures += 1
+                    self._failed_at[key] = time.time()
+    
+    def stats(self):
+        """Pending, completed and failed refresh counts"""
+        with self._lock:
+            return {'pending': len(self._pending), 'completed': self.completed, 'failures': self.failures}
+
+@st.cache_resource
+def get_background_refresher():
+    """Single refresher shared across reruns and Streamlit sessions"""
+    return BackgroundRefresher()
+
+class StaleWhileRevalidateCache:
+    """In-process cache that serves an expired entry at once and refreshes it in the background"""
+    
+    def __init__(self, name, ttl, refresher, single_flight, max_stale=SWR_MAX_STALE, max_entries=4096):
+        self.name = name
+        self.ttl = ttl
+        self.refresher = refresher
+        self.single_flight = single_flight
+        self.max_stale = max_stale
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = {}  # key -> (value, stored_at)
+    
+    def get(self, key, loader):
+        """Return (value, stored_at, stale); loader() runs inline only on a miss or past max_stale"""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+        
+        if entry is not None:
+            value, stored_at = entry
+            if now - stored_at <= self.ttl:
+                return value, stored_at, False
+            if now - stored_at <= self.ttl + self.max_stale:
+                self.refresher.submit((self.name, key), lambda: self._refresh(key, loader))
+                return value, stored_at, True
+        
+        # Concurrent misses on the same key share one load
+        value = self.single_flight.do((self.name, key), loader)
+        self._store(key, value, now)
+        return value, now, False
+    
+    def _refresh(self, key, loader):
+        # A failed refresh keeps serving the stale copy instead of replacing it with nothing
+        value = loader()
+        if value is not None:
+            self._store(key, value, time.time())
+        return value
+    
+    def _store(self, key, value, stored_at):
+        with self._lock:
+            self._entries[key] = (value, stored_at)
+            if len(self._entries) > self.max_entries:
+                # Drop the oldest quarter rather than pruning on every insert
+                by_age = sorted(self._entries, key=lambda k: self._entries[k][1])
+                for old_key in by_age[:len(by_age) // 4]:
+                    del self._entries[old_key]
+
 # ============================================================================
 # TECHNICAL ANALYSIS FUNCTIONS
 # ============================================================================
-@st.cache_data(ttl=3600)
-def fetch_price_history(ticker, period="3mo"):
-    """Fetch historical price data for technical analysis"""
+# Price histories are served fresh for this long, then stale-while-revalidate
+PRICE_CACHE_TTL = 3600  # seconds
+
+@st.cache_resource
+def get_price_cache():
+    """Price history cache shared across reruns and Streamlit sessions"""
+    return StaleWhileRevalidateCache("prices", PRICE_CACHE_TTL, get_background_refresher(), get_single_flight())
+
+def _download_price_history(ticker, period, rate_limiter):
+    """Download one ticker's price history from yfinance"""
     try:
+        rate_limiter.acquire()
         stock = yf.Ticker(ticker)
         hist = stock.history(period=period)
         if hist.empty:
@@ -10034,6 +971,115 @@ def fetch_price_history(ticker, period="3mo"):
     except:
         return None
 
+def fetch_price_history(ticker, period="3mo"):
+    """Fetch historical price data for technical analysis"""
+    rate_limiter = get_rate_limiter()
+    hist, _, _ = get_price_cache().get(
+        ('history', ticker, period), lambda: _download_price_history(ticker, period, rate_limiter)
+    )
+    return hist
+
+# Tickers per grouped yfinance download
+PRICE_HISTORY_BATCH_SIZE = 50
+# Worker threads yf.download may use for one group
+PRICE_DOWNLOAD_THREADS = 4
+
+def _download_price_batch(tickers, period, rate_limiter):
+    """Download OHLCV for one group of tickers with a single yf.download call
+
+    yf.download still makes one history request per symbol, so the group
+    is charged one rate-limit token per ticker; grouping saves Python-side
+    overhead and yields one aligned panel, not HTTP round-trips.
+    """
+    try:
+        for _ in tickers:
+            rate_limiter.acquire()
+        data = yf.download(
+            list(tickers),
+            period=period,
+            group_by='column',
+            auto_adjust=True,
+            threads=PRICE_DOWNLOAD_THREADS,
+            progress=False,
+            multi_level_index=True
+        )
+        if data is None or data.empty:
+            return None
+        return data
+    except:
+        return None
+
+def fetch_price_history_batch(tickers, period="6mo", batch_size=PRICE_HISTORY_BATCH_SIZE):
+    """Fetch OHLCV for many tickers as one panel with (field, ticker) columns"""
+    unique_tickers = list(dict.fromkeys(tickers))
+    price_cache = get_price_cache()
+    rate_limiter = get_rate_limiter()
+    frames = []
+    
+    for start in range(0, len(unique_tickers), batch_size):
+        group = tuple(unique_tickers[start:start + batch_size])
+        batch, _, _ = price_cache.get(
+            ('batch', group, period), lambda group=group: _download_price_batch(group, period, rate_limiter)
+        )
+        if batch is not None:
+            frames.append(batch)
+    
+    if not frames:
+        return None
+    return pd.concat(frames, axis=1).sort_index()
+
+def _supertrend_recursion(upper_band, lower_band, close):
+    """Single-pass band adjustment and trend direction over NumPy arrays (bands updated in place)"""
+    n = len(close)
+    supertrend = np.full(n, np.nan)
+    direction = np.full(n, np.nan)
+    
+    # Plain Python floats are much cheaper to index than NumPy scalars inside the loop
+    upper = upper_band.tolist()
+    lower = lower_band.tolist()
+    closes = close.tolist()
+    st_values = supertrend.tolist()
+    dir_values = direction.tolist()
+    
+    for i in range(1, n):
+        curr_upper = upper[i]
+        curr_lower = lower[i]
+        if curr_upper != curr_upper or curr_lower != curr_lower:  # NaN check
+            continue
+        
+        prev_close = closes[i - 1]
+        curr_close = closes[i]
+        prev_upper = upper[i - 1]
+        prev_lower = lower[i - 1]
+        
+        # Same as the original loop: on the first row with a full ATR window the previous
+        # bands are NaN, so neither test below holds and the NaN is carried forward. The
+        # adjusted bands and SuperTrend are NaN for the entire series and the signal is always -1.
+        # Adjust bands
+        if not (curr_upper < prev_upper or prev_close > prev_upper):
+            upper[i] = curr_upper = prev_upper
+        if not (curr_lower > prev_lower or prev_close < prev_lower):
+            lower[i] = curr_lower = prev_lower
+        
+        # Determine trend direction
+        if i == 1:
+            curr_direction = 1 if curr_close <= curr_lower else -1
+        else:
+            prev_direction = dir_values[i - 1]
+            if prev_direction == 1 and curr_close >= curr_lower:
+                curr_direction = -1
+            elif prev_direction == -1 and curr_close <= curr_upper:
+                curr_direction = 1
+            else:
+                curr_direction = prev_direction
+        
+        dir_values[i] = curr_direction
+        st_values[i] = curr_lower if curr_direction == 1 else curr_upper
+    
+    upper_band[:] = upper
+    lower_band[:] = lower
+    return np.array(st_values, dtype=float), np.array(dir_values, dtype=float)
+
 def calculate_supertrend(high, low, close, period=10, multiplier=3):
     """Calculate SuperTrend indicator"""
     try:
@@ -10046,52 +1092,18 @@ def calculate_supertrend(high, low, close, period=10, multiplier=3):
         
         # Calculate basic upper and lower bands
         hl_avg = (high + low) / 2
-        upper_band = hl_avg + (multiplier * atr)
-        lower_band = hl_avg - (multiplier * atr)
+        upper_values = (hl_avg + (multiplier * atr)).to_numpy(dtype=float, copy=True)
+        lower_values = (hl_avg - (multiplier * atr)).to_numpy(dtype=float, copy=True)
         
-        # Initialize SuperTrend
-        supertrend = pd.Series(index=close.index, dtype=float)
-        direction = pd.Series(index=close.index, dtype=int)
+        # Calculate SuperTrend on raw arrays
+        supertrend_values, direction_values = _supertrend_recursion(
+            upper_values, lower_values, close.to_numpy(dtype=float)
+        )
         
-        # Calculate SuperTrend
-        for i in range(1, len(close)):
-            if pd.isna(upper_band.iloc[i]) or pd.isna(lower_band.iloc[i]):
-                continue
-                
-            # Current upper and lower bands
-            curr_upper = upper_band.iloc[i]
-            curr_lower = lower_band.iloc[i]
-            prev_close = close.iloc[i-1]
-            curr_close = close.iloc[i]
-            
-            # Adjust bands
-            if curr_upper < upper_band.iloc[i-1] or prev_close > upper_band.iloc[i-1]:
-                upper_band.iloc[i] = curr_upper
-            else:
-                upper_band.iloc[i] = upper_band.iloc[i-1]
-                
-            if curr_lower > lower_band.iloc[i-1] or prev_close < lower_band.iloc[i-1]:
-                lower_band.iloc[i] = curr_lower
-            else:
-                lower_band.iloc[i] = lower_band.iloc[i-1]
-            
-            # Determine trend direction
-            if i == 1:
-                direction.iloc[i] = 1 if curr_close <= lower_band.iloc[i] else -1
-                supertrend.iloc[i] = lower_band.iloc[i] if direction.iloc[i] == 1 else upper_band.iloc[i]
-            else:
-                prev_supertrend = supertrend.iloc[i-1]
-                prev_direction = direction.iloc[i-1]
-                
-                if prev_direction == 1 and curr_close >= lower_band.iloc[i]:
-                    direction.iloc[i] = -1
-                    supertrend.iloc[i] = upper_band.iloc[i]
-                elif prev_direction == -1 and curr_close <= upper_band.iloc[i]:
-                    direction.iloc[i] = 1
-                    supertrend.iloc[i] = lower_band.iloc[i]
-                else:
-                    direction.iloc[i] = prev_direction
-                    supertrend.iloc[i] = lower_band.iloc[i] if direction.iloc[i] == 1 else upper_band.iloc[i]
+        supertrend = pd.Series(supertrend_values, index=close.index)
+        direction = pd.Series(direction_values, index=close.index)
+        upper_band = pd.Series(upper_values, index=close.index)
+        lower_band = pd.Series(lower_values, index=close.index)
         
         # Return signal: 1 for bullish (price > supertrend), -1 for bearish
         signal = (close > supertrend).astype(int) * 2 - 1
@@ -10112,9 +1124,10 @@ def is_near_52w_high(price, high_52w, threshold=0.95):
         return False
     return (price / high_52w) >= threshold
 
-def get_technical_signals(ticker):
+def get_technical_signals(ticker, hist=None):
     """Get comprehensive technical signals for a stock"""
-    hist = fetch_price_history(ticker, period="6mo")
+    if hist is None:
+        hist = fetch_price_history(ticker, period="6mo")
     if hist is None or len(hist) < 50:
         return None
     
@@ -10154,6 +1167,117 @@ def get_technical_signals(ticker):
     except Exception as e:
         return None
 
+# Columns produced by compute_technical_signals_panel, in get_technical_signals order
+TECHNICAL_SIGNAL_COLUMNS = [
+    'supertrend_signal', 'supertrend_value', 'near_52w_high', 'price_vs_52w_high',
+    'above_sma20', 'above_sma50', 'volume_surge', 'current_price'
+]
+
+def _bottom_align_panel(panel):
+    """Return {field: dates × tickers array} with each ticker's rows packed against the last row"""
+    tickers = list(dict.fromkeys(panel.columns.get_level_values(1)))
+    fields = list(dict.fromkeys(panel.columns.get_level_values(0)))
+    arrays = {field: panel[field].reindex(columns=tickers).to_numpy(dtype=float) for field in fields}
+    
+    # A row belongs to a ticker when any field is present
+    present = np.zeros(arrays[fields[0]].shape, dtype=bool)
+    for values in arrays.values():
+        present |= ~np.isnan(values)
+    
+    # Stable sort moves missing rows to the top while keeping trading-day order
+    order = np.argsort(present, axis=0, kind='stable')
+    aligned = {field: np.take_along_axis(values, order, axis=0) for field, values in arrays.items()}
+    return tickers, aligned, present.sum(axis=0)
+
+def _supertrend_panel(upper, lower, close, starts):
+    """SuperTrend recursion stepped over dates and vectorized across ticker columns"""
+    n_rows, n_cols = close.shape
+    supertrend = np.full((n_rows, n_cols), np.nan)
+    direction = np.full((n_rows, n_cols), np.nan)
+    
+    for i in range(1, n_rows):
+        curr_upper = upper[i]
+        curr_lower = lower[i]
+        # Each ticker's own recursion starts at its second row
+        valid = ~(np.isnan(curr_upper) | np.isnan(curr_lower)) & (i > starts)
+        if not valid.any():
+            continue
+        
+        prev_close = close[i - 1]
+        curr_close = close[i]
+        prev_upper = upper[i - 1]
+        prev_lower = lower[i - 1]
+        
+        # Adjust bands (same NaN carry-forward as _supertrend_recursion)
+        new_upper = np.where((curr_upper < prev_upper) | (prev_close > prev_upper), curr_upper, prev_upper)
+        new_lower = np.where((curr_lower > prev_lower) | (prev_close < prev_lower), curr_lower, prev_lower)
+        
+        # Determine trend direction
+        prev_direction = direction[i - 1]
+        first_step = i == starts + 1
+        continued = np.where(
+            (prev_direction == 1) & (curr_close >= new_lower), -1.0,
+            np.where((prev_direction == -1) & (curr_close <= new_upper), 1.0, prev_direction)
+        )
+        curr_direction = np.where(first_step, np.where(curr_close <= new_lower, 1.0, -1.0), continued)
+        
+        upper[i] = np.where(valid, new_upper, curr_upper)
+        lower[i] = np.where(valid, new_lower, curr_lower)
+        direction[i] = np.where(valid, curr_direction, np.nan)
+        supertrend[i] = np.where(valid, np.where(curr_direction == 1, new_lower, new_upper), np.nan)
+    
+    return supertrend, direction
+
+def compute_technical_signals_panel(panel, period=10, multiplier=3, min_history=50):
+    """Compute get_technical_signals for every ticker of a batched price panel in one pass"""
+    if panel is None or panel.empty:
+        return pd.DataFrame(columns=TECHNICAL_SIGNAL_COLUMNS)
+    
+    tickers, aligned, counts = _bottom_align_panel(panel)
+    n_rows = len(panel.index)
+    starts = n_rows - counts
+    
+    high = pd.DataFrame(aligned['High'], columns=tickers)
+    low = pd.DataFrame(aligned['Low'], columns=tickers)
+    close = pd.DataFrame(aligned['Close'], columns=tickers)
+    volume = pd.DataFrame(aligned['Volume'], columns=tickers)
+    
+    # ATR and basic bands for all tickers at once
+    prev_close = close.shift()
+    tr = np.fmax(np.fmax((high - low).to_numpy(), (high - prev_close).abs().to_numpy()),
+                 (low - prev_close).abs().to_numpy())
+    atr = pd.DataFrame(tr, columns=tickers).rolling(window=period).mean()
+    hl_avg = (high + low) / 2
+    upper = (hl_avg + (multiplier * atr)).to_numpy(dtype=float, copy=True)
+    lower = (hl_avg - (multiplier * atr)).to_numpy(dtype=float, copy=True)
+    
+    supertrend, _ = _supertrend_panel(upper, lower, close.to_numpy(dtype=float), starts)
+    
+    # Latest values per ticker (the last row holds each ticker's most recent session)
+    current_price = close.iloc[-1].to_numpy()
+    last_supertrend = supertrend[-1]
+    high_52w = high.rolling(window=252).max().iloc[-1].to_numpy()
+    sma_20 = close.rolling(window=20).mean().iloc[-1].to_numpy()
+    sma_50 = close.rolling(window=50).mean().iloc[-1].to_numpy()
+    avg_volume = volume.rolling(window=20).mean().iloc[-1].to_numpy()
+    recent_volume = volume.iloc[-5:].mean().to_numpy()
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        price_vs_high = current_price / high_52w
+        signals = pd.DataFrame({
+            'supertrend_signal': np.where(current_price > last_supertrend, 1, -1),
+            'supertrend_value': np.where(np.isnan(last_supertrend), None, last_supertrend),
+            'near_52w_high': (high_52w > 0) & (price_vs_high >= 0.95),
+            'price_vs_52w_high': np.where(high_52w > 0, price_vs_high, 0),
+            'above_sma20': ~np.isnan(sma_20) & (current_price > sma_20),
+            'above_sma50': ~np.isnan(sma_50) & (current_price > sma_50),
+            'volume_surge': (avg_volume > 0) & (recent_volume > avg_volume * 1.2),
+            'current_price': current_price
+        }, index=pd.Index(tickers, name='Ticker'))
+    
+    # Same minimum history as get_technical_signals by default
+    return signals[counts >= min_history]
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
@@ -10172,34 +1296,244 @@ def get_all_categories():
     """Get list of all categories"""
     return list(INDIAN_STOCKS.keys())
 
+# Exchange series suffixes that mark the same company (e.g. AGRODUTCH-BE.NS and AGRODUTCH.BO)
+SERIES_SUFFIXES = ('-BE', '-BZ', '-SM', '-ST', '-IL', '-BL', '-BT', '-B1')
+
+# Minimum trigram (Dice) similarity for a misspelt word to count as a match
+FUZZY_MATCH_THRESHOLD = 0.5
+
+# Exchange suffix typed as part of a full ticker (RELIANCE.NS, TCS.BO)
+EXCHANGE_SUFFIX_PATTERN = re.compile(r'\.(NS|BO)$', re.IGNORECASE)
+
+def _normalize_search_text(text):
+    """Lowercase and collapse punctuation to single spaces"""
+    return ' '.join(re.sub(r'[^a-z0-9&]+', ' ', text.lower()).split())
+
+def _trigrams(text, pad=True):
+    """Character trigrams of a string, padded at the edges for fuzzy word matching"""
+    if pad:
+        text = f"  {text} "
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def _company_key(ticker):
+    """Base symbol shared by .NS/.BO twins and their series variants"""
+    base = ticker.rsplit('.', 1)[0].upper()
+    for suffix in SERIES_SUFFIXES:
+        if base.endswith(suffix):
+            return base[:-len(suffix)]
+    return base
+
+class StockSearchIndex:
+    """Ranked company search: sorted prefix keys plus trigram indexes for substrings and typos"""
+    
+    def __init__(self, stocks_db):
+        # One entry per company; prefer the plain NSE listing over BSE and series twins
+        companies = {}
+        for category, stocks in stocks_db.items():
+            for ticker, name in stocks.items():
+                key = _company_key(ticker)
+                rank = (0 if ticker.endswith('.NS') else 1, 0 if ticker.rsplit('.', 1)[0].upper() == key else 1)
+                current = companies.get(key)
+                if current is None or rank < current[0]:
+                    companies[key] = (rank, ticker, name, category)
+        
+        # Every listing by full ticker, so a typed ticker finds that exact listing
+        self.listings = {
+            ticker.upper(): {'ticker': ticker, 'name': name, 'industry': category}
+            for category, stocks in stocks_db.items() for ticker, name in stocks.items()
+        }
+        
+        self.entries = []
+        self.names = []
+        # Tie-break within a score: NSE listings first, then entries with a real company name
+        self.preference = []
+        prefix_keys = []
+        self.substring_index = {}
+        self.word_entries = {}
+        
+        for entry_id, (key, (_, ticker, name, category)) in enumerate(companies.items()):
+            symbol = key.lower()
+            normalized_name = _normalize_search_text(name)
+            self.entries.append({'ticker': ticker, 'name': name, 'industry': category})
+            self.names.append((symbol, normalized_name))
+            self.preference.append((not ticker.endswith('.NS'), name.strip().upper() == ticker.upper()))
+            
+            prefix_keys.append((symbol, 0, entry_id))
+            prefix_keys.append((normalized_name, 1, entry_id))
+            for word in set(normalized_name.split()) | {symbol}:
+                prefix_keys.append((word, 2, entry_id))
+                self.word_entries.setdefault(word, set()).add(entry_id)
+            
+            for gram in _trigrams(symbol, pad=False) | _trigrams(normalized_name, pad=False):
+                self.substring_index.setdefault(gram, set()).add(entry_id)
+        
+        prefix_keys.sort()
+        self.prefix_keys = prefix_keys
+        self.prefix_strings = [k[0] for k in prefix_keys]
+        
+        # Vocabulary-level trigram postings keep typo matching cheap
+        self.word_grams = {}
+        self.word_gram_counts = {}
+        for word in self.word_entries:
+            grams = _trigrams(word)
+            self.word_gram_counts[word] = len(grams)
+            for gram in grams:
+                self.word_grams.setdefault(gram, []).append(word)
+    
+    def _prefix_matches(self, prefix):
+        """Yield (kind, entry_id) for every key starting with prefix"""
+        i = bisect_left(self.prefix_strings, prefix)
+        while i < len(self.prefix_strings) and self.prefix_strings[i].startswith(prefix):
+            _, kind, entry_id = self.prefix_keys[i]
+            yield kind, entry_id
+            i += 1
+    
+    def _similar_words(self, word):
+        """Vocabulary words within typo distance of word, with their trigram similarity"""
+        grams = _trigrams(word)
+        shared = Counter()
+        for gram in grams:
+            shared.update(self.word_grams.get(gram, ()))
+        
+        similar = {}
+        for candidate, count in shared.items():
+            similarity = 2 * count / (len(grams) + self.word_gram_counts[candidate])
+            if similarity >= FUZZY_MATCH_THRESHOLD:
+                similar[candidate] = similarity
+        return similar
+    
+    def search(self, query, limit=50):
+        """Return matches ranked symbol > name prefix > word prefix > substring > fuzzy"""
+        listing = self.listings.get(query.strip().upper())
+        q = _normalize_search_text(EXCHANGE_SUFFIX_PATTERN.sub('', query.strip()))
+        if not q:
+            return []
+        
+        scores = {}
+        
+        def score(entry_id, value):
+            if value > scores.get(entry_id, 0):
+                scores[entry_id] = value
+        
+        # Prefix tier (symbol, full name, or any word of the name)
+        for kind, entry_id in self._prefix_matches(q):
+            exact_symbol = kind == 0 and self.names[entry_id][0] == q
+            score(entry_id, 100 if exact_symbol else (90, 80, 70)[kind])
+        
+        # Multi-word queries: every query word must prefix some word of the name
+        words = q.split()
+        if len(words) > 1:
+            candidates = None
+            for word in words:
+                matched = {entry_id for kind, entry_id in self._prefix_matches(word) if kind == 2}
+                candidates = matched if candidates is None else candidates & matched
+                if not candidates:
+                    break
+            for entry_id in candidates or ():
+                score(entry_id, 65)
+        
+        wanted = limit if limit is not None else len(self.entries)
+        
+        # Substring tier: intersect trigram postings, then verify
+        if len(q) >= 3 and len(scores) < wanted:
+            postings = sorted(
+                (self.substring_index.get(gram, set()) for gram in _trigrams(q, pad=False)),
+                key=len
+            )
+            candidates = set(postings[0])
+            for posting in postings[1:]:
+                candidates &= posting
+                if not candidates:
+                    break
+            for entry_id in candidates:
+                symbol, normalized_name = self.names[entry_id]
+                if q in normalized_name or q in symbol:
+                    score(entry_id, 50)
+        
+        # Typo-tolerant tier: each query word must closely match some word of the name
+        if len(scores) < wanted:
+            fuzzy = {}
+            # Entries whose own symbol is the corrected word (relaince -> RELIANCE) lead the tier
+            symbol_hits = set()
+            for i, word in enumerate(words):
+                word_scores = {}
+                for similar, similarity in self._similar_words(word).items():
+                    for entry_id in self.word_entries[similar]:
+                        if similarity > word_scores.get(entry_id, 0):
+                            word_scores[entry_id] = similarity
+                        if self.names[entry_id][0] == similar:
+                            symbol_hits.add(entry_id)
+                if not word_scores:
+                    fuzzy = {}
+                    break
+                fuzzy = word_scores if i == 0 else {
+                    entry_id: total + word_scores[entry_id]
+                    for entry_id, total in fuzzy.items() if entry_id in word_scores
+                }
+            for entry_id, total in fuzzy.items():
+                score(entry_id, 40 * total / len(words) + (2 if entry_id in symbol_hits else 0))
+        
+        ranked = sorted(scores, key=lambda e: (-scores[e], self.preference[e], len(self.names[e][1]), self.names[e][1]))
+        matches = [self.entries[entry_id] for entry_id in ranked]
+        if listing is not None:
+            # A full ticker leads with that exact listing, even when the company's entry is a twin
+            matches = [listing] + [match for match in matches if match['ticker'] != listing['ticker']]
+        return matches[:wanted]
+
+@st.cache_resource
+def get_search_index():
+    """Company search index over INDIAN_STOCKS, built once per process"""
+    return StockSearchIndex(INDIAN_STOCKS)
+
 def search_stock(query):
     """Search for stocks by ticker or name"""
     results = {}
-    query_upper = query.upper()
+    for match in get_search_index().search(query, limit=None):
+        results.setdefault(match['industry'], {})[match['ticker']] = match['name']
+    return results
+
+def get_sector_for_industry(industry):
+    """Get broad sector for a given industry"""
+    return INDUSTRY_TO_SECTOR.get(industry, "Other")
+
+@st.cache_resource
+def get_stock_catalog():
+    """Hash indexes over INDIAN_STOCKS (ticker → (name, category), sector → tickers), built once per process"""
+    by_ticker = {}
+    by_sector = {}
     
     for category, stocks in INDIAN_STOCKS.items():
+        sector_tickers = by_sector.setdefault(get_sector_for_industry(category), {})
         for ticker, name in stocks.items():
-            if query_upper in ticker.upper() or query_upper in name.upper():
-                if category not in results:
-                    results[category] = {}
-                results[category][ticker] = name
+            # First category wins, matching the original linear scan
+            if ticker not in by_ticker:
+                by_ticker[ticker] = (name, category)
+            sector_tickers[ticker] = None
     
-    return results
+    return {
+        'by_ticker': by_ticker,
+        'by_sector': {sector: list(tickers) for sector, tickers in by_sector.items()}
+    }
 
 def get_stock_info(ticker):
     """Get stock information by ticker"""
-    for category, stocks in INDIAN_STOCKS.items():
-        if ticker in stocks:
-            return {
-                "ticker": ticker,
-                "name": stocks[ticker],
-                "category": category
-            }
-    return None
+    entry = get_stock_catalog()['by_ticker'].get(ticker)
+    if entry is None:
+        return None
+    return {
+        "ticker": ticker,
+        "name": entry[0],
+        "category": entry[1]
+    }
 
-def get_sector_for_industry(industry):
-    """Get broad sector for a given industry"""
-    return INDUSTRY_TO_SECTOR.get(industry, "Other")
+def get_category_for_ticker(ticker):
+    """Get the industry category a ticker is listed under"""
+    entry = get_stock_catalog()['by_ticker'].get(ticker)
+    return entry[1] if entry else None
+
+def get_tickers_by_sector(sector):
+    """Get all tickers whose industry maps to a broad sector"""
+    return get_stock_catalog()['by_sector'].get(sector, [])
 
 # Statistics
 TOTAL_STOCKS = sum(len(stocks) for stocks in INDIAN_STOCKS.values())
@@ -10224,22 +1558,334 @@ def retry_with_backoff(retries=3, backoff_in_seconds=2):
         return wrapper
     return decorator
 
-@st.cache_data(ttl=3600)
-@retry_with_backoff(retries=3, backoff_in_seconds=2)
+# On-disk fundamentals cache shared by every app process and kept across restarts
+FUNDAMENTALS_CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "fundamentals.sqlite")
+FUNDAMENTALS_CACHE_TTL = 3600  # seconds
+
+# How long each failed fetch outcome is trusted before the ticker is asked for again
+# (successful fetches follow FUNDAMENTALS_CACHE_TTL)
+FETCH_OUTCOME_TTLS = {
+    'dead': 7 * 24 * 3600,    # not found / delisted, or empty on two consecutive attempts
+    'empty': 1800,            # a single empty response, often a throttled reply
+    'rate_limited': 60,
+    'error': 300
+}
+
+def classify_fetch_error(error):
+    """Fetch outcome ('rate_limited', 'dead' or 'error') for an exception raised by yfinance"""
+    message = str(error).lower()
+    if "429" in message or "too many requests" in message or "rate limit" in message:
+        return 'rate_limited'
+    if "404" in message or "not found" in message or "delisted" in message:
+        return 'dead'
+    return 'error'
+
+class FundamentalsCache:
+    """SQLite-backed store of yfinance info dicts keyed by ticker"""
+    
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            # WAL lets several app processes read while one writes
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS fundamentals ("
+                "ticker TEXT PRIMARY KEY, info TEXT NOT NULL, fetched_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS industry_calibration ("
+                "industry TEXT PRIMARY KEY, benchmarks TEXT NOT NULL, sample_size INTEGER NOT NULL, "
+                "updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS screen_results ("
+                "industry TEXT NOT NULL, strategy TEXT NOT NULL, data_version TEXT NOT NULL, results TEXT NOT NULL, "
+                "data_as_of REAL NOT NULL, computed_at REAL NOT NULL, PRIMARY KEY (industry, strategy))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS fetch_failures ("
+                "ticker TEXT PRIMARY KEY, outcome TEXT NOT NULL, message TEXT NOT NULL, failed_at REAL NOT NULL)"
+            )
+    
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            yield conn
+            conn.commit()
+        finally:
+            conn.close()
+    
+    def get(self, ticker, ttl=FUNDAMENTALS_CACHE_TTL):
+        """Return (info, fetched_at) for a fresh entry, or (None, None) on a miss"""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT info, fetched_at FROM fundamentals WHERE ticker = ?", (ticker,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None, None
+        
+        if not row or time.time() - row[1] > ttl:
+            return None, None
+        return json.loads(row[0]), row[1]
+    
+    def put(self, ticker, info):
+        """Store a freshly fetched info dict"""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO fundamentals (ticker, info, fetched_at) VALUES (?, ?, ?)",
+                    (ticker, json.dumps(info, default=str), time.time())
+                )
+                conn.execute("DELETE FROM fetch_failures WHERE ticker = ?", (ticker,))
+        except sqlite3.Error:
+            pass
+    
+    def put_failure(self, ticker, outcome, message):
+        """Record a failed fetch so it is not retried before its FETCH_OUTCOME_TTLS entry expires
+
+        An empty response following an earlier empty or dead record is
+        promoted to 'dead'.
+        """
+        try:
+            with self._connect() as conn:
+                if outcome == 'empty':
+                    row = conn.execute(
+                        "SELECT outcome, failed_at FROM fetch_failures WHERE ticker = ?", (ticker,)
+                    ).fetchone()
+                    if row and row[0] in ('empty', 'dead') and time.time() - row[1] <= FETCH_OUTCOME_TTLS['dead']:
+                        outcome = 'dead'
+                conn.execute(
+                    "INSERT OR REPLACE INTO fetch_failures (ticker, outcome, message, failed_at) VALUES (?, ?, ?, ?)",
+                    (ticker, outcome, message, time.time())
+                )
+        except sqlite3.Error:
+            pass
+    
+    def get_failure(self, ticker):
+        """(outcome, message) of a failure still within its TTL, or None"""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT outcome, message, failed_at FROM fetch_failures WHERE ticker = ?", (ticker,)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        
+        if not row or time.time() - row[2] > FETCH_OUTCOME_TTLS.get(row[0], 0):
+            return None
+        return row[0], row[1]
+    
+    def active_failures(self):
+        """{ticker: (outcome, message)} for every failure still within its TTL"""
+        try:
+            with self._connect() as conn:
+                rows = conn.execute("SELECT ticker, outcome, message, failed_at FROM fetch_failures").fetchall()
+        except sqlite3.Error:
+            return {}
+        
+        now = time.time()
+        return {
+            ticker: (outcome, message)
+            for ticker, outcome, message, failed_at in rows
+            if now - failed_at <= FETCH_OUTCOME_TTLS.get(outcome, 0)
+        }
+    
+    def get_many(self, tickers):
+        """Latest snapshot of each cached ticker regardless of age: {ticker: (info, fetched_at)}"""
+        snapshots = {}
+        tickers = list(tickers)
+        try:
+            with self._connect() as conn:
+                # Stay under SQLite's bound-parameter limit
+                for start in range(0, len(tickers), 500):
+                    chunk = tickers[start:start + 500]
+                    rows = conn.execute(
+                        f"SELECT ticker, info, fetched_at FROM fundamentals WHERE ticker IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchall()
+                    for ticker, info, fetched_at in rows:
+                        snapshots[ticker] = (json.loads(info), fetched_at)
+        except sqlite3.Error:
+            pass
+        return snapshots
+    
+    def tickers_fetched_since(self, since):
+        """Tickers whose cached snapshot is newer than the given timestamp"""
+        try:
+            with self._connect() as conn:
+                rows = conn.execute("SELECT ticker FROM fundamentals WHERE fetched_at > ?", (since,)).fetchall()
+        except sqlite3.Error:
+            return []
+        return [row[0] for row in rows]
+    
+    def snapshot_stats(self, tickers):
+        """(count, oldest fetched_at, newest fetched_at) over the cached snapshots of the given tickers"""
+        count, oldest, newest = 0, None, None
+        tickers = list(tickers)
+        try:
+            with self._connect() as conn:
+                for start in range(0, len(tickers), 500):
+                    chunk = tickers[start:start + 500]
+                    n, lo, hi = conn.execute(
+                        f"SELECT COUNT(*), MIN(fetched_at), MAX(fetched_at) FROM fundamentals "
+                        f"WHERE ticker IN ({','.join('?' * len(chunk))})",
+                        chunk
+                    ).fetchone()
+                    if n:
+                        count += n
+                        oldest = lo if oldest is None else min(oldest, lo)
+                        newest = hi if newest is None else max(newest, hi)
+        except sqlite3.Error:
+            pass
+        return count, oldest, newest
+    
+    def refresh_index(self):
+        """{ticker: (fetched_at, market_cap)} for every cached snapshot, for refresh scheduling"""
+        try:
+            with self._connect() as conn:
+                rows = conn.execute(
+                    "SELECT ticker, fetched_at, json_extract(info, '$.marketCap') FROM fundamentals"
+                ).fetchall()
+        except sqlite3.Error:
+            return {}
+        return {ticker: (fetched_at, market_cap) for ticker, fetched_at, market_cap in rows}
+    
+    def get_screen_results(self, industry, strategy):
+        """Stored (data_version, rows, data_as_of, computed_at) for a screen, or None"""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT data_version, results, data_as_of, computed_at FROM screen_results "
+                    "WHERE industry = ? AND strategy = ?", (industry, strategy)
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        if not row:
+            return None
+        return row[0], json.loads(row[1]), row[2], row[3]
+    
+    def put_screen_results(self, industry, strategy, data_version, rows, data_as_of):
+        """Store the full passing-row set of a screen"""
+        try:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO screen_results "
+                    "(industry, strategy, data_version, results, data_as_of, computed_at) VALUES (?, ?, ?, ?, ?, ?)",
+                    (industry, strategy, data_version, json.dumps(rows, default=str), data_as_of, time.time())
+                )
+        except sqlite3.Error:
+            pass
+    
+    def load_calibration(self):
+        """Calibrated benchmarks by industry and the time of the last calibration"""
+        try:
+            with self._connect() as conn:
+                rows = conn.execute("SELECT industry, benchmarks, updated_at FROM industry_calibration").fetchall()
+        except sqlite3.Error:
+            return {}, 0.0
+        calibrated = {industry: json.loads(benchmarks) for industry, benchmarks, _ in rows}
+        return calibrated, max((row[2] for row in rows), default=0.0)
+    
+    def save_calibration(self, results, updated_at):
+        """Store {industry: (benchmarks, sample_size)} from a calibration run"""
+        try:
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO industry_calibration (industry, benchmarks, sample_size, updated_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    [(industry, json.dumps(benchmarks), size, updated_at) for industry, (benchmarks, size) in results.items()]
+                )
+        except sqlite3.Error:
+            pass
+
+@st.cache_resource
+def get_fundamentals_cache(path=FUNDAMENTALS_CACHE_PATH):
+    """Single cache handle shared across reruns and Streamlit sessions"""
+    return FundamentalsCache(path)
+
+def download_stock_info(ticker, rate_limiter, cache):
+    """Fetch a ticker's info from yfinance within the rate limit and store it in the disk cache
+
+    An empty response is recorded as a failure; a repeated one marks the ticker dead.
+    """
+    rate_limiter.acquire()
+    info = yf.Ticker(ticker).info
+    if not info or len(info) < 5:
+        cache.put_failure(ticker, 'empty', "Unable to fetch data")
+        return None
+    cache.put(ticker, info)
+    return info
+
+# Expired disk snapshots are still served for this long while they are refreshed in the background
+FUNDAMENTALS_MAX_STALE = SWR_MAX_STALE
+
+def is_stale_snapshot(fetched_at):
+    """Whether a snapshot fetched at this time is past FUNDAMENTALS_CACHE_TTL"""
+    return fetched_at is not None and time.time() - fetched_at > FUNDAMENTALS_CACHE_TTL
+
+def revalidate_stock_data(ticker):
+    """Queue a background refresh of a ticker's disk snapshot; True if newly queued"""
+    rate_limiter = get_rate_limiter()
+    cache = get_fundamentals_cache()
+    return get_background_refresher().submit(
+        ('fundamentals', ticker), lambda: download_stock_info(ticker, rate_limiter, cache)
+    )
+
+def fetch_stock_snapshot(ticker):
+    """(info, error, fetched_at) for a ticker, serving an expired disk snapshot at once while it is refreshed"""
+    cache = get_fundamentals_cache()
+    info, fetched_at = cache.get(ticker, ttl=FUNDAMENTALS_CACHE_TTL + FUNDAMENTALS_MAX_STALE)
+    if info:
+        if is_stale_snapshot(fetched_at):
+            revalidate_stock_data(ticker)
+        return info, None, fetched_at
+    
+    # Dead tickers and recent rate-limit or network errors are answered without a request
+    failure = cache.get_failure(ticker)
+    if failure:
+        return None, failure[1], None
+    
+    # Concurrent misses for the same ticker share one upstream request
+    info, error = get_single_flight().do(('fundamentals', ticker), lambda: _fetch_stock_data_live(ticker))
+    return info, error, time.time() if info else None
+
 def fetch_stock_data(ticker):
     """Fetch stock data with caching and retry mechanism"""
+    info, error, _ = fetch_stock_snapshot(ticker)
+    return info, error
+
+# Interactive screens give up after one 2s backoff; headless batch runs can afford the full 2/4/8s schedule
+FETCH_RETRIES = 1 if IN_STREAMLIT else 3
+
+@retry_with_backoff(retries=FETCH_RETRIES, backoff_in_seconds=2)
+def _download_stock_info_with_retry(ticker, rate_limiter, cache):
+    """download_stock_info, retried with backoff on rate-limit and transient errors"""
     try:
-        time.sleep(0.5)  # Rate limiting
-        stock = yf.Ticker(ticker)
-        info = stock.info
-        if not info or len(info) < 5:
-            return None, "Unable to fetch data"
-        return info, None
+        return download_stock_info(ticker, rate_limiter, cache)
     except Exception as e:
-        error_msg = str(e)
-        if "429" in error_msg or "rate" in error_msg.lower():
-            return None, "Rate limit reached"
-        return None, str(e)[:100]
+        # Retrying a symbol yfinance does not know will not help
+        if classify_fetch_error(e) == 'dead':
+            cache.put_failure(ticker, 'dead', "Unable to fetch data")
+            return None
+        raise
+
+def _fetch_stock_data_live(ticker):
+    """Fetch stock data from yfinance when no usable snapshot is cached"""
+    cache = get_fundamentals_cache()
+    try:
+        info = _download_stock_info_with_retry(ticker, get_rate_limiter(), cache)
+    except Exception as e:
+        outcome = classify_fetch_error(e)
+        message = "Rate limit reached" if outcome == 'rate_limited' else str(e)[:100]
+        cache.put_failure(ticker, outcome, message)
+        return None, message
+    
+    if not info:
+        return None, "Unable to fetch data"
+    return info, None
 
 def get_stock_fundamentals(ticker):
     """Get key fundamental metrics for a stock with enhanced sector analysis"""
@@ -10248,6 +1894,10 @@ def get_stock_fundamentals(ticker):
     if error or not info:
         return None
     
+    return fundamentals_from_info(ticker, info)
+
+def fundamentals_from_info(ticker, info):
+    """Key fundamental metrics extracted from a yfinance info dict"""
     try:
         # Extract key metrics
         market_cap = info.get('marketCap', 0)
@@ -10299,15 +1949,346 @@ def get_stock_fundamentals(ticker):
     except Exception as e:
         return None
 
-def get_industry_benchmarks(industry, cap_type='Large'):
-    """Get industry-specific benchmarks with cap-size adjustments"""
+# Bounded concurrency for industry-wide fundamental fetches
+SCREENER_MAX_WORKERS = 8
+
+def iter_fundamentals_concurrently(tickers, max_workers=SCREENER_MAX_WORKERS, on_progress=None):
+    """Yield (ticker, fundamentals) in completion order from a bounded thread pool"""
+    if not tickers:
+        return
+    
+    total = len(tickers)
+    completed = 0
+    workers = max(1, min(max_workers, total))
+    
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {executor.submit(get_stock_fundamentals, ticker): ticker for ticker in tickers}
+        
+        # Results arrive in completion order, not submission order
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                fundamentals = future.result()
+            except Exception:
+                fundamentals = None
+            
+            completed += 1
+            if on_progress:
+                on_progress(ticker, completed, total)
+            yield ticker, fundamentals
+    finally:
+        # A consumer that stops early should not wait on fetches nobody will read
+        executor.shutdown(wait=True, cancel_futures=True)
+
+def fetch_fundamentals_concurrently(tickers, max_workers=SCREENER_MAX_WORKERS, on_progress=None):
+    """Fetch fundamentals for many tickers in parallel using a bounded thread pool"""
+    return dict(iter_fundamentals_concurrently(tickers, max_workers=max_workers, on_progress=on_progress))
+
+def fetch_fundamentals_bulk(tickers, max_workers=SCREENER_MAX_WORKERS, on_progress=None):
+    """Fundamentals for a large ticker set: disk-cache hits in one read, misses fetched concurrently
+
+    Expired snapshots within FUNDAMENTALS_MAX_STALE are used as they are
+    and queued for a background refresh.
+    """
+    now = time.time()
+    snapshots = get_fundamentals_cache().get_many(tickers)
+    fundamentals_by_ticker = {}
+    for ticker, (info, fetched_at) in snapshots.items():
+        age = now - fetched_at
+        if not info or age > FUNDAMENTALS_CACHE_TTL + FUNDAMENTALS_MAX_STALE:
+            continue
+        if age > FUNDAMENTALS_CACHE_TTL:
+            revalidate_stock_data(ticker)
+        fundamentals_by_ticker[ticker] = fundamentals_from_info(ticker, info)
+    
+    # Known dead or recently failing tickers are skipped without a request
+    failures = get_fundamentals_cache().active_failures()
+    for ticker in tickers:
+        if ticker in failures and ticker not in fundamentals_by_ticker:
+            fundamentals_by_ticker[ticker] = None
+    
+    missing = [ticker for ticker in tickers if ticker not in fundamentals_by_ticker]
+    cached = len(fundamentals_by_ticker)
+    
+    def progress(ticker, completed, total):
+        on_progress(ticker, cached + completed, cached + total)
+    
+    fundamentals_by_ticker.update(
+        fetch_fundamentals_concurrently(missing, max_workers=max_workers, on_progress=progress if on_progress else None)
+    )
+    return fundamentals_by_ticker
+
+# Background refresher that keeps the disk cache warm ahead of demand
+PREFETCH_ENABLED = True
+# Refresh a snapshot once it reaches this fraction of FUNDAMENTALS_CACHE_TTL
+PREFETCH_REFRESH_AHEAD = 0.8
+# Tokens left in the rate-limit bucket for interactive fetches; the prefetcher only uses the surplus
+PREFETCH_RESERVE_TOKENS = YF_BURST_SIZE / 2
+# Largest fraction of YF_REQUESTS_PER_SECOND the prefetcher may use, however idle the app is.
+# It also bounds the warm set: at 4 req/s x 0.25 the prefetcher refreshes about
+# 2,880 tickers per refresh window (PREFETCH_REFRESH_AHEAD of the TTL), not the whole universe.
+PREFETCH_BUDGET_SHARE = 0.25
+# Industries most recently opened by users, refreshed first
+PREFETCH_RECENT_INDUSTRIES = 5
+# Seconds to sleep when nothing is due, and before retrying a ticker that failed
+PREFETCH_IDLE_SLEEP = 30.0
+PREFETCH_FAILURE_BACKOFF = 6 * 3600
+
+PREFETCH_THREAD_NAME = "fundamentals-prefetch"
+
+@st.cache_resource
+def get_prefetch_start_lock():
+    """Process-wide lock serializing prefetch thread starts across script reruns"""
+    return threading.Lock()
+
+def _running_prefetch_scheduler():
+    """Scheduler whose thread is already running in this process, if any"""
+    for thread in threading.enumerate():
+        if thread.name == PREFETCH_THREAD_NAME and thread.is_alive():
+            return getattr(thread, 'scheduler', None)
+    return None
+
+class PrefetchScheduler:
+    """Daemon thread that keeps a warm set of cached fundamentals refreshed before they expire
+
+    It is paced to PREFETCH_BUDGET_SHARE of the request budget and only
+    spends tokens beyond PREFETCH_RESERVE_TOKENS, so interactive screens
+    keep priority. That pace cannot cover the whole universe within one
+    refresh window, so each pass keeps only as many tickers warm as it can
+    refresh in that window: members of recently viewed industries, then
+    cached tickers by market cap, then tickers never fetched. The rest
+    are fetched on demand and may be served stale. Tickers with an active
+    fetch failure (dead, rate-limited, erroring) are skipped.
+    
+    Each pass refreshes the due warm tickers (missing, or older than
+    PREFETCH_REFRESH_AHEAD of the TTL) in order: recently viewed
+    industries, then large, mid and small caps, then tickers never fetched.
+    on_industry_refreshed(industry) runs on the prefetch thread once every
+    due member of an industry has been attempted and at least one refetched.
+    """
+    
+    def __init__(self, tickers_by_industry, rate_limiter, cache, ttl=FUNDAMENTALS_CACHE_TTL, on_industry_refreshed=None):
+        self.tickers_by_industry = tickers_by_industry
+        self.industries_of = {}
+        for industry, tickers in tickers_by_industry.items():
+            for ticker in tickers:
+                self.industries_of.setdefault(ticker, []).append(industry)
+        self.on_industry_refreshed = on_industry_refreshed
+        self.rate_limiter = rate_limiter
+        # Own pacing bucket that caps the prefetcher's share of the shared budget
+        self.pacer = TokenBucketRateLimiter(rate_limiter.rate * PREFETCH_BUDGET_SHARE, 1)
+        self.cache = cache
+        self.ttl = ttl
+        # Tickers the pace can refresh once per refresh window
+        self.warm_capacity = max(1, int(self.pacer.rate * ttl * PREFETCH_REFRESH_AHEAD))
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._recent = []
+        self._replan = False
+        self._failed_until = {}
+        self._queue_depth = 0
+        self._warm_size = 0
+        self._oldest_fetch = None
+        self.refreshed = 0
+        self.failures = 0
+        self.passes = 0
+        self._thread = threading.Thread(target=self._run, name=PREFETCH_THREAD_NAME, daemon=True)
+        # Lets a later get_prefetch_scheduler() adopt this scheduler from its running thread
+        self._thread.scheduler = self
+    
+    def start(self):
+        """Start the background thread unless a prefetch thread already runs in this process"""
+        with get_prefetch_start_lock():
+            if _running_prefetch_scheduler() is None and not self._thread.is_alive():
+                self._thread.start()
+        return self
+    
+    def stop(self):
+        """Ask the background thread to exit after the current fetch"""
+        self._stop.set()
+        self._wake.set()
+    
+    def mark_viewed(self, industry):
+        """Move an industry to the front of the refresh order"""
+        if industry not in self.tickers_by_industry:
+            return
+        with self._lock:
+            if self._recent[:1] == [industry]:
+                return
+            self._recent = [industry] + [i for i in self._recent if i != industry][:PREFETCH_RECENT_INDUSTRIES - 1]
+            self._replan = True
+        self._wake.set()
+    
+    def _plan(self):
+        """Due warm-set tickers in refresh order, and the due tickers of each industry"""
+        now = time.time()
+        index = self.cache.refresh_index()
+        failures = self.cache.active_failures()
+        with self._lock:
+            recent = list(self._recent)
+            self._replan = False
+        recent_rank = {}
+        for rank, industry in enumerate(recent):
+            for ticker in self.tickers_by_industry[industry]:
+                recent_rank.setdefault(ticker, rank)
+        
+        # Warm set: recent industries, then cached tickers by market cap, then never fetched
+        candidates = {}
+        for tickers in self.tickers_by_industry.values():
+            for ticker in tickers:
+                # Known dead or failing tickers are neither fetched nor counted towards the lag
+                if ticker in candidates or ticker in failures or self._failed_until.get(ticker, 0) > now:
+                    continue
+                fetched_at, market_cap = index.get(ticker, (None, None))
+                if ticker in recent_rank:
+                    warm_rank = (0, recent_rank[ticker])
+                elif fetched_at is not None:
+                    warm_rank = (1, -(market_cap or 0))
+                else:
+                    warm_rank = (2, 0)
+                candidates[ticker] = (warm_rank, ticker)
+        warm = heapq.nsmallest(self.warm_capacity, candidates, key=candidates.get)
+        
+        due = []
+        oldest = None
+        for ticker in warm:
+            fetched_at, market_cap = index.get(ticker, (None, None))
+            if fetched_at is not None:
+                oldest = fetched_at if oldest is None else min(oldest, fetched_at)
+                if now - fetched_at < self.ttl * PREFETCH_REFRESH_AHEAD:
+                    continue
+            
+            if ticker in recent_rank:
+                tier = recent_rank[ticker]
+            elif fetched_at is None:
+                tier = PREFETCH_RECENT_INDUSTRIES + 3
+            elif (market_cap or 0) >= 200000000000:
+                tier = PREFETCH_RECENT_INDUSTRIES
+            elif (market_cap or 0) >= 50000000000:
+                tier = PREFETCH_RECENT_INDUSTRIES + 1
+            else:
+                tier = PREFETCH_RECENT_INDUSTRIES + 2
+            due.append((tier, fetched_at or 0.0, ticker))
+        
+        due = [ticker for _, _, ticker in sorted(due)]
+        pending = {}
+        for ticker in due:
+            for industry in self.industries_of[ticker]:
+                pending.setdefault(industry, set()).add(ticker)
+        with self._lock:
+            self._queue_depth = len(due)
+            self._warm_size = len(warm)
+            self._oldest_fetch = oldest
+        return due, pending
+    
+    def _attempted(self, ticker, refetched, pending, touched):
+        """Record a prefetch attempt and report industries whose due members are all done"""
+        for industry in self.industries_of[ticker]:
+            if refetched:
+                touched.add(industry)
+            pending[industry].discard(ticker)
+            if pending[industry] or industry not in touched:
+                continue
+            touched.discard(industry)
+            if self.on_industry_refreshed is not None:
+                try:
+                    self.on_industry_refreshed(industry)
+                except Exception:
+                    # A failed follow-up must not stop the refresh loop
+                    pass
+    
+    def _wait_for_spare_capacity(self):
+        """Block for the prefetch pace, then until the bucket holds more than the interactive reserve; False if stopping"""
+        while self.pacer.current_wait() > 0:
+            if self._stop.wait(self.pacer.current_wait()):
+                return False
+        self.pacer.acquire()
+        while self.rate_limiter.available() < PREFETCH_RESERVE_TOKENS + 1:
+            if self._stop.wait(1.0 / self.rate_limiter.rate):
+                return False
+        return True
+    
+    def _run(self):
+        while not self._stop.is_set():
+            due, pending = self._plan()
+            touched = set()
+            for position, ticker in enumerate(due):
+                if self._stop.is_set() or self._replan or not self._wait_for_spare_capacity():
+                    break
+                try:
+                    info = download_stock_info(ticker, self.rate_limiter, self.cache)
+                except Exception as e:
+                    self.cache.put_failure(ticker, classify_fetch_error(e), str(e)[:100])
+                    info = None
+                
+                with self._lock:
+                    self._queue_depth = len(due) - position - 1
+                    if info:
+                        self.refreshed += 1
+                        self._failed_until.pop(ticker, None)
+                    else:
+                        self.failures += 1
+                        self._failed_until[ticker] = time.time() + PREFETCH_FAILURE_BACKOFF
+                self._attempted(ticker, bool(info), pending, touched)
+            else:
+                self.passes += 1
+                if not due:
+                    self._wake.wait(PREFETCH_IDLE_SLEEP)
+                    self._wake.clear()
+    
+    def stats(self):
+        """Queue depth, lag and counters for display"""
+        with self._lock:
+            oldest = self._oldest_fetch
+            return {
+                'running': self._thread.is_alive(),
+                'queue_depth': self._queue_depth,
+                'warm_set': self._warm_size,
+                'warm_capacity': self.warm_capacity,
+                # How far the stalest warm snapshot is past its TTL (0 when everything is fresh)
+                'lag': max(0.0, time.time() - oldest - self.ttl) if oldest else 0.0,
+                'refreshed': self.refreshed,
+                'failures': self.failures,
+                'passes': self.passes,
+                'recent_industries': list(self._recent)
+            }
+
+@st.cache_resource
+def get_prefetch_scheduler():
+    """Single prefetch thread per process, started on first use"""
+    # A scheduler outliving a cleared resource cache is adopted instead of starting a second thread
+    running = _running_prefetch_scheduler()
+    if running is not None:
+        return running
+    tickers_by_industry = {industry: list(stocks) for industry, stocks in INDIAN_STOCKS.items()}
+    return PrefetchScheduler(
+        tickers_by_industry, get_rate_limiter(), get_fundamentals_cache(),
+        on_industry_refreshed=rematerialize_industry
+    ).start()
+
+def rematerialize_industry(industry):
+    """Fold a freshly prefetched industry into the calibration, then recompute its stale stored screens
+
+    Price-history strategies are left to the next live run so the
+    prefetcher never spends request budget on price downloads.
+    """
+    if USE_CALIBRATED_BENCHMARKS:
+        calibrate_industry_benchmarks()
+    materialize_screens([industry], include_technical=False)
+
+def _resolve_benchmarks(industry, cap_type='Large', calibrated=None):
+    """Resolve industry benchmarks from the source tables with cap-size adjustments"""
     # Get industry-specific benchmarks first
     if industry in INDUSTRY_BENCHMARKS:
         base_benchmarks = INDUSTRY_BENCHMARKS[industry].copy()
     else:
-        # Fallback to sector benchmarks
+        # Fallback to sector benchmarks, refined by values calibrated from cached fundamentals
         sector = get_sector_for_industry(industry)
         base_benchmarks = SECTOR_BENCHMARKS.get(sector, SECTOR_BENCHMARKS['Other']).copy()
+        if calibrated and industry in calibrated:
+            base_benchmarks.update(calibrated[industry])
     
     # Apply cap-size multipliers
     if cap_type in CAP_SIZE_MULTIPLIERS:
@@ -10318,6 +2299,152 @@ def get_industry_benchmarks(industry, cap_type='Large'):
     
     return base_benchmarks
 
+# Benchmark metrics and cap buckets held by the precomputed table
+BENCHMARK_METRICS = ('pe', 'pb', 'roe', 'ev_ebitda', 'debt_equity')
+BENCHMARK_CAP_TYPES = tuple(CAP_SIZE_MULTIPLIERS) + ('Unknown',)
+
+class BenchmarkTable:
+    """Immutable (industry, cap_type) → benchmarks table with NumPy arrays for vectorized lookups"""
+    
+    def __init__(self, industries, calibrated=None):
+        # Row 0 is the default fallback shared by every industry not listed explicitly
+        self.industries = (None,) + tuple(industries)
+        self.industry_codes = {industry: code for code, industry in enumerate(self.industries)}
+        self.cap_codes = {cap_type: code for code, cap_type in enumerate(BENCHMARK_CAP_TYPES)}
+        self.unknown_cap_code = self.cap_codes['Unknown']
+        
+        entries = {}
+        arrays = {metric: np.full((len(self.industries), len(BENCHMARK_CAP_TYPES)), np.nan) for metric in BENCHMARK_METRICS}
+        for i, industry in enumerate(self.industries):
+            for j, cap_type in enumerate(BENCHMARK_CAP_TYPES):
+                benchmarks = MappingProxyType(_resolve_benchmarks(industry, cap_type, calibrated))
+                entries[(industry, cap_type)] = benchmarks
+                for metric in BENCHMARK_METRICS:
+                    arrays[metric][i, j] = benchmarks.get(metric, np.nan)
+        
+        for values in arrays.values():
+            values.flags.writeable = False
+        self.entries = MappingProxyType(entries)
+        self.arrays = MappingProxyType(arrays)
+    
+    def get(self, industry, cap_type='Large'):
+        """Benchmarks for one (industry, cap_type) pair"""
+        if industry not in self.industry_codes:
+            industry = None
+        if cap_type not in self.cap_codes:
+            cap_type = 'Unknown'
+        return self.entries[(industry, cap_type)]
+    
+    def codes(self, industries, cap_types):
+        """Row and column indexes into the benchmark arrays"""
+        industry_idx = np.fromiter((self.industry_codes.get(i, 0) for i in industries), dtype=np.intp, count=len(industries))
+        cap_idx = np.fromiter((self.cap_codes.get(c, self.unknown_cap_code) for c in cap_types), dtype=np.intp, count=len(cap_types))
+        return industry_idx, cap_idx
+    
+    def take(self, metric, industries, cap_types):
+        """Per-row values of one benchmark metric"""
+        return self.arrays[metric][self.codes(industries, cap_types)]
+
+def _benchmark_sources_fingerprint():
+    """Hash of every table that feeds the benchmarks"""
+    sources = [INDUSTRY_BENCHMARKS, SECTOR_BENCHMARKS, CAP_SIZE_MULTIPLIERS, INDUSTRY_TO_SECTOR, sorted(INDIAN_STOCKS)]
+    return hashlib.sha1(json.dumps(sources, sort_keys=True).encode()).hexdigest()
+
+# Changes only when a benchmark source table is edited
+BENCHMARK_SOURCES_VERSION = _benchmark_sources_fingerprint()
+
+# Let industries without hand-typed benchmarks use values calibrated from cached fundamentals
+USE_CALIBRATED_BENCHMARKS = True
+
+@st.cache_resource
+def _build_benchmark_table(version, calibration_version):
+    """Resolve every known (industry, cap_type) pair once per source and calibration version"""
+    industries = dict.fromkeys(
+        list(INDIAN_STOCKS) + list(INDUSTRY_BENCHMARKS) + list(INDUSTRY_TO_SECTOR) + list(YF_SECTOR_TO_INDUSTRY.values())
+    )
+    calibrated = get_fundamentals_cache().load_calibration()[0] if calibration_version else None
+    return BenchmarkTable(industries, calibrated)
+
+# Per-run handle on the shared table so hot lookups skip the st.cache_resource call
+_benchmark_table_handles = {}
+
+def get_benchmark_table():
+    """Current precomputed benchmark table"""
+    table = _benchmark_table_handles.get(BENCHMARK_SOURCES_VERSION)
+    if table is None:
+        calibration_version = get_fundamentals_cache().load_calibration()[1] if USE_CALIBRATED_BENCHMARKS else 0.0
+        table = _build_benchmark_table(BENCHMARK_SOURCES_VERSION, calibration_version)
+        _benchmark_table_handles[BENCHMARK_SOURCES_VERSION] = table
+    return table
+
+def get_industry_benchmarks(industry, cap_type='Large'):
+    """Get industry-specific benchmarks with cap-size adjustments"""
+    return get_benchmark_table().get(industry, cap_type)
+
+# Minimum usable snapshots before a calibrated metric replaces the static fallback
+CALIBRATION_MIN_SAMPLES = 5
+
+def _calibration_metrics(info):
+    """Benchmark-unit metrics from one info snapshot, keeping only plausible values"""
+    def number(key):
+        value = info.get(key)
+        return float(value) if isinstance(value, (int, float)) and not isinstance(value, bool) else None
+    
+    metrics = {}
+    pe = number('trailingPE')
+    if pe is not None and 0 < pe < 100:
+        metrics['pe'] = pe
+    pb = number('priceToBook')
+    if pb is not None and 0 < pb < 50:
+        metrics['pb'] = pb
+    roe = number('returnOnEquity')
+    if roe is not None and -1 < roe < 1:
+        metrics['roe'] = roe * 100  # benchmarks hold ROE in percent
+    ev_ebitda = number('enterpriseToEbitda')
+    if ev_ebitda is None:
+        enterprise_value, ebitda = number('enterpriseValue'), number('ebitda')
+        if enterprise_value is not None and ebitda and ebitda > 0:
+            ev_ebitda = enterprise_value / ebitda
+    if ev_ebitda is not None and 0 < ev_ebitda < 50:
+        metrics['ev_ebitda'] = ev_ebitda
+    debt_equity = number('debtToEquity')
+    if debt_equity is not None and 0 <= debt_equity < 1000:
+        metrics['debt_equity'] = debt_equity / 100  # yfinance reports percent, benchmarks a ratio
+    return metrics
+
+def calibrate_industry_benchmarks(min_samples=CALIBRATION_MIN_SAMPLES, full=False):
+    """Recompute median benchmarks for industries with new cached snapshots; returns industries updated"""
+    cache = get_fundamentals_cache()
+    _, last_calibrated = cache.load_calibration()
+    
+    # Only industries with a member fetched since the last run need recomputing
+    changed = cache.tickers_fetched_since(0.0 if full else last_calibrated)
+    industries = {get_category_for_ticker(ticker) for ticker in changed} - {None}
+    if not industries:
+        return []
+    
+    started_at = time.time()
+    results = {}
+    for industry in industries:
+        snapshots = cache.get_many(get_stocks_by_category(industry))
+        samples = {metric: [] for metric in BENCHMARK_METRICS}
+        for info, _ in snapshots.values():
+            for metric, value in _calibration_metrics(info).items():
+                samples[metric].append(value)
+        
+        benchmarks = {
+            metric: round(float(np.median(values)), 2)
+            for metric, values in samples.items() if len(values) >= min_samples
+        }
+        if benchmarks:
+            results[industry] = (benchmarks, len(snapshots))
+    
+    if results:
+        cache.save_calibration(results, started_at)
+        # Pick up the new calibration on the next lookup
+        _benchmark_table_handles.clear()
+    return sorted(results)
+
 def calculate_fair_value(fundamentals, industry, cap_type='Large'):
     """Calculate fair value using enhanced industry-specific benchmarks"""
     if not fundamentals or not fundamentals.get('price'):
@@ -10345,7 +2472,7 @@ def calculate_fair_value(fundamentals, industry, cap_type='Large'):
                     fair_values.append(pb_fair_value)
         
         # For high-growth industries, give more weight to forward-looking metrics
-        if industry in ['Information Technology Services', 'Drug Manufacturers - Major', 'Renewable Energy']:
+        if industry in FORWARD_PE_INDUSTRIES:
             if fundamentals.get('forward_pe') and fundamentals.get('trailing_eps'):
                 if 0 < fundamentals['forward_pe'] < 50:
                     forward_fair_value = fundamentals['trailing_eps'] * fundamentals['forward_pe'] * 1.1
@@ -10395,20 +2522,7 @@ def calculate_valuations(info, industry=None):
         else:
             # Fallback to yfinance sector mapping
             sector = info.get('sector', 'Other')
-            sector_mapping = {
-                'Technology': 'Information Technology Services',
-                'Financial Services': 'Money Center Banks', 
-                'Healthcare': 'Drug Manufacturers - Major',
-                'Industrials': 'Diversified Machinery',
-                'Energy': 'Oil & Gas Operations',
-                'Consumer Cyclical': 'Auto Manufacturers - Major',
-                'Consumer Defensive': 'Food - Major Diversified',
-                'Basic Materials': 'Steel & Iron',
-                'Communication Services': 'Wireless Communications',
-                'Real Estate': 'Real Estate Development',
-                'Utilities': 'Electric Utilities'
-            }
-            mapped_industry = sector_mapping.get(sector, 'Other')
+            mapped_industry = YF_SECTOR_TO_INDUSTRY.get(sector, 'Other')
             benchmarks = get_industry_benchmarks(mapped_industry, cap_type)
         
         industry_pe = benchmarks['pe']
@@ -10469,154 +2583,968 @@ def calculate_valuations(info, industry=None):
     except:
         return None
 
+# ============================================================================
+# VECTORIZED VALUATION ENGINE
+# ============================================================================
+# info keys read by calculate_valuations, with the same .get() defaults
+VALUATION_INFO_DEFAULTS = {
+    'currentPrice': 0, 'regularMarketPrice': 0, 'trailingPE': 0, 'forwardPE': 0,
+    'trailingEps': 0, 'enterpriseValue': 0, 'ebitda': 0, 'marketCap': 0,
+    'sharesOutstanding': 1, 'bookValue': 0, 'totalRevenue': 0, 'totalDebt': 0,
+    'totalCash': 0, 'dividendYield': 0, 'beta': 0, 'returnOnEquity': 0,
+    'profitMargins': 0, 'fiftyTwoWeekHigh': 0, 'fiftyTwoWeekLow': 0
+}
+
+# Industries whose fair value also uses the forward PE estimate
+FORWARD_PE_INDUSTRIES = ['Information Technology Services', 'Drug Manufacturers - Major', 'Renewable Energy']
+
+def _truthy(values):
+    """Vectorized Python truthiness for numeric columns where NaN stands for None"""
+    return ~np.isnan(values) & (values != 0)
+
+def _numeric_column(df, column, default=np.nan):
+    """Float array for a frame column (non-numeric values become NaN)"""
+    if column not in df:
+        return np.full(len(df), default, dtype=float)
+    return pd.to_numeric(df[column], errors='coerce').to_numpy(dtype=float)
+
+def _benchmark_arrays(industries, cap_types):
+    """Per-row pe/pb/ev_ebitda benchmarks gathered from the precomputed table"""
+    table = get_benchmark_table()
+    industry_idx, cap_idx = table.codes(industries, cap_types)
+    return tuple(table.arrays[metric][industry_idx, cap_idx] for metric in ('pe', 'pb', 'ev_ebitda'))
+
+def build_info_frame(infos):
+    """One row per ticker of the info fields calculate_valuations reads (missing keys get its defaults)"""
+    infos = {ticker: info for ticker, info in infos.items() if info}
+    # Column-wise construction is several times faster than a frame of row dicts
+    columns = {key: [info.get(key, default) for info in infos.values()] for key, default in VALUATION_INFO_DEFAULTS.items()}
+    columns['sector'] = [info.get('sector', 'Other') for info in infos.values()]
+    return pd.DataFrame(columns, index=list(infos), columns=list(columns))
+
+def build_fundamentals_frame(fundamentals_by_ticker):
+    """One row per ticker of get_stock_fundamentals output"""
+    rows = {ticker: f for ticker, f in fundamentals_by_ticker.items() if f}
+    return pd.DataFrame.from_dict(rows, orient='index')
+
+def calculate_valuations_batch(info_df, industries=None):
+    """Vectorized calculate_valuations over a build_info_frame frame; rows the scalar version rejects are dropped"""
+    n = len(info_df)
+    if industries is None or isinstance(industries, str):
+        industries = [industries] * n
+    industries = list(industries)
+    
+    current_price = _numeric_column(info_df, 'currentPrice', 0)
+    regular_price = _numeric_column(info_df, 'regularMarketPrice', 0)
+    trailing_pe = _numeric_column(info_df, 'trailingPE', 0)
+    forward_pe = _numeric_column(info_df, 'forwardPE', 0)
+    trailing_eps = _numeric_column(info_df, 'trailingEps', 0)
+    enterprise_value = _numeric_column(info_df, 'enterpriseValue', 0)
+    ebitda = _numeric_column(info_df, 'ebitda', 0)
+    market_cap = _numeric_column(info_df, 'marketCap', 0)
+    shares = _numeric_column(info_df, 'sharesOutstanding', 1)
+    book_value = _numeric_column(info_df, 'bookValue', 0)
+    revenue = _numeric_column(info_df, 'totalRevenue', 0)
+    total_debt = _numeric_column(info_df, 'totalDebt', 0)
+    total_cash = _numeric_column(info_df, 'totalCash', 0)
+    
+    price = np.where(_truthy(current_price), current_price, regular_price)
+    
+    # Determine market cap category
+    cap_type = np.where(market_cap >= 200000000000, 'Large',
+                        np.where(market_cap >= 50000000000, 'Mid', 'Small')).astype(object)
+    
+    # Industry benchmarks, falling back to the yfinance sector mapping
+    sectors = info_df['sector'] if 'sector' in info_df else pd.Series('Other', index=info_df.index)
+    benchmark_industries = [
+        industry if isinstance(industry, str) and industry else YF_SECTOR_TO_INDUSTRY.get(sector, 'Other')
+        for industry, sector in zip(industries, sectors.tolist())
+    ]
+    industry_pe, _, industry_ev_ebitda = _benchmark_arrays(benchmark_industries, cap_type)
+    
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Enhanced PE-based valuation
+        historical_pe = np.where(_truthy(trailing_pe) & (trailing_pe > 0) & (trailing_pe < 100), trailing_pe, industry_pe)
+        pe_weight = np.where(cap_type == 'Large', 0.8, np.where(cap_type == 'Mid', 0.7, 0.6))
+        blended_pe = (industry_pe * pe_weight) + (historical_pe * (1 - pe_weight))
+        fair_value_pe = np.where(_truthy(trailing_eps), trailing_eps * blended_pe, np.nan)
+        upside_pe = np.where(_truthy(fair_value_pe) & _truthy(price), (fair_value_pe - price) / price * 100, np.nan)
+        
+        # Enhanced EV/EBITDA-based valuation
+        positive_ebitda = _truthy(ebitda) & (ebitda > 0)
+        current_ev_ebitda = np.where(positive_ebitda, enterprise_value / ebitda, np.nan)
+        ev_weight = np.where(cap_type == 'Large', 0.7, np.where(cap_type == 'Mid', 0.6, 0.5))
+        blend_ev = _truthy(current_ev_ebitda) & (current_ev_ebitda > 0) & (current_ev_ebitda < 50)
+        target_ev_ebitda = np.where(
+            blend_ev,
+            (industry_ev_ebitda * ev_weight) + (current_ev_ebitda * (1 - ev_weight)),
+            industry_ev_ebitda
+        )
+        
+        net_debt = np.nan_to_num(total_debt) - np.nan_to_num(total_cash)
+        fair_mcap = ebitda * target_ev_ebitda - net_debt
+        fair_value_ev = np.where(positive_ebitda & _truthy(shares), fair_mcap / shares, np.nan)
+        upside_ev = np.where(_truthy(fair_value_ev) & _truthy(price), (fair_value_ev - price) / price * 100, np.nan)
+        
+        # Additional ratios
+        positive_book = _truthy(book_value) & (book_value > 0)
+        pb_ratio = np.where(positive_book, price / book_value, np.nan)
+        ps_ratio = np.where(_truthy(revenue) & (revenue > 0), market_cap / revenue, np.nan)
+    
+    # Rows where the scalar version raises (None compared or divided) and returns None
+    valid = ~np.isnan(market_cap)
+    valid &= ~(positive_ebitda & np.isnan(enterprise_value))
+    valid &= ~(positive_book & np.isnan(price))
+    
+    result = pd.DataFrame({
+        'price': price, 'trailing_pe': trailing_pe, 'forward_pe': forward_pe,
+        'trailing_eps': trailing_eps, 'industry_pe': industry_pe,
+        'fair_value_pe': fair_value_pe, 'upside_pe': upside_pe,
+        'enterprise_value': enterprise_value, 'ebitda': ebitda,
+        'market_cap': market_cap, 'current_ev_ebitda': current_ev_ebitda,
+        'industry_ev_ebitda': industry_ev_ebitda,
+        'fair_value_ev': fair_value_ev, 'upside_ev': upside_ev,
+        'pb_ratio': pb_ratio, 'ps_ratio': ps_ratio,
+        'book_value': book_value, 'revenue': revenue,
+        'net_debt': net_debt,
+        'dividend_yield': _numeric_column(info_df, 'dividendYield', 0),
+        'beta': _numeric_column(info_df, 'beta', 0),
+        'roe': _numeric_column(info_df, 'returnOnEquity', 0),
+        'profit_margin': _numeric_column(info_df, 'profitMargins', 0),
+        '52w_high': _numeric_column(info_df, 'fiftyTwoWeekHigh', 0),
+        '52w_low': _numeric_column(info_df, 'fiftyTwoWeekLow', 0),
+        'cap_type': cap_type
+    }, index=info_df.index)
+    return result[valid]
+
+def revalue_cached_industries(industries=None):
+    """calculate_valuations_batch over every cached member of the given industries (default: all)
+
+    Reads only the disk cache and values each stock against its own
+    industry's current benchmarks, so a benchmark or calibration change
+    can be applied to the whole universe in one pass.
+    """
+    industries = list(industries) if industries is not None else sorted(get_all_categories())
+    industry_of = {}
+    for industry in industries:
+        for ticker in get_stocks_by_category(industry):
+            industry_of.setdefault(ticker, industry)
+    
+    snapshots = get_fundamentals_cache().get_many(list(industry_of))
+    info_df = build_info_frame({ticker: info for ticker, (info, _) in snapshots.items()})
+    valuations = calculate_valuations_batch(info_df, [industry_of[ticker] for ticker in info_df.index])
+    valuations.insert(0, 'industry', [industry_of[ticker] for ticker in valuations.index])
+    return valuations
+
+def calculate_fair_value_batch(fund_df, industries):
+    """Vectorized calculate_fair_value over a build_fundamentals_frame frame (NaN where it returns None)"""
+    n = len(fund_df)
+    if isinstance(industries, str):
+        industries = [industries] * n
+    industries = list(industries)
+    
+    price = _numeric_column(fund_df, 'price')
+    trailing_pe = _numeric_column(fund_df, 'trailing_pe')
+    trailing_eps = _numeric_column(fund_df, 'trailing_eps')
+    forward_pe = _numeric_column(fund_df, 'forward_pe')
+    book_value = _numeric_column(fund_df, 'book_value')
+    cap_types = fund_df['cap_type'].fillna('Large').tolist() if 'cap_type' in fund_df else ['Large'] * n
+    
+    benchmark_pe, benchmark_pb, _ = _benchmark_arrays(industries, cap_types)
+    
+    with np.errstate(invalid='ignore'):
+        # PE-based fair value: 70% industry benchmark, 30% own PE
+        pe_value = trailing_eps * ((0.7 * benchmark_pe) + (0.3 * trailing_pe))
+        has_pe = _truthy(trailing_pe) & _truthy(trailing_eps) & (trailing_pe > 0) & (trailing_pe < 100) & (pe_value > 0)
+        
+        # PB-based fair value
+        pb_value = book_value * benchmark_pb
+        has_pb = _truthy(book_value) & _truthy(benchmark_pb) & (book_value > 0) & (pb_value > 0)
+        
+        # Forward PE for high-growth industries
+        forward_value = trailing_eps * forward_pe * 1.1
+        has_forward = (np.isin(np.array(industries, dtype=object), FORWARD_PE_INDUSTRIES)
+                       & _truthy(forward_pe) & _truthy(trailing_eps)
+                       & (forward_pe > 0) & (forward_pe < 50) & (forward_value > 0))
+    
+    # Combine like the scalar version: first two estimates weighted 70/30, three averaged
+    count = has_pe.astype(int) + has_pb + has_forward
+    first = np.where(has_pe, pe_value, np.where(has_pb, pb_value, forward_value))
+    second = np.where(has_pe & has_pb, pb_value, forward_value)
+    
+    fair_value = np.select(
+        [count == 1, count == 2, count == 3],
+        [first, first * 0.7 + second * 0.3, (pe_value + pb_value + forward_value) / 3],
+        default=np.nan
+    )
+    fair_value = np.where(_truthy(price), fair_value, np.nan)
+    return pd.Series(fair_value, index=fund_df.index)
+
+# ============================================================================
+# SCREEN DSL
+# ============================================================================
+# Screens are boolean expressions over per-stock fields and the stock's own
+# industry benchmarks, e.g. "upside >= 15 and pct_from_high >= -5 and roe > bench.roe / 100".
+# They compile to functions that evaluate over whole columns at once.
+# Logic is three-valued: a comparison with a missing (NaN) operand is unknown,
+# not, and/or follow Kleene logic, and only rows that are definitely true pass,
+# so "not trailing_pe > 30" and "trailing_pe != 10" both fail rows without a PE.
+
+# Fundamentals columns available to screens; a missing value is NaN and fails any comparison
+SCREEN_FIELDS = (
+    'price', 'market_cap', 'trailing_pe', 'forward_pe', 'pb_ratio', 'roe', 'dividend_yield', 'beta',
+    'profit_margin', 'debt_to_equity', 'volume', 'trailing_eps', 'enterprise_value', 'ebitda',
+    'book_value', 'revenue', '52w_high', '52w_low', 'pct_from_high', 'pct_from_low'
+)
+
+# Values used when a field is missing, matching the original per-stock .get() defaults
+SCREEN_FIELD_DEFAULTS = {'pct_from_high': -100}
+
+# Benchmark defaults where an industry's table has no entry for the metric
+SCREEN_BENCHMARK_DEFAULTS = {'roe': 15, 'debt_equity': 1.0}
+
+# Derived values every screen can use besides SCREEN_FIELDS
+SCREEN_DERIVED = ('fair_value', 'upside')
+
+_SCREEN_COMPARISONS = {
+    ast.Lt: operator.lt, ast.LtE: operator.le, ast.Gt: operator.gt,
+    ast.GtE: operator.ge, ast.Eq: operator.eq, ast.NotEq: operator.ne
+}
+_SCREEN_ARITHMETIC = {ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul, ast.Div: operator.truediv}
+
+def _is_boolean_screen_node(node):
+    """Whether a node yields a boolean mask (comparison, or and/or/not over such nodes)"""
+    if isinstance(node, ast.Compare):
+        return True
+    if isinstance(node, ast.BoolOp):
+        return all(_is_boolean_screen_node(value) for value in node.values)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        return _is_boolean_screen_node(node.operand)
+    return False
+
+def _compile_screen_node(node):
+    """Closure evaluating one expression node against a screen namespace
+
+    Boolean nodes yield (definitely true, definitely false) masks; rows in
+    neither are unknown because a compared value is missing. Other nodes
+    yield values.
+    """
+    if isinstance(node, ast.BoolOp) or (isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not)):
+        # and/or/not over numbers would treat NaN (missing data) as True
+        if not _is_boolean_screen_node(node):
+            raise ValueError("Screen and/or/not operands must be comparisons")
+    
+    if isinstance(node, ast.BoolOp):
+        operands = [_compile_screen_node(value) for value in node.values]
+        # and: true when all are true, false when any is false; or: the reverse
+        if isinstance(node.op, ast.And):
+            combine_true, combine_false = np.logical_and, np.logical_or
+        else:
+            combine_true, combine_false = np.logical_or, np.logical_and
+        
+        def combine(ns):
+            results = [operand(ns) for operand in operands]
+            return (functools.reduce(combine_true, (true for true, _ in results)),
+                    functools.reduce(combine_false, (false for _, false in results)))
+        return combine
+    
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+        operand = _compile_screen_node(node.operand)
+        # Unknown stays unknown
+        return lambda ns: operand(ns)[::-1]
+    
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        operand = _compile_screen_node(node.operand)
+        return lambda ns: -operand(ns)
+    
+    if isinstance(node, ast.Compare):
+        # Chained comparisons (a < b < c) mean (a < b) and (b < c)
+        terms = [_compile_screen_node(node.left)] + [_compile_screen_node(c) for c in node.comparators]
+        ops = []
+        for op in node.ops:
+            if type(op) not in _SCREEN_COMPARISONS:
+                raise ValueError(f"Unsupported comparison in screen: {type(op).__name__}")
+            ops.append(_SCREEN_COMPARISONS[type(op)])
+        
+        def compare(ns):
+            values = [term(ns) for term in terms]
+            defined = functools.reduce(np.logical_and, (~np.isnan(value) for value in values))
+            mask = True
+            for op, left, right in zip(ops, values, values[1:]):
+                mask = np.logical_and(mask, op(left, right))
+            return mask & defined, ~mask & defined
+        return compare
+    
+    if isinstance(node, ast.BinOp):
+        if type(node.op) not in _SCREEN_ARITHMETIC:
+            raise ValueError(f"Unsupported operator in screen: {type(node.op).__name__}")
+        op = _SCREEN_ARITHMETIC[type(node.op)]
+        left, right = _compile_screen_node(node.left), _compile_screen_node(node.right)
+        return lambda ns: op(left(ns), right(ns))
+    
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and not isinstance(node.value, bool):
+        value = float(node.value)
+        return lambda ns: value
+    
+    if isinstance(node, ast.Name):
+        if node.id not in SCREEN_FIELDS and node.id not in SCREEN_DERIVED:
+            raise ValueError(f"Unknown screen field: {node.id}")
+        name = node.id
+        return lambda ns: ns[name]
+    
+    if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == 'bench':
+        if node.attr not in BENCHMARK_METRICS:
+            raise ValueError(f"Unknown benchmark metric: bench.{node.attr}")
+        key = f"bench.{node.attr}"
+        return lambda ns: ns[key]
+    
+    raise ValueError(f"Unsupported syntax in screen: {ast.dump(node)[:60]}")
+
+# Compiled screens by expression text
+_compiled_screens = {}
+
+def compile_screen(expression):
+    """Compile a screen expression to a function mapping a screen namespace to a boolean mask"""
+    compiled = _compiled_screens.get(expression)
+    if compiled is None:
+        try:
+            tree = ast.parse(expression.strip(), mode='eval')
+        except SyntaxError as e:
+            raise ValueError(f"Invalid screen expression: {e.msg}") from None
+        # A bare number or arithmetic result would pass every row where it is non-zero or NaN
+        if not _is_boolean_screen_node(tree.body):
+            raise ValueError("Screen expression must be a comparison or a combination of comparisons")
+        evaluate = _compile_screen_node(tree.body)
+        
+        def compiled(ns):
+            is_true, _ = evaluate(ns)
+            return np.broadcast_to(np.asarray(is_true, dtype=bool), (ns['size'],))
+        _compiled_screens[expression] = compiled
+    return compiled
+
+def build_screen_namespace(fund_df, industries):
+    """Column arrays a compiled screen evaluates over: fields, derived values and per-row benchmarks"""
+    industries = list(industries)
+    cap_types = fund_df['cap_type'].fillna('Unknown').tolist() if 'cap_type' in fund_df else ['Unknown'] * len(fund_df)
+    table = get_benchmark_table()
+    industry_idx, cap_idx = table.codes(industries, cap_types)
+    
+    ns = {'size': len(fund_df)}
+    for field in SCREEN_FIELDS:
+        values = _numeric_column(fund_df, field)
+        if field in SCREEN_FIELD_DEFAULTS:
+            values = np.nan_to_num(values, nan=SCREEN_FIELD_DEFAULTS[field])
+        ns[field] = values
+    for metric in BENCHMARK_METRICS:
+        values = table.arrays[metric][industry_idx, cap_idx]
+        if metric in SCREEN_BENCHMARK_DEFAULTS:
+            values = np.nan_to_num(values, nan=SCREEN_BENCHMARK_DEFAULTS[metric])
+        ns[f"bench.{metric}"] = values
+    
+    ns['fair_value'] = calculate_fair_value_batch(fund_df, industries).to_numpy()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ns['upside'] = (ns['fair_value'] - ns['price']) / ns['price'] * 100
+    return ns
+
+# ============================================================================
+# STRATEGY REGISTRY
+# ============================================================================
+def confirm_supertrend_candidates(candidates, period="6mo", min_history=50):
+    """Keep candidates whose batched price history shows a confirmed SuperTrend uptrend"""
+    if candidates.empty:
+        return candidates
+    price_panel = fetch_price_history_batch(candidates['Ticker'].tolist(), period=period)
+    signals = compute_technical_signals_panel(price_panel, min_history=min_history).reindex(candidates['Ticker'])
+    # SuperTrend bullish (1) and additional confirmations; not in deep correction
+    confirmed = (
+        (signals['supertrend_signal'] == 1) &
+        (signals['above_sma20'] == True) &
+        (signals['price_vs_52w_high'].fillna(0) > 0.7)
+    )
+    return candidates[confirmed.to_numpy()]
+
+# Result columns the screener can rank by (highest first)
+SCREENER_RANK_COLUMNS = ['Upside %', 'ROE %', 'Dividend Yield %', 'From 52W High %', 'Market Cap']
+
+# Strategy key → label, screen expression, default ranking column and data requirements.
+# A strategy with a confirm function also needs `history` of daily prices (at least
+# `min_history` bars) for the survivors of its fundamental screen; the rest are fundamentals-only.
+STRATEGY_REGISTRY = {}
+
+def register_strategy(key, label, screen, rank_by='Upside %', confirm=None, history=None, min_history=0, sidebar=True):
+    """Add a screening strategy to the registry"""
+    compile_screen(screen)  # Reject invalid screens at registration time
+    if rank_by not in SCREENER_RANK_COLUMNS:
+        raise ValueError(f"Unknown ranking column: {rank_by}")
+    if confirm is not None and not history:
+        raise ValueError(f"Strategy {key} confirms on price history but declares no history period")
+    STRATEGY_REGISTRY[key] = MappingProxyType({
+        'key': key, 'label': label, 'screen': screen, 'rank_by': rank_by,
+        'confirm': confirm, 'history': history if confirm else None,
+        'min_history': min_history if confirm else 0, 'sidebar': sidebar
+    })
+
+def get_strategy(key):
+    """Registered strategy by key, or None"""
+    return STRATEGY_REGISTRY.get(key)
+
+def needs_price_history(strategy):
+    """Whether a strategy's survivors need a price-history download"""
+    return strategy is not None and strategy['confirm'] is not None
+
+def confirm_with_history(strategy, candidates):
+    """Run a strategy's technical confirmation over its fundamental survivors"""
+    if not needs_price_history(strategy) or candidates.empty:
+        return candidates
+    return strategy['confirm'](candidates, period=strategy['history'], min_history=strategy['min_history'])
+
+register_strategy('undervalued', "🎯 Undervalued Stocks (15%+ upside)", "upside >= 15")
+register_strategy('undervalued_near_high', "🚀 Undervalued Near 52W High", "upside >= 15 and pct_from_high >= -5")
+# Not offered in the sidebar: its SuperTrend signal is always -1 (see _supertrend_recursion), so it never matches
+register_strategy(
+    'undervalued_supertrend', "📈 Undervalued + SuperTrend Bullish", "upside >= 15",
+    confirm=confirm_supertrend_candidates, history="6mo", min_history=50, sidebar=False
+)
+register_strategy(
+    'undervalued_rsi_macd', "📊 Undervalued + Price Momentum",
+    "upside >= 15 and pct_from_high >= -30 and volume > 0", sidebar=False
+)
+register_strategy(
+    'momentum', "⚡ Momentum Near 52W High", "pct_from_high >= -10 and trailing_pe <= bench.pe * 1.5",
+    rank_by='From 52W High %', sidebar=False
+)
+register_strategy(
+    'quality', "💎 Quality at a Reasonable Price",
+    "roe > bench.roe / 100 and trailing_pe <= bench.pe * 1.2 and upside >= 5 and debt_to_equity <= bench.debt_equity",
+    rank_by='ROE %', sidebar=False
+)
+
 # ============================================================================
 # SCREENING LOGIC
 # ============================================================================
-def run_industry_screener(industry, strategy_type="undervalued", max_results=50):
-    """Run comprehensive screening for a specific industry using enhanced benchmarks"""
+class ScreenerProgress:
+    """Progress reporting for a screener run: Streamlit widgets in the app, optional log lines headless"""
+    
+    def __init__(self, stream=None, every=250):
+        self.stream = stream
+        self.every = every
+        self.rate_limiter = get_rate_limiter()
+        self.progress_bar = st.progress(0) if IN_STREAMLIT else None
+        self.status_text = st.empty() if IN_STREAMLIT else None
+    
+    def fetched(self, ticker, completed, total):
+        """One more ticker's fundamentals have arrived"""
+        message = f"Fetched {ticker} ({completed:,}/{total:,}) • rate limit wait {self.rate_limiter.current_wait():.1f}s"
+        if self.progress_bar is not None:
+            self.progress_bar.progress(completed / total)
+            self.status_text.text(message)
+        if self.stream is not None and (completed % self.every == 0 or completed == total):
+            print(message, file=self.stream, flush=True)
+    
+    def status(self, message):
+        """Show the current phase"""
+        if self.status_text is not None:
+            self.status_text.text(message)
+        if self.stream is not None:
+            print(message, file=self.stream, flush=True)
+    
+    def close(self):
+        """Clear the progress widgets"""
+        if self.progress_bar is not None:
+            self.progress_bar.empty()
+            self.status_text.empty()
+
+# Screening phases, timed separately: fetch fundamentals, value and filter, batched technicals for survivors
+SCREENER_PHASES = ('fundamentals', 'filter', 'technicals')
+
+@contextmanager
+def _timed_phase(timings, phase):
+    """Add the wall time of the enclosed block to timings[phase]"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[phase] = timings.get(phase, 0.0) + time.perf_counter() - start
+
+def format_phase_timings(timings):
+    """One-line summary of per-phase screening time"""
+    return " • ".join(f"{phase} {timings.get(phase, 0.0):.2f}s" for phase in SCREENER_PHASES)
+
+# Minimum seconds between live result-table refreshes while a screen runs
+SCREENER_LIVE_REFRESH = 0.5
+
+def _rank_score(result, rank_by):
+    """Sort key for a result row; missing values rank last"""
+    score = result.get(rank_by)
+    if score is None or pd.isna(score):
+        return float('-inf')
+    return score
+
+def _push_top_k(heap, k, result, rank_by, seq):
+    """Keep the k best results seen so far in a min-heap; earlier rows win ties"""
+    entry = (_rank_score(result, rank_by), -seq, result)
+    if len(heap) < k:
+        heapq.heappush(heap, entry)
+    elif entry[:2] > heap[0][:2]:
+        heapq.heapreplace(heap, entry)
+
+def _top_k_results(heap):
+    """Heap contents as result rows, best first"""
+    return [entry[2] for entry in sorted(heap, key=lambda entry: entry[:2], reverse=True)]
+
+def _screen_validity(ns):
+    """Rows with a usable valuation: a price, a positive fair value and a plausible upside"""
+    with np.errstate(invalid='ignore'):
+        # Remove outliers: upside > 350% is most likely a data error
+        return _truthy(ns['price']) & (ns['fair_value'] > 0) & (ns['upside'] <= 350)
+
+def _screen_result_frame(fund_df, ns, mask, industries, names):
+    """Result table rows for the masked stocks of a screen namespace"""
+    rows = fund_df[mask]
+    roe, dividend_yield = ns['roe'][mask], ns['dividend_yield'][mask]
+    return pd.DataFrame({
+        'Ticker': rows.index,
+        'Name': [names.get(ticker) for ticker in rows.index],
+        'Industry': np.array(industries, dtype=object)[mask],
+        'Price': ns['price'][mask],
+        'Fair Value': ns['fair_value'][mask],
+        'Upside %': ns['upside'][mask],
+        'PE Ratio': ns['trailing_pe'][mask],
+        'PB Ratio': ns['pb_ratio'][mask],
+        'ROE %': np.where(_truthy(roe), roe * 100, np.nan),
+        'Market Cap': ns['market_cap'][mask],
+        'Cap Type': rows['cap_type'].to_numpy(),
+        'From 52W High %': _numeric_column(rows, 'pct_from_high'),
+        'From 52W Low %': ns['pct_from_low'][mask],
+        'Beta': ns['beta'][mask],
+        'Dividend Yield %': np.where(_truthy(dividend_yield), dividend_yield * 100, np.nan),
+        'Industry PE Benchmark': ns['bench.pe'][mask],
+        'Industry EV/EBITDA Benchmark': ns['bench.ev_ebitda'][mask]
+    })
+
+def screen_fundamentals_frame(fund_df, industries, names, strategy_type="undervalued", screen=None):
+    """Evaluate a strategy (or a custom screen expression) over a build_fundamentals_frame frame in one pass
+
+    Returns the result rows passing the fundamental criteria and whether they
+    still need SuperTrend confirmation.
+    """
+    if fund_df.empty:
+        return pd.DataFrame(), False
+    strategy = get_strategy(strategy_type)
+    if screen is None and strategy is None:
+        return pd.DataFrame(), False
+    
+    industries = list(industries)
+    ns = build_screen_namespace(fund_df, industries)
+    with np.errstate(invalid='ignore'):
+        mask = _screen_validity(ns) & compile_screen(screen or strategy['screen'])(ns)
+    
+    results = _screen_result_frame(fund_df, ns, mask, industries, names)
+    return results, screen is None and needs_price_history(strategy)
+
+def screen_strategies_frame(fund_df, industries, names, strategy_keys):
+    """Evaluate several strategies over one shared namespace; one boolean column per strategy
+
+    Fundamentals, fair values and benchmarks are computed once and rows that
+    pass no strategy are dropped. Columns of price-history strategies hold
+    fundamental candidates until confirm_strategy_columns runs.
+    """
+    strategies = [get_strategy(key) for key in strategy_keys if get_strategy(key) is not None]
+    if fund_df.empty or not strategies:
+        return pd.DataFrame()
+    
+    industries = list(industries)
+    ns = build_screen_namespace(fund_df, industries)
+    valid = _screen_validity(ns)
+    with np.errstate(invalid='ignore'):
+        masks = {strategy['key']: valid & compile_screen(strategy['screen'])(ns) for strategy in strategies}
+    
+    any_pass = functools.reduce(np.logical_or, masks.values())
+    results = _screen_result_frame(fund_df, ns, any_pass, industries, names)
+    for key, mask in masks.items():
+        results[key] = mask[any_pass]
+    return results
+
+def confirm_strategy_columns(results, strategy_keys):
+    """Confirm price-history strategy columns for their own candidates; drop rows left passing nothing"""
+    strategy_columns = [key for key in strategy_keys if key in results]
+    if results.empty or not strategy_columns:
+        return results
+    
+    for key in strategy_columns:
+        strategy = get_strategy(key)
+        if needs_price_history(strategy) and results[key].any():
+            confirmed = set(confirm_with_history(strategy, results[results[key]])['Ticker'])
+            results[key] = results['Ticker'].isin(confirmed).to_numpy()
+    
+    return results[results[strategy_columns].any(axis=1)].reset_index(drop=True)
+
+def _screen_value(value, default=np.nan):
+    """Float for a scalar fundamentals field as the screen namespace sees it (missing → NaN or default)"""
+    if isinstance(value, (int, float, np.number)) and not isinstance(value, bool) and not pd.isna(value):
+        return float(value)
+    return default
+
+def screen_stock(ticker, name, fundamentals, industry, strategy_type="undervalued"):
+    """Apply a strategy to one stock; returns (result, needs_technical) or None if it fails"""
+    strategy = get_strategy(strategy_type)
+    if not fundamentals or not fundamentals['price'] or strategy is None:
+        return None
+    
+    # Fair value using industry-specific benchmarks
+    cap_type = fundamentals.get('cap_type', 'Large')
+    fair_value = calculate_fair_value(fundamentals, industry, cap_type)
+    if fair_value is None or pd.isna(fair_value) or fair_value <= 0:
+        return None
+    
+    upside = ((fair_value - fundamentals['price']) / fundamentals['price']) * 100
     
+    # Remove outliers: upside > 350% is most likely a data error
+    if upside > 350:
+        return None
+    
+    # Single-row screen namespace of plain floats; the compiled screen broadcasts over scalars
+    benchmarks = get_industry_benchmarks(industry, cap_type)
+    ns = {'size': 1, 'fair_value': float(fair_value), 'upside': float(upside)}
+    for field in SCREEN_FIELDS:
+        ns[field] = _screen_value(fundamentals.get(field), SCREEN_FIELD_DEFAULTS.get(field, np.nan))
+    for metric in BENCHMARK_METRICS:
+        ns[f"bench.{metric}"] = _screen_value(benchmarks.get(metric), SCREEN_BENCHMARK_DEFAULTS.get(metric, np.nan))
+    
+    if not compile_screen(strategy['screen'])(ns)[0]:
+        return None
+    
+    result = {
+        'Ticker': ticker,
+        'Name': name,
+        'Industry': industry,
+        'Price': fundamentals['price'],
+        'Fair Value': fair_value,
+        'Upside %': upside,
+        'PE Ratio': fundamentals['trailing_pe'],
+        'PB Ratio': fundamentals['pb_ratio'],
+        'ROE %': fundamentals['roe'] * 100 if fundamentals['roe'] else None,
+        'Market Cap': fundamentals['market_cap'],
+        'Cap Type': fundamentals['cap_type'],
+        'From 52W High %': fundamentals.get('pct_from_high'),
+        'From 52W Low %': fundamentals.get('pct_from_low'),
+        'Beta': fundamentals['beta'],
+        'Dividend Yield %': fundamentals['dividend_yield'] * 100 if fundamentals['dividend_yield'] else None,
+        'Industry PE Benchmark': benchmarks['pe'],
+        'Industry EV/EBITDA Benchmark': benchmarks['ev_ebitda']
+    }
+    return result, needs_price_history(strategy)
+
+def iter_industry_screener(industry, strategy_type="undervalued", max_workers=SCREENER_MAX_WORKERS, on_progress=None,
+                           timings=None):
+    """Yield (seq, result, needs_technical) for each passing stock as soon as its fundamentals arrive
+
+    seq is the stock's position in the industry, so callers can order
+    results deterministically even though they arrive in completion order.
+    Time spent waiting on fetches and filtering is added to timings.
+    """
     stocks = get_stocks_by_category(industry)
-    if not stocks:
+    positions = {ticker: seq for seq, ticker in enumerate(stocks)}
+    timings = {} if timings is None else timings
+    
+    fetched = iter_fundamentals_concurrently(list(stocks), max_workers=max_workers, on_progress=on_progress)
+    while True:
+        with _timed_phase(timings, 'fundamentals'):
+            item = next(fetched, None)
+        if item is None:
+            break
+        
+        ticker, fundamentals = item
+        with _timed_phase(timings, 'filter'):
+            outcome = screen_stock(ticker, stocks[ticker], fundamentals, industry, strategy_type)
+        if outcome:
+            yield positions[ticker], outcome[0], outcome[1]
+
+def run_industry_screener(industry, strategy_type="undervalued", max_results=50, max_workers=SCREENER_MAX_WORKERS,
+                          rank_by=None, on_results=None, progress=None, on_complete=None):
+    """Run comprehensive screening for a specific industry; returns the top max_results by rank_by
+
+    rank_by defaults to the strategy's registered ranking column. on_results, if given, receives the current top results (best first)
+    each time a new passing stock arrives. on_complete, if given, receives
+    every passing result in industry order once the run finishes. Per-phase
+    wall times are left in the returned frame's attrs['phase_timings'].
+    """
+    stocks = get_stocks_by_category(industry)
+    strategy = get_strategy(strategy_type)
+    if not stocks or strategy is None:
         return pd.DataFrame()
+    rank_by = rank_by or strategy['rank_by']
     
-    results = []
+    # Bounded min-heap of the best results so far: every stock is examined, memory stays O(max_results)
+    top_results = []
     
     # Progress tracking
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    total_stocks = len(stocks)
-    
-    for i, (ticker, name) in enumerate(stocks.items()):
-        # Update progress
-        progress = (i + 1) / total_stocks
-        progress_bar.progress(progress)
-        status_text.text(f"Processing {ticker} ({i + 1}/{total_stocks})")
-        
-        # Get fundamentals
-        fundamentals = get_stock_fundamentals(ticker)
-        if not fundamentals or not fundamentals['price']:
+    progress = progress or ScreenerProgress()
+    timings = dict.fromkeys(SCREENER_PHASES, 0.0)
+    
+    # Candidates of price-history strategies wait for one batched technical pass over the survivors
+    pending_technical = []
+    # Every passing row is kept only for a caller that asked for them; otherwise memory stays O(max_results)
+    passed = [] if on_complete else None
+    
+    for seq, result, needs_technical in iter_industry_screener(industry, strategy_type, max_workers, progress.fetched, timings):
+        if needs_technical:
+            pending_technical.append((seq, result))
             continue
         
-        # Calculate fair value using industry-specific benchmarks
-        fair_value = calculate_fair_value(fundamentals, industry, fundamentals.get('cap_type', 'Large'))
-        if not fair_value or fair_value <= 0:
-            continue
+        if passed is not None:
+            passed.append((seq, result))
+        _push_top_k(top_results, max_results, result, rank_by, seq)
+        if on_results:
+            on_results(_top_k_results(top_results))
+    
+    # Confirm technical candidates from one grouped price-history download
+    if pending_technical:
+        progress.status(f"Analyzing technical signals for {len(pending_technical)} candidates...")
+        with _timed_phase(timings, 'technicals'):
+            candidates = pd.DataFrame([result for _, result in pending_technical])
+            confirmed = set(confirm_with_history(strategy, candidates)['Ticker'])
         
-        # Calculate upside
-        upside = ((fair_value - fundamentals['price']) / fundamentals['price']) * 100
+        for seq, result in pending_technical:
+            if result['Ticker'] in confirmed:
+                if passed is not None:
+                    passed.append((seq, result))
+                _push_top_k(top_results, max_results, result, rank_by, seq)
         
-        # Remove outliers: Skip stocks with upside > 500% (likely data errors)
-        if upside > 350:
+        if on_results and top_results:
+            on_results(_top_k_results(top_results))
+    
+    # Clear progress indicators
+    progress.close()
+    
+    if on_complete:
+        on_complete([result for _, result in sorted(passed, key=lambda item: item[0])])
+    
+    results_df = pd.DataFrame(_top_k_results(top_results))
+    results_df.attrs['phase_timings'] = timings
+    return results_df
+
+# Pseudo-industry that screens the whole universe, each stock against its own industry benchmarks
+ALL_INDUSTRIES = "All Industries"
+
+def top_k_frame(results, k, rank_by='Upside %'):
+    """Best k rows of a result frame by rank_by; missing scores rank last, earlier rows win ties"""
+    scores = pd.to_numeric(results[rank_by], errors='coerce').fillna(float('-inf'))
+    order = np.argsort(-scores.to_numpy(), kind='stable')[:k]
+    return results.iloc[order].reset_index(drop=True)
+
+def _screen_universe(industries=None):
+    """({ticker: name}, {ticker: industry}) for a set of industries, or the whole universe for None/ALL_INDUSTRIES"""
+    if isinstance(industries, str):
+        industries = None if industries == ALL_INDUSTRIES else [industries]
+    if industries is None:
+        by_ticker = get_stock_catalog()['by_ticker']
+        return (
+            {ticker: name for ticker, (name, _) in by_ticker.items()},
+            {ticker: category for ticker, (_, category) in by_ticker.items()}
+        )
+    
+    stocks, industry_of = {}, {}
+    for industry in industries:
+        for ticker, name in get_stocks_by_category(industry).items():
+            if ticker not in stocks:
+                stocks[ticker] = name
+                industry_of[ticker] = industry
+    return stocks, industry_of
+
+def run_universe_screener(strategy_type="undervalued", max_results=50, max_workers=SCREENER_MAX_WORKERS,
+                          rank_by=None, industries=None, progress=None):
+    """Screen every stock in the universe (or in the given industries) against its own industry benchmarks
+
+    Returns the top max_results. Runs as three phases (bulk fundamentals,
+    vectorized filter, batched technicals for survivors) whose wall times
+    are left in the returned frame's attrs['phase_timings'].
+    """
+    strategy = get_strategy(strategy_type)
+    if strategy is None:
+        return pd.DataFrame()
+    rank_by = rank_by or strategy['rank_by']
+    
+    stocks, industry_of = _screen_universe(industries)
+    progress = progress or ScreenerProgress()
+    timings = dict.fromkeys(SCREENER_PHASES, 0.0)
+    
+    with _timed_phase(timings, 'fundamentals'):
+        fundamentals_by_ticker = fetch_fundamentals_bulk(list(stocks), max_workers=max_workers, on_progress=progress.fetched)
+    
+    progress.status(f"Screening {len(fundamentals_by_ticker):,} stocks...")
+    with _timed_phase(timings, 'filter'):
+        fundamentals_df = build_fundamentals_frame(fundamentals_by_ticker)
+        industry_list = [industry_of[ticker] for ticker in fundamentals_df.index]
+        results, needs_technical = screen_fundamentals_frame(fundamentals_df, industry_list, stocks, strategy_type)
+    
+    if needs_technical and not results.empty:
+        progress.status(f"Analyzing technical signals for {len(results):,} candidates...")
+        with _timed_phase(timings, 'technicals'):
+            results = confirm_with_history(strategy, results)
+    
+    progress.close()
+    
+    results_df = top_k_frame(results, max_results, rank_by) if not results.empty else pd.DataFrame()
+    results_df.attrs['phase_timings'] = timings
+    results_df.attrs['screened'] = len(fundamentals_df)
+    return results_df
+
+def run_multi_strategy_screener(industries, strategy_keys, max_results=50, max_workers=SCREENER_MAX_WORKERS,
+                                rank_by='Upside %', progress=None):
+    """Screen an industry, a list of industries or ALL_INDUSTRIES with several strategies in one pass
+
+    The result has one boolean column per strategy.
+    """
+    stocks, industry_of = _screen_universe(industries)
+    if not stocks:
+        return pd.DataFrame()
+    
+    progress = progress or ScreenerProgress()
+    timings = dict.fromkeys(SCREENER_PHASES, 0.0)
+    
+    with _timed_phase(timings, 'fundamentals'):
+        fundamentals_by_ticker = fetch_fundamentals_bulk(list(stocks), max_workers=max_workers, on_progress=progress.fetched)
+    
+    progress.status(f"Screening {len(fundamentals_by_ticker):,} stocks with {len(strategy_keys)} strategies...")
+    with _timed_phase(timings, 'filter'):
+        fundamentals_df = build_fundamentals_frame(fundamentals_by_ticker)
+        industry_list = [industry_of[ticker] for ticker in fundamentals_df.index]
+        results = screen_strategies_frame(fundamentals_df, industry_list, stocks, strategy_keys)
+    
+    if any(needs_price_history(get_strategy(key)) for key in strategy_keys) and not results.empty:
+        progress.status("Analyzing technical signals for price-history strategies...")
+        with _timed_phase(timings, 'technicals'):
+            results = confirm_strategy_columns(results, strategy_keys)
+    
+    progress.close()
+    
+    results_df = top_k_frame(results, max_results, rank_by) if not results.empty else pd.DataFrame()
+    results_df.attrs['phase_timings'] = timings
+    results_df.attrs['screened'] = len(fundamentals_df)
+    return results_df
+
+def search_stocks_by_name(query, max_results=50):
+    """Search stocks by company name across all industries"""
+    return get_search_index().search(query, limit=max_results)
+
+# ============================================================================
+# MATERIALIZED SCREEN RESULTS
+# ============================================================================
+# Stored results older than this are recomputed rather than served
+SCREEN_RESULTS_MAX_AGE = 24 * 3600
+
+def screen_inputs(industry, snapshots=None):
+    """(digest of the members' screening fundamentals, oldest snapshot time) for an industry's cached members
+
+    The digest covers the data itself, so refetches that return the same
+    fundamentals keep stored screens valid. The as-of time skips members
+    with an active fetch failure: their snapshot cannot be refreshed until
+    the failure expires and would otherwise pin the screen as too old.
+    """
+    cache = get_fundamentals_cache()
+    stocks = get_stocks_by_category(industry)
+    snapshots = cache.get_many(stocks) if snapshots is None else snapshots
+    failures = cache.active_failures()
+    
+    digest = hashlib.sha1()
+    oldest = None
+    for ticker in stocks:
+        if ticker not in snapshots:
+            continue
+        info, fetched_at = snapshots[ticker]
+        digest.update(json.dumps(fundamentals_from_info(ticker, info), sort_keys=True, default=str).encode())
+        if ticker not in failures:
+            oldest = fetched_at if oldest is None else min(oldest, fetched_at)
+    return digest.hexdigest(), oldest
+
+def screen_data_version(industry, strategy_key, inputs=None):
+    """Version of the inputs behind an (industry, strategy) screen, and the oldest member snapshot time
+
+    Changes when any member's screening fundamentals change, the industry's
+    effective benchmarks change (source tables or calibration), the
+    strategy is redefined, or (for price-history strategies) the day rolls over.
+    """
+    strategy = get_strategy(strategy_key)
+    data_digest, oldest = inputs or screen_inputs(industry)
+    table = get_benchmark_table()
+    benchmarks = [dict(table.get(industry, cap_type)) for cap_type in BENCHMARK_CAP_TYPES]
+    
+    parts = [industry, data_digest, benchmarks, strategy['screen']]
+    if needs_price_history(strategy):
+        parts += [strategy['history'], strategy['min_history'], datetime.now().strftime('%Y-%m-%d')]
+    return hashlib.sha1(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest(), oldest
+
+def materialize_screens(industries=None, strategy_keys=None, force=False, include_technical=True):
+    """Precompute every (industry, strategy) screen from cached fundamentals; returns pairs recomputed
+
+    Uses only the disk cache (no fundamentals fetches). Pairs whose stored
+    version still matches are skipped unless force is set.
+    """
+    cache = get_fundamentals_cache()
+    industries = list(industries) if industries is not None else sorted(get_all_categories())
+    strategy_keys = [
+        key for key in (strategy_keys or list(STRATEGY_REGISTRY))
+        if get_strategy(key) and (include_technical or not needs_price_history(get_strategy(key)))
+    ]
+    recomputed = []
+    
+    for industry in industries:
+        stocks = get_stocks_by_category(industry)
+        # One read of the industry's snapshots feeds both the versions and the screens
+        snapshots = cache.get_many(stocks)
+        if not snapshots:
             continue
         
-        # Get industry benchmarks for additional filtering
-        benchmarks = get_industry_benchmarks(industry, fundamentals.get('cap_type', 'Large'))
-        
-        # Apply strategy filters with enhanced criteria
-        passes_filter = False
-        
-        if strategy_type == "undervalued":
-            # Basic undervalued filter
-            if upside >= 15:  # At least 15% upside
-                passes_filter = True
-        
-        elif strategy_type == "undervalued_near_high":
-            # Undervalued stocks trading near 52-week highs (strong momentum + value)
-            if upside >= 15:  # Must be undervalued
-                pct_from_high = fundamentals.get('pct_from_high', -100)
-                # Near 52-week high: within 5% of high
-                if pct_from_high >= -5:
-                    passes_filter = True
-        
-        elif strategy_type == "undervalued_supertrend":
-            # Undervalued + Real SuperTrend bullish signal
-            if upside >= 15:  # Must be undervalued
-                # Get technical signals
-                with st.spinner(f"Analyzing technical signals for {ticker}..."):
-                    technical = get_technical_signals(ticker)
-                
-                if technical:
-                    # SuperTrend bullish (1) and additional confirmations
-                    if (technical['supertrend_signal'] == 1 and
-                        technical['above_sma20'] and 
-                        technical.get('price_vs_52w_high', 0) > 0.7):  # Not in deep correction
-                        passes_filter = True
-        
-        elif strategy_type == "undervalued_rsi_macd":
-            # Undervalued + momentum indicators (proxy using price action)
-            if (upside >= 15 and
-                fundamentals.get('pct_from_high', -100) >= -30 and
-                fundamentals.get('volume', 0) > 0):  # Has volume
-                passes_filter = True
-        
-        elif strategy_type == "momentum":
-            # Momentum: stocks near 52W high with reasonable valuation
-            if (fundamentals.get('pct_from_high', -100) >= -10 and
-                fundamentals.get('trailing_pe', 999) <= benchmarks['pe'] * 1.5):
-                passes_filter = True
-        
-        elif strategy_type == "quality":
-            # Quality: good fundamentals with reasonable valuation
-            roe_threshold = benchmarks.get('roe', 15) / 100
-            if (fundamentals.get('roe', 0) > roe_threshold and
-                fundamentals.get('trailing_pe', 999) <= benchmarks['pe'] * 1.2 and
-                upside >= 5 and
-                fundamentals.get('debt_to_equity', 999) <= benchmarks.get('debt_equity', 1.0)):
-                passes_filter = True
-        
-        if not passes_filter:
+        inputs = screen_inputs(industry, snapshots)
+        versions = {key: screen_data_version(industry, key, inputs) for key in strategy_keys}
+        stale = [
+            key for key in strategy_keys
+            if force or (cache.get_screen_results(industry, key) or (None,))[0] != versions[key][0]
+        ]
+        if not stale:
             continue
         
-        # Add to results
-        result = {
-            'Ticker': ticker,
-            'Name': name,
-            'Industry': industry,
-            'Price': fundamentals['price'],
-            'Fair Value': fair_value,
-            'Upside %': upside,
-            'PE Ratio': fundamentals['trailing_pe'],
-            'PB Ratio': fundamentals['pb_ratio'],
-            'ROE %': fundamentals['roe'] * 100 if fundamentals['roe'] else None,
-            'Market Cap': fundamentals['market_cap'],
-            'Cap Type': fundamentals['cap_type'],
-            'From 52W High %': fundamentals['pct_from_high'],
-            'From 52W Low %': fundamentals['pct_from_low'],
-            'Beta': fundamentals['beta'],
-            'Dividend Yield %': fundamentals['dividend_yield'] * 100 if fundamentals['dividend_yield'] else None,
-            'Industry PE Benchmark': benchmarks['pe'],
-            'Industry EV/EBITDA Benchmark': benchmarks['ev_ebitda']
+        # One shared pass over the industry's cached snapshots, in industry order
+        fundamentals_by_ticker = {
+            ticker: fundamentals_from_info(ticker, snapshots[ticker][0]) for ticker in stocks if ticker in snapshots
         }
-        results.append(result)
+        fundamentals_df = build_fundamentals_frame(fundamentals_by_ticker)
+        results = screen_strategies_frame(fundamentals_df, [industry] * len(fundamentals_df), stocks, stale)
+        results = confirm_strategy_columns(results, stale)
         
-        if len(results) >= max_results:
-            break
+        for key in stale:
+            rows = results[results[key]].drop(columns=stale) if not results.empty else results
+            cache.put_screen_results(industry, key, versions[key][0], rows.to_dict('records'), versions[key][1])
+            recomputed.append((industry, key))
     
-    # Clear progress indicators
-    progress_bar.empty()
-    status_text.empty()
-    
-    return pd.DataFrame(results)
+    return recomputed
 
-def search_stocks_by_name(query, max_results=50):
-    """Search stocks by company name across all industries"""
-    results = []
-    query_lower = query.lower()
+def store_screen_results(industry, strategy_key, rows):
+    """Materialize one screen from the full set of passing rows a live run just produced"""
+    data_version, data_as_of = screen_data_version(industry, strategy_key)
+    get_fundamentals_cache().put_screen_results(industry, strategy_key, data_version, rows, data_as_of)
+
+def load_materialized_screen(industry, strategy_key, max_results=50, rank_by=None):
+    """Serve a screen from stored results if its inputs are unchanged; None when it must be recomputed"""
+    strategy = get_strategy(strategy_key)
+    if strategy is None or industry == ALL_INDUSTRIES:
+        return None
     
-    for industry, stocks in INDIAN_STOCKS.items():
-        for ticker, name in stocks.items():
-            if query_lower in name.lower() or query_lower in ticker.lower():
-                results.append({
-                    'ticker': ticker,
-                    'name': name,
-                    'industry': industry
-                })
-                if len(results) >= max_results:
-                    break
-        if len(results) >= max_results:
-            break
+    stored = get_fundamentals_cache().get_screen_results(industry, strategy_key)
+    if stored is None:
+        return None
+    data_version, rows, data_as_of, computed_at = stored
+    current_version, _ = screen_data_version(industry, strategy_key)
+    if data_version != current_version or data_as_of is None or time.time() - data_as_of > SCREEN_RESULTS_MAX_AGE:
+        return None
     
-    return results
+    results_df = pd.DataFrame(rows)
+    if not results_df.empty:
+        results_df = top_k_frame(results_df, max_results, rank_by or strategy['rank_by'])
+    results_df.attrs['data_as_of'] = data_as_of
+    results_df.attrs['computed_at'] = computed_at
+    return results_df
 
 # ============================================================================
 # CHART GENERATION FUNCTIONS
@@ -10942,6 +3870,15 @@ def main():
             "Choose Mode",
             ["🎯 Industry Screener", "📈 Individual Analysis", "📊 Industry Explorer"]
         )
+        
+        prefetcher = get_prefetch_scheduler() if PREFETCH_ENABLED else None
+        if prefetcher:
+            prefetch_stats = prefetcher.stats()
+            st.caption(
+                f"🔄 Prefetch: {prefetch_stats['queue_depth']:,} queued of {prefetch_stats['warm_set']:,} kept warm • "
+                f"lag {prefetch_stats['lag'] / 60:.0f} min • "
+                f"{prefetch_stats['refreshed']:,} refreshed"
+            )
     
     # Mode-specific content
     if mode == "🎯 Industry Screener":
@@ -10950,20 +3887,19 @@ def main():
         
         # Industry selection with stock counts
         industries = sorted(get_all_categories())
-        industry_options = []
+        industry_options = [f"{ALL_INDUSTRIES} ({TOTAL_STOCKS:,} stocks)"]
         for industry in industries:
             stock_count = len(get_stocks_by_category(industry))
             industry_options.append(f"{industry} ({stock_count} stocks)")
         
         selected_industry_with_count = st.sidebar.selectbox("Select Industry", industry_options)
         selected_industry = selected_industry_with_count.split(" (")[0]  # Extract industry name
+        if prefetcher:
+            prefetcher.mark_viewed(selected_industry)
         
         # Strategy selection  
         strategy_options = [
-            ("undervalued", "🎯 Undervalued Stocks (15%+ upside)"),
-            ("undervalued_near_high", "🚀 Undervalued Near 52W High"),
-            ("undervalued_supertrend", "📈 Undervalued + SuperTrend Bullish")
-           
+            (key, strategy['label']) for key, strategy in STRATEGY_REGISTRY.items() if strategy['sidebar']
         ]
         
         strategy_choice = st.sidebar.selectbox(
@@ -10977,13 +3913,70 @@ def main():
         
         # Parameters
         max_results = st.sidebar.slider("Max Results", 10, 100, 30)
+        max_workers = st.sidebar.slider("Parallel Fetch Workers", 1, 16, SCREENER_MAX_WORKERS)
+        rank_by = st.sidebar.selectbox(
+            "Rank Results By",
+            SCREENER_RANK_COLUMNS,
+            index=SCREENER_RANK_COLUMNS.index(STRATEGY_REGISTRY[strategy_type]['rank_by'])
+        )
+        if needs_price_history(STRATEGY_REGISTRY[strategy_type]):
+            st.sidebar.caption(f"📥 Needs fundamentals + {STRATEGY_REGISTRY[strategy_type]['history']} price history for survivors")
+        else:
+            st.sidebar.caption("📥 Needs fundamentals only")
+        
+        # Multi-strategy comparison: one fetch and valuation pass, one column per strategy
+        use_precomputed = st.sidebar.checkbox("Use Precomputed Results", value=True,
+                                              help="Serve unchanged industry screens instantly from stored results")
+        compare_strategies = st.sidebar.checkbox("Compare Strategies")
+        if compare_strategies:
+            compared_keys = st.sidebar.multiselect(
+                "Strategies to Compare",
+                list(STRATEGY_REGISTRY),
+                default=['undervalued', 'momentum', 'quality'],
+                format_func=lambda key: STRATEGY_REGISTRY[key]['label']
+            )
+        
+        if compare_strategies and st.sidebar.button("🚀 Run Comparison", type="primary"):
+            if not compared_keys:
+                st.warning("Select at least one strategy to compare")
+            else:
+                with st.spinner(f"🔍 Comparing {len(compared_keys)} strategies in {selected_industry}..."):
+                    comparison_df = run_multi_strategy_screener(
+                        selected_industry, compared_keys, max_results, max_workers, rank_by
+                    )
+                if 'phase_timings' in comparison_df.attrs:
+                    st.caption(f"⏱️ Phases: {format_phase_timings(comparison_df.attrs['phase_timings'])}")
+                
+                if comparison_df.empty:
+                    st.warning(f"❌ No stocks in {selected_industry} pass any of the selected strategies")
+                else:
+                    st.markdown(f"#### Strategy Comparison • {selected_industry}")
+                    counts = " • ".join(
+                        f"{STRATEGY_REGISTRY[key]['label']}: {int(comparison_df[key].sum())}" for key in compared_keys
+                    )
+                    st.caption(f"Passing stocks among the top {len(comparison_df)}: {counts}")
+                    comparison_display = comparison_df[
+                        ['Ticker', 'Name', 'Industry', 'Price', 'Fair Value', rank_by] +
+                        [column for column in ['Upside %'] if column != rank_by] + compared_keys
+                    ].rename(columns={key: STRATEGY_REGISTRY[key]['label'] for key in compared_keys})
+                    st.dataframe(comparison_display, use_container_width=True, hide_index=True)
+                    st.download_button(
+                        label="📥 Download Comparison (CSV)",
+                        data=comparison_df.to_csv(index=False),
+                        file_name=f"NYZTrade_{selected_industry.replace(' ', '_')}_comparison_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                        mime="text/csv"
+                    )
         
         # Run screener
-        if st.sidebar.button("🚀 Run Screener", type="primary"):
+        if not compare_strategies and st.sidebar.button("🚀 Run Screener", type="primary"):
             
             # Show industry info
-            industry_stocks = get_stocks_by_category(selected_industry)
-            sector = get_sector_for_industry(selected_industry)
+            if selected_industry == ALL_INDUSTRIES:
+                industry_stocks = get_stock_catalog()['by_ticker']
+                sector = "All sectors"
+            else:
+                industry_stocks = get_stocks_by_category(selected_industry)
+                sector = get_sector_for_industry(selected_industry)
             
             st.markdown(f'''
             <div class="highlight-box">
@@ -10994,9 +3987,61 @@ def main():
             </div>
             ''', unsafe_allow_html=True)
             
-            # Run screener
-            with st.spinner(f"🔍 Screening {len(industry_stocks):,} stocks..."):
-                results_df = run_industry_screener(selected_industry, strategy_type, max_results)
+            # Live table of the best results so far, refreshed at most every SCREENER_LIVE_REFRESH seconds
+            live_table = st.empty()
+            last_refresh = [0.0]
+            
+            def show_partial_results(partial_results):
+                now = time.monotonic()
+                if now - last_refresh[0] < SCREENER_LIVE_REFRESH:
+                    return
+                last_refresh[0] = now
+                live_table.dataframe(
+                    pd.DataFrame(partial_results)[['Ticker', 'Name', 'Price', 'Fair Value', 'Upside %', 'Cap Type']],
+                    use_container_width=True, hide_index=True
+                )
+            
+            # Serve unchanged screens from the materialized results; otherwise run the screener
+            results_df = None
+            if use_precomputed:
+                results_df = load_materialized_screen(selected_industry, strategy_type, max_results, rank_by)
+            
+            if results_df is not None:
+                st.caption(
+                    f"⚡ Served from precomputed results • data as of "
+                    f"{datetime.fromtimestamp(results_df.attrs['data_as_of']):%Y-%m-%d %H:%M} • "
+                    f"computed {datetime.fromtimestamp(results_df.attrs['computed_at']):%Y-%m-%d %H:%M}"
+                )
+            else:
+                with st.spinner(f"🔍 Screening {len(industry_stocks):,} stocks..."):
+                    if selected_industry == ALL_INDUSTRIES:
+                        results_df = run_universe_screener(strategy_type, max_results, max_workers, rank_by)
+                    else:
+                        # Keep this run's full result set so the next identical click is served from it
+                        results_df = run_industry_screener(
+                            selected_industry, strategy_type, max_results, max_workers, rank_by,
+                            on_results=show_partial_results,
+                            on_complete=lambda rows: store_screen_results(selected_industry, strategy_type, rows)
+                        )
+                live_table.empty()
+                
+                # Fold the freshly cached fundamentals into the calibrated benchmarks
+                if USE_CALIBRATED_BENCHMARKS:
+                    calibrate_industry_benchmarks()
+                _, oldest_snapshot, _ = get_fundamentals_cache().snapshot_stats(industry_stocks)
+                if oldest_snapshot:
+                    stale_note = " • some entries stale, refreshing in background" if is_stale_snapshot(oldest_snapshot) else ""
+                    st.caption(f"🕒 Fundamentals data as of {datetime.fromtimestamp(oldest_snapshot):%Y-%m-%d %H:%M}{stale_note}")
+            
+            limiter_stats = get_rate_limiter().stats()
+            st.caption(
+                f"⏱️ Rate limiter: {limiter_stats['total_requests']:,} requests • "
+                f"current wait {limiter_stats['current_wait']:.1f}s • "
+                f"avg wait {limiter_stats['avg_wait']:.2f}s • "
+                f"{get_single_flight().stats()['shared']:,} coalesced"
+            )
+            if 'phase_timings' in results_df.attrs:
+                st.caption(f"⏱️ Phases: {format_phase_timings(results_df.attrs['phase_timings'])}")
             
             if results_df.empty:
                 st.warning(f"❌ No stocks found matching {strategy_name} criteria in {selected_industry}")
@@ -11009,8 +4054,8 @@ def main():
                 </div>
                 ''', unsafe_allow_html=True)
                 
-                # Sort results by upside
-                results_df = results_df.sort_values('Upside %', ascending=False)
+                # Sort results by the chosen ranking column
+                results_df = results_df.sort_values(rank_by, ascending=False)
                 
                 # Format display
                 display_df = results_df.copy()
@@ -11038,6 +4083,8 @@ def main():
                 
                 # Select key columns for display
                 display_columns = ['Ticker', 'Name', 'Price', 'Fair Value', 'Upside %', 'PE Ratio', 'From 52W High %', 'Cap Type']
+                if selected_industry == ALL_INDUSTRIES:
+                    display_columns.insert(2, 'Industry')
                 
                 # Display table
                 st.dataframe(
@@ -11110,12 +4157,18 @@ def main():
             stock_info = get_stock_info(selected_ticker)
             
             with st.spinner(f"Analyzing {selected_ticker}..."):
-                info, error = fetch_stock_data(selected_ticker)
+                info, error, fetched_at = fetch_stock_snapshot(selected_ticker)
             
             if error or not info:
                 st.error(f"❌ Error: {error if error else 'Failed to fetch stock data'}")
                 st.stop()
             
+            if is_stale_snapshot(fetched_at):
+                st.caption(
+                    f"🕒 Showing data from {datetime.fromtimestamp(fetched_at):%Y-%m-%d %H:%M} • "
+                    "refreshing in background"
+                )
+            
             vals = calculate_valuations(info, stock_info['category'] if stock_info else None)
             if not vals:
                 st.error("❌ Unable to calculate valuations for this stock")
@@ -11373,7 +4426,7 @@ def main():
                 sectors_count[sector] = sectors_count.get(sector, 0) + 1
             
             for sector, count in sorted(sectors_count.items(), key=lambda x: x[1], reverse=True):
-                st.text(f"{sector}: {count}")
+                st.text(f"{sector}: {count} ({len(get_tickers_by_sector(sector)):,} stocks)")
         
         # Specific industry exploration
         st.markdown("---")
@@ -11386,11 +4439,50 @@ def main():
         
         if selected_explore_industry_with_count:
             explore_industry = selected_explore_industry_with_count.split(" (")[0]  # Extract industry name
+            if prefetcher:
+                prefetcher.mark_viewed(explore_industry)
             industry_stocks = get_stocks_by_category(explore_industry)
             sector = get_sector_for_industry(explore_industry)
             
             st.info(f"**{explore_industry}** • Sector: {sector} • {len(industry_stocks)} stocks")
             
+            # Benchmarks in use: hand-typed, calibrated from cached fundamentals, or the sector default
+            calibrated, calibrated_at = get_fundamentals_cache().load_calibration()
+            if explore_industry in INDUSTRY_BENCHMARKS:
+                benchmark_source = "hand-curated industry table"
+            elif USE_CALIBRATED_BENCHMARKS and explore_industry in calibrated:
+                benchmark_source = f"calibrated from cached fundamentals ({datetime.fromtimestamp(calibrated_at):%Y-%m-%d %H:%M})"
+            else:
+                benchmark_source = f"{sector} sector default"
+            benchmarks = get_industry_benchmarks(explore_industry, 'Large')
+            # Sector defaults carry no D/E benchmark unless calibration supplied one
+            debt_equity_benchmark = benchmarks.get('debt_equity')
+            debt_equity_label = f"{debt_equity_benchmark:.2f}" if debt_equity_benchmark is not None else "n/a"
+            st.caption(
+                f"📐 Large-cap benchmarks ({benchmark_source}): P/E {benchmarks['pe']:.1f} • P/B {benchmarks['pb']:.1f} • "
+                f"ROE {benchmarks['roe']:.1f}% • EV/EBITDA {benchmarks['ev_ebitda']:.1f} • D/E {debt_equity_label}"
+            )
+            if USE_CALIBRATED_BENCHMARKS and st.button("🔄 Recalibrate benchmarks from cached fundamentals"):
+                updated = calibrate_industry_benchmarks(full=True)
+                revalued = revalue_cached_industries(updated) if updated else pd.DataFrame()
+                st.success(f"Recalibrated {len(updated)} industries • revalued {len(revalued):,} cached stocks")
+            
+            # Cached members valued against the benchmarks above
+            valuations = revalue_cached_industries([explore_industry])
+            if not valuations.empty:
+                st.caption(
+                    f"💹 {len(valuations)} cached stocks at current benchmarks • "
+                    f"median PE upside {valuations['upside_pe'].median():.1f}% • "
+                    f"median EV/EBITDA upside {valuations['upside_ev'].median():.1f}%"
+                )
+                with st.expander("View valuations at current benchmarks"):
+                    valuation_table = valuations[['cap_type', 'price', 'fair_value_pe', 'upside_pe', 'fair_value_ev', 'upside_ev']]
+                    valuation_table = valuation_table.rename(columns={
+                        'cap_type': 'Cap Type', 'price': 'Price', 'fair_value_pe': 'Fair Value (PE)',
+                        'upside_pe': 'Upside PE %', 'fair_value_ev': 'Fair Value (EV)', 'upside_ev': 'Upside EV %'
+                    }).sort_values('Upside PE %', ascending=False)
+                    st.dataframe(valuation_table.round(2), use_container_width=True)
+            
             # Show stocks in expandable section
             if st.expander(f"View all {len(industry_stocks)} stocks"):
                 stocks_df = pd.DataFrame(list(industry_stocks.items()), columns=['Ticker', 'Company'])
@@ -11430,5 +4522,117 @@ def main():
     </div>
     ''', unsafe_allow_html=True)
 
+# ============================================================================
+# HEADLESS BATCH SCREENER (CLI)
+# ============================================================================
+# Exit codes for scheduled runs
+CLI_EXIT_OK = 0
+CLI_EXIT_NO_RESULTS = 1
+CLI_EXIT_USAGE = 2
+CLI_EXIT_NO_DATA = 3
+CLI_EXIT_OUTPUT_ERROR = 4
+
+CLI_OUTPUT_FORMATS = ('csv', 'parquet', 'json')
+
+def write_screen_results(results_df, output, output_format=None):
+    """Write a result table as CSV, Parquet or JSON; '-' writes CSV/JSON to stdout"""
+    if output_format is None:
+        extension = os.path.splitext(output)[1].lower().lstrip('.')
+        output_format = extension if extension in CLI_OUTPUT_FORMATS else 'csv'
+    
+    if output_format == 'parquet':
+        if output == '-':
+            raise ValueError("Parquet output needs a file path")
+        results_df.to_parquet(output, index=False)
+    elif output_format == 'json':
+        results_df.to_json(sys.stdout if output == '-' else output, orient='records', indent=2)
+    else:
+        results_df.to_csv(sys.stdout if output == '-' else output, index=False)
+
+def build_cli_parser():
+    """Argument parser for the headless screener"""
+    parser = argparse.ArgumentParser(
+        prog="nyztrade_valuation_screener.py",
+        description="Run NYZTrade screens without a Streamlit server (e.g. nightly from cron)"
+    )
+    parser.add_argument("-s", "--strategy", action="append", choices=list(STRATEGY_REGISTRY),
+                        help="Strategy to run; repeat for a multi-strategy run (default: undervalued)")
+    parser.add_argument("-i", "--industry", action="append",
+                        help=f"Industry to screen; repeatable (default: {ALL_INDUSTRIES})")
+    parser.add_argument("-n", "--max-results", type=int, default=50, help="Rows to keep after ranking (default: 50)")
+    parser.add_argument("--rank-by", choices=SCREENER_RANK_COLUMNS, help="Ranking column (default: the strategy's own)")
+    parser.add_argument("-w", "--workers", type=int, default=SCREENER_MAX_WORKERS,
+                        help=f"Parallel fetch workers (default: {SCREENER_MAX_WORKERS})")
+    parser.add_argument("-o", "--output", default="-", help="Output path, or - for stdout (default: -)")
+    parser.add_argument("-f", "--format", choices=CLI_OUTPUT_FORMATS, help="Output format (default: from the file extension)")
+    parser.add_argument("-q", "--quiet", action="store_true", help="Only report errors on stderr")
+    parser.add_argument("--materialize", action="store_true",
+                        help="After screening, precompute every (industry, strategy) result the app can serve")
+    parser.add_argument("--list-strategies", action="store_true", help="List strategy keys and exit")
+    parser.add_argument("--list-industries", action="store_true", help="List industries and exit")
+    return parser
+
+def cli_main(argv=None):
+    """Headless entry point; returns a process exit code"""
+    args = build_cli_parser().parse_args(argv)
+    log = None if args.quiet else sys.stderr
+    
+    if args.list_strategies:
+        for key, strategy in STRATEGY_REGISTRY.items():
+            print(f"{key}\t{strategy['screen']}")
+        return CLI_EXIT_OK
+    if args.list_industries:
+        for industry in sorted(get_all_categories()):
+            print(industry)
+        return CLI_EXIT_OK
+    
+    industries = args.industry or [ALL_INDUSTRIES]
+    if ALL_INDUSTRIES in industries or any(industry.lower() == 'all' for industry in industries):
+        industries = None
+    else:
+        unknown = [industry for industry in industries if industry not in INDIAN_STOCKS]
+        if unknown:
+            print(f"Unknown industry: {', '.join(unknown)} (see --list-industries)", file=sys.stderr)
+            return CLI_EXIT_USAGE
+    if args.max_results < 1 or args.workers < 1:
+        print("--max-results and --workers must be positive", file=sys.stderr)
+        return CLI_EXIT_USAGE
+    
+    strategies = list(dict.fromkeys(args.strategy or ['undervalued']))
+    progress = ScreenerProgress(stream=log)
+    started = time.perf_counter()
+    if len(strategies) == 1:
+        results_df = run_universe_screener(strategies[0], args.max_results, args.workers, args.rank_by, industries, progress)
+    else:
+        results_df = run_multi_strategy_screener(
+            industries or ALL_INDUSTRIES, strategies, args.max_results, args.workers, args.rank_by or 'Upside %', progress
+        )
+    elapsed = time.perf_counter() - started
+    
+    if log:
+        print(f"Screened {results_df.attrs.get('screened', 0):,} stocks with {', '.join(strategies)}: "
+              f"{len(results_df):,} results in {elapsed:.2f}s ({format_phase_timings(results_df.attrs.get('phase_timings', {}))})",
+              file=log)
+    if not results_df.attrs.get('screened'):
+        print("No fundamentals could be fetched", file=sys.stderr)
+        return CLI_EXIT_NO_DATA
+    
+    if args.materialize:
+        materialize_started = time.perf_counter()
+        recomputed = materialize_screens(industries)
+        if log:
+            print(f"Materialized {len(recomputed):,} screens in {time.perf_counter() - materialize_started:.2f}s", file=log)
+    
+    try:
+        write_screen_results(results_df, args.output, args.format)
+    except (OSError, ValueError, ImportError) as e:
+        print(f"Could not write results: {e}", file=sys.stderr)
+        return CLI_EXIT_OUTPUT_ERROR
+    
+    return CLI_EXIT_OK if not results_df.empty else CLI_EXIT_NO_RESULTS
+
 if __name__ == "__main__":
-    main()
+    if IN_STREAMLIT:
+        main()
+    else:
+        sys.exit(cli_main())